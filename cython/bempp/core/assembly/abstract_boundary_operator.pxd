@@ -2,6 +2,7 @@ from bempp.core.utils cimport unique_ptr
 from bempp.core.utils cimport shared_ptr
 from bempp.core.utils cimport complex_double
 from bempp.core.utils cimport c_ParameterList
+from bempp.core.utils cimport catch_exception
 from bempp.core.space cimport c_Space
 from .discrete_boundary_operator cimport c_DiscreteBoundaryOperator
 from .assembler cimport c_LocalAssemblerForIntegralOperators
@@ -11,14 +12,14 @@ from .assembler cimport c_LocalAssemblerForLocalOperators
 cdef extern from "bempp/assembly/elementary_integral_operator.hpp" namespace "Bempp":
     cdef cppclass c_RealElementaryIntegralOperator "Bempp::ElementaryIntegralOperator<double,double,double>":
         unique_ptr[c_LocalAssemblerForIntegralOperators[double]] makeAssembler(const c_ParameterList&)
-        shared_ptr[c_DiscreteBoundaryOperator[double]] assembleWeakForm(const c_ParameterList&)
+        shared_ptr[c_DiscreteBoundaryOperator[double]] assembleWeakForm(const c_ParameterList&) nogil except +catch_exception
         shared_ptr[const c_Space[double]] domain()
         shared_ptr[const c_Space[double]] range()
         shared_ptr[const c_Space[double]] dualToRange()
 
     cdef cppclass c_ComplexElementaryIntegralOperator "Bempp::ElementaryIntegralOperator<double,std::complex<double>,std::complex<double> >":
         unique_ptr[c_LocalAssemblerForIntegralOperators[complex_double]] makeAssembler(const c_ParameterList&)
-        shared_ptr[c_DiscreteBoundaryOperator[complex_double]] assembleWeakForm(const c_ParameterList&)
+        shared_ptr[c_DiscreteBoundaryOperator[complex_double]] assembleWeakForm(const c_ParameterList&) nogil except +catch_exception
         shared_ptr[const c_Space[double]] domain()
         shared_ptr[const c_Space[double]] range()
         shared_ptr[const c_Space[double]] dualToRange()
@@ -26,7 +27,7 @@ cdef extern from "bempp/assembly/elementary_integral_operator.hpp" namespace "Be
 cdef extern from "bempp/assembly/elementary_local_operator.hpp" namespace "Bempp":
     cdef cppclass c_ElementaryLocalOperator "Bempp::ElementaryLocalOperator<double, double>":
         unique_ptr[c_LocalAssemblerForLocalOperators[double]] makeAssembler(const c_ParameterList&)
-        shared_ptr[c_DiscreteBoundaryOperator[double]] assembleWeakForm(const c_ParameterList&)
+        shared_ptr[c_DiscreteBoundaryOperator[double]] assembleWeakForm(const c_ParameterList&) nogil except +catch_exception
         shared_ptr[const c_Space[double]] domain()
         shared_ptr[const c_Space[double]] range()
         shared_ptr[const c_Space[double]] dualToRange()
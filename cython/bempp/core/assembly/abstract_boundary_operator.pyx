@@ -1,6 +1,9 @@
 from cython.operator cimport dereference as deref
 from .discrete_boundary_operator cimport RealDiscreteBoundaryOperator
 from .discrete_boundary_operator cimport ComplexDiscreteBoundaryOperator
+from .discrete_boundary_operator cimport c_DiscreteBoundaryOperator
+from bempp.core.utils cimport shared_ptr
+from bempp.core.utils cimport complex_double
 from bempp.core.utils.parameter_list cimport ParameterList
 from bempp.core.space.space cimport Space
 from .assembler cimport c_LocalAssemblerForIntegralOperators
@@ -29,7 +32,10 @@ cdef class RealElementaryIntegralOperator:
 
     def assemble_weak_form(self, ParameterList parameters):
         cdef RealDiscreteBoundaryOperator op = RealDiscreteBoundaryOperator()
-        op.impl_ = deref(self.impl_).assembleWeakForm(deref(parameters.impl_))
+        cdef shared_ptr[c_DiscreteBoundaryOperator[double]] weak_form
+        with nogil:
+            weak_form = deref(self.impl_).assembleWeakForm(deref(parameters.impl_))
+        op.impl_ = weak_form
         return op
 
     property domain:
@@ -68,7 +74,10 @@ cdef class ComplexElementaryIntegralOperator:
 
     def assemble_weak_form(self, ParameterList parameters):
         cdef ComplexDiscreteBoundaryOperator op = ComplexDiscreteBoundaryOperator()
-        op.impl_ = deref(self.impl_).assembleWeakForm(deref(parameters.impl_))
+        cdef shared_ptr[c_DiscreteBoundaryOperator[complex_double]] weak_form
+        with nogil:
+            weak_form = deref(self.impl_).assembleWeakForm(deref(parameters.impl_))
+        op.impl_ = weak_form
         return op
 
     property domain:
@@ -107,7 +116,10 @@ cdef class ElementaryLocalOperator:
 
     def assemble_weak_form(self, ParameterList parameters):
         cdef RealDiscreteBoundaryOperator op = RealDiscreteBoundaryOperator()
-        op.impl_ = deref(self.impl_).assembleWeakForm(deref(parameters.impl_))
+        cdef shared_ptr[c_DiscreteBoundaryOperator[double]] weak_form
+        with nogil:
+            weak_form = deref(self.impl_).assembleWeakForm(deref(parameters.impl_))
+        op.impl_ = weak_form
         return op
         
     property domain:
@@ -0,0 +1,258 @@
+#ifndef BEMPP_CORE_ANALYTIC_FUNCTORS_HPP
+#define BEMPP_CORE_ANALYTIC_FUNCTORS_HPP
+
+#include "bempp/common/types.hpp"
+#include "bempp/fiber/scalar_traits.hpp"
+#include "bempp/fiber/surface_normal_and_domain_index_dependent_function.hpp"
+#include <complex>
+#include <cmath>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+namespace Bempp
+{
+
+/** \brief Plane wave A * exp(i k d.x). */
+template <typename ValueType_>
+class PlaneWaveFunctor
+{
+public:
+    typedef ValueType_ ValueType;
+    typedef typename Fiber::ScalarTraits<ValueType>::RealType CoordinateType;
+
+    PlaneWaveFunctor(ValueType waveNumber, const CoordinateType* direction,
+                     ValueType amplitude) :
+        m_waveNumber(waveNumber), m_amplitude(amplitude)
+    {
+        for (int i = 0; i < 3; ++i) m_direction[i] = direction[i];
+    }
+
+    int argumentDimension() const { return 3; }
+
+    int resultDimension() const { return 1; }
+
+    void evaluate(const Eigen::Ref<Vector<CoordinateType>>& point,
+                  const Eigen::Ref<Vector<CoordinateType>>& normal,
+                  int domainIndex,
+                  Eigen::Ref<Vector<ValueType>> result) const
+    {
+        CoordinateType dot = 0;
+        for (int i = 0; i < 3; ++i) dot += m_direction[i] * point(i);
+        result(0) = m_amplitude * std::exp(ValueType(0, 1) * m_waveNumber * dot);
+    }
+
+private:
+    ValueType m_waveNumber;
+    CoordinateType m_direction[3];
+    ValueType m_amplitude;
+};
+
+/** \brief Point source A * exp(i k r) / (4 pi r) with r = |x - x0|. */
+template <typename ValueType_>
+class PointSourceFunctor
+{
+public:
+    typedef ValueType_ ValueType;
+    typedef typename Fiber::ScalarTraits<ValueType>::RealType CoordinateType;
+
+    PointSourceFunctor(ValueType waveNumber, const CoordinateType* source,
+                       ValueType amplitude) :
+        m_waveNumber(waveNumber), m_amplitude(amplitude)
+    {
+        for (int i = 0; i < 3; ++i) m_source[i] = source[i];
+    }
+
+    int argumentDimension() const { return 3; }
+
+    int resultDimension() const { return 1; }
+
+    void evaluate(const Eigen::Ref<Vector<CoordinateType>>& point,
+                  const Eigen::Ref<Vector<CoordinateType>>& normal,
+                  int domainIndex,
+                  Eigen::Ref<Vector<ValueType>> result) const
+    {
+        CoordinateType distSquared = 0;
+        for (int i = 0; i < 3; ++i) {
+            const CoordinateType diff = point(i) - m_source[i];
+            distSquared += diff * diff;
+        }
+        const CoordinateType dist = std::sqrt(distSquared);
+        result(0) = m_amplitude * std::exp(ValueType(0, 1) * m_waveNumber * dist) /
+            (CoordinateType(4. * M_PI) * dist);
+    }
+
+private:
+    ValueType m_waveNumber;
+    CoordinateType m_source[3];
+    ValueType m_amplitude;
+};
+
+/** \brief Tangential trace E x n of the Maxwell plane wave
+  E = p * exp(i k d.x). */
+template <typename ValueType_>
+class MaxwellPlaneWaveTraceFunctor
+{
+public:
+    typedef ValueType_ ValueType;
+    typedef typename Fiber::ScalarTraits<ValueType>::RealType CoordinateType;
+
+    MaxwellPlaneWaveTraceFunctor(ValueType waveNumber, const CoordinateType* direction,
+                                 const ValueType* polarization) :
+        m_waveNumber(waveNumber)
+    {
+        for (int i = 0; i < 3; ++i) {
+            m_direction[i] = direction[i];
+            m_polarization[i] = polarization[i];
+        }
+    }
+
+    int argumentDimension() const { return 3; }
+
+    int resultDimension() const { return 3; }
+
+    void evaluate(const Eigen::Ref<Vector<CoordinateType>>& point,
+                  const Eigen::Ref<Vector<CoordinateType>>& normal,
+                  int domainIndex,
+                  Eigen::Ref<Vector<ValueType>> result) const
+    {
+        CoordinateType dot = 0;
+        for (int i = 0; i < 3; ++i) dot += m_direction[i] * point(i);
+        const ValueType phase = std::exp(ValueType(0, 1) * m_waveNumber * dot);
+        result(0) = phase * (m_polarization[1] * normal(2) - m_polarization[2] * normal(1));
+        result(1) = phase * (m_polarization[2] * normal(0) - m_polarization[0] * normal(2));
+        result(2) = phase * (m_polarization[0] * normal(1) - m_polarization[1] * normal(0));
+    }
+
+private:
+    ValueType m_waveNumber;
+    CoordinateType m_direction[3];
+    ValueType m_polarization[3];
+};
+
+/** \brief Polynomial sum_j c_j x^a_j y^b_j z^c_j. */
+template <typename ValueType_>
+class PolynomialFunctor
+{
+public:
+    typedef ValueType_ ValueType;
+    typedef typename Fiber::ScalarTraits<ValueType>::RealType CoordinateType;
+
+    PolynomialFunctor(const std::vector<int>& exponents,
+                      const std::vector<ValueType>& coefficients) :
+        m_exponents(exponents), m_coefficients(coefficients)
+    {
+        if (m_exponents.size() != 3 * m_coefficients.size())
+            throw std::invalid_argument("PolynomialFunctor::PolynomialFunctor(): "
+                                        "exponents and coefficients do not match");
+    }
+
+    int argumentDimension() const { return 3; }
+
+    int resultDimension() const { return 1; }
+
+    void evaluate(const Eigen::Ref<Vector<CoordinateType>>& point,
+                  const Eigen::Ref<Vector<CoordinateType>>& normal,
+                  int domainIndex,
+                  Eigen::Ref<Vector<ValueType>> result) const
+    {
+        ValueType sum = 0;
+        for (size_t j = 0; j < m_coefficients.size(); ++j) {
+            CoordinateType monomial = 1;
+            for (int i = 0; i < 3; ++i)
+                for (int p = 0; p < m_exponents[3 * j + i]; ++p)
+                    monomial *= point(i);
+            sum += m_coefficients[j] * monomial;
+        }
+        result(0) = sum;
+    }
+
+private:
+    std::vector<int> m_exponents;
+    std::vector<ValueType> m_coefficients;
+};
+
+/** \brief Create one of the built-in analytic functions.
+
+  \p name selects the function and \p data holds its parameters as a flat
+  list of real numbers. Complex parameters are stored as consecutive real
+  and imaginary parts.
+
+  - "plane_wave": k, d[3], A
+  - "point_source": k, x0[3], A
+  - "maxwell_plane_wave_trace": k, d[3], p[3]
+  - "polynomial": n, then n times (a, b, c, coefficient)
+*/
+template <typename ValueType>
+shared_ptr<Fiber::Function<ValueType>>
+makeAnalyticFunction(const std::string& name,
+                     const std::vector<double>& data) {
+
+    typedef typename Fiber::ScalarTraits<ValueType>::RealType CoordinateType;
+
+    if (name == "plane_wave" || name == "point_source") {
+        if (data.size() != 7)
+            throw std::invalid_argument("makeAnalyticFunction(): "
+                                        "wrong number of parameters");
+        const ValueType waveNumber(data[0], data[1]);
+        const CoordinateType position[3] = {CoordinateType(data[2]),
+                                            CoordinateType(data[3]),
+                                            CoordinateType(data[4])};
+        const ValueType amplitude(data[5], data[6]);
+        if (name == "plane_wave")
+            return shared_ptr<Fiber::Function<ValueType>>(
+                new Fiber::SurfaceNormalAndDomainIndexDependentFunction<
+                    PlaneWaveFunctor<ValueType>>(
+                        PlaneWaveFunctor<ValueType>(waveNumber, position, amplitude)));
+        return shared_ptr<Fiber::Function<ValueType>>(
+            new Fiber::SurfaceNormalAndDomainIndexDependentFunction<
+                PointSourceFunctor<ValueType>>(
+                    PointSourceFunctor<ValueType>(waveNumber, position, amplitude)));
+    }
+
+    if (name == "maxwell_plane_wave_trace") {
+        if (data.size() != 11)
+            throw std::invalid_argument("makeAnalyticFunction(): "
+                                        "wrong number of parameters");
+        const ValueType waveNumber(data[0], data[1]);
+        const CoordinateType direction[3] = {CoordinateType(data[2]),
+                                             CoordinateType(data[3]),
+                                             CoordinateType(data[4])};
+        const ValueType polarization[3] = {ValueType(data[5], data[6]),
+                                           ValueType(data[7], data[8]),
+                                           ValueType(data[9], data[10])};
+        return shared_ptr<Fiber::Function<ValueType>>(
+            new Fiber::SurfaceNormalAndDomainIndexDependentFunction<
+                MaxwellPlaneWaveTraceFunctor<ValueType>>(
+                    MaxwellPlaneWaveTraceFunctor<ValueType>(
+                        waveNumber, direction, polarization)));
+    }
+
+    if (name == "polynomial") {
+        if (data.empty())
+            throw std::invalid_argument("makeAnalyticFunction(): "
+                                        "wrong number of parameters");
+        const size_t termCount = data[0];
+        if (data.size() != 1 + 5 * termCount)
+            throw std::invalid_argument("makeAnalyticFunction(): "
+                                        "wrong number of parameters");
+        std::vector<int> exponents(3 * termCount);
+        std::vector<ValueType> coefficients(termCount);
+        for (size_t j = 0; j < termCount; ++j) {
+            for (int i = 0; i < 3; ++i)
+                exponents[3 * j + i] = int(data[1 + 5 * j + i]);
+            coefficients[j] = ValueType(data[4 + 5 * j], data[5 + 5 * j]);
+        }
+        return shared_ptr<Fiber::Function<ValueType>>(
+            new Fiber::SurfaceNormalAndDomainIndexDependentFunction<
+                PolynomialFunctor<ValueType>>(
+                    PolynomialFunctor<ValueType>(exponents, coefficients)));
+    }
+
+    throw std::invalid_argument("makeAnalyticFunction(): unknown function '" +
+                                name + "'");
+}
+
+} // namespace Bempp
+
+#endif
@@ -1,15 +1,22 @@
 from bempp.core.utils cimport unique_ptr
 from bempp.core.utils cimport complex_double
 from bempp.core.utils cimport Matrix
+from bempp.core.utils cimport catch_exception
 from libcpp.vector cimport vector
 
+cdef extern from "bempp/fiber/types.hpp" namespace "Fiber":
+    cdef enum c_CallVariant "Fiber::CallVariant":
+        TEST_TRIAL "Fiber::TEST_TRIAL"
+        TRIAL_TEST "Fiber::TRIAL_TEST"
+
 cdef extern from "bempp/fiber/local_assembler_for_integral_operators.hpp" namespace "Fiber":
     cdef cppclass c_LocalAssemblerForIntegralOperators "Fiber::LocalAssemblerForIntegralOperators"[T]:
-        pass
+        void evaluateLocalWeakForms(c_CallVariant, const vector[int]&, int, int,
+                                    vector[Matrix[T]]&, double) nogil except +catch_exception
 
 cdef extern from "bempp/fiber/local_assembler_for_local_operators.hpp" namespace "Fiber":
     cdef cppclass c_LocalAssemblerForLocalOperators "Fiber::LocalAssemblerForLocalOperators"[T]:
-        void evaluateLocalWeakForms(const vector[int]&, vector[Matrix[T]]&)
+        void evaluateLocalWeakForms(const vector[int]&, vector[Matrix[T]]&) nogil except +catch_exception
 
 
 cdef class RealIntegralOperatorLocalAssembler:
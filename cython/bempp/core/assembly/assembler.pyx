@@ -4,12 +4,15 @@ from bempp.core.utils cimport catch_exception
 from bempp.core.utils cimport c_ParameterList, ParameterList
 from bempp.core.utils cimport Matrix
 from bempp.core.utils cimport eigen_matrix_to_np_float64
+from bempp.core.utils cimport eigen_matrix_to_np_complex128
 from bempp.core.space.space cimport c_Space, Space
 from .discrete_boundary_operator cimport c_DiscreteBoundaryOperator
 from .discrete_boundary_operator cimport RealDiscreteBoundaryOperator
 from .discrete_boundary_operator cimport ComplexDiscreteBoundaryOperator
 from cython.operator cimport dereference as deref
 from libcpp.vector cimport vector
+from libcpp.string cimport string
+from libcpp cimport bool as cbool
 
 cdef class RealIntegralOperatorLocalAssembler:
 
@@ -19,6 +22,24 @@ cdef class RealIntegralOperatorLocalAssembler:
     def __init__(self):
         pass
 
+    def evaluate_local_weak_forms(self, object test_elements, int trial_element):
+        """Return the element matrices of the pairs (test element, trial element).
+
+        The quadrature rule of each pair is selected from its distance
+        as in the assembly of the weak form.
+
+        """
+
+        cdef vector[int] c_test_elements = test_elements
+        cdef vector[Matrix[double]] result
+        with nogil:
+            deref(self.impl_).evaluateLocalWeakForms(
+                TEST_TRIAL, c_test_elements, trial_element, -1, result, -1)
+        result_list = []
+        for i in range(result.size()):
+            result_list.append(eigen_matrix_to_np_float64(result[i]))
+        return result_list
+
     def __dealloc__(self):
         self.impl_.reset()
 
@@ -30,6 +51,24 @@ cdef class ComplexIntegralOperatorLocalAssembler:
     def __init__(self):
         pass
 
+    def evaluate_local_weak_forms(self, object test_elements, int trial_element):
+        """Return the element matrices of the pairs (test element, trial element).
+
+        The quadrature rule of each pair is selected from its distance
+        as in the assembly of the weak form.
+
+        """
+
+        cdef vector[int] c_test_elements = test_elements
+        cdef vector[Matrix[complex_double]] result
+        with nogil:
+            deref(self.impl_).evaluateLocalWeakForms(
+                TEST_TRIAL, c_test_elements, trial_element, -1, result, -1)
+        result_list = []
+        for i in range(result.size()):
+            result_list.append(eigen_matrix_to_np_complex128(result[i]))
+        return result_list
+
     def __dealloc__(self):
         self.impl_.reset()
 
@@ -45,24 +84,56 @@ cdef class LocalOperatorLocalAssembler:
 
         cdef vector[int] c_element_indices = element_indices
         cdef vector[Matrix[double]] result
-        deref(self.impl_).evaluateLocalWeakForms(c_element_indices, result)
+        with nogil:
+            deref(self.impl_).evaluateLocalWeakForms(c_element_indices, result)
         result_list = []
         for i in range(result.size()):
             result_list.append(eigen_matrix_to_np_float64(result[i]))
         return result_list
 
+    def evaluate_local_weak_forms_array(self, object element_indices):
+        """Return the local element matrices as an array of shape (n, rows, cols).
+
+        Element matrices of different sizes are padded with zeros.
+
+        """
+
+        import numpy as np
+
+        cdef vector[int] c_element_indices = element_indices
+        cdef vector[Matrix[double]] result
+        cdef int i, j, k
+        cdef int rows = 0
+        cdef int cols = 0
+        with nogil:
+            deref(self.impl_).evaluateLocalWeakForms(c_element_indices, result)
+
+        for i in range(result.size()):
+            rows = max(rows, result[i].rows())
+            cols = max(cols, result[i].cols())
+
+        cdef double[:, :, ::1] values = np.zeros((result.size(), rows, cols), dtype='float64')
+        for i in range(result.size()):
+            for j in range(result[i].rows()):
+                for k in range(result[i].cols()):
+                    values[i, j, k] = result[i].value(j, k)
+        return np.asarray(values)
+
     def __dealloc__(self):
         self.impl_.reset()
 
 cdef extern from "bempp/assembly/dense_global_block_assembler.hpp" namespace "Bempp":
     cdef shared_ptr[const c_DiscreteBoundaryOperator[RESULT]] c_assembleDenseBlock "Bempp::assembleDenseBlock"[BASIS,RESULT](
-            int, int, int, int, const c_Space[BASIS]&, const c_Space[BASIS]&, const c_LocalAssemblerForIntegralOperators[RESULT]&, const c_ParameterList&) except +catch_exception
+            int, int, int, int, const c_Space[BASIS]&, const c_Space[BASIS]&, const c_LocalAssemblerForIntegralOperators[RESULT]&, const c_ParameterList&) nogil except +catch_exception
 
 def assemble_dense_block_ext(rows, cols, Space domain not None, Space dual_to_range not None, assembler, ParameterList parameters not None):
     """Assemble a given subblock of a dense boundary operator."""
 
     cdef RealDiscreteBoundaryOperator real_discrete_operator = RealDiscreteBoundaryOperator()
     cdef ComplexDiscreteBoundaryOperator complex_discrete_operator = ComplexDiscreteBoundaryOperator()
+    cdef RealIntegralOperatorLocalAssembler real_assembler
+    cdef ComplexIntegralOperatorLocalAssembler complex_assembler
+    cdef int row_start, row_end, col_start, col_end
 
     if rows == -1:
         row_start = 0
@@ -79,11 +150,71 @@ def assemble_dense_block_ext(rows, cols, Space domain not None, Space dual_to_ra
         col_end = cols[1]
 
     if isinstance(assembler, RealIntegralOperatorLocalAssembler):
-        real_discrete_operator.impl_ = c_assembleDenseBlock[double,double](row_start, row_end, col_start, col_end,
-                deref(dual_to_range.impl_), deref(domain.impl_), deref((<RealIntegralOperatorLocalAssembler> assembler).impl_), deref(parameters.impl_))
+        real_assembler = assembler
+        with nogil:
+            real_discrete_operator.impl_ = c_assembleDenseBlock[double,double](row_start, row_end, col_start, col_end,
+                    deref(dual_to_range.impl_), deref(domain.impl_), deref(real_assembler.impl_), deref(parameters.impl_))
         return real_discrete_operator
     if isinstance(assembler, ComplexIntegralOperatorLocalAssembler):
-        complex_discrete_operator.impl_ = c_assembleDenseBlock[double,complex_double](row_start, row_end, col_start, col_end,
-                deref(dual_to_range.impl_), deref(domain.impl_), deref((<ComplexIntegralOperatorLocalAssembler> assembler).impl_), deref(parameters.impl_))
+        complex_assembler = assembler
+        with nogil:
+            complex_discrete_operator.impl_ = c_assembleDenseBlock[double,complex_double](row_start, row_end, col_start, col_end,
+                    deref(dual_to_range.impl_), deref(domain.impl_), deref(complex_assembler.impl_), deref(parameters.impl_))
         return complex_discrete_operator
     raise ValueError("Unknown assembler type.")
+
+cdef extern from "bempp/fiber/singular_integral_cache_budget.hpp" namespace "Fiber":
+    cdef void c_setSingularIntegralCacheMemoryLimit "Fiber::SingularIntegralCacheBudget::setMemoryLimit"(size_t)
+    cdef size_t c_singularIntegralCacheMemoryLimit "Fiber::SingularIntegralCacheBudget::memoryLimit"()
+    cdef size_t c_singularIntegralCacheCurrentSize "Fiber::SingularIntegralCacheBudget::currentSize"()
+    cdef size_t c_singularIntegralCachePeakSize "Fiber::SingularIntegralCacheBudget::peakSize"()
+    cdef void c_resetSingularIntegralCachePeakSize "Fiber::SingularIntegralCacheBudget::resetPeakSize"()
+
+def set_singular_integral_cache_memory_limit_ext(size_t limit):
+    """Set the maximum memory in bytes of all singular integral caches (0 for no limit)."""
+
+    c_setSingularIntegralCacheMemoryLimit(limit)
+
+def singular_integral_cache_info_ext(reset_peak=False):
+    """Return the memory limit, current and peak size in bytes of the singular integral caches."""
+
+    info = {'limit': c_singularIntegralCacheMemoryLimit(),
+            'current': c_singularIntegralCacheCurrentSize(),
+            'peak': c_singularIntegralCachePeakSize()}
+    if reset_peak:
+        c_resetSingularIntegralCachePeakSize()
+    return info
+
+cdef extern from "bempp/common/assembly_profiler.hpp" namespace "Bempp":
+    cdef cppclass c_AssemblyPhase "Bempp::AssemblyProfiler::Phase":
+        string name
+        double seconds
+        cbool summedOverThreads
+        size_t peakMemory
+    cdef void c_setAssemblyProfilingEnabled "Bempp::AssemblyProfiler::setEnabled"(cbool)
+    cdef void c_resetAssemblyProfile "Bempp::AssemblyProfiler::reset"()
+    cdef vector[c_AssemblyPhase] c_assemblyProfilePhases "Bempp::AssemblyProfiler::phases"()
+    cdef vector[double] c_assemblyProfileThreadBusyTimes "Bempp::AssemblyProfiler::threadBusyTimes"()
+    cdef size_t c_peakResidentMemory "Bempp::AssemblyProfiler::peakResidentMemory"()
+
+def set_assembly_profiling_ext(enabled):
+    """Enable or disable the recording of assembly phase times."""
+    c_setAssemblyProfilingEnabled(enabled)
+
+def reset_assembly_profile_ext():
+    """Remove all recorded assembly phase times."""
+    c_resetAssemblyProfile()
+
+def assembly_profile_ext():
+    """Return the recorded phases, the peak memory in bytes at the end of each phase and the thread busy times."""
+
+    cdef vector[c_AssemblyPhase] phases = c_assemblyProfilePhases()
+    cdef vector[double] busy_times = c_assemblyProfileThreadBusyTimes()
+    return {'phases': [(phases[i].name.decode('utf-8'), phases[i].seconds, phases[i].summedOverThreads)
+                       for i in range(phases.size())],
+            'peak_memory': [phases[i].peakMemory for i in range(phases.size())],
+            'thread_busy_times': [busy_times[i] for i in range(busy_times.size())]}
+
+def peak_resident_memory_ext():
+    """Return the peak resident memory of the process in bytes or 0 if it is not available."""
+    return c_peakResidentMemory()
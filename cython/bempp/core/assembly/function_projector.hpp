@@ -13,6 +13,7 @@
 #include "bempp/fiber/basis_data.hpp"
 #include "bempp/fiber/collection_of_basis_transformations.hpp"
 #include "bempp/fiber/function.hpp"
+#include "bempp/fiber/geometrical_data.hpp"
 #include "bempp/fiber/local_assembler_for_grid_functions.hpp"
 #include "bempp/fiber/quadrature_strategy.hpp"
 #include "bempp/fiber/quadrature_strategy.hpp"
@@ -24,7 +25,11 @@
 #include "bempp/grid/entity.hpp"
 #include "bempp/grid/mapper.hpp"
 #include "bempp/space/space.hpp"
+#include "bempp/core/assembly/analytic_functors.hpp"
+#include <string>
 #include <vector>
+#include <tbb/blocked_range.h>
+#include <tbb/parallel_for.h>
 #include <Python.h>
 #include <numpy/arrayobject.h>
 #include <complex>
@@ -130,12 +135,132 @@ private:
 };
 
 
+/** \brief Function defined by a Python callable that is evaluated at all
+  points of a set of elements in a single call.
+
+  The callable is invoked as <tt>callable(x, n, domain_index, result)</tt>,
+  where \p x and \p n are (3, N) arrays of points and normals,
+  \p domain_index is an N-vector of domain indices and \p result is a
+  (components, N) array to be filled by the callable. */
+template <typename ValueType_>
+class VectorizedPythonFunction : public Fiber::Function<ValueType_>
+{
+public:
+    typedef ValueType_ ValueType;
+    typedef typename Fiber::ScalarTraits<ValueType>::RealType CoordinateType;
+
+    VectorizedPythonFunction(
+        PyObject* callable,
+        int argumentDimension, int resultDimension) :
+            m_callable(callable),
+            m_argumentDimension(argumentDimension),
+            m_resultDimension(resultDimension)
+            {
+                Py_INCREF(m_callable);
+            }
+
+    ~VectorizedPythonFunction(){
+
+        Py_DECREF(m_callable);
+
+    }
+
+    virtual int worldDimension() const {
+        return m_argumentDimension;
+    }
+
+    virtual int codomainDimension() const {
+        return m_resultDimension;
+    }
+
+    virtual void addGeometricalDependencies(size_t &geomDeps) const {
+        geomDeps |= Fiber::GLOBALS | Fiber::NORMALS | Fiber::DOMAIN_INDEX;
+    }
+
+    virtual void evaluate(const Fiber::GeometricalData<CoordinateType> &geomData,
+                          Matrix<ValueType> &result) const {
+
+        std::vector<const Fiber::GeometricalData<CoordinateType>*> geomDataPtrs(
+                1, &geomData);
+        std::vector<Matrix<ValueType>> results;
+        evaluateOnElements(geomDataPtrs, results);
+        result = results[0];
+    }
+
+    virtual void evaluateOnElements(
+        const std::vector<const Fiber::GeometricalData<CoordinateType>*> &geomData,
+        std::vector<Matrix<ValueType>> &result) const {
+
+        npy_intp pointCount = 0;
+        for (size_t i = 0; i < geomData.size(); ++i)
+            pointCount += geomData[i]->pointCount();
+
+        npy_intp argumentDims[2] = {m_argumentDimension, pointCount};
+        npy_intp resultDims[2] = {m_resultDimension, pointCount};
+
+        PyObject* x = PyArray_ZEROS(2, argumentDims, NumpyType<CoordinateType>::value, 0);
+        PyObject* normals = PyArray_ZEROS(2, argumentDims, NumpyType<CoordinateType>::value, 0);
+        PyObject* domainIndices = PyArray_ZEROS(1, &pointCount, NPY_INT, 0);
+        PyObject* values = PyArray_ZEROS(2, resultDims, NumpyType<ValueType>::value, 0);
+
+        CoordinateType* xPtr = (CoordinateType*)PyArray_DATA(x);
+        CoordinateType* normalPtr = (CoordinateType*)PyArray_DATA(normals);
+        int* domainIndexPtr = (int*)PyArray_DATA(domainIndices);
+
+        npy_intp offset = 0;
+        for (size_t i = 0; i < geomData.size(); ++i) {
+            const int elementPointCount = geomData[i]->pointCount();
+            for (int j = 0; j < elementPointCount; ++j) {
+                for (int dim = 0; dim < m_argumentDimension; ++dim) {
+                    xPtr[dim * pointCount + offset + j] = geomData[i]->globals(dim, j);
+                    normalPtr[dim * pointCount + offset + j] = geomData[i]->normals(dim, j);
+                }
+                domainIndexPtr[offset + j] = geomData[i]->domainIndex;
+            }
+            offset += elementPointCount;
+        }
+
+        PyObject* output = PyObject_CallFunctionObjArgs(
+            m_callable, x, normals, domainIndices, values, NULL);
+        Py_DECREF(x);
+        Py_DECREF(normals);
+        Py_DECREF(domainIndices);
+        if (!output){
+            Py_DECREF(values);
+            throw std::runtime_error("Error in evaluation of Python callable.");
+        }
+        Py_DECREF(output);
+
+        const ValueType* valuePtr = (const ValueType*)PyArray_DATA(values);
+
+        result.resize(geomData.size());
+        offset = 0;
+        for (size_t i = 0; i < geomData.size(); ++i) {
+            const int elementPointCount = geomData[i]->pointCount();
+            result[i].resize(m_resultDimension, elementPointCount);
+            for (int j = 0; j < elementPointCount; ++j)
+                for (int dim = 0; dim < m_resultDimension; ++dim)
+                    result[i](dim, j) = valuePtr[dim * pointCount + offset + j];
+            offset += elementPointCount;
+        }
+
+        Py_DECREF(values);
+    }
+
+private:
+    PyObject* m_callable;
+    int m_argumentDimension;
+    int m_resultDimension;
+
+};
+
+
 template <typename BasisFunctionType, typename ResultType>
 Vector<ResultType> reallyCalculateProjections(
     const Space<BasisFunctionType> &dualSpace,
     Fiber::LocalAssemblerForGridFunctions<ResultType> &assembler,
-    const AssemblyOptions &options) {
-  // TODO: parallelise using TBB (the parameter options will then start be used)
+    const AssemblyOptions &options,
+    bool parallel) {
 
   // Get the grid's leaf view so that we can iterate over elements
   const GridView &view = dualSpace.gridView();
@@ -167,7 +292,23 @@ Vector<ResultType> reallyCalculateProjections(
 
   std::vector<Vector<ResultType>> localResult;
   // Evaluate local weak forms
-  assembler.evaluateLocalWeakForms(testIndices, localResult);
+  if (parallel) {
+    // The local assembler is thread-safe, so chunks of elements can be
+    // integrated concurrently. Each chunk writes to its own slice of
+    // localResult.
+    localResult.resize(elementCount);
+    tbb::parallel_for(
+        tbb::blocked_range<size_t>(0, elementCount, 256),
+        [&](const tbb::blocked_range<size_t> &range) {
+          std::vector<int> chunkIndices(testIndices.begin() + range.begin(),
+                                        testIndices.begin() + range.end());
+          std::vector<Vector<ResultType>> chunkResult;
+          assembler.evaluateLocalWeakForms(chunkIndices, chunkResult);
+          for (size_t i = 0; i < chunkResult.size(); ++i)
+            localResult[range.begin() + i].swap(chunkResult[i]);
+        });
+  } else
+    assembler.evaluateLocalWeakForms(testIndices, localResult);
 
   // Loop over test indices
   for (size_t testIndex = 0; testIndex < elementCount; ++testIndex)
@@ -186,20 +327,20 @@ Vector<ResultType> reallyCalculateProjections(
   return result;
 }
 
-/** \brief Calculate projections of the function on the basis functions of
-  the given dual space. */
+/** \brief Calculate projections of a function on the basis functions of
+  the given dual space and return them as a NumPy array.
+
+  Local integrals are computed in parallel if \p parallel is true. This
+  requires that the function can be evaluated concurrently, which is not
+  the case for Python callables. */
 template <typename BasisFunctionType, typename ResultType>
 PyObject*
-calculateProjections(const ParameterList& parameterList,
-                     PyObject* callable,
-                     const Space<BasisFunctionType> &dualSpace) {
-  
-  const Context<BasisFunctionType, ResultType> context(parameterList);
-
+projectFunction(const ParameterList& parameterList,
+                const shared_ptr<Fiber::Function<ResultType>>& globalFunction,
+                const Space<BasisFunctionType> &dualSpace,
+                bool parallel) {
 
-  auto globalFunction =  shared_ptr<Fiber::Function<ResultType>>(
-     new Fiber::SurfaceNormalAndDomainIndexDependentFunction<PythonFunctor<ResultType>>(
-         PythonFunctor<ResultType>(callable,3,dualSpace.codomainDimension())));
+  const Context<BasisFunctionType, ResultType> context(parameterList);
 
   const AssemblyOptions &options = context.assemblyOptions();
 
@@ -232,7 +373,7 @@ calculateProjections(const ParameterList& parameterList,
           globalFunction, openClHandler);
 
   Vector<ResultType> result;
-  result =  reallyCalculateProjections(dualSpace, *assembler, options);
+  result =  reallyCalculateProjections(dualSpace, *assembler, options, parallel);
 
   npy_intp pyResultDimension = dualSpace.globalDofCount();
   PyObject* pyResult = PyArray_ZEROS(1,&pyResultDimension,NumpyType<ResultType>::value,1);
@@ -243,8 +384,47 @@ calculateProjections(const ParameterList& parameterList,
   return pyResult;
 }
 
+/** \brief Calculate projections of the function on the basis functions of
+  the given dual space.
 
+  If \p vectorized is true, the callable is evaluated on all quadrature
+  points of a batch of elements at once (see VectorizedPythonFunction).
+  Otherwise it is called separately for each point. */
+template <typename BasisFunctionType, typename ResultType>
+PyObject*
+calculateProjections(const ParameterList& parameterList,
+                     PyObject* callable,
+                     const Space<BasisFunctionType> &dualSpace,
+                     bool vectorized) {
+
+  shared_ptr<Fiber::Function<ResultType>> globalFunction;
+  if (vectorized)
+    globalFunction.reset(new VectorizedPythonFunction<ResultType>(
+        callable, 3, dualSpace.codomainDimension()));
+  else
+    globalFunction.reset(
+       new Fiber::SurfaceNormalAndDomainIndexDependentFunction<PythonFunctor<ResultType>>(
+         PythonFunctor<ResultType>(callable,3,dualSpace.codomainDimension())));
+
+  return projectFunction(parameterList, globalFunction, dualSpace, false);
+}
 
+/** \brief Calculate projections of a built-in analytic function on the
+  basis functions of the given dual space.
+
+  See makeAnalyticFunction() for the meaning of \p name and \p data. The
+  local integrals are computed in parallel. */
+template <typename BasisFunctionType, typename ResultType>
+PyObject*
+calculateAnalyticProjections(const ParameterList& parameterList,
+                             const std::string& name,
+                             const std::vector<double>& data,
+                             const Space<BasisFunctionType> &dualSpace) {
+
+  return projectFunction(parameterList,
+                         makeAnalyticFunction<ResultType>(name, data),
+                         dualSpace, true);
+}
 
 } // namespace Bempp
 
@@ -5,18 +5,31 @@ from bempp.core.utils cimport ParameterList
 from bempp.core.utils cimport catch_exception
 from bempp.core.space cimport Space, c_Space
 from cython.operator cimport dereference as deref
+from libcpp cimport bool as cbool
+from libcpp.string cimport string
+from libcpp.vector cimport vector
 
 cdef extern from "bempp/core/assembly/function_projector.hpp" namespace "Bempp":
     cdef object calculateProjections "Bempp::calculateProjections<double, std::complex<double>>"(
-            const c_ParameterList&, object, const c_Space[double]&) except +catch_exception
+            const c_ParameterList&, object, const c_Space[double]&, cbool) except +catch_exception
+    cdef object calculateAnalyticProjections "Bempp::calculateAnalyticProjections<double, std::complex<double>>"(
+            const c_ParameterList&, const string&, const vector[double]&,
+            const c_Space[double]&) except +catch_exception
 
 
-def calculate_projection(ParameterList parameters not None, object fun, Space space not None):
-    """Compute the projection of a Python function onto a function space."""
+def calculate_projection(ParameterList parameters not None, object fun, Space space not None,
+                         cbool vectorized=False):
+    """Compute the projection of a Python function onto a function space.
+
+    If vectorized is True, fun is called with arrays of shape (3, N)
+    for the points and normals, an array of N domain indices and a result
+    array of shape (components, N) for batches of quadrature points.
+
+    """
 
     import numpy as np
 
-    res =  calculateProjections(deref(parameters.impl_), fun, deref(space.impl_))
+    res =  calculateProjections(deref(parameters.impl_), fun, deref(space.impl_), vectorized)
     # Check if function projection is real. If yes, return only real part of array.
     if (np.isreal(res).all()):
         return np.real(res)
@@ -24,7 +37,24 @@ def calculate_projection(ParameterList parameters not None, object fun, Space sp
         return res
 
 
+def calculate_analytic_projection(ParameterList parameters not None, name, data,
+                                  Space space not None):
+    """Compute the projection of a built-in analytic function onto a function space.
 
+    The function is identified by its name. The flat list data contains
+    its parameters, with complex numbers stored as pairs of real and
+    imaginary parts. The local integrals are computed in parallel.
 
+    """
+
+    import numpy as np
 
+    cdef string c_name = name.encode('ascii')
+    cdef vector[double] c_data = [float(d) for d in data]
 
+    res = calculateAnalyticProjections(deref(parameters.impl_), c_name, c_data,
+                                       deref(space.impl_))
+    if (np.isreal(res).all()):
+        return np.real(res)
+    else:
+        return res
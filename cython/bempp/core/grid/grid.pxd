@@ -44,6 +44,7 @@ cdef class Grid:
     cdef GridView _grid_view
     cdef object _insertion_index_to_element
     cdef object _insertion_index_to_vertex
+    cdef object __weakref__
     cpdef unsigned int vertex_insertion_index(self,Entity2 vertex)
     cpdef unsigned int element_insertion_index(self,Entity0 element)
     cpdef Entity0 element_from_insertion_index(self, int index)
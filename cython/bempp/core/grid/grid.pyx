@@ -11,6 +11,7 @@ from bempp.core.grid.entity cimport Entity0
 from bempp.core.grid.grid_view cimport c_GridView, GridView
 from bempp.core.grid.grid_view cimport _grid_view_from_unique_ptr
 from bempp.core.grid.id_set cimport IdSet
+from bempp.core.grid.codim_template cimport codim_zero, codim_two
 import numpy as _np
 cimport numpy as _np
 cimport cython
@@ -45,6 +46,9 @@ cdef extern from "bempp/grid/grid_factory.hpp" namespace "Bempp":
             vector[int]& domainIndices
     ) except +catch_exception
 
+cdef extern from "bempp/core/grid/py_grid_helper.hpp" namespace "Bempp":
+    vector[int] py_get_insertion_indices[codim](const c_Grid&) except +catch_exception
+
 cdef extern from "bempp/core/grid/py_sphere.hpp" namespace "Bempp":
 
     cdef cppclass SphereMesh:
@@ -107,6 +111,14 @@ cdef class Grid:
         return deref(self.impl_).elementInsertionIndex(
                 deref(element.impl_))
     
+    def element_insertion_indices(self):
+        """Return an array with the insertion indices of all elements in leaf view order."""
+        return _np.array(py_get_insertion_indices[codim_zero](deref(self.impl_)), dtype='intc')
+
+    def vertex_insertion_indices(self):
+        """Return an array with the insertion indices of all vertices in leaf view order."""
+        return _np.array(py_get_insertion_indices[codim_two](deref(self.impl_)), dtype='intc')
+
     cpdef Entity0 element_from_insertion_index(self, int index):
 
         if self._insertion_index_to_element is None:
@@ -170,6 +182,11 @@ cdef class Grid:
         grid.impl_.assign(deref(self.impl_).barycentricGrid())
         return grid
 
+    property unique_id:
+        """ Integer that identifies the underlying C++ grid while it is alive. """
+        def __get__(self):
+            return <size_t>self.impl_.get()
+
     property dim:
         """" Dimension of the grid. """
         def __get__(self):
@@ -281,8 +298,8 @@ def grid_from_element_data(vertices, elements, domain_indices=[]):
     cdef:
         GridParameters parameters
         double[::1, :] vert_ptr \
-                = require(vertices, "double", 'F')
-        int[::1, :] corners_ptr = require(elements, "intc", 'F')
+                = require(vertices, "double", ['F', 'W'])
+        int[::1, :] corners_ptr = require(elements, "intc", ['F', 'W'])
         vector[int] indices
         Grid grid = Grid.__new__(Grid)
     for index in domain_indices:
@@ -39,7 +39,8 @@ cdef class GridView:
     cdef cbool _raw_data_is_computed 
     cdef np.ndarray _vertices
     cdef np.ndarray _elements
-    cdef vector[int] _domain_indices
+    cdef np.ndarray _domain_indices
+    cdef dict _derived_data
     cdef unique_ptr[c_GridView] impl_ 
     cdef Grid _grid
     cpdef size_t entity_count(self,int codim)
@@ -9,10 +9,20 @@ from bempp.core.grid.entity_iterator cimport EntityIterator1
 from bempp.core.grid.entity_iterator cimport EntityIterator2
 from bempp.core.utils.eigen cimport eigen_matrix_to_np_float64, eigen_matrix_to_np_int
 from bempp.core.utils cimport Matrix, Vector
+from bempp.core.utils cimport catch_exception
 
 import numpy as _np
 cimport numpy as _np
 
+cdef extern from "bempp/core/grid/py_grid_helper.hpp" namespace "Bempp":
+    Matrix[int] py_get_element_edges(const c_GridView&) except +catch_exception
+
+
+def _read_only(array):
+    """Mark a NumPy array as read-only and return it."""
+    array.flags.writeable = False
+    return array
+
 
 cdef class GridView:
     """GridView information
@@ -23,6 +33,7 @@ cdef class GridView:
 
     def __cinit__(self):
         self._raw_data_is_computed = False
+        self._derived_data = {}
 
     def __dealloc__(self):
         self.impl_.reset()
@@ -75,14 +86,51 @@ cdef class GridView:
             Matrix[double] vertices
             Matrix[int] elements
             Matrix[char] aux_data
-
-        deref(self.impl_).getRawElementData(vertices,elements,aux_data,self._domain_indices)
-
-        self._vertices = eigen_matrix_to_np_float64(vertices)
-        self._elements = eigen_matrix_to_np_int(elements)[:-1,:] # Last row not needed for triangular grids
-
-        return
-
+            vector[int] domain_indices
+
+        deref(self.impl_).getRawElementData(vertices,elements,aux_data,domain_indices)
+
+        self._vertices = _read_only(eigen_matrix_to_np_float64(vertices))
+        self._elements = _read_only(eigen_matrix_to_np_int(elements)[:-1,:]) # Last row not needed for triangular grids
+        self._domain_indices = _read_only(_np.array(domain_indices, dtype='intc'))
+        self._raw_data_is_computed = True
+
+    def _cached(self, name, compute):
+        """Return the derived quantity name and compute it on first access."""
+        if name not in self._derived_data:
+            self._derived_data[name] = _read_only(compute())
+        return self._derived_data[name]
+
+    def _compute_normals_and_areas(self):
+        corners = self.vertices[:, self.elements]
+        normals = _np.cross(corners[:, 1, :] - corners[:, 0, :],
+                            corners[:, 2, :] - corners[:, 0, :], axis=0)
+        lengths = _np.linalg.norm(normals, axis=0)
+        self._cached('areas', lambda: .5 * lengths)
+        self._cached('normals', lambda: normals / lengths)
+
+    def _compute_edge_adjacency(self):
+        element_edges = self.element_edges
+        number_of_elements = element_edges.shape[1]
+        edge_ids = element_edges.ravel()
+        element_ids = _np.tile(_np.arange(number_of_elements, dtype='intc'), 3)
+
+        order = _np.argsort(edge_ids, kind='mergesort')
+        sorted_edges = edge_ids[order]
+        first = _np.ones(len(sorted_edges), dtype='bool')
+        first[1:] = sorted_edges[1:] != sorted_edges[:-1]
+        second = _np.zeros(len(sorted_edges), dtype='bool')
+        second[1:] = ~first[1:] & first[:-1]
+
+        adjacency = -_np.ones((2, self.entity_count(1)), dtype='intc')
+        adjacency[0, sorted_edges[first]] = element_ids[order[first]]
+        adjacency[1, sorted_edges[second]] = element_ids[order[second]]
+        return adjacency
+
+    def _compute_element_neighbors(self):
+        adjacency = self.edge_adjacency[:, self.element_edges]
+        return _np.where(adjacency[0] == _np.arange(adjacency.shape[2]),
+                         adjacency[1], adjacency[0]).astype('intc')
 
     def entity_iterator(self,codim):
         """Return iterator for entities of given codim."""
@@ -126,6 +174,71 @@ cdef class GridView:
             self._compute_raw_element_data()
             return self._domain_indices
 
+    property normals:
+        """ Return a (3 x n_elements) array with the unit normals of the elements. """
+
+        def __get__(self):
+            if 'normals' not in self._derived_data:
+                self._compute_normals_and_areas()
+            return self._derived_data['normals']
+
+    property areas:
+        """ Return the areas of the elements. """
+
+        def __get__(self):
+            if 'areas' not in self._derived_data:
+                self._compute_normals_and_areas()
+            return self._derived_data['areas']
+
+    property centroids:
+        """ Return a (3 x n_elements) array with the centroids of the elements. """
+
+        def __get__(self):
+            return self._cached('centroids',
+                                lambda: _np.mean(self.vertices[:, self.elements], axis=1))
+
+    property element_edges:
+        """ Return a (3 x n_elements) array with the edge indices of the elements. """
+
+        def __get__(self):
+            return self._cached('element_edges', lambda: eigen_matrix_to_np_int(
+                py_get_element_edges(deref(self.impl_))))
+
+    property edges:
+        """ Return a (2 x n_edges) array with the vertex indices of the edges. """
+
+        def __get__(self):
+            def compute():
+                # Local vertices of the edges of the reference triangle
+                local_vertices = [(0, 1), (0, 2), (1, 2)]
+                edges = _np.zeros((2, self.entity_count(1)), dtype='intc')
+                for i, (first, second) in enumerate(local_vertices):
+                    edges[0, self.element_edges[i]] = self.elements[first]
+                    edges[1, self.element_edges[i]] = self.elements[second]
+                return edges
+            return self._cached('edges', compute)
+
+    property edge_adjacency:
+        """ Return a (2 x n_edges) array with the indices of the elements adjacent to each edge.
+
+        The second row is -1 for edges with only one adjacent element.
+
+        """
+
+        def __get__(self):
+            return self._cached('edge_adjacency', self._compute_edge_adjacency)
+
+    property element_neighbors:
+        """ Return a (3 x n_elements) array with the neighbors of the elements.
+
+        Entry (i, j) is the index of the element that shares the ith edge
+        of element j or -1 if there is no such element.
+
+        """
+
+        def __get__(self):
+            return self._cached('element_neighbors', self._compute_element_neighbors)
+
 
 
 cdef GridView _grid_view_from_unique_ptr(unique_ptr[c_GridView]& c_view):
@@ -0,0 +1,64 @@
+#ifndef bempp_py_grid_helper_hpp
+#define bempp_py_grid_helper_hpp
+
+#include "bempp/grid/grid.hpp"
+#include "bempp/grid/grid_view.hpp"
+#include "bempp/grid/index_set.hpp"
+#include "bempp/grid/entity.hpp"
+#include "bempp/grid/entity_iterator.hpp"
+#include "bempp/common/eigen_support.hpp"
+
+#include <memory>
+#include <vector>
+
+namespace Bempp {
+
+    inline unsigned int py_insertion_index(const Grid& grid, const Entity<0>& element)
+    {
+        return grid.elementInsertionIndex(element);
+    }
+
+    inline unsigned int py_insertion_index(const Grid& grid, const Entity<2>& vertex)
+    {
+        return grid.vertexInsertionIndex(vertex);
+    }
+
+    /** \brief Return the insertion indices of all entities of codimension
+     *  codim (0 or 2), ordered by their index in the leaf view. */
+    template <int codim>
+    inline std::vector<int> py_get_insertion_indices(const Grid& grid)
+    {
+        std::unique_ptr<GridView> view = grid.leafView();
+        const IndexSet& indexSet = view->indexSet();
+        std::vector<int> result(view->entityCount(codim));
+
+        std::unique_ptr<EntityIterator<codim>> it = view->template entityIterator<codim>();
+        while (!it->finished()) {
+            const Entity<codim>& entity = it->entity();
+            result[indexSet.entityIndex(entity)] = py_insertion_index(grid, entity);
+            it->next();
+        }
+        return result;
+    }
+
+    /** \brief Return a (3 x n_elements) matrix whose column j contains the
+     *  indices of the edges of the element with index j in the view. */
+    inline Matrix<int> py_get_element_edges(const GridView& view)
+    {
+        const IndexSet& indexSet = view.indexSet();
+        Matrix<int> result(3, view.entityCount(0));
+
+        std::unique_ptr<EntityIterator<0>> it = view.entityIterator<0>();
+        while (!it->finished()) {
+            const Entity<0>& element = it->entity();
+            const int index = indexSet.entityIndex(element);
+            for (int i = 0; i < 3; ++i)
+                result(i, index) = indexSet.subEntityIndex(element, i, 1);
+            it->next();
+        }
+        return result;
+    }
+
+}
+
+#endif
@@ -54,6 +54,14 @@ cdef extern from "bempp/assembly/hmat_interface.hpp":
             const c_Space[BASIS]&,
             const c_Space[BASIS]&,
             const c_ParameterList&)
+    cdef void c_keepBlockClusterTreeForAssembly "Bempp::keepBlockClusterTreeForAssembly" [BASIS](
+            const shared_ptr[const c_Space[BASIS]]&,
+            const shared_ptr[const c_Space[BASIS]]&,
+            const c_ParameterList&,
+            const shared_ptr[const c_BlockClusterTree]&)
+    cdef void c_discardKeptBlockClusterTrees "Bempp::discardKeptBlockClusterTrees" [BASIS](
+            const c_Space[BASIS]&,
+            const c_Space[BASIS]&)
 
 cdef class BlockClusterTreeNode:
     cdef shared_ptr[const c_BlockClusterTreeNode] impl_
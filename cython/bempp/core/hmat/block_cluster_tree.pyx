@@ -171,6 +171,33 @@ cdef class BlockClusterTree:
             for node in leafs:
                 yield node
 
+    property leaf_shapes:
+        """Return a list with a tuple (rows, columns, admissible) for each leaf node.
+
+        This is much faster than iterating over `leaf_nodes` for large trees.
+
+        """
+
+        def __get__(self):
+            result = []
+            _collect_leaf_shapes(deref(self.impl_).root(), result)
+            return result
+
+
+cdef _collect_leaf_shapes(shared_ptr[const c_BlockClusterTreeNode] node, list result):
+
+    cdef int i
+    cdef size_t rows, columns
+    if deref(node).isLeaf():
+        rows = (deref(deref(node).data().rowClusterTreeNode).data().indexRange[1] -
+                deref(deref(node).data().rowClusterTreeNode).data().indexRange[0])
+        columns = (deref(deref(node).data().columnClusterTreeNode).data().indexRange[1] -
+                   deref(deref(node).data().columnClusterTreeNode).data().indexRange[0])
+        result.append((rows, columns, deref(node).data().admissible))
+    else:
+        for i in range(4):
+            _collect_leaf_shapes(deref(node).child(i), result)
+
 
 def generate_block_cluster_tree(Space test_space, Space trial_space, 
         ParameterList parameter_list = None):
@@ -196,3 +223,24 @@ def generate_block_cluster_tree(Space test_space, Space trial_space,
 
 
     
+
+
+def keep_block_cluster_tree_for_assembly(Space test_space, Space trial_space,
+        BlockClusterTree block_cluster_tree, ParameterList parameter_list):
+    """Keep a block cluster tree for the next H-matrix assembly on a pair of spaces.
+
+    The tree is used once, by the next assembly on the same spaces with
+    the same admissibility and block size parameters.
+
+    """
+
+    c_keepBlockClusterTreeForAssembly[double](
+        test_space.impl_, trial_space.impl_,
+        deref(parameter_list.impl_), block_cluster_tree.impl_)
+
+
+def discard_kept_block_cluster_trees(Space test_space, Space trial_space):
+    """Discard the block cluster trees kept for a pair of spaces."""
+
+    c_discardKeptBlockClusterTrees[double](
+        deref(test_space.impl_), deref(trial_space.impl_))
@@ -112,6 +112,8 @@ def data_block_ext(discrete_operator, block_cluster_tree_node):
                 data._dtype = discrete_operator.dtype
             except:
                 raise Exception("Could not find data block.")
+            if data.impl_float64_.get() == NULL:
+                return None
             if data.block_type == 'dense':
                 return down_cast_to_dense_data(data)
             else:
@@ -123,6 +125,8 @@ def data_block_ext(discrete_operator, block_cluster_tree_node):
                 data._dtype = discrete_operator.dtype
             except:
                 raise Exception("Could not find data block.")
+            if data.impl_complex128_.get() == NULL:
+                return None
             if data.block_type == 'dense':
                 return down_cast_to_dense_data(data)
             else:
@@ -16,12 +16,12 @@ cdef extern from "bempp/operators/laplace_operators.hpp" namespace "Bempp":
     cdef shared_ptr[const c_DiscreteBoundaryOperator[double]] laplace_single_layer_potential_operator "Bempp::laplaceSingleLayerPotentialOperator<double,double>"(
                 const shared_ptr[const c_Space[double]]& space,
                 const Matrix[double]& evaluation_points,
-                const c_ParameterList& parameterList) except +catch_exception
+                const c_ParameterList& parameterList) nogil except +catch_exception
 
     cdef shared_ptr[const c_DiscreteBoundaryOperator[double]] laplace_double_layer_potential_operator "Bempp::laplaceDoubleLayerPotentialOperator<double,double>"(
                 const shared_ptr[const c_Space[double]]& space,
                 const Matrix[double]& evaluation_points,
-                const c_ParameterList& parameterList) except +catch_exception
+                const c_ParameterList& parameterList) nogil except +catch_exception
 
 
 def single_layer_ext(Space space not None,
@@ -33,10 +33,13 @@ def single_layer_ext(Space space not None,
         points = _np.require(evaluation_points,"double","F")
 
         cdef RealDiscreteBoundaryOperator op = RealDiscreteBoundaryOperator()
+        cdef Matrix[double] c_points = np_to_eigen_matrix_float64(points)
+        cdef shared_ptr[const c_DiscreteBoundaryOperator[double]] potential
 
-        op.impl_.assign(
-             laplace_single_layer_potential_operator(
-                 space.impl_,np_to_eigen_matrix_float64(points),deref(parameters.impl_)))
+        with nogil:
+            potential = laplace_single_layer_potential_operator(
+                space.impl_, c_points, deref(parameters.impl_))
+        op.impl_.assign(potential)
         return op
 
                 
@@ -49,8 +52,11 @@ def double_layer_ext(Space space not None,
         points = _np.require(evaluation_points,"double","F")
 
         cdef RealDiscreteBoundaryOperator op = RealDiscreteBoundaryOperator()
+        cdef Matrix[double] c_points = np_to_eigen_matrix_float64(points)
+        cdef shared_ptr[const c_DiscreteBoundaryOperator[double]] potential
 
-        op.impl_.assign(
-             laplace_double_layer_potential_operator(
-                 space.impl_,np_to_eigen_matrix_float64(points),deref(parameters.impl_)))
+        with nogil:
+            potential = laplace_double_layer_potential_operator(
+                space.impl_, c_points, deref(parameters.impl_))
+        op.impl_.assign(potential)
         return op
@@ -19,13 +19,13 @@ cdef extern from "bempp/operators/modified_helmholtz_operators.hpp" namespace "B
                 const shared_ptr[const c_Space[double]]& space,
                 const Matrix[double]& evaluation_points,
                 complex_double wave_number,
-                const c_ParameterList& parameterList) except +catch_exception
+                const c_ParameterList& parameterList) nogil except +catch_exception
 
     cdef shared_ptr[const c_DiscreteBoundaryOperator[complex_double]] modified_helmholtz_double_layer_potential_discrete_operator "Bempp::modifiedHelmholtzDoubleLayerPotentialOperator<double, std::complex<double>>"(
                 const shared_ptr[const c_Space[double]]& space,
                 const Matrix[double]& evaluation_points,
                 complex_double wave_number,
-                const c_ParameterList& parameterList) except +catch_exception
+                const c_ParameterList& parameterList) nogil except +catch_exception
 
 
 def single_layer_ext(Space space not None,
@@ -39,12 +39,14 @@ def single_layer_ext(Space space not None,
         points = _np.require(evaluation_points,"double","F")
 
         cdef ComplexDiscreteBoundaryOperator op = ComplexDiscreteBoundaryOperator()
+        cdef Matrix[double] c_points = np_to_eigen_matrix_float64(points)
+        cdef complex_double c_wave_number = complex_double(_np.real(wave_number), _np.imag(wave_number))
+        cdef shared_ptr[const c_DiscreteBoundaryOperator[complex_double]] potential
 
-        op.impl_.assign(
-             modified_helmholtz_single_layer_potential_discrete_operator(
-                 space.impl_,np_to_eigen_matrix_float64(points),
-                 complex_double(_np.real(wave_number), _np.imag(wave_number)),
-                 deref(parameters.impl_)))
+        with nogil:
+            potential = modified_helmholtz_single_layer_potential_discrete_operator(
+                space.impl_, c_points, c_wave_number, deref(parameters.impl_))
+        op.impl_.assign(potential)
         return op
 
                 
@@ -59,10 +61,12 @@ def double_layer_ext(Space space not None,
         points = _np.require(evaluation_points,"double","F")
 
         cdef ComplexDiscreteBoundaryOperator op = ComplexDiscreteBoundaryOperator()
+        cdef Matrix[double] c_points = np_to_eigen_matrix_float64(points)
+        cdef complex_double c_wave_number = complex_double(_np.real(wave_number), _np.imag(wave_number))
+        cdef shared_ptr[const c_DiscreteBoundaryOperator[complex_double]] potential
 
-        op.impl_.assign(
-             modified_helmholtz_double_layer_potential_discrete_operator(
-                 space.impl_,np_to_eigen_matrix_float64(points),
-                 complex_double(_np.real(wave_number), _np.imag(wave_number)),
-                 deref(parameters.impl_)))
+        with nogil:
+            potential = modified_helmholtz_double_layer_potential_discrete_operator(
+                space.impl_, c_points, c_wave_number, deref(parameters.impl_))
+        op.impl_.assign(potential)
         return op
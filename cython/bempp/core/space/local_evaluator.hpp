@@ -12,6 +12,14 @@
 #include "bempp/grid/geometry.hpp"
 #include "bempp/grid/grid.hpp"
 #include "bempp/grid/entity.hpp"
+#include "bempp/grid/entity_iterator.hpp"
+#include "bempp/grid/grid_view.hpp"
+#include "bempp/grid/mapper.hpp"
+
+#include <algorithm>
+#include <map>
+#include <memory>
+#include <vector>
 
 namespace Bempp {
 
@@ -58,6 +66,116 @@ Matrix<ValueType> evaluateLocalBasis(const Space<double>& space, const Entity<0>
   return values;
 }
 
+/** \brief Collect the global DOFs and DOF weights of all elements.
+
+  On output, row \p i of \p globalDofs and \p weights contains the global
+  DOF indices and the local DOF weights of the element with index \p i in
+  the leaf view of the space. Rows are padded with -1 and 0, respectively,
+  if elements have different numbers of local DOFs. */
+inline void getLocalDofMaps(const Space<double>& space, Matrix<int>& globalDofs,
+                            Matrix<double>& weights)
+{
+  const GridView &view = space.gridView();
+  const size_t elementCount = view.entityCount(0);
+  const Mapper &mapper = view.elementMapper();
+
+  std::vector<std::vector<GlobalDofIndex>> dofs(elementCount);
+  std::vector<std::vector<double>> dofWeights(elementCount);
+  size_t maxLocalDofCount = 0;
+
+  std::unique_ptr<EntityIterator<0>> it = view.entityIterator<0>();
+  while (!it->finished()) {
+    const Entity<0> &element = it->entity();
+    const int elementIndex = mapper.entityIndex(element);
+    space.getGlobalDofs(element, dofs[elementIndex], dofWeights[elementIndex]);
+    maxLocalDofCount = std::max(maxLocalDofCount, dofs[elementIndex].size());
+    it->next();
+  }
+
+  globalDofs.resize(elementCount, maxLocalDofCount);
+  weights.resize(elementCount, maxLocalDofCount);
+  globalDofs.setConstant(-1);
+  weights.setZero();
+
+  for (size_t e = 0; e < elementCount; ++e)
+    for (size_t j = 0; j < dofs[e].size(); ++j) {
+      globalDofs(e, j) = dofs[e][j];
+      weights(e, j) = dofWeights[e][j];
+    }
+}
+
+/** \brief Evaluate a function on all elements of a space.
+
+  Column \p e of \p localCoefficients contains the local coefficients of
+  the function on the element with index \p e in the leaf view. The
+  returned matrix has one row per component and the function value on
+  element \p e at the local point \p p in column
+  <tt>e * local.cols() + p</tt>. */
+template <typename ValueType>
+Matrix<ValueType> evaluateOnAllElements(const Space<double>& space,
+        const Matrix<double>& local, const Matrix<ValueType>& localCoefficients)
+{
+
+  if (local.rows() != space.grid()->dim())
+    throw std::invalid_argument("evaluateOnAllElements(): points in 'local' have an "
+                                "invalid number of coordinates");
+
+  const GridView &view = space.gridView();
+  const size_t elementCount = view.entityCount(0);
+  const Mapper &mapper = view.elementMapper();
+
+  if (localCoefficients.cols() != elementCount)
+    throw std::invalid_argument("evaluateOnAllElements(): wrong number of "
+                                "columns in 'localCoefficients'");
+
+  const int nComponents = space.codomainDimension();
+  const int pointCount = local.cols();
+  Matrix<ValueType> values(nComponents, elementCount * pointCount);
+  values.setZero();
+
+  size_t basisDeps = 0, geomDeps = 0;
+  const Fiber::CollectionOfShapesetTransformations<double>
+      &transformations = space.basisFunctionValue();
+  transformations.addDependencies(basisDeps, geomDeps);
+
+  // Shapesets are usually shared by all elements, so evaluate the basis
+  // data only once per distinct shapeset.
+  std::map<const Fiber::Shapeset<double> *, Fiber::BasisData<double>> basisDataCache;
+
+  Fiber::GeometricalData<double> geomData;
+  Fiber::CollectionOf3dArrays<double> functionValues;
+
+  std::unique_ptr<EntityIterator<0>> it = view.entityIterator<0>();
+  while (!it->finished()) {
+    const Entity<0> &element = it->entity();
+    const int elementIndex = mapper.entityIndex(element);
+
+    const Fiber::Shapeset<double> &shapeset = space.shapeset(element);
+    typename std::map<const Fiber::Shapeset<double> *,
+                      Fiber::BasisData<double>>::iterator basisData =
+        basisDataCache.find(&shapeset);
+    if (basisData == basisDataCache.end()) {
+      basisData = basisDataCache.insert(std::make_pair(
+          &shapeset, Fiber::BasisData<double>())).first;
+      shapeset.evaluate(basisDeps, local, ALL_DOFS, basisData->second);
+    }
+
+    element.geometry().getData(geomDeps, local, geomData);
+    transformations.evaluate(basisData->second, geomData, functionValues);
+
+    const size_t offset = elementIndex * pointCount;
+    for (size_t p = 0; p < functionValues[0].extent(2); ++p)
+      for (size_t f = 0; f < functionValues[0].extent(1); ++f)
+        for (size_t dim = 0; dim < functionValues[0].extent(0); ++dim)
+          values(dim, offset + p) +=
+              functionValues[0](dim, f, p) * localCoefficients(f, elementIndex);
+
+    it->next();
+  }
+
+  return values;
+}
+
 }
 
 #endif
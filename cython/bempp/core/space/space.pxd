@@ -36,6 +36,10 @@ cdef class Space:
 cdef extern from "bempp/core/space/local_evaluator.hpp" namespace "Bempp":
     cdef Matrix[T] c_evaluateLocalBasis "Bempp::evaluateLocalBasis"[T](const c_Space[double]&,
             const c_Entity[codim_zero]&, const Matrix[double]&, const Vector[T]&) except +catch_exception
+    cdef void c_getLocalDofMaps "Bempp::getLocalDofMaps"(const c_Space[double]&,
+            Matrix[int]&, Matrix[double]&) except +catch_exception
+    cdef Matrix[T] c_evaluateOnAllElements "Bempp::evaluateOnAllElements"[T](const c_Space[double]&,
+            const Matrix[double]&, const Matrix[T]&) except +catch_exception
 
 # Define all possible spaces
 
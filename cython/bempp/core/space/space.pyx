@@ -1,5 +1,6 @@
 from cython.operator cimport dereference as deref
 from bempp.core.utils cimport Matrix
+from bempp.core.utils.eigen cimport eigen_matrix_to_np_int
 from bempp.core.utils.shared_ptr cimport reverse_const_pointer_cast
 from bempp.core.utils.shared_ptr cimport const_pointer_cast
 from bempp.core.utils cimport eigen_matrix_to_np_float64
@@ -120,6 +121,39 @@ cdef class Space:
                                                         np_to_eigen_vector_complex128(local_coefficients)))
 
 
+    def local_dof_maps(self):
+        """Return the global dofs and dof weights of all elements.
+
+        The result is a tuple (global_dofs, weights) of arrays with one
+        row per element. Rows are padded with -1 and 0 if elements have
+        different numbers of local dofs.
+
+        """
+        cdef Matrix[int] global_dofs
+        cdef Matrix[double] weights
+        c_getLocalDofMaps(deref(self.impl_), global_dofs, weights)
+        return eigen_matrix_to_np_int(global_dofs), eigen_matrix_to_np_float64(weights)
+
+    def evaluate_on_all_elements(self, object local_coordinates, object local_coefficients):
+        """Evaluate a function on all elements.
+
+        Column i of local_coefficients contains the local coefficients on the
+        element with index i. The result has shape (components, n_elements * n_points).
+
+        """
+
+        import numpy as np
+
+        if np.isreal(local_coefficients).all():
+            return eigen_matrix_to_np_float64(
+                    c_evaluateOnAllElements[double](deref(self.impl_),
+                                                    np_to_eigen_matrix_float64(local_coordinates),
+                                                    np_to_eigen_matrix_float64(np.real(local_coefficients))))
+        else:
+            return eigen_matrix_to_np_complex128(
+                    c_evaluateOnAllElements[complex_double](deref(self.impl_),
+                                                            np_to_eigen_matrix_float64(local_coordinates),
+                                                            np_to_eigen_matrix_complex128(local_coefficients)))
 
            
     property global_dof_interpolation_points:
@@ -5,19 +5,19 @@ from bempp.core.utils.complex cimport complex_double
 from cython.operator cimport dereference as deref
 
 cdef Matrix[double] np_to_eigen_matrix_float64(np.ndarray x):
-    cdef double[::1,:] buf = np.require(x,dtype='float64',requirements=['A','F'])
+    cdef double[::1,:] buf = np.require(x,dtype='float64',requirements=['A','F','W'])
     return copy_buf_to_mat[double](<double*>&buf[0,0],buf.shape[0],buf.shape[1])
 
 cdef Matrix[complex_double] np_to_eigen_matrix_complex128(np.ndarray x):
-    cdef double complex[::1,:] buf = np.require(x,dtype='complex128',requirements=['A','F'])
+    cdef double complex[::1,:] buf = np.require(x,dtype='complex128',requirements=['A','F','W'])
     return copy_buf_to_mat[complex_double](<complex_double*>&buf[0,0],buf.shape[0],buf.shape[1])
 
 cdef Vector[double] np_to_eigen_vector_float64(np.ndarray x):
-    cdef double[::1] buf = np.require(x,dtype='float64',requirements=['A','F'])
+    cdef double[::1] buf = np.require(x,dtype='float64',requirements=['A','F','W'])
     return copy_buf_to_vec[double](<double*>&buf[0],buf.shape[0])
 
 cdef Vector[complex_double] np_to_eigen_vector_complex128(np.ndarray x):
-    cdef double complex[::1] buf = np.require(x,dtype='complex128',requirements=['A','F'])
+    cdef double complex[::1] buf = np.require(x,dtype='complex128',requirements=['A','F','W'])
     return copy_buf_to_vec[complex_double](<complex_double*>&buf[0],buf.shape[0])
 
 @cython.boundscheck(False)
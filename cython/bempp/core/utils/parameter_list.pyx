@@ -64,6 +64,56 @@ cdef class _AssemblyParameterList:
 
             cdef char* s = b"options.assembly.enableSingularIntegralCaching"           
             deref(self.impl_).put_bool(s,value)
+
+    property blas_in_quadrature:
+
+        def __get__(self):
+
+            cdef char* s = b"options.assembly.blasInQuadrature"
+            return (deref(self.impl_).get_string(s)).decode("UTF-8")
+
+        def __set__(self,object value):
+
+            cdef char* s = b"options.assembly.blasInQuadrature"
+            cdef string stringVal = _convert_to_bytes(value)
+
+            deref(self.impl_).put_string(s,stringVal)
+
+    property max_thread_count:
+
+        def __get__(self):
+
+            cdef char* s = b"options.global.maxThreadCount"
+            return deref(self.impl_).get_int(s)
+
+        def __set__(self,int value):
+
+            cdef char* s = b"options.global.maxThreadCount"
+            deref(self.impl_).put_int(s,value)
+
+    property memory_budget_mb:
+
+        def __get__(self):
+
+            cdef char* s = b"options.assembly.memoryBudgetMb"
+            return deref(self.impl_).get_double(s)
+
+        def __set__(self,double value):
+
+            cdef char* s = b"options.assembly.memoryBudgetMb"
+            deref(self.impl_).put_double(s,value)
+
+    property auto_dense_max_dof_count:
+
+        def __get__(self):
+
+            cdef char* s = b"options.assembly.autoDenseMaxDofCount"
+            return deref(self.impl_).get_int(s)
+
+        def __set__(self,int value):
+
+            cdef char* s = b"options.assembly.autoDenseMaxDofCount"
+            deref(self.impl_).put_int(s,value)
     
     property enable_interpolation_for_oscillatory_kernels:
 
@@ -85,6 +135,18 @@ cdef class _AssemblyParameterList:
             cdef char* s = b"options.assembly.interpolationPointsPerWavelength"
             deref(self.impl_).put_int(s,value)
 
+    property enable_weak_form_optimization:
+
+        def __get__(self):
+
+            cdef char* s = b"options.assembly.enableWeakFormOptimization"
+            return (deref(self.impl_).get_bool(s))
+
+        def __set__(self,cbool value):
+
+            cdef char* s = b"options.assembly.enableWeakFormOptimization"
+            deref(self.impl_).put_bool(s,value)
+
 cdef class _NearField:
 
     def __init__(self,_QuadratureParameterList base):
@@ -296,6 +358,22 @@ cdef class _HMatParameterList:
             cdef char* s = b"options.hmat.matVecParallelLevels"
             deref(self.impl_).put_int(s,value)
 
+    property leaf_partition_index:
+        def __get__(self):
+            cdef char* s = b"options.hmat.leafPartitionIndex"
+            return deref(self.impl_).get_int(s)
+        def __set__(self,int value):
+            cdef char* s = b"options.hmat.leafPartitionIndex"
+            deref(self.impl_).put_int(s,value)
+
+    property leaf_partition_count:
+        def __get__(self):
+            cdef char* s = b"options.hmat.leafPartitionCount"
+            return deref(self.impl_).get_int(s)
+        def __set__(self,int value):
+            cdef char* s = b"options.hmat.leafPartitionCount"
+            deref(self.impl_).put_int(s,value)
+
 cdef class ParameterList:
 
     def __cinit__(self):
@@ -316,6 +394,12 @@ cdef class ParameterList:
     def __dealloc__(self):
         del self.impl_
 
+    def copy(self):
+        """Return an independent copy of the parameter list."""
+        cdef ParameterList p = ParameterList()
+        deref(p.impl_).assign(deref(self.impl_))
+        return p
+
     property assembly:
 
         def __get__(self):
@@ -29,6 +29,7 @@
 #include <boost/type_traits/is_complex.hpp>
 #include <stdexcept>
 #include <tbb/atomic.h>
+#include <tbb/task_arena.h>
 
 namespace Bempp {
 
@@ -113,7 +114,19 @@ template <typename BasisFunctionType, typename ResultType>
 shared_ptr<DiscreteBoundaryOperator<ResultType>>
 AbstractBoundaryOperator<BasisFunctionType, ResultType>::assembleWeakForm(
     const Context<BasisFunctionType, ResultType> &context) const {
-  return this->assembleWeakFormImpl(context);
+  const int maxThreadCount =
+      context.assemblyOptions().parallelizationOptions().maxThreadCount();
+  if (maxThreadCount == ParallelizationOptions::AUTO)
+    return this->assembleWeakFormImpl(context);
+
+  // Run the assembly in its own arena so that operators assembled
+  // concurrently from several threads do not oversubscribe the machine.
+  // Products of the weak form are limited in the same way.
+  shared_ptr<DiscreteBoundaryOperator<ResultType>> result;
+  tbb::task_arena arena(maxThreadCount);
+  arena.execute([&]() { result = this->assembleWeakFormImpl(context); });
+  result->setMaxThreadCount(maxThreadCount);
+  return result;
 }
 
 template <typename BasisFunctionType, typename ResultType>
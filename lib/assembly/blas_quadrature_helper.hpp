@@ -41,6 +41,20 @@ shouldUseBlasInQuadrature(const AssemblyOptions &assemblyOptions,
            maximumShapesetOrder(dualToRange) >= 2));
 }
 
+/** \brief Return true if integrands with a batched (BLAS) implementation
+ *  should use it.
+ *
+ *  The Maxwell and hypersingular integrands consist of several terms per
+ *  pair of quadrature points. The batched path evaluates each kernel value
+ *  once per point pair and contracts it with the basis values in matrix
+ *  products, which pays off already for order 1 shapesets (compare the
+ *  blas_quadrature cases of bempp.api.benchmarks). Unlike
+ *  shouldUseBlasInQuadrature() it is therefore used for all shapeset orders
+ *  unless BLAS in quadrature has been disabled. */
+inline bool shouldUseBatchedQuadrature(const AssemblyOptions &assemblyOptions) {
+  return assemblyOptions.isBlasEnabledInQuadrature() != AssemblyOptions::NO;
+}
+
 } // namespace
 
 #endif
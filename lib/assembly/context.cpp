@@ -58,7 +58,9 @@ Context<BasisFunctionType, ResultType>::Context(
       "options.assembly.boundaryOperatorAssemblyType",
       defaults.get<std::string>(
           "options.assembly.boundaryOperatorAssemblyType"));
-  if (assemblyType == "hmat")
+  // "auto" is resolved per operator before the weak form is assembled.
+  // Everything else that creates a context does not depend on the mode.
+  if (assemblyType == "hmat" || assemblyType == "auto")
     m_assemblyOptions.switchToHMatMode();
   else if (assemblyType == "dense")
     m_assemblyOptions.switchToDenseMode();
@@ -89,7 +91,18 @@ Context<BasisFunctionType, ResultType>::Context(
       "options.assembly.enableSingularIntegralCaching",
       defaults.get<bool>("options.assembly.enableSingularIntegralCaching")));
 
-  m_assemblyOptions.enableBlasInQuadrature(AssemblyOptions::AUTO);
+  std::string blasInQuadrature = parameters.get<std::string>(
+      "options.assembly.blasInQuadrature",
+      defaults.get<std::string>("options.assembly.blasInQuadrature"));
+  if (blasInQuadrature == "auto")
+    m_assemblyOptions.enableBlasInQuadrature(AssemblyOptions::AUTO);
+  else if (blasInQuadrature == "yes")
+    m_assemblyOptions.enableBlasInQuadrature(AssemblyOptions::YES);
+  else if (blasInQuadrature == "no")
+    m_assemblyOptions.enableBlasInQuadrature(AssemblyOptions::NO);
+  else
+    throw std::runtime_error(
+        "Context::Context(): blasInQuadrature has unsupported value.");
 
   Fiber::AccuracyOptionsEx accuracyOptions;
 
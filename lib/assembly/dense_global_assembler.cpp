@@ -27,6 +27,7 @@
 #include "discrete_dense_boundary_operator.hpp"
 #include "context.hpp"
 
+#include "../common/assembly_profiler.hpp"
 #include "../common/auto_timer.hpp"
 #include "../common/multidimensional_arrays.hpp"
 #include "../common/not_implemented_error.hpp"
@@ -78,6 +79,7 @@ public:
         m_result(result), m_mutex(mutex) {}
 
   void operator()(const tbb::blocked_range<int> &r) const {
+    ScopedBusyTimer busyTimer;
     const int testElementCount = m_testIndices.size();
     std::vector<Matrix<ResultType>> localResult;
     for (int trialIndex = r.begin(); trialIndex != r.end(); ++trialIndex) {
@@ -273,12 +275,15 @@ DenseGlobalAssembler<BasisFunctionType, ResultType>::assembleDetachedWeakForm(
   std::vector<std::vector<GlobalDofIndex>> testGlobalDofs, trialGlobalDofs;
   std::vector<std::vector<BasisFunctionType>> testLocalDofWeights,
       trialLocalDofWeights;
-  gatherGlobalDofs(testSpace, testGlobalDofs, testLocalDofWeights);
-  if (&testSpace == &trialSpace) {
-    trialGlobalDofs = testGlobalDofs;
-    trialLocalDofWeights = testLocalDofWeights;
-  } else
-    gatherGlobalDofs(trialSpace, trialGlobalDofs, trialLocalDofWeights);
+  {
+    ScopedPhaseTimer timer("geometry_and_dof_lists");
+    gatherGlobalDofs(testSpace, testGlobalDofs, testLocalDofWeights);
+    if (&testSpace == &trialSpace) {
+      trialGlobalDofs = testGlobalDofs;
+      trialLocalDofWeights = testLocalDofWeights;
+    } else
+      gatherGlobalDofs(trialSpace, trialGlobalDofs, trialLocalDofWeights);
+  }
   const int testElementCount = testGlobalDofs.size();
   const int trialElementCount = trialGlobalDofs.size();
 
@@ -305,6 +310,7 @@ DenseGlobalAssembler<BasisFunctionType, ResultType>::assembleDetachedWeakForm(
   typename Body::MutexType mutex;
 
   {
+    ScopedPhaseTimer timer("dense_assembly");
     Fiber::SerialBlasRegion region;
     tbb::parallel_for(tbb::blocked_range<int>(0, trialElementCount),
                       Body(testIndices, testGlobalDofs, trialGlobalDofs,
@@ -29,6 +29,8 @@
 #include "../fiber/explicit_instantiation.hpp"
 #include "../fiber/scalar_traits.hpp"
 
+#include <tbb/task_arena.h>
+
 namespace Bempp {
 
 template <typename ValueType>
@@ -106,6 +108,24 @@ void DiscreteBoundaryOperator<ValueType>::apply(
   applyBuiltInImpl(trans, x_in, y_inout, alpha, beta);
 }
 
+namespace {
+
+// Releases the GIL for the lifetime of the object and reacquires it
+// even if an exception is thrown.
+class ReleaseGil {
+public:
+  ReleaseGil() : m_state(PyEval_SaveThread()) {}
+  ~ReleaseGil() { PyEval_RestoreThread(m_state); }
+
+private:
+  ReleaseGil(const ReleaseGil &other);
+  ReleaseGil &operator=(const ReleaseGil &other);
+
+  PyThreadState *m_state;
+};
+
+} // namespace
+
 template <typename ValueType>
 PyObject *
 DiscreteBoundaryOperator<ValueType>::apply(const TranspositionMode trans,
@@ -176,9 +196,21 @@ DiscreteBoundaryOperator<ValueType>::apply(const TranspositionMode trans,
           PyArray_DATA(reinterpret_cast<PyArrayObject *>(y_inout))),
       resultRows, ncols);
 
-  for (int i = 0; i < ncols; ++i)
-    this->apply(trans, Eigen::Ref<Vector<ValueType>>(x_mat.col(i)),
-                Eigen::Ref<Vector<ValueType>>(y_mat.col(i)), 1.0, 0.0);
+  {
+    // The products only touch the array data, so other Python threads
+    // can run while they are computed
+    ReleaseGil releaseGil;
+    auto applyColumns = [&]() {
+      for (int i = 0; i < ncols; ++i)
+        this->apply(trans, Eigen::Ref<Vector<ValueType>>(x_mat.col(i)),
+                    Eigen::Ref<Vector<ValueType>>(y_mat.col(i)), 1.0, 0.0);
+    };
+    if (m_maxThreadCount > 0) {
+      tbb::task_arena arena(m_maxThreadCount);
+      arena.execute(applyColumns);
+    } else
+      applyColumns();
+  }
 
   Py_DECREF(x_f);
   return y_inout;
@@ -190,6 +222,16 @@ void DiscreteBoundaryOperator<ValueType>::dump() const {
   std::cout << asMatrix() << std::endl;
 }
 
+template <typename ValueType>
+void DiscreteBoundaryOperator<ValueType>::setMaxThreadCount(
+    int maxThreadCount) {
+  m_maxThreadCount = maxThreadCount;
+}
+
+template <typename ValueType>
+int DiscreteBoundaryOperator<ValueType>::maxThreadCount() const {
+  return m_maxThreadCount;
+}
 
 FIBER_INSTANTIATE_CLASS_TEMPLATED_ON_RESULT(DiscreteBoundaryOperator);
 
@@ -106,6 +106,18 @@ public:
   /** \overload */
   PyObject *apply(const TranspositionMode trans, const PyObject *x_in) const;
 
+  /** \brief Set the maximum number of threads used by apply() on NumPy arrays.
+   *
+   *  \p maxThreadCount must be a positive number or -1 (default), which
+   *  means that all available threads are used. */
+  void setMaxThreadCount(int maxThreadCount);
+
+  /** \brief Return the maximum number of threads used by apply() on NumPy
+   *  arrays.
+   *
+   *  See setMaxThreadCount() for more information. */
+  int maxThreadCount() const;
+
   /** \brief Write a textual representation of the operator to standard output.
    *
    *  The default implementation prints the matrix returned by asMatrix().
@@ -152,6 +164,8 @@ private:
                                 Eigen::Ref<Vector<ValueType>> y_inout,
                                 const ValueType alpha,
                                 const ValueType beta) const = 0;
+
+  int m_maxThreadCount = -1;
 };
 
 } // namespace Bempp
@@ -24,6 +24,7 @@
 #include "discrete_sparse_boundary_operator.hpp"
 #include "numerical_quadrature_strategy.hpp"
 
+#include "../common/assembly_profiler.hpp"
 #include "../fiber/explicit_instantiation.hpp"
 #include "../fiber/local_assembler_for_integral_operators.hpp"
 
@@ -93,10 +94,13 @@ ElementaryIntegralOperatorBase<BasisFunctionType, ResultType>::makeAssembler(
   shared_ptr<ShapesetPtrVector> testShapesets, trialShapesets;
   bool cacheSingularIntegrals;
 
-  this->collectDataForAssemblerConstruction(
-      options, testRawGeometry, trialRawGeometry, testGeometryFactory,
-      trialGeometryFactory, testShapesets, trialShapesets, openClHandler,
-      cacheSingularIntegrals);
+  {
+    ScopedPhaseTimer timer("geometry_and_dof_lists");
+    this->collectDataForAssemblerConstruction(
+        options, testRawGeometry, trialRawGeometry, testGeometryFactory,
+        trialGeometryFactory, testShapesets, trialShapesets, openClHandler,
+        cacheSingularIntegrals);
+  }
 
   return makeAssemblerImpl(quadStrategy, testGeometryFactory,
                            trialGeometryFactory, testRawGeometry,
@@ -30,6 +30,7 @@
 #include "discrete_hmat_boundary_operator.hpp"
 #include "hmat_interface.hpp"
 
+#include "../common/assembly_profiler.hpp"
 #include "../common/auto_timer.hpp"
 #include "../common/chunk_statistics.hpp"
 #include "../common/to_string.hpp"
@@ -145,9 +146,17 @@ HMatGlobalAssembler<BasisFunctionType, ResultType>::assembleDetachedWeakForm(
   auto blockClusterTree = generateBlockClusterTree(
       *actualTestSpace, *actualTrialSpace, parameterList);
 
-  WeakFormHMatAssemblyHelper<BasisFunctionType, ResultType> helper(
-      *actualTestSpace, *actualTrialSpace, blockClusterTree, localAssemblers,
-      sparseTermsToAdd, denseTermMultipliers, sparseTermMultipliers);
+  std::unique_ptr<WeakFormHMatAssemblyHelper<BasisFunctionType, ResultType>>
+      helperPointer;
+  {
+    ScopedPhaseTimer timer("geometry_and_dof_lists");
+    helperPointer.reset(
+        new WeakFormHMatAssemblyHelper<BasisFunctionType, ResultType>(
+            *actualTestSpace, *actualTrialSpace, blockClusterTree,
+            localAssemblers, sparseTermsToAdd, denseTermMultipliers,
+            sparseTermMultipliers));
+  }
+  auto &helper = *helperPointer;
 
   auto compressionAlgorithm = parameterList.template get<std::string>(
       "options.hmat.compressionAlgorithm");
@@ -162,21 +171,50 @@ HMatGlobalAssembler<BasisFunctionType, ResultType>::assembleDetachedWeakForm(
   if (coarseningAccuracy == 0)
     coarseningAccuracy = eps;
 
-  shared_ptr<hmat::DefaultHMatrixType<ResultType>> hMatrix;
+  // Only compress the leaves of one part of the block cluster tree if the
+  // matrix is distributed over several processes
+  auto leafPartitionIndex =
+      parameterList.template get<int>("options.hmat.leafPartitionIndex");
+  auto leafPartitionCount =
+      parameterList.template get<int>("options.hmat.leafPartitionCount");
+
+  shared_ptr<hmat::DefaultHMatrixType<ResultType>> hMatrix(
+      new hmat::DefaultHMatrixType<ResultType>(blockClusterTree,
+                                               matVecParallelLevels));
+  hMatrix->setLeafPartition(leafPartitionIndex, leafPartitionCount);
+  hMatrix->setRecordInitializationTimes(AssemblyProfiler::isEnabled());
+
+  {
+    ScopedPhaseTimer timer("hmat_compression");
+    if (compressionAlgorithm == "aca") {
+
+      hmat::HMatrixAcaCompressor<ResultType, 2> compressor(helper, eps,
+                                                           maxRank);
+      hMatrix->initialize(compressor, coarsening, coarseningAccuracy);
+    } else if (compressionAlgorithm == "dense") {
+      hmat::HMatrixDenseCompressor<ResultType, 2> compressor(helper);
+      hMatrix->initialize(compressor);
+    } else
+      throw std::runtime_error(
+          "HMatGlobalAssember::assembleDetachedWeakForm: "
+          "Unknown compression algorithm");
+  }
 
-  if (compressionAlgorithm == "aca") {
+  if (AssemblyProfiler::isEnabled()) {
+    const auto &times = hMatrix->initializationTimes();
+    for (size_t level = 0; level < times.admissibleBlocksByLevel.size();
+         ++level)
+      if (times.admissibleBlocksByLevel[level] > 0)
+        AssemblyProfiler::addPhaseTime(compressionAlgorithm + "_level_" +
+                                           toString(level),
+                                       times.admissibleBlocksByLevel[level],
+                                       true);
+    AssemblyProfiler::addPhaseTime("dense_leaves", times.inadmissibleBlocks,
+                                   true);
+    if (coarsening && leafPartitionCount == 1)
+      AssemblyProfiler::addPhaseTime("coarsening", times.coarsening, true);
+  }
 
-    hmat::HMatrixAcaCompressor<ResultType, 2> compressor(helper, eps, maxRank);
-    hMatrix.reset(new hmat::DefaultHMatrixType<ResultType>(
-        blockClusterTree, compressor, matVecParallelLevels, coarsening,
-        coarseningAccuracy));
-  } else if (compressionAlgorithm == "dense") {
-    hmat::HMatrixDenseCompressor<ResultType, 2> compressor(helper);
-    hMatrix.reset(new hmat::DefaultHMatrixType<ResultType>(
-        blockClusterTree, compressor, matVecParallelLevels));
-  } else
-    throw std::runtime_error("HMatGlobalAssember::assembleDetachedWeakForm: "
-                             "Unknown compression algorithm");
   return std::unique_ptr<DiscreteBoundaryOperator<ResultType>>(
       static_cast<DiscreteBoundaryOperator<ResultType> *>(
           new DiscreteHMatBoundaryOperator<ResultType>(hMatrix)));
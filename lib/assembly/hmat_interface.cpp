@@ -25,9 +25,43 @@
 
 #include "../fiber/explicit_instantiation.hpp"
 #include "../common/types.hpp"
+#include "../common/assembly_profiler.hpp"
+#include "../common/to_string.hpp"
+
+#include <tbb/mutex.h>
+
+#include <algorithm>
+#include <string>
+#include <vector>
 
 namespace Bempp {
 
+namespace {
+
+// A block cluster tree kept for the next assembly on a pair of spaces. The
+// spaces are held so that their addresses can not be reused by other spaces.
+struct KeptBlockClusterTree {
+  shared_ptr<const void> testSpace;
+  shared_ptr<const void> trialSpace;
+  std::string clusterParameters;
+  shared_ptr<const hmat::DefaultBlockClusterTreeType> blockClusterTree;
+};
+
+tbb::mutex s_keptBlockClusterTreesMutex;
+std::vector<KeptBlockClusterTree> s_keptBlockClusterTrees;
+
+// The parameters that determine a block cluster tree
+std::string clusterParameters(const ParameterList &parameterList) {
+  return parameterList.template get<std::string>("options.hmat.admissibility") +
+         " " + toString(parameterList.template get<double>("options.hmat.eta")) +
+         " " +
+         toString(parameterList.template get<int>("options.hmat.minBlockSize")) +
+         " " +
+         toString(parameterList.template get<int>("options.hmat.maxBlockSize"));
+}
+
+} // namespace
+
 template <typename BasisFunctionType>
 SpaceHMatGeometryInterface<BasisFunctionType>::SpaceHMatGeometryInterface(
     const Space<BasisFunctionType> &space)
@@ -88,12 +122,16 @@ generateBlockClusterTree(const hmat::Geometry& testGeometry,
     throw std::runtime_error(
         "generateBlockClusterTree(): Unknown admissibility type");
 
-  auto testClusterTree = shared_ptr<hmat::DefaultClusterTreeType>(
-      new hmat::DefaultClusterTreeType(testGeometry, minBlockSize));
-
-  auto trialClusterTree = shared_ptr<hmat::DefaultClusterTreeType>(
-      new hmat::DefaultClusterTreeType(trialGeometry, minBlockSize));
+  shared_ptr<hmat::DefaultClusterTreeType> testClusterTree, trialClusterTree;
+  {
+    ScopedPhaseTimer timer("cluster_tree");
+    testClusterTree.reset(
+        new hmat::DefaultClusterTreeType(testGeometry, minBlockSize));
+    trialClusterTree.reset(
+        new hmat::DefaultClusterTreeType(trialGeometry, minBlockSize));
+  }
 
+  ScopedPhaseTimer timer("block_cluster_tree");
   shared_ptr<hmat::DefaultBlockClusterTreeType> blockClusterTree(
       new hmat::DefaultBlockClusterTreeType(testClusterTree, trialClusterTree,
                                             maxBlockSize,
@@ -110,6 +148,21 @@ generateBlockClusterTree(const Space<BasisFunctionType> &testSpace,
                          const Space<BasisFunctionType> &trialSpace,
                          const ParameterList &parameterList) {
 
+  {
+    tbb::mutex::scoped_lock lock(s_keptBlockClusterTreesMutex);
+    const std::string parameters = clusterParameters(parameterList);
+    for (auto it = s_keptBlockClusterTrees.begin();
+         it != s_keptBlockClusterTrees.end(); ++it)
+      if (it->testSpace.get() == &testSpace &&
+          it->trialSpace.get() == &trialSpace &&
+          it->clusterParameters == parameters) {
+        auto blockClusterTree = it->blockClusterTree;
+        s_keptBlockClusterTrees.erase(it);
+        return const_pointer_cast<hmat::DefaultBlockClusterTreeType>(
+            blockClusterTree);
+      }
+  }
+
   hmat::Geometry testGeometry;
   hmat::Geometry trialGeometry;
 
@@ -119,19 +172,61 @@ generateBlockClusterTree(const Space<BasisFunctionType> &testSpace,
   auto trialSpaceGeometryInterface = shared_ptr<hmat::GeometryInterface>(
       new SpaceHMatGeometryInterface<BasisFunctionType>(trialSpace));
 
-  hmat::fillGeometry(testGeometry, *testSpaceGeometryInterface);
-  hmat::fillGeometry(trialGeometry, *trialSpaceGeometryInterface);
+  {
+    ScopedPhaseTimer timer("geometry_and_dof_lists");
+    hmat::fillGeometry(testGeometry, *testSpaceGeometryInterface);
+    hmat::fillGeometry(trialGeometry, *trialSpaceGeometryInterface);
+  }
 
   return generateBlockClusterTree(testGeometry, trialGeometry,
           parameterList);
 
 }
 
+template <typename BasisFunctionType>
+void keepBlockClusterTreeForAssembly(
+    const shared_ptr<const Space<BasisFunctionType>> &testSpace,
+    const shared_ptr<const Space<BasisFunctionType>> &trialSpace,
+    const ParameterList &parameterList,
+    const shared_ptr<const hmat::DefaultBlockClusterTreeType>
+        &blockClusterTree) {
+  KeptBlockClusterTree kept;
+  kept.testSpace = testSpace;
+  kept.trialSpace = trialSpace;
+  kept.clusterParameters = clusterParameters(parameterList);
+  kept.blockClusterTree = blockClusterTree;
+
+  tbb::mutex::scoped_lock lock(s_keptBlockClusterTreesMutex);
+  s_keptBlockClusterTrees.push_back(kept);
+}
+
+template <typename BasisFunctionType>
+void discardKeptBlockClusterTrees(const Space<BasisFunctionType> &testSpace,
+                                  const Space<BasisFunctionType> &trialSpace) {
+  tbb::mutex::scoped_lock lock(s_keptBlockClusterTreesMutex);
+  s_keptBlockClusterTrees.erase(
+      std::remove_if(s_keptBlockClusterTrees.begin(),
+                     s_keptBlockClusterTrees.end(),
+                     [&](const KeptBlockClusterTree &kept) {
+                       return kept.testSpace.get() == &testSpace &&
+                              kept.trialSpace.get() == &trialSpace;
+                     }),
+      s_keptBlockClusterTrees.end());
+}
+
 #define INSTANTIATE_NONMEMBER_FUNCTION(VALUE)                                  \
   template shared_ptr<hmat::DefaultBlockClusterTreeType>                       \
   generateBlockClusterTree(const Space<VALUE> &testSpace,                      \
                            const Space<VALUE> &trialSpace,                     \
-                           const ParameterList &parameterList);
+                           const ParameterList &parameterList);                \
+  template void keepBlockClusterTreeForAssembly(                               \
+      const shared_ptr<const Space<VALUE>> &testSpace,                         \
+      const shared_ptr<const Space<VALUE>> &trialSpace,                        \
+      const ParameterList &parameterList,                                      \
+      const shared_ptr<const hmat::DefaultBlockClusterTreeType>                \
+          &blockClusterTree);                                                  \
+  template void discardKeptBlockClusterTrees(const Space<VALUE> &testSpace,    \
+                                             const Space<VALUE> &trialSpace);
 
 FIBER_ITERATE_OVER_VALUE_TYPES(INSTANTIATE_NONMEMBER_FUNCTION);
 FIBER_INSTANTIATE_CLASS_TEMPLATED_ON_RESULT(SpaceHMatGeometryInterface);
@@ -74,6 +74,25 @@ shared_ptr<hmat::DefaultBlockClusterTreeType>
 generateBlockClusterTree(const hmat::Geometry& testGeometry,
                          const hmat::Geometry& trialGeometry,
                          const ParameterList &parameterList);
+
+/** \brief Keep a block cluster tree for the next assembly on a pair of spaces.
+ *
+ *  The next call of generateBlockClusterTree() with the same space objects
+ *  and the same admissibility and block size parameters returns
+ *  \p blockClusterTree instead of building a new tree. Each kept tree is
+ *  returned at most once, since the assembly can coarsen it. */
+template <typename BasisFunctionType>
+void keepBlockClusterTreeForAssembly(
+    const shared_ptr<const Space<BasisFunctionType>> &testSpace,
+    const shared_ptr<const Space<BasisFunctionType>> &trialSpace,
+    const ParameterList &parameterList,
+    const shared_ptr<const hmat::DefaultBlockClusterTreeType> &blockClusterTree);
+
+/** \brief Discard the block cluster trees kept for a pair of spaces that
+ *  were not used by an assembly. */
+template <typename BasisFunctionType>
+void discardKeptBlockClusterTrees(const Space<BasisFunctionType> &testSpace,
+                                  const Space<BasisFunctionType> &trialSpace);
 }
 
 #endif
@@ -28,6 +28,7 @@
 #include "../fiber/local_assembler_for_integral_operators.hpp"
 #include "../fiber/conjugate.hpp"
 #include "../common/eigen_support.hpp"
+#include "../common/assembly_profiler.hpp"
 
 namespace Bempp {
 
@@ -108,6 +109,8 @@ void WeakFormHMatAssemblyHelper<BasisFunctionType, ResultType>::
         const hmat::DefaultBlockClusterTreeNodeType &blockClusterTreeNode,
         Matrix<ResultType> &data) const {
 
+  ScopedBusyTimer busyTimer;
+
   auto numberOfTestIndices = testIndexRange[1] - testIndexRange[0];
   auto numberOfTrialIndices = trialIndexRange[1] - trialIndexRange[0];
 
@@ -284,6 +287,9 @@ void WeakFormHMatAssemblyHelper<BasisFunctionType, ResultType>::
   }
 
   // Now, add the contributions of the sparse terms
+  if (m_sparseTermsToAdd.empty())
+    return;
+  ScopedPhaseTimer sparseTimer("sparse_term_addition", true);
   for (size_t nTerm = 0; nTerm < m_sparseTermsToAdd.size(); ++nTerm)
     m_sparseTermsToAdd[nTerm]->addBlock(
         // since m_indexWithGlobalDofs is set, these refer
@@ -0,0 +1,148 @@
+// Copyright (C) 2011-2012 by the BEM++ Authors
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+// THE SOFTWARE.
+
+#include "assembly_profiler.hpp"
+
+#include <algorithm>
+#include <tbb/atomic.h>
+#include <tbb/enumerable_thread_specific.h>
+#include <tbb/mutex.h>
+
+#include <sys/resource.h>
+
+namespace Bempp {
+
+namespace {
+
+// A phase together with the time at which it was first entered, which
+// orders the phases recorded by different threads.
+struct RecordedPhase {
+  AssemblyProfiler::Phase phase;
+  tbb::tick_count firstEntry;
+};
+
+// Times recorded by one thread. They are only written by their thread and
+// merged when the profile is read, so that the threads never wait for each
+// other.
+struct ThreadRecord {
+  ThreadRecord() : busyTime(0) {}
+  double busyTime;
+  std::vector<RecordedPhase> summedPhases;
+};
+
+tbb::atomic<bool> s_enabled;
+tbb::mutex s_mutex;
+std::vector<RecordedPhase> s_phases;
+tbb::enumerable_thread_specific<ThreadRecord> s_threadRecords;
+
+void addToPhases(std::vector<RecordedPhase> &phases,
+                 const RecordedPhase &recorded) {
+  for (auto &entry : phases)
+    if (entry.phase.name == recorded.phase.name) {
+      entry.phase.seconds += recorded.phase.seconds;
+      entry.phase.peakMemory =
+          std::max(entry.phase.peakMemory, recorded.phase.peakMemory);
+      if ((recorded.firstEntry - entry.firstEntry).seconds() < 0)
+        entry.firstEntry = recorded.firstEntry;
+      return;
+    }
+  phases.push_back(recorded);
+}
+
+} // namespace
+
+void AssemblyProfiler::setEnabled(bool enabled) { s_enabled = enabled; }
+
+bool AssemblyProfiler::isEnabled() { return s_enabled; }
+
+void AssemblyProfiler::reset() {
+  tbb::mutex::scoped_lock lock(s_mutex);
+  s_phases.clear();
+  s_threadRecords.clear();
+}
+
+void AssemblyProfiler::addPhaseTime(const std::string &name, double seconds,
+                                    bool summedOverThreads) {
+  RecordedPhase recorded;
+  recorded.phase.name = name;
+  recorded.phase.seconds = seconds;
+  recorded.phase.summedOverThreads = summedOverThreads;
+  recorded.phase.peakMemory = 0;
+  recorded.firstEntry = tbb::tick_count::now();
+
+  if (summedOverThreads) {
+    // Parallel phases end once per block on each thread. Their memory is
+    // sampled when the profile is read.
+    addToPhases(s_threadRecords.local().summedPhases, recorded);
+    return;
+  }
+
+  recorded.phase.peakMemory = peakResidentMemory();
+  tbb::mutex::scoped_lock lock(s_mutex);
+  addToPhases(s_phases, recorded);
+}
+
+void AssemblyProfiler::addThreadBusyTime(double seconds) {
+  s_threadRecords.local().busyTime += seconds;
+}
+
+std::vector<AssemblyProfiler::Phase> AssemblyProfiler::phases() {
+  const size_t peakMemory = peakResidentMemory();
+  tbb::mutex::scoped_lock lock(s_mutex);
+  std::vector<RecordedPhase> merged = s_phases;
+  for (const auto &record : s_threadRecords)
+    for (auto recorded : record.summedPhases) {
+      recorded.phase.peakMemory = peakMemory;
+      addToPhases(merged, recorded);
+    }
+  std::stable_sort(merged.begin(), merged.end(),
+                   [](const RecordedPhase &first, const RecordedPhase &second) {
+                     return (first.firstEntry - second.firstEntry).seconds() <
+                            0;
+                   });
+
+  std::vector<Phase> result;
+  for (const auto &recorded : merged)
+    result.push_back(recorded.phase);
+  return result;
+}
+
+std::vector<double> AssemblyProfiler::threadBusyTimes() {
+  tbb::mutex::scoped_lock lock(s_mutex);
+  std::vector<double> result;
+  for (const auto &record : s_threadRecords)
+    if (record.busyTime > 0)
+      result.push_back(record.busyTime);
+  return result;
+}
+
+size_t AssemblyProfiler::peakResidentMemory() {
+  struct rusage usage;
+  if (getrusage(RUSAGE_SELF, &usage) != 0)
+    return 0;
+#ifdef __APPLE__
+  // ru_maxrss is given in bytes on OS X and in kilobytes elsewhere
+  return static_cast<size_t>(usage.ru_maxrss);
+#else
+  return static_cast<size_t>(usage.ru_maxrss) * 1024;
+#endif
+}
+
+} // namespace Bempp
@@ -0,0 +1,143 @@
+// Copyright (C) 2011-2012 by the BEM++ Authors
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+// THE SOFTWARE.
+
+#ifndef bempp_assembly_profiler_hpp
+#define bempp_assembly_profiler_hpp
+
+#include <cstddef>
+#include <string>
+#include <vector>
+
+#include <tbb/tick_count.h>
+
+namespace Bempp {
+
+/** \ingroup common
+ *  \brief Process-wide record of the time spent in the phases of operator
+ *  assembly.
+ *
+ *  Profiling is disabled by default. While it is enabled the assemblers add
+ *  the wall time of sequential phases and the thread time of phases that run
+ *  in parallel, summed over all threads, to this record. In addition the time
+ *  that each thread spends computing matrix entries is recorded. Times are
+ *  given in seconds. At the end of each sequential phase the peak resident
+ *  memory of the process is recorded, so that the phase in which the memory
+ *  grew can be identified.
+ *
+ *  The busy times and the times of parallel phases are accumulated per
+ *  thread without locking and merged when the profile is read, so that
+ *  profiling does not serialise the threads. The peak memory of parallel
+ *  phases is the one at the time the profile is read. */
+class AssemblyProfiler {
+public:
+  /** \brief Time spent in one phase. */
+  struct Phase {
+    std::string name;
+    double seconds;
+    /** \brief True if the time is summed over all threads. */
+    bool summedOverThreads;
+    /** \brief Peak resident memory of the process in bytes at the end of
+     *  the phase, or when the profile is read for phases summed over
+     *  threads. */
+    size_t peakMemory;
+  };
+
+  static void setEnabled(bool enabled);
+  static bool isEnabled();
+
+  /** \brief Remove all recorded times. Must not be called during an
+   *  assembly. */
+  static void reset();
+
+  /** \brief Add \p seconds to the phase \p name. */
+  static void addPhaseTime(const std::string &name, double seconds,
+                           bool summedOverThreads = false);
+
+  /** \brief Add \p seconds to the busy time of the calling thread. */
+  static void addThreadBusyTime(double seconds);
+
+  /** \brief Return the phases in the order in which they were first
+   *  recorded. */
+  static std::vector<Phase> phases();
+
+  /** \brief Return the busy time of each thread that has recorded one. */
+  static std::vector<double> threadBusyTimes();
+
+  /** \brief Return the peak resident memory of the process in bytes or 0 if
+   *  it is not available. */
+  static size_t peakResidentMemory();
+};
+
+/** \ingroup common
+ *  \brief Adds the time between construction and destruction to a phase of
+ *  the AssemblyProfiler if profiling is enabled. */
+class ScopedPhaseTimer {
+public:
+  explicit ScopedPhaseTimer(const char *name, bool summedOverThreads = false)
+      : m_name(name), m_summedOverThreads(summedOverThreads),
+        m_enabled(AssemblyProfiler::isEnabled()) {
+    if (m_enabled)
+      m_start = tbb::tick_count::now();
+  }
+
+  ~ScopedPhaseTimer() {
+    if (m_enabled)
+      AssemblyProfiler::addPhaseTime(
+          m_name, (tbb::tick_count::now() - m_start).seconds(),
+          m_summedOverThreads);
+  }
+
+private:
+  ScopedPhaseTimer(const ScopedPhaseTimer &other);
+  ScopedPhaseTimer &operator=(const ScopedPhaseTimer &other);
+
+  const char *m_name;
+  bool m_summedOverThreads;
+  bool m_enabled;
+  tbb::tick_count m_start;
+};
+
+/** \ingroup common
+ *  \brief Adds the time between construction and destruction to the busy
+ *  time of the calling thread if profiling is enabled. */
+class ScopedBusyTimer {
+public:
+  ScopedBusyTimer() : m_enabled(AssemblyProfiler::isEnabled()) {
+    if (m_enabled)
+      m_start = tbb::tick_count::now();
+  }
+
+  ~ScopedBusyTimer() {
+    if (m_enabled)
+      AssemblyProfiler::addThreadBusyTime(
+          (tbb::tick_count::now() - m_start).seconds());
+  }
+
+private:
+  ScopedBusyTimer(const ScopedBusyTimer &other);
+  ScopedBusyTimer &operator=(const ScopedBusyTimer &other);
+
+  bool m_enabled;
+  tbb::tick_count m_start;
+};
+
+} // namespace Bempp
+
+#endif
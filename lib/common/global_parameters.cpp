@@ -35,10 +35,20 @@ ParameterList GlobalParameters::parameterList() {
   parameters.put("options.global.verbosityLevel", static_cast<int>(5));
 
   // Default assembly type for boundary operators. Allowed values are
-  // "dense" and "hmat".
+  // "dense", "hmat" and "auto". With "auto" the type is chosen per operator
+  // by the Python interface.
   parameters.put("options.assembly.boundaryOperatorAssemblyType",
                  std::string("hmat"));
 
+  // Maximum estimated storage in megabytes of the weak form of an operator
+  // assembled with assembly type "auto". A value <= 0 means no limit.
+  parameters.put("options.assembly.memoryBudgetMb", static_cast<double>(0));
+
+  // Operators with at most this number of rows and columns are assembled
+  // densely with assembly type "auto".
+  parameters.put("options.assembly.autoDenseMaxDofCount",
+                 static_cast<int>(2000));
+
   // Default assembly type for potential oeprators.
   // Allowed values are "dense" and "hmat".
   parameters.put("options.assembly.potentialOperatorAssemblyType",
@@ -49,12 +59,22 @@ ParameterList GlobalParameters::parameterList() {
 
   parameters.put("options.assembly.enableSingularIntegralCaching", true);
 
+  // Evaluate regular integrals of operators that support it with BLAS
+  // matrix products. Allowed values are "auto" (only for shapesets of
+  // order >= 2), "yes" and "no".
+  parameters.put("options.assembly.blasInQuadrature", std::string("auto"));
+
   // Use polynomial interpolation instead of exponentials to assemble
   // Helmholtz or Maxwell type kernels.
   parameters.put("options.assembly.enableInterpolationForOscillatoryKernels", true);
 
   // Number of interpolation points per wavelength for oscillatory kernels.
   parameters.put("options.assembly.interpolationPointsPerWavelength", static_cast<int>(5000));
+
+  // If true then the weak forms of composite boundary operators (sums,
+  // products, scaled and compound operators) are flattened into a single
+  // evaluation plan with folded scalars and premultiplied sparse factors.
+  parameters.put("options.assembly.enableWeakFormOptimization", false);
    
 
   // Order for singular double integrals.
@@ -122,6 +142,12 @@ ParameterList GlobalParameters::parameterList() {
   // The total number of tasks is 4^matVecParallelLevels
   parameters.put("options.hmat.matVecParallelLevels", static_cast<int>(5));
 
+  // Part of the leaves of the block cluster tree compressed by this process
+  // and the number of parts. Used to distribute boundary operator H-matrices
+  // over several processes.
+  parameters.put("options.hmat.leafPartitionIndex", static_cast<int>(0));
+  parameters.put("options.hmat.leafPartitionCount", static_cast<int>(1));
+
   return parameters;
 }
 }
@@ -0,0 +1,137 @@
+// Copyright (C) 2011-2012 by the BEM++ Authors
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+// THE SOFTWARE.
+
+#ifndef fiber_batched_test_kernel_trial_integral_hpp
+#define fiber_batched_test_kernel_trial_integral_hpp
+
+#include "test_kernel_trial_integral.hpp"
+
+#include <utility>
+#include <vector>
+
+namespace Fiber {
+
+/** \brief Single term of an integrand evaluated by
+ *  BatchedTestKernelTrialIntegral.
+ *
+ *  The term is equal to
+ *  \f[ c\, \overline{\phi_{t,a}(x)}\, K_{k,rs}(x, y)\, \psi_{u,b}(y), \f]
+ *  where \f$c\f$ is the coefficient, \f$\phi_{t,a}\f$ is the component
+ *  \f$a\f$ of the test transformation \f$t\f$, \f$K_{k,rs}\f$ is the entry
+ *  \f$(r, s)\f$ of the kernel \f$k\f$ and \f$\psi_{u,b}\f$ is the component
+ *  \f$b\f$ of the trial transformation \f$u\f$. */
+template <typename CoordinateType> struct BatchedIntegralTerm {
+  BatchedIntegralTerm(int testTransformation_, int testComponent_,
+                      int kernel_, int kernelRow_, int kernelCol_,
+                      int trialTransformation_, int trialComponent_,
+                      CoordinateType coefficient_ = 1.)
+      : testTransformation(testTransformation_),
+        testComponent(testComponent_), kernel(kernel_),
+        kernelRow(kernelRow_), kernelCol(kernelCol_),
+        trialTransformation(trialTransformation_),
+        trialComponent(trialComponent_), coefficient(coefficient_) {}
+
+  int testTransformation;
+  int testComponent;
+  int kernel;
+  int kernelRow;
+  int kernelCol;
+  int trialTransformation;
+  int trialComponent;
+  CoordinateType coefficient;
+};
+
+/** \ingroup weak_form_elements
+  \brief Implementation of the TestKernelTrialIntegral interface for
+  integrands that are sums of products of a test function component, a kernel
+  entry and a trial function component.
+
+  The integrand is described by a list of BatchedIntegralTerm objects.
+  Instead of evaluating an integrand functor for each combination of test
+  dof, trial dof, test point and trial point, each term is evaluated for all
+  dofs and quadrature points at once as a product of three matrices
+  (test values x kernel values x trial values). This is considerably faster
+  than DefaultTestKernelTrialIntegral for vector-valued integrands such as
+  the ones of the Maxwell operators.
+ */
+template <typename BasisFunctionType_, typename KernelType_,
+          typename ResultType_>
+class BatchedTestKernelTrialIntegral
+    : public TestKernelTrialIntegral<BasisFunctionType_, KernelType_,
+                                     ResultType_> {
+  typedef TestKernelTrialIntegral<BasisFunctionType_, KernelType_, ResultType_>
+      Base;
+
+public:
+  typedef typename Base::CoordinateType CoordinateType;
+  typedef typename Base::BasisFunctionType BasisFunctionType;
+  typedef typename Base::KernelType KernelType;
+  typedef typename Base::ResultType ResultType;
+  typedef BatchedIntegralTerm<CoordinateType> Term;
+
+  explicit BatchedTestKernelTrialIntegral(const std::vector<Term> &terms);
+
+  virtual void addGeometricalDependencies(size_t &testGeomDeps,
+                                          size_t &trialGeomDeps) const;
+
+  virtual void evaluateWithTensorQuadratureRule(
+      const GeometricalData<CoordinateType> &testGeomData,
+      const GeometricalData<CoordinateType> &trialGeomData,
+      const CollectionOf3dArrays<BasisFunctionType> &testValues,
+      const CollectionOf3dArrays<BasisFunctionType> &trialValues,
+      const CollectionOf4dArrays<KernelType> &kernelValues,
+      const std::vector<CoordinateType> &testQuadWeights,
+      const std::vector<CoordinateType> &trialQuadWeights,
+      Matrix<ResultType> &result) const;
+
+  virtual void evaluateWithNontensorQuadratureRule(
+      const GeometricalData<CoordinateType> &testGeomData,
+      const GeometricalData<CoordinateType> &trialGeomData,
+      const CollectionOf3dArrays<BasisFunctionType> &testValues,
+      const CollectionOf3dArrays<BasisFunctionType> &trialValues,
+      const CollectionOf3dArrays<KernelType> &kernelValues,
+      const std::vector<CoordinateType> &quadWeights,
+      Matrix<ResultType> &result) const;
+
+private:
+  /** \brief Return the index of \p key in \p keys, appending it if
+   *  necessary. */
+  template <typename Key>
+  static size_t keyIndex(std::vector<Key> &keys, const Key &key);
+
+  std::vector<Term> m_terms;
+  // Distinct (transformation, component) pairs of the test and trial
+  // functions and (kernel, (row, col)) pairs of the kernels. The values
+  // of each pair are gathered once per element pair and shared by all
+  // terms that use them.
+  std::vector<std::pair<int, int>> m_testKeys;
+  std::vector<std::pair<int, int>> m_trialKeys;
+  std::vector<std::pair<int, std::pair<int, int>>> m_kernelKeys;
+  // Indices of the keys of each term
+  std::vector<size_t> m_termTestKeys;
+  std::vector<size_t> m_termTrialKeys;
+  std::vector<size_t> m_termKernelKeys;
+};
+
+} // namespace Fiber
+
+#include "batched_test_kernel_trial_integral_imp.hpp"
+
+#endif
@@ -0,0 +1,222 @@
+// Copyright (C) 2011-2012 by the BEM++ Authors
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+// THE SOFTWARE.
+
+#ifndef fiber_batched_test_kernel_trial_integral_imp_hpp
+#define fiber_batched_test_kernel_trial_integral_imp_hpp
+
+#include "batched_test_kernel_trial_integral.hpp"
+
+#include "collection_of_3d_arrays.hpp"
+#include "collection_of_4d_arrays.hpp"
+#include "conjugate.hpp"
+#include "geometrical_data.hpp"
+
+#include <cassert>
+
+namespace Fiber {
+
+template <typename BasisFunctionType, typename KernelType, typename ResultType>
+BatchedTestKernelTrialIntegral<BasisFunctionType, KernelType, ResultType>::
+    BatchedTestKernelTrialIntegral(const std::vector<Term> &terms)
+    : m_terms(terms) {
+  for (size_t termIndex = 0; termIndex < m_terms.size(); ++termIndex) {
+    const Term &term = m_terms[termIndex];
+    m_termTestKeys.push_back(keyIndex(
+        m_testKeys, std::make_pair(term.testTransformation, term.testComponent)));
+    m_termTrialKeys.push_back(
+        keyIndex(m_trialKeys, std::make_pair(term.trialTransformation,
+                                             term.trialComponent)));
+    m_termKernelKeys.push_back(
+        keyIndex(m_kernelKeys,
+                 std::make_pair(term.kernel, std::make_pair(term.kernelRow,
+                                                            term.kernelCol))));
+  }
+}
+
+template <typename BasisFunctionType, typename KernelType, typename ResultType>
+template <typename Key>
+size_t BatchedTestKernelTrialIntegral<BasisFunctionType, KernelType,
+                                      ResultType>::
+    keyIndex(std::vector<Key> &keys, const Key &key) {
+  for (size_t i = 0; i < keys.size(); ++i)
+    if (keys[i] == key)
+      return i;
+  keys.push_back(key);
+  return keys.size() - 1;
+}
+
+template <typename BasisFunctionType, typename KernelType, typename ResultType>
+void BatchedTestKernelTrialIntegral<BasisFunctionType, KernelType, ResultType>::
+    addGeometricalDependencies(size_t &testGeomDeps,
+                               size_t &trialGeomDeps) const {
+  testGeomDeps |= INTEGRATION_ELEMENTS;
+  trialGeomDeps |= INTEGRATION_ELEMENTS;
+}
+
+template <typename BasisFunctionType, typename KernelType, typename ResultType>
+void BatchedTestKernelTrialIntegral<BasisFunctionType, KernelType, ResultType>::
+    evaluateWithTensorQuadratureRule(
+        const GeometricalData<CoordinateType> &testGeomData,
+        const GeometricalData<CoordinateType> &trialGeomData,
+        const CollectionOf3dArrays<BasisFunctionType> &testValues,
+        const CollectionOf3dArrays<BasisFunctionType> &trialValues,
+        const CollectionOf4dArrays<KernelType> &kernelValues,
+        const std::vector<CoordinateType> &testQuadWeights,
+        const std::vector<CoordinateType> &trialQuadWeights,
+        Matrix<ResultType> &result) const {
+  const size_t testDofCount = testValues[0].extent(1);
+  const size_t trialDofCount = trialValues[0].extent(1);
+
+  const size_t testPointCount = testQuadWeights.size();
+  const size_t trialPointCount = trialQuadWeights.size();
+
+  assert(result.rows() == testDofCount);
+  assert(result.cols() == trialDofCount);
+
+  // Weighted and conjugated test values (dof x point), kernel values
+  // (test point x trial point) and weighted trial values (point x dof)
+  std::vector<Matrix<ResultType>> testMatrices(m_testKeys.size());
+  for (size_t i = 0; i < m_testKeys.size(); ++i) {
+    const _3dArray<BasisFunctionType> &test = testValues[m_testKeys[i].first];
+    const int component = m_testKeys[i].second;
+    assert(test.extent(2) == testPointCount);
+    Matrix<ResultType> &testMatrix = testMatrices[i];
+    testMatrix.resize(testDofCount, testPointCount);
+    for (size_t point = 0; point < testPointCount; ++point) {
+      const CoordinateType weight =
+          testGeomData.integrationElements(point) * testQuadWeights[point];
+      for (size_t dof = 0; dof < testDofCount; ++dof)
+        testMatrix(dof, point) =
+            conjugate(test(component, dof, point)) * weight;
+    }
+  }
+
+  std::vector<Matrix<ResultType>> trialMatrices(m_trialKeys.size());
+  for (size_t i = 0; i < m_trialKeys.size(); ++i) {
+    const _3dArray<BasisFunctionType> &trial =
+        trialValues[m_trialKeys[i].first];
+    const int component = m_trialKeys[i].second;
+    assert(trial.extent(2) == trialPointCount);
+    Matrix<ResultType> &trialMatrix = trialMatrices[i];
+    trialMatrix.resize(trialPointCount, trialDofCount);
+    for (size_t dof = 0; dof < trialDofCount; ++dof)
+      for (size_t point = 0; point < trialPointCount; ++point)
+        trialMatrix(point, dof) =
+            trial(component, dof, point) *
+            (trialGeomData.integrationElements(point) *
+             trialQuadWeights[point]);
+  }
+
+  std::vector<Matrix<ResultType>> kernelMatrices(m_kernelKeys.size());
+  for (size_t i = 0; i < m_kernelKeys.size(); ++i) {
+    const _4dArray<KernelType> &kernel = kernelValues[m_kernelKeys[i].first];
+    const int row = m_kernelKeys[i].second.first;
+    const int col = m_kernelKeys[i].second.second;
+    assert(kernel.extent(2) == testPointCount);
+    assert(kernel.extent(3) == trialPointCount);
+    Matrix<ResultType> &kernelMatrix = kernelMatrices[i];
+    kernelMatrix.resize(testPointCount, trialPointCount);
+    for (size_t trialPoint = 0; trialPoint < trialPointCount; ++trialPoint)
+      for (size_t testPoint = 0; testPoint < testPointCount; ++testPoint)
+        kernelMatrix(testPoint, trialPoint) =
+            kernel(row, col, testPoint, trialPoint);
+  }
+
+  result.setZero();
+  for (size_t termIndex = 0; termIndex < m_terms.size(); ++termIndex)
+    result.noalias() +=
+        m_terms[termIndex].coefficient *
+        ((testMatrices[m_termTestKeys[termIndex]] *
+          kernelMatrices[m_termKernelKeys[termIndex]]) *
+         trialMatrices[m_termTrialKeys[termIndex]]);
+}
+
+template <typename BasisFunctionType, typename KernelType, typename ResultType>
+void BatchedTestKernelTrialIntegral<BasisFunctionType, KernelType, ResultType>::
+    evaluateWithNontensorQuadratureRule(
+        const GeometricalData<CoordinateType> &testGeomData,
+        const GeometricalData<CoordinateType> &trialGeomData,
+        const CollectionOf3dArrays<BasisFunctionType> &testValues,
+        const CollectionOf3dArrays<BasisFunctionType> &trialValues,
+        const CollectionOf3dArrays<KernelType> &kernelValues,
+        const std::vector<CoordinateType> &quadWeights,
+        Matrix<ResultType> &result) const {
+  const size_t testDofCount = testValues[0].extent(1);
+  const size_t trialDofCount = trialValues[0].extent(1);
+
+  const size_t pointCount = quadWeights.size();
+
+  assert(result.rows() == testDofCount);
+  assert(result.cols() == trialDofCount);
+
+  // Conjugated test values (dof x point), kernel values multiplied by the
+  // weights (point) and trial values (point x dof)
+  std::vector<Matrix<ResultType>> testMatrices(m_testKeys.size());
+  for (size_t i = 0; i < m_testKeys.size(); ++i) {
+    const _3dArray<BasisFunctionType> &test = testValues[m_testKeys[i].first];
+    const int component = m_testKeys[i].second;
+    assert(test.extent(2) == pointCount);
+    Matrix<ResultType> &testMatrix = testMatrices[i];
+    testMatrix.resize(testDofCount, pointCount);
+    for (size_t point = 0; point < pointCount; ++point)
+      for (size_t dof = 0; dof < testDofCount; ++dof)
+        testMatrix(dof, point) = conjugate(test(component, dof, point));
+  }
+
+  std::vector<Matrix<ResultType>> trialMatrices(m_trialKeys.size());
+  for (size_t i = 0; i < m_trialKeys.size(); ++i) {
+    const _3dArray<BasisFunctionType> &trial =
+        trialValues[m_trialKeys[i].first];
+    const int component = m_trialKeys[i].second;
+    assert(trial.extent(2) == pointCount);
+    Matrix<ResultType> &trialMatrix = trialMatrices[i];
+    trialMatrix.resize(pointCount, trialDofCount);
+    for (size_t dof = 0; dof < trialDofCount; ++dof)
+      for (size_t point = 0; point < pointCount; ++point)
+        trialMatrix(point, dof) = trial(component, dof, point);
+  }
+
+  std::vector<Vector<ResultType>> kernelVectors(m_kernelKeys.size());
+  for (size_t i = 0; i < m_kernelKeys.size(); ++i) {
+    const _3dArray<KernelType> &kernel = kernelValues[m_kernelKeys[i].first];
+    const int row = m_kernelKeys[i].second.first;
+    const int col = m_kernelKeys[i].second.second;
+    assert(kernel.extent(2) == pointCount);
+    Vector<ResultType> &kernelVector = kernelVectors[i];
+    kernelVector.resize(pointCount);
+    for (size_t point = 0; point < pointCount; ++point)
+      kernelVector(point) =
+          kernel(row, col, point) *
+          (testGeomData.integrationElements(point) *
+           trialGeomData.integrationElements(point) * quadWeights[point]);
+  }
+
+  result.setZero();
+  for (size_t termIndex = 0; termIndex < m_terms.size(); ++termIndex)
+    result.noalias() +=
+        m_terms[termIndex].coefficient *
+        ((testMatrices[m_termTestKeys[termIndex]] *
+          kernelVectors[m_termKernelKeys[termIndex]].asDiagonal()) *
+         trialMatrices[m_termTrialKeys[termIndex]]);
+}
+
+} // namespace Fiber
+
+#endif
@@ -32,6 +32,7 @@
 #include "numerical_quadrature.hpp"
 #include "parallelization_options.hpp"
 #include "shared_ptr.hpp"
+#include "singular_integral_cache_budget.hpp"
 #include "test_kernel_trial_integrator.hpp"
 #include "verbosity_level.hpp"
 
@@ -153,6 +154,8 @@ private:
 
   void cacheSingularLocalWeakForms();
   void findPairsOfAdjacentElements(ElementIndexPairSet &pairs) const;
+  size_t cachedLocalWeakFormSize(const ElementIndexPair &pair) const;
+  void limitToMemoryBudget(ElementIndexPairSet &pairs);
   void cacheLocalWeakForms(const ElementIndexPairSet &elementIndexPairs);
 
   const Integrator &selectIntegrator(int testElementIndex,
@@ -202,6 +205,8 @@ private:
    *  element index set to INVALID_INDEX (= INT_MAX, so that the sorting is
    *  preserved). */
   Cache m_cache;
+  /** \brief Memory of the cache reserved from SingularIntegralCacheBudget. */
+  size_t m_cacheMemory;
   /** \endcond */
 };
 
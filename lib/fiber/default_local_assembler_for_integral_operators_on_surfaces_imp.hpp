@@ -30,8 +30,10 @@
 #include "separable_numerical_test_kernel_trial_integrator.hpp"
 #include "serial_blas_region.hpp"
 
+#include <iostream>
 #include <tbb/parallel_for.h>
 
+#include "../common/assembly_profiler.hpp"
 #include "../common/auto_timer.hpp"
 
 namespace Fiber {
@@ -115,7 +117,7 @@ DefaultLocalAssemblerForIntegralOperatorsOnSurfaces<
       m_openClHandler(openClHandler),
       m_parallelizationOptions(parallelizationOptions),
       m_verbosityLevel(verbosityLevel), m_quadDescSelector(quadDescSelector),
-      m_quadRuleFamily(quadRuleFamily) {
+      m_quadRuleFamily(quadRuleFamily), m_cacheMemory(0) {
   Utilities::checkConsistencyOfGeometryAndShapesets(*testRawGeometry,
                                                     *testShapesets);
   Utilities::checkConsistencyOfGeometryAndShapesets(*trialRawGeometry,
@@ -133,6 +135,8 @@ DefaultLocalAssemblerForIntegralOperatorsOnSurfaces<
   // Note: obviously the destructor is assumed to be called only after
   // all threads have ceased using the assembler!
 
+  SingularIntegralCacheBudget::release(m_cacheMemory);
+
   for (typename IntegratorMap::const_iterator it =
            m_testKernelTrialIntegrators.begin();
        it != m_testKernelTrialIntegrators.end(); ++it)
@@ -376,11 +380,69 @@ template <typename BasisFunctionType, typename KernelType, typename ResultType,
 void DefaultLocalAssemblerForIntegralOperatorsOnSurfaces<
     BasisFunctionType, KernelType, ResultType,
     GeometryFactory>::cacheSingularLocalWeakForms() {
+  Bempp::ScopedPhaseTimer timer("singular_integral_caching");
   ElementIndexPairSet elementIndexPairs;
   findPairsOfAdjacentElements(elementIndexPairs);
+  limitToMemoryBudget(elementIndexPairs);
   cacheLocalWeakForms(elementIndexPairs);
 }
 
+/** \brief Return the approximate memory needed to cache the local weak form
+        of an element pair. */
+template <typename BasisFunctionType, typename KernelType, typename ResultType,
+          typename GeometryFactory>
+size_t DefaultLocalAssemblerForIntegralOperatorsOnSurfaces<
+    BasisFunctionType, KernelType, ResultType,
+    GeometryFactory>::cachedLocalWeakFormSize(const ElementIndexPair &pair)
+    const {
+  return sizeof(std::pair<int, Matrix<ResultType>>) +
+         sizeof(ResultType) * (*m_testShapesets)[pair.first]->size() *
+             (*m_trialShapesets)[pair.second]->size();
+}
+
+/** \brief Reserve memory for the cache and remove from \p pairs the element
+        pairs that do not fit into the memory budget.
+
+    If the budget is too small, coincident pairs, whose integrals are the
+    most expensive ones, are kept first. */
+template <typename BasisFunctionType, typename KernelType, typename ResultType,
+          typename GeometryFactory>
+void DefaultLocalAssemblerForIntegralOperatorsOnSurfaces<
+    BasisFunctionType, KernelType, ResultType,
+    GeometryFactory>::limitToMemoryBudget(ElementIndexPairSet &pairs) {
+  typedef typename ElementIndexPairSet::const_iterator ElementIndexPairIterator;
+
+  size_t requested = 0;
+  for (ElementIndexPairIterator it = pairs.begin(); it != pairs.end(); ++it)
+    requested += cachedLocalWeakFormSize(*it);
+
+  m_cacheMemory = SingularIntegralCacheBudget::reserve(requested);
+  if (m_cacheMemory == requested)
+    return;
+
+  ElementIndexPairSet selectedPairs;
+  size_t used = 0;
+  for (int pass = 0; pass < 2; ++pass)
+    for (ElementIndexPairIterator it = pairs.begin(); it != pairs.end(); ++it) {
+      if ((it->first == it->second) != (pass == 0))
+        continue;
+      const size_t size = cachedLocalWeakFormSize(*it);
+      if (used + size > m_cacheMemory)
+        continue;
+      selectedPairs.insert(*it);
+      used += size;
+    }
+
+  if (m_verbosityLevel >= VerbosityLevel::DEFAULT)
+    std::cout << "Singular integral cache memory limit reached: caching "
+              << selectedPairs.size() << " of " << pairs.size()
+              << " adjacent element pairs." << std::endl;
+
+  SingularIntegralCacheBudget::release(m_cacheMemory - used);
+  m_cacheMemory = used;
+  pairs.swap(selectedPairs);
+}
+
 /** \brief Fill \p pairs with the list of pairs of indices of elements
         sharing at least one vertex. */
 template <typename BasisFunctionType, typename KernelType, typename ResultType,
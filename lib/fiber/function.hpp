@@ -26,6 +26,8 @@
 #include "scalar_traits.hpp"
 #include "types.hpp"
 
+#include <vector>
+
 namespace Fiber {
 
 /** \cond FORWARD_DECL */
@@ -85,6 +87,28 @@ public:
    */
   virtual void evaluate(const GeometricalData<CoordinateType> &geomData,
                         Matrix<ValueType> &result) const = 0;
+
+  /** \brief Evaluate the function on several elements at once.
+   *
+   *  \param[in] geomData
+   *    Pointers to the geometrical data related to the points on each of
+   *    the elements.
+   *  \param[out] result
+   *    On output, <tt>result[i]</tt> contains the function values at the
+   *    points described by <tt>*geomData[i]</tt>, in the format used by
+   *    evaluate().
+   *
+   *  The default implementation calls evaluate() separately for each
+   *  element. Subclasses whose evaluation has a large fixed cost per call
+   *  may override this method to process all points in a single pass.
+   */
+  virtual void evaluateOnElements(
+      const std::vector<const GeometricalData<CoordinateType> *> &geomData,
+      std::vector<Matrix<ValueType>> &result) const {
+    result.resize(geomData.size());
+    for (size_t i = 0; i < geomData.size(); ++i)
+      evaluate(*geomData[i], result[i]);
+  }
 };
 
 } // namespace Fiber
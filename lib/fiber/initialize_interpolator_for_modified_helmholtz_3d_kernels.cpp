@@ -21,8 +21,78 @@
 #include "initialize_interpolator_for_modified_helmholtz_3d_kernels.hpp"
 #include "explicit_instantiation.hpp"
 
+#include "../common/complex_aux.hpp"
+
+#include <deque>
+#include <map>
+#include <tbb/mutex.h>
+#include <tuple>
+
 namespace Fiber {
 
+namespace {
+
+// Maximum number of interpolators kept alive by the cache. The oldest
+// entries are dropped first.
+const size_t maxCachedInterpolatorCount = 32;
+
+template <typename ValueType> class InterpolatorCache {
+public:
+  typedef typename ScalarTraits<ValueType>::RealType CoordinateType;
+  typedef std::tuple<CoordinateType, CoordinateType, CoordinateType, int> Key;
+  typedef shared_ptr<const HermiteInterpolator<ValueType>> InterpolatorPtr;
+
+  static InterpolatorCache &instance() {
+    static InterpolatorCache cache;
+    return cache;
+  }
+
+  InterpolatorPtr get(ValueType waveNumber, CoordinateType maxDist,
+                      int interpPtsPerWavelength) {
+    const Key key(realPart(waveNumber), imagPart(waveNumber), maxDist,
+                  interpPtsPerWavelength);
+    {
+      tbb::mutex::scoped_lock lock(m_mutex);
+      typename std::map<Key, InterpolatorPtr>::const_iterator it =
+          m_interpolators.find(key);
+      if (it != m_interpolators.end())
+        return it->second;
+    }
+
+    // Build the table outside of the lock; if another thread has stored an
+    // interpolator for the same key in the meantime, that one is returned.
+    shared_ptr<HermiteInterpolator<ValueType>> interpolator(
+        new HermiteInterpolator<ValueType>);
+    initializeInterpolatorForModifiedHelmholtz3dKernels(
+        waveNumber, maxDist, interpPtsPerWavelength, *interpolator);
+
+    tbb::mutex::scoped_lock lock(m_mutex);
+    std::pair<typename std::map<Key, InterpolatorPtr>::iterator, bool> result =
+        m_interpolators.insert(std::make_pair(key, InterpolatorPtr(interpolator)));
+    if (result.second) {
+      m_order.push_back(key);
+      if (m_order.size() > maxCachedInterpolatorCount) {
+        m_interpolators.erase(m_order.front());
+        m_order.pop_front();
+      }
+    }
+    return result.first->second;
+  }
+
+  void clear() {
+    tbb::mutex::scoped_lock lock(m_mutex);
+    m_interpolators.clear();
+    m_order.clear();
+  }
+
+private:
+  tbb::mutex m_mutex;
+  std::map<Key, InterpolatorPtr> m_interpolators;
+  std::deque<Key> m_order;
+};
+
+} // namespace
+
 template <typename ValueType>
 void initializeInterpolatorForModifiedHelmholtz3dKernels(
     ValueType waveNumber, typename ScalarTraits<ValueType>::RealType maxDist,
@@ -43,10 +113,29 @@ void initializeInterpolatorForModifiedHelmholtz3dKernels(
   interpolator.initialize(minDist, maxDist, values, derivatives);
 }
 
+template <typename ValueType>
+shared_ptr<const HermiteInterpolator<ValueType>>
+sharedInterpolatorForModifiedHelmholtz3dKernels(
+    ValueType waveNumber, typename ScalarTraits<ValueType>::RealType maxDist,
+    int interpPtsPerWavelength) {
+  return InterpolatorCache<ValueType>::instance().get(waveNumber, maxDist,
+                                                      interpPtsPerWavelength);
+}
+
+void clearModifiedHelmholtz3dInterpolatorCache() {
+  InterpolatorCache<float>::instance().clear();
+  InterpolatorCache<double>::instance().clear();
+  InterpolatorCache<std::complex<float>>::instance().clear();
+  InterpolatorCache<std::complex<double>>::instance().clear();
+}
+
 #define INSTANTIATE_FUNCTION(KERNEL)                                           \
   template void initializeInterpolatorForModifiedHelmholtz3dKernels(           \
       KERNEL, ScalarTraits<KERNEL>::RealType, int,                             \
-      HermiteInterpolator<KERNEL> &);
+      HermiteInterpolator<KERNEL> &);                                          \
+  template shared_ptr<const HermiteInterpolator<KERNEL>>                       \
+  sharedInterpolatorForModifiedHelmholtz3dKernels(                             \
+      KERNEL, ScalarTraits<KERNEL>::RealType, int);
 
 FIBER_ITERATE_OVER_KERNEL_TYPES(INSTANTIATE_FUNCTION);
 
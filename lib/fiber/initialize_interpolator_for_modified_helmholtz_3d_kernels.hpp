@@ -3,6 +3,7 @@
 
 #include "../common/common.hpp"
 #include "hermite_interpolator.hpp"
+#include "shared_ptr.hpp"
 
 namespace Fiber {
 
@@ -11,6 +12,25 @@ void initializeInterpolatorForModifiedHelmholtz3dKernels(
     ValueType waveNumber, typename ScalarTraits<ValueType>::RealType maxDist,
     int interpPtsPerWavelength, HermiteInterpolator<ValueType> &interpolator);
 
+/** \brief Return an interpolator of exp(-waveNumber * r) on [0, maxDist].
+ *
+ *  Interpolators are stored in a process-wide cache keyed by the wave
+ *  number, the maximum distance and the number of interpolation points per
+ *  wavelength, so that kernels of different operators with the same
+ *  parameters share one read-only table. */
+template <typename ValueType>
+shared_ptr<const HermiteInterpolator<ValueType>>
+sharedInterpolatorForModifiedHelmholtz3dKernels(
+    ValueType waveNumber, typename ScalarTraits<ValueType>::RealType maxDist,
+    int interpPtsPerWavelength);
+
+/** \brief Remove all interpolators from the cache used by
+ *  sharedInterpolatorForModifiedHelmholtz3dKernels().
+ *
+ *  Interpolators still used by kernel functors stay alive until the functors
+ *  are destroyed. */
+void clearModifiedHelmholtz3dInterpolatorCache();
+
 } // namespace Fiber
 
 #endif
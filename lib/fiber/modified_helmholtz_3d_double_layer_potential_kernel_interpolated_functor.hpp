@@ -55,10 +55,9 @@ public:
 
   ModifiedHelmholtz3dDoubleLayerPotentialKernelInterpolatedFunctor(
       ValueType waveNumber, CoordinateType maxDist, int interpPtsPerWavelength)
-      : m_waveNumber(waveNumber) {
-    initializeInterpolatorForModifiedHelmholtz3dKernels(
-        waveNumber, maxDist, interpPtsPerWavelength, m_interpolator);
-  }
+      : m_waveNumber(waveNumber),
+        m_interpolator(sharedInterpolatorForModifiedHelmholtz3dKernels(
+            waveNumber, maxDist, interpPtsPerWavelength)) {}
 
   int kernelCount() const { return 1; }
   int kernelRowCount(int /* kernelIndex */) const { return 1; }
@@ -86,7 +85,7 @@ public:
       numeratorSum += diff * trialGeomData.normal(coordIndex);
     }
     CoordinateType dist = sqrt(distSq);
-    ValueType v = m_interpolator.evaluate(dist);
+    ValueType v = m_interpolator->evaluate(dist);
     result[0](0, 0) =
         numeratorSum /
         (static_cast<CoordinateType>(-4.0 * M_PI) * distSq * dist) *
@@ -101,7 +100,7 @@ public:
 private:
   /** \cond PRIVATE */
   ValueType m_waveNumber;
-  HermiteInterpolator<ValueType> m_interpolator;
+  shared_ptr<const HermiteInterpolator<ValueType>> m_interpolator;
   /** \endcond */
 };
 
@@ -56,10 +56,9 @@ public:
 
   explicit ModifiedHelmholtz3dHypersingularOffDiagonalInterpolatedKernelFunctor(
       ValueType waveNumber, CoordinateType maxDist, int interpPtsPerWavelength)
-      : m_waveNumber(waveNumber) {
-    initializeInterpolatorForModifiedHelmholtz3dKernels(
-        waveNumber, maxDist, interpPtsPerWavelength, m_interpolator);
-  }
+      : m_waveNumber(waveNumber),
+        m_interpolator(sharedInterpolatorForModifiedHelmholtz3dKernels(
+            waveNumber, maxDist, interpPtsPerWavelength)) {}
 
   int kernelCount() const { return 1; }
   int kernelRowCount(int /* kernelIndex */) const { return 1; }
@@ -95,7 +94,7 @@ public:
     }
     CoordinateType distance = sqrt(distanceSq);
     ValueType kr = waveNumber * distance;
-    ValueType v = m_interpolator.evaluate(distance);
+    ValueType v = m_interpolator->evaluate(distance);
     const CoordinateType ONE = 1., THREE = 3.;
     result[0](0, 0) =
         static_cast<CoordinateType>(1.0 / (4.0 * M_PI)) /
@@ -112,7 +111,7 @@ public:
 private:
   /** \cond PRIVATE */
   ValueType m_waveNumber;
-  HermiteInterpolator<ValueType> m_interpolator;
+  shared_ptr<const HermiteInterpolator<ValueType>> m_interpolator;
   /** \endcond */
 };
 
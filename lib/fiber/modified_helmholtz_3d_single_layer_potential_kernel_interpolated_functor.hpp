@@ -55,10 +55,9 @@ public:
 
   ModifiedHelmholtz3dSingleLayerPotentialKernelInterpolatedFunctor(
       ValueType waveNumber, CoordinateType maxDist, int interpPtsPerWavelength)
-      : m_waveNumber(waveNumber) {
-    initializeInterpolatorForModifiedHelmholtz3dKernels(
-        waveNumber, maxDist, interpPtsPerWavelength, m_interpolator);
-  }
+      : m_waveNumber(waveNumber),
+        m_interpolator(sharedInterpolatorForModifiedHelmholtz3dKernels(
+            waveNumber, maxDist, interpPtsPerWavelength)) {}
 
   int kernelCount() const { return 1; }
   int kernelRowCount(int /* kernelIndex */) const { return 1; }
@@ -85,7 +84,7 @@ public:
       sum += diff * diff;
     }
     CoordinateType distance = sqrt(sum);
-    ValueType v = m_interpolator.evaluate(distance);
+    ValueType v = m_interpolator->evaluate(distance);
     result[0](0, 0) =
         static_cast<CoordinateType>(1.0 / (4.0 * M_PI)) / distance * v;
   }
@@ -98,7 +97,7 @@ public:
 private:
   /** \cond PRIVATE */
   ValueType m_waveNumber;
-  HermiteInterpolator<ValueType> m_interpolator;
+  shared_ptr<const HermiteInterpolator<ValueType>> m_interpolator;
   /** \endcond */
 };
 
@@ -26,8 +26,10 @@
 #include "collection_of_3d_arrays.hpp"
 #include "geometrical_data.hpp"
 #include "conjugate.hpp"
+#include "batched_test_kernel_trial_integral.hpp"
 
 #include <cassert>
+#include <vector>
 
 namespace Fiber {
 
@@ -81,6 +83,22 @@ public:
            kernelValues[0](2, 0) * (conjugate(testValues(0)) * trialValues(1) -
                                     conjugate(testValues(1)) * trialValues(0));
   }
+
+  /** \brief Return the terms of the integrand in the form expected by
+   *  BatchedTestKernelTrialIntegral. */
+  static std::vector<BatchedIntegralTerm<CoordinateType>> batchedTerms() {
+    typedef BatchedIntegralTerm<CoordinateType> Term;
+    std::vector<Term> terms;
+    // Term(test transf., test comp., kernel, kernel row, kernel col,
+    //      trial transf., trial comp., coefficient)
+    terms.push_back(Term(0, 1, 0, 0, 0, 0, 2, 1.));
+    terms.push_back(Term(0, 2, 0, 0, 0, 0, 1, -1.));
+    terms.push_back(Term(0, 2, 0, 1, 0, 0, 0, 1.));
+    terms.push_back(Term(0, 0, 0, 1, 0, 0, 2, -1.));
+    terms.push_back(Term(0, 0, 0, 2, 0, 0, 1, 1.));
+    terms.push_back(Term(0, 1, 0, 2, 0, 0, 0, -1.));
+    return terms;
+  }
 };
 
 } // namespace Fiber
@@ -54,10 +54,9 @@ public:
 
   ModifiedMaxwell3dDoubleLayerOperatorsKernelInterpolatedFunctor(
       ValueType waveNumber, CoordinateType maxDist, int interpPtsPerWavelength)
-      : m_waveNumber(waveNumber) {
-    initializeInterpolatorForModifiedHelmholtz3dKernels(
-        waveNumber, maxDist, interpPtsPerWavelength, m_interpolator);
-  }
+      : m_waveNumber(waveNumber),
+        m_interpolator(sharedInterpolatorForModifiedHelmholtz3dKernels(
+            waveNumber, maxDist, interpPtsPerWavelength)) {}
 
   int kernelCount() const { return 1; }
   int kernelRowCount(int /* kernelIndex */) const { return 3; }
@@ -84,7 +83,7 @@ public:
       distanceSq += diff * diff;
     }
     const CoordinateType distance = sqrt(distanceSq);
-    ValueType v = m_interpolator.evaluate(distance);
+    ValueType v = m_interpolator->evaluate(distance);
     const ValueType commonFactor =
         static_cast<CoordinateType>(-1. / (4. * M_PI)) *
         (static_cast<CoordinateType>(1.) + m_waveNumber * distance) /
@@ -102,7 +101,7 @@ public:
 private:
   /** \cond PRIVATE */
   ValueType m_waveNumber;
-  HermiteInterpolator<ValueType> m_interpolator;
+  shared_ptr<const HermiteInterpolator<ValueType>> m_interpolator;
   /** \endcond */
 };
 
@@ -26,6 +26,11 @@
 #include "quadrature/galerkinduffy.hpp"
 #include "quadrature/quadrature.hpp"
 
+#include "shared_ptr.hpp"
+
+#include <map>
+#include <tbb/mutex.h>
+
 namespace Fiber {
 
 // Helper functions in anonymous namespace
@@ -64,29 +69,33 @@ inline void reallyFillPointsAndWeightsRegular(int order,
 
 // Singular integration
 
+// Apply the affine map x -> A x + b to all columns of points
+template <typename ValueType>
+inline void applyAffineMap(const Matrix<ValueType> &A, const Vector<ValueType> &b,
+                           Matrix<ValueType> &points) {
+  points = (A * points).colwise() + b;
+}
+
 template <typename ValueType>
 inline void remapPointsSharedVertexTriangle(int sharedVertex,
                                             Matrix<ValueType> &points) {
   // Map vertex 0 to vertex #sharedVertex
+  Matrix<ValueType> A(2, 2);
+  Vector<ValueType> b(2);
   if (sharedVertex == 0)
-    ; // do nothing
+    return; // do nothing
   else if (sharedVertex == 1) {
-    const int pointCount = points.cols();
-    Matrix<ValueType> oldPoints(points);
-    for (int i = 0; i < pointCount; ++i) {
-      points(0, i) = -oldPoints(0, i) - oldPoints(1, i) + 1.;
-      points(1, i) = oldPoints(1, i);
-    }
+    // (x, y) -> (1 - x - y, y)
+    A << -1., -1., 0., 1.;
+    b << 1., 0.;
   } else if (sharedVertex == 2) {
-    const int pointCount = points.cols();
-    Matrix<ValueType> oldPoints(points);
-    for (int i = 0; i < pointCount; ++i) {
-      points(0, i) = oldPoints(0, i);
-      points(1, i) = -oldPoints(0, i) - oldPoints(1, i) + 1.;
-    }
+    // (x, y) -> (x, 1 - x - y)
+    A << 1., 0., -1., -1.;
+    b << 0., 1.;
   } else
     throw std::invalid_argument("remapPointsSharedVertexTriangle(): "
                                 "sharedVertex must be 0, 1 or 2");
+  applyAffineMap(A, b, points);
 }
 
 template <typename ValueType>
@@ -131,13 +140,7 @@ inline void remapPointsSharedEdgeTriangle(int sharedVertex0, int sharedVertex1,
   A.col(0) = newVertices.col(1) - b;
   A.col(1) = newVertices.col(2) - b;
 
-  Matrix<ValueType> oldPoints(points);
-
-  // points := A * oldPoints + b[extended to pointCount columns)
-  for (size_t col = 0; col < points.cols(); ++col)
-    for (int dim = 0; dim < 2; ++dim)
-      points(dim, col) = A(dim, 0) * oldPoints(0, col) +
-                         A(dim, 1) * oldPoints(1, col) + b(dim);
+  applyAffineMap(A, b, points);
 }
 
 template <typename ValueType>
@@ -174,13 +177,18 @@ inline void remapPointsSharedEdge(int sharedVertex0, int sharedVertex1,
                                                   points);
 }
 
+// Galerkin-Duffy rule on the reference element pair, before the points are
+// mapped to the vertices actually shared by a given element pair
+template <typename ValueType> struct ReferenceSingularRule {
+  Matrix<ValueType> testPoints;
+  Matrix<ValueType> trialPoints;
+  std::vector<ValueType> weights;
+};
+
 template <ELEMENT_SHAPE SHAPE, SING_INT SINGULARITY, typename ValueType>
-inline void reallyFillPointsAndWeightsSingular(
-    const DoubleQuadratureDescriptor &desc, Matrix<ValueType> &testPoints,
-    Matrix<ValueType> &trialPoints, std::vector<ValueType> &weights) {
+void createReferenceSingularRule(int order,
+                                 ReferenceSingularRule<ValueType> &result) {
   const int elementDim = 2;
-  // Is there a more efficient way?
-  const int order = std::max(desc.testOrder, desc.trialOrder);
   const int numPointsIn1d = (order + 1 + 1) / 2;
   // quadrangle regardless of SHAPE
   const QuadratureRule<QUADRANGLE, GAUSS> rule(numPointsIn1d);
@@ -189,6 +197,10 @@ inline void reallyFillPointsAndWeightsSingular(
   const int regionCount = transform.getNumRegions();
   const int totalPointCount = regionCount * pointCount * pointCount;
 
+  Matrix<ValueType> &testPoints = result.testPoints;
+  Matrix<ValueType> &trialPoints = result.trialPoints;
+  std::vector<ValueType> &weights = result.weights;
+
   Point2 point;
 
   // Quadrature points
@@ -231,6 +243,38 @@ inline void reallyFillPointsAndWeightsSingular(
         weights[col] = transform.getWeight(testIndex, trialIndex, region) *
                        rule.getWeight(testIndex) * rule.getWeight(trialIndex);
       }
+}
+
+// Return the reference rule of the given order. Rules are created once per
+// process and shared by all element pairs and operators.
+template <ELEMENT_SHAPE SHAPE, SING_INT SINGULARITY, typename ValueType>
+const ReferenceSingularRule<ValueType> &referenceSingularRule(int order) {
+  typedef std::map<int, shared_ptr<const ReferenceSingularRule<ValueType>>>
+      RuleMap;
+  static tbb::mutex mutex;
+  static RuleMap rules;
+
+  tbb::mutex::scoped_lock lock(mutex);
+  typename RuleMap::const_iterator it = rules.find(order);
+  if (it != rules.end())
+    return *it->second;
+  shared_ptr<ReferenceSingularRule<ValueType>> rule(
+      new ReferenceSingularRule<ValueType>);
+  createReferenceSingularRule<SHAPE, SINGULARITY>(order, *rule);
+  rules[order] = rule;
+  return *rule;
+}
+
+template <ELEMENT_SHAPE SHAPE, SING_INT SINGULARITY, typename ValueType>
+inline void reallyFillPointsAndWeightsSingular(
+    const DoubleQuadratureDescriptor &desc, Matrix<ValueType> &testPoints,
+    Matrix<ValueType> &trialPoints, std::vector<ValueType> &weights) {
+  const int order = std::max(desc.testOrder, desc.trialOrder);
+  const ReferenceSingularRule<ValueType> &rule =
+      referenceSingularRule<SHAPE, SINGULARITY, ValueType>(order);
+  testPoints = rule.testPoints;
+  trialPoints = rule.trialPoints;
+  weights = rule.weights;
 
   if (SINGULARITY == VRTX_ADJACENT) {
     remapPointsSharedVertex<SHAPE>(desc.topology.testSharedVertex0, testPoints);
@@ -32,8 +32,10 @@
 #include "raw_grid_geometry.hpp"
 #include "types.hpp"
 
+#include <algorithm>
 #include <stdexcept>
 #include <memory>
+#include <vector>
 
 namespace Fiber {
 
@@ -91,7 +93,6 @@ void NumericalTestFunctionIntegrator<
                              "must have the same number of components");
 
   BasisData<BasisFunctionType> testBasisData;
-  GeometricalData<CoordinateType> geomData;
 
   size_t testBasisDeps = 0;
   size_t geomDeps = INTEGRATION_ELEMENTS;
@@ -103,31 +104,57 @@ void NumericalTestFunctionIntegrator<
   std::unique_ptr<Geometry> geometry(m_geometryFactory.make());
 
   Fiber::CollectionOf3dArrays<BasisFunctionType> testValues;
-  Matrix<UserFunctionType> functionValues;
 
   result.resize(testDofCount, elementCount);
 
   testShapeset.evaluate(testBasisDeps, m_localQuadPoints, ALL_DOFS,
                         testBasisData);
 
-  // Iterate over the elements
-  for (size_t e = 0; e < elementCount; ++e) {
-    const int elementIndex = elementIndices[e];
-    m_rawGeometry.setupGeometry(elementIndex, *geometry);
-    geometry->getData(geomDeps, m_localQuadPoints, geomData);
-    if (geomDeps & DOMAIN_INDEX)
-      geomData.domainIndex = m_rawGeometry.domainIndex(elementIndex);
-    m_testTransformations.evaluate(testBasisData, geomData, testValues);
-    m_function.evaluate(geomData, functionValues);
-
-    for (int testDof = 0; testDof < testDofCount; ++testDof) {
-      ResultType sum = 0.;
-      for (size_t point = 0; point < pointCount; ++point)
-        for (int dim = 0; dim < componentCount; ++dim)
-          sum += m_quadWeights[point] * geomData.integrationElements(point) *
-                 conjugate(testValues[0](dim, testDof, point)) *
-                 functionValues(dim, point);
-      result(testDof, e) = sum;
+  // Elements are processed in chunks so that the function can be evaluated
+  // on all points of a chunk at once.
+  const size_t maxChunkSize = 4096;
+  std::vector<GeometricalData<CoordinateType>> geomData(
+      std::min(elementCount, maxChunkSize));
+  std::vector<const GeometricalData<CoordinateType> *> geomDataPtrs;
+  std::vector<Matrix<UserFunctionType>> functionValues;
+
+  for (size_t chunkStart = 0; chunkStart < elementCount;
+       chunkStart += maxChunkSize) {
+    const size_t chunkEnd = std::min(elementCount, chunkStart + maxChunkSize);
+
+    // Collect the geometrical data of the elements in the chunk
+    geomDataPtrs.clear();
+    for (size_t e = chunkStart; e < chunkEnd; ++e) {
+      const int elementIndex = elementIndices[e];
+      GeometricalData<CoordinateType> &elementGeomData =
+          geomData[e - chunkStart];
+      m_rawGeometry.setupGeometry(elementIndex, *geometry);
+      geometry->getData(geomDeps, m_localQuadPoints, elementGeomData);
+      if (geomDeps & DOMAIN_INDEX)
+        elementGeomData.domainIndex = m_rawGeometry.domainIndex(elementIndex);
+      geomDataPtrs.push_back(&elementGeomData);
+    }
+
+    m_function.evaluateOnElements(geomDataPtrs, functionValues);
+
+    for (size_t e = chunkStart; e < chunkEnd; ++e) {
+      const GeometricalData<CoordinateType> &elementGeomData =
+          geomData[e - chunkStart];
+      const Matrix<UserFunctionType> &elementFunctionValues =
+          functionValues[e - chunkStart];
+      m_testTransformations.evaluate(testBasisData, elementGeomData,
+                                     testValues);
+
+      for (int testDof = 0; testDof < testDofCount; ++testDof) {
+        ResultType sum = 0.;
+        for (size_t point = 0; point < pointCount; ++point)
+          for (int dim = 0; dim < componentCount; ++dim)
+            sum += m_quadWeights[point] *
+                   elementGeomData.integrationElements(point) *
+                   conjugate(testValues[0](dim, testDof, point)) *
+                   elementFunctionValues(dim, point);
+        result(testDof, e) = sum;
+      }
     }
   }
 }
@@ -0,0 +1,81 @@
+// Copyright (C) 2011-2012 by the BEM++ Authors
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+// THE SOFTWARE.
+
+#include "singular_integral_cache_budget.hpp"
+
+#include <algorithm>
+#include <tbb/atomic.h>
+
+namespace Fiber {
+
+namespace {
+
+tbb::atomic<size_t> s_memoryLimit;
+tbb::atomic<size_t> s_currentSize;
+tbb::atomic<size_t> s_peakSize;
+
+void updatePeakSize(size_t size) {
+  size_t peak = s_peakSize;
+  while (size > peak) {
+    size_t previous = s_peakSize.compare_and_swap(size, peak);
+    if (previous == peak)
+      break;
+    peak = previous;
+  }
+}
+
+} // namespace
+
+void SingularIntegralCacheBudget::setMemoryLimit(size_t bytes) {
+  s_memoryLimit = bytes;
+}
+
+size_t SingularIntegralCacheBudget::memoryLimit() { return s_memoryLimit; }
+
+size_t SingularIntegralCacheBudget::reserve(size_t bytes) {
+  while (true) {
+    const size_t current = s_currentSize;
+    const size_t limit = s_memoryLimit;
+    size_t granted = bytes;
+    if (limit > 0)
+      granted = current >= limit ? 0 : std::min(bytes, limit - current);
+    if (granted == 0)
+      return 0;
+    if (s_currentSize.compare_and_swap(current + granted, current) ==
+        current) {
+      updatePeakSize(current + granted);
+      return granted;
+    }
+  }
+}
+
+void SingularIntegralCacheBudget::release(size_t bytes) {
+  s_currentSize -= bytes;
+}
+
+size_t SingularIntegralCacheBudget::currentSize() { return s_currentSize; }
+
+size_t SingularIntegralCacheBudget::peakSize() { return s_peakSize; }
+
+void SingularIntegralCacheBudget::resetPeakSize() {
+  s_peakSize = s_currentSize;
+}
+
+} // namespace Fiber
@@ -0,0 +1,67 @@
+// Copyright (C) 2011-2012 by the BEM++ Authors
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+// OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+// THE SOFTWARE.
+
+#ifndef fiber_singular_integral_cache_budget_hpp
+#define fiber_singular_integral_cache_budget_hpp
+
+#include "../common/common.hpp"
+
+#include <cstddef>
+
+namespace Fiber {
+
+/** \brief Process-wide memory budget of the singular integral caches.
+ *
+ *  All local assemblers for integral operators draw the memory of their
+ *  singular integral caches from this common budget. Once the limit is
+ *  reached no further element pairs are cached; the corresponding integrals
+ *  are evaluated on the fly during the assembly. The memory is returned to
+ *  the budget when the local assembler is destroyed.
+ *
+ *  All sizes are in bytes. */
+class SingularIntegralCacheBudget {
+public:
+  /** \brief Set the maximum memory of all singular integral caches.
+   *
+   *  A value of 0 means that the memory is not limited. */
+  static void setMemoryLimit(size_t bytes);
+
+  /** \brief Return the maximum memory of all singular integral caches. */
+  static size_t memoryLimit();
+
+  /** \brief Reserve up to \p bytes and return the amount actually granted. */
+  static size_t reserve(size_t bytes);
+
+  /** \brief Return \p bytes previously obtained from reserve(). */
+  static void release(size_t bytes);
+
+  /** \brief Return the memory currently used by singular integral caches. */
+  static size_t currentSize();
+
+  /** \brief Return the largest value of currentSize() since the last reset. */
+  static size_t peakSize();
+
+  /** \brief Set the peak size to the current size. */
+  static void resetPeakSize();
+};
+
+} // namespace Fiber
+
+#endif
@@ -11,6 +11,8 @@
 #include "eigen_fwd.hpp"
 
 #include <unordered_map>
+#include <unordered_set>
+#include <vector>
 
 namespace hmat {
 
@@ -19,6 +21,19 @@ template <typename ValueType, int N> class HMatrix;
 
 template <typename ValueType> using DefaultHMatrixType = HMatrix<ValueType, 2>;
 
+/** \brief Times in seconds spent in the steps of HMatrix::initialize().
+ *
+ *  All times are summed over the threads that run the steps. */
+struct HMatrixInitializationTimes {
+  HMatrixInitializationTimes() : inadmissibleBlocks(0), coarsening(0) {}
+
+  /** \brief Compression of admissible leaves, indexed by tree level. */
+  std::vector<double> admissibleBlocksByLevel;
+  /** \brief Compression of inadmissible leaves. */
+  double inadmissibleBlocks;
+  double coarsening;
+};
+
 template <typename ValueType, int N> class HMatrix {
 public:
   typedef tbb::concurrent_unordered_map<
@@ -39,6 +54,15 @@ public:
 
   void initialize(const HMatrixCompressor<ValueType, N> &hMatrixCompressor,
                   bool coarsening = false, double coarsening_accuracy = 0);
+
+  /** \brief Only compress the leaves of part partIndex out of partCount
+   *  parts in subsequent calls to initialize().
+   *
+   *  Leaves are assigned to parts by their estimated compression cost.
+   *  The leaves of other parts are skipped in apply(), so that the sum of
+   *  the products computed by all parts is the product with the full
+   *  matrix. Coarsening is disabled if partCount > 1. */
+  void setLeafPartition(int partIndex, int partCount);
   bool isInitialized() const;
   void reset();
 
@@ -54,6 +78,12 @@ public:
                            RowColSelector rowOrColumn) const;
 
   shared_ptr<const BlockClusterTree<N>> blockClusterTree() const;
+
+  /** \brief Return the data of a leaf.
+   *
+   *  If the matrix is restricted to a part of its leaves with
+   *  setLeafPartition(), a null pointer is returned for the leaves of
+   *  other parts. Throws std::out_of_range if \p node is not a leaf. */
   shared_ptr<const hmat::HMatrixData<ValueType>>
   data(shared_ptr<const BlockClusterTreeNode<N>> node) const;
 
@@ -63,7 +93,24 @@ public:
 
   double memSizeKb() const;
 
+  /** \brief Record the times of the steps of subsequent calls to
+   *  initialize(). Disabled by default. */
+  void setRecordInitializationTimes(bool record);
+
+  /** \brief Return the times of the last call to initialize(). They are zero
+   *  unless recording was enabled with setRecordInitializationTimes(). */
+  const HMatrixInitializationTimes &initializationTimes() const;
+
 private:
+  typedef std::unordered_set<shared_ptr<BlockClusterTreeNode<N>>,
+                             shared_ptr_hash<BlockClusterTreeNode<N>>> LeafSet;
+
+  LeafSet ownedLeaves() const;
+
+  void apply_leaf(const shared_ptr<BlockClusterTreeNode<N>> &node,
+                  const Eigen::Ref<Matrix<ValueType>> &X,
+                  Eigen::Ref<Matrix<ValueType>> Y, TransposeMode trans) const;
+
   void apply_impl_parallel(const shared_ptr<BlockClusterTreeNode<N>> &node,
                   const Eigen::Ref<Matrix<ValueType>> &X,
                   Eigen::Ref<Matrix<ValueType>> Y, TransposeMode trans, int levelCount) const;
@@ -85,6 +132,10 @@ private:
   int m_numberOfLowRankBlocks;
   int m_memSizeKb;
   int m_applyParallelLevels;
+  int m_partIndex;
+  int m_partCount;
+  HMatrixInitializationTimes m_initializationTimes;
+  bool m_recordInitializationTimes;
 };
 }
 
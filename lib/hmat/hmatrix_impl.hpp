@@ -10,8 +10,11 @@
 #include "math_helper.hpp"
 #include <tbb/parallel_for_each.h>
 #include <tbb/task_group.h>
+#include <tbb/combinable.h>
+#include <tbb/tick_count.h>
 
 #include <algorithm>
+#include <stdexcept>
 
 namespace hmat {
 
@@ -20,7 +23,8 @@ HMatrix<ValueType, N>::HMatrix(
     const shared_ptr<BlockClusterTree<N>> &blockClusterTree, int applyParallelLevels)
     : m_applyParallelLevels(applyParallelLevels), 
       m_blockClusterTree(blockClusterTree), m_numberOfDenseBlocks(0),
-      m_numberOfLowRankBlocks(0), m_memSizeKb(0.0) {}
+      m_numberOfLowRankBlocks(0), m_memSizeKb(0.0), m_partIndex(0),
+      m_partCount(1), m_recordInitializationTimes(false) {}
 
 template <typename ValueType, int N>
 HMatrix<ValueType, N>::HMatrix(
@@ -73,31 +77,79 @@ void HMatrix<ValueType, N>::initialize(
     double coarsening_accuracy) {
 
   reset();
+  m_initializationTimes = HMatrixInitializationTimes();
 
   typedef decltype(m_blockClusterTree->root()) node_t;
 
-  std::function<void(const node_t &node)> compressFun =
-      [&](const node_t &node) {
+  const bool partitioned = m_partCount > 1;
+  LeafSet leaves;
+  if (partitioned)
+    leaves = ownedLeaves();
+
+  const bool record = m_recordInitializationTimes;
+  // Times are accumulated per thread and merged after the compression.
+  tbb::combinable<HMatrixInitializationTimes> threadTimes;
+
+  std::function<void(const node_t &node, int level)> compressFun =
+      [&](const node_t &node, int level) {
         if (node->isLeaf()) {
+          if (partitioned && leaves.count(node) == 0)
+            return;
+          tbb::tick_count start;
+          if (record)
+            start = tbb::tick_count::now();
           shared_ptr<HMatrixData<ValueType>> nodeData;
           hMatrixCompressor.compressBlock(*node, nodeData);
           m_hMatrixData[node] = nodeData;
+          if (!record)
+            return;
+          double seconds = (tbb::tick_count::now() - start).seconds();
+
+          auto &times = threadTimes.local();
+          if (node->data().admissible) {
+            if (static_cast<int>(times.admissibleBlocksByLevel.size()) <= level)
+              times.admissibleBlocksByLevel.resize(level + 1, 0);
+            times.admissibleBlocksByLevel[level] += seconds;
+          } else
+            times.inadmissibleBlocks += seconds;
         } else {
           tbb::task_group g;
-          g.run([&] { compressFun(node->child(0)); });
-          g.run([&] { compressFun(node->child(1)); });
-          g.run([&] { compressFun(node->child(2)); });
-          g.run_and_wait([&] { compressFun(node->child(3)); });
+          g.run([&] { compressFun(node->child(0), level + 1); });
+          g.run([&] { compressFun(node->child(1), level + 1); });
+          g.run([&] { compressFun(node->child(2), level + 1); });
+          g.run_and_wait([&] { compressFun(node->child(3), level + 1); });
 
           // Now do a coarsen step
-          if (coarsening)
+          if (coarsening && !partitioned) {
+            tbb::tick_count start;
+            if (record)
+              start = tbb::tick_count::now();
             coarsen_impl(node, coarsening_accuracy);
+            if (record)
+              threadTimes.local().coarsening +=
+                  (tbb::tick_count::now() - start).seconds();
+          }
         }
 
       };
 
   // Start the compression
-  compressFun(m_blockClusterTree->root());
+  compressFun(m_blockClusterTree->root(), 0);
+
+  if (record)
+    threadTimes.combine_each([this](const HMatrixInitializationTimes &times) {
+      auto &total = m_initializationTimes;
+      if (total.admissibleBlocksByLevel.size() <
+          times.admissibleBlocksByLevel.size())
+        total.admissibleBlocksByLevel.resize(
+            times.admissibleBlocksByLevel.size(), 0);
+      for (size_t level = 0; level < times.admissibleBlocksByLevel.size();
+           ++level)
+        total.admissibleBlocksByLevel[level] +=
+            times.admissibleBlocksByLevel[level];
+      total.inadmissibleBlocks += times.inadmissibleBlocks;
+      total.coarsening += times.coarsening;
+    });
 
   // Compute statistics
 
@@ -113,6 +165,73 @@ void HMatrix<ValueType, N>::initialize(
 
 }
 
+template <typename ValueType, int N>
+void HMatrix<ValueType, N>::setRecordInitializationTimes(bool record) {
+  m_recordInitializationTimes = record;
+}
+
+template <typename ValueType, int N>
+const HMatrixInitializationTimes &
+HMatrix<ValueType, N>::initializationTimes() const {
+  return m_initializationTimes;
+}
+
+template <typename ValueType, int N>
+void HMatrix<ValueType, N>::setLeafPartition(int partIndex, int partCount) {
+  if (partCount < 1 || partIndex < 0 || partIndex >= partCount)
+    throw std::invalid_argument("HMatrix::setLeafPartition(): "
+                                "partIndex must be in [0, partCount)");
+  m_partIndex = partIndex;
+  m_partCount = partCount;
+}
+
+template <typename ValueType, int N>
+typename HMatrix<ValueType, N>::LeafSet
+HMatrix<ValueType, N>::ownedLeaves() const {
+
+  typedef shared_ptr<BlockClusterTreeNode<N>> node_t;
+
+  std::vector<node_t> leaves;
+  std::function<void(const node_t &node)> collectLeaves =
+      [&](const node_t &node) {
+        if (node->isLeaf())
+          leaves.push_back(node);
+        else
+          for (int i = 0; i < 4; ++i)
+            collectLeaves(node->child(i));
+      };
+  collectLeaves(m_blockClusterTree->root());
+
+  // Estimated cost of the compression of each leaf. Admissible blocks are
+  // assumed to have a rank of at most 30.
+  std::vector<std::pair<double, std::size_t>> costs(leaves.size());
+  for (std::size_t i = 0; i < leaves.size(); ++i) {
+    const auto &data = leaves[i]->data();
+    double rows = data.rowClusterTreeNode->data().indexRange[1] -
+                  data.rowClusterTreeNode->data().indexRange[0];
+    double cols = data.columnClusterTreeNode->data().indexRange[1] -
+                  data.columnClusterTreeNode->data().indexRange[0];
+    double cost = data.admissible
+                      ? (rows + cols) * std::min(std::min(rows, cols), 30.)
+                      : rows * cols;
+    costs[i] = std::make_pair(-cost, i);
+  }
+
+  // Assign the most expensive remaining leaf to the part with the lowest
+  // load. The result only depends on the block cluster tree, so all parts
+  // compute the same assignment.
+  std::sort(costs.begin(), costs.end());
+  std::vector<double> loads(m_partCount, 0.);
+  LeafSet result;
+  for (const auto &cost : costs) {
+    int part = std::min_element(loads.begin(), loads.end()) - loads.begin();
+    loads[part] -= cost.first;
+    if (part == m_partIndex)
+      result.insert(leaves[cost.second]);
+  }
+  return result;
+}
+
 template <typename ValueType, int N> void HMatrix<ValueType, N>::reset() {
   m_hMatrixData.clear();
 }
@@ -131,8 +250,15 @@ HMatrix<ValueType, N>::blockClusterTree() const {
 template <typename ValueType, int N>
 shared_ptr<const HMatrixData<ValueType>> HMatrix<ValueType, N>::data(
     shared_ptr<const BlockClusterTreeNode<N>> node) const {
-  return this->m_hMatrixData.at(
+  auto it = this->m_hMatrixData.find(
       const_pointer_cast<BlockClusterTreeNode<N>>(node));
+  if (it != this->m_hMatrixData.end())
+    return it->second;
+
+  // Leaves owned by other parts of a partitioned matrix have no data
+  if (m_partCount > 1 && node->isLeaf())
+    return shared_ptr<const HMatrixData<ValueType>>();
+  throw std::out_of_range("HMatrix::data(): node is not a leaf of the matrix");
 }
 
 template <typename ValueType, int N>
@@ -226,6 +352,18 @@ void HMatrix<ValueType, N>::apply(const Eigen::Ref<Matrix<ValueType>> &X,
   // Y = this->permuteMatToOriginalDofs(yPermuted, ROW);
 }
 
+template <typename ValueType, int N>
+void HMatrix<ValueType, N>::apply_leaf(
+    const shared_ptr<BlockClusterTreeNode<N>> &node,
+    const Eigen::Ref<Matrix<ValueType>> &X, Eigen::Ref<Matrix<ValueType>> Y,
+    TransposeMode trans) const {
+
+  // Leaves owned by other parts of a partitioned matrix have no data
+  auto it = this->m_hMatrixData.find(node);
+  if (it != this->m_hMatrixData.end() && it->second)
+    it->second->apply(X, Y, trans, 1, 1);
+}
+
 template <typename ValueType, int N>
 void HMatrix<ValueType, N>::apply_impl_parallel(
     const shared_ptr<BlockClusterTreeNode<N>> &node,
@@ -233,7 +371,7 @@ void HMatrix<ValueType, N>::apply_impl_parallel(
     TransposeMode trans, int levelCount) const {
 
   if (node->isLeaf()) {
-    this->m_hMatrixData.at(node)->apply(X, Y, trans, 1, 1);
+    this->apply_leaf(node, X, Y, trans);
   } else {
 
     auto child0 = node->child(0);
@@ -338,7 +476,7 @@ void HMatrix<ValueType, N>::apply_impl_serial(
     TransposeMode trans) const {
 
   if (node->isLeaf()) {
-    this->m_hMatrixData.at(node)->apply(X, Y, trans, 1, 1);
+    this->apply_leaf(node, X, Y, trans);
   } else {
 
     auto child0 = node->child(0);
@@ -402,8 +540,11 @@ template <typename ValueType, int N>
 double HMatrix<ValueType, N>::frobeniusNorm_impl(
     const shared_ptr<BlockClusterTreeNode<N>> &node) const {
 
-  if (node->isLeaf())
-    return m_hMatrixData.at(node)->frobeniusNorm();
+  if (node->isLeaf()) {
+    auto it = m_hMatrixData.find(node);
+    return (it != m_hMatrixData.end() && it->second) ? it->second->frobeniusNorm()
+                                                     : 0;
+  }
 
   tbb::task_group g;
 
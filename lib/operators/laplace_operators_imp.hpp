@@ -194,7 +194,7 @@ laplaceHypersingularBoundaryOperator(
   shared_ptr<Fiber::TestKernelTrialIntegral<BasisFunctionType, KernelType,
                                             ResultType>> integral;
 
-  if (shouldUseBlasInQuadrature(assemblyOptions, *domain, *dualToRange)) {
+  if (shouldUseBatchedQuadrature(assemblyOptions)) {
     integral.reset(new Fiber::TypicalTestScalarKernelTrialIntegral<
         BasisFunctionType, KernelType, ResultType>());
   } else {
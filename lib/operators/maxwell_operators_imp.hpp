@@ -29,6 +29,8 @@
 #include "../fiber/modified_maxwell_3d_double_layer_operators_kernel_interpolated_functor.hpp"
 #include "../fiber/modified_maxwell_3d_double_layer_boundary_operator_integrand_functor.hpp"
 #include "../fiber/hdiv_function_value_functor.hpp"
+#include "../fiber/typical_test_scalar_kernel_trial_integral.hpp"
+#include "../fiber/batched_test_kernel_trial_integral.hpp"
 
 
 #include "../grid/max_distance.hpp"
@@ -72,6 +74,18 @@ maxwellElectricFieldBoundaryOperator(
 
   typedef GeneralElementarySingularIntegralOperator<BasisFunctionType,
                                                     KernelType, ResultType> Op;
+
+  // The integrand pairs the values with the first kernel and the surface
+  // divergences with the second kernel, so it can be evaluated with BLAS
+  shared_ptr<Fiber::TestKernelTrialIntegral<BasisFunctionType, KernelType,
+                                            ResultType>> integral;
+  if (shouldUseBatchedQuadrature(assemblyOptions))
+    integral.reset(new Fiber::TypicalTestScalarKernelTrialIntegral<
+        BasisFunctionType, KernelType, ResultType>());
+  else
+    integral.reset(new Fiber::DefaultTestKernelTrialIntegral<IntegrandFunctor>(
+        IntegrandFunctor()));
+
   if (useInterpolation)
     return 
         boost::make_shared<Op>(
@@ -81,12 +95,12 @@ maxwellElectricFieldBoundaryOperator(
                 1.1 * maxDistance(*domain->grid(), *dualToRange->grid()),
                 interpPtsPerWavelength),
             TransformationFunctor(), TransformationFunctor(),
-            IntegrandFunctor());
+            integral);
   else
         return boost::make_shared<Op>(domain, range, dualToRange, label, symmetry,
                                KernelFunctor(waveNumber / KernelType(0., 1.)),
                                TransformationFunctor(), TransformationFunctor(),
-                               IntegrandFunctor());
+                               integral);
 }
 
 
@@ -123,6 +137,17 @@ maxwellMagneticFieldBoundaryOperator(
 
   typedef GeneralElementarySingularIntegralOperator<BasisFunctionType,
                                                     KernelType, ResultType> Op;
+
+  shared_ptr<Fiber::TestKernelTrialIntegral<BasisFunctionType, KernelType,
+                                            ResultType>> integral;
+  if (shouldUseBatchedQuadrature(assemblyOptions))
+    integral.reset(new Fiber::BatchedTestKernelTrialIntegral<
+        BasisFunctionType, KernelType, ResultType>(
+        IntegrandFunctor::batchedTerms()));
+  else
+    integral.reset(new Fiber::DefaultTestKernelTrialIntegral<IntegrandFunctor>(
+        IntegrandFunctor()));
+
   if (useInterpolation)
     return 
         boost::make_shared<Op>(
@@ -132,13 +157,13 @@ maxwellMagneticFieldBoundaryOperator(
                 1.1 * maxDistance(*domain->grid(), *dualToRange->grid()),
                 interpPtsPerWavelength),
             TransformationFunctor(), TransformationFunctor(),
-            IntegrandFunctor());
+            integral);
   else
     return 
         boost::make_shared<Op>(domain, range, dualToRange, label, symmetry,
                                KernelFunctor(waveNumber / KernelType(0., 1.)),
                                TransformationFunctor(), TransformationFunctor(),
-                               IntegrandFunctor());
+                               integral);
 
 }
 
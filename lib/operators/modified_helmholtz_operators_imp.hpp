@@ -273,7 +273,7 @@ modifiedHelmholtzHypersingularBoundaryOperator(
 
   shared_ptr<Fiber::TestKernelTrialIntegral<BasisFunctionType, KernelType,
                                             ResultType>> integral;
-  if (shouldUseBlasInQuadrature(assemblyOptions, *domain, *dualToRange)) {
+  if (shouldUseBatchedQuadrature(assemblyOptions)) {
     integral.reset(new Fiber::TypicalTestScalarKernelTrialIntegral<
         BasisFunctionType, KernelType, ResultType>());
   } else {
@@ -284,7 +284,7 @@ modifiedHelmholtzHypersingularBoundaryOperator(
   typedef GeneralElementarySingularIntegralOperator<BasisFunctionType, KernelType,
                                                ResultType> Op;
   shared_ptr<Op> newOp;
-  if (shouldUseBlasInQuadrature(assemblyOptions, *domain, *dualToRange)) {
+  if (shouldUseBatchedQuadrature(assemblyOptions)) {
     shared_ptr<Fiber::TestKernelTrialIntegral<BasisFunctionType, KernelType,
                                               ResultType>> integral;
     integral.reset(new Fiber::TypicalTestScalarKernelTrialIntegral<
@@ -7,9 +7,6 @@ if scipy.version.version < '0.16.0':
     raise Exception("At leat SciPy version 0.16.0 required to run BEM++. Found version {0}".format(scipy.version.version))
     
 
-# This imports dolfin at the same time as bempp if available to avoid delays
-# at later imports of dolfin
-
 # Initialize logger
 
 from bempp.api.utils.logging import _init_logger
@@ -26,15 +23,16 @@ except:
 
 # Check for FEniCS
 
-try:
-    import dolfin as _
-except:
-    HAVE_DOLFIN = False
-    LOGGER.info("Dolfin could not be imported. FEM/BEM coupling with FEniCS not available.")
-else:
-    HAVE_DOLFIN = True
-    LOGGER.info("Found Dolfin. FEM/BEM coupling with FEniCS enabled.")
-
+def _have_dolfin():
+    """Check if FEniCS is available."""
+    try:
+        import dolfin as _
+    except:
+        LOGGER.info("Dolfin could not be imported. FEM/BEM coupling with FEniCS not available.")
+        return False
+    else:
+        LOGGER.info("Found Dolfin. FEM/BEM coupling with FEniCS enabled.")
+        return True
 
 
 # Check if config directory exists. If not create it.
@@ -65,9 +63,6 @@ def _check_create_init_dir():
     return config_path, tmp_path
 
 
-CONFIG_PATH, TMP_PATH = _check_create_init_dir()
-
-
 # Get the path to Gmsh
 
 def _gmsh_path():
@@ -80,7 +75,51 @@ def _gmsh_path():
     return gmp
 
 
-GMSH_PATH = _gmsh_path()
+# Attributes that are only computed or imported on first access. The
+# values are functions that return the attribute.
+
+def _config_paths():
+    global CONFIG_PATH, TMP_PATH
+    CONFIG_PATH, TMP_PATH = _check_create_init_dir()
+    return CONFIG_PATH, TMP_PATH
+
+
+def _import_from(module_name, name=None):
+    def load():
+        import importlib
+        module = importlib.import_module(module_name)
+        return module if name is None else getattr(module, name)
+    return load
+
+
+_LAZY_ATTRIBUTES = {
+    'HAVE_DOLFIN': _have_dolfin,
+    'GMSH_PATH': _gmsh_path,
+    'CONFIG_PATH': lambda: _config_paths()[0],
+    'TMP_PATH': lambda: _config_paths()[1],
+    'shapes': _import_from('bempp.api.shapes'),
+    'functions': _import_from('bempp.api.functions'),
+    'file_interfaces': _import_from('bempp.api.file_interfaces'),
+    'import_grid': _import_from('bempp.api.file_interfaces', 'import_grid'),
+    'export': _import_from('bempp.api.file_interfaces', 'export'),
+    'operators': _import_from('bempp.api.operators'),
+    'linalg': _import_from('bempp.api.linalg'),
+    'hmat': _import_from('bempp.api.hmat'),
+    'hmatrix_interface': _import_from('bempp.api.hmat', 'hmatrix_interface'),
+}
+
+
+def __getattr__(name):
+    """Load lazy attributes of the module on first access."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError("module 'bempp.api' has no attribute '{0}'".format(name))
+    value = _LAZY_ATTRIBUTES[name]()
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 
 # Define the global default options
@@ -101,15 +140,12 @@ from bempp.api.assembly import InverseSparseDiscreteBoundaryOperator
 from bempp.api.assembly import ZeroBoundaryOperator
 from bempp.api.assembly import as_matrix
 from bempp.api.assembly import assemble_dense_block
+from bempp.api.assembly import singular_integral_cache_info
+from bempp.api.assembly import set_singular_integral_cache_memory_limit
+from bempp.api.assembly import tune_quadrature
+from bempp.api.assembly import estimate_memory
 from bempp.api.assembly import BlockedOperator
 from bempp.api.assembly import BlockedDiscreteOperator
-from bempp.api import shapes
-from bempp.api.file_interfaces import import_grid
-from bempp.api.file_interfaces import export
-from bempp.api import operators
-from bempp.api import linalg
-from bempp.api import hmat
-from bempp.api.hmat import hmatrix_interface
 
 from bempp.api.utils.logging import DEBUG, INFO, WARNING, ERROR, CRITICAL
 from bempp.api.utils.logging import enable_console_logging
@@ -118,6 +154,12 @@ from bempp.api.utils.logging import set_logging_level
 
 ALL = -1 # Useful global identifier
 
+# Python versions before 3.7 do not support module level __getattr__
+import sys as _sys
+if _sys.version_info < (3, 7):
+    for _name in sorted(_LAZY_ATTRIBUTES):
+        __getattr__(_name)
+
 def test():
     """ Runs BEM++ python unit tests """
     import unittest
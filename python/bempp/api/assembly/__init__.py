@@ -5,7 +5,10 @@ from .discrete_boundary_operator import DenseDiscreteBoundaryOperator
 from .discrete_boundary_operator import SparseDiscreteBoundaryOperator
 from .discrete_boundary_operator import InverseSparseDiscreteBoundaryOperator
 from .discrete_boundary_operator import ZeroDiscreteBoundaryOperator
+from .discrete_boundary_operator import CompoundDiscreteBoundaryOperator
 from .discrete_boundary_operator import as_matrix
+from .weak_form_optimizer import OptimizedDiscreteOperator
+from .weak_form_optimizer import optimize_weak_form
 from .boundary_operator import BoundaryOperator
 from .boundary_operator import LocalBoundaryOperator
 from .boundary_operator import ElementaryBoundaryOperator
@@ -15,6 +18,13 @@ from .blocked_operator import BlockedOperator
 from .blocked_operator import BlockedDiscreteOperator
 from .grid_function import GridFunction
 from .assembler import assemble_dense_block
+from .assembler import singular_integral_cache_info
+from .assembler import set_singular_integral_cache_memory_limit
+from .profiling import AssemblyProfile
+from .quadrature_tuning import tune_quadrature
+from .memory_estimate import estimate_memory
+from .memory_estimate import MemoryEstimate
+from .memory_estimate import select_assembly_parameters
 from .potential_operator import PotentialOperator
 
 
@@ -37,6 +37,14 @@ class ElementaryAbstractIntegralOperator(object):
 
         return discrete_operator
 
+    @property
+    def is_complex(self):
+        """Return True if the weak form has complex entries."""
+        from bempp.core.assembly.abstract_boundary_operator import \
+            ComplexElementaryIntegralOperator
+
+        return isinstance(self._impl, ComplexElementaryIntegralOperator)
+
     @property
     def domain(self):
         """Return the domain space."""
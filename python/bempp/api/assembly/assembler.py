@@ -11,6 +11,10 @@ class LocalOperatorLocalAssembler(object):
         """Return a list of local element matrices on the given element indices."""
         return self._impl.evaluate_local_weak_forms(element_indices)
 
+    def evaluate_local_weak_forms_array(self, element_indices):
+        """Return the local element matrices as an array of shape (n, rows, cols)."""
+        return self._impl.evaluate_local_weak_forms_array(element_indices)
+
 
 def assemble_dense_block(operator, rows, cols, domain, dual_to_range, parameters=None):
     """Assemble a dense (sub)-block of an elementary integral operator."""
@@ -29,3 +33,46 @@ def assemble_dense_block(operator, rows, cols, domain, dual_to_range, parameters
     return DenseDiscreteBoundaryOperator(assemble_dense_block_ext(rows, cols, domain._impl, dual_to_range._impl,
                                                                   operator.local_assembler,
                                                                   parameters).as_matrix())
+
+
+def singular_integral_cache_info(reset_peak=False):
+    """Return the memory used by the singular integral caches.
+
+    The caches of all operators draw from one common memory budget that is
+    set with :func:`set_singular_integral_cache_memory_limit`.
+
+    Parameters
+    ----------
+    reset_peak : bool
+        If True the peak size is reset to the current size after it has been read.
+
+    Returns
+    -------
+    info : dict
+        A dictionary with the keys 'limit', 'current' and 'peak' that contain
+        the memory limit (0 if unlimited), the memory currently used by the
+        caches of all live operators and the largest memory used since the
+        last reset, all in bytes.
+
+    """
+    from bempp.core.assembly.assembler import singular_integral_cache_info_ext
+    return singular_integral_cache_info_ext(reset_peak)
+
+
+def set_singular_integral_cache_memory_limit(megabytes):
+    """Set the maximum memory of the singular integral caches of all operators together.
+
+    The limit is a setting of the process and applies to all operators
+    assembled afterwards. Element pairs that do not fit into the cache
+    are integrated on the fly.
+
+    Parameters
+    ----------
+    megabytes : float
+        The memory limit in megabytes. A value <= 0 (the default)
+        means that the memory is not limited.
+
+    """
+    from bempp.core.assembly.assembler import set_singular_integral_cache_memory_limit_ext
+    set_singular_integral_cache_memory_limit_ext(
+        int(megabytes * 1024 * 1024) if megabytes > 0 else 0)
@@ -42,17 +42,44 @@ class BlockedOperator(object):
 
         return (False not in self._cols) and (False not in self._rows)
 
-    def weak_form(self):
+    def weak_form(self, parallel=False, max_workers=None):
+        """Return the discrete weak form of the blocked operator.
+
+        Parameters
+        ----------
+        parallel : bool
+            If True, the blocks are assembled concurrently by a pool of
+            Python threads (default False). The native assembly runs without
+            the GIL. Set `parameters.assembly.max_thread_count` of the block
+            operators to limit the threads that each assembly uses.
+        max_workers : int
+            Number of concurrently assembled blocks if `parallel` is True.
+            The default is the number of CPUs.
+
+        """
 
         if not self._fill_complete():
             raise ValueError("Each row and column must have at least one operator")
 
         discrete_operator = BlockedDiscreteOperator(self._m, self._n)
 
-        for i in range(self._m):
-            for j in range(self._n):
-                if self._operators[i, j] is not None:
-                    discrete_operator[i, j] = self._operators[i, j].weak_form()
+        indices = [(i, j) for i in range(self._m) for j in range(self._n)
+                   if self._operators[i, j] is not None]
+
+        if parallel:
+            from multiprocessing.pool import ThreadPool
+
+            pool = ThreadPool(max_workers)
+            try:
+                weak_forms = pool.map(lambda index: self._operators[index].weak_form(), indices)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            weak_forms = [self._operators[index].weak_form() for index in indices]
+
+        for index, weak_form in zip(indices, weak_forms):
+            discrete_operator[index] = weak_form
 
         return discrete_operator
 
@@ -16,6 +16,21 @@ def _end_assembly_message(label, assembly_time):
     return "Operator: {1}. FINISHED ASSEMBLY. Time: {0} seconds".format(assembly_time, label)
 
 
+def _optimize_weak_form(discrete_operator, parameters=None):
+    """Flatten the weak form of a composite operator if enabled in the parameters."""
+
+    import bempp.api
+
+    if parameters is None:
+        parameters = bempp.api.global_parameters
+
+    if not parameters.assembly.enable_weak_form_optimization:
+        return discrete_operator
+
+    from .weak_form_optimizer import optimize_weak_form
+    return optimize_weak_form(discrete_operator)
+
+
 class BoundaryOperator(object):
     """A basic object describing operators acting on boundaries.
 
@@ -53,7 +68,7 @@ class BoundaryOperator(object):
         """Return the label of the operator."""
         return self._label
 
-    def weak_form(self, recompute=False):
+    def weak_form(self, recompute=False, profile=False):
         """Return the discretised weak form.
 
         Parameters
@@ -61,9 +76,20 @@ class BoundaryOperator(object):
         recompute : bool
             Usually the weak form is cached. If this parameter is set to
             `true` the weak form is recomputed.
+        profile : bool
+            If True the weak form is recomputed with per-phase timing
+            and a tuple (weak_form, profile) is returned, where profile is
+            a :class:`bempp.api.assembly.profiling.AssemblyProfile`. The
+            cached weak forms of operators this operator is composed of
+            are not recomputed. The profiler is shared by the process,
+            so assemblies running concurrently are mixed in the profile.
 
         """
 
+        if profile:
+            from .profiling import profile_assembly
+            return profile_assembly(lambda: self.weak_form(recompute=True))
+
         if recompute:
             self._weak_form = None
 
@@ -247,6 +273,11 @@ class ElementaryBoundaryOperator(BoundaryOperator):
         """Return the parameters of the operator."""
         return self._parameters
 
+    @property
+    def is_complex(self):
+        """Return True if the weak form has complex entries."""
+        return self._impl.is_complex
+
     @property
     def local_assembler(self):
         """Return the local assembler"""
@@ -257,14 +288,26 @@ class ElementaryBoundaryOperator(BoundaryOperator):
         import time
         import bempp.api
 
-        assembly_mode = self._parameters.assembly.boundary_operator_assembly_type
+        parameters = self._parameters
+        auto = parameters.assembly.boundary_operator_assembly_type == 'auto'
+        if auto:
+            from .memory_estimate import select_assembly_parameters
+            parameters = select_assembly_parameters(self, keep_block_cluster_tree=True)
+
+        assembly_mode = parameters.assembly.boundary_operator_assembly_type
 
         bempp.api.LOGGER.info(_start_assembly_message(self.domain,
                                                       self.dual_to_range,
                                                       assembly_mode, self.label))
         start_time = time.time()
 
-        weak_form = self._impl.assemble_weak_form(self._parameters)
+        try:
+            weak_form = self._impl.assemble_weak_form(parameters)
+        finally:
+            if auto:
+                from bempp.core.hmat.block_cluster_tree import discard_kept_block_cluster_trees
+
+                discard_kept_block_cluster_trees(self.dual_to_range._impl, self.domain._impl)
 
         end_time = time.time()
         bempp.api.LOGGER.info(_end_assembly_message(self.label, end_time - start_time))
@@ -375,7 +418,7 @@ class _ProjectionBoundaryOperator(BoundaryOperator):
 
             projected_weak_form *= discrete_coefficient_projection(self._domain, self._operator.domain)
 
-        return projected_weak_form
+        return _optimize_weak_form(projected_weak_form)
 
 
 class _SumBoundaryOperator(BoundaryOperator):
@@ -394,7 +437,7 @@ class _SumBoundaryOperator(BoundaryOperator):
         self._op2 = op2
 
     def _weak_form_impl(self):
-        return self._op1.weak_form() + self._op2.weak_form()
+        return _optimize_weak_form(self._op1.weak_form() + self._op2.weak_form())
 
 
 class _ScaledBoundaryOperator(BoundaryOperator):
@@ -408,7 +451,7 @@ class _ScaledBoundaryOperator(BoundaryOperator):
         self._alpha = alpha
 
     def _weak_form_impl(self):
-        return self._op.weak_form() * self._alpha
+        return _optimize_weak_form(self._op.weak_form() * self._alpha)
 
 
 class _ProductBoundaryOperator(BoundaryOperator):
@@ -426,7 +469,7 @@ class _ProductBoundaryOperator(BoundaryOperator):
         self._op2 = op2
 
     def _weak_form_impl(self):
-        return self._op1.weak_form() * self._op2.strong_form()
+        return _optimize_weak_form(self._op1.weak_form() * self._op2.strong_form())
 
 
 class _TransposeBoundaryOperator(BoundaryOperator):
@@ -456,10 +499,17 @@ class _AdjointBoundaryOperator(BoundaryOperator):
 
 
 class CompoundBoundaryOperator(BoundaryOperator):
-    """Create a compound boundary operator."""
+    """Create a compound boundary operator.
+
+    The operator is the sum over i of multipliers[i] times the product of
+    test_local_ops[i], kernel_op and trial_local_ops[i] (with the inverse
+    mass matrices in between). The kernel operator is applied once per
+    product for all terms together.
+
+    """
 
     def __init__(self, test_local_ops, kernel_op, trial_local_ops,
-                 parameters=None, label=""):
+                 parameters=None, label="", multipliers=None):
 
         import bempp
 
@@ -495,6 +545,11 @@ class CompoundBoundaryOperator(BoundaryOperator):
         self._trial_local_ops = trial_local_ops
         self._kernel_op = kernel_op
         self._number_of_ops = len(test_local_ops)
+        if multipliers is None:
+            multipliers = [1] * self._number_of_ops
+        if len(multipliers) != self._number_of_ops:
+            raise ValueError("There must be one multiplier for each term.")
+        self._multipliers = multipliers
 
     def _weak_form_impl(self):
 
@@ -502,9 +557,8 @@ class CompoundBoundaryOperator(BoundaryOperator):
 
         from .discrete_boundary_operator import ZeroDiscreteBoundaryOperator
         from .discrete_boundary_operator import InverseSparseDiscreteBoundaryOperator
-
-        discrete_op = ZeroDiscreteBoundaryOperator(self.dual_to_range.global_dof_count,
-                                                   self.domain.global_dof_count)
+        from .discrete_boundary_operator import SparseDiscreteBoundaryOperator
+        from .discrete_boundary_operator import CompoundDiscreteBoundaryOperator
 
         test_inverse = InverseSparseDiscreteBoundaryOperator(
             identity(self._test_local_ops[0].domain, self._kernel_op.domain,
@@ -515,7 +569,21 @@ class CompoundBoundaryOperator(BoundaryOperator):
                                                                        parameters=self._parameters).weak_form())
 
         kernel_discrete_op = self._kernel_op.weak_form()
-        for i in range(self._number_of_ops):
-            discrete_op += (self._test_local_ops[i].weak_form() * test_inverse * kernel_discrete_op *
-                            trial_inverse * self._trial_local_ops[i].weak_form())
-        return discrete_op
+        test_discrete_ops = [op.weak_form() for op in self._test_local_ops]
+        trial_discrete_ops = [op.weak_form() for op in self._trial_local_ops]
+
+        if all([isinstance(op, SparseDiscreteBoundaryOperator)
+                for op in test_discrete_ops + trial_discrete_ops]):
+            # Apply the kernel operator only once per product.
+            discrete_op = CompoundDiscreteBoundaryOperator(test_discrete_ops, test_inverse,
+                                                           kernel_discrete_op, trial_inverse,
+                                                           trial_discrete_ops, self._multipliers)
+        else:
+            discrete_op = ZeroDiscreteBoundaryOperator(self.dual_to_range.global_dof_count,
+                                                       self.domain.global_dof_count)
+            for i in range(self._number_of_ops):
+                discrete_op += self._multipliers[i] * (
+                    test_discrete_ops[i] * test_inverse * kernel_discrete_op *
+                    trial_inverse * trial_discrete_ops[i])
+
+        return _optimize_weak_form(discrete_op, self._parameters)
@@ -225,7 +225,7 @@ class InverseSparseDiscreteBoundaryOperator(_LinearOperator):
             result = self._solve_fun(vec.squeeze())
 
             if vec.ndim > 1:
-                return result.reshape(self.shape[0], 1)
+                return result.reshape(self.shape[0], vec.shape[1])
             else:
                 return result
 
@@ -251,6 +251,11 @@ class InverseSparseDiscreteBoundaryOperator(_LinearOperator):
 
         return self._solver.solve(vec)
 
+    def _matmat(self, mat): #pylint: disable=method-hidden
+        """Implemententation of matmat."""
+
+        return self._solver.solve(mat)
+
 class ZeroDiscreteBoundaryOperator(_LinearOperator):
     """A discrete operator that represents a zero operator.
 
@@ -278,6 +283,104 @@ class ZeroDiscreteBoundaryOperator(_LinearOperator):
         else:
             return _np.zeros(self.shape[0], dtype='float64')
 
+class CompoundDiscreteBoundaryOperator(_LinearOperator):
+    """Discrete form of a sum of sparse transformations of a single kernel operator.
+
+    This operator represents the sum
+
+        sum_i multipliers[i] * test_ops[i] * test_inverse * kernel_op * trial_inverse * trial_ops[i]
+
+    that arises in the assembly of hypersingular and electric field operators
+    from a single-layer operator. Instead of applying the kernel operator once
+    for each term, the results of the trial operators are stacked into the
+    columns of a single matrix, to which the inverses and the kernel operator
+    are applied in one matrix-matrix product. The test operators are then
+    contracted with the corresponding columns.
+
+    This class derives from :class:`scipy.sparse.linalg.interface.LinearOperator`
+    and thereby implements the SciPy LinearOperator protocol.
+
+    Parameters
+    ----------
+    test_ops : list of SparseDiscreteBoundaryOperator
+        The sparse operators on the test side.
+    test_inverse : scipy.sparse.linalg.interface.LinearOperator
+        The inverse mass matrix on the test side.
+    kernel_op : scipy.sparse.linalg.interface.LinearOperator
+        The discrete kernel operator.
+    trial_inverse : scipy.sparse.linalg.interface.LinearOperator
+        The inverse mass matrix on the trial side.
+    trial_ops : list of SparseDiscreteBoundaryOperator
+        The sparse operators on the trial side.
+    multipliers : list of scalars
+        A scalar factor for each term (default 1 for all terms).
+
+    """
+
+    def __init__(self, test_ops, test_inverse, kernel_op, trial_inverse, trial_ops,
+                 multipliers=None):
+
+        from scipy.sparse import hstack, vstack
+
+        if len(test_ops) != len(trial_ops):
+            raise ValueError("There must be the same number of test and trial operators.")
+
+        if multipliers is None:
+            multipliers = [1] * len(test_ops)
+        if len(multipliers) != len(test_ops):
+            raise ValueError("There must be one multiplier for each term.")
+
+        dtype = _np.dtype('float64')
+        for op in [test_inverse, kernel_op, trial_inverse] + list(test_ops) + list(trial_ops):
+            dtype = _np.result_type(dtype, op.dtype)
+        for multiplier in multipliers:
+            dtype = _np.result_type(dtype, _np.asarray(multiplier).dtype)
+
+        super(CompoundDiscreteBoundaryOperator, self).__init__(
+            dtype=dtype, shape=(test_ops[0].shape[0], trial_ops[0].shape[1]))
+
+        self._number_of_ops = len(test_ops)
+        self._test_inverse = test_inverse
+        self._kernel_op = kernel_op
+        self._trial_inverse = trial_inverse
+
+        # Trial operators are stacked vertically and test operators
+        # horizontally so that each side is applied with a single sparse product.
+        # The multipliers are absorbed into the trial operators.
+        self._trial_stack = vstack([multiplier * op.sparse_operator
+                                    for multiplier, op in zip(multipliers, trial_ops)]).tocsr()
+        self._test_stack = hstack([op.sparse_operator for op in test_ops]).tocsr()
+
+    def _matmat(self, mat): # pylint: disable=method-hidden
+        """Apply the compound operator to the columns of mat."""
+
+        number_of_ops = self._number_of_ops
+        cols = mat.shape[1]
+        trial_rows = self._trial_stack.shape[0] // number_of_ops
+        test_cols = self._test_stack.shape[1] // number_of_ops
+
+        # Move the result of the ith trial operator into the ith block of columns.
+        stacked = self._trial_stack.dot(mat).reshape(number_of_ops, trial_rows, cols)
+        stacked = _np.ascontiguousarray(stacked.transpose(1, 0, 2)).reshape(
+            trial_rows, number_of_ops * cols)
+
+        stacked = self._trial_inverse.matmat(stacked)
+        stacked = self._kernel_op.matmat(stacked)
+        stacked = self._test_inverse.matmat(stacked)
+
+        # Undo the column stacking and contract with the test operators.
+        stacked = _np.asarray(stacked).reshape(test_cols, number_of_ops, cols)
+        stacked = _np.ascontiguousarray(stacked.transpose(1, 0, 2)).reshape(
+            number_of_ops * test_cols, cols)
+
+        return self._test_stack.dot(stacked)
+
+    def _matvec(self, vec): # pylint: disable=method-hidden
+        """Implements matrix-vector product."""
+
+        return self._matmat(vec.reshape(-1, 1))
+
+
 def as_matrix(operator):
     """Return a representation of a discrete linear operator as a dense numpy matrix.
 
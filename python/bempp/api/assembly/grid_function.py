@@ -24,6 +24,19 @@ class GridFunction(object):
             fun(x,n,domain_index,result):
                 result[0] =  np.dot(x,n)
 
+       If the GridFunction is created with ``vectorized=True`` the callable
+       is instead called for whole batches of quadrature points. In this case
+       x and n are arrays of shape (3, N), domain_index is an array of
+       length N and result is an array of shape (components, N). The above
+       example then becomes::
+
+            fun(x,n,domain_index,result):
+                result[0] = np.sum(x * n, axis=0)
+
+       Built-in functions from :mod:`bempp.api.functions`, such as plane
+       waves or point sources, can be passed in the same way. They are
+       projected in parallel in native code.
+
     2. By providing a vector of coefficients at the nodes. This is preferable if
        the coefficients of the data are coming from an external code.
 
@@ -49,6 +62,9 @@ class GridFunction(object):
     parameters : bempp.api.ParameterList
         A ParameterList object used for the assembly of
         the GridFunction (optional).
+    vectorized : bool
+        If True, the callable fun is evaluated on batches of points
+        instead of single points (default False).
 
     Attributes
     ----------
@@ -84,6 +100,10 @@ class GridFunction(object):
 
     >>> grid_function = GridFunction(space,coefficients=coeffs)
 
+    To create a GridFunction from a vectorized Python callable my_fun use
+
+    >>> grid_function = GridFunction(space, fun=my_fun, vectorized=True)
+
     To create a GridFunction from a vector of projections proj use
 
     >>> grid_function = GridFunction(space,dual_space=dual_space, projections=proj)
@@ -91,7 +111,7 @@ class GridFunction(object):
     """
 
     def __init__(self, space, dual_space=None, fun=None, coefficients=None,
-                 projections=None, parameters=None):
+                 projections=None, parameters=None, vectorized=False):
 
         import bempp.api
         import numpy as np
@@ -121,7 +141,13 @@ class GridFunction(object):
             else:
                 proj_space = self.space
 
-            projections = calculate_projection(parameters, fun, proj_space._impl)
+            from bempp.api.functions import AnalyticFunction
+
+            if isinstance(fun, AnalyticFunction):
+                projections = fun.projections(proj_space, parameters)
+            else:
+                projections = calculate_projection(parameters, fun, proj_space._impl,
+                                                   vectorized)
 
         if projections is not None:
             np_proj = 1.0 * np.asarray(projections).squeeze()
@@ -186,6 +212,97 @@ class GridFunction(object):
                 np.asarray(weights)
         return self.space.evaluate_local_basis(element, local_coordinates, dof_values)
 
+    def evaluate_all(self, local_coordinates):
+        """Evaluate the grid function on all elements.
+
+        Parameters
+        ----------
+        local_coordinates : np.ndarray
+            A (2 x n_points) array of local coordinates on the
+            reference element.
+
+        Returns
+        -------
+        out : np.ndarray
+            An array of shape (components, n_elements, n_points). The
+            second index is the index of the element in the leaf view.
+
+        """
+
+        import numpy as np
+
+        local_coordinates = np.asarray(local_coordinates, dtype='float64').reshape(2, -1)
+        local_coefficients = self._local_coefficients()
+        values = self.space._impl.evaluate_on_all_elements(
+            local_coordinates, local_coefficients.T)
+        return values.reshape(values.shape[0], local_coefficients.shape[0],
+                              local_coordinates.shape[1])
+
+    def _local_coefficients(self):
+        """Return an (n_elements x n_local_dofs) array of weighted local coefficients."""
+
+        import numpy as np
+
+        global_dofs = self.space.local2global
+        return np.where(global_dofs >= 0,
+                        self.coefficients[np.maximum(global_dofs, 0)],
+                        0) * self.space.local_multipliers
+
+    def element_l2_norms(self):
+        """Return the L^2 norms of the function on all elements.
+
+        The result is an array whose ith entry is the norm on the element
+        with index i in the leaf view. All local mass matrices are
+        computed in a single call to the local assembler.
+
+        """
+
+        import numpy as np
+        import bempp.api
+
+        ident = bempp.api.operators.boundary.sparse.identity(
+            self.space, self.space, self.space)
+        element_count = self.grid.leaf_view.entity_count(0)
+
+        local_mass = ident.local_assembler.evaluate_local_weak_forms_array(
+            list(range(element_count)))
+        local_coefficients = self._local_coefficients()
+        n_local = local_mass.shape[1]
+
+        squared_norms = np.einsum('ei,eij,ej->e', local_coefficients[:, :n_local].conjugate(),
+                                  local_mass, local_coefficients[:, :n_local])
+        return np.sqrt(np.maximum(np.real(squared_norms), 0))
+
+    def element_residual_indicators(self, reference=None, mesh_size_exponent=0.5):
+        """Return weighted element-wise residual indicators.
+
+        The indicator on the element T is h_T^s * ||r||_{L^2(T)}, where
+        h_T is the square root of the area of T and s is the mesh size
+        exponent.
+
+        Parameters
+        ----------
+        reference : bempp.api.GridFunction
+            If given, the residual r is the difference between this grid
+            function and reference, which must be defined on the same
+            space. Otherwise r is this grid function (optional).
+        mesh_size_exponent : float
+            The exponent s of the mesh size weight (default 0.5).
+
+        Returns
+        -------
+        out : np.ndarray
+            An array of indicators, one for each element in the leaf view.
+
+        """
+
+        import numpy as np
+
+        residual = self if reference is None else self - reference
+
+        areas = self.grid.leaf_view.areas
+        return np.sqrt(areas)**mesh_size_exponent * residual.element_l2_norms()
+
     def l2_norm(self, element=None):
         """Return the L^2 norm of the function on a single element or in total."""
 
@@ -297,7 +414,7 @@ class GridFunction(object):
     @property
     def component_count(self):
         """Return the number of components of the grid function values."""
-        return self.space.codomainDimension
+        return self.space.codomain_dimension
 
     @property
     def dtype(self):
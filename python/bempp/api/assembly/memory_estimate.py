@@ -0,0 +1,324 @@
+"""Estimation of the memory required by the weak form of an operator before its assembly."""
+
+
+def _item_size(operator):
+    """Return the size in bytes of an entry of the weak form."""
+    return 16 if operator.is_complex else 8
+
+
+def estimated_rank(eps, max_rank):
+    """Return the rank assumed for the admissible blocks of an H-matrix.
+
+    The rank of an ACA approximation of an asymptotically smooth kernel
+    grows with the square of the number of correct digits. The model
+    rank ceil(log10(1 / eps)^2), limited by `max_rank`, overestimates
+    the typical ranks of Laplace type kernels. Oscillatory kernels at
+    high wavenumbers can require larger ranks.
+
+    """
+    import math
+
+    if eps >= 1:
+        return 1
+    return max(1, min(max_rank, int(math.ceil(math.log10(1. / eps) ** 2))))
+
+
+class MemoryEstimate(object):
+    """The estimated storage of the weak form of an operator.
+
+    Attributes
+    ----------
+    assembly_type : string
+        The assembly type of the operator ('dense' or 'hmat'). For
+        operators with assembly type 'auto' this is the chosen type.
+    shape : tuple
+        The shape of the weak form.
+    dense_mb : float
+        The storage in megabytes of the dense weak form.
+    hmat_mb : float
+        The estimated storage in megabytes of the H-matrix weak form,
+        or None if the block cluster tree was not built.
+    rank : int
+        The rank assumed for the admissible blocks.
+    dense_blocks : int
+        The number of inadmissible (dense) leaves of the H-matrix,
+        or None if the block cluster tree was not built.
+    low_rank_blocks : int
+        The number of admissible (low-rank) leaves of the H-matrix,
+        or None if the block cluster tree was not built.
+
+    """
+
+    def __init__(self, assembly_type, shape, dense_mb, hmat_mb, rank,
+                 dense_blocks, low_rank_blocks):
+        self.assembly_type = assembly_type
+        self.shape = shape
+        self.dense_mb = dense_mb
+        self.hmat_mb = hmat_mb
+        self.rank = rank
+        self.dense_blocks = dense_blocks
+        self.low_rank_blocks = low_rank_blocks
+
+    @property
+    def mb(self): # pylint: disable=invalid-name
+        """Return the estimated storage in megabytes for the assembly type of the operator."""
+        return self.hmat_mb if self.assembly_type == 'hmat' else self.dense_mb
+
+    def __str__(self):
+        if self.hmat_mb is None:
+            return "Shape: {0}. Dense: {1:.1f} MB. H-matrix: not estimated.".format(
+                self.shape, self.dense_mb)
+        return ("Shape: {0}. Dense: {1:.1f} MB. H-matrix: {2:.1f} MB " +
+                "({3} dense and {4} low-rank blocks of assumed rank {5}).").format(
+                    self.shape, self.dense_mb, self.hmat_mb, self.dense_blocks,
+                    self.low_rank_blocks, self.rank)
+
+
+# The lowest H-matrix accuracy that the assembly type 'auto' uses to meet the memory budget.
+_AUTO_MAX_EPS = 1E-2
+
+
+def _block_cluster_tree(operator, parameters):
+    """Return the block cluster tree of an operator."""
+    from bempp.core.hmat.block_cluster_tree import generate_block_cluster_tree
+
+    # pylint: disable=protected-access
+    return generate_block_cluster_tree(operator.dual_to_range._impl, operator.domain._impl,
+                                       parameters)
+
+
+def _dense_mb(operator):
+    """Return the storage in megabytes of the dense weak form of an operator."""
+    megabyte = 1024. ** 2
+    return (operator.dual_to_range.global_dof_count * operator.domain.global_dof_count *
+            _item_size(operator) / megabyte)
+
+
+def _make_estimate(operator, assembly_type, leaf_shapes, rank):
+    """Return the MemoryEstimate for the given leaves and rank of the admissible blocks.
+
+    If `leaf_shapes` is None only the dense storage is estimated.
+
+    """
+    megabyte = 1024. ** 2
+    item_size = _item_size(operator)
+    rows = operator.dual_to_range.global_dof_count
+    columns = operator.domain.global_dof_count
+
+    if leaf_shapes is None:
+        return MemoryEstimate(assembly_type, (rows, columns), _dense_mb(operator),
+                              None, rank, None, None)
+
+    entries = 0
+    dense_blocks = 0
+    low_rank_blocks = 0
+    for block_rows, block_columns, admissible in leaf_shapes:
+        if admissible:
+            entries += min(rank * (block_rows + block_columns), block_rows * block_columns)
+            low_rank_blocks += 1
+        else:
+            entries += block_rows * block_columns
+            dense_blocks += 1
+
+    return MemoryEstimate(assembly_type, (rows, columns), _dense_mb(operator),
+                          entries * item_size / megabyte, rank, dense_blocks, low_rank_blocks)
+
+
+def _select_assembly(operator, parameters, rank=None, estimate_hmat=False):
+    """Choose the assembly type and accuracy of an operator for the assembly type 'auto'.
+
+    Unless `estimate_hmat` is True the block cluster tree is only built
+    if the H-matrix storage has to be checked against the memory budget,
+    that is not for operators that are assembled densely and not without
+    a memory budget.
+
+    Returns
+    -------
+    (parameters, estimate, reason, tree) : tuple
+        A copy of the parameters with the chosen assembly type and
+        accuracy, the memory estimate for this choice, the reason
+        for the choice as string and the block cluster tree or None
+        if it was not built.
+
+    """
+    budget = parameters.assembly.memory_budget_mb
+    max_rank = parameters.hmat.max_rank
+    rows = operator.dual_to_range.global_dof_count
+    columns = operator.domain.global_dof_count
+
+    def fits(megabytes):
+        return budget <= 0 or megabytes <= budget
+
+    selected = parameters.copy()
+    nominal_rank = rank if rank is not None else estimated_rank(parameters.hmat.eps, max_rank)
+
+    tree = _block_cluster_tree(operator, parameters) if estimate_hmat else None
+    leaf_shapes = tree.leaf_shapes if tree is not None else None
+
+    max_dofs = parameters.assembly.auto_dense_max_dof_count
+    if max(rows, columns) <= max_dofs and fits(_dense_mb(operator)):
+        selected.assembly.boundary_operator_assembly_type = 'dense'
+        return (selected, _make_estimate(operator, 'dense', leaf_shapes, nominal_rank),
+                "At most {0} DOFs.".format(max_dofs), tree)
+
+    selected.assembly.boundary_operator_assembly_type = 'hmat'
+    if budget <= 0:
+        return (selected, _make_estimate(operator, 'hmat', leaf_shapes, nominal_rank),
+                "More than {0} DOFs.".format(max_dofs), tree)
+
+    eps = parameters.hmat.eps
+    if tree is None:
+        tree = _block_cluster_tree(operator, parameters)
+        leaf_shapes = tree.leaf_shapes
+    estimate = _make_estimate(operator, 'hmat', leaf_shapes, nominal_rank)
+    if fits(estimate.hmat_mb):
+        if max(rows, columns) > max_dofs:
+            return selected, estimate, "More than {0} DOFs.".format(max_dofs), tree
+        return selected, estimate, \
+            "Dense storage exceeds the memory budget of {0:.1f} MB.".format(budget), tree
+
+    while eps * 10 <= _AUTO_MAX_EPS:
+        eps *= 10
+        estimate = _make_estimate(operator, 'hmat', leaf_shapes,
+                                  min(nominal_rank, estimated_rank(eps, max_rank)))
+        if fits(estimate.hmat_mb):
+            selected.hmat.eps = eps
+            return selected, estimate, \
+                "Accuracy lowered to eps={0:g} to meet the memory budget of {1:.1f} MB.".format(
+                    eps, budget), tree
+
+    raise MemoryError(
+        ("The weak form of operator {0} needs an estimated {1:.1f} MB even with " +
+         "eps={2:g}, which exceeds the memory budget of {3:.1f} MB.").format(
+             operator.label, estimate.hmat_mb, eps, budget))
+
+
+def select_assembly_parameters(operator, parameters=None, keep_block_cluster_tree=False):
+    """Return the parameters with which an operator is assembled in the assembly type 'auto'.
+
+    Operators with at most `parameters.assembly.auto_dense_max_dof_count`
+    rows and columns are assembled densely if their storage fits into
+    `parameters.assembly.memory_budget_mb`. All other operators are
+    assembled as H-matrix. If the estimated H-matrix storage exceeds the
+    budget the accuracy `parameters.hmat.eps` is lowered by factors of
+    ten, up to 1E-2. The block cluster tree is only built to estimate
+    the H-matrix storage against a budget. The choice is logged.
+
+    Parameters
+    ----------
+    operator : bempp.api.assembly.ElementaryBoundaryOperator
+        The operator to assemble.
+    parameters : bempp.api.common.ParameterList
+        The parameters to start from. Defaults to the parameters of
+        the operator. They are not modified.
+    keep_block_cluster_tree : bool
+        If True and the H-matrix assembly is chosen, the block cluster
+        tree built for the estimate is kept for the next assembly of
+        the operator instead of being built again. Kept trees that are
+        not used are released with
+        :func:`bempp.core.hmat.block_cluster_tree.discard_kept_block_cluster_trees`.
+
+    Returns
+    -------
+    parameters : bempp.api.common.ParameterList
+        A copy of the parameters with the chosen assembly type and accuracy.
+
+    Raises
+    ------
+    MemoryError
+        If the estimated storage exceeds the budget at the lowest accuracy.
+
+    """
+    import bempp.api
+
+    if parameters is None:
+        parameters = operator.parameters
+
+    selected, estimate, reason, tree = _select_assembly(operator, parameters)
+    if estimate.mb is None:
+        storage = "Storage not estimated."
+    else:
+        storage = "Estimated storage: {0:.1f} MB".format(estimate.mb)
+    bempp.api.LOGGER.info(
+        "Operator: {0}. AUTO ASSEMBLY TYPE: {1}. {2} {3}".format(
+            operator.label, selected.assembly.boundary_operator_assembly_type, reason,
+            storage))
+
+    if (keep_block_cluster_tree and tree is not None and
+            selected.assembly.boundary_operator_assembly_type == 'hmat'):
+        from bempp.core.hmat.block_cluster_tree import keep_block_cluster_tree_for_assembly
+
+        # pylint: disable=protected-access
+        keep_block_cluster_tree_for_assembly(operator.dual_to_range._impl,
+                                             operator.domain._impl, tree, selected)
+    return selected
+
+
+def estimate_memory(operator, parameters=None, rank=None, limit_mb=None):
+    """Estimate the storage of the weak form of an operator without assembling it.
+
+    The dense storage is rows x columns x size of an entry. For the
+    H-matrix storage the block cluster tree is built from the parameters
+    of the operator. Each inadmissible leaf of size m x n is stored as
+    dense block and each admissible leaf as low-rank block of storage
+    rank x (m + n) entries. The rank is taken from
+    :func:`estimated_rank` unless it is given. Coarsening can reduce
+    the actual storage. The memory needed for the singular integral
+    caches and the temporary data of the assembly is not included.
+
+    The estimate can be validated against the peak memory per
+    assembly phase returned by `operator.weak_form(profile=True)`.
+    For the assembly type 'auto' the estimate is given for the type
+    and accuracy chosen by :func:`select_assembly_parameters`. The
+    block cluster tree is always built, so that the H-matrix storage
+    is estimated and `limit_mb` is checked also without a memory budget.
+
+    Parameters
+    ----------
+    operator : bempp.api.assembly.ElementaryBoundaryOperator
+        The operator to estimate.
+    parameters : bempp.api.common.ParameterList
+        The parameters that determine the block cluster tree, the
+        accuracy and the assembly type. Defaults to the parameters of
+        the operator.
+    rank : int
+        The rank of the admissible blocks. Overrides the rank model.
+    limit_mb : float
+        If given, a MemoryError is raised if the estimate for the
+        assembly type exceeds this number of megabytes. This allows
+        a job to fail before an expensive assembly.
+
+    Returns
+    -------
+    estimate : MemoryEstimate
+        The estimated storage.
+
+    Examples
+    --------
+    >>> slp = bempp.api.operators.boundary.laplace.single_layer(space, space, space)
+    >>> print(bempp.api.estimate_memory(slp))
+
+    """
+    from .boundary_operator import ElementaryBoundaryOperator
+
+    if not isinstance(operator, ElementaryBoundaryOperator):
+        raise ValueError("Memory can only be estimated for elementary integral operators.")
+
+    if parameters is None:
+        parameters = operator.parameters
+
+    if parameters.assembly.boundary_operator_assembly_type == 'auto':
+        estimate = _select_assembly(operator, parameters, rank, estimate_hmat=True)[1]
+    else:
+        if rank is None:
+            rank = estimated_rank(parameters.hmat.eps, parameters.hmat.max_rank)
+        estimate = _make_estimate(operator, parameters.assembly.boundary_operator_assembly_type,
+                                  _block_cluster_tree(operator, parameters).leaf_shapes, rank)
+
+    if limit_mb is not None and estimate.mb > limit_mb:
+        raise MemoryError(
+            ("The weak form of operator {0} needs an estimated {1:.1f} MB, " +
+             "which exceeds the limit of {2:.1f} MB.").format(
+                 operator.label, estimate.mb, limit_mb))
+
+    return estimate
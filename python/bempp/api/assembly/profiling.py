@@ -0,0 +1,114 @@
+"""Per-phase timing of the assembly of weak forms."""
+
+
+class AssemblyProfile(object):
+    """The time spent in the phases of an assembly.
+
+    Phases that run sequentially report their wall time. Phases that run in
+    parallel (marked as summed over threads) report the time of all threads
+    added up, which can exceed the total wall time. The busy time of a
+    thread is the time it spent computing matrix entries, so that the
+    differences between threads show the load imbalance.
+
+    At the end of each sequential phase the peak resident memory
+    (high-water mark) of the process is recorded. Since it never
+    decreases, the phase in which it first exceeds its value before the
+    assembly is the phase that allocated the memory. Phases summed over
+    threads are recorded per thread without synchronisation and report
+    the peak memory at the end of the assembly.
+
+    Attributes
+    ----------
+    phases : list of tuple
+        A tuple (name, seconds, summed over threads) for each phase
+        in the order in which the phases were first entered.
+    thread_busy_times : list of float
+        The busy time in seconds of each thread that computed entries.
+    total_time : float
+        The wall time in seconds of the whole assembly.
+    peak_memory_mb : dict
+        The peak resident memory of the process in megabytes at the end
+        of each phase, indexed by the phase name.
+    initial_peak_memory_mb : float
+        The peak resident memory in megabytes before the assembly.
+
+    """
+
+    def __init__(self, phases, thread_busy_times, total_time,
+                 peak_memory_mb=None, initial_peak_memory_mb=0):
+        self.phases = phases
+        self.thread_busy_times = thread_busy_times
+        self.total_time = total_time
+        self.peak_memory_mb = peak_memory_mb if peak_memory_mb is not None else {}
+        self.initial_peak_memory_mb = initial_peak_memory_mb
+
+    def phase_time(self, name):
+        """Return the time in seconds of a phase or 0 if it was not entered."""
+        for phase_name, seconds, _ in self.phases:
+            if phase_name == name:
+                return seconds
+        return 0
+
+    @property
+    def load_imbalance(self):
+        """Return the ratio of the maximum to the mean thread busy time."""
+        if not self.thread_busy_times:
+            return 1
+        mean = sum(self.thread_busy_times) / len(self.thread_busy_times)
+        return max(self.thread_busy_times) / mean if mean > 0 else 1
+
+    def as_dict(self):
+        """Return the profile as dictionary that can be stored as JSON."""
+        return {'phases': [{'name': name, 'seconds': seconds,
+                            'summed_over_threads': summed,
+                            'peak_memory_mb': self.peak_memory_mb.get(name)}
+                           for name, seconds, summed in self.phases],
+                'initial_peak_memory_mb': self.initial_peak_memory_mb,
+                'thread_busy_times': list(self.thread_busy_times),
+                'load_imbalance': self.load_imbalance,
+                'total_time': self.total_time}
+
+    def __str__(self):
+        lines = ["{0:<32} {1:>12} {2:>16}".format('phase', 'seconds', 'peak memory MB')]
+        for name, seconds, summed in self.phases:
+            lines.append("{0:<32} {1:>12.4f} {2:>16.1f}{3}".format(
+                name, seconds, self.peak_memory_mb.get(name, 0),
+                ' (thread time)' if summed else ''))
+        lines.append("{0:<32} {1:>12.4f}".format('total', self.total_time))
+        lines.append("threads: {0}, load imbalance: {1:.2f}".format(
+            len(self.thread_busy_times), self.load_imbalance))
+        return '\n'.join(lines)
+
+
+def profile_assembly(assemble):
+    """Call `assemble()` with profiling enabled.
+
+    Returns
+    -------
+    (result, profile) : tuple
+        The return value of `assemble` and an
+        :class:`AssemblyProfile`.
+
+    """
+    import time
+    from bempp.core.assembly.assembler import set_assembly_profiling_ext
+    from bempp.core.assembly.assembler import reset_assembly_profile_ext
+    from bempp.core.assembly.assembler import assembly_profile_ext
+    from bempp.core.assembly.assembler import peak_resident_memory_ext
+
+    initial_peak_memory = peak_resident_memory_ext()
+    reset_assembly_profile_ext()
+    set_assembly_profiling_ext(True)
+    try:
+        start_time = time.time()
+        result = assemble()
+        total_time = time.time() - start_time
+    finally:
+        set_assembly_profiling_ext(False)
+
+    info = assembly_profile_ext()
+    megabyte = 1024. ** 2
+    peak_memory_mb = dict((phase[0], peak_memory / megabyte)
+                          for phase, peak_memory in zip(info['phases'], info['peak_memory']))
+    return result, AssemblyProfile(info['phases'], info['thread_busy_times'], total_time,
+                                   peak_memory_mb, initial_peak_memory / megabyte)
@@ -0,0 +1,257 @@
+"""Automatic selection of regular quadrature orders for a target accuracy."""
+
+_DISTANCE_CLASSES = ['near', 'medium', 'far']
+
+_STORE_FILE_NAME = 'quadrature_orders.json'
+
+
+def _element_geometry(grid):
+    """Return the element centers, sizes and corners used to classify element pairs.
+
+    As in the quadrature order selection of the assembler the size of an
+    element is the length of its longest edge.
+
+    """
+    import numpy as np
+
+    leaf_view = grid.leaf_view
+    vertices = leaf_view.vertices
+    elements = leaf_view.elements
+    corners = [vertices[:, elements[i, :]] for i in range(3)]
+    centers = (corners[0] + corners[1] + corners[2]) / 3.
+    sizes = np.max([np.linalg.norm(corners[(i + 1) % 3] - corners[i], axis=0)
+                    for i in range(3)], axis=0)
+    return centers, sizes, elements
+
+
+def _sample_element_pairs(operator, parameters, samples, rng):
+    """Return for each distance class a list of (test element, trial element) pairs.
+
+    The pairs are randomly chosen disjoint element pairs whose relative
+    distance falls into the distance class.
+
+    """
+    import numpy as np
+
+    test_space = operator.dual_to_range
+    trial_space = operator.domain
+    same_grid = test_space.grid.unique_id == trial_space.grid.unique_id
+
+    test_centers, test_sizes, test_elements = _element_geometry(test_space.grid)
+    trial_centers, trial_sizes, trial_elements = _element_geometry(trial_space.grid)
+
+    near_max = parameters.quadrature.near.max_rel_dist
+    medium_max = parameters.quadrature.medium.max_rel_dist
+    bounds = {'near': (0, near_max),
+              'medium': (near_max, medium_max),
+              'far': (medium_max, np.inf)}
+
+    pairs = dict((name, []) for name in _DISTANCE_CLASSES)
+    for test_element in rng.permutation(test_centers.shape[1]):
+        if all(len(pairs[name]) >= samples for name in _DISTANCE_CLASSES):
+            break
+        distances = (np.linalg.norm(trial_centers - test_centers[:, [test_element]], axis=0) /
+                     np.maximum(trial_sizes, test_sizes[test_element]))
+        if same_grid:
+            touching = np.in1d(trial_elements.ravel(),
+                               test_elements[:, test_element]).reshape(trial_elements.shape)
+            disjoint = np.logical_not(np.any(touching, axis=0))
+        else:
+            disjoint = np.ones(len(distances), dtype='bool')
+        for name in _DISTANCE_CLASSES:
+            if len(pairs[name]) >= samples:
+                continue
+            lower, upper = bounds[name]
+            candidates = np.flatnonzero(disjoint & (distances > lower) & (distances <= upper))
+            if len(candidates) > 0:
+                pairs[name].append((int(test_element), int(rng.choice(candidates))))
+    return pairs
+
+
+def _sample_entries(operator, element_pairs):
+    """Return the entries of the element matrices of an operator for a list of element pairs.
+
+    Only the element pairs themselves are integrated, so that each sample
+    belongs to exactly one distance class.
+
+    """
+    import numpy as np
+
+    local_assembler = operator.local_assembler
+    return np.concatenate(
+        [local_assembler.evaluate_local_weak_forms([test_element], trial_element)[0].ravel()
+         for test_element, trial_element in element_pairs])
+
+
+def _relative_error(actual, expected):
+    import numpy as np
+
+    norm = np.linalg.norm(expected)
+    error = np.linalg.norm(actual - expected)
+    return error / norm if norm > 0 else error
+
+
+def _set_orders(parameters, orders):
+    for name in _DISTANCE_CLASSES:
+        getattr(parameters.quadrature, name).double_order = orders[name]
+
+
+def _store_path():
+    import os
+    import bempp.api
+    return os.path.join(bempp.api.CONFIG_PATH, _STORE_FILE_NAME)
+
+
+def _load_store():
+    import json
+    import os
+
+    path = _store_path()
+    if not os.path.isfile(path):
+        return {}
+    try:
+        with open(path) as store_file:
+            return json.load(store_file)
+    except ValueError:
+        return {}
+
+
+def _store_keys(kernel, space, target_rel_error):
+    """Return the keys under which tuned orders are persisted."""
+    if space.kind is None:
+        raise ValueError("Tuned quadrature orders can only be persisted for spaces " +
+                         "created with bempp.api.function_space.")
+    return kernel, "{0}{1}".format(space.kind, space.order), repr(float(target_rel_error))
+
+
+def _load_orders(keys, parameters):
+    """Return persisted orders that were tuned with the same distance thresholds or None."""
+    kernel, space_key, target_key = keys
+    entry = _load_store().get(kernel, {}).get(space_key, {}).get(target_key)
+    if (entry is None or
+            entry['near_max_rel_dist'] != parameters.quadrature.near.max_rel_dist or
+            entry['medium_max_rel_dist'] != parameters.quadrature.medium.max_rel_dist):
+        return None
+    return entry
+
+
+def _save_orders(keys, parameters, orders):
+    import json
+
+    kernel, space_key, target_key = keys
+    store = _load_store()
+    entry = dict(orders)
+    entry['near_max_rel_dist'] = parameters.quadrature.near.max_rel_dist
+    entry['medium_max_rel_dist'] = parameters.quadrature.medium.max_rel_dist
+    store.setdefault(kernel, {}).setdefault(space_key, {})[target_key] = entry
+    with open(_store_path(), 'w') as store_file:
+        json.dump(store, store_file, indent=2, sort_keys=True)
+
+
+def tune_quadrature(operator_factory, space, target_rel_error, parameters=None,
+                    samples=20, reference_order=10, kernel=None, persist=False):
+    """Find the cheapest regular quadrature orders that meet a target accuracy.
+
+    For each of the near, medium and far field distance classes (as defined
+    by `parameters.quadrature.near.max_rel_dist` and
+    `parameters.quadrature.medium.max_rel_dist`) weak form entries are
+    sampled as element matrices of randomly chosen pairs of disjoint
+    elements of that class.
+    They are compared against a reference computed with quadrature order
+    `reference_order`, and the lowest order that meets the target relative
+    error is selected. Only the orders of the regular double integrals
+    (`double_order`) are tuned.
+
+    Parameters
+    ----------
+    operator_factory : callable
+        A function `operator_factory(space, parameters)` that returns
+        an elementary boundary operator assembled with the given parameters.
+    space : bempp.api.space.Space
+        The space passed to the operator factory.
+    target_rel_error : float
+        The relative error of the sampled entries that each distance
+        class must meet.
+    parameters : bempp.api.common.ParameterList
+        The parameters to start from. Defaults to
+        `bempp.api.global_parameters`. They are not modified.
+    samples : int
+        Maximum number of sampled element pairs per distance class.
+    reference_order : int
+        Quadrature order of the reference values.
+    kernel : string
+        Name of the kernel, e.g. 'helmholtz_single_layer_k2'. Only
+        required if `persist` is True.
+    persist : bool
+        If True, the tuned orders are stored per (kernel, space kind and
+        order, target_rel_error) in the BEM++ configuration directory
+        (usually ~/.bempp) and reused by later calls.
+
+    Returns
+    -------
+    parameters : bempp.api.common.ParameterList
+        A copy of `parameters` with the tuned quadrature orders.
+
+    Examples
+    --------
+    >>> factory = lambda space, parameters: bempp.api.operators.boundary.laplace.single_layer(
+    ...     space, space, space, parameters=parameters)
+    >>> parameters = bempp.api.tune_quadrature(factory, space, 1E-6)
+    >>> slp = factory(space, parameters)
+
+    """
+    import numpy as np
+    import bempp.api
+
+    if parameters is None:
+        parameters = bempp.api.global_parameters
+
+    result = parameters.copy()
+
+    keys = None
+    if persist:
+        if kernel is None:
+            raise ValueError("A kernel name is required to persist tuned quadrature orders.")
+        keys = _store_keys(kernel, space, target_rel_error)
+        orders = _load_orders(keys, parameters)
+        if orders is not None:
+            bempp.api.LOGGER.info("Using stored quadrature orders for kernel {0}.".format(kernel))
+            _set_orders(result, orders)
+            return result
+
+    reference = parameters.copy()
+    _set_orders(reference, dict((name, reference_order) for name in _DISTANCE_CLASSES))
+    reference_operator = operator_factory(space, reference)
+
+    pairs = _sample_element_pairs(reference_operator, parameters, samples,
+                                  np.random.RandomState(0))
+
+    orders = {}
+    for name in _DISTANCE_CLASSES:
+        if len(pairs[name]) == 0:
+            orders[name] = getattr(parameters.quadrature, name).double_order
+            bempp.api.LOGGER.info(
+                "No element pairs in the {0} field. Keeping order {1}.".format(name, orders[name]))
+            continue
+
+        expected = _sample_entries(reference_operator, pairs[name])
+        orders[name] = reference_order
+        for order in range(1, reference_order):
+            candidate = reference.copy()
+            getattr(candidate.quadrature, name).double_order = order
+            actual = _sample_entries(operator_factory(space, candidate), pairs[name])
+            error = _relative_error(actual, expected)
+            if error <= target_rel_error:
+                orders[name] = order
+                break
+        else:
+            bempp.api.LOGGER.warning(
+                ("Target error {0} not reached in the {1} field below the reference order. " +
+                 "Using order {2}.").format(target_rel_error, name, reference_order))
+
+        bempp.api.LOGGER.info("Tuned {0} field quadrature order: {1}".format(name, orders[name]))
+
+    _set_orders(result, orders)
+    if persist:
+        _save_orders(keys, parameters, orders)
+    return result
@@ -106,3 +106,26 @@ class TestAssembler(TestCase):
         expected = as_matrix(operator.weak_form())[self._rows[0]:self._rows[1], self._cols[0]:self._cols[1]]
 
         self.assertAlmostEqual(np.linalg.norm(actual - expected), 0)
+
+    def test_singular_integral_cache_memory_limit(self):
+        from bempp.api import as_matrix, singular_integral_cache_info
+        import numpy as np
+        import bempp
+
+        space = self._real_operator.domain
+        parameters = bempp.api.common.global_parameters()
+        parameters.assembly.boundary_operator_assembly_type = 'dense'
+        expected = as_matrix(bempp.api.operators.boundary.laplace.single_layer(
+            space, space, space, parameters=parameters).weak_form())
+
+        bempp.api.set_singular_integral_cache_memory_limit(0.01)
+        try:
+            actual = as_matrix(bempp.api.operators.boundary.laplace.single_layer(
+                space, space, space, parameters=parameters).weak_form())
+            info = singular_integral_cache_info()
+        finally:
+            bempp.api.set_singular_integral_cache_memory_limit(0)
+
+        self.assertEqual(info['limit'], int(0.01 * 1024 * 1024))
+        self.assertGreaterEqual(info['peak'], info['current'])
+        self.assertAlmostEqual(np.linalg.norm(actual - expected) / np.linalg.norm(expected), 0)
@@ -0,0 +1,114 @@
+"""Test cases for the assembly type 'auto'."""
+
+from unittest import TestCase
+import bempp.api
+
+
+class TestAutoAssembly(TestCase):
+    """Test class for the automatic selection of the assembly type."""
+
+    def setUp(self):
+        grid = bempp.api.shapes.regular_sphere(4)
+        self._space = bempp.api.function_space(grid, "DP", 0)
+        self._parameters = bempp.api.common.global_parameters()
+        self._parameters.assembly.boundary_operator_assembly_type = 'auto'
+
+    def _single_layer(self):
+        return bempp.api.operators.boundary.laplace.single_layer(
+            self._space, self._space, self._space, parameters=self._parameters)
+
+    def test_small_operator_is_dense(self):
+        self._parameters.assembly.auto_dense_max_dof_count = self._space.global_dof_count
+
+        weak_form = self._single_layer().weak_form()
+
+        self.assertIsInstance(weak_form, bempp.api.assembly.DenseDiscreteBoundaryOperator)
+
+    def test_large_operator_is_hmat(self):
+        self._parameters.assembly.auto_dense_max_dof_count = self._space.global_dof_count - 1
+
+        weak_form = self._single_layer().weak_form()
+
+        self.assertIsInstance(weak_form,
+                              bempp.api.assembly.GeneralNonlocalDiscreteBoundaryOperator)
+
+    def _fail_to_build_tree(self):
+        from bempp.api.assembly import memory_estimate
+
+        def fail(operator, parameters):
+            raise AssertionError("Block cluster tree built.")
+
+        original = memory_estimate._block_cluster_tree
+        memory_estimate._block_cluster_tree = fail
+        self.addCleanup(setattr, memory_estimate, '_block_cluster_tree', original)
+
+    def test_small_operator_builds_no_tree(self):
+        self._parameters.assembly.auto_dense_max_dof_count = self._space.global_dof_count
+        operator = self._single_layer()
+        self._fail_to_build_tree()
+
+        selected = bempp.api.assembly.select_assembly_parameters(operator)
+
+        self.assertEqual(selected.assembly.boundary_operator_assembly_type, 'dense')
+
+    def test_large_operator_without_budget_builds_no_tree(self):
+        self._parameters.assembly.auto_dense_max_dof_count = 0
+        self._parameters.assembly.memory_budget_mb = 0
+        operator = self._single_layer()
+        self._fail_to_build_tree()
+
+        selected = bempp.api.assembly.select_assembly_parameters(operator)
+
+        self.assertEqual(selected.assembly.boundary_operator_assembly_type, 'hmat')
+
+    def test_limit_is_checked_without_budget(self):
+        self._parameters.assembly.auto_dense_max_dof_count = 0
+        self._parameters.assembly.memory_budget_mb = 0
+        operator = self._single_layer()
+
+        estimate = bempp.api.estimate_memory(operator)
+        self.assertEqual(estimate.assembly_type, 'hmat')
+        self.assertIsNotNone(estimate.hmat_mb)
+
+        with self.assertRaises(MemoryError):
+            bempp.api.estimate_memory(operator, limit_mb=0.5 * estimate.hmat_mb)
+
+    def test_kept_tree_gives_same_weak_form(self):
+        import numpy as np
+
+        self._parameters.assembly.auto_dense_max_dof_count = 0
+        self._parameters.assembly.memory_budget_mb = 1E6
+        auto = self._single_layer().weak_form()
+        self._parameters.assembly.boundary_operator_assembly_type = 'hmat'
+        hmat = self._single_layer().weak_form()
+
+        vector = np.random.rand(self._space.global_dof_count)
+        self.assertAlmostEqual(np.linalg.norm(auto * vector - hmat * vector), 0)
+
+    def test_budget_lowers_accuracy(self):
+        self._parameters.assembly.auto_dense_max_dof_count = 0
+        self._parameters.assembly.memory_budget_mb = 1E6
+        self._parameters.hmat.eps = 1E-6
+        operator = self._single_layer()
+
+        nominal = bempp.api.estimate_memory(operator)
+        self._parameters.assembly.memory_budget_mb = 0.9 * nominal.mb
+        selected = bempp.api.assembly.select_assembly_parameters(operator)
+
+        self.assertEqual(selected.assembly.boundary_operator_assembly_type, 'hmat')
+        self.assertGreater(selected.hmat.eps, 1E-6)
+        self.assertEqual(self._parameters.hmat.eps, 1E-6)
+        self.assertLessEqual(bempp.api.estimate_memory(operator).mb,
+                             self._parameters.assembly.memory_budget_mb)
+
+    def test_budget_exceeded_raises(self):
+        self._parameters.assembly.memory_budget_mb = 1E-3
+
+        with self.assertRaises(MemoryError):
+            self._single_layer().weak_form()
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -0,0 +1,42 @@
+"""Test cases for blocked operators."""
+
+from unittest import TestCase
+import bempp.api
+
+
+class TestBlockedOperator(TestCase):
+    """Test class for blocked operators."""
+
+    def setUp(self):
+        grid = bempp.api.shapes.regular_sphere(3)
+        self._space = bempp.api.function_space(grid, "DP", 0)
+
+    def _blocked_operator(self):
+        parameters = bempp.api.common.global_parameters()
+        parameters.assembly.max_thread_count = 2
+
+        laplace = bempp.api.operators.boundary.laplace
+        blocked = bempp.api.BlockedOperator(2, 2)
+        blocked[0, 0] = laplace.single_layer(self._space, self._space, self._space,
+                                             parameters=parameters)
+        blocked[0, 1] = laplace.double_layer(self._space, self._space, self._space,
+                                             parameters=parameters)
+        blocked[1, 1] = bempp.api.operators.boundary.sparse.identity(
+            self._space, self._space, self._space)
+        return blocked
+
+    def test_parallel_weak_form_agrees_with_sequential(self):
+        import numpy as np
+
+        vec = np.random.RandomState(0).randn(2 * self._space.global_dof_count)
+
+        expected = self._blocked_operator().weak_form() * vec
+        actual = self._blocked_operator().weak_form(parallel=True, max_workers=3) * vec
+
+        self.assertLess(np.linalg.norm(actual - expected) / np.linalg.norm(expected), 1E-13)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -291,6 +291,67 @@ class TestZeroDiscreteBoundaryOperator(TestCase):
         self.assertEqual(res.shape, (self._M, ), "Multiply with array with ndim = 1.")
 
 
+class TestCompoundDiscreteBoundaryOperator(TestCase):
+
+    def setUp(self):
+
+        import numpy as np
+        from scipy.sparse import random as sparse_random
+        from scipy.sparse import identity
+        from bempp.api.assembly import SparseDiscreteBoundaryOperator
+        from bempp.api.assembly import DenseDiscreteBoundaryOperator
+        from bempp.api.assembly import InverseSparseDiscreteBoundaryOperator
+
+        np.random.seed(0)
+        self._N = 8
+        self._M = 12
+
+        self._test_ops = [SparseDiscreteBoundaryOperator(sparse_random(self._N, self._M, density=.3, format='csr'))
+                          for _ in range(3)]
+        self._trial_ops = [SparseDiscreteBoundaryOperator(sparse_random(self._M, self._N, density=.3, format='csr'))
+                           for _ in range(3)]
+        self._kernel = DenseDiscreteBoundaryOperator(np.random.rand(self._M, self._M) +
+                                                     1j * np.random.rand(self._M, self._M))
+        self._inverse = InverseSparseDiscreteBoundaryOperator(
+            (2 * identity(self._M)).tocsc())
+
+    def test_compound_operator_equals_sum_of_products(self):
+
+        import numpy as np
+        from bempp.api.assembly import CompoundDiscreteBoundaryOperator
+
+        op = CompoundDiscreteBoundaryOperator(self._test_ops, self._inverse, self._kernel,
+                                              self._inverse, self._trial_ops)
+
+        x = np.random.rand(self._N, 2)
+        expected = sum([self._test_ops[i] * self._inverse * self._kernel *
+                        self._inverse * self._trial_ops[i] * x for i in range(3)])
+        actual = op * x
+
+        self.assertEqual(actual.shape, (self._N, 2))
+        self.assertAlmostEqual(np.linalg.norm(actual - expected), 0)
+
+        actual = op * x[:, 0]
+        self.assertEqual(actual.shape, (self._N, ))
+        self.assertAlmostEqual(np.linalg.norm(actual - expected[:, 0]), 0)
+
+    def test_multipliers_scale_the_terms(self):
+
+        import numpy as np
+        from bempp.api.assembly import CompoundDiscreteBoundaryOperator
+
+        multipliers = [1, 2j, -.5]
+        op = CompoundDiscreteBoundaryOperator(self._test_ops, self._inverse, self._kernel,
+                                              self._inverse, self._trial_ops, multipliers)
+
+        x = np.random.rand(self._N, 2)
+        expected = sum([multipliers[i] * (self._test_ops[i] * self._inverse * self._kernel *
+                                          self._inverse * self._trial_ops[i] * x)
+                        for i in range(3)])
+
+        self.assertAlmostEqual(np.linalg.norm(op * x - expected), 0)
+
+
 
 
 if __name__ == "__main__":
@@ -53,6 +53,23 @@ class TestGridFunction(TestCase):
         self.assertAlmostEquals(np.linalg.norm(actual - 1j * expected), 0)
         self.assertEqual(grid_fun.dtype, 'complex128')
 
+    def test_initialize_from_vectorized_function(self):
+        import numpy as np
+
+        def fun(x, n, d, res):
+            res[0] = x[0] * n[1] + d
+
+        def vectorized_fun(x, n, d, res):
+            self.assertEqual(x.shape[0], 3)
+            self.assertEqual(n.shape, x.shape)
+            self.assertEqual(res.shape, (1, x.shape[1]))
+            res[0, :] = x[0, :] * n[1, :] + d
+
+        expected = bempp.api.GridFunction(self._space, fun=fun).coefficients
+        actual = bempp.api.GridFunction(self._space, fun=vectorized_fun,
+                                        vectorized=True).coefficients
+        self.assertAlmostEquals(np.linalg.norm(actual - expected), 0)
+
     def test_initialize_from_projections(self):
         import numpy as np
 
@@ -148,6 +165,48 @@ class TestGridFunction(TestCase):
 
         self.assertAlmostEqual(np.sqrt(sum), grid_fun.l2_norm())
 
+    def test_evaluate_all_agrees_with_evaluate(self):
+
+        import numpy as np
+
+        grid_fun = bempp.api.GridFunction(
+            self._space, coefficients=np.random.rand(self._space.global_dof_count))
+        local_coordinates = np.array([[0.2, 0.6], [0.3, 0.1]])
+
+        actual = grid_fun.evaluate_all(local_coordinates)
+        index_set = self._space.grid.leaf_view.index_set()
+
+        self.assertEqual(actual.shape, (1, self._space.grid.leaf_view.entity_count(0), 2))
+        for element in self._space.grid.leaf_view.entity_iterator(0):
+            expected = grid_fun.evaluate(element, local_coordinates)
+            index = index_set.entity_index(element)
+            self.assertAlmostEqual(np.linalg.norm(actual[:, index, :] - expected), 0)
+
+    def test_element_l2_norms_agree_with_l2_norm(self):
+
+        import numpy as np
+
+        grid_fun = bempp.api.GridFunction(
+            self._space, coefficients=np.random.rand(self._space.global_dof_count))
+
+        norms = grid_fun.element_l2_norms()
+        index_set = self._space.grid.leaf_view.index_set()
+
+        self.assertAlmostEqual(np.sqrt(np.sum(norms**2)), grid_fun.l2_norm())
+        for element in self._space.grid.leaf_view.entity_iterator(0):
+            self.assertAlmostEqual(norms[index_set.entity_index(element)],
+                                   grid_fun.l2_norm(element))
+
+    def test_element_residual_indicators_of_identical_functions_vanish(self):
+
+        import numpy as np
+
+        grid_fun = bempp.api.GridFunction(
+            self._space, coefficients=np.random.rand(self._space.global_dof_count))
+
+        indicators = grid_fun.element_residual_indicators(reference=grid_fun)
+        self.assertAlmostEqual(np.max(indicators), 0)
+
 
 if __name__ == "__main__":
     from unittest import main
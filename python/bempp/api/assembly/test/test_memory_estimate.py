@@ -0,0 +1,68 @@
+"""Test cases for the estimation of the weak form storage."""
+
+from unittest import TestCase
+import bempp.api
+
+
+class TestMemoryEstimate(TestCase):
+    """Test class for estimate_memory."""
+
+    def setUp(self):
+        grid = bempp.api.shapes.regular_sphere(4)
+        self._space = bempp.api.function_space(grid, "DP", 0)
+
+    def _single_layer(self, assembly_type):
+        parameters = bempp.api.common.global_parameters()
+        parameters.assembly.boundary_operator_assembly_type = assembly_type
+        return bempp.api.operators.boundary.laplace.single_layer(
+            self._space, self._space, self._space, parameters=parameters)
+
+    def test_dense_estimate_is_exact(self):
+        dofs = self._space.global_dof_count
+        estimate = bempp.api.estimate_memory(self._single_layer('dense'))
+
+        self.assertEqual(estimate.shape, (dofs, dofs))
+        self.assertAlmostEqual(estimate.mb, dofs * dofs * 8 / 1024. ** 2)
+
+    def test_complex_operator_uses_complex_entries(self):
+        dofs = self._space.global_dof_count
+        operator = bempp.api.operators.boundary.helmholtz.single_layer(
+            self._space, self._space, self._space, 1.)
+
+        self.assertAlmostEqual(bempp.api.estimate_memory(operator).dense_mb,
+                               dofs * dofs * 16 / 1024. ** 2)
+
+    def test_hmat_estimate_bounds_actual_storage(self):
+        operator = self._single_layer('hmat')
+        estimate = bempp.api.estimate_memory(operator)
+
+        self.assertLess(estimate.hmat_mb, estimate.dense_mb)
+        self.assertGreater(estimate.low_rank_blocks, 0)
+
+        weak_form = operator.weak_form()
+        actual_mb = bempp.api.hmatrix_interface.mem_size(weak_form) / 1024.
+        # Coarsening can only merge blocks
+        self.assertLessEqual(bempp.api.hmatrix_interface.number_of_blocks(weak_form),
+                             estimate.dense_blocks + estimate.low_rank_blocks)
+        self.assertLess(actual_mb, 2 * estimate.hmat_mb)
+
+    def test_rank_is_limited_by_max_rank(self):
+        self.assertEqual(bempp.api.assembly.memory_estimate.estimated_rank(1E-3, 30), 9)
+        self.assertEqual(bempp.api.assembly.memory_estimate.estimated_rank(1E-12, 30), 30)
+
+    def test_limit_raises_memory_error(self):
+        with self.assertRaises(MemoryError):
+            bempp.api.estimate_memory(self._single_layer('dense'), limit_mb=1E-3)
+
+    def test_profile_records_peak_memory(self):
+        _, profile = self._single_layer('hmat').weak_form(profile=True)
+
+        self.assertGreater(profile.peak_memory_mb['hmat_compression'], 0)
+        self.assertGreaterEqual(profile.peak_memory_mb['hmat_compression'],
+                                profile.initial_peak_memory_mb)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -0,0 +1,53 @@
+"""Test cases for the profiling of operator assembly."""
+
+from unittest import TestCase
+import bempp.api
+
+
+class TestAssemblyProfiling(TestCase):
+    """Test class for weak_form(profile=True)."""
+
+    def setUp(self):
+        grid = bempp.api.shapes.regular_sphere(3)
+        self._space = bempp.api.function_space(grid, "DP", 0)
+
+    def _single_layer(self, assembly_type):
+        parameters = bempp.api.common.global_parameters()
+        parameters.assembly.boundary_operator_assembly_type = assembly_type
+        return bempp.api.operators.boundary.laplace.single_layer(
+            self._space, self._space, self._space, parameters=parameters)
+
+    def test_hmat_phases(self):
+        weak_form, profile = self._single_layer('hmat').weak_form(profile=True)
+
+        self.assertEqual(weak_form.shape, (self._space.global_dof_count,
+                                           self._space.global_dof_count))
+        names = [name for name, _, _ in profile.phases]
+        for name in ['geometry_and_dof_lists', 'cluster_tree', 'block_cluster_tree',
+                     'singular_integral_caching', 'hmat_compression', 'dense_leaves']:
+            self.assertIn(name, names)
+        self.assertTrue(any(name.startswith('aca_level_') for name in names))
+        self.assertGreater(len(profile.thread_busy_times), 0)
+        self.assertGreaterEqual(profile.load_imbalance, 1)
+        self.assertLessEqual(profile.phase_time('hmat_compression'), profile.total_time)
+
+    def test_dense_phases(self):
+        _, profile = self._single_layer('dense').weak_form(profile=True)
+
+        names = [name for name, _, _ in profile.phases]
+        self.assertIn('dense_assembly', names)
+        self.assertNotIn('cluster_tree', names)
+
+    def test_profiling_is_disabled_afterwards(self):
+        from bempp.core.assembly.assembler import assembly_profile_ext
+
+        self._single_layer('hmat').weak_form(profile=True)
+        self._single_layer('dense').weak_form()
+
+        names = [name for name, _, _ in assembly_profile_ext()['phases']]
+        self.assertNotIn('dense_assembly', names)
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -0,0 +1,94 @@
+"""Test cases for the automatic tuning of quadrature orders."""
+
+from unittest import TestCase
+import bempp.api
+
+
+def _single_layer(space, parameters):
+    return bempp.api.operators.boundary.laplace.single_layer(
+        space, space, space, parameters=parameters)
+
+
+class TestQuadratureTuning(TestCase):
+    """Test class for tune_quadrature."""
+
+    def setUp(self):
+        grid = bempp.api.shapes.regular_sphere(3)
+        self._space = bempp.api.function_space(grid, "DP", 0)
+
+    def test_tuned_orders_meet_target(self):
+        import numpy as np
+
+        parameters = bempp.api.tune_quadrature(_single_layer, self._space, 1E-4, samples=5)
+        # Dense assembly, so that only the quadrature error is measured
+        parameters.assembly.boundary_operator_assembly_type = 'dense'
+
+        reference_parameters = parameters.copy()
+        for field in [reference_parameters.quadrature.near,
+                      reference_parameters.quadrature.medium,
+                      reference_parameters.quadrature.far]:
+            field.double_order = 10
+
+        actual = bempp.api.as_matrix(_single_layer(self._space, parameters).weak_form())
+        expected = bempp.api.as_matrix(
+            _single_layer(self._space, reference_parameters).weak_form())
+
+        self.assertLess(np.linalg.norm(actual - expected) / np.linalg.norm(expected), 1E-3)
+
+    def test_samples_are_element_pairs_of_their_distance_class(self):
+        import numpy as np
+        from bempp.api.assembly.quadrature_tuning import _sample_element_pairs
+        from bempp.api.assembly.quadrature_tuning import _sample_entries
+
+        parameters = bempp.api.common.global_parameters()
+        parameters.assembly.boundary_operator_assembly_type = 'dense'
+        operator = _single_layer(self._space, parameters)
+        pairs = _sample_element_pairs(operator, parameters, 3, np.random.RandomState(0))
+        matrix = bempp.api.as_matrix(operator.weak_form())
+
+        # For DP0 the element matrix of a pair is the weak form entry.
+        for name in ['near', 'medium', 'far']:
+            self.assertGreater(len(pairs[name]), 0)
+            entries = _sample_entries(operator, pairs[name])
+            expected = [matrix[test_element, trial_element]
+                        for test_element, trial_element in pairs[name]]
+            self.assertTrue(np.allclose(entries, expected))
+
+    def test_global_parameters_are_not_modified(self):
+        near_order = bempp.api.global_parameters.quadrature.near.double_order
+
+        parameters = bempp.api.tune_quadrature(_single_layer, self._space, 1E-1, samples=2)
+        parameters.quadrature.near.double_order = near_order + 1
+
+        self.assertEqual(bempp.api.global_parameters.quadrature.near.double_order, near_order)
+
+    def test_persisted_orders_are_reused(self):
+        import os
+        import shutil
+        import tempfile
+
+        config_path = bempp.api.CONFIG_PATH
+        bempp.api.CONFIG_PATH = tempfile.mkdtemp()
+        try:
+            tuned = bempp.api.tune_quadrature(_single_layer, self._space, 1E-3, samples=2,
+                                              kernel='laplace_slp', persist=True)
+            self.assertTrue(os.path.isfile(os.path.join(bempp.api.CONFIG_PATH,
+                                                        'quadrature_orders.json')))
+
+            def failing_factory(space, parameters):
+                raise AssertionError("Stored orders were not used.")
+
+            stored = bempp.api.tune_quadrature(failing_factory, self._space, 1E-3,
+                                               kernel='laplace_slp', persist=True)
+            for name in ['near', 'medium', 'far']:
+                self.assertEqual(getattr(stored.quadrature, name).double_order,
+                                 getattr(tuned.quadrature, name).double_order)
+        finally:
+            shutil.rmtree(bempp.api.CONFIG_PATH)
+            bempp.api.CONFIG_PATH = config_path
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -0,0 +1,127 @@
+from unittest import TestCase
+import unittest
+import bempp.api
+
+
+class TestWeakFormOptimizer(TestCase):
+    """Test cases for the weak form optimizer."""
+
+    def setUp(self):
+        import numpy as np
+        from scipy.sparse import random as sparse_random
+        from bempp.api.assembly import SparseDiscreteBoundaryOperator
+        from bempp.api.assembly import DenseDiscreteBoundaryOperator
+
+        n = 20
+        np.random.seed(0)
+        self._sparse1 = SparseDiscreteBoundaryOperator(sparse_random(n, n, density=.2, format='csr'))
+        self._sparse2 = SparseDiscreteBoundaryOperator(sparse_random(n, n, density=.2, format='csr'))
+        self._dense1 = DenseDiscreteBoundaryOperator(np.random.rand(n, n))
+        self._dense2 = DenseDiscreteBoundaryOperator(np.random.rand(n, n))
+        self._vec = np.random.rand(n) + 1j * np.random.rand(n)
+
+    def test_sum_of_sparse_operators_is_sparse(self):
+        from bempp.api.assembly import optimize_weak_form
+        from bempp.api.assembly import SparseDiscreteBoundaryOperator
+
+        operator = 2.0 * self._sparse1 + self._sparse2 * 3.0
+        self.assertIsInstance(optimize_weak_form(operator), SparseDiscreteBoundaryOperator)
+
+    def test_product_of_sparse_operators_is_sparse(self):
+        from bempp.api.assembly import optimize_weak_form
+        from bempp.api.assembly import SparseDiscreteBoundaryOperator
+
+        operator = self._sparse1 * (2.0 * self._sparse2)
+        self.assertIsInstance(optimize_weak_form(operator), SparseDiscreteBoundaryOperator)
+
+    def test_dense_operators_are_not_copied(self):
+        from scipy.sparse.linalg.interface import _SumLinearOperator
+        from scipy.sparse.linalg.interface import _ScaledLinearOperator
+        from bempp.api.assembly import optimize_weak_form
+
+        operator = _SumLinearOperator(self._dense1, _ScaledLinearOperator(self._dense2, -1))
+        optimized = optimize_weak_form(operator)
+
+        self.assertEqual([(alpha, factors[0]) for alpha, factors in optimized.terms],
+                         [(1, self._dense1), (-1, self._dense2)])
+
+    def test_zero_terms_are_removed(self):
+        from bempp.api.assembly import optimize_weak_form
+        from bempp.api.assembly import ZeroDiscreteBoundaryOperator
+        from bempp.api.assembly import SparseDiscreteBoundaryOperator
+
+        zero = ZeroDiscreteBoundaryOperator(*self._sparse1.shape)
+        operator = zero + self._sparse1
+        self.assertIsInstance(optimize_weak_form(operator), SparseDiscreteBoundaryOperator)
+
+    def test_matvec_of_optimized_operator_is_correct(self):
+        import numpy as np
+        from bempp.api.assembly import optimize_weak_form
+
+        operator = (2.0 * self._sparse1 * self._dense1 * self._sparse2 +
+                    1j * self._dense2 * (self._sparse1 + self._dense1) - self._sparse2)
+        optimized = optimize_weak_form(operator)
+
+        expected = operator * self._vec
+        actual = optimized * self._vec
+
+        self.assertAlmostEqual(np.linalg.norm(actual - expected) / np.linalg.norm(expected), 0)
+
+    def test_repeated_matvecs_of_optimized_operator_are_independent(self):
+        import numpy as np
+        from bempp.api.assembly import optimize_weak_form
+
+        operator = 2.0 * self._dense1 * self._sparse1 + 1j * self._dense2 * self._dense1
+        optimized = optimize_weak_form(operator)
+
+        first = optimized * self._vec
+        expected = first.copy()
+        second = optimized * self._vec.real
+        third = optimized * self._vec
+
+        self.assertAlmostEqual(np.linalg.norm(first - expected), 0)
+        self.assertAlmostEqual(np.linalg.norm(second - operator * self._vec.real), 0)
+        self.assertAlmostEqual(np.linalg.norm(third - expected), 0)
+
+    def test_adjoint_of_optimized_operator_is_correct(self):
+        import numpy as np
+        from bempp.api.assembly import optimize_weak_form
+
+        operator = 1j * self._dense2 * self._sparse1 * self._dense1 + self._sparse2
+        optimized = optimize_weak_form(operator)
+
+        expected = operator.H * self._vec
+        actual = optimized.H * self._vec
+
+        self.assertAlmostEqual(np.linalg.norm(actual - expected) / np.linalg.norm(expected), 0)
+
+    def test_weak_form_of_compound_operator_is_optimized(self):
+        import numpy as np
+        from bempp.api.assembly import OptimizedDiscreteOperator
+
+        grid = bempp.api.shapes.regular_sphere(2)
+        space = bempp.api.function_space(grid, "P", 1)
+        vec = np.ones(space.global_dof_count)
+
+        assembly_mode = bempp.api.global_parameters.assembly.boundary_operator_assembly_type
+        bempp.api.global_parameters.assembly.boundary_operator_assembly_type = 'dense'
+
+        expected = bempp.api.operators.boundary.helmholtz.hypersingular(
+            space, space, space, 1, use_slp=True).weak_form() * vec
+
+        bempp.api.global_parameters.assembly.enable_weak_form_optimization = True
+        weak_form = bempp.api.operators.boundary.helmholtz.hypersingular(
+            space, space, space, 1, use_slp=True).weak_form()
+        bempp.api.global_parameters.assembly.enable_weak_form_optimization = False
+        bempp.api.global_parameters.assembly.boundary_operator_assembly_type = assembly_mode
+
+        self.assertIsInstance(weak_form, OptimizedDiscreteOperator)
+
+        actual = weak_form * vec
+        self.assertAlmostEqual(np.linalg.norm(actual - expected) / np.linalg.norm(expected), 0)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
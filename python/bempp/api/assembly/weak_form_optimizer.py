@@ -0,0 +1,253 @@
+"""Flatten the weak forms of composite boundary operators.
+
+Sums, products and scalings of discrete operators are represented by
+nested SciPy LinearOperator objects. Each application of such an operator
+walks the whole tree and allocates a temporary for every node. The functions
+in this module rewrite such a tree into a flat list of terms
+
+    alpha_1 * A_11 * A_12 * ... + alpha_2 * A_21 * ... + ...
+
+in which scalar factors are folded together, adjacent sparse factors are
+premultiplied into a single CSR matrix and terms consisting of a single
+sparse operator are merged into one sparse operator. Dense operators are
+not merged, since the weak forms they belong to stay cached by their
+boundary operators and a merged copy would double the memory.
+
+"""
+
+import numpy as _np
+from scipy.sparse.linalg.interface import LinearOperator as _LinearOperator
+
+
+def _is_sparse(operator):
+    """Return true if operator is a sparse discrete operator."""
+    from .discrete_boundary_operator import SparseDiscreteBoundaryOperator
+    return isinstance(operator, SparseDiscreteBoundaryOperator)
+
+
+def _expand(operator):
+    """Return a list of (alpha, factors) terms that represent operator."""
+
+    from scipy.sparse.linalg.interface import _SumLinearOperator
+    from scipy.sparse.linalg.interface import _ProductLinearOperator
+    from scipy.sparse.linalg.interface import _ScaledLinearOperator
+    from .discrete_boundary_operator import ZeroDiscreteBoundaryOperator
+
+    if isinstance(operator, OptimizedDiscreteOperator):
+        return [(alpha, list(factors)) for alpha, factors in operator.terms]
+
+    if isinstance(operator, ZeroDiscreteBoundaryOperator):
+        return []
+
+    if isinstance(operator, _ScaledLinearOperator):
+        op, alpha = operator.args
+        return [(alpha * beta, factors) for beta, factors in _expand(op)]
+
+    if isinstance(operator, _SumLinearOperator):
+        return _expand(operator.args[0]) + _expand(operator.args[1])
+
+    if isinstance(operator, _ProductLinearOperator):
+        # Products of sums are not distributed since this would apply
+        # expensive factors several times. A sum inside a product is
+        # instead compiled into a single factor.
+        left = _simplify(_expand(operator.args[0]))
+        right = _simplify(_expand(operator.args[1]))
+        if len(left) == 0 or len(right) == 0:
+            return []
+        left_alpha, left_factors = _as_single_term(left, operator.args[0].shape)
+        right_alpha, right_factors = _as_single_term(right, operator.args[1].shape)
+        return [(left_alpha * right_alpha, left_factors + right_factors)]
+
+    return [(1.0, [operator])]
+
+
+def _as_single_term(terms, shape):
+    """Return a single (alpha, factors) pair for a simplified list of terms."""
+
+    if len(terms) == 1:
+        return terms[0]
+    return (1.0, [OptimizedDiscreteOperator(terms, shape)])
+
+
+def _premultiply_sparse_factors(alpha, factors):
+    """Merge adjacent sparse factors and fold alpha into a sparse factor."""
+
+    from .discrete_boundary_operator import SparseDiscreteBoundaryOperator
+
+    merged = []
+    for factor in factors:
+        if merged and _is_sparse(merged[-1]) and _is_sparse(factor):
+            merged[-1] = SparseDiscreteBoundaryOperator(
+                (merged[-1].sparse_operator * factor.sparse_operator).tocsr())
+        else:
+            merged.append(factor)
+
+    if alpha != 1:
+        for index, factor in enumerate(merged):
+            if _is_sparse(factor):
+                merged[index] = SparseDiscreteBoundaryOperator(
+                    (alpha * factor.sparse_operator).tocsr())
+                alpha = 1.0
+                break
+
+    return alpha, merged
+
+
+def _simplify(terms):
+    """Simplify a list of (alpha, factors) terms."""
+
+    from .discrete_boundary_operator import SparseDiscreteBoundaryOperator
+
+    sparse_sum = None
+    remaining = []
+
+    for alpha, factors in terms:
+        if alpha == 0:
+            continue
+        alpha, factors = _premultiply_sparse_factors(alpha, factors)
+        if len(factors) == 1 and _is_sparse(factors[0]):
+            mat = factors[0].sparse_operator
+            if alpha != 1:
+                mat = alpha * mat
+            sparse_sum = mat if sparse_sum is None else sparse_sum + mat
+        else:
+            remaining.append((alpha, factors))
+
+    if sparse_sum is not None:
+        remaining.insert(0, (1.0, [SparseDiscreteBoundaryOperator(sparse_sum.tocsr())]))
+
+    return remaining
+
+
+class OptimizedDiscreteOperator(_LinearOperator):
+    """A flattened evaluation plan for a composite discrete operator.
+
+    This class derives from :class:`scipy.sparse.linalg.interface.LinearOperator`
+    and thereby implements the SciPy LinearOperator protocol. Instances are
+    usually created through :func:`optimize_weak_form`.
+
+    The value of each term is accumulated in place into the product of
+    the first term, so that an application allocates no arrays besides
+    the products of the factors.
+
+    Parameters
+    ----------
+    terms : list
+        A list of tuples (alpha, factors), where alpha is a scalar and
+        factors is a list of discrete operators whose product is
+        scaled by alpha.
+    shape : tuple
+        The shape of the operator.
+
+    """
+
+    def __init__(self, terms, shape):
+
+        dtype = _np.dtype('float64')
+        for alpha, factors in terms:
+            dtype = _np.result_type(dtype, _np.array(1.0 * alpha).dtype)
+            for factor in factors:
+                dtype = _np.result_type(dtype, factor.dtype)
+
+        super(OptimizedDiscreteOperator, self).__init__(dtype=dtype, shape=shape)
+
+        self._terms = terms
+
+    @property
+    def terms(self):
+        """Return the list of (alpha, factors) terms of the evaluation plan."""
+        return self._terms
+
+    def _matmat(self, mat): # pylint: disable=method-hidden
+        """Evaluate the plan for a dense matrix or column vector."""
+
+        shape = (self.shape[0], mat.shape[1])
+        dtype = _np.result_type(self.dtype, mat.dtype)
+
+        result = None
+        for alpha, factors in self._terms:
+            local = mat
+            for factor in reversed(factors):
+                local = factor.dot(local)
+            local = _np.asarray(local).reshape(shape)
+            if result is None:
+                # The product of the first term becomes the result unless it
+                # is not a new array of the result type
+                if local.dtype != dtype or _np.may_share_memory(local, mat):
+                    result = local.astype(dtype)
+                else:
+                    result = local
+                if alpha != 1:
+                    result *= alpha
+            elif alpha != 1:
+                result += alpha * local
+            else:
+                result += local
+
+        if result is None:
+            return _np.zeros(shape, dtype=dtype)
+        return result
+
+    def _matvec(self, vec): # pylint: disable=method-hidden
+        """Implements matrix-vector product."""
+
+        return self._matmat(vec.reshape(-1, 1))
+
+    def _transpose(self):
+        """Return the transpose of the evaluation plan."""
+
+        return OptimizedDiscreteOperator(
+            [(alpha, [factor.transpose() for factor in reversed(factors)])
+             for alpha, factors in self._terms],
+            (self.shape[1], self.shape[0]))
+
+    def _adjoint(self):
+        """Return the adjoint of the evaluation plan."""
+
+        return OptimizedDiscreteOperator(
+            [(_np.conjugate(alpha), [factor.adjoint() for factor in reversed(factors)])
+             for alpha, factors in self._terms],
+            (self.shape[1], self.shape[0]))
+
+
+def optimize_weak_form(discrete_operator):
+    """Return a flattened representation of a composite discrete operator.
+
+    Parameters
+    ----------
+    discrete_operator : scipy.sparse.linalg.interface.LinearOperator
+        The discrete operator to be optimized. Usually this is the
+        weak form of a sum, product, scaled or compound boundary
+        operator.
+
+    Returns
+    -------
+    A discrete operator that represents the same linear map. If the
+    expression simplifies to a single sparse or dense operator this
+    operator is returned directly. Otherwise, an
+    :class:`OptimizedDiscreteOperator` is returned.
+
+    Notes
+    -----
+    The optimizer performs the following simplifications:
+
+    * Scalar factors are multiplied together and, if possible, folded
+      into a sparse factor of the corresponding term.
+    * Adjacent sparse factors in a product are premultiplied into
+      a single CSR matrix.
+    * Terms consisting of a single sparse operator are merged into a
+      single sparse operator. Dense operators are used as they are.
+
+    """
+
+    from .discrete_boundary_operator import ZeroDiscreteBoundaryOperator
+
+    terms = _simplify(_expand(discrete_operator))
+
+    if len(terms) == 0:
+        return ZeroDiscreteBoundaryOperator(*discrete_operator.shape)
+
+    if len(terms) == 1 and terms[0][0] == 1 and len(terms[0][1]) == 1:
+        return terms[0][1][0]
+
+    return OptimizedDiscreteOperator(terms, discrete_operator.shape)
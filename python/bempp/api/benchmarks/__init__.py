@@ -0,0 +1,9 @@
+"""Benchmark suite for assembly, products, potentials, projections, I/O and solvers.
+
+Run ``python -m bempp.api.benchmarks --help`` for the command line interface.
+
+"""
+
+from .cases import Benchmark, benchmarks, PRESETS
+from .runner import run_case, run_benchmarks, compare_results, format_comparison
+from .runner import save_results, load_results
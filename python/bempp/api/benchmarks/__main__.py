@@ -0,0 +1,105 @@
+"""Command line interface of the benchmark suite.
+
+Examples
+--------
+Run the quick preset and store the results::
+
+    python -m bempp.api.benchmarks --preset quick --output baseline.json
+
+Run the H-matrix assembly cases and compare against the stored results::
+
+    python -m bempp.api.benchmarks --preset quick --filter assembly.hmat \\
+        --output current.json --baseline baseline.json
+
+The exit status is 1 if a case regressed against the baseline.
+
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import sys
+
+
+def _parser():
+    from .cases import PRESETS
+
+    parser = argparse.ArgumentParser(
+        prog='python -m bempp.api.benchmarks',
+        description="Run the BEM++ benchmark suite.")
+    parser.add_argument('--mesh-dir', help="Directory with the bundled meshes " +
+                        "(default: $BEMPP_MESH_DIR or the installed share/bempp/meshes).")
+    parser.add_argument('--preset', choices=sorted(PRESETS), default='default',
+                        help="The set of meshes to run the cases on.")
+    parser.add_argument('--mesh', action='append',
+                        help="Run on this mesh (e.g. sphere-h-0.1) instead of a preset. " +
+                        "Can be given several times.")
+    parser.add_argument('--filter', help="Only run cases whose name matches this regular expression.")
+    parser.add_argument('--repeat', type=int, default=1, help="Repetitions of each case.")
+    parser.add_argument('--no-isolate', action='store_true',
+                        help="Run all cases in this process. Peak memory is then cumulative.")
+    parser.add_argument('--output', help="Write the results as JSON into this file.")
+    parser.add_argument('--baseline', help="Compare against the results in this JSON file.")
+    parser.add_argument('--time-tolerance', type=float, default=1.2,
+                        help="Allowed ratio of time to baseline time (default 1.2).")
+    parser.add_argument('--memory-tolerance', type=float, default=1.2,
+                        help="Allowed ratio of peak memory to baseline peak memory (default 1.2).")
+    parser.add_argument('--list', action='store_true', help="List the cases and exit.")
+    parser.add_argument('--run-case', help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv=None):
+    """Run the benchmark command line interface and return the exit status."""
+    from .cases import PRESETS, benchmarks
+    from .runner import (default_mesh_dir, run_case, run_benchmarks, save_results,
+                         load_results, compare_results, format_comparison)
+
+    args = _parser().parse_args(argv)
+
+    meshes = args.mesh if args.mesh else PRESETS[args.preset]
+
+    if args.run_case is not None:
+        # Internal mode used to run a single case in a separate process
+        cases = [benchmark for benchmark in benchmarks(meshes)
+                 if benchmark.name == args.run_case]
+        if not cases:
+            print("Unknown benchmark case {0}.".format(args.run_case), file=sys.stderr)
+            return 2
+        print(json.dumps(run_case(cases[0], args.mesh_dir, args.repeat)))
+        return 0
+
+    if args.list:
+        import re
+        for benchmark in benchmarks(meshes):
+            if args.filter is None or re.search(args.filter, benchmark.name):
+                print(benchmark.name)
+        return 0
+
+    mesh_dir = args.mesh_dir if args.mesh_dir is not None else default_mesh_dir()
+    if mesh_dir is None:
+        print("Could not find the BEM++ meshes. Use --mesh-dir or set BEMPP_MESH_DIR.",
+              file=sys.stderr)
+        return 2
+
+    results = run_benchmarks(meshes, mesh_dir, pattern=args.filter, repeat=args.repeat,
+                             isolate=not args.no_isolate)
+
+    if args.output is not None:
+        save_results(results, args.output)
+    else:
+        print(json.dumps(results, indent=2, sort_keys=True))
+
+    if args.baseline is not None:
+        comparison = compare_results(results, load_results(args.baseline),
+                                     args.time_tolerance, args.memory_tolerance)
+        print(format_comparison(comparison))
+        if any(entry[-1] for entry in comparison):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
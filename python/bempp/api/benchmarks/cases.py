@@ -0,0 +1,317 @@
+"""Definition of the benchmark cases."""
+
+import os
+
+SPHERE_MESHES = ['sphere-h-0.4', 'sphere-h-0.2', 'sphere-h-0.1', 'sphere-h-0.05', 'sphere-h-0.025']
+
+CUBE_MESHES = ['cube-h-0.1', 'cube-h-0.05', 'cube-h-0.025', 'cube-h-0.0125']
+
+# Meshes used by each preset. Dense assembly is only benchmarked on the
+# meshes in DENSE_MESHES since the storage grows quadratically.
+PRESETS = {
+    'quick': ['sphere-h-0.4', 'sphere-h-0.2', 'cube-h-0.1'],
+    'default': ['sphere-h-0.4', 'sphere-h-0.2', 'sphere-h-0.1', 'cube-h-0.1', 'cube-h-0.05'],
+    'full': SPHERE_MESHES + CUBE_MESHES,
+}
+
+DENSE_MESHES = ['sphere-h-0.4', 'sphere-h-0.2', 'sphere-h-0.1', 'cube-h-0.1', 'cube-h-0.05']
+
+WAVE_NUMBER = 5.
+
+MAXWELL_WAVE_NUMBER = 2.
+
+
+def _scalar_operator(module_name, operator_name, wave_number=None):
+    """Return a factory for a scalar boundary operator on DP0/P1 spaces."""
+    def factory(grid, parameters):
+        import importlib
+        import bempp.api
+
+        module = importlib.import_module('bempp.api.operators.boundary.' + module_name)
+        if operator_name == 'hypersingular':
+            space = bempp.api.function_space(grid, "P", 1)
+        else:
+            space = bempp.api.function_space(grid, "DP", 0)
+        args = [space, space, space]
+        if wave_number is not None:
+            args.append(wave_number)
+        return getattr(module, operator_name)(*args, parameters=parameters)
+    return factory
+
+
+def _maxwell_operator(operator_name):
+    """Return a factory for a Maxwell boundary operator on RT spaces."""
+    def factory(grid, parameters):
+        import bempp.api
+        from bempp.api.operators.boundary import maxwell
+
+        space = bempp.api.function_space(grid, "RT", 0)
+        return getattr(maxwell, operator_name)(space, MAXWELL_WAVE_NUMBER, parameters=parameters)
+    return factory
+
+
+KERNELS = {
+    'laplace_single_layer': _scalar_operator('laplace', 'single_layer'),
+    'laplace_double_layer': _scalar_operator('laplace', 'double_layer'),
+    'laplace_adjoint_double_layer': _scalar_operator('laplace', 'adjoint_double_layer'),
+    'laplace_hypersingular': _scalar_operator('laplace', 'hypersingular'),
+    'helmholtz_single_layer': _scalar_operator('helmholtz', 'single_layer', WAVE_NUMBER),
+    'helmholtz_double_layer': _scalar_operator('helmholtz', 'double_layer', WAVE_NUMBER),
+    'helmholtz_adjoint_double_layer': _scalar_operator('helmholtz', 'adjoint_double_layer',
+                                                       WAVE_NUMBER),
+    'helmholtz_hypersingular': _scalar_operator('helmholtz', 'hypersingular', WAVE_NUMBER),
+    'modified_helmholtz_single_layer': _scalar_operator('modified_helmholtz', 'single_layer',
+                                                        WAVE_NUMBER),
+    'modified_helmholtz_double_layer': _scalar_operator('modified_helmholtz', 'double_layer',
+                                                        WAVE_NUMBER),
+    'modified_helmholtz_hypersingular': _scalar_operator('modified_helmholtz', 'hypersingular',
+                                                         WAVE_NUMBER),
+    'maxwell_electric_field': _maxwell_operator('electric_field'),
+    'maxwell_magnetic_field': _maxwell_operator('magnetic_field'),
+}
+
+
+class Benchmark(object):
+    """A single benchmark case.
+
+    Parameters
+    ----------
+    name : string
+        Unique name of the case.
+    setup : callable
+        A function `setup(mesh_dir)` that returns the state passed
+        to `run`. Its cost is not included in the timings.
+    run : callable
+        A function `run(state)` that executes the timed operation.
+    params : dict
+        The parameters of the case that are stored with the results.
+
+    """
+
+    def __init__(self, name, setup, run, params):
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.params = params
+
+
+def _load_grid(mesh_dir, mesh):
+    import bempp.api
+    return bempp.api.import_grid(os.path.join(mesh_dir, mesh + '.msh'))
+
+
+# Kernels whose regular integrals have a batched (BLAS) and a scalar quadrature path
+BLAS_QUADRATURE_KERNELS = ['laplace_hypersingular', 'modified_helmholtz_hypersingular',
+                           'maxwell_electric_field', 'maxwell_magnetic_field']
+
+
+def _assembly_parameters(assembly_type, blas_in_quadrature='auto'):
+    import bempp.api
+
+    parameters = bempp.api.global_parameters.copy()
+    parameters.assembly.boundary_operator_assembly_type = assembly_type
+    parameters.assembly.blas_in_quadrature = blas_in_quadrature
+    return parameters
+
+
+def _assembly_benchmark(assembly_type, kernel, mesh):
+
+    def setup(mesh_dir):
+        grid = _load_grid(mesh_dir, mesh)
+        return KERNELS[kernel](grid, _assembly_parameters(assembly_type))
+
+    def run(operator):
+        operator.weak_form()
+
+    return Benchmark('assembly.{0}.{1}.{2}'.format(assembly_type, kernel, mesh), setup, run,
+                     {'assembly_type': assembly_type, 'kernel': kernel, 'mesh': mesh})
+
+
+def _blas_quadrature_benchmark(blas_in_quadrature, kernel, mesh):
+    """Dense assembly with the batched ('yes') or scalar ('no') quadrature path."""
+
+    def setup(mesh_dir):
+        grid = _load_grid(mesh_dir, mesh)
+        return KERNELS[kernel](grid, _assembly_parameters('dense', blas_in_quadrature))
+
+    def run(operator):
+        operator.weak_form()
+
+    return Benchmark('blas_quadrature.{0}.{1}.{2}'.format(blas_in_quadrature, kernel, mesh),
+                     setup, run,
+                     {'blas_in_quadrature': blas_in_quadrature, 'kernel': kernel, 'mesh': mesh})
+
+
+def _product_benchmark(kernel, mesh, columns):
+
+    def setup(mesh_dir):
+        import numpy as np
+
+        grid = _load_grid(mesh_dir, mesh)
+        weak_form = KERNELS[kernel](grid, _assembly_parameters('hmat')).weak_form()
+        shape = (weak_form.shape[1], columns) if columns > 1 else (weak_form.shape[1],)
+        return weak_form, np.random.RandomState(0).randn(*shape)
+
+    def run(state):
+        weak_form, x = state
+        weak_form * x
+
+    kind = 'matvec' if columns == 1 else 'matmat'
+    return Benchmark('hmat_{0}.{1}.{2}'.format(kind, kernel, mesh), setup, run,
+                     {'kernel': kernel, 'mesh': mesh, 'columns': columns})
+
+
+def _potential_benchmark(mesh, points_count=10000):
+
+    def setup(mesh_dir):
+        import numpy as np
+        import bempp.api
+
+        grid = _load_grid(mesh_dir, mesh)
+        space = bempp.api.function_space(grid, "DP", 0)
+        fun = bempp.api.GridFunction(space, coefficients=np.ones(space.global_dof_count))
+        points = np.random.RandomState(0).randn(3, points_count)
+        points = 3 * points / np.linalg.norm(points, axis=0)
+        return space, fun, points
+
+    def run(state):
+        from bempp.api.operators.potential import laplace
+
+        space, fun, points = state
+        laplace.single_layer(space, points) * fun
+
+    return Benchmark('potential.laplace_single_layer.{0}'.format(mesh), setup, run,
+                     {'mesh': mesh, 'points': points_count})
+
+
+def _projection_benchmark(mesh):
+
+    def setup(mesh_dir):
+        import bempp.api
+
+        return bempp.api.function_space(_load_grid(mesh_dir, mesh), "P", 1)
+
+    def run(space):
+        import numpy as np
+        import bempp.api
+
+        def fun(x, n, domain_index, result):
+            result[0] = np.sin(x[0]) * n[1]
+
+        bempp.api.GridFunction(space, fun=fun).coefficients
+
+    return Benchmark('projection.{0}'.format(mesh), setup, run, {'mesh': mesh})
+
+
+def _import_benchmark(mesh):
+
+    def setup(mesh_dir):
+        return os.path.join(mesh_dir, mesh + '.msh')
+
+    def run(file_name):
+        import bempp.api
+        bempp.api.import_grid(file_name)
+
+    return Benchmark('gmsh_import.{0}'.format(mesh), setup, run, {'mesh': mesh})
+
+
+def _export_benchmark(mesh):
+
+    def setup(mesh_dir):
+        import numpy as np
+        import bempp.api
+
+        space = bempp.api.function_space(_load_grid(mesh_dir, mesh), "P", 1)
+        return bempp.api.GridFunction(space, coefficients=np.ones(space.global_dof_count))
+
+    def run(fun):
+        import shutil
+        import tempfile
+        import bempp.api
+
+        directory = tempfile.mkdtemp()
+        try:
+            bempp.api.export(grid_function=fun, file_name=os.path.join(directory, 'out.msh'))
+        finally:
+            shutil.rmtree(directory)
+
+    return Benchmark('gmsh_export.{0}'.format(mesh), setup, run, {'mesh': mesh})
+
+
+def _laplace_solve_benchmark(mesh):
+    """The tutorial laplace_interior_dirichlet."""
+
+    def setup(mesh_dir):
+        return _load_grid(mesh_dir, mesh)
+
+    def run(grid):
+        import numpy as np
+        import bempp.api
+
+        def dirichlet_data(x, n, domain_index, result):
+            result[0] = 1. / (4 * np.pi * ((x[0] - .9)**2 + x[1]**2 + x[2]**2)**(0.5))
+
+        const_space = bempp.api.function_space(grid, "DP", 0)
+        lin_space = bempp.api.function_space(grid, "P", 1)
+        identity = bempp.api.operators.boundary.sparse.identity(
+            lin_space, lin_space, const_space)
+        dlp = bempp.api.operators.boundary.laplace.double_layer(
+            lin_space, lin_space, const_space)
+        slp = bempp.api.operators.boundary.laplace.single_layer(
+            const_space, lin_space, const_space)
+        dirichlet_fun = bempp.api.GridFunction(lin_space, fun=dirichlet_data)
+        bempp.api.linalg.gmres(slp, (.5 * identity + dlp) * dirichlet_fun, tol=1E-5)
+
+    return Benchmark('solve.laplace_interior_dirichlet.{0}'.format(mesh), setup, run,
+                     {'mesh': mesh})
+
+
+def _helmholtz_solve_benchmark(mesh):
+    """The tutorial helmholtz_combined_exterior."""
+
+    def setup(mesh_dir):
+        return _load_grid(mesh_dir, mesh)
+
+    def run(grid):
+        import numpy as np
+        import bempp.api
+
+        k = WAVE_NUMBER
+
+        def combined_data(x, n, domain_index, result):
+            result[0] = 2j * k * np.exp(1j * k * x[0]) * (n[0] - 1)
+
+        space = bempp.api.function_space(grid, "DP", 0)
+        identity = bempp.api.operators.boundary.sparse.identity(space, space, space)
+        adlp = bempp.api.operators.boundary.helmholtz.adjoint_double_layer(space, space, space, k)
+        slp = bempp.api.operators.boundary.helmholtz.single_layer(space, space, space, k)
+        lhs = identity + 2 * adlp - 2j * k * slp
+        bempp.api.linalg.gmres(lhs, bempp.api.GridFunction(space, fun=combined_data), tol=1E-5)
+
+    return Benchmark('solve.helmholtz_combined_exterior.{0}'.format(mesh), setup, run,
+                     {'mesh': mesh})
+
+
+def benchmarks(meshes):
+    """Return the list of benchmark cases for the given meshes."""
+    cases = []
+    for mesh in meshes:
+        for kernel in sorted(KERNELS):
+            if mesh in DENSE_MESHES:
+                cases.append(_assembly_benchmark('dense', kernel, mesh))
+            cases.append(_assembly_benchmark('hmat', kernel, mesh))
+        if mesh in DENSE_MESHES:
+            for kernel in BLAS_QUADRATURE_KERNELS:
+                for blas_in_quadrature in ['yes', 'no']:
+                    cases.append(_blas_quadrature_benchmark(blas_in_quadrature, kernel, mesh))
+        for kernel in ['laplace_single_layer', 'helmholtz_single_layer']:
+            cases.append(_product_benchmark(kernel, mesh, 1))
+            cases.append(_product_benchmark(kernel, mesh, 16))
+        cases.append(_potential_benchmark(mesh))
+        cases.append(_projection_benchmark(mesh))
+        cases.append(_import_benchmark(mesh))
+        cases.append(_export_benchmark(mesh))
+        if mesh in SPHERE_MESHES:
+            cases.append(_laplace_solve_benchmark(mesh))
+            cases.append(_helmholtz_solve_benchmark(mesh))
+    return cases
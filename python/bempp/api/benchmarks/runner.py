@@ -0,0 +1,235 @@
+"""Execution of benchmark cases and comparison against a baseline."""
+
+import json
+import os
+import sys
+
+
+def default_mesh_dir():
+    """Return the directory with the bundled meshes or None if it is not found.
+
+    The directory is taken from the environment variable BEMPP_MESH_DIR,
+    or else the installation directory share/bempp/meshes is used.
+
+    """
+    candidates = [os.environ.get('BEMPP_MESH_DIR'),
+                  os.path.join(sys.prefix, 'share', 'bempp', 'meshes')]
+    for candidate in candidates:
+        if candidate is not None and os.path.isdir(candidate):
+            return candidate
+    return None
+
+
+def _reset_peak_memory():
+    """Reset the peak resident memory of the process to its current value.
+
+    Returns False if the platform does not support this (only Linux does).
+
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as clear_refs:
+            clear_refs.write('5')
+    except (IOError, OSError):
+        return False
+    return True
+
+
+def _peak_memory_mb():
+    """Return the peak resident memory of the process in megabytes or None."""
+    # VmHWM is the peak since the last reset, ru_maxrss the peak of the process
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024.
+    except (IOError, OSError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is given in bytes on OS X and in kilobytes elsewhere
+    if sys.platform == 'darwin':
+        return peak / 1024. ** 2
+    return peak / 1024.
+
+
+def run_case(benchmark, mesh_dir, repeat=1):
+    """Run a benchmark in the current process and return its result.
+
+    Parameters
+    ----------
+    benchmark : bempp.api.benchmarks.cases.Benchmark
+        The case to run.
+    mesh_dir : string
+        Directory with the bundled meshes.
+    repeat : int
+        Number of repetitions. The minimum time is reported.
+
+    Returns
+    -------
+    result : dict
+        A dictionary with the keys 'time' (seconds), 'setup_memory_mb'
+        (peak memory during the setup), 'peak_memory_mb' (peak memory
+        during the timed runs), 'peak_memory_per_phase' and 'params'.
+        If the peak memory can not be reset between the phases
+        'peak_memory_per_phase' is False and the peak memory of the
+        runs includes the setup and the earlier cases of the process.
+
+    """
+    import time
+
+    def max_memory(first, second):
+        return second if first is None else max(first, second)
+
+    times = []
+    setup_memory = None
+    peak_memory = None
+    per_phase = True
+    for _ in range(repeat):
+        per_phase = _reset_peak_memory() and per_phase
+        state = benchmark.setup(mesh_dir)
+        setup_memory = max_memory(setup_memory, _peak_memory_mb())
+        per_phase = _reset_peak_memory() and per_phase
+        start_time = time.time()
+        benchmark.run(state)
+        times.append(time.time() - start_time)
+        peak_memory = max_memory(peak_memory, _peak_memory_mb())
+        del state
+
+    return {'time': min(times),
+            'setup_memory_mb': setup_memory,
+            'peak_memory_mb': peak_memory,
+            'peak_memory_per_phase': per_phase,
+            'params': benchmark.params}
+
+
+def _run_case_in_subprocess(name, meshes, mesh_dir, repeat):
+    """Run a case in a new interpreter so that its peak memory is not shared with other cases."""
+    import subprocess
+
+    command = [sys.executable, '-m', 'bempp.api.benchmarks', '--run-case', name,
+               '--mesh-dir', mesh_dir, '--repeat', str(repeat)]
+    for mesh in meshes:
+        command += ['--mesh', mesh]
+    output = subprocess.check_output(command)
+    return json.loads(output.decode('utf-8').strip().splitlines()[-1])
+
+
+def run_benchmarks(meshes, mesh_dir, pattern=None, repeat=1, isolate=True):
+    """Run the benchmark cases and return the results.
+
+    Parameters
+    ----------
+    meshes : list of string
+        The names of the meshes (without extension) to run the cases on.
+    mesh_dir : string
+        Directory with the bundled meshes.
+    pattern : string
+        A regular expression. Only cases whose name matches are run.
+    repeat : int
+        Number of repetitions of each case.
+    isolate : bool
+        If True (default) each case is run in a separate process so that
+        the peak memory is measured per case.
+
+    Returns
+    -------
+    results : dict
+        A dictionary with the keys 'metadata' and 'results'. The
+        results map the case names to the dictionaries returned by
+        :func:`run_case`. Failed cases contain the key 'error' instead.
+
+    """
+    import platform
+    import re
+    import time
+    import bempp.api
+    from .cases import benchmarks
+
+    results = {}
+    for benchmark in benchmarks(meshes):
+        if pattern is not None and re.search(pattern, benchmark.name) is None:
+            continue
+        bempp.api.LOGGER.info("Running benchmark {0}".format(benchmark.name))
+        try:
+            if isolate:
+                results[benchmark.name] = _run_case_in_subprocess(
+                    benchmark.name, [benchmark.params['mesh']], mesh_dir, repeat)
+            else:
+                results[benchmark.name] = run_case(benchmark, mesh_dir, repeat)
+        except Exception as error: # pylint: disable=broad-except
+            bempp.api.LOGGER.warning(
+                "Benchmark {0} failed: {1}".format(benchmark.name, error))
+            results[benchmark.name] = {'error': str(error), 'params': benchmark.params}
+
+    metadata = {'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'hostname': platform.node(),
+                'platform': platform.platform(),
+                'python': platform.python_version(),
+                'max_thread_count': bempp.api.global_parameters.assembly.max_thread_count,
+                'repeat': repeat}
+    return {'metadata': metadata, 'results': results}
+
+
+def save_results(results, file_name):
+    """Save benchmark results as JSON file."""
+    with open(file_name, 'w') as result_file:
+        json.dump(results, result_file, indent=2, sort_keys=True)
+
+
+def load_results(file_name):
+    """Load benchmark results from a JSON file."""
+    with open(file_name) as result_file:
+        return json.load(result_file)
+
+
+def compare_results(results, baseline, time_tolerance=1.2, memory_tolerance=1.2):
+    """Compare benchmark results against a baseline.
+
+    Parameters
+    ----------
+    results : dict
+        The results as returned by :func:`run_benchmarks`.
+    baseline : dict
+        The baseline results in the same format.
+    time_tolerance : float
+        A case regresses if its time exceeds the baseline time
+        by more than this factor.
+    memory_tolerance : float
+        A case regresses if its peak memory exceeds the baseline
+        by more than this factor.
+
+    Returns
+    -------
+    comparison : list of tuple
+        A tuple (name, metric, baseline value, current value, ratio,
+        regressed) for each metric of each case that succeeded in both
+        results.
+
+    """
+    tolerances = {'time': time_tolerance, 'peak_memory_mb': memory_tolerance}
+    comparison = []
+    for name in sorted(results['results']):
+        current = results['results'][name]
+        reference = baseline['results'].get(name)
+        if reference is None or 'error' in current or 'error' in reference:
+            continue
+        for metric in ['time', 'peak_memory_mb']:
+            if not current.get(metric) or not reference.get(metric):
+                continue
+            ratio = current[metric] / reference[metric]
+            comparison.append((name, metric, reference[metric], current[metric], ratio,
+                               ratio > tolerances[metric]))
+    return comparison
+
+
+def format_comparison(comparison):
+    """Return a table of a comparison created by :func:`compare_results`."""
+    lines = ["{0:<70} {1:<15} {2:>12} {3:>12} {4:>8}".format(
+        'case', 'metric', 'baseline', 'current', 'ratio')]
+    for name, metric, reference, current, ratio, regressed in comparison:
+        lines.append("{0:<70} {1:<15} {2:>12.4g} {3:>12.4g} {4:>8.2f}{5}".format(
+            name, metric, reference, current, ratio, ' REGRESSION' if regressed else ''))
+    return '\n'.join(lines)
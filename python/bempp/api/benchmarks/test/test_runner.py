@@ -0,0 +1,94 @@
+"""Test cases for the benchmark runner."""
+
+from unittest import TestCase
+
+
+def _results(times):
+    return {'metadata': {},
+            'results': dict((name, {'time': time, 'peak_memory_mb': 100., 'params': {}})
+                            for name, time in times.items())}
+
+
+class TestRunner(TestCase):
+    """Test class for the benchmark runner."""
+
+    def test_compare_detects_regression(self):
+        from bempp.api.benchmarks import compare_results
+
+        baseline = _results({'a': 1., 'b': 1.})
+        current = _results({'a': 1.1, 'b': 1.5})
+
+        regressed = dict((entry[0], entry[-1]) for entry in compare_results(current, baseline)
+                         if entry[1] == 'time')
+
+        self.assertFalse(regressed['a'])
+        self.assertTrue(regressed['b'])
+
+    def test_compare_skips_new_and_failed_cases(self):
+        from bempp.api.benchmarks import compare_results
+
+        baseline = _results({'a': 1.})
+        current = _results({'a': 1., 'new': 1.})
+        current['results']['a'] = {'error': 'failed', 'params': {}}
+
+        self.assertEqual(compare_results(current, baseline), [])
+
+    def test_case_names_are_unique(self):
+        from bempp.api.benchmarks import benchmarks, PRESETS
+
+        names = [benchmark.name for benchmark in benchmarks(PRESETS['full'])]
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_run_case(self):
+        import bempp.api
+        from bempp.api.benchmarks import Benchmark, run_case
+
+        def setup(mesh_dir):
+            grid = bempp.api.shapes.regular_sphere(2)
+            space = bempp.api.function_space(grid, "DP", 0)
+            return bempp.api.operators.boundary.laplace.single_layer(space, space, space)
+
+        result = run_case(Benchmark('test', setup, lambda op: op.weak_form(), {}), None, repeat=2)
+
+        self.assertGreater(result['time'], 0)
+        self.assertIn('peak_memory_mb', result)
+
+    def test_run_phase_peak_memory_excludes_setup(self):
+        import sys
+        from bempp.api.benchmarks import Benchmark, run_case
+
+        if not sys.platform.startswith('linux'):
+            self.skipTest("The peak memory can only be reset on Linux.")
+
+        def setup(mesh_dir):
+            # Allocate and free 200 MB, so that only the setup peak contains them
+            data = bytearray(200 * 1024 ** 2)
+            del data
+
+        result = run_case(Benchmark('test', setup, lambda state: None, {}), None)
+
+        self.assertTrue(result['peak_memory_per_phase'])
+        self.assertGreater(result['setup_memory_mb'] - result['peak_memory_mb'], 100)
+
+    def test_run_case_in_subprocess_with_custom_mesh(self):
+        import os
+        import shutil
+        import tempfile
+        import bempp.api
+        from bempp.api.benchmarks.runner import _run_case_in_subprocess
+
+        mesh_dir = tempfile.mkdtemp()
+        try:
+            bempp.api.export(grid=bempp.api.shapes.regular_sphere(2),
+                             file_name=os.path.join(mesh_dir, 'custom.msh'))
+            result = _run_case_in_subprocess('gmsh_import.custom', ['custom'], mesh_dir, 1)
+        finally:
+            shutil.rmtree(mesh_dir)
+
+        self.assertGreater(result['time'], 0)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
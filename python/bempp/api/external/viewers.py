@@ -30,7 +30,7 @@ def visualize_with_gmsh(obj):
     if isinstance(obj, Grid):
         export(grid=obj,file_name=f.name)
     elif isinstance(obj, GridFunction):
-        export(grid_function=obj,file_name=f.name,transformation=real)
+        export(grid_function=obj,file_name=f.name,array_transformation=real)
     f.close()
 
     subprocess.Popen([GMSH_PATH,f.name])
@@ -7,12 +7,10 @@ def p1_dof_to_vertex_matrix(space):
     grid = space.grid
     vertex_count = space.global_dof_count
 
-    vertex_to_dof_map = np.zeros(vertex_count, dtype=np.int)
-
-    for element in grid.leaf_view.entity_iterator(0):
-        global_dofs = space.get_global_dofs(element)
-        for ind, v in enumerate(element.sub_entity_iterator(2)):
-            vertex_to_dof_map[grid.vertex_insertion_index(v)] = global_dofs[ind]
+    # The local dofs of a P1 space are associated with the corners of the elements
+    vertex_to_dof_map = np.zeros(vertex_count, dtype='int64')
+    insertion_indices = grid.vertex_insertion_indices()
+    vertex_to_dof_map[insertion_indices[grid.leaf_view.elements.T]] = space.local2global[:, :3]
 
     vertex_indices = np.arange(vertex_count)
     data = np.ones(vertex_count)
@@ -6,7 +6,7 @@ class FileReader(object):
     This class represents a generic interface to read data from different
     file sources. Currently it supports the following types:
 
-    * Gmsh ASCII v2.2 files
+    * Gmsh ASCII and binary v2.2 and v4.1 files
 
     The class creates a grid object from the data and provides maps
     that translate between the internal BEM++ numbering for elements
@@ -24,36 +24,34 @@ class FileReader(object):
     grid : bempp.api.Grid
         Returns a grid object, representing the element and node data
         in the file.
-    vertex_index_to_file_key_map : list
+    vertex_index_to_file_key_map : np.ndarray
         vertex_index_to_file_key_map[i] returns the associated file key
         of the ith vertex in BEM++.
-    vertex_file_key_to_index_map : dictionary
+    vertex_file_key_to_index_map : FileKeyToIndexMap
         vertex_file_key_to_index_map[key] returns the BEM++ index of the
-        vertex with name 'key' in the file.
-    element_index_to_file_key_map : list
+        vertex with name 'key' in the file or -1 if the file has
+        no such vertex. 'key' can be an integer or an array of integers.
+    element_index_to_file_key_map : np.ndarray
         element_index_to_file_key_map[i] returns the associated file key
         of the ith element in BEM++.
-    element_file_key_to_index_map : dictionary
+    element_file_key_to_index_map : FileKeyToIndexMap
         element_file_key_to_index_map[key] returns the BEM++ index of the
-        element with name 'key' in the file.
+        element with name 'key' in the file or -1 if the file has
+        no such element. 'key' can be an integer or an array of integers.
 
     """
 
 
     def __init__(self,**kwargs):
         import os.path
-        from collections import OrderedDict
 
-        self._impl = None 
-        self._vertex_file_to_insertion_indices = None
-        self._element_file_to_insertion_indices = None
-        self._vertex_insertion_indices_to_file = []
-        self._element_insertion_indices_to_file = []
+        self._impl = None
+        self._grid = None
 
         self._vertex_indices_to_file = None
-        self._file_to_vertex_indices = OrderedDict()
+        self._file_to_vertex_indices = None
         self._element_indices_to_file = None
-        self._file_to_element_indices = OrderedDict()
+        self._file_to_element_indices = None
 
         if 'file_name' in kwargs:
             fname = kwargs['file_name']
@@ -62,64 +60,46 @@ class FileReader(object):
             if extension=='.msh':
                 from bempp.api.file_interfaces import gmsh
                 self._impl = gmsh.GmshInterface.read(fname)
+            else:
+                raise ValueError("Unsupported file format {0}.".format(extension))
 
             self._grid = self._create_grid()
 
-            # Setup the mappers
-
-            self._file_to_vertex_indices = OrderedDict.fromkeys(self._impl.vertices.keys(),value=-1)
-            self._file_to_element_indices = OrderedDict.fromkeys(self._impl.elements.keys(),value=-1)
-
-            self._vertex_indices_to_file = self._grid.leaf_view.entity_count(2)*[None]
-            self._element_indices_to_file = self._grid.leaf_view.entity_count(0)*[None]
-
-            index_set = self._grid.leaf_view.index_set()
-            for elem in self._grid.leaf_view.entity_iterator(0):
-                index = index_set.entity_index(elem)
-                insertion_index = self._grid.element_insertion_index(elem)
-                file_key = self._element_insertion_indices_to_file[insertion_index]
-                self._element_indices_to_file[index] = file_key
-                self._file_to_element_indices[file_key] = index
-                
-            for vertex in self._grid.leaf_view.entity_iterator(2):
-                index = index_set.entity_index(vertex)
-                insertion_index = self._grid.vertex_insertion_index(vertex)
-                file_key = self._vertex_insertion_indices_to_file[insertion_index]
-                self._vertex_indices_to_file[index] = file_key
-                self._file_to_vertex_indices[file_key] = index
-
     def _create_grid(self):
 
-        from bempp.api import GridFactory
-        from collections import OrderedDict
+        from bempp.api import grid_from_element_data
+
+        vertex_keys, vertices, element_keys, elements, domain_indices = self._impl.grid_arrays()
+
+        # Translate the vertex keys of the elements into columns of the vertex array
 
-        vertices = self._impl.vertices
-        elements = self._impl.elements
+        try:
+            columns = _key_positions(vertex_keys, elements)
+        except ValueError:
+            raise ValueError("Elements reference vertices that are not defined in the file.")
 
-        factory = GridFactory()
+        # Only insert vertices that belong to an element, in the order of their
+        # first appearance.
 
-        self._element_file_to_insertion_indices = OrderedDict.fromkeys(elements.keys(),value=-1)
-        self._vertex_file_to_insertion_indices = OrderedDict.fromkeys(vertices.keys(),value=-1)
+        used_columns, first_appearance, corners = _np.unique(
+            columns.T.ravel(), return_index=True, return_inverse=True)
+        insertion_order = _np.argsort(first_appearance, kind='mergesort')
+        rank = _np.empty_like(insertion_order)
+        rank[insertion_order] = _np.arange(len(insertion_order))
+        insertion_columns = used_columns[insertion_order]
+        corners = rank[corners].reshape(-1, 3).T
 
-        vertex_insertion_count = 0
-        element_insertion_count = 0
+        grid = grid_from_element_data(vertices[:, insertion_columns], corners, domain_indices)
 
-        for key in elements:
-            elem = elements[key]
-            elem_vertex_keys = []
-            for vertex_key in elem['data']:
-                if self._vertex_file_to_insertion_indices[vertex_key] ==-1:
-                    factory.insert_vertex(vertices[vertex_key])
-                    self._vertex_file_to_insertion_indices[vertex_key] = vertex_insertion_count
-                    self._vertex_insertion_indices_to_file.append(vertex_key)
-                    vertex_insertion_count += 1
-                elem_vertex_keys.append(self._vertex_file_to_insertion_indices[vertex_key])
-            factory.insert_element(elem_vertex_keys, domain_index=elem['domain_index'])
-            self._element_file_to_insertion_indices[key] = element_insertion_count
-            self._element_insertion_indices_to_file.append(key)
-            element_insertion_count += 1
+        # Setup the mappers
 
-        return factory.finalize()
+        self._element_indices_to_file = element_keys[grid.element_insertion_indices()]
+        self._vertex_indices_to_file = vertex_keys[insertion_columns][grid.vertex_insertion_indices()]
+
+        self._file_to_element_indices = FileKeyToIndexMap(self._element_indices_to_file)
+        self._file_to_vertex_indices = FileKeyToIndexMap(self._vertex_indices_to_file)
+
+        return grid
 
     vertex_index_to_file_key_map = property(lambda self: self._vertex_indices_to_file)
     vertex_file_key_to_index_map = property(lambda self: self._file_to_vertex_indices)
@@ -129,6 +109,46 @@ class FileReader(object):
 
     grid = property(lambda self: self._grid)
 
+class FileKeyToIndexMap(object):
+    """Map file keys to their position in an array of keys.
+
+    Indexing with an integer or an array of integers returns the
+    position of each key or -1 for keys that do not occur. The keys
+    are stored sorted and looked up by bisection, so that the memory
+    does not depend on the size of the keys.
+
+    Parameters
+    ----------
+    keys : np.ndarray
+        The array of distinct keys.
+
+    """
+
+    def __init__(self, keys):
+        keys = _np.asarray(keys, dtype='int64')
+        self._order = _np.argsort(keys, kind='mergesort')
+        self._sorted_keys = keys[self._order]
+
+    def __getitem__(self, key):
+        key = _np.asarray(key, dtype='int64')
+        flat_key = key.ravel()
+        result = -_np.ones(len(flat_key), dtype='int64')
+        if len(self._sorted_keys) > 0:
+            index = _np.minimum(_np.searchsorted(self._sorted_keys, flat_key),
+                                len(self._sorted_keys) - 1)
+            found = self._sorted_keys[index] == flat_key
+            result[found] = self._order[index[found]]
+        if key.ndim == 0:
+            return int(result[0])
+        return result.reshape(key.shape)
+
+    def __contains__(self, key):
+        return self[key] >= 0
+
+    def __len__(self):
+        return len(self._sorted_keys)
+
+
 def import_grid(file_name):
     """
 
@@ -163,7 +183,9 @@ def export(**kwargs):
     This funtion can export grids and gridfunctions into external file formats.
     Supported formats are:
 
-    * Gmsh ASCII v2.2 files
+    * Gmsh ASCII and binary v2.2 files ('gmsh', extension .msh)
+    * VTK unstructured grid files with appended binary data ('vtu', extension .vtu)
+    * XDMF files with HDF5 heavy data ('xdmf', extension .xdmf, requires h5py)
 
     The function only takes keyword arguments. 
 
@@ -173,8 +195,19 @@ def export(**kwargs):
         Name of the output file.
     grid : bempp.api.Grid
         A grid object to write out
-    grid_function : bempp.api.GridFunction
-        A gridfunction to write out
+    grid_function : bempp.api.GridFunction or list
+        A gridfunction to write out. A list of grid functions on
+        the same grid is written as a series, e.g. the solutions of
+        a frequency sweep. The grid is stored only once.
+    format : string
+        (optional) One of 'gmsh', 'vtu' or 'xdmf'. By default the format
+        is determined from the file extension.
+    time_values : list
+        (optional) The time or frequency values of the grid functions
+        in a series (default 0, 1, 2, ...).
+    append : bool
+        (optional) Append the grid functions as new steps to an existing
+        XDMF file of the same grid without rewriting the grid (default False).
     vertex_index_to_file_key_map :  list
         (optional) A list that maps BEM++ indices to vertex indices in the file
     element_index_to_file_key_map : list
@@ -189,7 +222,16 @@ def export(**kwargs):
         (optional) A string labelling grid function data in the file.
     transformation : function object
         (optional) A function object that is applied to the data before
-        writing it out.
+        writing it out. It is called for each element with the array of
+        shape (components, n_points) of values on the element, or with
+        the array of the components for element data.
+    array_transformation : function object
+        (optional) A function object that is applied to the data of all
+        elements at once before writing it out. It is called with the
+        array of shape (components, n_elements, n_points) and is faster
+        than `transformation` for functions that work on whole arrays.
+    binary : bool
+        (optional) Write a binary Gmsh file (default False).
 
     Notes
     -----
@@ -198,6 +240,8 @@ def export(**kwargs):
       no index_to_file_key_map is provided. The reason is that some
       file formats such as Gmsh start counting nodes and elements from 1
       instead of zero.
+    * VTK and XDMF files store complex data as separate real and
+      imaginary parts.
 
     Examples
     --------
@@ -212,107 +256,147 @@ def export(**kwargs):
 
     To save the real part of a complex grid function in Gmsh format use
 
-    >>> export(grid_function=gridfun, file_name='output.msh', transformation=lambda x: np.real(x))
+    >>> export(grid_function=gridfun, file_name='output.msh', array_transformation=np.real)
+
+    To save the solutions 'solutions' of a frequency sweep over the
+    frequencies 'freqs' for ParaView use
+
+    >>> export(grid_function=solutions, time_values=freqs, file_name='sweep.xdmf')
 
     """
 
     import os
 
     interface = None # Holds the actual FileInterface for the specified data format
-    vertex_index_to_file_key_map = None
-    element_index_to_file_key_map = None
 
     if 'file_name' in kwargs:
         fname = kwargs['file_name']
     else:
         raise ValueError("file_name must be specified.")
-    
+
     extension = os.path.splitext(fname)[1].lower()
+    file_format = kwargs.get('format', {'.msh': 'gmsh', '.vtu': 'vtu',
+                                        '.xdmf': 'xdmf'}.get(extension, None))
+    append = kwargs.get('append', False)
 
-    if extension=='.msh':
+    if file_format=='gmsh':
         from bempp.api.file_interfaces import gmsh
-        interface = gmsh.GmshInterface()
-    
+        interface = gmsh.GmshInterface(binary=kwargs.get('binary', False))
+    elif file_format=='vtu':
+        from bempp.api.file_interfaces import vtk
+        interface = vtk.VtuInterface()
+    elif file_format=='xdmf':
+        from bempp.api.file_interfaces import xdmf
+        interface = xdmf.XdmfInterface(append=append)
+    else:
+        raise ValueError("Unknown file format. Use one of 'gmsh', 'vtu' or 'xdmf'.")
+
+    if append and file_format != 'xdmf':
+        raise ValueError("Only XDMF files support appending data.")
+
     if int('grid' in kwargs) + int('grid_function' in kwargs) != 1:
         raise ValueError("Exactly one of 'grid' or 'grid_function' must be specified")
 
+    grid_functions = []
     if 'grid' in kwargs:
         grid = kwargs['grid']
     elif 'grid_function' in kwargs:
-        grid = kwargs['grid_function'].grid
-
-    number_of_vertices = grid.leaf_view.entity_count(2)
-    number_of_elements = grid.leaf_view.entity_count(0)
+        grid_functions = kwargs['grid_function']
+        if not isinstance(grid_functions, (list, tuple)):
+            grid_functions = [grid_functions]
+        if len(grid_functions) == 0:
+            raise ValueError("At least one grid function must be specified.")
+        grid = grid_functions[0].grid
+        for fun in grid_functions:
+            if fun.grid != grid:
+                raise ValueError("All grid functions must be defined on the same grid.")
+
+    leaf_view = grid.leaf_view
+    number_of_vertices = leaf_view.entity_count(2)
+    number_of_elements = leaf_view.entity_count(0)
 
     offset = interface.index_offset
     if 'vertex_index_to_file_key_map' in kwargs:
-        vertex_index_to_file_key_map = kwargs['vertex_index_to_file_key_map']
+        vertex_keys = _np.asarray(kwargs['vertex_index_to_file_key_map'])
     else:
-        vertex_index_to_file_key_map = range(offset,number_of_vertices+offset)
+        vertex_keys = _np.arange(offset, number_of_vertices + offset)
     if 'element_index_to_file_key_map' in kwargs:
-        element_index_to_file_key_map = kwargs['element_index_to_file_key_map']
+        element_keys = _np.asarray(kwargs['element_index_to_file_key_map'])
     else:
-        element_index_to_file_key_map = range(offset,number_of_elements+offset)
+        element_keys = _np.arange(offset, number_of_elements + offset)
 
-    # Create the vertex and element structure
+    # Create the vertex and element arrays from the raw grid data
 
-    from collections import OrderedDict
-
-    vertex_iterator = grid.leaf_view.entity_iterator(2)
-    element_iterator = grid.leaf_view.entity_iterator(0)
-    index_set = grid.leaf_view.index_set()
-
-    vertices = OrderedDict([(vertex_index_to_file_key_map[index_set.entity_index(vertex)],vertex.geometry.corners[:,0])
-        for vertex in vertex_iterator])
-    elements = OrderedDict([(element_index_to_file_key_map[index_set.entity_index(element)],
-        {'data':[element_index_to_file_key_map[index_set.sub_entity_index(element,n,2)] for n in range(3)],
-         'domain_index':element.domain}) for element in element_iterator])
-
-    interface.add_grid_data(vertices,elements)
+    elements = leaf_view.elements
+    interface.add_grid_arrays(vertex_keys, leaf_view.vertices, element_keys,
+                              vertex_keys[elements], leaf_view.domain_indices)
 
     # Evaluate data
 
-    if 'grid_function' in kwargs:
-        fun = kwargs['grid_function']
-        data_type = kwargs.get('data_type',interface.default_data_type)
-
-        if 'transformation' in kwargs:
-            transformation = kwargs['transformation']
-        else:
-            transformation = lambda x: x
-
-        index_set = grid.leaf_view.index_set()
+    data_type = kwargs.get('data_type',interface.default_data_type)
+    if data_type not in ['node', 'element', 'element_node']:
+        raise ValueError("data_type must be one of 'node', 'element', or 'element_node'")
+
+    transformation = kwargs.get('transformation', None)
+    array_transformation = kwargs.get('array_transformation', None)
+
+    time_values = kwargs.get('time_values', range(len(grid_functions)))
+    if len(time_values) != len(grid_functions):
+        raise ValueError("time_values must have one entry for each grid function.")
+
+    for fun, time in zip(grid_functions, time_values):
+
+        def transformed_values(local_coordinates):
+            """Evaluate and transform fun on all elements."""
+            values = fun.evaluate_all(local_coordinates)
+            if array_transformation is not None:
+                values = _np.asarray(array_transformation(values))
+                if values.ndim == 2:
+                    values = values[_np.newaxis, :, :]
+            if transformation is not None:
+                if data_type == 'element':
+                    values = _np.stack([_np.asarray(transformation(values[:, index, 0])).ravel()
+                                        for index in range(values.shape[1])], axis=1)
+                    values = values[:, :, _np.newaxis]
+                else:
+                    values = _np.stack([_np.asarray(transformation(values[:, index, :]))
+                                        for index in range(values.shape[1])], axis=1)
+            return values
 
         if data_type == 'element_node':
-            local_coordinates = _np.array([[0,1,0],[0,0,1]])
-            data = OrderedDict.fromkeys(element_index_to_file_key_map)
-
-            for element in grid.leaf_view.entity_iterator(0):
-                data[element_index_to_file_key_map[index_set.entity_index(element)]] = transformation(
-                        fun.evaluate(element,local_coordinates))
-            interface.add_element_node_data(data,kwargs.get('label','element_node_data'))
+            values = transformed_values(_np.array([[0,1,0],[0,0,1]]))
+            interface.add_element_node_data((element_keys, values),
+                                            kwargs.get('label','element_node_data'), time)
         elif data_type == 'node':
-            local_coordinates = _np.array([[0,1,0],[0,0,1]])
-            data = OrderedDict.fromkeys(vertex_index_to_file_key_map)
-            for element in grid.leaf_view.entity_iterator(0):
-                local_data = transformation(fun.evaluate(element,local_coordinates))
-                for i in range(3):
-                    data[vertex_index_to_file_key_map[index_set.sub_entity_index(element,i,2)]] = local_data[:,i]
-            interface.add_node_data(data,kwargs.get('label','node_data'))
-        elif data_type == 'element':
-            local_coordinates = _np.array([[1./3],[1./3]])
-            data = OrderedDict.fromkeys(element_index_to_file_key_map)
-
-            for element in grid.leaf_view.entity_iterator(0):
-                data[element_index_to_file_key_map[index_set.entity_index(element)]] = transformation(
-                        fun.evaluate(element,local_coordinates).ravel())
-            interface.add_element_data(data,kwargs.get('label','element_data'))
+            values = transformed_values(_np.array([[0,1,0],[0,0,1]]))
+            node_values = _np.zeros((values.shape[0], number_of_vertices), dtype=values.dtype)
+            for i in range(3):
+                node_values[:, elements[i, :]] = values[:, :, i]
+            interface.add_node_data((vertex_keys, node_values),
+                                    kwargs.get('label','node_data'), time)
         else:
-            raise ValueError("data_type must be one of 'node', 'element', or 'element_node'")
+            values = transformed_values(_np.array([[1./3],[1./3]]))
+            interface.add_element_data((element_keys, values[:, :, 0]),
+                                       kwargs.get('label','element_data'), time)
 
     interface.write(kwargs['file_name'])
 
 
+def _key_positions(keys, lookup):
+    """Return the positions of the entries of lookup in the array keys.
+
+    Raises a ValueError if an entry of lookup is not contained in keys.
+
+    """
+    order = _np.argsort(keys, kind='mergesort')
+    sorted_keys = keys[order]
+    positions = _np.minimum(_np.searchsorted(sorted_keys, lookup), max(len(sorted_keys) - 1, 0))
+    if _np.size(lookup) > 0 and (len(sorted_keys) == 0 or
+                                 _np.any(sorted_keys[positions] != lookup)):
+        raise ValueError("Unknown key.")
+    return order[positions]
+
+
 class FileInterfaceImpl(object):
 
     def __init__(self):
@@ -332,13 +416,41 @@ class FileInterfaceImpl(object):
         self.__vertices = vertices
         self.__elements = elements
 
-    def add_node_data(self, data, label):
+    def add_grid_arrays(self, vertex_keys, vertices, element_keys, elements, domain_indices):
+        """Add grid data given as arrays.
+
+        vertices is a (3 x n_vertices) array and elements a (3 x n_elements)
+        array of vertex file keys. The default implementation converts the
+        arrays into the dictionaries used by add_grid_data.
+
+        """
+        from collections import OrderedDict
+
+        self.add_grid_data(
+            OrderedDict(zip(vertex_keys, vertices.T)),
+            OrderedDict((key, {'data': list(element), 'domain_index': domain_index})
+                        for key, element, domain_index in zip(element_keys, elements.T,
+                                                              domain_indices)))
+
+    def grid_arrays(self):
+        """Return (vertex_keys, vertices, element_keys, elements, domain_indices) arrays."""
+
+        vertex_keys = _np.fromiter(self.vertices.keys(), dtype='int64', count=len(self.vertices))
+        vertices = _np.array(list(self.vertices.values()), dtype='float64').reshape(-1, 3).T
+        element_keys = _np.fromiter(self.elements.keys(), dtype='int64', count=len(self.elements))
+        elements = _np.array([elem['data'] for elem in self.elements.values()],
+                             dtype='int64').reshape(-1, 3).T
+        domain_indices = _np.array([elem['domain_index'] for elem in self.elements.values()],
+                                   dtype='int64')
+        return vertex_keys, vertices, element_keys, elements, domain_indices
+
+    def add_node_data(self, data, label, time=0):
         pass
 
-    def add_element_data(self, data, label):
+    def add_element_data(self, data, label, time=0):
         pass
 
-    def add_element_node_data(self, data, label):
+    def add_element_node_data(self, data, label, time=0):
         pass
 
     @property
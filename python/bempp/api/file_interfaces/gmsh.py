@@ -1,5 +1,15 @@
 import numpy as np
-from .general_interface import FileInterfaceImpl, Vertex, Element 
+from .general_interface import FileInterfaceImpl
+
+# Number of nodes for each Gmsh element type
+_NODES_PER_ELEMENT = {1: 2, 2: 3, 3: 4, 4: 4, 5: 8, 6: 6, 7: 5, 8: 3, 9: 6,
+                      10: 9, 11: 10, 12: 27, 13: 18, 14: 14, 15: 1, 16: 8,
+                      17: 20, 18: 15, 19: 13, 20: 9, 21: 10, 22: 12, 23: 15,
+                      24: 15, 25: 21, 26: 4, 27: 5, 28: 6, 29: 20, 30: 35,
+                      31: 56, 92: 64, 93: 125}
+
+# Gmsh element type of linear triangles
+_TRIANGLE = 2
 
 def read_version(s):
     tokens = s.split()
@@ -11,62 +21,262 @@ def read_version(s):
         raise ValueError("Version number not recognized.")
     return version
 
-def read_vertex(s):
-    tokens = s.split()
-    if len(tokens)!=4:
-        raise ValueError("Unsupported format for vertex in string {0}".format(s))
+def _nodes_per_element(elem_type):
     try:
-        index = int(tokens[0])
-        x = float(tokens[1])
-        y = float(tokens[2])
-        z = float(tokens[3])
-    except:
-        raise ValueError("Vertex value not recognized in string {0}".format(s))
+        return _NODES_PER_ELEMENT[elem_type]
+    except KeyError:
+        raise ValueError("Unsupported element type {0}.".format(elem_type))
 
-    return Vertex(index,x,y,z)
 
-def read_element(s):
-    tokens = s.split()
-    try:
-        index = int(tokens[0])
-        elem_type = int(tokens[1])
-    except:
-        raise ValueError("Unspported format for element in string {0}".format(s))
-    if elem_type!=2: return None
-    try:
-        n_tags = int(tokens[2])
-        phys_id = int(tokens[3])
-        v2 = int(tokens[-1])
-        v1 = int(tokens[-2])
-        v0 = int(tokens[-3])
-    except:
-        raise ValueError("Unsupported format for element in string {0}".format(s))
-    return Element(index,v0,v1,v2,phys_id)
+class _MshContent(object):
+    """Sequential access to the lines and binary blocks of a Gmsh file."""
+
+    def __init__(self, content):
+        self._content = content
+        self._pos = 0
+
+    def next_line(self):
+        """Return the next line as string or None at the end of the file."""
+        if self._pos >= len(self._content):
+            return None
+        end = self._content.find(b'\n', self._pos)
+        if end == -1:
+            end = len(self._content)
+        line = self._content[self._pos:end]
+        self._pos = end + 1
+        return line.decode('ascii', 'replace').strip()
+
+    def expect(self, expected):
+        """Skip empty lines and check that the next line is as expected."""
+        line = self.next_line()
+        while line == '':
+            line = self.next_line()
+        if line != expected:
+            raise ValueError("Expected {0} but got {1}".format(expected, line))
+
+    def text_until(self, marker):
+        """Return the text up to the line starting with marker."""
+        end = self._content.find(b'\n' + marker.encode('ascii'), self._pos - 1)
+        if end == -1:
+            raise ValueError("Expected {0}".format(marker))
+        text = self._content[self._pos:end]
+        self._pos = end + 1
+        return text
+
+    def read_array(self, dtype, count):
+        """Read count binary values of the given dtype."""
+        result = np.frombuffer(self._content, dtype=dtype, count=count, offset=self._pos)
+        self._pos += result.nbytes
+        return result
+
+
+def _value_reader(content, binary, end_marker):
+    """Return a function read(kind, count) for the values of a MSH 4.1 section.
+
+    kind is one of 'int', 'size' or 'double' and determines the size of
+    binary values. In ASCII files all values of the section are parsed at once.
+
+    """
+
+    if binary:
+        dtypes = {'int': '<i4', 'size': '<u8', 'double': '<f8'}
+        return lambda kind, count: content.read_array(dtypes[kind], count)
+
+    values = np.fromstring(content.text_until(end_marker).decode('ascii'), sep=' ')
+    position = [0]
+
+    def read(kind, count):
+        result = values[position[0]:position[0] + count]
+        position[0] += count
+        return result
+
+    return read
+
+
+def _read_entities_v4(content, binary):
+    """Return a dictionary from surface entity tags to physical tags."""
+
+    read = _value_reader(content, binary, '$EndEntities')
+    counts = read('size', 4).astype('int64')
+    physical_tags = {}
+    for dim in range(4):
+        for _ in range(counts[dim]):
+            tag = int(read('int', 1)[0])
+            read('double', 3 if dim == 0 else 6)
+            tags = read('int', int(read('size', 1)[0]))
+            if dim > 0:
+                read('int', int(read('size', 1)[0]))
+            if dim == 2 and len(tags) > 0:
+                physical_tags[tag] = int(tags[0])
+    return physical_tags
+
+
+def _read_nodes_v4(content, binary):
+    """Return (keys, vertices) arrays from a MSH 4.1 $Nodes section."""
+
+    read = _value_reader(content, binary, '$EndNodes')
+    block_count = int(read('size', 4)[0])
+    keys = []
+    vertices = []
+    for _ in range(block_count):
+        dim, _, parametric = read('int', 3).astype('int64')
+        count = int(read('size', 1)[0])
+        keys.append(read('size', count).astype('int64'))
+        coordinate_count = 3 + (dim if parametric else 0)
+        vertices.append(read('double', count * coordinate_count).reshape(
+            count, coordinate_count)[:, :3])
+    if block_count == 0:
+        return np.zeros(0, dtype='int64'), np.zeros((3, 0))
+    return np.concatenate(keys), np.concatenate(vertices).T
+
+
+def _read_elements_v4(content, binary, physical_tags):
+    """Return (keys, elements, domain_indices) of the triangles in a MSH 4.1 $Elements section."""
+
+    read = _value_reader(content, binary, '$EndElements')
+    block_count = int(read('size', 4)[0])
+    keys = []
+    elements = []
+    domain_indices = []
+    for _ in range(block_count):
+        _, tag, elem_type = read('int', 3).astype('int64')
+        count = int(read('size', 1)[0])
+        node_count = _nodes_per_element(elem_type)
+        data = read('size', count * (1 + node_count)).astype('int64').reshape(count, 1 + node_count)
+        if elem_type == _TRIANGLE:
+            keys.append(data[:, 0])
+            elements.append(data[:, 1:])
+            domain_indices.append(physical_tags.get(tag, 0) * np.ones(count, dtype='int64'))
+    if len(keys) == 0:
+        return np.zeros(0, dtype='int64'), np.zeros((3, 0), dtype='int64'), np.zeros(0, dtype='int64')
+    return np.concatenate(keys), np.concatenate(elements).T, np.concatenate(domain_indices)
+
+
+def _read_nodes_v2(content, binary):
+    """Return (keys, vertices) arrays from a MSH 2.2 $Nodes section."""
+
+    number_of_vertices = int(content.next_line())
+    if binary:
+        records = content.read_array(np.dtype([('key', '<i4'), ('x', '<f8', (3,))]),
+                                     number_of_vertices)
+        keys, vertices = records['key'].astype('int64'), records['x'].T
+    else:
+        data = np.fromstring(content.text_until('$EndNodes').decode('ascii'), sep=' ')
+        if len(data) != 4 * number_of_vertices:
+            raise ValueError("Expected {0} vertices but got {1} values.".format(
+                number_of_vertices, len(data)))
+        data = data.reshape(number_of_vertices, 4)
+        keys, vertices = data[:, 0].astype('int64'), data[:, 1:].T
+    content.expect('$EndNodes')
+    return keys, vertices
+
+
+def _read_elements_v2(content, binary):
+    """Return (keys, elements, domain_indices) of the triangles in a MSH 2.2 $Elements section."""
+
+    number_of_elements = int(content.next_line())
+
+    if binary:
+        keys = []
+        elements = []
+        domain_indices = []
+        count = 0
+        while count < number_of_elements:
+            elem_type, block_size, tag_count = content.read_array('<i4', 3)
+            node_count = _nodes_per_element(elem_type)
+            data = content.read_array('<i4', block_size * (1 + tag_count + node_count)).reshape(
+                block_size, -1).astype('int64')
+            if elem_type == _TRIANGLE:
+                keys.append(data[:, 0])
+                elements.append(data[:, 1 + tag_count:])
+                domain_indices.append(data[:, 1] if tag_count > 0
+                                      else np.zeros(block_size, dtype='int64'))
+            count += block_size
+        content.expect('$EndElements')
+        if len(keys) == 0:
+            return np.zeros(0, dtype='int64'), np.zeros((3, 0), dtype='int64'), np.zeros(0, dtype='int64')
+        return np.concatenate(keys), np.concatenate(elements).T, np.concatenate(domain_indices)
+
+    text = content.text_until('$EndElements')
+    content.expect('$EndElements')
+    if number_of_elements == 0:
+        return np.zeros(0, dtype='int64'), np.zeros((3, 0), dtype='int64'), np.zeros(0, dtype='int64')
+
+    # Records have different lengths. Count the tokens in each line to find
+    # the start of each record in the flat array of values.
+    buf = np.frombuffer(text, dtype=np.uint8)
+    is_space = (buf == 32) | (buf == 9) | (buf == 10) | (buf == 13)
+    token_start = ~is_space & np.concatenate(([True], is_space[:-1]))
+    line_of_token = np.cumsum(buf == 10)[token_start]
+    tokens_per_line = np.bincount(line_of_token)
+    tokens_per_line = tokens_per_line[tokens_per_line > 0]
+    if len(tokens_per_line) != number_of_elements:
+        raise ValueError("Expected {0} elements but got {1} elements.".format(
+            number_of_elements, len(tokens_per_line)))
+
+    values = np.fromstring(text.decode('ascii'), sep=' ').astype('int64')
+    ends = np.cumsum(tokens_per_line)
+    starts = ends - tokens_per_line
+
+    triangles = values[starts + 1] == _TRIANGLE
+    starts = starts[triangles]
+    ends = ends[triangles]
+    tag_counts = values[starts + 2]
+
+    keys = values[starts]
+    domain_indices = np.where(tag_counts > 0, values[starts + 3], 0)
+    elements = values[ends[np.newaxis, :] - 3 + np.arange(3)[:, np.newaxis]]
+    return keys, elements, domain_indices
+
+
+def _as_data_arrays(data):
+    """Return (keys, values) arrays for data given as dictionary or tuple."""
+    if isinstance(data, dict):
+        keys = np.fromiter(data.keys(), dtype='int64', count=len(data))
+        values = np.array([np.asarray(val) for val in data.values()])
+        if values.ndim == 1:
+            values = values[:, np.newaxis]
+        return keys, values.swapaxes(0, 1)
+    keys, values = data
+    return np.asarray(keys), np.asarray(values)
+
 
 class GmshInterface(FileInterfaceImpl):
 
-    def __init__(self):
+    def __init__(self, binary=False):
 
         super(GmshInterface,self).__init__()
         self._version = None
-        self._node_data = None
-        self._element_data = None
-        self._element_node_data = None
+        self._binary = binary
+        self._grid_arrays = None
+        self._node_data = []
+        self._element_data = []
+        self._element_node_data = []
 
     @property
     def default_data_type(self):
         return 'element_node'
 
+    def add_grid_arrays(self, vertex_keys, vertices, element_keys, elements, domain_indices):
+        self._grid_arrays = (np.asarray(vertex_keys), np.asarray(vertices),
+                             np.asarray(element_keys), np.asarray(elements),
+                             np.asarray(domain_indices))
+
+    def grid_arrays(self):
+        if self._grid_arrays is not None:
+            return self._grid_arrays
+        return super(GmshInterface, self).grid_arrays()
+
     def write(self, file_name):
-        with open(file_name,'w') as f:
+        with open(file_name,'wb') as f:
             self.write_version(f)
             self.write_vertices(f)
             self.write_elements(f)
-            if self._node_data is not None:
+            if self._node_data:
                 self.write_node_data(f)
-            if self._element_data is not None:
+            if self._element_data:
                 self.write_element_data(f)
-            if self._element_node_data is not None:
+            if self._element_node_data:
                 self.write_element_node_data(f)
 
     @classmethod
@@ -74,140 +284,169 @@ class GmshInterface(FileInterfaceImpl):
 
         gmsh_interface = GmshInterface()
 
-        with open(file_name) as f:
-            while True:
-                line = f.readline()
-                if line=='': break
-                s = line.rstrip()
-                if s=="$MeshFormat":
-                    s = f.readline().rstrip()
-                    gmsh_interface._version = read_version(s)
-                    s = f.readline().rstrip()
-                    if not s=="$EndMeshFormat":
-                        raise ValueError("Expected $EndMeshFormat but got {0}".format(s))
-                    continue
-                if s=="$Nodes":
-                    s = f.readline().rstrip()
-                    try:
-                        number_of_vertices = int(s)
-                    except:
-                        raise ValueError("Expected integer, got {0}".format(s))
-
-                    count = 0
-                    s = f.readline().rstrip()
-                    while s!="$EndNodes":
-                        vertex = read_vertex(s)
-                        gmsh_interface.vertices[vertex.index] = vertex.data
-                        count += 1
-                        s = f.readline().rstrip()
-                        if count==number_of_vertices:
-                            break
-                    if count!=number_of_vertices:
-                        raise ValueError("Expected {0} vertices but got {1} vertices.".format(number_of_vertices,count))
-                    if s!="$EndNodes":
-                        raise ValueError("Expected $EndNodes but got {0}.".format(s))
-                if s=="$Elements":
-                    s = f.readline().rstrip()
-                    try:
-                        number_of_elements = int(s)
-                    except:
-                        raise ValueError("Expected integer, got {0}".format(s))
-                    count = 0
-                    s = f.readline().rstrip()
-                    while s!= "$EndElements":
-                        element = read_element(s)
-                        count += 1
-                        if element is not None:
-                            gmsh_interface.elements[element.index] = {'data':element.data, 'domain_index':element.domain_index}
-                        s = f.readline().rstrip()
-                        if count==number_of_elements:
-                            break
-                    if count!=number_of_elements:
-                        raise ValueError("Expected {0} elements but got {1} elements.".format(number_of_elements,count))
-                    if s!="$EndElements":
-                        raise ValueError("Expected $EndElements but got {0}.".format(s))
+        with open(file_name, 'rb') as f:
+            content = _MshContent(f.read())
+
+        binary = False
+        physical_tags = {}
+        vertex_keys = vertices = None
+        element_keys = elements = domain_indices = None
+
+        while True:
+            s = content.next_line()
+            if s is None: break
+            if s=="$MeshFormat":
+                s = content.next_line()
+                gmsh_interface._version = read_version(s)
+                binary = int(s.split()[1]) == 1
+                if gmsh_interface._version >= 3 and gmsh_interface._version < 4.1:
+                    raise ValueError("Gmsh files of version {0} are not supported. ".format(
+                        gmsh_interface._version) + "Use version 2.2 or 4.1.")
+                if binary:
+                    if content.read_array('<i4', 1)[0] != 1:
+                        raise ValueError("Only little endian binary files are supported.")
+                content.expect("$EndMeshFormat")
+            elif s=="$Entities" and gmsh_interface._version >= 4:
+                physical_tags = _read_entities_v4(content, binary)
+                content.expect("$EndEntities")
+            elif s=="$Nodes":
+                if gmsh_interface._version >= 4:
+                    vertex_keys, vertices = _read_nodes_v4(content, binary)
+                    content.expect("$EndNodes")
+                else:
+                    vertex_keys, vertices = _read_nodes_v2(content, binary)
+            elif s=="$Elements":
+                if gmsh_interface._version >= 4:
+                    element_keys, elements, domain_indices = _read_elements_v4(
+                        content, binary, physical_tags)
+                    content.expect("$EndElements")
+                else:
+                    element_keys, elements, domain_indices = _read_elements_v2(content, binary)
+            elif s.startswith("$") and not s.startswith("$End"):
+                # Skip sections that are not needed
+                content.text_until("$End" + s[1:])
+                content.next_line()
+
+        if vertex_keys is None or element_keys is None:
+            raise ValueError("File {0} contains no $Nodes or $Elements section.".format(file_name))
+
+        gmsh_interface.add_grid_arrays(vertex_keys, vertices, element_keys,
+                                       elements, domain_indices)
         return gmsh_interface
 
+    def _write_text(self, f, text):
+        f.write(text.encode('ascii'))
+
+    def _write_rows(self, f, rows, formats):
+        """Write the rows of a 2-d array as text."""
+        if len(rows) == 0:
+            return
+        np.savetxt(f, rows, fmt=formats, delimiter=' ')
+
     def write_vertices(self, f):
-        n_vertices = len(self.vertices)
-        f.write("$Nodes\n")
-        f.write(str(n_vertices)+"\n")
-        for key in self.vertices:
-            f.write(str(key)+" "+str(self.vertices[key][0])+" "+str(self.vertices[key][1])+" "+str(self.vertices[key][2])+"\n")
-        f.write("$EndNodes\n")
+        vertex_keys, vertices = self.grid_arrays()[:2]
+        self._write_text(f, "$Nodes\n{0}\n".format(len(vertex_keys)))
+        if self._binary:
+            records = np.empty(len(vertex_keys), dtype=[('key', '<i4'), ('x', '<f8', (3,))])
+            records['key'] = vertex_keys
+            records['x'] = vertices.T
+            f.write(records.tobytes())
+            self._write_text(f, "\n")
+        else:
+            self._write_rows(f, np.column_stack([vertex_keys, vertices.T]),
+                             ["%d"] + 3 * ["%.16g"])
+        self._write_text(f, "$EndNodes\n")
 
     def write_elements(self, f):
-        n_elements = len(self.elements)
-        f.write("$Elements\n")
-        f.write(str(n_elements)+"\n")
-        for key in self.elements:
-            v0, v1, v2 = self.elements[key]['data']
-            f.write(str(key)+" "+"2"+" "+"2 "+str(self.elements[key]['domain_index'])+" "+"0 "+str(v0)+" "+str(v1)+" "+str(v2)+"\n")
-        f.write("$EndElements\n")
+        element_keys, elements, domain_indices = self.grid_arrays()[2:]
+        n_elements = len(element_keys)
+        self._write_text(f, "$Elements\n{0}\n".format(n_elements))
+        if self._binary:
+            # Header: element type (triangle), number of elements, number of tags
+            f.write(np.array([2, n_elements, 2], dtype='<i4').tobytes())
+            records = np.column_stack([element_keys, domain_indices, np.zeros(n_elements),
+                                       elements.T]).astype('<i4')
+            f.write(records.tobytes())
+            self._write_text(f, "\n")
+        else:
+            records = np.column_stack([element_keys, 2 * np.ones(n_elements), 2 * np.ones(n_elements),
+                                       domain_indices, np.zeros(n_elements),
+                                       elements.T]).astype('int64')
+            self._write_rows(f, records, records.shape[1] * ["%d"])
+        self._write_text(f, "$EndElements\n")
 
     def write_version(self, f):
-        f.write("$MeshFormat\n")
-        f.write("2.2 0 8\n")
-        f.write("$EndMeshFormat\n")
+        self._write_text(f, "$MeshFormat\n")
+        if self._binary:
+            self._write_text(f, "2.2 1 8\n")
+            # Integer one to detect the endianness of the file
+            f.write(np.array([1], dtype='<i4').tobytes())
+            self._write_text(f, "\n")
+        else:
+            self._write_text(f, "2.2 0 8\n")
+        self._write_text(f, "$EndMeshFormat\n")
+
+    def _write_data(self, f, section, data, time_step, nodes_per_element=None):
+        """Write a $NodeData, $ElementData or $ElementNodeData section."""
+
+        label = data['label']
+        keys, values = data['keys'], data['values']
+        if np.iscomplexobj(values):
+            raise ValueError("Gmsh only supports real data. Use a transformation " +
+                             "such as np.real to convert the data.")
+
+        n_components = values.shape[0]
+        # Values of one entry are stored as (nodes x components) in the file
+        if nodes_per_element is None:
+            flat_values = values.T
+        else:
+            flat_values = values.transpose(1, 2, 0).reshape(len(keys), -1)
+
+        self._write_text(f, "${0}\n1\n\"{1}\"\n1\n{2!r}\n4\n{3}\n{4}\n{5}\n0\n".format(
+            section, label.strip('"'), float(data['time']), time_step, n_components, len(keys)))
+
+        if self._binary:
+            fields = [('key', '<i4')]
+            if nodes_per_element is not None:
+                fields.append(('count', '<i4'))
+            fields.append(('values', '<f8', (flat_values.shape[1],)))
+            records = np.empty(len(keys), dtype=fields)
+            records['key'] = keys
+            if nodes_per_element is not None:
+                records['count'] = nodes_per_element
+            records['values'] = flat_values
+            f.write(records.tobytes())
+            self._write_text(f, "\n")
+        else:
+            columns = [keys]
+            if nodes_per_element is not None:
+                columns.append(nodes_per_element * np.ones(len(keys)))
+            self._write_rows(f, np.column_stack(columns + [flat_values]),
+                             len(columns) * ["%d"] + flat_values.shape[1] * ["%.16g"])
+
+        self._write_text(f, "$End{0}\n".format(section))
 
     def write_node_data(self, f):
-        label = self._node_data['label']
-        data = self._node_data['data']
-        f.write("$NodeData\n")
-        f.write("1\n")
-        f.write(label+"\n")
-        f.write("1\n")
-        f.write("0\n")
-        f.write("4\n")
-        f.write("0\n"+str(len(list(data.values())[0]))+"\n"+str(len(data))+"\n"+"0\n")
-        for key in data:
-            f.write(str(key))
-            for val in data[key]:
-                f.write(" "+str(val))
-            f.write("\n")
-        f.write("$EndNodeData\n")
-
-    def add_node_data(self, data, label):
-        self._node_data = {'label':label,'data':data}
+        for time_step, data in enumerate(self._node_data):
+            self._write_data(f, "NodeData", data, time_step)
+
+    def add_node_data(self, data, label, time=0):
+        keys, values = _as_data_arrays(data)
+        self._node_data.append({'label':label, 'keys':keys, 'values':values, 'time':time})
 
     def write_element_data(self, f):
-        label = self._element_data['label']
-        data = self._element_data['data']
-        f.write("$ElementData\n")
-        f.write("1\n")
-        f.write(label+"\n")
-        f.write("1\n")
-        f.write("0\n")
-        f.write("4\n")
-        f.write("0\n"+str(len(list(data.values())[0]))+"\n"+str(len(data))+"\n"+"0\n")
-        for key in data:
-            f.write(str(key))
-            for val in data[key]:
-                f.write(" "+str(val))
-            f.write("\n")
-        f.write("$EndElementData\n")
-
-    def add_element_data(self, data, label):
-        self._element_data = {'label':label, 'data':data}
+        for time_step, data in enumerate(self._element_data):
+            self._write_data(f, "ElementData", data, time_step)
+
+    def add_element_data(self, data, label, time=0):
+        keys, values = _as_data_arrays(data)
+        self._element_data.append({'label':label, 'keys':keys, 'values':values, 'time':time})
 
     def write_element_node_data(self, f):
-        label = self._element_node_data['label']
-        data = self._element_node_data['data']
-        f.write("$ElementNodeData\n")
-        f.write("1\n")
-        f.write(label+"\n")
-        f.write("1\n")
-        f.write("0\n")
-        f.write("4\n")
-        f.write("0\n"+str(len(list(data.values())[0][:,0]))+"\n"+str(len(data))+"\n"+"0\n")
-        for key in data:
-            f.write(str(key)+" 3")
-            for i in range(3):
-                for val in data[key][:,i]:
-                    f.write(" "+str(val))
-            f.write("\n")
-        f.write("$EndElementNodeData\n")
-
-    def add_element_node_data(self, data, label):
-        self._element_node_data = {'label':label, 'data':data}
+        for time_step, data in enumerate(self._element_node_data):
+            self._write_data(f, "ElementNodeData", data, time_step, nodes_per_element=3)
 
+    def add_element_node_data(self, data, label, time=0):
+        keys, values = _as_data_arrays(data)
+        self._element_node_data.append({'label':label, 'keys':keys, 'values':values,
+                                        'time':time})
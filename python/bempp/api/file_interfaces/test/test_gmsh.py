@@ -0,0 +1,151 @@
+"""Test cases for the Gmsh interface."""
+
+from unittest import TestCase
+import bempp.api
+
+
+class TestGmsh(TestCase):
+    """Test class for writing Gmsh files."""
+
+    def setUp(self):
+        import tempfile
+        import numpy as np
+
+        self._grid = bempp.api.shapes.regular_sphere(3)
+        space = bempp.api.function_space(self._grid, "P", 1)
+        self._grid_fun = bempp.api.GridFunction(
+            space, coefficients=np.random.rand(space.global_dof_count))
+        self._tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self._tmp_dir)
+
+    def test_export_and_import_ascii_grid(self):
+        import os
+        import numpy as np
+
+        file_name = os.path.join(self._tmp_dir, 'grid.msh')
+        bempp.api.export(grid=self._grid, file_name=file_name)
+        grid = bempp.api.import_grid(file_name)
+
+        self.assertEqual(grid.leaf_view.entity_count(0), self._grid.leaf_view.entity_count(0))
+        self.assertEqual(grid.leaf_view.entity_count(2), self._grid.leaf_view.entity_count(2))
+        self.assertAlmostEqual(np.linalg.norm(np.sort(grid.leaf_view.vertices, axis=1) -
+                                              np.sort(self._grid.leaf_view.vertices, axis=1)), 0)
+
+    def test_export_and_import_binary_grid(self):
+        import os
+        import numpy as np
+        from bempp.api.file_interfaces import FileReader
+
+        file_name = os.path.join(self._tmp_dir, 'grid.msh')
+        bempp.api.export(grid=self._grid, file_name=file_name, binary=True)
+        reader = FileReader(file_name=file_name)
+        grid = reader.grid
+
+        self.assertEqual(grid.leaf_view.entity_count(0), self._grid.leaf_view.entity_count(0))
+
+        # Vertex keys written by export are the BEM++ indices plus one
+        keys = reader.vertex_index_to_file_key_map
+        self.assertAlmostEqual(np.linalg.norm(
+            grid.leaf_view.vertices - self._grid.leaf_view.vertices[:, keys - 1]), 0)
+        self.assertTrue(np.all(reader.vertex_file_key_to_index_map[keys] ==
+                               np.arange(len(keys))))
+
+        # Keys outside of the range of file keys are not found
+        key_map = reader.element_file_key_to_index_map
+        self.assertEqual(key_map[np.max(reader.element_index_to_file_key_map) + 1], -1)
+        self.assertEqual(key_map[-1], -1)
+        self.assertTrue(np.all(key_map[np.array([0, 10 ** 9])] == -1))
+        self.assertNotIn(10 ** 9, key_map)
+
+    def test_key_map_with_sparse_keys(self):
+        import numpy as np
+        from bempp.api.file_interfaces.general_interface import FileKeyToIndexMap
+
+        key_map = FileKeyToIndexMap(np.array([7 * 10 ** 12, 3, 10 ** 6]))
+
+        self.assertEqual(key_map[3], 1)
+        self.assertTrue(np.all(key_map[np.array([10 ** 6, 7 * 10 ** 12, 4, -3, 10 ** 13])] ==
+                               np.array([2, 0, -1, -1, -1])))
+        self.assertEqual(len(key_map), 3)
+
+    def test_import_version_4_1(self):
+        import os
+        import numpy as np
+        from bempp.api.file_interfaces import FileReader
+
+        content = '\n'.join([
+            '$MeshFormat', '4.1 0 8', '$EndMeshFormat',
+            '$Entities', '0 0 1 0', '7 0 0 0 1 1 0 1 5 0', '$EndEntities',
+            '$Nodes', '1 4 1 4', '2 7 0 4', '1', '2', '3', '4',
+            '0 0 0', '1 0 0', '1 1 0', '0 1 0', '$EndNodes',
+            '$Elements', '1 2 1 2', '2 7 2 2', '10 1 2 3', '11 1 3 4', '$EndElements', ''])
+        file_name = os.path.join(self._tmp_dir, 'grid41.msh')
+        with open(file_name, 'w') as f:
+            f.write(content)
+
+        reader = FileReader(file_name=file_name)
+        grid = reader.grid
+
+        self.assertEqual(grid.leaf_view.entity_count(0), 2)
+        self.assertEqual(grid.leaf_view.entity_count(2), 4)
+        self.assertEqual(sorted(reader.element_index_to_file_key_map), [10, 11])
+        self.assertTrue(np.all(grid.leaf_view.domain_indices == 5))
+
+    def test_export_binary_grid_function(self):
+        import os
+
+        for data_type in ['node', 'element', 'element_node']:
+            file_name = os.path.join(self._tmp_dir, data_type + '.msh')
+            bempp.api.export(grid_function=self._grid_fun, file_name=file_name,
+                             data_type=data_type, binary=True)
+            with open(file_name, 'rb') as f:
+                self.assertEqual(f.readline(), b'$MeshFormat\n')
+                self.assertEqual(f.readline(), b'2.2 1 8\n')
+
+    def test_ascii_element_node_data_agrees_with_evaluation(self):
+        import os
+        import numpy as np
+
+        file_name = os.path.join(self._tmp_dir, 'data.msh')
+        bempp.api.export(grid_function=self._grid_fun, file_name=file_name,
+                         data_type='element_node')
+
+        with open(file_name) as f:
+            lines = f.read().split('\n')
+        start = lines.index('$ElementNodeData') + 10
+        first_entry = [float(val) for val in lines[start].split()]
+
+        expected = self._grid_fun.evaluate_all(np.array([[0, 1, 0], [0, 0, 1]]))[0, 0, :]
+        self.assertEqual(first_entry[:2], [1, 3])
+        self.assertAlmostEqual(np.linalg.norm(np.array(first_entry[2:]) - expected), 0)
+
+    def test_transformation_is_applied_per_element(self):
+        import os
+        import numpy as np
+
+        shapes = {}
+
+        def transformation(values):
+            shapes.setdefault(data_type, set()).add(values.shape)
+            return 2 * values
+
+        for data_type in ['element', 'element_node']:
+            per_element = os.path.join(self._tmp_dir, data_type + '_per_element.msh')
+            bempp.api.export(grid_function=self._grid_fun, file_name=per_element,
+                             data_type=data_type, transformation=transformation)
+            array = os.path.join(self._tmp_dir, data_type + '_array.msh')
+            bempp.api.export(grid_function=self._grid_fun, file_name=array,
+                             data_type=data_type, array_transformation=lambda x: 2 * x)
+            with open(per_element) as f1, open(array) as f2:
+                self.assertEqual(f1.read(), f2.read())
+
+        self.assertEqual(shapes, {'element': set([(1,)]), 'element_node': set([(1, 3)])})
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -0,0 +1,73 @@
+"""Test cases for the VTK interface."""
+
+from unittest import TestCase
+import bempp.api
+
+
+class TestVtk(TestCase):
+    """Test class for writing VTK unstructured grid files."""
+
+    def setUp(self):
+        import tempfile
+        import numpy as np
+
+        self._grid = bempp.api.shapes.regular_sphere(2)
+        space = bempp.api.function_space(self._grid, "P", 1)
+        self._grid_funs = [bempp.api.GridFunction(
+            space, coefficients=np.random.rand(space.global_dof_count)) for _ in range(2)]
+        self._tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self._tmp_dir)
+
+    def _read_appended_arrays(self, file_name):
+        """Return a dictionary from array names to the raw bytes of the arrays."""
+        import re
+        import numpy as np
+
+        with open(file_name, 'rb') as f:
+            content = f.read()
+        start = content.index(b'<AppendedData encoding="raw">\n_') + 31
+        arrays = {}
+        for name, offset in re.findall(b'<DataArray type="[^"]*"(?: Name="([^"]*)")? ' +
+                                       b'NumberOfComponents="[0-9]*" format="appended" ' +
+                                       b'offset="([0-9]*)"', content):
+            position = start + int(offset)
+            nbytes = np.frombuffer(content, dtype='<u8', count=1, offset=position)[0]
+            arrays[name.decode('ascii')] = content[position + 8:position + 8 + nbytes]
+        return arrays
+
+    def test_export_grid(self):
+        import os
+        import numpy as np
+
+        file_name = os.path.join(self._tmp_dir, 'grid.vtu')
+        bempp.api.export(grid=self._grid, file_name=file_name)
+        arrays = self._read_appended_arrays(file_name)
+
+        vertices = np.frombuffer(arrays[''], dtype='<f8').reshape(-1, 3).T
+        connectivity = np.frombuffer(arrays['connectivity'], dtype='<i8').reshape(-1, 3).T
+
+        self.assertAlmostEqual(np.linalg.norm(vertices - self._grid.leaf_view.vertices), 0)
+        self.assertTrue(np.all(connectivity == self._grid.leaf_view.elements))
+
+    def test_export_series_of_grid_functions(self):
+        import os
+        import numpy as np
+
+        file_name = os.path.join(self._tmp_dir, 'series.vtu')
+        bempp.api.export(grid_function=self._grid_funs, file_name=file_name,
+                         label='u', transformation=lambda x: 1j * x)
+        arrays = self._read_appended_arrays(file_name)
+
+        self.assertEqual(sorted(arrays.keys()),
+                         ['', 'connectivity', 'domain_index', 'offsets', 'types',
+                          'u_0.imag', 'u_0.real', 'u_1.imag', 'u_1.real'])
+        self.assertEqual(np.max(np.abs(np.frombuffer(arrays['u_1.real'], dtype='<f8'))), 0)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
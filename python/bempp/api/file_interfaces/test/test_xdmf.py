@@ -0,0 +1,61 @@
+"""Test cases for the XDMF interface."""
+
+from unittest import TestCase
+import bempp.api
+
+
+class TestXdmf(TestCase):
+    """Test class for writing XDMF files."""
+
+    def setUp(self):
+        import tempfile
+        import numpy as np
+
+        try:
+            import h5py
+        except ImportError:
+            self.skipTest("h5py is not available.")
+
+        self._grid = bempp.api.shapes.regular_sphere(2)
+        space = bempp.api.function_space(self._grid, "P", 1)
+        self._grid_funs = [bempp.api.GridFunction(
+            space, coefficients=np.random.rand(space.global_dof_count)) for _ in range(3)]
+        self._tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self._tmp_dir)
+
+    def test_append_does_not_rewrite_grid(self):
+        import os
+        import h5py
+        import numpy as np
+
+        file_name = os.path.join(self._tmp_dir, 'sweep.xdmf')
+        bempp.api.export(grid_function=self._grid_funs[:2], time_values=[1.0, 2.0],
+                         file_name=file_name)
+
+        with h5py.File(os.path.join(self._tmp_dir, 'sweep.h5'), 'r') as h5_file:
+            geometry_id = h5_file['mesh/geometry'].id.get_offset()
+
+        bempp.api.export(grid_function=self._grid_funs[2], time_values=[3.0],
+                         file_name=file_name, append=True)
+
+        with h5py.File(os.path.join(self._tmp_dir, 'sweep.h5'), 'r') as h5_file:
+            self.assertEqual(h5_file['mesh/geometry'].id.get_offset(), geometry_id)
+            self.assertEqual(len(h5_file['steps']), 3)
+            expected = self._grid_funs[2].evaluate_all(np.array([[0, 1, 0], [0, 0, 1]]))
+            node_values = h5_file['steps/2/real'][:, 0]
+            elements = self._grid.leaf_view.elements
+            self.assertAlmostEqual(np.linalg.norm(node_values[elements[0]] - expected[0, :, 0]), 0)
+
+        with open(file_name) as f:
+            content = f.read()
+        self.assertEqual(content.count('<Time Value='), 3)
+        self.assertIn('<Time Value="3.0"/>', content)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
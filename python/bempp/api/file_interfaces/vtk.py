@@ -0,0 +1,134 @@
+"""Export of grids and grid functions into VTK unstructured grid (.vtu) files."""
+
+import numpy as np
+from .general_interface import FileInterfaceImpl, _key_positions
+
+# VTK cell type of linear triangles
+_VTK_TRIANGLE = 5
+
+_VTK_TYPES = {'float64': 'Float64', 'int32': 'Int32', 'int64': 'Int64', 'uint8': 'UInt8'}
+
+
+def _real_arrays(label, values):
+    """Return a list of (name, values) pairs with the real data to write.
+
+    Complex data is split into real and imaginary parts.
+
+    """
+    if np.iscomplexobj(values):
+        return [(label + '.real', np.real(values)), (label + '.imag', np.imag(values))]
+    return [(label, values)]
+
+
+class VtuInterface(FileInterfaceImpl):
+    """Write grids and grid functions as VTK XML unstructured grids.
+
+    All arrays are stored as raw little endian binary data in the
+    appended data section of the file.
+
+    """
+
+    def __init__(self):
+
+        super(VtuInterface, self).__init__()
+        self._grid_arrays = None
+        self._point_data = []
+        self._cell_data = []
+
+    @property
+    def index_offset(self):
+        return 0
+
+    @property
+    def default_data_type(self):
+        return 'node'
+
+    def add_grid_arrays(self, vertex_keys, vertices, element_keys, elements, domain_indices):
+        self._grid_arrays = (np.asarray(vertex_keys), np.asarray(vertices),
+                             np.asarray(element_keys), np.asarray(elements),
+                             np.asarray(domain_indices))
+
+    def grid_arrays(self):
+        if self._grid_arrays is not None:
+            return self._grid_arrays
+        return super(VtuInterface, self).grid_arrays()
+
+    def _add_data(self, target, all_keys, data, label):
+        keys, values = data
+        ordered = np.zeros((values.shape[0], len(all_keys)), dtype=values.dtype)
+        ordered[:, _key_positions(np.asarray(all_keys), np.asarray(keys))] = values
+        target.append((label, ordered))
+
+    def add_node_data(self, data, label, time=0):
+        self._add_data(self._point_data, self.grid_arrays()[0], data, label)
+
+    def add_element_data(self, data, label, time=0):
+        self._add_data(self._cell_data, self.grid_arrays()[2], data, label)
+
+    def add_element_node_data(self, data, label, time=0):
+        raise ValueError("VTK files do not support element node data. " +
+                         "Use data_type='node' or data_type='element'.")
+
+    def write(self, file_name):
+
+        vertex_keys, vertices, element_keys, elements, domain_indices = self.grid_arrays()
+        n_vertices = len(vertex_keys)
+        n_elements = len(element_keys)
+
+        connectivity = _key_positions(vertex_keys, elements.T.ravel())
+
+        blocks = []
+
+        def data_array(name, values, components=1):
+            """Register a binary block and return its XML header."""
+            values = np.ascontiguousarray(values)
+            offset = sum(8 + block.nbytes for block in blocks)
+            blocks.append(values.astype(values.dtype.newbyteorder('<')))
+            name_attribute = '' if name is None else ' Name="{0}"'.format(name)
+            return ('<DataArray type="{0}"{1} NumberOfComponents="{2}" ' +
+                    'format="appended" offset="{3}"/>\n').format(
+                        _VTK_TYPES[values.dtype.name], name_attribute, components, offset)
+
+        def data_arrays(arrays):
+            # Number the arrays of a series, e.g. 'label_0', 'label_1', ...
+            labels = [label for label, _ in arrays]
+            headers = []
+            for step, (label, values) in enumerate(arrays):
+                if labels.count(label) > 1:
+                    label = "{0}_{1}".format(label, labels[:step].count(label))
+                for name, real_values in _real_arrays(label, values):
+                    headers.append(data_array(name, real_values.astype('float64').T,
+                                              real_values.shape[0]))
+            return ''.join(headers)
+
+        xml = ''.join([
+            '<?xml version="1.0"?>\n',
+            '<VTKFile type="UnstructuredGrid" version="1.0" byte_order="LittleEndian" ',
+            'header_type="UInt64">\n',
+            '<UnstructuredGrid>\n',
+            '<Piece NumberOfPoints="{0}" NumberOfCells="{1}">\n'.format(n_vertices, n_elements),
+            '<Points>\n',
+            data_array(None, vertices.T.astype('float64'), 3),
+            '</Points>\n',
+            '<Cells>\n',
+            data_array('connectivity', connectivity.astype('int64')),
+            data_array('offsets', 3 * np.arange(1, n_elements + 1, dtype='int64')),
+            data_array('types', _VTK_TRIANGLE * np.ones(n_elements, dtype='uint8')),
+            '</Cells>\n',
+            '<PointData>\n',
+            data_arrays(self._point_data),
+            '</PointData>\n',
+            '<CellData>\n',
+            data_array('domain_index', domain_indices.astype('int32')),
+            data_arrays(self._cell_data),
+            '</CellData>\n',
+            '</Piece>\n',
+            '</UnstructuredGrid>\n',
+            '<AppendedData encoding="raw">\n_'])
+
+        with open(file_name, 'wb') as f:
+            f.write(xml.encode('ascii'))
+            for block in blocks:
+                f.write(np.array([block.nbytes], dtype='<u8').tobytes())
+                f.write(block.tobytes())
+            f.write('\n</AppendedData>\n</VTKFile>\n'.encode('ascii'))
@@ -0,0 +1,169 @@
+"""Export of grids and grid functions into XDMF files with HDF5 heavy data."""
+
+import numpy as np
+from .general_interface import FileInterfaceImpl, _key_positions
+
+
+def _data_item(h5_name, path, shape, number_type):
+    """Return an XDMF DataItem that references an HDF5 dataset."""
+    precision = 4 if number_type == 'Int' else 8
+    return ('<DataItem Dimensions="{0}" NumberType="{1}" Precision="{2}" ' +
+            'Format="HDF">{3}:{4}</DataItem>\n').format(
+                ' '.join(str(n) for n in shape), number_type, precision, h5_name, path)
+
+
+def _attribute_type(components):
+    return {1: 'Scalar', 3: 'Vector'}.get(components, 'Matrix')
+
+
+class XdmfInterface(FileInterfaceImpl):
+    """Write grids and grid functions as XDMF files.
+
+    The heavy data is stored in an HDF5 file with the same name as the
+    XDMF file and extension .h5. Grid functions are stored as steps of
+    a temporal collection that all reference the same grid. In append
+    mode new steps are added to an existing file without rewriting the grid.
+
+    """
+
+    def __init__(self, append=False):
+
+        super(XdmfInterface, self).__init__()
+        self._append = append
+        self._grid_arrays = None
+        self._steps = []
+
+    @property
+    def index_offset(self):
+        return 0
+
+    @property
+    def default_data_type(self):
+        return 'node'
+
+    def add_grid_arrays(self, vertex_keys, vertices, element_keys, elements, domain_indices):
+        self._grid_arrays = (np.asarray(vertex_keys), np.asarray(vertices),
+                             np.asarray(element_keys), np.asarray(elements),
+                             np.asarray(domain_indices))
+
+    def grid_arrays(self):
+        if self._grid_arrays is not None:
+            return self._grid_arrays
+        return super(XdmfInterface, self).grid_arrays()
+
+    def _add_data(self, all_keys, data, label, time, center):
+        keys, values = data
+        ordered = np.zeros((values.shape[0], len(all_keys)), dtype=values.dtype)
+        ordered[:, _key_positions(np.asarray(all_keys), np.asarray(keys))] = values
+        self._steps.append((label, time, center, ordered))
+
+    def add_node_data(self, data, label, time=0):
+        self._add_data(self.grid_arrays()[0], data, label, time, 'Node')
+
+    def add_element_data(self, data, label, time=0):
+        self._add_data(self.grid_arrays()[2], data, label, time, 'Cell')
+
+    def add_element_node_data(self, data, label, time=0):
+        raise ValueError("XDMF files do not support element node data. " +
+                         "Use data_type='node' or data_type='element'.")
+
+    def _write_mesh(self, h5_file):
+        """Write the grid into the HDF5 file or check that it matches the stored grid."""
+
+        vertex_keys, vertices, element_keys, elements, domain_indices = self.grid_arrays()
+        topology = _key_positions(vertex_keys, elements.T.ravel()).reshape(-1, 3)
+
+        if 'mesh' in h5_file:
+            mesh = h5_file['mesh']
+            if (mesh['geometry'].shape != (len(vertex_keys), 3) or
+                    mesh['topology'].shape != topology.shape):
+                raise ValueError("The grid does not match the grid stored in the file.")
+            return
+
+        mesh = h5_file.create_group('mesh')
+        mesh.create_dataset('geometry', data=vertices.T.astype('float64'))
+        mesh.create_dataset('topology', data=topology.astype('int32'))
+        mesh.create_dataset('domain_index', data=domain_indices.astype('int32'))
+
+    def write(self, file_name):
+        import os
+
+        try:
+            import h5py
+        except ImportError:
+            raise ImportError("XDMF export requires the h5py module.")
+
+        h5_file_name = os.path.splitext(file_name)[0] + '.h5'
+        mode = 'a' if self._append and os.path.isfile(h5_file_name) else 'w'
+
+        with h5py.File(h5_file_name, mode) as h5_file:
+            self._write_mesh(h5_file)
+            steps = h5_file.require_group('steps')
+            for label, time, center, values in self._steps:
+                step = steps.create_group(str(len(steps)))
+                step.attrs['time'] = float(time)
+                step.attrs['label'] = np.bytes_(label)
+                step.attrs['center'] = np.bytes_(center)
+                if np.iscomplexobj(values):
+                    step.create_dataset('real', data=np.real(values).T)
+                    step.create_dataset('imag', data=np.imag(values).T)
+                else:
+                    step.create_dataset('real', data=values.T.astype('float64'))
+            xml = self._xml(h5_file, os.path.basename(h5_file_name))
+
+        with open(file_name, 'w') as f:
+            f.write(xml)
+
+    def _xml(self, h5_file, h5_name):
+        """Create the XML description of the content of the HDF5 file."""
+
+        mesh = h5_file['mesh']
+        geometry_shape = mesh['geometry'].shape
+        topology_shape = mesh['topology'].shape
+
+        mesh_xml = ''.join([
+            '<Topology TopologyType="Triangle" NumberOfElements="{0}">\n'.format(
+                topology_shape[0]),
+            _data_item(h5_name, '/mesh/topology', topology_shape, 'Int'),
+            '</Topology>\n',
+            '<Geometry GeometryType="XYZ">\n',
+            _data_item(h5_name, '/mesh/geometry', geometry_shape, 'Float'),
+            '</Geometry>\n',
+            '<Attribute Name="domain_index" AttributeType="Scalar" Center="Cell">\n',
+            _data_item(h5_name, '/mesh/domain_index', (topology_shape[0],), 'Int'),
+            '</Attribute>\n'])
+
+        steps = h5_file['steps']
+        grids = []
+        for index in range(len(steps)):
+            step = steps[str(index)]
+            label = step.attrs['label'].decode('ascii')
+            center = step.attrs['center'].decode('ascii')
+            attributes = []
+            for part in ['real', 'imag']:
+                if part not in step:
+                    continue
+                shape = step[part].shape
+                name = label if 'imag' not in step else label + '.' + part
+                attributes.append(''.join([
+                    '<Attribute Name="{0}" AttributeType="{1}" Center="{2}">\n'.format(
+                        name, _attribute_type(shape[1]), center),
+                    _data_item(h5_name, '/steps/{0}/{1}'.format(index, part), shape, 'Float'),
+                    '</Attribute>\n']))
+            grids.append(''.join([
+                '<Grid Name="step_{0}" GridType="Uniform">\n'.format(index),
+                '<Time Value="{0!r}"/>\n'.format(float(step.attrs['time'])),
+                mesh_xml] + attributes + ['</Grid>\n']))
+
+        if len(grids) == 0:
+            body = '<Grid Name="mesh" GridType="Uniform">\n' + mesh_xml + '</Grid>\n'
+        else:
+            body = ''.join(['<Grid Name="series" GridType="Collection" CollectionType="Temporal">\n'] +
+                           grids + ['</Grid>\n'])
+
+        return ''.join(['<?xml version="1.0"?>\n',
+                        '<Xdmf Version="3.0">\n',
+                        '<Domain>\n',
+                        body,
+                        '</Domain>\n',
+                        '</Xdmf>\n'])
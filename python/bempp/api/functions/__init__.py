@@ -0,0 +1,10 @@
+"""Built-in analytic functions with native implementations."""
+
+__all__ = ['AnalyticFunction', 'plane_wave', 'point_source',
+           'maxwell_plane_wave_trace', 'polynomial']
+
+from .analytic_functions import AnalyticFunction
+from .analytic_functions import plane_wave
+from .analytic_functions import point_source
+from .analytic_functions import maxwell_plane_wave_trace
+from .analytic_functions import polynomial
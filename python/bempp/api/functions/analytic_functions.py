@@ -0,0 +1,207 @@
+"""Built-in analytic functions that are projected in native code.
+
+The functions in this module return :class:`AnalyticFunction` objects. They
+can be passed as ``fun`` argument to :class:`bempp.api.GridFunction`, in
+which case the projection onto the dual space is computed in parallel in
+C++ without calling back into Python. The objects are also Python callables
+with the usual signature ``fun(x, n, domain_index, result)`` so that they
+can be used wherever a Python callable is expected.
+
+"""
+
+import numpy as _np
+
+
+def _complex_parts(value):
+    """Return real and imaginary part of a scalar as a list."""
+    value = complex(value)
+    return [value.real, value.imag]
+
+
+def _unit_vector(vector, name):
+    """Return a vector of length three normalized to unit length."""
+    vector = _np.asarray(vector, dtype='float64').ravel()
+    if vector.shape != (3,):
+        raise ValueError("'{0}' must be a vector of length 3.".format(name))
+    norm = _np.linalg.norm(vector)
+    if norm == 0:
+        raise ValueError("'{0}' must not be the zero vector.".format(name))
+    return vector / norm
+
+
+class AnalyticFunction(object):
+    """An analytic function with a native implementation.
+
+    Instances are created through the functions
+    :func:`plane_wave`, :func:`point_source`,
+    :func:`maxwell_plane_wave_trace` and :func:`polynomial`.
+
+    Attributes
+    ----------
+    name : string
+        The identifier of the native implementation.
+    component_count : int
+        The number of components of the function values.
+
+    """
+
+    def __init__(self, name, data, component_count, evaluator):
+
+        self._name = name
+        self._data = data
+        self._component_count = component_count
+        self._evaluator = evaluator
+
+    @property
+    def name(self):
+        """Return the identifier of the native implementation."""
+        return self._name
+
+    @property
+    def component_count(self):
+        """Return the number of components of the function values."""
+        return self._component_count
+
+    def __call__(self, x, n, domain_index, result):
+        """Evaluate the function at the point x with normal n."""
+        result[:] = self._evaluator(x, n)
+
+    def projections(self, space, parameters=None):
+        """Compute the projections onto the basis functions of a space.
+
+        Parameters
+        ----------
+        space : bempp.api.space.Space
+            The space onto whose basis functions the function
+            is projected.
+        parameters : bempp.api.ParameterList
+            The parameters used for the integration
+            (default bempp.api.global_parameters).
+
+        """
+        import bempp.api
+        from bempp.core.assembly.function_projector import calculate_analytic_projection
+
+        if parameters is None:
+            parameters = bempp.api.global_parameters
+
+        if space.codomain_dimension != self.component_count:
+            raise ValueError(
+                "The space has {0} components but the function has {1}.".format(
+                    space.codomain_dimension, self.component_count))
+
+        return calculate_analytic_projection(parameters, self._name, self._data,
+                                             space._impl)
+
+
+def plane_wave(wavenumber, direction, amplitude=1.0):
+    """Return the plane wave amplitude * exp(1j * k * <direction, x>).
+
+    Parameters
+    ----------
+    wavenumber : complex
+        The wavenumber k.
+    direction : np.ndarray
+        The direction of propagation. It is normalized to unit length.
+    amplitude : complex
+        The amplitude of the wave (default 1).
+
+    """
+    direction = _unit_vector(direction, 'direction')
+
+    def evaluator(x, n):
+        return amplitude * _np.exp(1j * wavenumber * _np.dot(direction, x))
+
+    data = _complex_parts(wavenumber) + list(direction) + _complex_parts(amplitude)
+    return AnalyticFunction('plane_wave', data, 1, evaluator)
+
+
+def point_source(wavenumber, source, amplitude=1.0):
+    """Return the field amplitude * exp(1j * k * r) / (4 * pi * r) of a point source.
+
+    Here r = |x - source|. A wavenumber of zero gives the Laplace
+    Green's function.
+
+    Parameters
+    ----------
+    wavenumber : complex
+        The wavenumber k.
+    source : np.ndarray
+        The location of the point source.
+    amplitude : complex
+        The amplitude of the source (default 1).
+
+    """
+    source = _np.asarray(source, dtype='float64').ravel()
+    if source.shape != (3,):
+        raise ValueError("'source' must be a vector of length 3.")
+
+    def evaluator(x, n):
+        dist = _np.linalg.norm(x - source)
+        return amplitude * _np.exp(1j * wavenumber * dist) / (4 * _np.pi * dist)
+
+    data = _complex_parts(wavenumber) + list(source) + _complex_parts(amplitude)
+    return AnalyticFunction('point_source', data, 1, evaluator)
+
+
+def maxwell_plane_wave_trace(wavenumber, direction, polarization):
+    """Return the tangential trace E x n of a Maxwell plane wave.
+
+    The plane wave is given by E = polarization * exp(1j * k * <direction, x>).
+
+    Parameters
+    ----------
+    wavenumber : complex
+        The wavenumber k.
+    direction : np.ndarray
+        The direction of propagation. It is normalized to unit length.
+    polarization : np.ndarray
+        The (possibly complex) polarization vector.
+
+    """
+    direction = _unit_vector(direction, 'direction')
+    polarization = _np.asarray(polarization, dtype='complex128').ravel()
+    if polarization.shape != (3,):
+        raise ValueError("'polarization' must be a vector of length 3.")
+
+    def evaluator(x, n):
+        field = polarization * _np.exp(1j * wavenumber * _np.dot(direction, x))
+        return _np.cross(field, n)
+
+    data = _complex_parts(wavenumber) + list(direction)
+    for component in polarization:
+        data += _complex_parts(component)
+    return AnalyticFunction('maxwell_plane_wave_trace', data, 3, evaluator)
+
+
+def polynomial(terms):
+    """Return a polynomial in the coordinates x, y, z.
+
+    Parameters
+    ----------
+    terms : dict
+        A dictionary that maps exponent tuples (a, b, c) to
+        coefficients. The polynomial is the sum of all terms
+        coefficient * x**a * y**b * z**c.
+
+    Examples
+    --------
+    The polynomial 2 * x * y + z**2 is created by
+
+    >>> polynomial({(1, 1, 0): 2, (0, 0, 2): 1})
+
+    """
+    terms = [(tuple(int(e) for e in exponents), coefficient)
+             for exponents, coefficient in terms.items()]
+    for exponents, _ in terms:
+        if len(exponents) != 3 or min(exponents) < 0:
+            raise ValueError("Exponents must be tuples of three non-negative integers.")
+
+    def evaluator(x, n):
+        return sum(coefficient * x[0]**a * x[1]**b * x[2]**c
+                   for (a, b, c), coefficient in terms)
+
+    data = [len(terms)]
+    for exponents, coefficient in terms:
+        data += list(exponents) + _complex_parts(coefficient)
+    return AnalyticFunction('polynomial', data, 1, evaluator)
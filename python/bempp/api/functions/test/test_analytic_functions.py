@@ -0,0 +1,51 @@
+"""Test cases for the built-in analytic functions."""
+
+from unittest import TestCase
+import bempp.api
+
+
+class TestAnalyticFunctions(TestCase):
+    """Compare native projections with projections of Python callables."""
+
+    def setUp(self):
+        grid = bempp.api.shapes.regular_sphere(3)
+        self._space = bempp.api.function_space(grid, "P", 1)
+        self._rt_space = bempp.api.function_space(grid, "RT", 0)
+
+    def _compare_with_python_callable(self, fun, space):
+        import numpy as np
+
+        def python_fun(x, n, domain_index, result):
+            fun(x, n, domain_index, result)
+
+        expected = bempp.api.GridFunction(space, fun=python_fun).projections()
+        actual = bempp.api.GridFunction(space, fun=fun).projections()
+
+        self.assertAlmostEqual(np.linalg.norm(actual - expected) / np.linalg.norm(expected), 0)
+
+    def test_plane_wave(self):
+        fun = bempp.api.functions.plane_wave(2.5, [1, 1, 0])
+        self._compare_with_python_callable(fun, self._space)
+
+    def test_point_source(self):
+        fun = bempp.api.functions.point_source(1.5, [0, 0, 3], amplitude=2j)
+        self._compare_with_python_callable(fun, self._space)
+
+    def test_polynomial(self):
+        fun = bempp.api.functions.polynomial({(1, 1, 0): 2, (0, 0, 2): 1})
+        self._compare_with_python_callable(fun, self._space)
+
+    def test_maxwell_plane_wave_trace(self):
+        fun = bempp.api.functions.maxwell_plane_wave_trace(2, [0, 0, 1], [1, 0, 0])
+        self._compare_with_python_callable(fun, self._rt_space)
+
+    def test_component_count_must_match_space(self):
+        fun = bempp.api.functions.plane_wave(1, [1, 0, 0])
+        with self.assertRaises(ValueError):
+            bempp.api.GridFunction(self._rt_space, fun=fun)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -26,6 +26,7 @@ class Grid(object):
 
     def __init__(self, impl):
         self._impl = impl
+        self._barycentric_grid = None
 
     def __eq__(self, other):
         return self._impl == other._impl
@@ -43,6 +44,14 @@ class Grid(object):
         """Return the element insertion index of the given element."""
         return self._impl.element_insertion_index(element._impl)
 
+    def vertex_insertion_indices(self):
+        """Return the insertion indices of all vertices in leaf view index order."""
+        return self._impl.vertex_insertion_indices()
+
+    def element_insertion_indices(self):
+        """Return the insertion indices of all elements in leaf view index order."""
+        return self._impl.element_insertion_indices()
+
     def element_from_insertion_index(self, index):
         """Return the element associated with a given insertion index."""
         return _Entity(0, self._impl.element_from_insertion_index(index))
@@ -65,11 +74,25 @@ class Grid(object):
 
     def refine(self):
         """Refine grid."""
+        from bempp.api.space.space import _reset_cached_spaces
+        self._barycentric_grid = None
         self._impl.refine()
+        _reset_cached_spaces(self)
 
     def barycentric_grid(self):
-        """Return a barycentrically refine grid."""
-        return Grid(self._impl.barycentric_grid())
+        """Return a barycentrically refined grid.
+
+        The refined grid is created once and reused by subsequent calls.
+
+        """
+        if self._barycentric_grid is None:
+            self._barycentric_grid = Grid(self._impl.barycentric_grid())
+        return self._barycentric_grid
+
+    @property
+    def unique_id(self):
+        """Return an integer that identifies the underlying grid while it is alive."""
+        return self._impl.unique_id
 
     @property
     def dim(self):
@@ -107,6 +130,36 @@ class Grid(object):
         """
         return self._impl.bounding_box
 
+    @property
+    def vertices(self):
+        """Return a (3 x n_vertices) array with the vertices of the leaf view."""
+        return self.leaf_view.vertices
+
+    @property
+    def elements(self):
+        """Return a (3 x n_elements) array with the elements of the leaf view."""
+        return self.leaf_view.elements
+
+    @property
+    def domain_indices(self):
+        """Return an array with the domain indices of the elements of the leaf view."""
+        return self.leaf_view.domain_indices
+
+    @property
+    def normals(self):
+        """Return a (3 x n_elements) array with the unit normals of the leaf view elements."""
+        return self.leaf_view.normals
+
+    @property
+    def areas(self):
+        """Return an array with the areas of the elements of the leaf view."""
+        return self.leaf_view.areas
+
+    @property
+    def centroids(self):
+        """Return a (3 x n_elements) array with the centroids of the leaf view elements."""
+        return self.leaf_view.centroids
+
     @property
     def leaf_view(self):
         """Return a view onto the grid."""
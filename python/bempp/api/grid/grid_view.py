@@ -44,10 +44,49 @@ class GridView(object):
 
     @property
     def domain_indices(self):
-        """Return a list of domain indices."""
+        """Return an array with the domain indices of the elements."""
         return self._impl.domain_indices
 
+    @property
+    def normals(self):
+        """Return a (3 x n_elements) array with the unit normals of the elements."""
+        return self._impl.normals
+
+    @property
+    def areas(self):
+        """Return an array with the areas of the elements."""
+        return self._impl.areas
 
+    @property
+    def centroids(self):
+        """Return a (3 x n_elements) array with the centroids of the elements."""
+        return self._impl.centroids
 
+    @property
+    def element_edges(self):
+        """Return a (3 x n_elements) array with the edge indices of the elements."""
+        return self._impl.element_edges
+
+    @property
+    def edges(self):
+        """Return a (2 x n_edges) array with the vertex indices of the edges."""
+        return self._impl.edges
+
+    @property
+    def edge_adjacency(self):
+        """Return a (2 x n_edges) array with the elements adjacent to each edge.
+
+        The second row is -1 for edges with only one adjacent element.
+
+        """
+        return self._impl.edge_adjacency
+
+    @property
+    def element_neighbors(self):
+        """Return a (3 x n_elements) array with the neighbors of the elements.
 
+        Entry (i, j) is the index of the element that shares the ith edge
+        of element j or -1 if there is no such element.
 
+        """
+        return self._impl.element_neighbors
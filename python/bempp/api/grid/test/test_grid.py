@@ -53,5 +53,41 @@ class TestGrid(unittest.TestCase):
         for vert in VERTICES.T:
             self.assertIn(vert, actual_vertices.T)
 
+    def test_geometry_arrays(self):
+        """Test the cached geometry arrays of the leaf view."""
+
+        from bempp.api import grid_from_element_data
+
+        leaf_view = grid_from_element_data(VERTICES, ELEMENTS).leaf_view
+
+        self.assertTrue(np.allclose(leaf_view.areas, [.5, .5]))
+        self.assertTrue(np.allclose(np.abs(leaf_view.normals[2]), 1))
+        self.assertTrue(np.allclose(np.sort(leaf_view.centroids[0]), [1. / 3, 2. / 3]))
+        self.assertIs(leaf_view.areas, leaf_view.areas)
+        self.assertFalse(leaf_view.vertices.flags.writeable)
+
+        # The two triangles share one edge and each has two boundary edges
+        adjacency = leaf_view.edge_adjacency
+        self.assertEqual(adjacency.shape, (2, 5))
+        self.assertEqual(np.sum(adjacency[1] >= 0), 1)
+        self.assertTrue(np.all(np.sort(leaf_view.element_neighbors, axis=0)[-1] ==
+                               [1, 0]))
+
+    def test_element_neighbors_of_closed_surface(self):
+        """Test that all elements of a closed surface have three neighbors."""
+
+        from bempp.api.shapes import regular_sphere
+
+        leaf_view = regular_sphere(2).leaf_view
+        neighbors = leaf_view.element_neighbors
+        self.assertTrue(np.all(neighbors >= 0))
+
+        # Neighboring elements share the two vertices of the common edge
+        for i in range(3):
+            shared = [len(set(leaf_view.elements[:, j]) &
+                          set(leaf_view.elements[:, neighbors[i, j]]))
+                      for j in range(leaf_view.entity_count(0))]
+            self.assertTrue(np.all(np.array(shared) == 2))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
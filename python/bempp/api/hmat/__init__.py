@@ -1,2 +1,3 @@
 from . import hmatrix_interface
-
+from .distributed import distributed_weak_form
+from .distributed import DistributedDiscreteBoundaryOperator
@@ -0,0 +1,172 @@
+"""Distribution of H-matrix assembly and matrix-vector products over MPI processes."""
+
+from scipy.sparse.linalg.interface import LinearOperator as _LinearOperator
+
+
+def _default_communicator():
+    """Return MPI.COMM_WORLD or raise an ImportError if mpi4py is not available."""
+    try:
+        from mpi4py import MPI
+    except ImportError:
+        raise ImportError("Distributed H-matrix assembly requires the mpi4py module.")
+    return MPI.COMM_WORLD
+
+
+class DistributedDiscreteBoundaryOperator(_LinearOperator):
+    """An H-matrix whose leaves are distributed over the processes of an MPI communicator.
+
+    Each process stores only the leaves of the block cluster tree that were
+    assigned to it. A matrix-vector product computes the contribution of the
+    local leaves and sums the contributions of all processes. The vector
+    must be the same on all processes and each process obtains the full
+    result. Adjoint and transpose products are distributed in the same way.
+
+    This class derives from :class:`scipy.sparse.linalg.interface.LinearOperator`
+    and thereby implements the SciPy LinearOperator protocol. Products must be
+    called collectively on all processes of the communicator.
+
+    """
+
+    def __init__(self, local_operator, comm, assembly_time):
+
+        super(DistributedDiscreteBoundaryOperator, self).__init__(
+            shape=local_operator.shape, dtype=local_operator.dtype)
+
+        self._local_operator = local_operator
+        self._comm = comm
+        self._timings = {'assembly': assembly_time,
+                         'matvec_compute': 0,
+                         'matvec_reduce': 0,
+                         'matvec_count': 0}
+
+    def _matvec(self, vec): # pylint: disable=method-hidden
+        """Implements matrix-vector product."""
+        return self._matmat(vec.reshape(-1, 1)).ravel()
+
+    def _matmat(self, mat): # pylint: disable=method-hidden
+        import time
+        import numpy as np
+
+        start_time = time.time()
+        local_result = np.ascontiguousarray(self._local_operator.matmat(mat),
+                                            dtype=np.result_type(self.dtype, mat.dtype))
+        compute_time = time.time()
+        result = np.empty_like(local_result)
+        self._comm.Allreduce(local_result, result)
+        end_time = time.time()
+
+        self._timings['matvec_compute'] += compute_time - start_time
+        self._timings['matvec_reduce'] += end_time - compute_time
+        self._timings['matvec_count'] += mat.shape[1]
+        return result
+
+    def _adjoint(self):
+        """Return the adjoint, which sums the adjoints of the local leaves."""
+        return DistributedDiscreteBoundaryOperator(
+            self._local_operator.adjoint(), self._comm, self._timings['assembly'])
+
+    def _transpose(self):
+        """Return the transpose, which sums the transposes of the local leaves."""
+        return DistributedDiscreteBoundaryOperator(
+            self._local_operator.transpose(), self._comm, self._timings['assembly'])
+
+    @property
+    def comm(self):
+        """Return the MPI communicator."""
+        return self._comm
+
+    @property
+    def local_operator(self):
+        """Return the discrete operator with the leaves stored on this process."""
+        return self._local_operator
+
+    @property
+    def timings(self):
+        """Return a dictionary with the timings in seconds on this process.
+
+        The keys are 'assembly', 'matvec_compute' (local products summed over
+        all products), 'matvec_reduce' (communication summed over all
+        products) and 'matvec_count' (number of vectors multiplied).
+
+        """
+        return dict(self._timings)
+
+    def gather_timings(self):
+        """Return a list with the timings of all processes.
+
+        This method must be called collectively on all processes.
+
+        """
+        return self._comm.allgather(self.timings)
+
+    def scaling_report(self):
+        """Return a string with the per-process timings of assembly and products.
+
+        This method must be called collectively on all processes. The
+        imbalance is the ratio of the maximum to the mean time over the
+        processes.
+
+        """
+        timings = self.gather_timings()
+        lines = ["{0:>6} {1:>12} {2:>16} {3:>16}".format(
+            'rank', 'assembly', 'matvec compute', 'matvec reduce')]
+        for rank, timing in enumerate(timings):
+            lines.append("{0:>6} {1:>12.4f} {2:>16.4f} {3:>16.4f}".format(
+                rank, timing['assembly'], timing['matvec_compute'], timing['matvec_reduce']))
+        for name in ['assembly', 'matvec_compute']:
+            times = [timing[name] for timing in timings]
+            mean = sum(times) / len(times)
+            imbalance = max(times) / mean if mean > 0 else 1
+            lines.append("{0} imbalance: {1:.2f}".format(name.replace('_', ' '), imbalance))
+        return '\n'.join(lines)
+
+
+def distributed_weak_form(operator, comm=None):
+    """Assemble the weak form of an operator as H-matrix distributed over MPI processes.
+
+    The leaves of the block cluster tree are split into parts with
+    approximately equal assembly cost, one per process, and each process
+    only compresses and stores its own part. This function must be called
+    collectively on all processes of the communicator, e.g. in a script
+    started with `mpirun -n 4 python script.py`. Coarsening is disabled
+    since it merges leaves that can belong to different processes.
+
+    Parameters
+    ----------
+    operator : bempp.api.assembly.ElementaryBoundaryOperator
+        The operator to assemble. It must support H-matrix assembly.
+    comm : mpi4py.MPI.Comm
+        The communicator (default is MPI.COMM_WORLD).
+
+    Returns
+    -------
+    weak_form : DistributedDiscreteBoundaryOperator
+        The distributed discrete operator.
+
+    Examples
+    --------
+    >>> slp = bempp.api.operators.boundary.laplace.single_layer(space, space, space)
+    >>> discrete_slp = bempp.api.hmat.distributed_weak_form(slp)
+    >>> result = discrete_slp * x
+    >>> print(discrete_slp.scaling_report())
+
+    """
+    import time
+    import bempp.api
+
+    if comm is None:
+        comm = _default_communicator()
+
+    parameters = operator.parameters.copy()
+    parameters.assembly.boundary_operator_assembly_type = 'hmat'
+    parameters.hmat.coarsening = False
+    parameters.hmat.leaf_partition_index = comm.rank
+    parameters.hmat.leaf_partition_count = comm.size
+
+    bempp.api.LOGGER.info(
+        "Assembling H-matrix part {0} of {1}.".format(comm.rank + 1, comm.size))
+    start_time = time.time()
+    local_operator = operator._impl.assemble_weak_form(parameters) # pylint: disable=protected-access
+    assembly_time = time.time() - start_time
+
+    return DistributedDiscreteBoundaryOperator(local_operator, comm, assembly_time)
@@ -51,7 +51,12 @@ def mem_size(discrete_operator):
     return mem_size_ext(discrete_operator._impl)
 
 def data_block(discrete_operator, block_cluster_tree_node):
-    """Return the data block associated with a block cluster tree node."""
+    """Return the data block associated with a leaf of the block cluster tree.
+
+    For the local operator of a distributed H-matrix None is returned
+    for the leaves that are stored by other processes.
+
+    """
 
     from bempp.api.assembly.discrete_boundary_operator import \
             GeneralNonlocalDiscreteBoundaryOperator
@@ -0,0 +1,127 @@
+"""Test cases for the distributed H-matrix assembly.
+
+Run with e.g. `mpirun -n 4 python -m unittest bempp.api.hmat.test.test_distributed`.
+With a single process the tests check the partitioned code path with one part.
+
+"""
+
+from unittest import TestCase
+import bempp.api
+
+try:
+    from mpi4py import MPI
+except ImportError:
+    MPI = None
+
+
+class TestDistributed(TestCase):
+    """Test class for distributed_weak_form."""
+
+    def setUp(self):
+        if MPI is None:
+            self.skipTest("mpi4py is not available.")
+        grid = bempp.api.shapes.regular_sphere(4)
+        self._space = bempp.api.function_space(grid, "DP", 0)
+        self._parameters = bempp.api.common.global_parameters()
+        self._parameters.assembly.boundary_operator_assembly_type = 'hmat'
+        self._parameters.hmat.coarsening = False
+
+    def _operator(self):
+        return bempp.api.operators.boundary.laplace.single_layer(
+            self._space, self._space, self._space, parameters=self._parameters)
+
+    def test_matvec_agrees_with_hmat(self):
+        import numpy as np
+
+        operator = self._operator()
+        distributed = bempp.api.hmat.distributed_weak_form(operator, MPI.COMM_WORLD)
+
+        rng = np.random.RandomState(0)
+        vec = rng.randn(self._space.global_dof_count)
+
+        actual = distributed * vec
+        expected = operator.weak_form() * vec
+
+        self.assertLess(np.linalg.norm(actual - expected) / np.linalg.norm(expected), 1E-12)
+
+    def test_adjoint_agrees_with_hmat(self):
+        import numpy as np
+
+        operator = self._operator()
+        distributed = bempp.api.hmat.distributed_weak_form(operator, MPI.COMM_WORLD)
+
+        rng = np.random.RandomState(0)
+        vec = rng.randn(self._space.global_dof_count)
+
+        for actual, expected in [(distributed.H * vec, operator.weak_form().H * vec),
+                                 (distributed.T * vec, operator.weak_form().T * vec)]:
+            self.assertLess(np.linalg.norm(actual - expected) / np.linalg.norm(expected), 1E-12)
+
+    def test_each_leaf_is_stored_by_one_process(self):
+        import numpy as np
+
+        distributed = bempp.api.hmat.distributed_weak_form(self._operator(), MPI.COMM_WORLD)
+        local_operator = distributed.local_operator
+        leaves = bempp.api.hmat.hmatrix_interface.block_cluster_tree(local_operator).leaf_nodes
+
+        stored = np.array([bempp.api.hmat.hmatrix_interface.data_block(local_operator, leaf) is not None
+                           for leaf in leaves], dtype='int32')
+        counts = np.empty_like(stored)
+        MPI.COMM_WORLD.Allreduce(stored, counts)
+        self.assertTrue(np.all(counts == 1))
+
+    def test_operator_parameters_are_not_modified(self):
+        bempp.api.hmat.distributed_weak_form(self._operator(), MPI.COMM_WORLD)
+
+        self.assertEqual(self._parameters.hmat.leaf_partition_index, 0)
+        self.assertEqual(self._parameters.hmat.leaf_partition_count, 1)
+
+    def test_invalid_partition_raises(self):
+        operator = self._operator()
+        self._parameters.hmat.leaf_partition_count = 2
+        self._parameters.hmat.leaf_partition_index = 2
+
+        with self.assertRaises(Exception):
+            operator.weak_form()
+
+    def test_scaling_report_lists_all_processes(self):
+        import numpy as np
+
+        distributed = bempp.api.hmat.distributed_weak_form(self._operator(), MPI.COMM_WORLD)
+        distributed * np.ones(self._space.global_dof_count)
+
+        report = distributed.scaling_report()
+        self.assertEqual(len(distributed.gather_timings()), MPI.COMM_WORLD.size)
+        self.assertIn('assembly imbalance', report)
+
+
+class TestLeafPartition(TestCase):
+    """Test the partition of the H-matrix leaves without MPI."""
+
+    def test_parts_sum_to_full_matvec(self):
+        import numpy as np
+
+        grid = bempp.api.shapes.regular_sphere(4)
+        space = bempp.api.function_space(grid, "DP", 0)
+        parameters = bempp.api.common.global_parameters()
+        parameters.assembly.boundary_operator_assembly_type = 'hmat'
+        parameters.hmat.coarsening = False
+
+        def weak_form(part_index, part_count):
+            part_parameters = parameters.copy()
+            part_parameters.hmat.leaf_partition_index = part_index
+            part_parameters.hmat.leaf_partition_count = part_count
+            return bempp.api.operators.boundary.laplace.single_layer(
+                space, space, space, parameters=part_parameters).weak_form()
+
+        vec = np.random.RandomState(0).randn(space.global_dof_count)
+        expected = weak_form(0, 1) * vec
+        actual = sum(weak_form(part, 4) * vec for part in range(4))
+
+        self.assertLess(np.linalg.norm(actual - expected) / np.linalg.norm(expected), 1E-12)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -82,19 +82,15 @@ def electric_field(space,
             test_local_ops.append(test_local_op)
             trial_local_ops.append(test_local_op.transpose(space))  # Range parameter arbitrary
 
-        term1 = CompoundBoundaryOperator(test_local_ops, kappa * slp, trial_local_ops, label=label+"_term1")
-
-        test_local_ops = []
-        trial_local_ops = []
-
         div_op = LocalBoundaryOperator(ElementaryAbstractLocalOperator(div_times_scalar_ext(slp.dual_to_range._impl, space._impl, space._impl)),
             label='DIV')
-        div_op_transpose = div_op.transpose(space) # Range space does not matter
-
-        term2 = CompoundBoundaryOperator([div_op], (1. / kappa) * slp,
-                                         [div_op_transpose], label=label+"_term2")
+        test_local_ops.append(div_op)
+        trial_local_ops.append(div_op.transpose(space)) # Range space does not matter
 
-        return term1 + term2
+        # A single compound operator so that slp is applied once per product.
+        return CompoundBoundaryOperator(test_local_ops, slp, trial_local_ops,
+                                        parameters=parameters, label=label,
+                                        multipliers=3 * [kappa] + [1. / kappa])
 
 
 def magnetic_field(space,
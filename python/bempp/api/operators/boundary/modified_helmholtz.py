@@ -218,11 +218,6 @@ def hypersingular(domain, range_, dual_to_range, wave_number,
             test_local_ops.append(test_local_op)
             trial_local_ops.append(test_local_op.transpose(range_))  # Range parameter arbitrary
 
-        term1 = CompoundBoundaryOperator(test_local_ops, slp, trial_local_ops, label=label + "_term1")
-
-        test_local_ops = []
-        trial_local_ops = []
-
         for index in range(3):
             # Definition of range_ does not matter in next operator
             test_local_op = LocalBoundaryOperator(ElementaryAbstractLocalOperator(
@@ -231,10 +226,10 @@ def hypersingular(domain, range_, dual_to_range, wave_number,
             test_local_ops.append(test_local_op)
             trial_local_ops.append(test_local_op.transpose(range_))  # Range parameter arbitrary
 
-        term2 = (wave_number * wave_number) * CompoundBoundaryOperator(test_local_ops, slp, trial_local_ops,
-                                                                       label=label + "_term2")
-
-        return term1 + term2
+        # A single compound operator so that slp is applied once per product.
+        return CompoundBoundaryOperator(test_local_ops, slp, trial_local_ops,
+                                        parameters=parameters, label=label,
+                                        multipliers=3 * [1] + 3 * [wave_number * wave_number])
 
 def multitrace_operator(grid, wave_number, parameters=None):
     """Return the modified Helmholtz multitrace operator.
@@ -30,6 +30,23 @@ class TestLaplace(TestCase):
 
         self.assertAlmostEqual(np.linalg.norm(mat1 - mat2) / np.linalg.norm(mat1), 0)
 
+    def test_blas_quadrature_agrees_with_scalar_quadrature(self):
+        from bempp.api.operators.boundary.laplace import hypersingular
+
+        for order in [1, 2]:
+            space = bempp.api.function_space(self._grid, "P", order)
+            matrices = []
+            for blas_in_quadrature in ['yes', 'no', 'auto']:
+                parameters = bempp.api.common.global_parameters()
+                parameters.assembly.boundary_operator_assembly_type = 'dense'
+                parameters.assembly.blas_in_quadrature = blas_in_quadrature
+                matrices.append(bempp.api.as_matrix(
+                    hypersingular(space, space, space, parameters=parameters).weak_form()))
+
+            self.assertAlmostEqual(
+                np.linalg.norm(matrices[0] - matrices[1]) / np.linalg.norm(matrices[1]), 0)
+            self.assertEqual(np.linalg.norm(matrices[2] - matrices[0]), 0)
+
     def test_dual_space_laplace_by_projection_is_correct(self):
 
         dual_const_space = bempp.api.function_space(self._grid, "DUAL", 0)
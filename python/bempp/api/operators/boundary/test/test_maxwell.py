@@ -4,6 +4,22 @@ import bempp
 WAVE_NUMBER = 1
 
 
+def _count_kernel_applications(slp):
+    """Replace the cached weak form of slp by a wrapper that counts its products."""
+    from scipy.sparse.linalg.interface import LinearOperator
+
+    weak_form = slp.weak_form()
+    calls = []
+
+    def matmat(mat):
+        calls.append(mat.shape[1])
+        return weak_form.matmat(mat)
+
+    slp._weak_form = LinearOperator(weak_form.shape, matvec=lambda x: matmat(x.reshape(-1, 1)),
+                                    matmat=matmat, dtype=weak_form.dtype)
+    return calls
+
+
 class TestMaxwell(TestCase):
     """Test cases for Maxwell operators."""
 
@@ -30,6 +46,42 @@ class TestMaxwell(TestCase):
 
         self.assertAlmostEqual(np.linalg.norm(mat1 - mat2) / np.linalg.norm(mat1), 0)
 
+    def test_compound_electric_field_applies_single_layer_once(self):
+        from bempp.api.operators.boundary.helmholtz import single_layer
+        from bempp.api.operators.boundary.maxwell import electric_field
+        import numpy as np
+
+        new_space = self._space.discontinuous_space
+        slp = single_layer(new_space, new_space, new_space, WAVE_NUMBER)
+        calls = _count_kernel_applications(slp)
+
+        efie = electric_field(self._space, WAVE_NUMBER, use_slp=slp).weak_form()
+        efie * np.ones(self._space.global_dof_count)
+
+        self.assertEqual(len(calls), 1)
+
+    def test_blas_quadrature_agrees_with_scalar_quadrature(self):
+        from bempp.api.operators.boundary.maxwell import electric_field, magnetic_field
+        import numpy as np
+
+        for operator in [electric_field, magnetic_field]:
+            for order in [1, 2]:
+                matrices = []
+                for blas_in_quadrature in ['yes', 'no', 'auto']:
+                    parameters = bempp.api.common.global_parameters()
+                    parameters.assembly.boundary_operator_assembly_type = 'dense'
+                    parameters.assembly.blas_in_quadrature = blas_in_quadrature
+                    for field in [parameters.quadrature.near, parameters.quadrature.medium,
+                                  parameters.quadrature.far]:
+                        field.double_order = order
+                    matrices.append(bempp.api.as_matrix(
+                        operator(self._space, WAVE_NUMBER, parameters=parameters).weak_form()))
+
+                self.assertAlmostEqual(
+                    np.linalg.norm(matrices[0] - matrices[1]) / np.linalg.norm(matrices[1]), 0)
+                # 'auto' takes the batched path for the order 1 Raviart-Thomas shapesets
+                self.assertEqual(np.linalg.norm(matrices[2] - matrices[0]), 0)
+
 
 if __name__ == "__main__":
     from unittest import main
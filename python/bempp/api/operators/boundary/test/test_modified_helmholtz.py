@@ -4,6 +4,23 @@ import numpy as np
 
 WAVE_NUMBER = -2j
 
+
+def _count_kernel_applications(slp):
+    """Replace the cached weak form of slp by a wrapper that counts its products."""
+    from scipy.sparse.linalg.interface import LinearOperator
+
+    weak_form = slp.weak_form()
+    calls = []
+
+    def matmat(mat):
+        calls.append(mat.shape[1])
+        return weak_form.matmat(mat)
+
+    slp._weak_form = LinearOperator(weak_form.shape, matvec=lambda x: matmat(x.reshape(-1, 1)),
+                                    matmat=matmat, dtype=weak_form.dtype)
+    return calls
+
+
 class TestModifiedHelmholtz(TestCase):
     """Test cases for modified Helmholtz operators."""
 
@@ -31,6 +48,21 @@ class TestModifiedHelmholtz(TestCase):
 
         self.assertAlmostEqual(np.linalg.norm(mat1 - mat2) / np.linalg.norm(mat1), 0)
 
+    def test_compound_hypersingular_applies_single_layer_once(self):
+        from bempp.api.operators.boundary.modified_helmholtz import hypersingular
+        from bempp.api.operators.boundary.modified_helmholtz import single_layer
+
+        discontinuous_space = self._lin_space.discontinuous_space
+        slp = single_layer(discontinuous_space, self._const_space, discontinuous_space,
+                           WAVE_NUMBER)
+        calls = _count_kernel_applications(slp)
+
+        operator = hypersingular(self._lin_space, self._const_space, self._lin_space,
+                                 WAVE_NUMBER, use_slp=slp).weak_form()
+        operator * np.ones((self._lin_space.global_dof_count, 2))
+
+        self.assertEqual(calls, [6 * 2])
+
     def test_calderon_single_layer_agrees_with_standard_single_layer(self):
 
         dual_const_space = bempp.api.function_space(self._grid, "DUAL", 0)
@@ -125,6 +157,24 @@ class TestModifiedHelmholtz(TestCase):
 
         self.assertAlmostEqual(diff_norm, 0, 4)
 
+    def test_blas_quadrature_agrees_with_scalar_quadrature(self):
+        from bempp.api.operators.boundary.modified_helmholtz import hypersingular
+
+        for order in [1, 2]:
+            space = bempp.api.function_space(self._grid, "P", order)
+            matrices = []
+            for blas_in_quadrature in ['yes', 'no', 'auto']:
+                parameters = bempp.api.common.global_parameters()
+                parameters.assembly.boundary_operator_assembly_type = 'dense'
+                parameters.assembly.blas_in_quadrature = blas_in_quadrature
+                matrices.append(bempp.api.as_matrix(
+                    hypersingular(space, space, space, WAVE_NUMBER,
+                                  parameters=parameters).weak_form()))
+
+            self.assertAlmostEqual(
+                np.linalg.norm(matrices[0] - matrices[1]) / np.linalg.norm(matrices[1]), 0)
+            self.assertEqual(np.linalg.norm(matrices[2] - matrices[0]), 0)
+
 
 if __name__ == "__main__":
     from unittest import main
@@ -19,6 +19,7 @@
 # THE SOFTWARE.
 
 import numpy as np
+import tempfile
 import bempp
 
 
@@ -40,27 +41,18 @@ def get_gmsh_file():
     return (geo_file, geo_name, msh_name)
 
 
-def __generate_grid_from_gmsh_string(gmsh_string):
-    """Return a grid from a string containing a gmsh mesh"""
-
-    import os
-    import tempfile
-
-    handle, fname = tempfile.mkstemp(
-        suffix='.msh', dir=bempp.api.TMP_PATH, text=True)
-    with os.fdopen(handle, "w") as f:
-        f.write(gmsh_string)
-    grid = bempp.api.import_grid(fname)
-    os.remove(fname)
-    return grid
-
-
 def __generate_grid_from_geo_string(geo_string):
     """Helper routine that implements the grid generation
+
+    Generated grids are cached in bempp.api.TMP_PATH under the hash of
+    the geometry description, so repeated calls with the same parameters
+    do not run Gmsh again.
+
     """
 
     import os
     import subprocess
+    import hashlib
 
     def msh_from_string(geo_string):
         gmsh_command = bempp.api.GMSH_PATH
@@ -71,23 +63,87 @@ def __generate_grid_from_geo_string(geo_string):
         f.close()
 
         fnull = open(os.devnull, 'w')
-        cmd = gmsh_command + " -2 " + geo_name
+        cmd = [gmsh_command, "-2", geo_name]
         try:
             subprocess.check_call(
-                cmd, shell=True, stdout=fnull, stderr=fnull)
+                cmd, stdout=fnull, stderr=fnull)
         except:
-            print("The following command failed: " + cmd)
+            print("The following command failed: " + " ".join(cmd))
             fnull.close()
             raise
         os.remove(geo_name)
         fnull.close()
         return msh_name
 
+    cache_name = os.path.join(
+        bempp.api.TMP_PATH,
+        'grid_' + hashlib.sha1(geo_string.encode('utf-8')).hexdigest() + '.npz')
+
+    if os.path.isfile(cache_name):
+        try:
+            with np.load(cache_name) as data:
+                return bempp.api.grid_from_element_data(
+                    data['vertices'], data['elements'], data['domain_indices'])
+        except (IOError, OSError, ValueError, KeyError):
+            bempp.api.LOGGER.warning("Ignoring corrupt grid cache file " + cache_name)
+
     msh_name = msh_from_string(geo_string)
     grid = bempp.api.import_grid(msh_name)
     os.remove(msh_name)
+
+    # Write to a temporary file first so that concurrent processes
+    # never read a partially written cache file.
+    handle, tmp_name = tempfile.mkstemp(suffix='.npz', dir=bempp.api.TMP_PATH)
+    with os.fdopen(handle, 'wb') as f:
+        np.savez(f, vertices=grid.leaf_view.vertices, elements=grid.leaf_view.elements,
+                 domain_indices=grid.leaf_view.domain_indices)
+    os.rename(tmp_name, cache_name)
+
     return grid
 
+
+def _cube_surface_mesh(n):
+    """Return (vertices, elements) of the surface of [-1, 1]^3.
+
+    Each face is divided into n x n squares, which are split into two
+    triangles. The elements are oriented with outward pointing normals.
+
+    """
+    t = np.linspace(-1, 1, n + 1)
+    u, v = np.meshgrid(t, t, indexing='ij')
+    index = np.arange((n + 1)**2).reshape(n + 1, n + 1)
+    corner00 = index[:-1, :-1].ravel()
+    corner10 = index[1:, :-1].ravel()
+    corner11 = index[1:, 1:].ravel()
+    corner01 = index[:-1, 1:].ravel()
+
+    # Counterclockwise in the (u, v) plane of the face
+    face_elements = np.hstack([np.vstack([corner00, corner10, corner11]),
+                               np.vstack([corner00, corner11, corner01])])
+
+    vertices = []
+    elements = []
+    offset = 0
+    for axis in range(3):
+        for sign in [-1, 1]:
+            points = np.zeros((3, (n + 1)**2))
+            points[axis] = sign
+            points[(axis + 1) % 3] = u.ravel()
+            points[(axis + 2) % 3] = v.ravel()
+            face = face_elements if sign > 0 else face_elements[[0, 2, 1]]
+            vertices.append(points)
+            elements.append(face + offset)
+            offset += points.shape[1]
+    vertices = np.hstack(vertices)
+    elements = np.hstack(elements)
+
+    # Merge the vertices that are shared by neighboring faces
+    lattice = np.round(.5 * n * (vertices + 1)).astype('int64')
+    keys = (lattice[0] * (n + 1) + lattice[1]) * (n + 1) + lattice[2]
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    return vertices[:, first], inverse.ravel()[elements]
+
+
 def regular_sphere(n):
     """Return a regular sphere."""
 
@@ -97,10 +153,34 @@ def regular_sphere(n):
     return Grid(grid_from_sphere(n))
 
 
-def ellipsoid(r1=1, r2=1, r3=1, origin=(0, 0, 0), h=0.1):
-    """Return an ellipsoid grid. """
-    import subprocess
-    import os
+def ellipsoid(r1=1, r2=1, r3=1, origin=(0, 0, 0), h=0.1, use_gmsh=True):
+    """Return an ellipsoid grid.
+
+    Parameters
+    ----------
+    r1, r2, r3 : float
+        The half axes in the x, y and z direction.
+    origin : tuple
+        The center of the ellipsoid.
+    h : float
+        The approximate element size.
+    use_gmsh : bool
+        If True (default) create an unstructured mesh with Gmsh.
+        Otherwise project a structured cube surface mesh onto the
+        ellipsoid without calling an external process. The structured
+        mesh has different elements than the Gmsh mesh.
+
+    """
+
+    if not use_gmsh:
+        n = max(1, int(np.ceil(.5 * np.pi * max(r1, r2, r3) / h)))
+        vertices, elements = _cube_surface_mesh(n)
+        # The equiangular map gives elements of similar size on the sphere
+        vertices = np.tan(.25 * np.pi * vertices)
+        vertices /= np.linalg.norm(vertices, axis=0)
+        vertices = (np.array([r1, r2, r3], dtype='float64')[:, np.newaxis] * vertices +
+                    np.array(origin, dtype='float64')[:, np.newaxis])
+        return bempp.api.grid_from_element_data(vertices, elements)
 
     sphere_stub = """
     Point(1) = {orig0,orig1,orig2,cl};
@@ -155,11 +235,37 @@ def ellipsoid(r1=1, r2=1, r3=1, origin=(0, 0, 0), h=0.1):
     return __generate_grid_from_geo_string(sphere_geometry)
 
 
-def sphere(r=1, origin=(0, 0, 0), h=0.1):
-    return ellipsoid(origin=origin, h=h)
+def sphere(r=1, origin=(0, 0, 0), h=0.1, use_gmsh=True):
+    """Return a sphere grid with radius r. See :func:`ellipsoid` for the parameters."""
+    return ellipsoid(r, r, r, origin=origin, h=h, use_gmsh=use_gmsh)
 
 
-def cube(length=1, origin=(0, 0, 0), h=0.1):
+def cube(length=1, origin=(0, 0, 0), h=0.1, use_gmsh=True):
+    """Return a cube grid.
+
+    Parameters
+    ----------
+    length : float
+        The side length of the cube.
+    origin : tuple
+        The corner of the cube with the smallest coordinates.
+    h : float
+        The approximate element size.
+    use_gmsh : bool
+        If True (default) create an unstructured mesh with Gmsh.
+        Otherwise create a structured mesh without calling an external
+        process. The structured mesh has different elements than the
+        Gmsh mesh.
+
+    """
+
+    if not use_gmsh:
+        n = max(1, int(np.ceil(length / h)))
+        vertices, elements = _cube_surface_mesh(n)
+        vertices = (.5 * length * (vertices + 1) +
+                    np.array(origin, dtype='float64')[:, np.newaxis])
+        return bempp.api.grid_from_element_data(vertices, elements)
+
     cube_stub = """
     Point(1) = {orig0,orig1,orig2,cl};
     Point(2) = {orig0+l,orig1,orig2,cl};
@@ -219,15397 +325,5 @@ def almond():
     Return a grid discretizing the Nasa almond shape.
 
     """
-    return __generate_grid_from_gmsh_string(_almond_mesh)
-
-
-_almond_mesh = """
-$MeshFormat
-2.2 0 8
-$EndMeshFormat
-$Nodes
-5128
-1 0.1459790021181107 0.0005871389876119792 0.0001957130007212982
-2 0.1446350067853928 0.001223520026542246 0.0004078400088474154
-3 0.1431739926338196 0.001906960038468242 0.0006356519879773259
-4 0.1415839940309525 0.002637750003486872 0.0008792509906925261
-5 0.1419879943132401 2.123960059905505e-19 0.001156229991465807
-6 0.141292005777359 0.001332690007984638 0.001226949971169233
-7 0.1398569941520691 0.004682010039687157 0.0004181799886282533
-8 0.1205049976706505 0.01149039994925261 0.003830119967460632
-9 0.1177750006318092 0.006360809784382582 0.005540459882467985
-10 0.136011004447937 0.002899759914726019 0.002270499942824244
-11 0.135576993227005 0.005351929925382137 0.001783980056643486
-12 0.130838006734848 0.007346579805016518 0.002448860090225935
-13 0.1295479983091354 6.81537991522627e-19 0.003710119985044003
-14 0.1307950019836426 0.002636840101331472 0.00340001005679369
-15 0.1231769993901253 0.01042350009083748 0.00347450003027916
-16 0.1280360072851181 0.002563710091635585 0.003936000168323517
-17 0.1198510006070137 0.004667410161346197 0.005324069876223803
-18 0.1290609985589981 0.005545329768210649 0.00336733995936811
-19 0.1334480047225952 0.002557849977165461 0.002874820027500391
-20 0.1341399997472763 0.004587590228766203 0.00240837992168963
-21 0.1320749968290329 0.004870919976383448 0.002834920072928071
-22 0.125790998339653 0.009379340335726738 0.003126450115814805
-23 0.126690000295639 0.007306700106710196 0.003513999981805682
-24 0.1240030005574226 0.004559630062431097 0.004533300176262856
-25 0.1220619976520538 0.005647509824484587 0.004782239906489849
-26 0.1209189966320992 0.008143319748342037 0.00460866978392005
-27 0.1242299973964691 0.00726898992434144 0.004070079885423183
-28 0.1250810027122498 0.002479070099070668 0.004499710164964199
-29 0.1263049989938736 0.00494092982262373 0.004034049808979034
-30 0.1221190020442009 0.002742710057646036 0.005041699856519699
-31 0.1196409985423088 0.002150869928300381 0.005536709912121296
-32 0.1177750006318092 1.089749969456321e-18 0.005932299885898829
-33 0.1398569941520691 0.003427470102906227 0.001142489956691861
-34 0.1398569941520691 2.968040101619962e-19 0.001615719986148179
-35 0.1398569941520691 0.001732429955154657 0.001508999965153635
-36 0.138156995177269 0.002688510110601783 0.001775569980964065
-37 0.1177750006318092 0.01258429978042841 0.004194770008325577
-38 0.1177750006318092 0.01506519969552755 0.003158230101689696
-39 0.1194830015301704 0.01414269953966141 0.003044419921934605
-40 0.1258170008659363 0.01279820036143064 0.001143089961260557
-41 0.1221079975366592 0.01356980018317699 0.002402809914201498
-42 0.1377879977226257 0.005951569881290197 0.0005315730231814086
-43 0.1377740055322647 0.004363290034234524 0.001454430050216615
-44 0.1332560032606125 0.006348739843815565 0.002116250107064843
-45 0.1308770030736923 0.0100143002346158 0.0008944440050981939
-46 0.1283459961414337 0.008354759775102139 0.002784919925034046
-47 0.1356070041656494 0.007292489986866713 0.0006513390108011663
-48 0.1332949995994568 0.008650409989058971 0.0007726229960098863
-49 0.1283800005912781 0.0113944998010993 0.001017719972878695
-50 0.1205129995942116 0.01569150015711784 0.00140149996150285
-51 0.1231940016150475 0.01422919984906912 0.001270900014787912
-52 0.1205149963498116 0.01624429970979691 0
-53 0.1177750006318092 0.01719049923121929 0.001535390038043261
-54 0.1177750006318092 0.003186620073392987 0.005836430005729198
-55 0.1177750006318092 0.009504949674010277 0.005015380214899778
-56 0.1152120009064674 0.01110769994556904 0.005170059856027365
-57 0.07360920310020447 0.005854669958353043 0.01210370007902384
-58 0.07855120301246643 0.007348570041358471 0.01140940003097057
-59 0.0761013999581337 0.005353330168873072 0.01182689983397722
-60 0.1146629974246025 0.008087689988315105 0.005858960095793009
-61 0.115557000041008 0.005124089773744345 0.006064279936254025
-62 0.1125620007514954 0.006267180200666189 0.006473570130765438
-63 0.1130390018224716 0.009568469598889351 0.005917599890381098
-64 0.08156280219554901 0.002565490081906319 0.01128599978983402
-65 0.09159749746322632 0.01435989979654551 0.008803900331258774
-66 0.0828889012336731 0.01697029918432236 0.00960887037217617
-67 0.07989820092916489 0.01693519949913025 0.01002870034426451
-68 0.07861500233411789 0.001827129977755249 0.01165109965950251
-69 0.07994040101766586 2.115159969711889e-18 0.01151440013200045
-70 0.0789652019739151 0.01067289989441633 0.01106049958616495
-71 0.0814765989780426 0.009108800441026688 0.01090519968420267
-72 0.09426140040159225 0.01812360063195229 0.007542020175606012
-73 0.08081989735364914 0.01975589990615845 0.009307810105383396
-74 0.08934620022773743 0.01528779976069927 0.008982320316135883
-75 0.1083460003137589 1.382070014463426e-18 0.007523620035499334
-76 0.09441179782152176 0.008996360003948212 0.009149120189249516
-77 0.09771890193223953 0.01702209934592247 0.007198739796876907
-78 0.09740900248289108 0.01957049965858459 0.006523489952087402
-79 0.08183430135250092 0.01422910019755363 0.01022959966212511
-80 0.08147899806499481 0.01176759973168373 0.01061690039932728
-81 0.09292220324277878 0.01598010025918484 0.008275790140032768
-82 0.08388320356607437 0.01225700043141842 0.01024159975349903
-83 0.09318219870328903 0.01185590028762817 0.008967489935457706
-84 0.09758669883012772 0.008299100212752819 0.008745459839701653
-85 0.09499520063400269 0.005734960082918406 0.009357980452477932
-86 0.1008619964122772 0.007652999833226204 0.008304299786686897
-87 0.09790199995040894 0.005344749893993139 0.008956920355558395
-88 0.1004199981689453 0.01015160046517849 0.00807156041264534
-89 0.09677570313215256 0.0112490002065897 0.008498609997332096
-90 0.09867569804191589 0.01447129994630814 0.00761824008077383
-91 0.09501910209655762 0.01482160016894341 0.008167180232703686
-92 0.1034109964966774 0.008962330408394337 0.00774070993065834
-93 0.1017699986696243 0.01456489972770214 0.007045490201562643
-94 0.1027790009975433 0.01143919955939054 0.007479600142687559
-95 0.1070899963378906 0.004788630176335573 0.00754904979839921
-96 0.1010940000414848 0.004657519981265068 0.008518540300428867
-97 0.07598350197076797 0.009061769582331181 0.01158639974892139
-98 0.07360920310020447 0.00292837992310524 0.01222109980881214
-99 0.1041010022163391 0.003135510021820664 0.008134219795465469
-100 0.08512409776449203 0.01776549965143204 0.009124130010604858
-101 0.08368030190467834 0.02059270069003105 0.008673559874296188
-102 0.07617779821157455 0.002378229983150959 0.01192689966410398
-103 0.08667249977588654 0.02023999951779842 0.008291530422866344
-104 0.08780390024185181 0.01767480000853539 0.008735040202736855
-105 0.08109410107135773 0.02222900092601776 0.008629250340163708
-106 0.08128619939088821 0.005810500122606754 0.01117969956248999
-107 0.07870610058307648 0.004185429774224758 0.01156990043818951
-108 0.07959330081939697 0.02451189979910851 0.008170640096068382
-109 0.08910650014877319 0.0198173001408577 0.007996199652552605
-110 0.1086869984865189 0.01343549974262714 0.005961619783192873
-111 0.07866139709949493 0.02163979969918728 0.009159790351986885
-112 0.1072359979152679 0.002435399917885661 0.007655439898371696
-113 0.1003570035099983 0.01658320054411888 0.006817180197685957
-114 0.100101999938488 0.01246370002627373 0.007759260013699532
-115 0.08418770134449005 0.0152252996340394 0.009747940115630627
-116 0.08677030354738235 0.01460300013422966 0.009489229880273342
-117 0.08993580192327499 0.01309460029006004 0.009269280359148979
-118 0.08477009832859039 0.004847459960728884 0.01080489996820688
-119 0.1122739985585213 0.01212240010499954 0.00553649989888072
-120 0.09361959993839264 0.002929080044850707 0.009705459699034691
-121 0.1119849979877472 0.01465809997171164 0.00488603999838233
-122 0.1090909987688065 0.0156955998390913 0.005231880117207766
-123 0.08626940101385117 1.974960093714511e-18 0.01075119990855455
-124 0.08486899733543396 0.002047500107437372 0.01089819986373186
-125 0.08745899796485901 0.002929650014266372 0.01054409984499216
-126 0.1060359999537468 0.01094590034335852 0.006988000124692917
-127 0.1047910004854202 0.01383879967033863 0.006643760018050671
-128 0.1146309971809387 1.186780013067593e-18 0.006460549775511026
-129 0.1142970025539398 0.002468730090186 0.006461539771407843
-130 0.1032740026712418 0.01769939996302128 0.00589981023222208
-131 0.07672259956598282 0.01627550087869167 0.01057459972798824
-132 0.07924660295248032 0.01400389987975359 0.01060259994119406
-133 0.07639169692993164 0.01286789961159229 0.01112610008567572
-134 0.09843099862337112 0.002544489922001958 0.009024379774928093
-135 0.09093510359525681 0.01760680042207241 0.008243010379374027
-136 0.07659979909658432 0.02525440044701099 0.0084181297570467
-137 0.07360920310020447 0.02320319972932339 0.009512510150671005
-138 0.1092690005898476 0.006366820074617863 0.007040690165013075
-139 0.1101450026035309 0.003181949956342578 0.007134309969842434
-140 0.1009149998426437 0.002092130016535521 0.008667130023241043
-141 0.1038779988884926 0.006213909946382046 0.007962710224092007
-142 0.07606910169124603 0.02102340012788773 0.009697410278022289
-143 0.07803229987621307 0.01906700059771538 0.009859840385615826
-144 0.0756084993481636 0.01887339912354946 0.01024060044437647
-145 0.09613849967718124 0.003326599951833487 0.00932942982763052
-146 0.1098409965634346 0.009499849751591682 0.006530529819428921
-147 0.07690659910440445 0.02318619936704636 0.009005050174891949
-148 0.1065870001912117 0.007857689633965492 0.007339990232139826
-149 0.07360920310020447 0.02035919949412346 0.0102105000987649
-150 0.07360920310020447 0.01748769916594028 0.01078560017049313
-151 0.09258860349655151 1.820489904584521e-18 0.009910300374031067
-152 0.09889910370111465 1.654499984653811e-18 0.009006660431623459
-153 0.09216450154781342 0.006234900094568729 0.009727519936859608
-154 0.08838470280170441 0.006721199955791235 0.01021530013531446
-155 0.09054230153560638 0.003051579929888248 0.01012740004807711
-156 0.09093110263347626 0.009681710042059422 0.009582109749317169
-157 0.08448260277509689 0.008376809768378735 0.01059310045093298
-158 0.08750779926776886 0.01090210024267435 0.009924129582941532
-159 0.07601939886808395 0.02837689965963364 0.007338370196521282
-160 0.09460639953613281 0.02789999917149544 0.002491920022293925
-161 0.09580189734697342 0.02589520066976547 0.003839429933577776
-162 0.0927995964884758 0.02640240080654621 0.004465760197490454
-163 0.08965060114860535 0.027768699452281 0.004515930078923702
-164 0.07937580347061157 0.03152310103178024 0.004857339896261692
-165 0.07926689833402634 0.02911989949643612 0.006330470088869333
-166 0.07662779837846756 0.03448859974741936 0.003080399939790368
-167 0.07779330015182495 0.03296079859137535 0.004201999865472317
-168 0.07360920310020447 0.03113470040261745 0.006526989862322807
-169 0.0763327032327652 0.03206820040941238 0.005306920036673546
-170 0.08453969657421112 0.02624469995498657 0.006600390188395977
-171 0.08110480010509491 0.02688989974558353 0.007000360172241926
-172 0.09150800108909607 0.02133809961378574 0.007112709805369377
-173 0.08854480087757111 0.02218309976160526 0.007394359912723303
-174 0.08763349801301956 0.02550549991428852 0.006276419851928949
-175 0.09075400233268738 0.02456980012357235 0.005998040083795786
-176 0.08557070046663284 0.02299249917268753 0.007664170116186142
-177 0.08258520066738129 0.0237635001540184 0.007921149954199791
-178 0.09466250240802765 0.02377660013735294 0.005432100035250187
-179 0.0944627970457077 0.02046719938516617 0.006822419818490744
-180 0.09709160029888153 0.02200689911842346 0.005655020009726286
-181 0.08649670332670212 0.0288442000746727 0.004724100232124329
-182 0.0886726975440979 0.03025360032916069 0.002702150028198957
-183 0.09755279868841171 0.02667300030589104 0.00238232989795506
-184 0.1004849970340729 0.02541290037333965 0.002269790042191744
-185 0.08280190080404282 0.02970900014042854 0.00516403978690505
-186 0.07692079991102219 0.03055479936301708 0.006085710134357214
-187 0.1157540008425713 0.01668659970164299 0.002892140066251159
-188 0.1148779988288879 0.01361619960516691 0.004538749810308218
-189 0.07852110266685486 0.02700489945709705 0.007439199835062027
-190 0.1149049997329712 0.01858679950237274 0.001660099951550364
-191 0.1134359985589981 0.01726749911904335 0.003349999897181988
-192 0.1102569997310638 0.01844549924135208 0.003739049891009927
-193 0.1091760024428368 0.02139919996261597 0.00191130000166595
-194 0.09828480333089828 0.02426790073513985 0.004135540220886469
-195 0.09951160103082657 0.02143719978630543 0.005314980167895555
-196 0.1071870028972626 0.0204003993421793 0.003626760095357895
-197 0.1076150014996529 0.01814839988946915 0.004663969855755568
-198 0.1062989979982376 0.02278020046651363 0.002034649951383471
-199 0.1003459990024567 0.01864789985120296 0.006215959787368774
-200 0.1061889976263046 0.01671439968049526 0.005571459885686636
-201 0.1051679998636246 0.01936580054461956 0.004786009900271893
-202 0.1023819968104362 0.02040250040590763 0.005052039865404367
-203 0.1034030020236969 0.02411999925971031 0.002154310001060367
-204 0.1014460027217865 0.02297599986195564 0.003940260037779808
-205 0.1043630018830299 0.02182050049304962 0.003704240079969168
-206 0.09757349640130997 0.02760479971766472 0
-207 0.1177750006318092 0.01779690012335777 0
-208 0.1034210026264191 0.0249623004347086 0
-209 0.1120420023798943 0.01999549940228462 0.001785930013284087
-210 0.09164629876613617 0.02909360080957413 0.002598539926111698
-211 0.08568160235881805 0.0313681997358799 0.002801700029522181
-212 0.08569779992103577 0.03246879950165749 0
-213 0.08267179876565933 0.03243149816989899 0.002896670019254088
-214 0.08268439769744873 0.03357100114226341 0
-215 0.07965970039367676 0.03464179858565331 0
-216 0.07965130358934402 0.03346430137753487 0.002988910069689155
-217 0.07663190364837646 0.03570380061864853 0
-218 0.02944369986653328 0.02727239951491356 0.01271000038832426
-219 0.03182090073823929 0.02820540033280849 0.01232129987329245
-220 0.03273690119385719 0.009054849855601788 0.01515179965645075
-221 0.07120350003242493 0.02460060082376003 0.009432559832930565
-222 0.07360920310020447 0.02600749954581261 0.008669169619679451
-223 0.03861400112509727 0.02792119979858398 0.01194579992443323
-224 0.03668290004134178 0.03004099987447262 0.01150050014257431
-225 0.04037069901823997 0.02975150011479855 0.0113207995891571
-226 0.04216570034623146 0.03171870112419128 0.01057290006428957
-227 0.06843700259923935 0.02467980049550533 0.009776829741895199
-228 0.03580699861049652 0.03245240077376366 0.01081749983131886
-229 0.03514460101723671 0.02731529995799065 0.01232740003615618
-230 0.03301560133695602 0.03061450086534023 0.01158410031348467
-231 0.02944369986653328 0.03022870048880577 0.01194390002638102
-232 0.03260369971394539 2.840100024577597e-18 0.01546080037951469
-233 0.05375050008296967 0.01479919999837875 0.01321639958769083
-234 0.05261709913611412 0.01874279975891113 0.01274779997766018
-235 0.05619059875607491 0.01704059913754463 0.01269690040498972
-236 0.04574229940772057 0.007007549982517958 0.01451960019767284
-237 0.0385906994342804 0.02110379934310913 0.01340360008180141
-238 0.03241910040378571 0.02573899924755096 0.01286830008029938
-239 0.03522200137376785 0.02437339909374714 0.01298729982227087
-240 0.03625470027327538 0.01566679961979389 0.01434149965643883
-241 0.0503045991063118 0.02161329984664917 0.01243910007178783
-242 0.04738499969244003 0.02082630060613155 0.01282699964940548
-243 0.05949569866061211 0.01033340021967888 0.01318920031189919
-244 0.06181029975414276 0.005611000116914511 0.01329660043120384
-245 0.06185739859938622 0.008478119969367981 0.01311769988387823
-246 0.04549140110611916 0.02370980009436607 0.01241749990731478
-247 0.03357879817485809 0.01478559989482164 0.01459410041570663
-248 0.03544630110263824 0.01276149973273277 0.01470329985022545
-249 0.03893639892339706 0.01621190086007118 0.01411859970539808
-250 0.03747230023145676 0.02313769981265068 0.01309730019420385
-251 0.03791550174355507 0.02553319931030273 0.01256689988076687
-252 0.04481149837374687 0.0122103001922369 0.01418989989906549
-253 0.06480000168085098 0.01690159924328327 0.01186269987374544
-254 0.03166859969496727 0.01674629934132099 0.0144651997834444
-255 0.02944369986653328 0.01826870068907738 0.0143911000341177
-256 0.04212610051035881 0.01149229984730482 0.01443529967218637
-257 0.03538199886679649 0.02137340046465397 0.01355060003697872
-258 0.03286109864711761 0.02326860092580318 0.01335300039499998
-259 0.06751959770917892 0.01640450023114681 0.01164320018142462
-260 0.04261590167880058 0.01884559914469719 0.01351370010524988
-261 0.041457898914814 0.02126039937138557 0.01319089997559786
-262 0.04660249873995781 0.02663560025393963 0.01165239978581667
-263 0.04407069832086563 0.02618589997291565 0.01197469979524612
-264 0.06656250357627869 0.01412069983780384 0.0120734004303813
-265 0.0661081001162529 0.01175540033727884 0.01239980012178421
-266 0.06875450164079666 0.01173240039497614 0.01212510000914335
-267 0.06820099800825119 0.002789620077237487 0.01276810001581907
-268 0.03140980005264282 0.0142238000407815 0.01477690041065216
-269 0.04141119867563248 0.01646599918603897 0.01393330004066229
-270 0.06692910194396973 0.02207970060408115 0.0106258001178503
-271 0.03990510106086731 0.02362109906971455 0.01284500025212765
-272 0.06208230182528496 0.02240259945392609 0.01112459972500801
-273 0.06514529883861542 0.02428030036389828 0.01030869968235493
-274 0.04121740162372589 0.02657910063862801 0.01209769956767559
-275 0.04760570079088211 0.00984358973801136 0.01419830042868853
-276 0.04413989931344986 0.02129519917070866 0.01299399975687265
-277 0.05688200145959854 0.009310140274465084 0.01350480038672686
-278 0.04390779882669449 0.009081129916012287 0.01451320014894009
-279 0.03729290142655373 0.0185650996863842 0.01389109995216131
-280 0.06367009878158569 0.01329679973423481 0.01247849967330694
-281 0.04527610167860985 0.01839490048587322 0.01339189987629652
-282 0.0379347987473011 0.01336229965090752 0.01450490020215511
-283 0.03694719821214676 0.01031369995325804 0.01483509968966246
-284 0.04045270010828972 0.01383389998227358 0.01430770009756088
-285 0.06740409880876541 0.006638600025326014 0.0126868998631835
-286 0.06450860202312469 0.004615969955921173 0.01307910028845072
-287 0.06449290364980698 0.007546150125563145 0.01292429957538843
-288 0.04002029821276665 0.01880759932100773 0.01368930004537106
-289 0.0346623994410038 0.01052779983729124 0.01494169980287552
-290 0.04292890056967735 0.01430440042167902 0.01409879978746176
-291 0.04351279884576797 0.01666419953107834 0.01376709993928671
-292 0.06499490141868591 0.002032639924436808 0.01310800015926361
-293 0.07094830274581909 0.0197443999350071 0.0106527004390955
-294 0.04552070051431656 0.01539320033043623 0.01378860045224428
-295 0.06689950078725815 0.0190872997045517 0.01125190034508705
-296 0.0645378977060318 0.02068999968469143 0.01120890025049448
-297 0.0439119003713131 0.02879359945654869 0.01131189987063408
-298 0.04277700185775757 0.02387039922177792 0.01259359996765852
-299 0.0343221016228199 0.01806179992854595 0.01413580030202866
-300 0.0353224016726017 0.008361480198800564 0.01505929976701736
-301 0.03737229853868484 0.006936879828572273 0.01503170002251863
-302 0.03937840089201927 0.01061780005693436 0.01467499975115061
-303 0.041024100035429 0.008145060390233994 0.01475679967552423
-304 0.0533686988055706 0.02755220048129559 0.01077079959213734
-305 0.04208340123295784 2.747610065155899e-18 0.0149573003873229
-306 0.03892410174012184 2.780389992060457e-18 0.01513569988310337
-307 0.04291310161352158 0.005550200119614601 0.01477930042892694
-308 0.03966429829597473 0.005288609769195318 0.01498270034790039
-309 0.06416390091180801 2.42697997047932e-18 0.01321190036833286
-310 0.07360920310020447 0.01459669973701239 0.01125319954007864
-311 0.07123389840126038 0.01302780024707317 0.01171370036900043
-312 0.07061489671468735 0.01555259991437197 0.01143379975110292
-313 0.06894669681787491 0.0139964995905757 0.01183409988880157
-314 0.06974609941244125 0.01810950040817261 0.01110680028796196
-315 0.03491149842739105 0.003250449895858765 0.01530210021883249
-316 0.03424689918756485 0.005846419837325811 0.01524860039353371
-317 0.02944369986653328 0.003053959924727678 0.01559329964220524
-318 0.02944369986653328 0.006106450222432613 0.01549329981207848
-319 0.03171379864215851 0.003382859984412789 0.01546410005539656
-320 0.02944369986653328 0.02428949996829033 0.01336540002375841
-321 0.05908500030636787 0.02109749987721443 0.01171999983489513
-322 0.03150599822402 0.006717420183122158 0.01535269990563393
-323 0.07042050361633301 0.02212999947369099 0.01018480025231838
-324 0.06898870319128036 0.02025719918310642 0.01077730022370815
-325 0.03748349845409393 0.003503710031509399 0.01516180019825697
-326 0.03183859959244728 0.02044459991157055 0.01391690038144588
-327 0.05455039814114571 0.004969430156052113 0.01395860034972429
-328 0.051910400390625 0.00569193996489048 0.01413580030202866
-329 0.05330530181527138 0.002463320037350059 0.01413829997181892
-330 0.05076619982719421 0.01604449935257435 0.01330219954252243
-331 0.03106109984219074 0.01061729993671179 0.0151297003030777
-332 0.02944369986653328 0.009155970066785812 0.01532549969851971
-333 0.02944369986653328 0.01220079977065325 0.01508789975196123
-334 0.03262009844183922 0.01203809957951307 0.01492480002343655
-335 0.0569830983877182 0.01305860001593828 0.01314229983836412
-336 0.04970249906182289 0.01889139972627163 0.01296889968216419
-337 0.05677349865436554 0.0233989991247654 0.01146710012108088
-338 0.05311930179595947 0.02224669978022575 0.01206429954618216
-339 0.05469679832458496 0.02508060075342655 0.01128210034221411
-340 0.05151350051164627 0.02471630088984966 0.01167550031095743
-341 0.05936169996857643 0.007364590186625719 0.01342490036040545
-342 0.06184329837560654 0.01097240019589663 0.01290920004248619
-343 0.0605149008333683 0.01334279961884022 0.01278659980744123
-344 0.05470870062708855 2.582310013856059e-18 0.01405739970505238
-345 0.05372650176286697 0.008197469636797905 0.01384889986366034
-346 0.06676489859819412 0.009576190263032913 0.01254019979387522
-347 0.06419359892606735 0.01014690008014441 0.01275250036269426
-348 0.0484934002161026 0.0240837000310421 0.01208810042589903
-349 0.04954009875655174 0.02764669992029667 0.01112260017544031
-350 0.06187539920210838 0.01573619991540909 0.01234420016407967
-351 0.06144170090556145 0.01878960058093071 0.01190720032900572
-352 0.06259670108556747 0.002644400112330914 0.01332959998399019
-353 0.04777229949831963 0.01730399951338768 0.01336419954895973
-354 0.04841019958257675 0.01353720016777515 0.01379179954528809
-355 0.05949360132217407 0.003450850024819374 0.01359520014375448
-356 0.05786209926009178 2.534070081302885e-18 0.0137948002666235
-357 0.07360920310020447 0.01169160008430481 0.01162409968674183
-358 0.05056130141019821 0.00819557998329401 0.01409760024398565
-359 0.0541330985724926 0.01151440013200045 0.01354559976607561
-360 0.07141920179128647 0.01080940011888742 0.01194289978593588
-361 0.07032179832458496 0.008320000022649765 0.0122750997543335
-362 0.07360920310020447 0.008776609785854816 0.01190590020269156
-363 0.04524140059947968 2.710720084582719e-18 0.01475649978965521
-364 0.0407366007566452 0.002911129966378212 0.01499820034950972
-365 0.04414010047912598 0.002477719914168119 0.01479979977011681
-366 0.06736080348491669 0.02734529972076416 0.009115110151469707
-367 0.05933009833097458 0.01615270040929317 0.01253569964319468
-368 0.05162740126252174 0.01335230004042387 0.01356130000203848
-369 0.05107710137963295 0.01078459993004799 0.01385859958827496
-370 0.05598419904708862 0.02011729963123798 0.01220810040831566
-371 0.05840630084276199 0.01867089979350567 0.01223170012235641
-372 0.04848689958453178 0.006419760175049305 0.01435690000653267
-373 0.05612310022115707 0.002806959906592965 0.01390200015157461
-374 0.05681850016117096 0.00592187000438571 0.01372690033167601
-375 0.06731250137090683 2.368889971191864e-18 0.01289559993892908
-376 0.07360920310020447 2.252140045174905e-18 0.01226009987294674
-377 0.04533629864454269 0.03128970041871071 0.01042990013957024
-378 0.04677839949727058 0.02908479981124401 0.01097590010613203
-379 0.07131429761648178 0.002097520045936108 0.01246820017695427
-380 0.07069160044193268 0.004793989937752485 0.01244680024683475
-381 0.04677170142531395 0.001959400018677115 0.01463240012526512
-382 0.04965440183877945 0.002959910081699491 0.01440490037202835
-383 0.04642460122704506 0.004346759989857674 0.01459330040961504
-384 0.06184139847755432 0.02584009990096092 0.01030219998210669
-385 0.06423590332269669 0.0280115008354187 0.009337170049548149
-386 0.05754189938306808 0.02679329924285412 0.01053700037300587
-387 0.05977059900760651 0.02408800087869167 0.01099309977144003
-388 0.0483241006731987 0.03842309862375259 0.006865019910037518
-389 0.04799890145659447 0.03590939939022064 0.008282099850475788
-390 0.06810279935598373 0.03147109970450401 0.00735368998721242
-391 0.06916890293359756 0.03320629894733429 0.006232679821550846
-392 0.03196129947900772 0.04156789928674698 0.006928860209882259
-393 0.03350320085883141 0.0430523008108139 0.005622270051389933
-394 0.02944369986653328 0.04325760155916214 0.006022680085152388
-395 0.06842230260372162 0.03542200103402138 0.004888770170509815
-396 0.06429470330476761 0.03824760019779205 0.003416140098124743
-397 0.06202669814229012 0.03721040114760399 0.005103420000523329
-398 0.06306000053882599 0.03465599939227104 0.006613729987293482
-399 0.06740009784698486 0.03734280169010162 0.003335329936817288
-400 0.0665815994143486 0.03388160094618797 0.006364690139889717
-401 0.06528949737548828 0.03639569878578186 0.004928660113364458
-402 0.06158610060811043 0.03265770152211189 0.007904199883341789
-403 0.0590256005525589 0.03802559897303581 0.005162519868463278
-404 0.06117919832468033 0.03911750018596649 0.003493830095976591
-405 0.05957899987697601 0.03541469946503639 0.006822240073233843
-406 0.05590369924902916 0.03874289989471436 0.00527741014957428
-407 0.04399950057268143 0.0350847989320755 0.009119750000536442
-408 0.04850130155682564 0.03082449920475483 0.01027479954063892
-409 0.05166120082139969 0.03032859973609447 0.010109500028193
-410 0.05357189849019051 0.03355130180716515 0.008651440031826496
-411 0.05457210168242455 0.03678819909691811 0.00687061995267868
-412 0.05017460137605667 0.03356099873781204 0.009068669751286507
-413 0.04541549831628799 0.04272719845175743 0.003816240001469851
-414 0.0370309017598629 0.03634719923138618 0.009229269810020924
-415 0.03584320098161697 0.04432540014386177 0.0039589898660779
-416 0.03455689921975136 0.0404668003320694 0.007341589778661728
-417 0.03738920018076897 0.04190709814429283 0.00602127006277442
-418 0.07048369944095612 0.02667099982500076 0.008890350349247456
-419 0.07360920310020447 0.03349699825048447 0.005063329823315144
-420 0.07360920310020447 0.03552690148353577 0.003173140110448003
-421 0.07140260189771652 0.03407619893550873 0.005166209768503904
-422 0.07099039852619171 0.03185620158910751 0.006631690077483654
-423 0.05977629870176315 0.03091650083661079 0.008908960036933422
-424 0.06296370178461075 0.03038029931485653 0.00866037979722023
-425 0.06477349996566772 0.03214430063962936 0.00761470990255475
-426 0.04692360013723373 0.04059800133109093 0.005567660089582205
-427 0.05481550097465515 0.0298020001500845 0.009933999739587307
-428 0.05796390026807785 0.0292447991669178 0.00974825955927372
-429 0.06910719722509384 0.0294743999838829 0.00806427001953125
-430 0.06615599989891052 0.02984209917485714 0.008384140208363533
-431 0.05719380080699921 0.0368570014834404 0.006373479962348938
-432 0.05875319987535477 0.03297509998083115 0.008192740380764008
-433 0.0566525012254715 0.0346514992415905 0.007708190008997917
-434 0.06110480055212975 0.02865069918334484 0.009550229646265507
-435 0.05174989998340607 0.04140999913215637 0.003698589978739619
-436 0.05692220106720924 0.0319489985704422 0.008883019909262657
-437 0.04069890081882477 0.04171169921755791 0.005710890050977468
-438 0.04236280173063278 0.03877250105142593 0.007475350052118301
-439 0.04730670154094696 0.03344419971108437 0.009441629983484745
-440 0.05123639851808548 0.036855798214674 0.007351739797741175
-441 0.04995520040392876 0.04000340029597282 0.00547845009714365
-442 0.05315870046615601 0.03928849846124649 0.005415880121290684
-443 0.04380359873175621 0.04093610122799873 0.005839330144226551
-444 0.04545620083808899 0.03807789832353592 0.007475859951227903
-445 0.03462250158190727 0.03767380118370056 0.008835120126605034
-446 0.03186300024390221 0.03936609998345375 0.008244140073657036
-447 0.03421130031347275 0.03486869856715202 0.0100681995972991
-448 0.04065360128879547 0.03396860137581825 0.009893599897623062
-449 0.03898829966783524 0.03210040181875229 0.01070010010153055
-450 0.04020629823207855 0.03615200147032738 0.009029990062117577
-451 0.03790849819779396 0.03441840037703514 0.009949970059096813
-452 0.03797870129346848 0.03894669935107231 0.007865140214562416
-453 0.03968250006437302 0.04022910073399544 0.006912120152264833
-454 0.03262469917535782 0.03279500082135201 0.01093169953674078
-455 0.07360920310020447 0.02861499972641468 0.007702549919486046
-456 0.07190150022506714 0.02908230014145374 0.007778239902108908
-457 0.02944369986653328 0.03581469878554344 0.01008289959281683
-458 0.03203479945659637 0.03658850118517876 0.00954705011099577
-459 0.03264230117201805 0.04479619860649109 0.004001040011644363
-460 0.0358486995100975 0.04588820040225983 0
-461 0.03904210031032562 0.04384149983525276 0.003915769979357719
-462 0.04223449900746346 0.04331659898161888 0.0038688899949193
-463 0.03905029967427254 0.04538679867982864 0
-464 0.04542750120162964 0.04423199966549873 0
-465 0.04700750112533569 0.04352400079369545 0.001910010003484786
-466 0.05017510056495667 0.04284749925136566 0.00188033003360033
-467 0.04859999939799309 0.04357120022177696 0
-468 0.05491700023412704 0.04212170094251633 0
-469 0.05490370094776154 0.04068949818611145 0.003634240012615919
-470 0.05804770067334175 0.03992829844355583 0.003566249972209334
-471 0.05648209899663925 0.04136890172958374 0.001815440016798675
-472 0.05961940065026283 0.04056670144200325 0.001780239981599152
-473 0.05806029960513115 0.04133350029587746 0
-474 0.06430339813232422 0.03959419950842857 0
-475 0.06119029968976974 0.04049430042505264 0
-476 0.0658951997756958 0.03877659887075424 0.001704600057564676
-477 0.06921970099210739 0.03776900097727776 0.001674039987847209
-478 0.07050260156393051 0.03642779961228371 0.003253600094467402
-479 0.05333349853754044 0.04212899878621101 0.001848799991421402
-480 0.05176340043544769 0.04286770150065422 0
-481 0.04858700186014175 0.04208929836750031 0.00375926005654037
-482 0.04383059963583946 0.0441582016646862 0.001937850029207766
-483 0.04224500060081482 0.04484279826283455 0
-484 0.04061450064182281 0.04473140090703964 0.001971790101379156
-485 0.06740599870681763 0.03865829855203629 0
-486 0.06274700164794922 0.03970130160450935 0.001742759952321649
-487 0.03728440031409264 0.0452503003180027 0.002039130078628659
-488 0.03395120054483414 0.0457678996026516 0.00203699991106987
-489 0.03264499828219414 0.04637600108981133 0
-490 0.07360920310020447 0.0364282988011837 0.001691919984295964
-491 -0.008199930191040039 0.03236730024218559 0.01209099963307381
-492 -0.008462630212306976 0.002203880110755563 0.01618549972772598
-493 -0.01051560044288635 0.02824299968779087 0.01316229999065399
-494 0.0273755993694067 0.01360020041465759 0.01502420008182526
-495 -0.01051560044288635 0.009481829591095448 0.01587099954485893
-496 -0.01051560044288635 0.01578149944543839 0.01530370023101568
-497 0.02684690058231354 0.02761919982731342 0.0127325002104044
-498 -0.004421070218086243 0.0223833005875349 0.01442109979689121
-499 0.003912690095603466 0.0213031992316246 0.01458670012652874
-500 0.01610130071640015 0.010886300355196 0.01563969999551773
-501 0.01797889918088913 0.01277329958975315 0.01542679965496063
-502 0.02122809924185276 0.01201900001615286 0.01539030019193888
-503 -0.001927049946971238 0.02134530059993267 0.01460659969598055
-504 -0.003814480034634471 0.01997189968824387 0.01481309998780489
-505 -0.007327749859541655 0.01705689914524555 0.01518000010401011
-506 -0.007527689915150404 0.01338389981538057 0.01558229979127645
-507 -0.006418940145522356 0.01976300030946732 0.01482080016285181
-508 0.02144310064613819 0.01765879988670349 0.01476419996470213
-509 0.02135859988629818 0.01991079933941364 0.01444550044834614
-510 -0.007410920225083828 0.02964089997112751 0.0128533998504281
-511 0.02484860084950924 0.01987339928746223 0.01432089973241091
-512 0.02590020000934601 0.02440650016069412 0.01347879972308874
-513 0.02358029969036579 0.02258599922060966 0.01391709968447685
-514 0.01758709922432899 0.02092679962515831 0.01441380009055138
-515 0.02739059925079346 0.03101019933819771 0.01181020028889179
-516 -0.006944959983229637 0.02438480034470558 0.01403009984642267
-517 -0.002935450058430433 0.02479269914329052 0.01398770045489073
-518 0.0274363998323679 0.01968690007925034 0.01425290014594793
-519 -0.01051560044288635 0.006323779933154583 0.01604470051825047
-520 -0.007769709918648005 0.005166400223970413 0.01611690036952496
-521 -0.008577000349760056 0.007834809832274914 0.01598710007965565
-522 -0.003980460111051798 0.02986370027065277 0.0128389997407794
-523 -0.004362700041383505 0.0344724990427494 0.01149080041795969
-524 -0.005718130152672529 0.03207869827747345 0.01221380010247231
-525 -0.001834299997426569 0.01811850070953369 0.01508279982954264
-526 1.278580020880327e-05 0.02638559974730015 0.01366230007261038
-527 0.01893250085413456 0.01069589983671904 0.01557420007884502
-528 0.0004486129910219461 0.023098299279809 0.01430310029536486
-529 0.0006704339757561684 0.01943350024521351 0.01489359978586435
-530 -0.004561650101095438 0.01748890057206154 0.01515250001102686
-531 0.02441189996898174 0.0136668998748064 0.0151231000199914
-532 0.02377299964427948 0.009888609871268272 0.0154705997556448
-533 0.0003974039864260703 0.002329899929463863 0.01624009944498539
-534 0.02690310031175613 0.004628890193998814 0.01563530042767525
-535 0.02644450031220913 0.00792298000305891 0.01550259999930859
-536 0.02381259948015213 0.006471219938248396 0.01567069999873638
-537 0.02381259948015213 0.02798690088093281 0.01277409959584475
-538 0.0266887005418539 0.01680140011012554 0.01468429993838072
-539 0.02944369986653328 0.01523919962346554 0.01477780006825924
-540 0.02681539952754974 0.01108380034565926 0.01527190022170544
-541 0.02944369986653328 0.03314869850873947 0.01104960031807423
-542 -0.007654150016605854 0.02706010080873966 0.01346630044281483
-543 -0.01051560044288635 0.02204420045018196 0.01441810000687838
-544 -0.007368229795247316 0.02161220088601112 0.01452070008963346
-545 0.02368490025401115 0.02551859989762306 0.01333940029144287
-546 0.02112510055303574 0.02712040022015572 0.01309099979698658
-547 0.02013220079243183 0.02372049912810326 0.01383890025317669
-548 0.02350899949669838 0.01717459969222546 0.01475290022790432
-549 0.02186259999871254 0.01534960046410561 0.01503400038927794
-550 0.0179063007235527 0.00835178978741169 0.01576579920947552
-551 0.0194752998650074 0.01474529970437288 0.01518219988793135
-552 0.01862419955432415 0.01773349940776825 0.0148497000336647
-553 0.009400430135428905 0.007491909898817539 0.01598509959876537
-554 0.00845750980079174 0.009725919924676418 0.01585919968783855
-555 0.006740400101989508 0.007936310023069382 0.01599030010402203
-556 0.002523229923099279 0.004195420071482658 0.01618519984185696
-557 0.002033760072663426 0.007058550138026476 0.01607210002839565
-558 -0.00109590997453779 0.01211680006235838 0.01573959924280643
-559 0.0151055995374918 0.02677690051496029 0.01337550021708012
-560 0.01216750033199787 0.02737269923090935 0.01330980006605387
-561 0.003997299820184708 0.0114662004634738 0.01576929911971092
-562 0.01490399986505508 0.01364540029317141 0.01542390044778585
-563 0.0001478269987273961 0.01594579964876175 0.01534979976713657
-564 0.01215930003672838 0.01870080083608627 0.01487709954380989
-565 0.01382850017398596 0.02147980034351349 0.01442189980298281
-566 -0.002665020059794188 0.002902250038459897 0.01622889935970306
-567 -0.00129249005112797 2.988029903399283e-18 0.0162661001086235
-568 0.007258940022438765 0.02377519942820072 0.0141251003369689
-569 0.009919510222971439 0.02803670056164265 0.0131973996758461
-570 0.01007649954408407 0.02541040070354939 0.01376849971711636
-571 0.005340040195733309 0.02966460026800632 0.01286069955676794
-572 0.02170230075716972 0.03187460079789162 0.01182319968938828
-573 0.02165180072188377 0.02961920015513897 0.01245590019971132
-574 0.02437819913029671 0.03084589913487434 0.01199750043451786
-575 0.02330780029296875 0.03360620141029358 0.01120209973305464
-576 0.007961769588291645 0.02133730053901672 0.0145412003621459
-577 0.006362630054354668 0.01939049921929836 0.01485799998044968
-578 0.0182402990758419 0.02656389959156513 0.01332509983330965
-579 0.01691720075905323 0.02893389947712421 0.01281549967825413
-580 0.0006535819848068058 0.03281269967556 0.01202839985489845
-581 -0.0006125890067778528 0.0297072995454073 0.01289070025086403
-582 -0.002662430051714182 0.03228040039539337 0.01218710001558065
-583 -0.004366950131952763 2.985160000264031e-18 0.01625039987266064
-584 0.001579690026119351 0.01025469973683357 0.01587790064513683
-585 0.003632739884778857 0.01725150085985661 0.01517170015722513
-586 0.007211700081825256 0.01632980071008205 0.01525290030986071
-587 0.01404980011284351 0.02935880050063133 0.01279260031878948
-588 0.01269229967147112 0.03213239833712578 0.01207169983536005
-589 -0.005096179898828268 0.027241300791502 0.01345730014145374
-590 -0.002608150010928512 0.02763820067048073 0.01338679995387793
-591 0.01937370002269745 0.02873760089278221 0.0127750001847744
-592 0.0202396996319294 0.0338331013917923 0.01127769984304905
-593 0.004215680062770844 0.00868596974760294 0.01596730016171932
-594 0.01120399963110685 0.009914480149745941 0.01580910012125969
-595 0.01217519957572222 0.007742370013147593 0.01593079976737499
-596 0.00476250983774662 0.005797000136226416 0.01611259952187538
-597 0.01716969907283783 0.03403440117835999 0.01134479977190495
-598 0.01573709957301617 0.03164279833436012 0.01213049981743097
-599 0.01893389970064163 0.03128520026803017 0.01211540028452873
-600 0.009095599874854088 0.01880449987947941 0.01490969955921173
-601 0.01057920046150684 0.02095809951424599 0.01456610020250082
-602 0.01056110020726919 0.02313110046088696 0.01419780030846596
-603 0.005595630034804344 0.03212400153279305 0.0121916001662612
-604 0.0267574992030859 0.02210989966988564 0.01387850008904934
-605 0.02944369986653328 0.02128669992089272 0.01392260007560253
-606 0.006248930003494024 0.01070229988545179 0.01581110060214996
-607 0.009099819697439671 0.01294459961354733 0.01558999996632338
-608 0.01488909963518381 0.008036060258746147 0.01586209982633591
-609 0.01379919983446598 0.005395589862018824 0.01601249910891056
-610 0.01621510088443756 0.02399099990725517 0.01391690038144588
-611 0.01305530034005642 0.02472149953246117 0.0138525003567338
-612 0.01617930084466934 0.003040109993889928 0.016032500192523
-613 0.01592460088431835 0.005802359897643328 0.01594920083880424
-614 0.002653599949553609 0.0311322994530201 0.01249739993363619
-615 0.002831170102581382 0.02821560017764568 0.01323620043694973
-616 0.01372979953885078 0.009875760413706303 0.01576800085604191
-617 0.01213280018419027 0.0141313998028636 0.01542919967323542
-618 0.01274900045245886 0.01179269980639219 0.01563720032572746
-619 -0.006023949943482876 0.002785000018775463 0.01620360091328621
-620 -0.0007385169737972319 0.005251190159469843 0.01616239920258522
-621 0.02089639939367771 0.008015500381588936 0.01569130085408688
-622 0.001791769987903535 0.03448760136961937 0.01149590034037828
-623 0.009263359941542149 0.002639719983562827 0.01616580039262772
-624 0.005587249994277954 0.002775330096483231 0.01620090007781982
-625 0.007587740197777748 0.005204670131206512 0.01611060090363026
-626 0.002216859953477979 0.01355889998376369 0.01559360045939684
-627 0.005358629859983921 0.01372900046408176 0.01555429957807064
-628 0.01676809974014759 0.01563649997115135 0.01516429986804724
-629 0.01370569970458746 0.01617610082030296 0.01517389994114637
-630 -0.001810809946618974 0.00855811033397913 0.01600039936602116
-631 0.01077849976718426 0.005183069966733456 0.01607180014252663
-632 0.001782009960152209 2.986489899893863e-18 0.01625769957900047
-633 0.002976970048621297 0.001861299970187247 0.01623559929430485
-634 0.01549770031124353 0.01860000006854534 0.01482119970023632
-635 -0.007891260087490082 0.01050950028002262 0.01582209952175617
-636 -0.005493239965289831 0.008513789623975754 0.01598110049962997
-637 -0.004400019999593496 0.005473639816045761 0.01614069938659668
-638 0.003547400003299117 0.02486749924719334 0.01395179983228445
-639 -0.004855259787291288 0.01204250007867813 0.0157306008040905
-640 -0.003386510070413351 0.01031710021197796 0.01587769947946072
-641 -0.002913489937782288 0.0150049002841115 0.01545609999448061
-642 -0.005297529976814985 0.0148844001814723 0.01545289997011423
-643 0.006663599982857704 0.0272538997232914 0.01342099998146296
-644 0.008070129901170731 0.0307071004062891 0.01255560014396906
-645 0.02436669915914536 0.002665840089321136 0.01577669940888882
-646 0.01247680000960827 0.002723559970036149 0.01611690036952496
-647 0.01110150013118982 0.03008509986102581 0.01267050020396709
-648 0.00794564001262188 0.03438900038599968 0.01146300043910742
-649 0.02944369986653328 2.870529931361892e-18 0.01562649942934513
-650 0.01102180033922195 0.03430569916963577 0.01143520046025515
-651 0.01016900036484003 0.03236629813909531 0.01205519959330559
-652 0.02329850010573864 2.910209992141213e-18 0.01584249921143055
-653 0.02022580057382584 2.929879933517418e-18 0.01594950072467327
-654 0.02730559930205345 0.00206982996314764 0.0156830009073019
-655 0.02176940068602562 0.004900150001049042 0.01580669917166233
-656 0.02026250027120113 0.002268319949507713 0.0159268993884325
-657 0.01884499937295914 0.005253899842500687 0.01588959991931915
-658 0.01061160024255514 0.01622959971427917 0.01522149983793497
-659 0.02724169939756393 0.04392490163445473 0.005666910205036402
-660 0.02637900039553642 0.04558660089969635 0.004071630071848631
-661 0.02944369986653328 0.04528199881315231 0.004044429864734411
-662 -0.008479219861328602 0.04546229913830757 0.005731239914894104
-663 -0.01051560044288635 0.04689360037446022 0.004188369959592819
-664 0.02673869952559471 0.04203270003199577 0.00712146982550621
-665 0.02364140003919601 0.04204339906573296 0.007351890206336975
-666 -0.001596780028194189 0.04552429914474487 0.005841779988259077
-667 -0.002799409907311201 0.04292549937963486 0.007711539976298809
-668 -0.0002217220026068389 0.04288740083575249 0.007739129941910505
-669 0.002295339945703745 0.04519800096750259 0.006084280088543892
-670 0.005882900208234787 0.04488829895853996 0.00626874016597867
-671 0.00896333996206522 0.04525699838995934 0.005883490201085806
-672 0.01705240085721016 0.04200829938054085 0.007819719612598419
-673 -0.005599389784038067 0.04504029825329781 0.006175910122692585
-674 -0.008309789933264256 0.04113529995083809 0.008632339537143707
-675 -0.005822449922561646 0.04239730164408684 0.007981309667229652
-676 -0.008230440318584442 0.04366840049624443 0.007119010202586651
-677 0.01718430034816265 0.04649059846997261 0.004152379930019379
-678 0.0248929001390934 0.0441385991871357 0.005711840000003576
-679 0.02202280052006245 0.04424820095300674 0.005895069800317287
-680 0.008557709865272045 0.04340630024671555 0.007273260038346052
-681 0.01943870075047016 0.04485179856419563 0.00561652984470129
-682 0.02039170078933239 0.04235659912228584 0.007392779923975468
-683 0.01282740011811256 0.04370699822902679 0.006929310038685799
-684 0.01105539966374636 0.04217449948191643 0.007970940321683884
-685 0.01184340007603168 0.04536119848489761 0.005681890062987804
-686 0.01053110044449568 0.04394989833235741 0.006843190174549818
-687 0.01400620024651289 0.04191270098090172 0.00802129041403532
-688 0.01734290085732937 0.04409610107541084 0.006400750018656254
-689 -0.007439100183546543 0.03439820185303688 0.01146609988063574
-690 0.01249790005385876 0.03999819979071617 0.009093450382351875
-691 0.01543849986046553 0.03991129994392395 0.00903168972581625
-692 0.01343579962849617 0.03812089934945107 0.009925260208547115
-693 0.01463830005377531 0.04513299837708473 0.005735749844461679
-694 0.01518029998987913 0.04345589876174927 0.006994930095970631
-695 0.009226130321621895 0.0411021001636982 0.008617869578301907
-696 -0.01051560044288635 0.03978389874100685 0.009274429641664028
-697 -0.001285549951717257 0.03450550138950348 0.01150180026888847
-698 0.01885960064828396 0.03929600119590759 0.009165080264210701
-699 0.02200979925692081 0.03965239971876144 0.008807159960269928
-700 0.01918260008096695 0.03626370057463646 0.01045180018991232
-701 0.006045530084520578 0.0421576015651226 0.008098180405795574
-702 -0.01051560044288635 0.03432850167155266 0.01144280005246401
-703 0.01409680023789406 0.03419189900159836 0.01139730028808117
-704 -0.008675250224769115 0.03628300130367279 0.01077789999544621
-705 -0.01051560044288635 0.03708929941058159 0.0104417996481061
-706 -0.008552069775760174 0.03849489986896515 0.009889859706163406
-707 -0.006477170158177614 0.03689049929380417 0.01058540027588606
-708 -0.005915530025959015 0.03973690047860146 0.009379079565405846
-709 0.01577810011804104 0.03691659867763519 0.01034369971603155
-710 -0.003040239913389087 0.04102319851517677 0.008785240352153778
-711 -0.0007613640045747161 0.04020509868860245 0.0092042600736022
-712 0.001297579961828887 0.04152709990739822 0.008512509986758232
-713 0.02944369986653328 0.04091989994049072 0.007624770049005747
-714 0.02944369986653328 0.03841660171747208 0.008955690078437328
-715 0.02461940050125122 0.04006880149245262 0.008424609899520874
-716 0.02677159942686558 0.03920299932360649 0.008730529807507992
-717 -0.003314309986308217 0.03790109977126122 0.01022680010646582
-718 0.0005805569817312062 0.03735550120472908 0.01045260019600391
-719 0.01197099965065718 0.03641660138964653 0.01065600011497736
-720 0.004578379914164543 0.03663359954953194 0.01070119999349117
-721 0.008800039999186993 0.03659500181674957 0.01065510045737028
-722 0.0263752993196249 0.03337199985980988 0.01112399995326996
-723 0.004868879914283752 0.0344482995569706 0.01148280035704374
-724 0.02677780017256737 0.03648160025477409 0.009955950081348419
-725 0.002969739958643913 0.04029960185289383 0.009130240418016911
-726 0.01042430009692907 0.03853359818458557 0.009826740249991417
-727 0.0069428700953722 0.0393977016210556 0.009506549686193466
-728 0.02202850021421909 0.03576289862394333 0.01049910020083189
-729 0.02107029967010021 0.03759349882602692 0.009813359938561916
-730 0.02442069910466671 0.03521589934825897 0.01057660020887852
-731 0.02394969947636127 0.03774679824709892 0.009582630358636379
-732 0.002946580061689019 0.04300969839096069 0.00763275008648634
-733 0.001801509992219508 0.04877270013093948 0
-734 0.0001278429990634322 0.04836760088801384 0.002123859943822026
-735 0.00291230995208025 0.04833099991083145 0.002120970049872994
-736 0.001800209982320666 0.0471109002828598 0.004207769874483347
-737 0.004881270229816437 0.04871689900755882 0
-738 0.006064100190997124 0.0482637993991375 0.002118010073900223
-739 0.004879610147327185 0.04705699905753136 0.004202960059046745
-740 0.007958410307765007 0.04697579890489578 0.004195710178464651
-741 0.00796039029955864 0.0486329011619091 0
-742 0.01411200035363436 0.04670609906315804 0.00417162012308836
-743 0.01284829992800951 0.04800400137901306 0.002106619998812675
-744 0.01411440037190914 0.04835360124707222 0
-745 0.01706849969923496 0.04772179946303368 0.002094229916110635
-746 0.01103620044887066 0.04686189815402031 0.00418554013594985
-747 0.009536400437355042 0.04815350100398064 0.002113180002197623
-748 0.0110384002327919 0.04851489886641502 0
-749 0.02025170065462589 0.04621570184826851 0.004127820022404194
-750 0.01718650013208389 0.04813050106167793 0
-751 0.02025360055267811 0.04784590005874634 0
-752 0.02125390060245991 0.04733080044388771 0.002077070064842701
-753 0.02331589907407761 0.04590610042214394 0.004100169986486435
-754 0.02637960016727448 0.0471947006881237 0
-755 0.02450410090386868 0.04698869958519936 0.002062059938907623
-756 0.02944369986653328 0.0464308001101017 0.002156500006094575
-757 0.02944369986653328 0.04687939956784248 0
-758 -0.007437219843268394 0.04698880016803741 0.004196870140731335
-759 -0.004359030164778233 0.04709040001034737 0.004205939825624228
-760 -0.001278629992157221 0.04879819974303246 0
-761 -0.001279550022445619 0.04713540151715279 0.004209970124065876
-762 -0.002826760057359934 0.04836149886250496 0.002122770063579082
-763 -0.004358469974249601 0.048751600086689 0
-764 0.02759899944067001 0.04665450006723404 0.00206729001365602
-765 -0.01051560044288635 0.04854780063033104 0
-766 -0.006183200050145388 0.04826489835977554 0.002138729905709624
-767 -0.007436930201947689 0.04864640161395073 0
-768 -0.03878949955105782 0.007464389782398939 0.01489249989390373
-769 -0.01503490004688501 0.006143589969724417 0.01595110073685646
-770 -0.04206240177154541 0.02231249958276749 0.01291829999536276
-771 -0.03345600143074989 0.02012250013649464 0.01386689953505993
-772 -0.02547919936478138 0.01642579957842827 0.01478289999067783
-773 -0.0289904996752739 0.009542769752442837 0.01529529970139265
-774 -0.0197478998452425 0.01503259968012571 0.01515480037778616
-775 -0.02144920080900192 0.0172715000808239 0.01482999976724386
-776 -0.02128770016133785 0.01286190003156662 0.01532659959048033
-777 -0.01580859906971455 0.02053100056946278 0.01453060004860163
-778 -0.02481280080974102 0.006930939853191376 0.01562589965760708
-779 -0.03642090037465096 0.01756650023162365 0.01406690012663603
-780 -0.0322732999920845 0.01029529981315136 0.01508220005780458
-781 -0.03278709948062897 0.01323970034718513 0.01479560043662786
-782 -0.01782229915261269 0.009980799630284309 0.0156663004308939
-783 -0.02518530003726482 0.02487250044941902 0.01342429965734482
-784 -0.02748190052807331 0.02391190081834793 0.01350970007479191
-785 -0.0184406004846096 0.01265409961342812 0.01543250028043985
-786 -0.02263550087809563 0.008369640447199345 0.01562559977173805
-787 -0.04022400081157684 0.01151099987328053 0.01451420038938522
-788 -0.0381866991519928 0.01004029996693134 0.01475939992815256
-789 -0.03868750110268593 0.01381869986653328 0.01438399963080883
-790 -0.01762159913778305 0.02280809916555882 0.01410000026226044
-791 -0.02102039940655231 0.02248989976942539 0.01404799986630678
-792 -0.01998589932918549 2.933099940846934e-18 0.01596710085868835
-793 -0.0231419000774622 2.914400075534101e-18 0.01586529985070229
-794 -0.02840190008282661 0.03030579909682274 0.01195860002189875
-795 -0.01713749952614307 0.007113149855285883 0.01585770025849342
-796 -0.0152545003220439 0.008851310238242149 0.01580299995839596
-797 -0.01676619984209538 0.02555279992520809 0.01359259989112616
-798 -0.0134317995980382 0.0270140003412962 0.0133654996752739
-799 -0.01051560044288635 0.0313045009970665 0.01236889977008104
-800 -0.01935279928147793 0.02014880068600178 0.0144921001046896
-801 -0.02676749974489212 0.01925729960203171 0.01434220001101494
-802 -0.02960719913244247 0.01232639979571104 0.01504210010170937
-803 -0.026451600715518 0.0116768004372716 0.01523880008608103
-804 -0.02753500081598759 0.007030659820884466 0.01551149971783161
-805 -0.02047640085220337 0.01057050004601479 0.0155477998778224
-806 -0.01756200008094311 0.01766430027782917 0.01489850040525198
-807 -0.01958690024912357 0.02467060089111328 0.01368729956448078
-808 -0.03324640169739723 0.01693160086870193 0.01434450037777424
-809 -0.02729530073702335 0.01389439962804317 0.01499340031296015
-810 -0.02946689911186695 0.01574850082397461 0.01468820031732321
-811 -0.02342480048537254 0.01119370013475418 0.0153972003608942
-812 -0.02574680000543594 0.009041240438818932 0.01546700019389391
-813 -0.02234370075166225 0.0249342005699873 0.0135319996625185
-814 -0.02905409969389439 0.004696330055594444 0.01554610021412373
-815 -0.01384519971907139 0.01772050000727177 0.01498330011963844
-816 -0.027683200314641 0.002340489998459816 0.01566779986023903
-817 -0.02608080022037029 0.00480755977332592 0.01566749997437
-818 -0.02473879978060722 0.002498730085790157 0.01578200049698353
-819 -0.01996820047497749 0.007658029906451702 0.01575390063226223
-820 -0.01944600045681 0.004713539965450764 0.01589949987828732
-821 -0.02948489971458912 0.03311819955706596 0.01103939954191446
-822 -0.03520099818706512 0.02630439959466457 0.01255100034177303
-823 -0.03425240144133568 0.02336429990828037 0.01324130035936832
-824 -0.02301990054547787 0.01972280070185661 0.01442770007997751
-825 -0.02467039972543716 0.02236459963023663 0.01392609998583794
-826 -0.02771379984915257 0.02168090082705021 0.01390940044075251
-827 -0.03060879930853844 0.02276049926877022 0.01357010006904602
-828 -0.03025469928979874 0.01940960064530373 0.01415350008755922
-829 -0.03535459935665131 0.01445730030536652 0.01451999973505735
-830 -0.0353148989379406 0.0116031002253294 0.01480519957840443
-831 -0.02711289934813976 0.02695360034704208 0.01287980005145073
-832 -0.02588249929249287 0.02957000024616718 0.01229299977421761
-833 -0.0302095003426075 0.02773470059037209 0.01252810005098581
-834 -0.04206240177154541 0.02544819936156273 0.01225730031728745
-835 -0.0382080003619194 0.02368720062077045 0.01290949992835522
-836 -0.01399180013686419 0.02346359938383102 0.01407579984515905
-837 -0.02364489994943142 0.01399100013077259 0.01513110008090734
-838 -0.0182448998093605 0.002237109933048487 0.01599369943141937
-839 -0.01293530035763979 0.02055780030786991 0.01459749974310398
-840 -0.01634519919753075 0.01496849954128265 0.01525409985333681
-841 -0.02948169969022274 0.02545190043747425 0.01309190038591623
-842 -0.01303800009191036 0.01069450005888939 0.01572529971599579
-843 -0.03905890136957169 0.02007509954273701 0.01351550035178661
-844 -0.03199530020356178 0.02573570050299168 0.01288860011845827
-845 -0.01051560044288635 0.01263509970158339 0.01562490034848452
-846 -0.02271159924566746 0.005355549976229668 0.01577240042388439
-847 -0.01051560044288635 0.01891889981925488 0.01490330044180155
-848 -0.03965840116143227 0.01734640076756477 0.0138903995975852
-849 -0.02129890024662018 0.002470009960234165 0.01590240001678467
-850 -0.03627920150756836 0.02100110054016113 0.01354339998215437
-851 -0.01330230012536049 0.004394909832626581 0.01605330035090446
-852 -0.01660080067813396 0.004318609833717346 0.0159837007522583
-853 -0.01304659992456436 0.007305169943720102 0.01593980006873608
-854 -0.01982579939067364 0.02750279940664768 0.01306810043752193
-855 -0.01051560044288635 0.02515389956533909 0.01384100038558245
-856 -0.02317179925739765 0.03365309908986092 0.01121770031750202
-857 -0.01512399967759848 0.002089980058372021 0.01606719940900803
-858 -0.01262599974870682 0.001931129954755306 0.01612240076065063
-859 -0.01051560044288635 0.003162649925798178 0.01614820025861263
-860 -0.0133178997784853 0.01392799988389015 0.01543440017849207
-861 -0.01557779964059591 0.01189490035176277 0.01557090040296316
-862 -0.0323714017868042 0.003866980085149407 0.01541479956358671
-863 -0.03019719943404198 0.002132989931851625 0.01556000020354986
-864 -0.03260590136051178 2.840199906636563e-18 0.01546129956841469
-865 -0.03892109915614128 0.03201929852366447 0.01067310012876987
-866 -0.03957829996943474 0.02996259927749634 0.01126260031014681
-867 -0.03868760168552399 0.02737770043313503 0.01203710027039051
-868 -0.04206240177154541 0.03162109851837158 0.01054039970040321
-869 -0.04206240177154541 0.003204480046406388 0.01486799959093332
-870 -0.01368109975010157 0.03418239951133728 0.01139410026371479
-871 -0.01630770042538643 0.02893020026385784 0.01283430028706789
-872 -0.01334359962493181 0.03046680055558681 0.01251740008592606
-873 -0.02347210049629211 0.02778369933366776 0.01285549998283386
-874 -0.02128070034086704 0.02941410057246685 0.01254309993237257
-875 -0.02279370091855526 0.0312488991767168 0.01197679992765188
-876 -0.03659360110759735 0.02969219908118248 0.01157850027084351
-877 -0.03342229872941971 0.02856590040028095 0.01211799960583448
-878 -0.03397699818015099 0.0308568999171257 0.01144040003418922
-879 -0.03263580054044724 0.03279519826173782 0.01093169953674078
-880 -0.0314531996846199 0.03059929981827736 0.01169130019843578
-881 -0.01903139986097813 0.03097400069236755 0.01220849994570017
-882 -0.01584210060536861 0.03177259862422943 0.01208109967410564
-883 -0.03925770148634911 0.004304130095988512 0.01500339992344379
-884 -0.0389104001224041 2.772850033981883e-18 0.01509470026940107
-885 -0.03453480079770088 0.002117459895089269 0.01533710025250912
-886 -0.03744740039110184 0.002156100003048778 0.01516509987413883
-887 -0.03573650121688843 0.00489520002156496 0.01519429963082075
-888 -0.0350152999162674 0.008243010379374027 0.01507250033318996
-889 -0.03122100047767162 0.007061710115522146 0.01534259971231222
-890 -0.03358609974384308 0.006023580208420753 0.01527069974690676
-891 -0.03994809836149216 0.001933100051246583 0.01501729991286993
-892 -0.04018820077180862 0.04240550100803375 0.005069170147180557
-893 -0.04206240177154541 0.0431951992213726 0.00385804008692503
-894 -0.01443289965391159 0.04451340064406395 0.006239110138267279
-895 -0.03977020084857941 0.03642110154032707 0.008879819884896278
-896 -0.02071860060095787 0.0410705991089344 0.008163399994373322
-897 -0.01762579940259457 0.0403158999979496 0.008727669715881348
-898 -0.0215671993792057 0.04400920122861862 0.006167559884488583
-899 -0.03089799918234348 0.04309000074863434 0.00593593018129468
-900 -0.02631659992039204 0.04153959825634956 0.00748455012217164
-901 -0.01804729923605919 0.04378649964928627 0.006589789874851704
-902 -0.03578029945492744 0.03242110088467598 0.01080700010061264
-903 -0.0387004017829895 0.03427280113101006 0.009883820079267025
-904 -0.03726129978895187 0.03726650029420853 0.00874571967869997
-905 -0.03005550056695938 0.03686970099806786 0.009577699936926365
-906 -0.02780250087380409 0.04363369941711426 0.005860359873622656
-907 -0.02951299957931042 0.04523659870028496 0.004040370229631662
-908 -0.0263299997895956 0.03340280055999756 0.01113430038094521
-909 -0.02319739945232868 0.04596839845180511 0.004105729982256889
-910 -0.02460410073399544 0.04399739950895309 0.005899359937757254
-911 -0.02776139974594116 0.03846580162644386 0.00902791041880846
-912 -0.03030869923532009 0.03906660154461861 0.008531290106475353
-913 -0.02933670021593571 0.04127290099859238 0.007380019873380661
-914 -0.02234929986298084 0.03902649879455566 0.009119139984250069
-915 -0.03487420082092285 0.03864099830389023 0.008316189981997013
-916 -0.03606969863176346 0.04100289940834045 0.006792750209569931
-917 -0.0322410985827446 0.04056369885802269 0.007525119930505753
-918 -0.03418629989027977 0.04294490069150925 0.005601920187473297
-919 -0.02858269959688187 0.03531660139560699 0.01031079981476068
-920 -0.03134800121188164 0.03530240058898926 0.0101215997710824
-921 -0.02315350063145161 0.04158680140972137 0.007702169939875603
-922 -0.02480719983577728 0.03665729984641075 0.01001810003072023
-923 -0.03579879924654961 0.04428489878773689 0.00395536981523037
-924 -0.02070879936218262 0.03631599992513657 0.01037439983338118
-925 -0.03226659819483757 0.03777379915118217 0.008994219824671745
-926 -0.03477229923009872 0.0355461984872818 0.009741709567606449
-927 -0.01684669964015484 0.03403950110077858 0.01134650036692619
-928 -0.01262039970606565 0.03637810051441193 0.01064470037817955
-929 -0.01490879990160465 0.03682690113782883 0.01039670035243034
-930 -0.01982120051980019 0.03897260129451752 0.009283280000090599
-931 -0.02516880072653294 0.03914690017700195 0.008882259950041771
-932 -0.03976560011506081 0.03830070048570633 0.00795281957834959
-933 -0.02001079916954041 0.03386979922652245 0.01128990016877651
-934 -0.01570519991219044 0.0390854999423027 0.009405089542269707
-935 -0.01310709957033396 0.03910699859261513 0.009490270167589188
-936 -0.01788369938731194 0.03723400086164474 0.01012799981981516
-937 -0.02635790035128593 0.04562579840421677 0.004075129982084036
-938 -0.03893020004034042 0.04373760148882866 0.00390648003667593
-939 -0.0374164991080761 0.04265100136399269 0.005331019870936871
-940 -0.03932559862732887 0.04069650173187256 0.006558659952133894
-941 -0.03768150135874748 0.03923920169472694 0.007677469868212938
-942 -0.01526420004665852 0.04165270179510117 0.008106750436127186
-943 -0.01051560044288635 0.04237629845738411 0.007896140217781067
-944 -0.01239180006086826 0.04221190139651299 0.007905970327556133
-945 -0.01051560044288635 0.04479720070958138 0.006237019784748554
-946 -0.02636219933629036 0.04723479971289635 0
-947 -0.02791460044682026 0.04663509875535965 0.002046860055997968
-948 -0.03110959939658642 0.04620819911360741 0.002019779989495873
-949 -0.02951730042695999 0.04683170095086098 0
-950 -0.03266119956970215 0.0447952002286911 0.004000939894467592
-951 -0.03580160066485405 0.0458466000854969 0
-952 -0.0373368002474308 0.04518689960241318 0.001961650094017386
-953 -0.02467009983956814 0.04701900109648705 0.002065259963274002
-954 -0.02320129983127117 0.04758960008621216 0
-955 -0.02003219909965992 0.04626519978046417 0.004132240079343319
-956 -0.02003549970686436 0.04789699986577034 0
-957 -0.0210878998041153 0.04738340154290199 0.00209034001454711
-958 -0.03266499936580658 0.04637480154633522 0
-959 -0.03438629955053329 0.04571279883384705 0.001958090113475919
-960 -0.04023090004920959 0.04465179890394211 0.0019750299397856
-961 -0.04206240177154541 0.04471899941563606 0
-962 -0.03893150016665459 0.04528019949793816 0
-963 -0.01686160080134869 0.04649779945611954 0.004153020214289427
-964 -0.01368850003927946 0.04669350013136864 0.004170500207692385
-965 -0.01809499971568584 0.04763590171933174 0.002092299982905388
-966 -0.01686389930546284 0.04813789948821068 0
-967 -0.01495239976793528 0.04783869907259941 0.002120069926604629
-968 -0.01051560044288635 0.04808330163359642 0.002233250066637993
-969 -0.07360920310020447 0.02164719998836517 0.009101609699428082
-970 -0.07360920310020447 0.006239099893718958 0.0114272003993392
-971 -0.04545040056109428 0.02264860086143017 0.01254830043762922
-972 -0.04526039958000183 0.03110859915614128 0.01036950014531612
-973 -0.04845910146832466 0.0306003000587225 0.01020010001957417
-974 -0.07122460007667542 0.008532949723303318 0.01158929988741875
-975 -0.06815829873085022 0.007968240417540073 0.01205999962985516
-976 -0.05482880026102066 0.0294393002986908 0.009813089855015278
-977 -0.06056369841098785 0.008596270345151424 0.0129653001204133
-978 -0.05739739909768105 0.01026189979165792 0.01317000016570091
-979 -0.05340979993343353 0.002923989901319146 0.01396869961172342
-980 -0.05426939949393272 0.006280870176851749 0.01375799998641014
-981 -0.06025649979710579 0.0125620998442173 0.01263120025396347
-982 -0.04743010178208351 0.01409380044788122 0.0137090003117919
-983 -0.0503447987139225 0.01371829956769943 0.01350579969584942
-984 -0.06427539885044098 0.0171888992190361 0.01149970013648272
-985 -0.05438509956002235 0.01095199957489967 0.01341119967401028
-986 -0.05635220184922218 0.01305569987744093 0.01299929991364479
-987 -0.05317439883947372 0.01336739957332611 0.01328270044177771
-988 -0.05139710009098053 0.02152270078659058 0.01222139969468117
-989 -0.04700300097465515 0.01979630067944527 0.01293930038809776
-990 -0.04859279841184616 0.02147259935736656 0.01249739993363619
-991 -0.04984759911894798 0.01844670064747334 0.01291020028293133
-992 -0.06856279820203781 0.004650239832699299 0.01219969987869263
-993 -0.05165059864521027 0.03005239926278591 0.01001750025898218
-994 -0.04938169941306114 0.008986449800431728 0.01402449980378151
-995 -0.04500539973378181 0.01212539989501238 0.01411029975861311
-996 -0.04206240177154541 0.009605930186808109 0.0145584000274539
-997 -0.04455349966883659 0.01509399991482496 0.01382480002939701
-998 -0.06356669962406158 0.01998420059680939 0.01108909957110882
-999 -0.06250949949026108 0.01523530017584562 0.0120278000831604
-1000 -0.06740520149469376 0.02643539942800999 0.008811810053884983
-1001 -0.07360920310020447 0.01554219983518124 0.01039549987763166
-1002 -0.0575455017387867 0.007321550045162439 0.01337539963424206
-1003 -0.06311880052089691 0.01000330038368702 0.01255299989134073
-1004 -0.05540049821138382 0.008838370442390442 0.01348700001835823
-1005 -0.05474279820919037 0.01561869960278273 0.01284809969365597
-1006 -0.06386210024356842 0.003713269950821996 0.01285069994628429
-1007 -0.06133110076189041 0.01835650019347668 0.01168499980121851
-1008 -0.05982879921793938 0.0163780003786087 0.01218529976904392
-1009 -0.06057180091738701 0.02112310007214546 0.01125590037554502
-1010 -0.06640910357236862 0.01893950067460537 0.01088059972971678
-1011 -0.06540130078792572 0.01436209958046675 0.01177070010453463
-1012 -0.06032130122184753 0.02356790006160736 0.01074260007590055
-1013 -0.05138190090656281 0.01123620010912418 0.01366849988698959
-1014 -0.04953280091285706 0.0157661996781826 0.01332630030810833
-1015 -0.05193179845809937 0.01581650041043758 0.01310119964182377
-1016 -0.06774149835109711 0.02063190005719662 0.01032469980418682
-1017 -0.06995780020952225 0.01792039908468723 0.0105279004201293
-1018 -0.05227150022983551 0.02477180026471615 0.0114283999428153
-1019 -0.04206240177154541 0.0191555991768837 0.01346949953585863
-1020 -0.04206240177154541 0.0127988001331687 0.01428280025720596
-1021 -0.04206240177154541 0.01598300039768219 0.01392170041799545
-1022 -0.04722800105810165 0.01690120063722134 0.01336830016225576
-1023 -0.05786950141191483 2.494750050885177e-18 0.01358080003410578
-1024 -0.05908099934458733 0.00217098998837173 0.01343030016869307
-1025 -0.05690060183405876 0.004225070122629404 0.01359410025179386
-1026 -0.04438420012593269 0.01882190071046352 0.0133213996887207
-1027 -0.06661160290241241 0.002643249928951263 0.0125316996127367
-1028 -0.07360920310020447 0.003120969980955124 0.01156819984316826
-1029 -0.07090520113706589 0.005482879932969809 0.01183759979903698
-1030 -0.07046549767255783 2.212170057590883e-18 0.01204250007867813
-1031 -0.07015509903430939 0.002273770049214363 0.01205909997224808
-1032 -0.05250490084290504 0.008648550137877464 0.0137772997841239
-1033 -0.050034299492836 0.02766020037233829 0.01092400029301643
-1034 -0.04852849990129471 0.02461089938879013 0.01184660010039806
-1035 -0.0714339017868042 0.02256710082292557 0.00922986026853323
-1036 -0.07050620019435883 0.02553410083055496 0.008511349558830261
-1037 -0.04538270086050034 0.02588650025427341 0.01184049993753433
-1038 -0.07000400125980377 0.02070599980652332 0.009938470087945461
-1039 -0.04206240177154541 0.006407110020518303 0.01475249975919724
-1040 -0.04583590105175972 0.009469250217080116 0.01427050027996302
-1041 -0.06829860061407089 0.02321299910545349 0.009605560451745987
-1042 -0.0610244981944561 2.433429911305702e-18 0.01324700005352497
-1043 -0.06417589634656906 2.366190053672491e-18 0.01288089994341135
-1044 -0.05073710158467293 0.005801570136100054 0.01410149969160557
-1045 -0.04777970165014267 0.006960750091820955 0.0142815001308918
-1046 -0.05639449879527092 0.001865520025603473 0.01370839960873127
-1047 -0.05828579887747765 0.0191383995115757 0.01191489957273006
-1048 -0.05492119863629341 0.02148899994790554 0.01185320038348436
-1049 -0.05799710005521774 0.0287817008793354 0.00959389004856348
-1050 -0.05869489908218384 0.02588650025427341 0.01036449987441301
-1051 -0.06576450169086456 0.02173030003905296 0.01039099972695112
-1052 -0.06280150264501572 0.02281619980931282 0.01058079954236746
-1053 -0.06511040031909943 0.02457530051469803 0.009777969680726528
-1054 -0.06174720078706741 0.002155029913410544 0.01314069982618093
-1055 -0.06059230118989944 0.004900679923593998 0.01318090036511421
-1056 -0.06429090350866318 0.02729449979960918 0.009098149836063385
-1057 -0.05603739991784096 0.0274512991309166 0.01027119997888803
-1058 -0.05340909957885742 0.0275046993046999 0.01058380026370287
-1059 -0.06326880306005478 0.01260210014879704 0.01226949971169233
-1060 -0.04808799922466278 0.01156620029360056 0.01391729991883039
-1061 -0.05741000175476074 0.01592759974300861 0.01252369955182076
-1062 -0.05564479902386665 0.01816529966890812 0.01237520016729832
-1063 -0.05315230041742325 0.0186036005616188 0.0125652002170682
-1064 -0.06520780175924301 0.00832642987370491 0.01242929976433516
-1065 -0.06320369988679886 0.006997960153967142 0.01277120038866997
-1066 -0.06587880104780197 0.005797860212624073 0.01250459998846054
-1067 -0.04206240177154541 2.738250102934555e-18 0.01490630023181438
-1068 -0.05809219926595688 0.02280139923095703 0.01120579987764359
-1069 -0.05560459941625595 0.0249502994120121 0.01100050006061792
-1070 -0.06210190057754517 0.02544260025024414 0.01000710017979145
-1071 -0.04426740109920502 0.002564359921962023 0.01471239980310202
-1072 -0.07360920310020447 0.01245389971882105 0.01084769982844591
-1073 -0.06939119845628738 0.01100079994648695 0.01161570008844137
-1074 -0.07360920310020447 0.009351289831101894 0.01118880044668913
-1075 -0.06783690303564072 0.013349499553442 0.01156250014901161
-1076 -0.07063029706478119 0.01399639993906021 0.01106959953904152
-1077 -0.07169289886951447 0.0110828997567296 0.01127989962697029
-1078 -0.06757819652557373 0.01606719940900803 0.01121020037680864
-1079 -0.06618329882621765 0.01118679996579885 0.01204369962215424
-1080 -0.05052810162305832 0.002655569929629564 0.01422850042581558
-1081 -0.04838979989290237 2.650829933487195e-18 0.01443039998412132
-1082 -0.04522600024938583 2.694329914335287e-18 0.01466729957610369
-1083 -0.04734649881720543 0.003453030018135905 0.01445959974080324
-1084 -0.04463990032672882 0.006114080082625151 0.01456569973379374
-1085 -0.04397109895944595 0.02851950004696846 0.01128969993442297
-1086 -0.0469961017370224 0.02810450084507465 0.01110890042036772
-1087 -0.04206240177154541 0.02855500020086765 0.0114716999232769
-1088 -0.07360920310020447 0.02710920013487339 0.007297220174223185
-1089 -0.06800910085439682 0.03092649951577187 0.006844529882073402
-1090 -0.06266400218009949 0.03432239964604378 0.006280149798840284
-1091 -0.05932049825787544 0.03418590128421783 0.007088140118867159
-1092 -0.06098220124840736 0.03133039921522141 0.008144579827785492
-1093 -0.047867801040411 0.03303990140557289 0.009381289593875408
-1094 -0.04633560031652451 0.03719960153102875 0.007670970167964697
-1095 -0.04206240177154541 0.03664619848132133 0.008542969822883606
-1096 -0.04206240177154541 0.03903419896960258 0.007273389957845211
-1097 -0.04456660151481628 0.03923590108752251 0.006741509772837162
-1098 -0.04430339857935905 0.03638099879026413 0.008367990143597126
-1099 -0.05226949974894524 0.03642719984054565 0.007174340076744556
-1100 -0.06311129778623581 0.03645969927310944 0.00462319003418088
-1101 -0.06016189977526665 0.03714080154895782 0.004950790200382471
-1102 -0.06115270033478737 0.02807099930942059 0.009357010014355183
-1103 -0.06326819956302643 0.02958109974861145 0.008449910208582878
-1104 -0.06616920232772827 0.02914539910852909 0.008057739585638046
-1105 -0.06441099941730499 0.03143120184540749 0.007428899873048067
-1106 -0.06239540129899979 0.03793900087475777 0.003388579934835434
-1107 -0.04206240177154541 0.04126409813761711 0.005745130125433207
-1108 -0.06802830100059509 0.03586680069565773 0.003203490050509572
-1109 -0.06509540230035782 0.03549110144376755 0.004779169801622629
-1110 -0.06633470207452774 0.03379639983177185 0.005637399852275848
-1111 -0.04206240177154541 0.03416420146822929 0.009618230164051056
-1112 -0.04518989846110344 0.03420599922537804 0.009227380156517029
-1113 -0.0700519010424614 0.02855050005018711 0.007467410061508417
-1114 -0.07360920310020447 0.03173429891467094 0.004796879831701517
-1115 -0.06931819766759872 0.03336609899997711 0.005005769897252321
-1116 -0.07105039805173874 0.03122100047767162 0.005892099812626839
-1117 -0.05702260136604309 0.03187980130314827 0.008581089787185192
-1118 -0.07360920310020447 0.03365740180015564 0.003006160026416183
-1119 -0.0716807022690773 0.03311419859528542 0.00437651015818119
-1120 -0.04792949929833412 0.04191790148615837 0.003743960056453943
-1121 -0.04544829949736595 0.04099410027265549 0.005278119817376137
-1122 -0.04791650176048279 0.03977809846401215 0.005773440003395081
-1123 -0.0574336014688015 0.03724589943885803 0.00558914989233017
-1124 -0.0494266003370285 0.03688229992985725 0.007386900018900633
-1125 -0.04781030118465424 0.03510620072484016 0.008510979823768139
-1126 -0.05152999982237816 0.0390269011259079 0.005617740098387003
-1127 -0.05459199845790863 0.03836619853973389 0.005425769835710526
-1128 -0.05376389995217323 0.04050249978899956 0.003617529990151525
-1129 -0.05461210012435913 0.03604520112276077 0.006965099833905697
-1130 -0.05595429986715317 0.03451250120997429 0.007549609988927841
-1131 -0.05385150015354156 0.03249029815196991 0.008812930434942245
-1132 -0.05325689911842346 0.03465100005269051 0.007937449961900711
-1133 -0.0503958985209465 0.03367099910974503 0.008806750178337097
-1134 -0.04619500041007996 0.04339810088276863 0.001931519946083426
-1135 -0.05085580050945282 0.04124730080366135 0.003684059949591756
-1136 -0.05665789917111397 0.03970459848642349 0.003546270076185465
-1137 -0.05521789938211441 0.04115980118513107 0.001806269981898367
-1138 -0.05810470134019852 0.04031430184841156 0.001769160036928952
-1139 -0.0609733983874321 0.03940970078110695 0.001729459967464209
-1140 -0.06666889786720276 0.03735220059752464 0.001641980023123324
-1141 -0.07081639766693115 0.03475629910826683 0.003104310017079115
-1142 -0.0696633979678154 0.0361379012465477 0.001601750031113625
-1143 -0.05228950083255768 0.0419607013463974 0.00184923002962023
-1144 -0.04924729838967323 0.04269810020923615 0.001924050040543079
-1145 -0.04793719947338104 0.04339490085840225 0
-1146 -0.05086689814925194 0.04269950091838837 0
-1147 -0.05953650176525116 0.03885339945554733 0.003470249939709902
-1148 -0.06522669643163681 0.03694330155849457 0.003299640025943518
-1149 -0.06381890177726746 0.03843459859490395 0.001687149982899427
-1150 -0.06523910164833069 0.03824169933795929 0
-1151 -0.04499879851937294 0.04405229911208153 0
-1152 -0.07360920310020447 0.03484470024704933 0
-1153 -0.04499499872326851 0.04255209863185883 0.003800600068643689
-1154 -0.04206240177154541 0.04429110139608383 0.002057119971141219
-1155 -0.07082059979438782 0.0359807014465332 0
-1156 -0.07572150230407715 0.02072739973664284 0.008880959823727608
-1157 -0.07360920310020447 0.01860979944467545 0.009819650091230869
-1158 -0.07900740206241608 0.01817500032484531 0.008822419680655003
-1159 -0.07521550357341766 0.01694630086421967 0.009827770292758942
-1160 -0.07745420187711716 0.0157868005335331 0.009613920003175735
-1161 -0.07670559734106064 0.01860979944467545 0.009188540279865265
-1162 -0.07644719630479813 0.02362200058996677 0.007873980328440666
-1163 -0.07861369848251343 0.02077849954366684 0.008252359926700592
-1164 -0.07934729754924774 0.01297799963504076 0.00972019974142313
-1165 -0.08301530033349991 0.01846889965236187 0.007850020192563534
-1166 -0.0761101022362709 0.007618620060384274 0.01089289970695972
-1167 -0.07648830115795135 0.01084509957581758 0.01051659975200891
-1168 -0.08211240172386169 0.02156239934265614 0.007187460083514452
-1169 -0.08367069810628891 0.007078300230205059 0.009546499699354172
-1170 -0.08073829859495163 0.01912290044128895 0.008224169723689556
-1171 -0.08755730092525482 0.01902740076184273 0.006342470180243254
-1172 -0.08547879755496979 0.01768480055034161 0.007382909767329693
-1173 -0.08403349667787552 0.01604489982128143 0.0081632100045681
-1174 -0.07627560198307037 0.0133170997723937 0.01023480016738176
-1175 -0.08772770315408707 0.0166506003588438 0.006984000094234943
-1176 -0.07803139835596085 0.002766340039670467 0.01083160005509853
-1177 -0.07658530026674271 2.041400067695383e-18 0.01111279986798763
-1178 -0.07587070018053055 0.004208929836750031 0.01113899983465672
-1179 -0.07554709911346436 0.002019919920712709 0.01126249972730875
-1180 -0.07831119745969772 0.005692929960787296 0.01065209973603487
-1181 -0.0792125016450882 0.008995460346341133 0.0102335000410676
-1182 -0.08605910092592239 0.005213209893554449 0.009146310389041901
-1183 -0.08369000256061554 0.001962790032848716 0.00982144009321928
-1184 -0.08574660122394562 0.002698659896850586 0.009344819933176041
-1185 -0.08345899730920792 0.004442209843546152 0.009771949611604214
-1186 -0.0854853019118309 1.737209980898141e-18 0.009456920437514782
-1187 -0.08802050352096558 0.003232290036976337 0.008783649653196335
-1188 -0.09264770150184631 0.004888160154223442 0.00748638017103076
-1189 -0.09034500271081924 0.002492289990186691 0.008227069862186909
-1190 -0.09134499728679657 1.471089951215464e-18 0.008008229546248913
-1191 -0.09283620119094849 0.001887719961814582 0.00758109986782074
-1192 -0.09572289884090424 0.005757160019129515 0.006483600009232759
-1193 -0.09761639684438705 0.00446499977260828 0.005857029929757118
-1194 -0.08925680071115494 0.00582179008051753 0.008318499661982059
-1195 -0.08631029725074768 0.008611209690570831 0.008790330030024052
-1196 -0.09574919939041138 0.002563929883763194 0.006693180184811354
-1197 -0.09711319953203201 1.146479980419162e-18 0.006241159979254007
-1198 -0.09280969947576523 0.01614709943532944 0.00538235018029809
-1199 -0.09812109917402267 0.002015999983996153 0.005784019827842712
-1200 -0.09989819675683975 0.002727970015257597 0.004996399860829115
-1201 -0.0918503999710083 0.01409259997308254 0.006320650223642588
-1202 -0.08876349776983261 0.01463500037789345 0.007161359768360853
-1203 -0.09020440280437469 0.01762159913778305 0.005873870104551315
-1204 -0.09386640042066574 0.008756609633564949 0.006719150114804506
-1205 -0.09129290282726288 0.007275059819221497 0.007647430058568716
-1206 -0.09347940236330032 0.01180600002408028 0.006305519957095385
-1207 -0.09630150347948074 0.01114779990166426 0.005403569899499416
-1208 -0.09535039961338043 0.01457520015537739 0.004858389962464571
-1209 -0.09818500280380249 0.01031020004302263 0.004667120054364204
-1210 -0.08986149728298187 0.01230479963123798 0.0073187998495996
-1211 -0.08703199774026871 0.01217000000178814 0.008121980354189873
-1212 -0.0811678022146225 0.01621749997138977 0.008792189881205559
-1213 -0.08344220370054245 0.0131844999268651 0.008846630342304707
-1214 -0.0861537978053093 0.01490209996700287 0.007846199907362461
-1215 -0.08507160097360611 0.01103250030428171 0.008788649924099445
-1216 -0.08116059750318527 0.002817580010741949 0.01028919965028763
-1217 -0.0796298012137413 0.004323429893702269 0.01050010044127703
-1218 -0.08101599663496017 0.005968289915472269 0.01015789993107319
-1219 -0.08155269920825958 0.0106952004134655 0.009606449864804745
-1220 -0.08364570140838623 0.009986789897084236 0.009255110286176205
-1221 -0.08181949704885483 0.00858002994209528 0.009789059869945049
-1222 -0.09989819675683975 0.008136910386383533 0.004293520003557205
-1223 -0.0975584015250206 0.007830499671399593 0.005478859879076481
-1224 -0.09163209795951843 0.01121679972857237 0.006997569929808378
-1225 -0.08997459709644318 0.009524459950625896 0.00773447984829545
-1226 -0.09989819675683975 0.01077309995889664 0.003591019893065095
-1227 -0.07608009874820709 0.030790900811553 0.004466310143470764
-1228 -0.07360920310020447 0.02949629910290241 0.006183530203998089
-1229 -0.07592450082302094 0.02874059975147247 0.005837580189108849
-1230 -0.07867439836263657 0.02950309962034225 0.004375330172479153
-1231 -0.07929349690675735 0.02262590080499649 0.00754196010529995
-1232 -0.07788030058145523 0.02781550027430058 0.005721270106732845
-1233 -0.08024299889802933 0.02781949937343597 0.004913929849863052
-1234 -0.07851579785346985 0.02560560032725334 0.006602670066058636
-1235 -0.07599770277738571 0.02639289945363998 0.006943069864064455
-1236 -0.07360920310020447 0.02463890053331852 0.008212979882955551
-1237 -0.09604260325431824 0.0192416999489069 0.001718600047752261
-1238 -0.09784310311079025 0.01537119969725609 0.003010639920830727
-1239 -0.09550879895687103 0.01765060052275658 0.003460499923676252
-1240 -0.09413199871778488 0.01959419995546341 0.003131039906293154
-1241 -0.08162839710712433 0.02971759997308254 0.002654270036146045
-1242 -0.09150280058383942 0.02308440022170544 0.002061810111626983
-1243 -0.09002210199832916 0.02048690058290958 0.004808200057595968
-1244 -0.09198310226202011 0.02112060040235519 0.003447589930146933
-1245 -0.09257309883832932 0.01894240081310272 0.004371029790490866
-1246 -0.0828080028295517 0.02693199925124645 0.004449690226465464
-1247 -0.08120790123939514 0.02505549974739552 0.006068849936127663
-1248 -0.08352869749069214 0.02452420070767403 0.005537979770451784
-1249 -0.08467060327529907 0.02600640058517456 0.004193120170384645
-1250 -0.08420579880475998 0.028227299451828 0.002521160058677197
-1251 -0.09989819675683975 0.01471630018204451 0.001314410008490086
-1252 -0.08648359775543213 0.02461840026080608 0.004197690170258284
-1253 -0.08912249654531479 0.02487130090594292 0.002221409929916263
-1254 -0.08949069678783417 0.02283089980483055 0.003755619982257485
-1255 -0.09768500179052353 0.01274089980870485 0.004246970172971487
-1256 -0.08486650139093399 0.02035650052130222 0.00678551010787487
-1257 -0.08721870183944702 0.02197379991412163 0.005306450184434652
-1258 -0.08495870232582092 0.02291879989206791 0.005759479943662882
-1259 -0.09800489991903305 0.01700880005955696 0.001519159995950758
-1260 -0.09989819675683975 0.01523539982736111 0
-1261 -0.09801899641752243 0.0175905991345644 0
-1262 -0.09386850148439407 0.02194250002503395 0
-1263 -0.09607250243425369 0.01988920010626316 0
-1264 -0.09382879734039307 0.02122779935598373 0.001895989989861846
-1265 -0.09154680371284485 0.02386349998414516 0
-1266 -0.08669310063123703 0.02659150026738644 0.002375059993937612
-1267 -0.07897190004587173 0.0310639999806881 0.002774530090391636
-1268 -0.07628340274095535 0.03234609961509705 0.002889039926230907
-1269 -0.07629629969596863 0.03348080068826675 0
-1270 -0.07360920310020447 0.03451130166649818 0.001602889969944954
-1271 -0.1049389988183975 0.00143585994374007 0.0004786190111190081
-1272 -0.1051559969782829 0 0
-1273 -0.1048099994659424 0.00352071993984282 0
-1274 -0.1049700006842613 0.001654869993217289 0
-1275 -0.1041560024023056 0.005985530093312263 0.000893443007953465
-1276 -0.1026460006833076 0.01012500002980232 0
-1277 -0.1023819968104362 0.01062010042369366 0.001240620040334761
-1278 -0.1013199985027313 0.01257339958101511 0
-1279 -0.09989819675683975 0.01289690006524324 0.00270366994664073
-1280 -0.1047040000557899 0.003093079896643758 0.001031029969453812
-1281 -0.1037480011582375 0.007812789641320705 0
-1282 -0.1039540022611618 0.00697069987654686 0.0007944750250317156
-1283 -0.1044749990105629 0.005594640038907528 0
-1284 -0.1014880016446114 0.008674999698996544 0.002891669981181622
-1285 -0.1047499999403954 2.475940015454509e-19 0.00134783994872123
-1286 -0.1042170003056526 0.002381250029429793 0.00220121000893414
-1287 -0.1031889989972115 0.004344699904322624 0.002883200068026781
-1288 -0.1040839999914169 0.004909549839794636 0.001636520028114319
-1289 -0.1026910021901131 0.001905909972265363 0.003431669902056456
-1290 -0.1029379963874817 0.006756430026143789 0.002252140082418919
-1291 -0.1015049964189529 0.003711950033903122 0.00404332997277379
-1292 -0.09989819675683975 0.005445300135761499 0.004743029829114676
-1293 -0.101173996925354 0.001684430055320263 0.004310640040785074
-1294 -0.1016630008816719 0.006239550188183784 0.003568350104615092
-1295 0.1459790021181107 -0.0005871389876119792 0.0001957130007212982
-1296 0.1439120024442673 1.353559968031473e-19 0.0007368429796770215
-1297 0.1456490010023117 6.43826013140419e-20 0.0003504829946905375
-1298 0.1446350067853928 -0.001223520026542246 0.0004078400088474154
-1299 0.141292005777359 -0.001332690007984638 0.001226949971169233
-1300 0.1415839940309525 -0.002637750003486872 0.0008792509906925261
-1301 0.1472180038690567 0 0
-1302 0.1415870040655136 -0.003728110110387206 0
-1303 0.1459809988737106 -0.0008288960088975728 0
-1304 0.1446390002965927 -0.001727230031974614 0
-1305 0.1431739926338196 -0.001906960038468242 0.0006356519879773259
-1306 0.1398569941520691 -0.004682010039687157 0.0004181799886282533
-1307 0.1194830015301704 -0.01414269953966141 0.003044419921934605
-1308 0.1205129995942116 -0.01569150015711784 0.00140149996150285
-1309 0.125790998339653 -0.009379340335726738 0.003126450115814805
-1310 0.1231769993901253 -0.01042350009083748 0.00347450003027916
-1311 0.1221079975366592 -0.01356980018317699 0.002402809914201498
-1312 0.1231940016150475 -0.01422919984906912 0.001270900014787912
-1313 0.1398569941520691 -0.003427470102906227 0.001142489956691861
-1314 0.1377740055322647 -0.004363290034234524 0.001454430050216615
-1315 0.1377879977226257 -0.005951569881290197 0.0005315730231814086
-1316 0.130838006734848 -0.007346579805016518 0.002448860090225935
-1317 0.1308770030736923 -0.0100143002346158 0.0008944440050981939
-1318 0.1332949995994568 -0.008650409989058971 0.0007726229960098863
-1319 0.1283459961414337 -0.008354759775102139 0.002784919925034046
-1320 0.1205049976706505 -0.01149039994925261 0.003830119967460632
-1321 0.1209189966320992 -0.008143319748342037 0.00460866978392005
-1322 0.1177750006318092 -0.01258429978042841 0.004194770008325577
-1323 0.1177750006318092 -0.006360809784382582 0.005540459882467985
-1324 0.1349570006132126 4.869249857593799e-19 0.0026507000438869
-1325 0.1332560032606125 -0.006348739843815565 0.002116250107064843
-1326 0.135576993227005 -0.005351929925382137 0.001783980056643486
-1327 0.1320749968290329 -0.004870919976383448 0.002834920072928071
-1328 0.1341399997472763 -0.004587590228766203 0.00240837992168963
-1329 0.1307950019836426 -0.002636840101331472 0.00340001005679369
-1330 0.13230100274086 5.842109900714486e-19 0.003180299885571003
-1331 0.1290609985589981 -0.005545329768210649 0.00336733995936811
-1332 0.1334480047225952 -0.002557849977165461 0.002874820027500391
-1333 0.1263049989938736 -0.00494092982262373 0.004034049808979034
-1334 0.126690000295639 -0.007306700106710196 0.003513999981805682
-1335 0.1242299973964691 -0.00726898992434144 0.004070079885423183
-1336 0.1220619976520538 -0.005647509824484587 0.004782239906489849
-1337 0.1267140060663223 7.802249812984191e-19 0.00424735015258193
-1338 0.1280360072851181 -0.002563710091635585 0.003936000168323517
-1339 0.1250810027122498 -0.002479070099070668 0.004499710164964199
-1340 0.1238069981336594 8.808520198033777e-19 0.004795129876583815
-1341 0.1240030005574226 -0.004559630062431097 0.004533300176262856
-1342 0.1208280026912689 9.83840969149905e-19 0.005355780012905598
-1343 0.1196409985423088 -0.002150869928300381 0.005536709912121296
-1344 0.1221190020442009 -0.002742710057646036 0.005041699856519699
-1345 0.1198510006070137 -0.004667410161346197 0.005324069876223803
-1346 0.136011004447937 -0.002899759914726019 0.002270499942824244
-1347 0.138156995177269 -0.002688510110601783 0.001775569980964065
-1348 0.1398569941520691 -0.001732429955154657 0.001508999965153635
-1349 0.1374810039997101 3.893650037187972e-19 0.002119610086083412
-1350 0.1377899944782257 -0.006160289980471134 0
-1351 0.1356070041656494 -0.007292489986866713 0.0006513390108011663
-1352 0.1258170008659363 -0.01279820036143064 0.001143089961260557
-1353 0.1283800005912781 -0.0113944998010993 0.001017719972878695
-1354 0.1177750006318092 -0.01719049923121929 0.001535390038043261
-1355 0.09460639953613281 -0.02789999917149544 0.002491920022293925
-1356 0.09757349640130997 -0.02760479971766472 0
-1357 0.1004849970340729 -0.02541290037333965 0.002269790042191744
-1358 0.1034210026264191 -0.0249623004347086 0
-1359 0.1005050018429756 -0.02630040049552917 0
-1360 0.1149049997329712 -0.01858679950237274 0.001660099951550364
-1361 0.1149090006947517 -0.01924050040543079 0
-1362 0.1120420023798943 -0.01999549940228462 0.001785930013284087
-1363 0.1120499968528748 -0.02069680020213127 0
-1364 0.1062989979982376 -0.02278020046651363 0.002034649951383471
-1365 0.1063150018453598 -0.02357620000839233 0
-1366 0.1091879978775978 -0.02214800007641315 0
-1367 0.1034030020236969 -0.02411999925971031 0.002154310001060367
-1368 0.09164629876613617 -0.02909360080957413 0.002598539926111698
-1369 0.08869119733572006 -0.03131350129842758 0
-1370 0.09462709724903107 -0.02887539938092232 0
-1371 0.09166619926691055 -0.03011170029640198 0
-1372 0.08569779992103577 -0.03246879950165749 0
-1373 0.08267179876565933 -0.03243149816989899 0.002896670019254088
-1374 0.07965130358934402 -0.03346430137753487 0.002988910069689155
-1375 0.07663190364837646 -0.03570380061864853 0
-1376 0.1177750006318092 -0.01506519969552755 0.003158230101689696
-1377 0.08965060114860535 -0.027768699452281 0.004515930078923702
-1378 0.0886726975440979 -0.03025360032916069 0.002702150028198957
-1379 0.07601939886808395 -0.02837689965963364 0.007338370196521282
-1380 0.07360920310020447 -0.02861499972641468 0.007702549919486046
-1381 0.07360920310020447 -0.03552690148353577 0.003173140110448003
-1382 0.08280190080404282 -0.02970900014042854 0.00516403978690505
-1383 0.07662779837846756 -0.03448859974741936 0.003080399939790368
-1384 0.07360920310020447 -0.03349699825048447 0.005063329823315144
-1385 0.0763327032327652 -0.03206820040941238 0.005306920036673546
-1386 0.08453969657421112 -0.02624469995498657 0.006600390188395977
-1387 0.08557070046663284 -0.02299249917268753 0.007664170116186142
-1388 0.09075400233268738 -0.02456980012357235 0.005998040083795786
-1389 0.08763349801301956 -0.02550549991428852 0.006276419851928949
-1390 0.08649670332670212 -0.0288442000746727 0.004724100232124329
-1391 0.08258520066738129 -0.0237635001540184 0.007921149954199791
-1392 0.0927995964884758 -0.02640240080654621 0.004465760197490454
-1393 0.07937580347061157 -0.03152310103178024 0.004857339896261692
-1394 0.07779330015182495 -0.03296079859137535 0.004201999865472317
-1395 0.09755279868841171 -0.02667300030589104 0.00238232989795506
-1396 0.09580189734697342 -0.02589520066976547 0.003839429933577776
-1397 0.09709160029888153 -0.02200689911842346 0.005655020009726286
-1398 0.09466250240802765 -0.02377660013735294 0.005432100035250187
-1399 0.07692079991102219 -0.03055479936301708 0.006085710134357214
-1400 0.08568160235881805 -0.0313681997358799 0.002801700029522181
-1401 0.1134359985589981 -0.01726749911904335 0.003349999897181988
-1402 0.07959330081939697 -0.02451189979910851 0.008170640096068382
-1403 0.07659979909658432 -0.02525440044701099 0.0084181297570467
-1404 0.07926689833402634 -0.02911989949643612 0.006330470088869333
-1405 0.07852110266685486 -0.02700489945709705 0.007439199835062027
-1406 0.08110480010509491 -0.02688989974558353 0.007000360172241926
-1407 0.1157540008425713 -0.01668659970164299 0.002892140066251159
-1408 0.1102569997310638 -0.01844549924135208 0.003739049891009927
-1409 0.09951160103082657 -0.02143719978630543 0.005314980167895555
-1410 0.09828480333089828 -0.02426790073513985 0.004135540220886469
-1411 0.1091760024428368 -0.02139919996261597 0.00191130000166595
-1412 0.1076150014996529 -0.01814839988946915 0.004663969855755568
-1413 0.1071870028972626 -0.0204003993421793 0.003626760095357895
-1414 0.1090909987688065 -0.0156955998390913 0.005231880117207766
-1415 0.1051679998636246 -0.01936580054461956 0.004786009900271893
-1416 0.1061889976263046 -0.01671439968049526 0.005571459885686636
-1417 0.1043630018830299 -0.02182050049304962 0.003704240079969168
-1418 0.1014460027217865 -0.02297599986195564 0.003940260037779808
-1419 0.1023819968104362 -0.02040250040590763 0.005052039865404367
-1420 0.1125620007514954 -0.006267180200666189 0.006473570130765438
-1421 0.07360920310020447 -0.01169160008430481 0.01162409968674183
-1422 0.1101450026035309 -0.003181949956342578 0.007134309969842434
-1423 0.1146629974246025 -0.008087689988315105 0.005858960095793009
-1424 0.1177750006318092 -0.009504949674010277 0.005015380214899778
-1425 0.08368030190467834 -0.02059270069003105 0.008673559874296188
-1426 0.08993580192327499 -0.01309460029006004 0.009269280359148979
-1427 0.08934620022773743 -0.01528779976069927 0.008982320316135883
-1428 0.09159749746322632 -0.01435989979654551 0.008803900331258774
-1429 0.07989820092916489 -0.01693519949913025 0.01002870034426451
-1430 0.07855120301246643 -0.007348570041358471 0.01140940003097057
-1431 0.08147899806499481 -0.01176759973168373 0.01061690039932728
-1432 0.0944627970457077 -0.02046719938516617 0.006822419818490744
-1433 0.1003459990024567 -0.01864789985120296 0.006215959787368774
-1434 0.09499520063400269 -0.005734960082918406 0.009357980452477932
-1435 0.07677450031042099 2.183150080160685e-18 0.01188450027257204
-1436 0.07617779821157455 -0.002378229983150959 0.01192689966410398
-1437 0.09740900248289108 -0.01957049965858459 0.006523489952087402
-1438 0.09771890193223953 -0.01702209934592247 0.007198739796876907
-1439 0.1003570035099983 -0.01658320054411888 0.006817180197685957
-1440 0.07924660295248032 -0.01400389987975359 0.01060259994119406
-1441 0.08183430135250092 -0.01422910019755363 0.01022959966212511
-1442 0.08388320356607437 -0.01225700043141842 0.01024159975349903
-1443 0.09318219870328903 -0.01185590028762817 0.008967489935457706
-1444 0.09677570313215256 -0.0112490002065897 0.008498609997332096
-1445 0.09758669883012772 -0.008299100212752819 0.008745459839701653
-1446 0.09790199995040894 -0.005344749893993139 0.008956920355558395
-1447 0.1008619964122772 -0.007652999833226204 0.008304299786686897
-1448 0.1004199981689453 -0.01015160046517849 0.00807156041264534
-1449 0.1017699986696243 -0.01456489972770214 0.007045490201562643
-1450 0.100101999938488 -0.01246370002627373 0.007759260013699532
-1451 0.1052000001072884 1.47678002325164e-18 0.008039209991693497
-1452 0.1072359979152679 -0.002435399917885661 0.007655439898371696
-1453 0.09292220324277878 -0.01598010025918484 0.008275790140032768
-1454 0.09501910209655762 -0.01482160016894341 0.008167180232703686
-1455 0.09426140040159225 -0.01812360063195229 0.007542020175606012
-1456 0.0789652019739151 -0.01067289989441633 0.01106049958616495
-1457 0.07639169692993164 -0.01286789961159229 0.01112610008567572
-1458 0.07598350197076797 -0.009061769582331181 0.01158639974892139
-1459 0.07861500233411789 -0.001827129977755249 0.01165109965950251
-1460 0.0761013999581337 -0.005353330168873072 0.01182689983397722
-1461 0.08512409776449203 -0.01776549965143204 0.009124130010604858
-1462 0.0814765989780426 -0.009108800441026688 0.01090519968420267
-1463 0.08128619939088821 -0.005810500122606754 0.01117969956248999
-1464 0.08477009832859039 -0.004847459960728884 0.01080489996820688
-1465 0.0828889012336731 -0.01697029918432236 0.00960887037217617
-1466 0.08081989735364914 -0.01975589990615845 0.009307810105383396
-1467 0.07870610058307648 -0.004185429774224758 0.01156990043818951
-1468 0.08418770134449005 -0.0152252996340394 0.009747940115630627
-1469 0.08109410107135773 -0.02222900092601776 0.008629250340163708
-1470 0.08156280219554901 -0.002565490081906319 0.01128599978983402
-1471 0.08780390024185181 -0.01767480000853539 0.008735040202736855
-1472 0.08910650014877319 -0.0198173001408577 0.007996199652552605
-1473 0.08667249977588654 -0.02023999951779842 0.008291530422866344
-1474 0.08854480087757111 -0.02218309976160526 0.007394359912723303
-1475 0.1086869984865189 -0.01343549974262714 0.005961619783192873
-1476 0.1041010022163391 -0.003135510021820664 0.008134219795465469
-1477 0.09867569804191589 -0.01447129994630814 0.00761824008077383
-1478 0.08677030354738235 -0.01460300013422966 0.009489229880273342
-1479 0.09093110263347626 -0.009681710042059422 0.009582109749317169
-1480 0.09441179782152176 -0.008996360003948212 0.009149120189249516
-1481 0.1152120009064674 -0.01110769994556904 0.005170059856027365
-1482 0.08310569822788239 2.046360049443404e-18 0.01113990042358637
-1483 0.115557000041008 -0.005124089773744345 0.006064279936254025
-1484 0.1177750006318092 -0.003186620073392987 0.005836430005729198
-1485 0.1148779988288879 -0.01361619960516691 0.004538749810308218
-1486 0.09216450154781342 -0.006234900094568729 0.009727519936859608
-1487 0.09361959993839264 -0.002929080044850707 0.009705459699034691
-1488 0.1119849979877472 -0.01465809997171164 0.00488603999838233
-1489 0.07360920310020447 -0.02035919949412346 0.0102105000987649
-1490 0.07803229987621307 -0.01906700059771538 0.009859840385615826
-1491 0.08943019807338715 1.899349995462876e-18 0.01033960003405809
-1492 0.08486899733543396 -0.002047500107437372 0.01089819986373186
-1493 0.08745899796485901 -0.002929650014266372 0.01054409984499216
-1494 0.1027790009975433 -0.01143919955939054 0.007479600142687559
-1495 0.1047910004854202 -0.01383879967033863 0.006643760018050671
-1496 0.1114889979362488 1.284810014641865e-18 0.006994190160185099
-1497 0.1142970025539398 -0.002468730090186 0.006461539771407843
-1498 0.1032740026712418 -0.01769939996302128 0.00589981023222208
-1499 0.07672259956598282 -0.01627550087869167 0.01057459972798824
-1500 0.09150800108909607 -0.02133809961378574 0.007112709805369377
-1501 0.09093510359525681 -0.01760680042207241 0.008243010379374027
-1502 0.07360920310020447 -0.02320319972932339 0.009512510150671005
-1503 0.07690659910440445 -0.02318619936704636 0.009005050174891949
-1504 0.07866139709949493 -0.02163979969918728 0.009159790351986885
-1505 0.07606910169124603 -0.02102340012788773 0.009697410278022289
-1506 0.1092690005898476 -0.006366820074617863 0.007040690165013075
-1507 0.1070899963378906 -0.004788630176335573 0.00754904979839921
-1508 0.1020509973168373 1.567309978211894e-18 0.00853206031024456
-1509 0.1009149998426437 -0.002092130016535521 0.008667130023241043
-1510 0.1010940000414848 -0.004657519981265068 0.008518540300428867
-1511 0.1038779988884926 -0.006213909946382046 0.007962710224092007
-1512 0.1060359999537468 -0.01094590034335852 0.006988000124692917
-1513 0.0756084993481636 -0.01887339912354946 0.01024060044437647
-1514 0.09613849967718124 -0.003326599951833487 0.00932942982763052
-1515 0.09574499726295471 1.738880058554886e-18 0.009466029703617096
-1516 0.1098409965634346 -0.009499849751591682 0.006530529819428921
-1517 0.1065870001912117 -0.007857689633965492 0.007339990232139826
-1518 0.1034109964966774 -0.008962330408394337 0.00774070993065834
-1519 0.09843099862337112 -0.002544489922001958 0.009024379774928093
-1520 0.08838470280170441 -0.006721199955791235 0.01021530013531446
-1521 0.09054230153560638 -0.003051579929888248 0.01012740004807711
-1522 0.1130390018224716 -0.009568469598889351 0.005917599890381098
-1523 0.1122739985585213 -0.01212240010499954 0.00553649989888072
-1524 0.08750779926776886 -0.01090210024267435 0.009924129582941532
-1525 0.08448260277509689 -0.008376809768378735 0.01059310045093298
-1526 0.03182090073823929 -0.02820540033280849 0.01232129987329245
-1527 0.02944369986653328 -0.02727239951491356 0.01271000038832426
-1528 0.03576400130987167 2.810639987061521e-18 0.01530039962381124
-1529 0.06514529883861542 -0.02428030036389828 0.01030869968235493
-1530 0.06692910194396973 -0.02207970060408115 0.0106258001178503
-1531 0.07360920310020447 -0.02600749954581261 0.008669169619679451
-1532 0.07120350003242493 -0.02460060082376003 0.009432559832930565
-1533 0.03580699861049652 -0.03245240077376366 0.01081749983131886
-1534 0.03668290004134178 -0.03004099987447262 0.01150050014257431
-1535 0.03861400112509727 -0.02792119979858398 0.01194579992443323
-1536 0.03514460101723671 -0.02731529995799065 0.01232740003615618
-1537 0.06843700259923935 -0.02467980049550533 0.009776829741895199
-1538 0.07048369944095612 -0.02667099982500076 0.008890350349247456
-1539 0.07042050361633301 -0.02212999947369099 0.01018480025231838
-1540 0.03301560133695602 -0.03061450086534023 0.01158410031348467
-1541 0.02944369986653328 -0.02428949996829033 0.01336540002375841
-1542 0.03241910040378571 -0.02573899924755096 0.01286830008029938
-1543 0.02944369986653328 -0.003053959924727678 0.01559329964220524
-1544 0.05619059875607491 -0.01704059913754463 0.01269690040498972
-1545 0.05598419904708862 -0.02011729963123798 0.01220810040831566
-1546 0.04574229940772057 -0.007007549982517958 0.01451960019767284
-1547 0.04390779882669449 -0.009081129916012287 0.01451320014894009
-1548 0.06419359892606735 -0.01014690008014441 0.01275250036269426
-1549 0.03729290142655373 -0.0185650996863842 0.01389109995216131
-1550 0.04738499969244003 -0.02082630060613155 0.01282699964940548
-1551 0.06185739859938622 -0.008478119969367981 0.01311769988387823
-1552 0.05688200145959854 -0.009310140274465084 0.01350480038672686
-1553 0.05949569866061211 -0.01033340021967888 0.01318920031189919
-1554 0.06449290364980698 -0.007546150125563145 0.01292429957538843
-1555 0.04407069832086563 -0.02618589997291565 0.01197469979524612
-1556 0.03625470027327538 -0.01566679961979389 0.01434149965643883
-1557 0.03747230023145676 -0.02313769981265068 0.01309730019420385
-1558 0.0385906994342804 -0.02110379934310913 0.01340360008180141
-1559 0.03538199886679649 -0.02137340046465397 0.01355060003697872
-1560 0.03791550174355507 -0.02553319931030273 0.01256689988076687
-1561 0.03522200137376785 -0.02437339909374714 0.01298729982227087
-1562 0.02944369986653328 -0.01826870068907738 0.0143911000341177
-1563 0.02944369986653328 -0.01523919962346554 0.01477780006825924
-1564 0.03357879817485809 -0.01478559989482164 0.01459410041570663
-1565 0.03286109864711761 -0.02326860092580318 0.01335300039499998
-1566 0.03183859959244728 -0.02044459991157055 0.01391690038144588
-1567 0.07061489671468735 -0.01555259991437197 0.01143379975110292
-1568 0.04261590167880058 -0.01884559914469719 0.01351370010524988
-1569 0.041457898914814 -0.02126039937138557 0.01319089997559786
-1570 0.06875450164079666 -0.01173240039497614 0.01212510000914335
-1571 0.06820099800825119 -0.002789620077237487 0.01276810001581907
-1572 0.03140980005264282 -0.0142238000407815 0.01477690041065216
-1573 0.03694719821214676 -0.01031369995325804 0.01483509968966246
-1574 0.0346623994410038 -0.01052779983729124 0.01494169980287552
-1575 0.06751959770917892 -0.01640450023114681 0.01164320018142462
-1576 0.04002029821276665 -0.01880759932100773 0.01368930004537106
-1577 0.04141119867563248 -0.01646599918603897 0.01393330004066229
-1578 0.03893639892339706 -0.01621190086007118 0.01411859970539808
-1579 0.06184329837560654 -0.01097240019589663 0.01290920004248619
-1580 0.0439119003713131 -0.02879359945654869 0.01131189987063408
-1581 0.04212610051035881 -0.01149229984730482 0.01443529967218637
-1582 0.04277700185775757 -0.02387039922177792 0.01259359996765852
-1583 0.04549140110611916 -0.02370980009436607 0.01241749990731478
-1584 0.04291310161352158 -0.005550200119614601 0.01477930042892694
-1585 0.03990510106086731 -0.02362109906971455 0.01284500025212765
-1586 0.06656250357627869 -0.01412069983780384 0.0120734004303813
-1587 0.0661081001162529 -0.01175540033727884 0.01239980012178421
-1588 0.06367009878158569 -0.01329679973423481 0.01247849967330694
-1589 0.04527610167860985 -0.01839490048587322 0.01339189987629652
-1590 0.04413989931344986 -0.02129519917070866 0.01299399975687265
-1591 0.03937840089201927 -0.01061780005693436 0.01467499975115061
-1592 0.0379347987473011 -0.01336229965090752 0.01450490020215511
-1593 0.06450860202312469 -0.004615969955921173 0.01307910028845072
-1594 0.03262009844183922 -0.01203809957951307 0.01492480002343655
-1595 0.03544630110263824 -0.01276149973273277 0.01470329985022545
-1596 0.04045270010828972 -0.01383389998227358 0.01430770009756088
-1597 0.04351279884576797 -0.01666419953107834 0.01376709993928671
-1598 0.04552070051431656 -0.01539320033043623 0.01378860045224428
-1599 0.04292890056967735 -0.01430440042167902 0.01409879978746176
-1600 0.04481149837374687 -0.0122103001922369 0.01418989989906549
-1601 0.06499490141868591 -0.002032639924436808 0.01310800015926361
-1602 0.06898870319128036 -0.02025719918310642 0.01077730022370815
-1603 0.06974609941244125 -0.01810950040817261 0.01110680028796196
-1604 0.04841019958257675 -0.01353720016777515 0.01379179954528809
-1605 0.04777229949831963 -0.01730399951338768 0.01336419954895973
-1606 0.0645378977060318 -0.02068999968469143 0.01120890025049448
-1607 0.06689950078725815 -0.0190872997045517 0.01125190034508705
-1608 0.05677349865436554 -0.0233989991247654 0.01146710012108088
-1609 0.04037069901823997 -0.02975150011479855 0.0113207995891571
-1610 0.04121740162372589 -0.02657910063862801 0.01209769956767559
-1611 0.0541330985724926 -0.01151440013200045 0.01354559976607561
-1612 0.0343221016228199 -0.01806179992854595 0.01413580030202866
-1613 0.03166859969496727 -0.01674629934132099 0.0144651997834444
-1614 0.03737229853868484 -0.006936879828572273 0.01503170002251863
-1615 0.0353224016726017 -0.008361480198800564 0.01505929976701736
-1616 0.03966429829597473 -0.005288609769195318 0.01498270034790039
-1617 0.041024100035429 -0.008145060390233994 0.01475679967552423
-1618 0.0407366007566452 -0.002911129966378212 0.01499820034950972
-1619 0.06101410090923309 2.482570023160486e-18 0.01351450011134148
-1620 0.06259670108556747 -0.002644400112330914 0.01332959998399019
-1621 0.07123389840126038 -0.01302780024707317 0.01171370036900043
-1622 0.06894669681787491 -0.0139964995905757 0.01183409988880157
-1623 0.07360920310020447 -0.01459669973701239 0.01125319954007864
-1624 0.07360920310020447 -0.01748769916594028 0.01078560017049313
-1625 0.02944369986653328 -0.006106450222432613 0.01549329981207848
-1626 0.03171379864215851 -0.003382859984412789 0.01546410005539656
-1627 0.03491149842739105 -0.003250449895858765 0.01530210021883249
-1628 0.06144170090556145 -0.01878960058093071 0.01190720032900572
-1629 0.03150599822402 -0.006717420183122158 0.01535269990563393
-1630 0.03273690119385719 -0.009054849855601788 0.01515179965645075
-1631 0.02944369986653328 -0.009155970066785812 0.01532549969851971
-1632 0.06480000168085098 -0.01690159924328327 0.01186269987374544
-1633 0.06740409880876541 -0.006638600025326014 0.0126868998631835
-1634 0.07094830274581909 -0.0197443999350071 0.0106527004390955
-1635 0.03424689918756485 -0.005846419837325811 0.01524860039353371
-1636 0.03748349845409393 -0.003503710031509399 0.01516180019825697
-1637 0.05155399814248085 2.627820043592654e-18 0.01430520042777061
-1638 0.04954009875655174 -0.02764669992029667 0.01112260017544031
-1639 0.05330530181527138 -0.002463320037350059 0.01413829997181892
-1640 0.05375050008296967 -0.01479919999837875 0.01321639958769083
-1641 0.05261709913611412 -0.01874279975891113 0.01274779997766018
-1642 0.03106109984219074 -0.01061729993671179 0.0151297003030777
-1643 0.02944369986653328 -0.01220079977065325 0.01508789975196123
-1644 0.06187539920210838 -0.01573619991540909 0.01234420016407967
-1645 0.0605149008333683 -0.01334279961884022 0.01278659980744123
-1646 0.0503045991063118 -0.02161329984664917 0.01243910007178783
-1647 0.0569830983877182 -0.01305860001593828 0.01314229983836412
-1648 0.05311930179595947 -0.02224669978022575 0.01206429954618216
-1649 0.05469679832458496 -0.02508060075342655 0.01128210034221411
-1650 0.04965440183877945 -0.002959910081699491 0.01440490037202835
-1651 0.051910400390625 -0.00569193996489048 0.01413580030202866
-1652 0.05151350051164627 -0.02471630088984966 0.01167550031095743
-1653 0.05936169996857643 -0.007364590186625719 0.01342490036040545
-1654 0.05681850016117096 -0.00592187000438571 0.01372690033167601
-1655 0.05076619982719421 -0.01604449935257435 0.01330219954252243
-1656 0.04970249906182289 -0.01889139972627163 0.01296889968216419
-1657 0.06181029975414276 -0.005611000116914511 0.01329660043120384
-1658 0.05455039814114571 -0.004969430156052113 0.01395860034972429
-1659 0.06676489859819412 -0.009576190263032913 0.01254019979387522
-1660 0.0484934002161026 -0.0240837000310421 0.01208810042589903
-1661 0.0533686988055706 -0.02755220048129559 0.01077079959213734
-1662 0.05933009833097458 -0.01615270040929317 0.01253569964319468
-1663 0.05949360132217407 -0.003450850024819374 0.01359520014375448
-1664 0.05612310022115707 -0.002806959906592965 0.01390200015157461
-1665 0.05056130141019821 -0.00819557998329401 0.01409760024398565
-1666 0.04760570079088211 -0.00984358973801136 0.01419830042868853
-1667 0.05107710137963295 -0.01078459993004799 0.01385859958827496
-1668 0.05840630084276199 -0.01867089979350567 0.01223170012235641
-1669 0.07032179832458496 -0.008320000022649765 0.0122750997543335
-1670 0.07141920179128647 -0.01080940011888742 0.01194289978593588
-1671 0.07360920310020447 -0.008776609785854816 0.01190590020269156
-1672 0.05162740126252174 -0.01335230004042387 0.01356130000203848
-1673 0.04850130155682564 -0.03082449920475483 0.01027479954063892
-1674 0.05372650176286697 -0.008197469636797905 0.01384889986366034
-1675 0.04848689958453178 -0.006419760175049305 0.01435690000653267
-1676 0.07046060264110565 2.310030073549276e-18 0.01257519982755184
-1677 0.05908500030636787 -0.02109749987721443 0.01171999983489513
-1678 0.05977059900760651 -0.02408800087869167 0.01099309977144003
-1679 0.04677839949727058 -0.02908479981124401 0.01097590010613203
-1680 0.04660249873995781 -0.02663560025393963 0.01165239978581667
-1681 0.07131429761648178 -0.002097520045936108 0.01246820017695427
-1682 0.07360920310020447 -0.00292837992310524 0.01222109980881214
-1683 0.07360920310020447 -0.005854669958353043 0.01210370007902384
-1684 0.07069160044193268 -0.004793989937752485 0.01244680024683475
-1685 0.04839820042252541 2.670620022847373e-18 0.01453819964081049
-1686 0.04642460122704506 -0.004346759989857674 0.01459330040961504
-1687 0.06208230182528496 -0.02240259945392609 0.01112459972500801
-1688 0.04414010047912598 -0.002477719914168119 0.01479979977011681
-1689 0.04677170142531395 -0.001959400018677115 0.01463240012526512
-1690 0.06184139847755432 -0.02584009990096092 0.01030219998210669
-1691 0.05796390026807785 -0.0292447991669178 0.00974825955927372
-1692 0.06110480055212975 -0.02865069918334484 0.009550229646265507
-1693 0.05754189938306808 -0.02679329924285412 0.01053700037300587
-1694 0.05123639851808548 -0.036855798214674 0.007351739797741175
-1695 0.06916890293359756 -0.03320629894733429 0.006232679821550846
-1696 0.03264230117201805 -0.04479619860649109 0.004001040011644363
-1697 0.02944369986653328 -0.04325760155916214 0.006022680085152388
-1698 0.07050260156393051 -0.03642779961228371 0.003253600094467402
-1699 0.06842230260372162 -0.03542200103402138 0.004888770170509815
-1700 0.03584320098161697 -0.04432540014386177 0.0039589898660779
-1701 0.06306000053882599 -0.03465599939227104 0.006613729987293482
-1702 0.06740009784698486 -0.03734280169010162 0.003335329936817288
-1703 0.06528949737548828 -0.03639569878578186 0.004928660113364458
-1704 0.06202669814229012 -0.03721040114760399 0.005103420000523329
-1705 0.0590256005525589 -0.03802559897303581 0.005162519868463278
-1706 0.05875319987535477 -0.03297509998083115 0.008192740380764008
-1707 0.05804770067334175 -0.03992829844355583 0.003566249972209334
-1708 0.05457210168242455 -0.03678819909691811 0.00687061995267868
-1709 0.05315870046615601 -0.03928849846124649 0.005415880121290684
-1710 0.05490370094776154 -0.04068949818611145 0.003634240012615919
-1711 0.05590369924902916 -0.03874289989471436 0.00527741014957428
-1712 0.04533629864454269 -0.03128970041871071 0.01042990013957024
-1713 0.0483241006731987 -0.03842309862375259 0.006865019910037518
-1714 0.05166120082139969 -0.03032859973609447 0.010109500028193
-1715 0.04799890145659447 -0.03590939939022064 0.008282099850475788
-1716 0.05481550097465515 -0.0298020001500845 0.009933999739587307
-1717 0.05017460137605667 -0.03356099873781204 0.009068669751286507
-1718 0.05357189849019051 -0.03355130180716515 0.008651440031826496
-1719 0.06477349996566772 -0.03214430063962936 0.00761470990255475
-1720 0.0665815994143486 -0.03388160094618797 0.006364690139889717
-1721 0.04223449900746346 -0.04331659898161888 0.0038688899949193
-1722 0.04380359873175621 -0.04093610122799873 0.005839330144226551
-1723 0.04069890081882477 -0.04171169921755791 0.005710890050977468
-1724 0.03462250158190727 -0.03767380118370056 0.008835120126605034
-1725 0.0370309017598629 -0.03634719923138618 0.009229269810020924
-1726 0.03350320085883141 -0.0430523008108139 0.005622270051389933
-1727 0.06910719722509384 -0.0294743999838829 0.00806427001953125
-1728 0.02944369986653328 -0.03841660171747208 0.008955690078437328
-1729 0.03196129947900772 -0.04156789928674698 0.006928860209882259
-1730 0.03455689921975136 -0.0404668003320694 0.007341589778661728
-1731 0.03186300024390221 -0.03936609998345375 0.008244140073657036
-1732 0.07140260189771652 -0.03407619893550873 0.005166209768503904
-1733 0.07360920310020447 -0.03113470040261745 0.006526989862322807
-1734 0.06158610060811043 -0.03265770152211189 0.007904199883341789
-1735 0.06423590332269669 -0.0280115008354187 0.009337170049548149
-1736 0.04730670154094696 -0.03344419971108437 0.009441629983484745
-1737 0.04236280173063278 -0.03877250105142593 0.007475350052118301
-1738 0.05692220106720924 -0.0319489985704422 0.008883019909262657
-1739 0.06736080348491669 -0.02734529972076416 0.009115110151469707
-1740 0.06615599989891052 -0.02984209917485714 0.008384140208363533
-1741 0.06810279935598373 -0.03147109970450401 0.00735368998721242
-1742 0.05977629870176315 -0.03091650083661079 0.008908960036933422
-1743 0.05719380080699921 -0.0368570014834404 0.006373479962348938
-1744 0.05957899987697601 -0.03541469946503639 0.006822240073233843
-1745 0.06296370178461075 -0.03038029931485653 0.00866037979722023
-1746 0.0566525012254715 -0.0346514992415905 0.007708190008997917
-1747 0.03968250006437302 -0.04022910073399544 0.006912120152264833
-1748 0.04995520040392876 -0.04000340029597282 0.00547845009714365
-1749 0.04692360013723373 -0.04059800133109093 0.005567660089582205
-1750 0.04399950057268143 -0.0350847989320755 0.009119750000536442
-1751 0.04545620083808899 -0.03807789832353592 0.007475859951227903
-1752 0.02944369986653328 -0.03581469878554344 0.01008289959281683
-1753 0.0341327004134655 -0.03486910089850426 0.01007420010864735
-1754 0.03149149939417839 -0.03665420040488243 0.009565110318362713
-1755 0.04020629823207855 -0.03615200147032738 0.009029990062117577
-1756 0.03797870129346848 -0.03894669935107231 0.007865140214562416
-1757 0.03790849819779396 -0.03441840037703514 0.009949970059096813
-1758 0.04216570034623146 -0.03171870112419128 0.01057290006428957
-1759 0.03898829966783524 -0.03210040181875229 0.01070010010153055
-1760 0.04065360128879547 -0.03396860137581825 0.009893599897623062
-1761 0.03738920018076897 -0.04190709814429283 0.00602127006277442
-1762 0.07099039852619171 -0.03185620158910751 0.006631690077483654
-1763 0.07190150022506714 -0.02908230014145374 0.007778239902108908
-1764 0.03262469917535782 -0.03279500082135201 0.01093169953674078
-1765 0.03904210031032562 -0.04384149983525276 0.003915769979357719
-1766 0.04061450064182281 -0.04473140090703964 0.001971790101379156
-1767 0.04383059963583946 -0.0441582016646862 0.001937850029207766
-1768 0.04541549831628799 -0.04272719845175743 0.003816240001469851
-1769 0.04858700186014175 -0.04208929836750031 0.00375926005654037
-1770 0.05333349853754044 -0.04212899878621101 0.001848799991421402
-1771 0.05961940065026283 -0.04056670144200325 0.001780239981599152
-1772 0.06274700164794922 -0.03970130160450935 0.001742759952321649
-1773 0.06430339813232422 -0.03959419950842857 0
-1774 0.06740599870681763 -0.03865829855203629 0
-1775 0.07050540298223495 -0.03771200031042099 0
-1776 0.06921970099210739 -0.03776900097727776 0.001674039987847209
-1777 0.05174989998340607 -0.04140999913215637 0.003698589978739619
-1778 0.05017510056495667 -0.04284749925136566 0.00188033003360033
-1779 0.04700750112533569 -0.04352400079369545 0.001910010003484786
-1780 0.05491700023412704 -0.04212170094251633 0
-1781 0.0658951997756958 -0.03877659887075424 0.001704600057564676
-1782 0.05648209899663925 -0.04136890172958374 0.001815440016798675
-1783 0.05806029960513115 -0.04133350029587746 0
-1784 0.03728440031409264 -0.0452503003180027 0.002039130078628659
-1785 0.03905029967427254 -0.04538679867982864 0
-1786 0.06117919832468033 -0.03911750018596649 0.003493830095976591
-1787 0.06119029968976974 -0.04049430042505264 0
-1788 0.06429470330476761 -0.03824760019779205 0.003416140098124743
-1789 0.0358486995100975 -0.04588820040225983 0
-1790 0.07360920310020447 -0.0364282988011837 0.001691919984295964
-1791 0.07360920310020447 -0.03678020089864731 0
-1792 0.02944369986653328 -0.0464308001101017 0.002156500006094575
-1793 0.03395120054483414 -0.0457678996026516 0.00203699991106987
-1794 -0.008462630212306976 -0.002203880110755563 0.01618549972772598
-1795 -0.01051560044288635 -0.02824299968779087 0.01316229999065399
-1796 -0.007654150016605854 -0.02706010080873966 0.01346630044281483
-1797 -0.007327749859541655 -0.01705689914524555 0.01518000010401011
-1798 0.02944369986653328 -0.03022870048880577 0.01194390002638102
-1799 -0.008199930191040039 -0.03236730024218559 0.01209099963307381
-1800 -0.007441270165145397 2.97872991177235e-18 0.01621540077030659
-1801 -0.01051560044288635 2.972699971901991e-18 0.01618259958922863
-1802 0.003912690095603466 -0.0213031992316246 0.01458670012652874
-1803 0.007258940022438765 -0.02377519942820072 0.0141251003369689
-1804 -0.001927049946971238 -0.02134530059993267 0.01460659969598055
-1805 0.01549770031124353 -0.01860000006854534 0.01482119970023632
-1806 0.01490399986505508 -0.01364540029317141 0.01542390044778585
-1807 0.01691720075905323 -0.02893389947712421 0.01281549967825413
-1808 -0.005297529976814985 -0.0148844001814723 0.01545289997011423
-1809 0.02484860084950924 -0.01987339928746223 0.01432089973241091
-1810 -0.003814480034634471 -0.01997189968824387 0.01481309998780489
-1811 0.01862419955432415 -0.01773349940776825 0.0148497000336647
-1812 -0.001834299997426569 -0.01811850070953369 0.01508279982954264
-1813 -0.004561650101095438 -0.01748890057206154 0.01515250001102686
-1814 0.02135859988629818 -0.01991079933941364 0.01444550044834614
-1815 0.02089639939367771 -0.008015500381588936 0.01569130085408688
-1816 -0.01051560044288635 -0.009481829591095448 0.01587099954485893
-1817 0.02358029969036579 -0.02258599922060966 0.01391709968447685
-1818 -0.005718130152672529 -0.03207869827747345 0.01221380010247231
-1819 0.02437819913029671 -0.03084589913487434 0.01199750043451786
-1820 0.02684690058231354 -0.02761919982731342 0.0127325002104044
-1821 0.02122809924185276 -0.01201900001615286 0.01539030019193888
-1822 0.0274363998323679 -0.01968690007925034 0.01425290014594793
-1823 -0.008577000349760056 -0.007834809832274914 0.01598710007965565
-1824 -0.007410920225083828 -0.02964089997112751 0.0128533998504281
-1825 0.01382850017398596 -0.02147980034351349 0.01442189980298281
-1826 1.278580020880327e-05 -0.02638559974730015 0.01366230007261038
-1827 0.0004486129910219461 -0.023098299279809 0.01430310029536486
-1828 0.0001478269987273961 -0.01594579964876175 0.01534979976713657
-1829 0.01610130071640015 -0.010886300355196 0.01563969999551773
-1830 0.0006704339757561684 -0.01943350024521351 0.01489359978586435
-1831 0.02377299964427948 -0.009888609871268272 0.0154705997556448
-1832 0.02112510055303574 -0.02712040022015572 0.01309099979698658
-1833 0.0182402990758419 -0.02656389959156513 0.01332509983330965
-1834 0.02013220079243183 -0.02372049912810326 0.01383890025317669
-1835 0.02381259948015213 -0.006471219938248396 0.01567069999873638
-1836 0.02436669915914536 -0.002665840089321136 0.01577669940888882
-1837 -0.004362700041383505 -0.0344724990427494 0.01149080041795969
-1838 -0.002662430051714182 -0.03228040039539337 0.01218710001558065
-1839 0.0266887005418539 -0.01680140011012554 0.01468429993838072
-1840 0.0273755993694067 -0.01360020041465759 0.01502420008182526
-1841 0.02739059925079346 -0.03101019933819771 0.01181020028889179
-1842 0.0263752993196249 -0.03337199985980988 0.01112399995326996
-1843 -0.004421070218086243 -0.0223833005875349 0.01442109979689121
-1844 -0.006944959983229637 -0.02438480034470558 0.01403009984642267
-1845 -0.007368229795247316 -0.02161220088601112 0.01452070008963346
-1846 -0.007527689915150404 -0.01338389981538057 0.01558229979127645
-1847 0.01797889918088913 -0.01277329958975315 0.01542679965496063
-1848 0.0194752998650074 -0.01474529970437288 0.01518219988793135
-1849 0.02381259948015213 -0.02798690088093281 0.01277409959584475
-1850 0.02368490025401115 -0.02551859989762306 0.01333940029144287
-1851 -0.006418940145522356 -0.01976300030946732 0.01482080016285181
-1852 -0.01051560044288635 -0.01891889981925488 0.01490330044180155
-1853 0.02441189996898174 -0.0136668998748064 0.0151231000199914
-1854 0.02186259999871254 -0.01534960046410561 0.01503400038927794
-1855 0.02350899949669838 -0.01717459969222546 0.01475290022790432
-1856 0.0179063007235527 -0.00835178978741169 0.01576579920947552
-1857 0.01592460088431835 -0.005802359897643328 0.01594920083880424
-1858 0.02144310064613819 -0.01765879988670349 0.01476419996470213
-1859 0.01077849976718426 -0.005183069966733456 0.01607180014252663
-1860 0.009400430135428905 -0.007491909898817539 0.01598509959876537
-1861 0.004215680062770844 -0.00868596974760294 0.01596730016171932
-1862 0.001579690026119351 -0.01025469973683357 0.01587790064513683
-1863 -0.00109590997453779 -0.01211680006235838 0.01573959924280643
-1864 0.009095599874854088 -0.01880449987947941 0.01490969955921173
-1865 0.01057920046150684 -0.02095809951424599 0.01456610020250082
-1866 0.0003974039864260703 -0.002329899929463863 0.01624009944498539
-1867 0.01305530034005642 -0.02472149953246117 0.0138525003567338
-1868 0.01216750033199787 -0.02737269923090935 0.01330980006605387
-1869 0.009919510222971439 -0.02803670056164265 0.0131973996758461
-1870 0.003547400003299117 -0.02486749924719334 0.01395179983228445
-1871 0.02330780029296875 -0.03360620141029358 0.01120209973305464
-1872 -0.002608150010928512 -0.02763820067048073 0.01338679995387793
-1873 0.01937370002269745 -0.02873760089278221 0.0127750001847744
-1874 0.02165180072188377 -0.02961920015513897 0.01245590019971132
-1875 -0.001285549951717257 -0.03450550138950348 0.01150180026888847
-1876 0.0006535819848068058 -0.03281269967556 0.01202839985489845
-1877 0.002216859953477979 -0.01355889998376369 0.01559360045939684
-1878 -0.002665020059794188 -0.002902250038459897 0.01622889935970306
-1879 0.01573709957301617 -0.03164279833436012 0.01213049981743097
-1880 -0.005096179898828268 -0.027241300791502 0.01345730014145374
-1881 -0.002935450058430433 -0.02479269914329052 0.01398770045489073
-1882 -0.003980460111051798 -0.02986370027065277 0.0128389997407794
-1883 0.02170230075716972 -0.03187460079789162 0.01182319968938828
-1884 0.006740400101989508 -0.007936310023069382 0.01599030010402203
-1885 0.01217519957572222 -0.007742370013147593 0.01593079976737499
-1886 0.00476250983774662 -0.005797000136226416 0.01611259952187538
-1887 0.01379919983446598 -0.005395589862018824 0.01601249910891056
-1888 0.01617930084466934 -0.003040109993889928 0.016032500192523
-1889 0.00845750980079174 -0.009725919924676418 0.01585919968783855
-1890 0.009099819697439671 -0.01294459961354733 0.01558999996632338
-1891 0.002523229923099279 -0.004195420071482658 0.01618519984185696
-1892 0.0151055995374918 -0.02677690051496029 0.01337550021708012
-1893 0.01110150013118982 -0.03008509986102581 0.01267050020396709
-1894 0.01404980011284351 -0.02935880050063133 0.01279260031878948
-1895 -0.0007385169737972319 -0.005251190159469843 0.01616239920258522
-1896 0.002033760072663426 -0.007058550138026476 0.01607210002839565
-1897 0.01007649954408407 -0.02541040070354939 0.01376849971711636
-1898 0.02681539952754974 -0.01108380034565926 0.01527190022170544
-1899 0.02644450031220913 -0.00792298000305891 0.01550259999930859
-1900 0.01409680023789406 -0.03419189900159836 0.01139730028808117
-1901 0.01893389970064163 -0.03128520026803017 0.01211540028452873
-1902 0.006362630054354668 -0.01939049921929836 0.01485799998044968
-1903 0.007961769588291645 -0.02133730053901672 0.0145412003621459
-1904 0.01056110020726919 -0.02313110046088696 0.01419780030846596
-1905 0.007587740197777748 -0.005204670131206512 0.01611060090363026
-1906 0.005595630034804344 -0.03212400153279305 0.0121916001662612
-1907 0.008070129901170731 -0.0307071004062891 0.01255560014396906
-1908 0.02944369986653328 -0.02128669992089272 0.01392260007560253
-1909 0.0267574992030859 -0.02210989966988564 0.01387850008904934
-1910 0.02590020000934601 -0.02440650016069412 0.01347879972308874
-1911 0.01372979953885078 -0.009875760413706303 0.01576800085604191
-1912 0.01488909963518381 -0.008036060258746147 0.01586209982633591
-1913 0.01621510088443756 -0.02399099990725517 0.01391690038144588
-1914 0.01758709922432899 -0.02092679962515831 0.01441380009055138
-1915 -0.007891260087490082 -0.01050950028002262 0.01582209952175617
-1916 -0.0006125890067778528 -0.0297072995454073 0.01289070025086403
-1917 0.002653599949553609 -0.0311322994530201 0.01249739993363619
-1918 0.005340040195733309 -0.02966460026800632 0.01286069955676794
-1919 0.01120399963110685 -0.009914480149745941 0.01580910012125969
-1920 0.01274900045245886 -0.01179269980639219 0.01563720032572746
-1921 -0.004400019999593496 -0.005473639816045761 0.01614069938659668
-1922 0.01893250085413456 -0.01069589983671904 0.01557420007884502
-1923 0.007930849678814411 2.977960013417216e-18 0.01621129922568798
-1924 0.00485645979642868 2.983089980781117e-18 0.01623919978737831
-1925 0.005587249994277954 -0.002775330096483231 0.01620090007781982
-1926 0.003632739884778857 -0.01725150085985661 0.01517170015722513
-1927 0.01676809974014759 -0.01563649997115135 0.01516429986804724
-1928 -0.001810809946618974 -0.00855811033397913 0.01600039936602116
-1929 -0.003386510070413351 -0.01031710021197796 0.01587769947946072
-1930 0.01213280018419027 -0.0141313998028636 0.01542919967323542
-1931 0.009263359941542149 -0.002639719983562827 0.01616580039262772
-1932 0.01100509986281395 2.970769952737752e-18 0.01617209985852242
-1933 0.01407920010387897 2.960930018965974e-18 0.01611859910190105
-1934 0.01247680000960827 -0.002723559970036149 0.01611690036952496
-1935 0.002976970048621297 -0.001861299970187247 0.01623559929430485
-1936 0.01061160024255514 -0.01622959971427917 0.01522149983793497
-1937 0.01215930003672838 -0.01870080083608627 0.01487709954380989
-1938 0.006248930003494024 -0.01070229988545179 0.01581110060214996
-1939 0.003997299820184708 -0.0114662004634738 0.01576929911971092
-1940 -0.006023949943482876 -0.002785000018775463 0.01620360091328621
-1941 -0.005493239965289831 -0.008513789623975754 0.01598110049962997
-1942 -0.007769709918648005 -0.005166400223970413 0.01611690036952496
-1943 0.002831170102581382 -0.02821560017764568 0.01323620043694973
-1944 0.006663599982857704 -0.0272538997232914 0.01342099998146296
-1945 -0.002913489937782288 -0.0150049002841115 0.01545609999448061
-1946 -0.004855259787291288 -0.01204250007867813 0.0157306008040905
-1947 0.005358629859983921 -0.01372900046408176 0.01555429957807064
-1948 0.007211700081825256 -0.01632980071008205 0.01525290030986071
-1949 0.00794564001262188 -0.03438900038599968 0.01146300043910742
-1950 0.02637100033462048 2.889900019766046e-18 0.01573190093040466
-1951 0.01269229967147112 -0.03213239833712578 0.01207169983536005
-1952 0.01016900036484003 -0.03236629813909531 0.01205519959330559
-1953 0.02690310031175613 -0.004628890193998814 0.01563530042767525
-1954 0.02730559930205345 -0.00206982996314764 0.0156830009073019
-1955 0.01715279929339886 2.947310076589982e-18 0.01604440063238144
-1956 0.02176940068602562 -0.004900150001049042 0.01580669917166233
-1957 0.01884499937295914 -0.005253899842500687 0.01588959991931915
-1958 0.02026250027120113 -0.002268319949507713 0.0159268993884325
-1959 0.01370569970458746 -0.01617610082030296 0.01517389994114637
-1960 -0.01051560044288635 -0.04237629845738411 0.007896140217781067
-1961 -0.002799409907311201 -0.04292549937963486 0.007711539976298809
-1962 0.02461940050125122 -0.04006880149245262 0.008424609899520874
-1963 -0.0002217220026068389 -0.04288740083575249 0.007739129941910505
-1964 -0.001596780028194189 -0.04552429914474487 0.005841779988259077
-1965 0.005882900208234787 -0.04488829895853996 0.00626874016597867
-1966 0.002295339945703745 -0.04519800096750259 0.006084280088543892
-1967 0.007958410307765007 -0.04697579890489578 0.004195710178464651
-1968 0.01734290085732937 -0.04409610107541084 0.006400750018656254
-1969 0.02039170078933239 -0.04235659912228584 0.007392779923975468
-1970 0.02025170065462589 -0.04621570184826851 0.004127820022404194
-1971 0.02331589907407761 -0.04590610042214394 0.004100169986486435
-1972 -0.004359030164778233 -0.04709040001034737 0.004205939825624228
-1973 -0.001279550022445619 -0.04713540151715279 0.004209970124065876
-1974 -0.008230440318584442 -0.04366840049624443 0.007119010202586651
-1975 -0.005599389784038067 -0.04504029825329781 0.006175910122692585
-1976 -0.008479219861328602 -0.04546229913830757 0.005731239914894104
-1977 0.02724169939756393 -0.04392490163445473 0.005666910205036402
-1978 0.01184340007603168 -0.04536119848489761 0.005681890062987804
-1979 0.01463830005377531 -0.04513299837708473 0.005735749844461679
-1980 0.01543849986046553 -0.03991129994392395 0.00903168972581625
-1981 0.02202280052006245 -0.04424820095300674 0.005895069800317287
-1982 0.01943870075047016 -0.04485179856419563 0.00561652984470129
-1983 0.00896333996206522 -0.04525699838995934 0.005883490201085806
-1984 0.01053110044449568 -0.04394989833235741 0.006843190174549818
-1985 0.01518029998987913 -0.04345589876174927 0.006994930095970631
-1986 0.01705240085721016 -0.04200829938054085 0.007819719612598419
-1987 -0.005915530025959015 -0.03973690047860146 0.009379079565405846
-1988 0.01400620024651289 -0.04191270098090172 0.00802129041403532
-1989 0.01282740011811256 -0.04370699822902679 0.006929310038685799
-1990 0.01249790005385876 -0.03999819979071617 0.009093450382351875
-1991 0.01105539966374636 -0.04217449948191643 0.007970940321683884
-1992 -0.008309789933264256 -0.04113529995083809 0.008632339537143707
-1993 -0.01051560044288635 -0.03978389874100685 0.009274429641664028
-1994 -0.008552069775760174 -0.03849489986896515 0.009889859706163406
-1995 0.01918260008096695 -0.03626370057463646 0.01045180018991232
-1996 0.0202396996319294 -0.0338331013917923 0.01127769984304905
-1997 0.01885960064828396 -0.03929600119590759 0.009165080264210701
-1998 0.02200979925692081 -0.03965239971876144 0.008807159960269928
-1999 0.02107029967010021 -0.03759349882602692 0.009813359938561916
-2000 0.02364140003919601 -0.04204339906573296 0.007351890206336975
-2001 0.0248929001390934 -0.0441385991871357 0.005711840000003576
-2002 0.002946580061689019 -0.04300969839096069 0.00763275008648634
-2003 0.01716969907283783 -0.03403440117835999 0.01134479977190495
-2004 0.006045530084520578 -0.0421576015651226 0.008098180405795574
-2005 0.01577810011804104 -0.03691659867763519 0.01034369971603155
-2006 -0.007439100183546543 -0.03439820185303688 0.01146609988063574
-2007 -0.008675250224769115 -0.03628300130367279 0.01077789999544621
-2008 -0.006477170158177614 -0.03689049929380417 0.01058540027588606
-2009 0.01343579962849617 -0.03812089934945107 0.009925260208547115
-2010 -0.005822449922561646 -0.04239730164408684 0.007981309667229652
-2011 -0.003040239913389087 -0.04102319851517677 0.008785240352153778
-2012 0.001297579961828887 -0.04152709990739822 0.008512509986758232
-2013 0.02673869952559471 -0.04203270003199577 0.00712146982550621
-2014 0.02944369986653328 -0.04091989994049072 0.007624770049005747
-2015 -0.003314309986308217 -0.03790109977126122 0.01022680010646582
-2016 0.01042430009692907 -0.03853359818458557 0.009826740249991417
-2017 0.02944369986653328 -0.03314869850873947 0.01104960031807423
-2018 0.01102180033922195 -0.03430569916963577 0.01143520046025515
-2019 0.01197099965065718 -0.03641660138964653 0.01065600011497736
-2020 0.0005805569817312062 -0.03735550120472908 0.01045260019600391
-2021 -0.0007613640045747161 -0.04020509868860245 0.0092042600736022
-2022 0.02677780017256737 -0.03648160025477409 0.009955950081348419
-2023 0.02442069910466671 -0.03521589934825897 0.01057660020887852
-2024 0.008800039999186993 -0.03659500181674957 0.01065510045737028
-2025 0.004578379914164543 -0.03663359954953194 0.01070119999349117
-2026 0.0069428700953722 -0.0393977016210556 0.009506549686193466
-2027 0.002969739958643913 -0.04029960185289383 0.009130240418016911
-2028 0.004868879914283752 -0.0344482995569706 0.01148280035704374
-2029 0.001791769987903535 -0.03448760136961937 0.01149590034037828
-2030 0.02394969947636127 -0.03774679824709892 0.009582630358636379
-2031 0.02677159942686558 -0.03920299932360649 0.008730529807507992
-2032 0.02202850021421909 -0.03576289862394333 0.01049910020083189
-2033 0.009226130321621895 -0.0411021001636982 0.008617869578301907
-2034 0.008557709865272045 -0.04340630024671555 0.007273260038346052
-2035 0.001800209982320666 -0.0471109002828598 0.004207769874483347
-2036 0.0001278429990634322 -0.04836760088801384 0.002123859943822026
-2037 -0.001278629992157221 -0.04879819974303246 0
-2038 0.001801509992219508 -0.04877270013093948 0
-2039 0.00291230995208025 -0.04833099991083145 0.002120970049872994
-2040 0.006064100190997124 -0.0482637993991375 0.002118010073900223
-2041 0.004879610147327185 -0.04705699905753136 0.004202960059046745
-2042 0.009536400437355042 -0.04815350100398064 0.002113180002197623
-2043 0.01411200035363436 -0.04670609906315804 0.00417162012308836
-2044 0.01284829992800951 -0.04800400137901306 0.002106619998812675
-2045 0.01706849969923496 -0.04772179946303368 0.002094229916110635
-2046 0.01718430034816265 -0.04649059846997261 0.004152379930019379
-2047 0.02125390060245991 -0.04733080044388771 0.002077070064842701
-2048 0.01103620044887066 -0.04686189815402031 0.00418554013594985
-2049 0.02637900039553642 -0.04558660089969635 0.004071630071848631
-2050 0.02450410090386868 -0.04698869958519936 0.002062059938907623
-2051 -0.002826760057359934 -0.04836149886250496 0.002122770063579082
-2052 0.02759899944067001 -0.04665450006723404 0.00206729001365602
-2053 0.02944369986653328 -0.04528199881315231 0.004044429864734411
-2054 -0.01051560044288635 -0.04689360037446022 0.004188369959592819
-2055 -0.006183200050145388 -0.04826489835977554 0.002138729905709624
-2056 -0.007437219843268394 -0.04698880016803741 0.004196870140731335
-2057 -0.03342229872941971 -0.02856590040028095 0.01211799960583448
-2058 -0.0302095003426075 -0.02773470059037209 0.01252810005098581
-2059 -0.01660080067813396 -0.004318609833717346 0.0159837007522583
-2060 -0.04206240177154541 -0.01598300039768219 0.01392170041799545
-2061 -0.04206240177154541 -0.0127988001331687 0.01428280025720596
-2062 -0.03642090037465096 -0.01756650023162365 0.01406690012663603
-2063 -0.0350152999162674 -0.008243010379374027 0.01507250033318996
-2064 -0.0322732999920845 -0.01029529981315136 0.01508220005780458
-2065 -0.02144920080900192 -0.0172715000808239 0.01482999976724386
-2066 -0.03324640169739723 -0.01693160086870193 0.01434450037777424
-2067 -0.02629729919135571 2.892769922901299e-18 0.01574750058352947
-2068 -0.01557779964059591 -0.01189490035176277 0.01557090040296316
-2069 -0.02960719913244247 -0.01232639979571104 0.01504210010170937
-2070 -0.01782229915261269 -0.009980799630284309 0.0156663004308939
-2071 -0.0152545003220439 -0.008851310238242149 0.01580299995839596
-2072 -0.02467039972543716 -0.02236459963023663 0.01392609998583794
-2073 -0.02364489994943142 -0.01399100013077259 0.01513110008090734
-2074 -0.0353148989379406 -0.0116031002253294 0.01480519957840443
-2075 -0.0381866991519928 -0.01004029996693134 0.01475939992815256
-2076 -0.02588249929249287 -0.02957000024616718 0.01229299977421761
-2077 -0.04022400081157684 -0.01151099987328053 0.01451420038938522
-2078 -0.03520099818706512 -0.02630439959466457 0.01255100034177303
-2079 -0.03425240144133568 -0.02336429990828037 0.01324130035936832
-2080 -0.01762159913778305 -0.02280809916555882 0.01410000026226044
-2081 -0.0289904996752739 -0.009542769752442837 0.01529529970139265
-2082 -0.02234370075166225 -0.0249342005699873 0.0135319996625185
-2083 -0.02102039940655231 -0.02248989976942539 0.01404799986630678
-2084 -0.01713749952614307 -0.007113149855285883 0.01585770025849342
-2085 -0.01676619984209538 -0.02555279992520809 0.01359259989112616
-2086 -0.0134317995980382 -0.0270140003412962 0.0133654996752739
-2087 -0.01399180013686419 -0.02346359938383102 0.01407579984515905
-2088 -0.03199530020356178 -0.02573570050299168 0.01288860011845827
-2089 -0.01051560044288635 -0.0313045009970665 0.01236889977008104
-2090 -0.01935279928147793 -0.02014880068600178 0.0144921001046896
-2091 -0.02301990054547787 -0.01972280070185661 0.01442770007997751
-2092 -0.02574680000543594 -0.009041240438818932 0.01546700019389391
-2093 -0.02771379984915257 -0.02168090082705021 0.01390940044075251
-2094 -0.02753500081598759 -0.007030659820884466 0.01551149971783161
-2095 -0.02905409969389439 -0.004696330055594444 0.01554610021412373
-2096 -0.03122100047767162 -0.007061710115522146 0.01534259971231222
-2097 -0.02676749974489212 -0.01925729960203171 0.01434220001101494
-2098 -0.0197478998452425 -0.01503259968012571 0.01515480037778616
-2099 -0.01634519919753075 -0.01496849954128265 0.01525409985333681
-2100 -0.0184406004846096 -0.01265409961342812 0.01543250028043985
-2101 -0.01958690024912357 -0.02467060089111328 0.01368729956448078
-2102 -0.02047640085220337 -0.01057050004601479 0.0155477998778224
-2103 -0.02263550087809563 -0.008369640447199345 0.01562559977173805
-2104 -0.03278709948062897 -0.01323970034718513 0.01479560043662786
-2105 -0.02946689911186695 -0.01574850082397461 0.01468820031732321
-2106 -0.026451600715518 -0.0116768004372716 0.01523880008608103
-2107 -0.01384519971907139 -0.01772050000727177 0.01498330011963844
-2108 -0.01756200008094311 -0.01766430027782917 0.01489850040525198
-2109 -0.02945199981331825 2.868160058906927e-18 0.01561350002884865
-2110 -0.01996820047497749 -0.007658029906451702 0.01575390063226223
-2111 -0.02840190008282661 -0.03030579909682274 0.01195860002189875
-2112 -0.0314531996846199 -0.03059929981827736 0.01169130019843578
-2113 -0.0382080003619194 -0.02368720062077045 0.01290949992835522
-2114 -0.02748190052807331 -0.02391190081834793 0.01350970007479191
-2115 -0.03345600143074989 -0.02012250013649464 0.01386689953505993
-2116 -0.03060879930853844 -0.02276049926877022 0.01357010006904602
-2117 -0.03025469928979874 -0.01940960064530373 0.01415350008755922
-2118 -0.03868750110268593 -0.01381869986653328 0.01438399963080883
-2119 -0.03535459935665131 -0.01445730030536652 0.01451999973505735
-2120 -0.02518530003726482 -0.02487250044941902 0.01342429965734482
-2121 -0.01051560044288635 -0.006323779933154583 0.01604470051825047
-2122 -0.01304659992456436 -0.007305169943720102 0.01593980006873608
-2123 -0.02547919936478138 -0.01642579957842827 0.01478289999067783
-2124 -0.04206240177154541 -0.02544819936156273 0.01225730031728745
-2125 -0.01051560044288635 -0.02515389956533909 0.01384100038558245
-2126 -0.02128770016133785 -0.01286190003156662 0.01532659959048033
-2127 -0.02342480048537254 -0.01119370013475418 0.0153972003608942
-2128 -0.02729530073702335 -0.01389439962804317 0.01499340031296015
-2129 -0.02948489971458912 -0.03311819955706596 0.01103939954191446
-2130 -0.01944600045681 -0.004713539965450764 0.01589949987828732
-2131 -0.01682930067181587 2.947740003713357e-18 0.01604669913649559
-2132 -0.01051560044288635 -0.02204420045018196 0.01441810000687838
-2133 -0.01051560044288635 -0.01578149944543839 0.01530370023101568
-2134 -0.03627920150756836 -0.02100110054016113 0.01354339998215437
-2135 -0.02948169969022274 -0.02545190043747425 0.01309190038591623
-2136 -0.02711289934813976 -0.02695360034704208 0.01287980005145073
-2137 -0.02129890024662018 -0.002470009960234165 0.01590240001678467
-2138 -0.01051560044288635 -0.01263509970158339 0.01562490034848452
-2139 -0.01303800009191036 -0.01069450005888939 0.01572529971599579
-2140 -0.02481280080974102 -0.006930939853191376 0.01562589965760708
-2141 -0.01580859906971455 -0.02053100056946278 0.01453060004860163
-2142 -0.01293530035763979 -0.02055780030786991 0.01459749974310398
-2143 -0.03905890136957169 -0.02007509954273701 0.01351550035178661
-2144 -0.03965840116143227 -0.01734640076756477 0.0138903995975852
-2145 -0.02608080022037029 -0.00480755977332592 0.01566749997437
-2146 -0.02271159924566746 -0.005355549976229668 0.01577240042388439
-2147 -0.02473879978060722 -0.002498730085790157 0.01578200049698353
-2148 -0.01330230012536049 -0.004394909832626581 0.01605330035090446
-2149 -0.01503490004688501 -0.006143589969724417 0.01595110073685646
-2150 -0.01334359962493181 -0.03046680055558681 0.01251740008592606
-2151 -0.02317179925739765 -0.03365309908986092 0.01121770031750202
-2152 -0.01368109975010157 -0.03418239951133728 0.01139410026371479
-2153 -0.01051560044288635 -0.03432850167155266 0.01144280005246401
-2154 -0.01512399967759848 -0.002089980058372021 0.01606719940900803
-2155 -0.01367240026593208 2.960080090886576e-18 0.01611389964818954
-2156 -0.01262599974870682 -0.001931129954755306 0.01612240076065063
-2157 -0.01051560044288635 -0.003162649925798178 0.01614820025861263
-2158 -0.0182448998093605 -0.002237109933048487 0.01599369943141937
-2159 -0.0133178997784853 -0.01392799988389015 0.01543440017849207
-2160 -0.0323714017868042 -0.003866980085149407 0.01541479956358671
-2161 -0.027683200314641 -0.002340489998459816 0.01566779986023903
-2162 -0.03019719943404198 -0.002132989931851625 0.01556000020354986
-2163 -0.03892109915614128 -0.03201929852366447 0.01067310012876987
-2164 -0.02001079916954041 -0.03386979922652245 0.01128990016877651
-2165 -0.03868760168552399 -0.02737770043313503 0.01203710027039051
-2166 -0.04206240177154541 -0.02855500020086765 0.0114716999232769
-2167 -0.03957829996943474 -0.02996259927749634 0.01126260031014681
-2168 -0.04206240177154541 -0.03162109851837158 0.01054039970040321
-2169 -0.04206240177154541 -0.006407110020518303 0.01475249975919724
-2170 -0.03878949955105782 -0.007464389782398939 0.01489249989390373
-2171 -0.01584210060536861 -0.03177259862422943 0.01208109967410564
-2172 -0.03925770148634911 -0.004304130095988512 0.01500339992344379
-2173 -0.01630770042538643 -0.02893020026385784 0.01283430028706789
-2174 -0.02279370091855526 -0.0312488991767168 0.01197679992765188
-2175 -0.02347210049629211 -0.02778369933366776 0.01285549998283386
-2176 -0.02128070034086704 -0.02941410057246685 0.01254309993237257
-2177 -0.01982579939067364 -0.02750279940664768 0.01306810043752193
-2178 -0.03659360110759735 -0.02969219908118248 0.01157850027084351
-2179 -0.03263580054044724 -0.03279519826173782 0.01093169953674078
-2180 -0.03578029945492744 -0.03242110088467598 0.01080700010061264
-2181 -0.03397699818015099 -0.0308568999171257 0.01144040003418922
-2182 -0.01903139986097813 -0.03097400069236755 0.01220849994570017
-2183 -0.01684669964015484 -0.03403950110077858 0.01134650036692619
-2184 -0.03453480079770088 -0.002117459895089269 0.01533710025250912
-2185 -0.03744740039110184 -0.002156100003048778 0.01516509987413883
-2186 -0.0357585996389389 2.807759950963764e-18 0.01528470031917095
-2187 -0.03573650121688843 -0.00489520002156496 0.01519429963082075
-2188 -0.03358609974384308 -0.006023580208420753 0.01527069974690676
-2189 -0.04206240177154541 -0.003204480046406388 0.01486799959093332
-2190 -0.03994809836149216 -0.001933100051246583 0.01501729991286993
-2191 -0.04206240177154541 -0.04126409813761711 0.005745130125433207
-2192 -0.04206240177154541 -0.0431951992213726 0.00385804008692503
-2193 -0.02071860060095787 -0.0410705991089344 0.008163399994373322
-2194 -0.01051560044288635 -0.04479720070958138 0.006237019784748554
-2195 -0.01368850003927946 -0.04669350013136864 0.004170500207692385
-2196 -0.03768150135874748 -0.03923920169472694 0.007677469868212938
-2197 -0.03726129978895187 -0.03726650029420853 0.00874571967869997
-2198 -0.01762579940259457 -0.0403158999979496 0.008727669715881348
-2199 -0.02315350063145161 -0.04158680140972137 0.007702169939875603
-2200 -0.01310709957033396 -0.03910699859261513 0.009490270167589188
-2201 -0.02933670021593571 -0.04127290099859238 0.007380019873380661
-2202 -0.0215671993792057 -0.04400920122861862 0.006167559884488583
-2203 -0.0387004017829895 -0.03427280113101006 0.009883820079267025
-2204 -0.03477229923009872 -0.0355461984872818 0.009741709567606449
-2205 -0.03977020084857941 -0.03642110154032707 0.008879819884896278
-2206 -0.02776139974594116 -0.03846580162644386 0.00902791041880846
-2207 -0.0263299997895956 -0.03340280055999756 0.01113430038094521
-2208 -0.02480719983577728 -0.03665729984641075 0.01001810003072023
-2209 -0.03226659819483757 -0.03777379915118217 0.008994219824671745
-2210 -0.03487420082092285 -0.03864099830389023 0.008316189981997013
-2211 -0.03606969863176346 -0.04100289940834045 0.006792750209569931
-2212 -0.03418629989027977 -0.04294490069150925 0.005601920187473297
-2213 -0.03089799918234348 -0.04309000074863434 0.00593593018129468
-2214 -0.03030869923532009 -0.03906660154461861 0.008531290106475353
-2215 -0.0322410985827446 -0.04056369885802269 0.007525119930505753
-2216 -0.02516880072653294 -0.03914690017700195 0.008882259950041771
-2217 -0.02635790035128593 -0.04562579840421677 0.004075129982084036
-2218 -0.02631659992039204 -0.04153959825634956 0.00748455012217164
-2219 -0.02858269959688187 -0.03531660139560699 0.01031079981476068
-2220 -0.01982120051980019 -0.03897260129451752 0.009283280000090599
-2221 -0.03134800121188164 -0.03530240058898926 0.0101215997710824
-2222 -0.03266119956970215 -0.0447952002286911 0.004000939894467592
-2223 -0.03005550056695938 -0.03686970099806786 0.009577699936926365
-2224 -0.01490879990160465 -0.03682690113782883 0.01039670035243034
-2225 -0.01262039970606565 -0.03637810051441193 0.01064470037817955
-2226 -0.01051560044288635 -0.03708929941058159 0.0104417996481061
-2227 -0.02070879936218262 -0.03631599992513657 0.01037439983338118
-2228 -0.02234929986298084 -0.03902649879455566 0.009119139984250069
-2229 -0.01804729923605919 -0.04378649964928627 0.006589789874851704
-2230 -0.03976560011506081 -0.03830070048570633 0.00795281957834959
-2231 -0.04206240177154541 -0.03903419896960258 0.007273389957845211
-2232 -0.03932559862732887 -0.04069650173187256 0.006558659952133894
-2233 -0.01570519991219044 -0.0390854999423027 0.009405089542269707
-2234 -0.01788369938731194 -0.03723400086164474 0.01012799981981516
-2235 -0.02780250087380409 -0.04363369941711426 0.005860359873622656
-2236 -0.02460410073399544 -0.04399739950895309 0.005899359937757254
-2237 -0.03893020004034042 -0.04373760148882866 0.00390648003667593
-2238 -0.0374164991080761 -0.04265100136399269 0.005331019870936871
-2239 -0.04018820077180862 -0.04240550100803375 0.005069170147180557
-2240 -0.02003219909965992 -0.04626519978046417 0.004132240079343319
-2241 -0.01686160080134869 -0.04649779945611954 0.004153020214289427
-2242 -0.01526420004665852 -0.04165270179510117 0.008106750436127186
-2243 -0.01239180006086826 -0.04221190139651299 0.007905970327556133
-2244 -0.01443289965391159 -0.04451340064406395 0.006239110138267279
-2245 -0.02791460044682026 -0.04663509875535965 0.002046860055997968
-2246 -0.02951299957931042 -0.04523659870028496 0.004040370229631662
-2247 -0.03266499936580658 -0.04637480154633522 0
-2248 -0.03580160066485405 -0.0458466000854969 0
-2249 -0.02319739945232868 -0.04596839845180511 0.004105729982256889
-2250 -0.02320129983127117 -0.04758960008621216 0
-2251 -0.02467009983956814 -0.04701900109648705 0.002065259963274002
-2252 -0.0210878998041153 -0.04738340154290199 0.00209034001454711
-2253 -0.02003549970686436 -0.04789699986577034 0
-2254 -0.01809499971568584 -0.04763590171933174 0.002092299982905388
-2255 -0.02636219933629036 -0.04723479971289635 0
-2256 -0.03110959939658642 -0.04620819911360741 0.002019779989495873
-2257 -0.02951730042695999 -0.04683170095086098 0
-2258 -0.03438629955053329 -0.04571279883384705 0.001958090113475919
-2259 -0.03579879924654961 -0.04428489878773689 0.00395536981523037
-2260 -0.0373368002474308 -0.04518689960241318 0.001961650094017386
-2261 -0.04023090004920959 -0.04465179890394211 0.0019750299397856
-2262 -0.03893150016665459 -0.04528019949793816 0
-2263 -0.01495239976793528 -0.04783869907259941 0.002120069926604629
-2264 -0.01368959993124008 -0.04834059998393059 0
-2265 -0.01686389930546284 -0.04813789948821068 0
-2266 -0.01051560044288635 -0.04808330163359642 0.002233250066637993
-2267 -0.0714339017868042 -0.02256710082292557 0.00922986026853323
-2268 -0.07050620019435883 -0.02553410083055496 0.008511349558830261
-2269 -0.04583590105175972 -0.009469250217080116 0.01427050027996302
-2270 -0.07360920310020447 -0.009351289831101894 0.01118880044668913
-2271 -0.06856279820203781 -0.004650239832699299 0.01219969987869263
-2272 -0.04206240177154541 -0.02231249958276749 0.01291829999536276
-2273 -0.04545040056109428 -0.02264860086143017 0.01254830043762922
-2274 -0.04538270086050034 -0.02588650025427341 0.01184049993753433
-2275 -0.0469961017370224 -0.02810450084507465 0.01110890042036772
-2276 -0.07090520113706589 -0.005482879932969809 0.01183759979903698
-2277 -0.05165059864521027 -0.03005239926278591 0.01001750025898218
-2278 -0.06056369841098785 -0.008596270345151424 0.0129653001204133
-2279 -0.06025649979710579 -0.0125620998442173 0.01263120025396347
-2280 -0.05982879921793938 -0.0163780003786087 0.01218529976904392
-2281 -0.05739739909768105 -0.01026189979165792 0.01317000016570091
-2282 -0.05690060183405876 -0.004225070122629404 0.01359410025179386
-2283 -0.05426939949393272 -0.006280870176851749 0.01375799998641014
-2284 -0.05340979993343353 -0.002923989901319146 0.01396869961172342
-2285 -0.05073710158467293 -0.005801570136100054 0.01410149969160557
-2286 -0.06326880306005478 -0.01260210014879704 0.01226949971169233
-2287 -0.04700300097465515 -0.01979630067944527 0.01293930038809776
-2288 -0.04743010178208351 -0.01409380044788122 0.0137090003117919
-2289 -0.05474279820919037 -0.01561869960278273 0.01284809969365597
-2290 -0.05635220184922218 -0.01305569987744093 0.01299929991364479
-2291 -0.06640910357236862 -0.01893950067460537 0.01088059972971678
-2292 -0.05438509956002235 -0.01095199957489967 0.01341119967401028
-2293 -0.05317439883947372 -0.01336739957332611 0.01328270044177771
-2294 -0.0503447987139225 -0.01371829956769943 0.01350579969584942
-2295 -0.04984759911894798 -0.01844670064747334 0.01291020028293133
-2296 -0.04206240177154541 -0.009605930186808109 0.0145584000274539
-2297 -0.04455349966883659 -0.01509399991482496 0.01382480002939701
-2298 -0.06280150264501572 -0.02281619980931282 0.01058079954236746
-2299 -0.06427539885044098 -0.0171888992190361 0.01149970013648272
-2300 -0.06133110076189041 -0.01835650019347668 0.01168499980121851
-2301 -0.07360920310020447 -0.01554219983518124 0.01039549987763166
-2302 -0.05155219882726669 2.603960018823562e-18 0.01417529955506325
-2303 -0.050034299492836 -0.02766020037233829 0.01092400029301643
-2304 -0.04845910146832466 -0.0306003000587225 0.01020010001957417
-2305 -0.05540049821138382 -0.008838370442390442 0.01348700001835823
-2306 -0.0575455017387867 -0.007321550045162439 0.01337539963424206
-2307 -0.05564479902386665 -0.01816529966890812 0.01237520016729832
-2308 -0.05741000175476074 -0.01592759974300861 0.01252369955182076
-2309 -0.06587880104780197 -0.005797860212624073 0.01250459998846054
-2310 -0.06250949949026108 -0.01523530017584562 0.0120278000831604
-2311 -0.06356669962406158 -0.01998420059680939 0.01108909957110882
-2312 -0.04938169941306114 -0.008986449800431728 0.01402449980378151
-2313 -0.05138190090656281 -0.01123620010912418 0.01366849988698959
-2314 -0.04953280091285706 -0.0157661996781826 0.01332630030810833
-2315 -0.05193179845809937 -0.01581650041043758 0.01310119964182377
-2316 -0.05250490084290504 -0.008648550137877464 0.0137772997841239
-2317 -0.06774149835109711 -0.02063190005719662 0.01032469980418682
-2318 -0.05227150022983551 -0.02477180026471615 0.0114283999428153
-2319 -0.05139710009098053 -0.02152270078659058 0.01222139969468117
-2320 -0.04438420012593269 -0.01882190071046352 0.0133213996887207
-2321 -0.04206240177154541 -0.0191555991768837 0.01346949953585863
-2322 -0.04722800105810165 -0.01690120063722134 0.01336830016225576
-2323 -0.06115270033478737 -0.02807099930942059 0.009357010014355183
-2324 -0.06732220202684402 2.291249971717025e-18 0.01247300021350384
-2325 -0.06661160290241241 -0.002643249928951263 0.0125316996127367
-2326 -0.07360920310020447 -0.003120969980955124 0.01156819984316826
-2327 -0.07360920310020447 2.133619952647082e-18 0.01161490008234978
-2328 -0.07015509903430939 -0.002273770049214363 0.01205909997224808
-2329 -0.07000400125980377 -0.02070599980652332 0.009938470087945461
-2330 -0.06995780020952225 -0.01792039908468723 0.0105279004201293
-2331 -0.04777970165014267 -0.006960750091820955 0.0142815001308918
-2332 -0.05340909957885742 -0.0275046993046999 0.01058380026370287
-2333 -0.04852849990129471 -0.02461089938879013 0.01184660010039806
-2334 -0.04859279841184616 -0.02147259935736656 0.01249739993363619
-2335 -0.07360920310020447 -0.01860979944467545 0.009819650091230869
-2336 -0.06829860061407089 -0.02321299910545349 0.009605560451745987
-2337 -0.06511040031909943 -0.02457530051469803 0.009777969680726528
-2338 -0.06174720078706741 -0.002155029913410544 0.01314069982618093
-2339 -0.05471180006861687 2.551339958131767e-18 0.01388879958540201
-2340 -0.05639449879527092 -0.001865520025603473 0.01370839960873127
-2341 -0.05869489908218384 -0.02588650025427341 0.01036449987441301
-2342 -0.06740520149469376 -0.02643539942800999 0.008811810053884983
-2343 -0.06429090350866318 -0.02729449979960918 0.009098149836063385
-2344 -0.06576450169086456 -0.02173030003905296 0.01039099972695112
-2345 -0.06386210024356842 -0.003713269950821996 0.01285069994628429
-2346 -0.06059230118989944 -0.004900679923593998 0.01318090036511421
-2347 -0.06210190057754517 -0.02544260025024414 0.01000710017979145
-2348 -0.05560459941625595 -0.0249502994120121 0.01100050006061792
-2349 -0.05603739991784096 -0.0274512991309166 0.01027119997888803
-2350 -0.05908099934458733 -0.00217098998837173 0.01343030016869307
-2351 -0.04463990032672882 -0.006114080082625151 0.01456569973379374
-2352 -0.07063029706478119 -0.01399639993906021 0.01106959953904152
-2353 -0.06311880052089691 -0.01000330038368702 0.01255299989134073
-2354 -0.06540130078792572 -0.01436209958046675 0.01177070010453463
-2355 -0.04500539973378181 -0.01212539989501238 0.01411029975861311
-2356 -0.04808799922466278 -0.01156620029360056 0.01391729991883039
-2357 -0.06057180091738701 -0.02112310007214546 0.01125590037554502
-2358 -0.05828579887747765 -0.0191383995115757 0.01191489957273006
-2359 -0.05492119863629341 -0.02148899994790554 0.01185320038348436
-2360 -0.05315230041742325 -0.0186036005616188 0.0125652002170682
-2361 -0.06815829873085022 -0.007968240417540073 0.01205999962985516
-2362 -0.07122460007667542 -0.008532949723303318 0.01158929988741875
-2363 -0.06618329882621765 -0.01118679996579885 0.01204369962215424
-2364 -0.06320369988679886 -0.006997960153967142 0.01277120038866997
-2365 -0.06520780175924301 -0.00832642987370491 0.01242929976433516
-2366 -0.06032130122184753 -0.02356790006160736 0.01074260007590055
-2367 -0.05809219926595688 -0.02280139923095703 0.01120579987764359
-2368 -0.06783690303564072 -0.013349499553442 0.01156250014901161
-2369 -0.07169289886951447 -0.0110828997567296 0.01127989962697029
-2370 -0.06939119845628738 -0.01100079994648695 0.01161570008844137
-2371 -0.06757819652557373 -0.01606719940900803 0.01121020037680864
-2372 -0.04734649881720543 -0.003453030018135905 0.01445959974080324
-2373 -0.05052810162305832 -0.002655569929629564 0.01422850042581558
-2374 -0.04426740109920502 -0.002564359921962023 0.01471239980310202
-2375 -0.04397109895944595 -0.02851950004696846 0.01128969993442297
-2376 -0.07360920310020447 -0.02710920013487339 0.007297220174223185
-2377 -0.0700519010424614 -0.02855050005018711 0.007467410061508417
-2378 -0.04518989846110344 -0.03420599922537804 0.009227380156517029
-2379 -0.047867801040411 -0.03303990140557289 0.009381289593875408
-2380 -0.04781030118465424 -0.03510620072484016 0.008510979823768139
-2381 -0.04526039958000183 -0.03110859915614128 0.01036950014531612
-2382 -0.04430339857935905 -0.03638099879026413 0.008367990143597126
-2383 -0.06800910085439682 -0.03092649951577187 0.006844529882073402
-2384 -0.04633560031652451 -0.03719960153102875 0.007670970167964697
-2385 -0.06266400218009949 -0.03432239964604378 0.006280149798840284
-2386 -0.07105039805173874 -0.03122100047767162 0.005892099812626839
-2387 -0.06016189977526665 -0.03714080154895782 0.004950790200382471
-2388 -0.05932049825787544 -0.03418590128421783 0.007088140118867159
-2389 -0.06098220124840736 -0.03133039921522141 0.008144579827785492
-2390 -0.04206240177154541 -0.03664619848132133 0.008542969822883606
-2391 -0.06441099941730499 -0.03143120184540749 0.007428899873048067
-2392 -0.06326819956302643 -0.02958109974861145 0.008449910208582878
-2393 -0.06616920232772827 -0.02914539910852909 0.008057739585638046
-2394 -0.06311129778623581 -0.03645969927310944 0.00462319003418088
-2395 -0.06509540230035782 -0.03549110144376755 0.004779169801622629
-2396 -0.06522669643163681 -0.03694330155849457 0.003299640025943518
-2397 -0.06633470207452774 -0.03379639983177185 0.005637399852275848
-2398 -0.06931819766759872 -0.03336609899997711 0.005005769897252321
-2399 -0.04206240177154541 -0.03416420146822929 0.009618230164051056
-2400 -0.07360920310020447 -0.02949629910290241 0.006183530203998089
-2401 -0.0716807022690773 -0.03311419859528542 0.00437651015818119
-2402 -0.04544829949736595 -0.04099410027265549 0.005278119817376137
-2403 -0.04456660151481628 -0.03923590108752251 0.006741509772837162
-2404 -0.05482880026102066 -0.0294393002986908 0.009813089855015278
-2405 -0.05799710005521774 -0.0287817008793354 0.00959389004856348
-2406 -0.04791650176048279 -0.03977809846401215 0.005773440003395081
-2407 -0.05459199845790863 -0.03836619853973389 0.005425769835710526
-2408 -0.05665789917111397 -0.03970459848642349 0.003546270076185465
-2409 -0.04792949929833412 -0.04191790148615837 0.003743960056453943
-2410 -0.05085580050945282 -0.04124730080366135 0.003684059949591756
-2411 -0.05152999982237816 -0.0390269011259079 0.005617740098387003
-2412 -0.0494266003370285 -0.03688229992985725 0.007386900018900633
-2413 -0.0503958985209465 -0.03367099910974503 0.008806750178337097
-2414 -0.05595429986715317 -0.03451250120997429 0.007549609988927841
-2415 -0.05226949974894524 -0.03642719984054565 0.007174340076744556
-2416 -0.05461210012435913 -0.03604520112276077 0.006965099833905697
-2417 -0.0574336014688015 -0.03724589943885803 0.00558914989233017
-2418 -0.05325689911842346 -0.03465100005269051 0.007937449961900711
-2419 -0.05385150015354156 -0.03249029815196991 0.008812930434942245
-2420 -0.05702260136604309 -0.03187980130314827 0.008581089787185192
-2421 -0.04499499872326851 -0.04255209863185883 0.003800600068643689
-2422 -0.04619500041007996 -0.04339810088276863 0.001931519946083426
-2423 -0.04793719947338104 -0.04339490085840225 0
-2424 -0.05376389995217323 -0.04050249978899956 0.003617529990151525
-2425 -0.05228950083255768 -0.0419607013463974 0.00184923002962023
-2426 -0.0537772998213768 -0.04192750155925751 0
-2427 -0.05953650176525116 -0.03885339945554733 0.003470249939709902
-2428 -0.06802830100059509 -0.03586680069565773 0.003203490050509572
-2429 -0.0696633979678154 -0.0361379012465477 0.001601750031113625
-2430 -0.05810470134019852 -0.04031430184841156 0.001769160036928952
-2431 -0.05667269974946976 -0.04110080003738403 0
-2432 -0.05521789938211441 -0.04115980118513107 0.001806269981898367
-2433 -0.04924729838967323 -0.04269810020923615 0.001924050040543079
-2434 -0.0609733983874321 -0.03940970078110695 0.001729459967464209
-2435 -0.05955170094966888 -0.04021919891238213 0
-2436 -0.06239540129899979 -0.03793900087475777 0.003388579934835434
-2437 -0.06381890177726746 -0.03843459859490395 0.001687149982899427
-2438 -0.06241000071167946 -0.03927230089902878 0
-2439 -0.06666889786720276 -0.03735220059752464 0.001641980023123324
-2440 -0.07082059979438782 -0.0359807014465332 0
-2441 -0.07360920310020447 -0.03365740180015564 0.003006160026416183
-2442 -0.04206240177154541 -0.04429110139608383 0.002057119971141219
-2443 -0.07081639766693115 -0.03475629910826683 0.003104310017079115
-2444 -0.07360920310020447 -0.02164719998836517 0.009101609699428082
-2445 -0.07644719630479813 -0.02362200058996677 0.007873980328440666
-2446 -0.07648830115795135 -0.01084509957581758 0.01051659975200891
-2447 -0.07745420187711716 -0.0157868005335331 0.009613920003175735
-2448 -0.0811678022146225 -0.01621749997138977 0.008792189881205559
-2449 -0.07521550357341766 -0.01694630086421967 0.009827770292758942
-2450 -0.07670559734106064 -0.01860979944467545 0.009188540279865265
-2451 -0.07929349690675735 -0.02262590080499649 0.00754196010529995
-2452 -0.07572150230407715 -0.02072739973664284 0.008880959823727608
-2453 -0.08301530033349991 -0.01846889965236187 0.007850020192563534
-2454 -0.07861369848251343 -0.02077849954366684 0.008252359926700592
-2455 -0.07900740206241608 -0.01817500032484531 0.008822419680655003
-2456 -0.07360920310020447 -0.006239099893718958 0.0114272003993392
-2457 -0.07587070018053055 -0.004208929836750031 0.01113899983465672
-2458 -0.08073829859495163 -0.01912290044128895 0.008224169723689556
-2459 -0.08211240172386169 -0.02156239934265614 0.007187460083514452
-2460 -0.08755730092525482 -0.01902740076184273 0.006342470180243254
-2461 -0.08403349667787552 -0.01604489982128143 0.0081632100045681
-2462 -0.07360920310020447 -0.01245389971882105 0.01084769982844591
-2463 -0.07934729754924774 -0.01297799963504076 0.00972019974142313
-2464 -0.07627560198307037 -0.0133170997723937 0.01023480016738176
-2465 -0.08547879755496979 -0.01768480055034161 0.007382909767329693
-2466 -0.0861537978053093 -0.01490209996700287 0.007846199907362461
-2467 -0.08703199774026871 -0.01217000000178814 0.008121980354189873
-2468 -0.08631029725074768 -0.008611209690570831 0.008790330030024052
-2469 -0.08574660122394562 -0.002698659896850586 0.009344819933176041
-2470 -0.08605910092592239 -0.005213209893554449 0.009146310389041901
-2471 -0.08345899730920792 -0.004442209843546152 0.009771949611604214
-2472 -0.08486650139093399 -0.02035650052130222 0.00678551010787487
-2473 -0.08116059750318527 -0.002817580010741949 0.01028919965028763
-2474 -0.07956299930810928 1.950919950367035e-18 0.01062029972672462
-2475 -0.08367069810628891 -0.007078300230205059 0.009546499699354172
-2476 -0.07831119745969772 -0.005692929960787296 0.01065209973603487
-2477 -0.07554709911346436 -0.002019919920712709 0.01126249972730875
-2478 -0.0761101022362709 -0.007618620060384274 0.01089289970695972
-2479 -0.08802050352096558 -0.003232290036976337 0.008783649653196335
-2480 -0.082533098757267 1.85235993281527e-18 0.01008380018174648
-2481 -0.08369000256061554 -0.001962790032848716 0.00982144009321928
-2482 -0.09768500179052353 -0.01274089980870485 0.004246970172971487
-2483 -0.09425369650125504 1.323169998561129e-18 0.007202989887446165
-2484 -0.09574919939041138 -0.002563929883763194 0.006693180184811354
-2485 -0.09283620119094849 -0.001887719961814582 0.00758109986782074
-2486 -0.09264770150184631 -0.004888160154223442 0.00748638017103076
-2487 -0.08842139691114426 1.608810043133985e-18 0.0087579395622015
-2488 -0.09034500271081924 -0.002492289990186691 0.008227069862186909
-2489 -0.09572289884090424 -0.005757160019129515 0.006483600009232759
-2490 -0.09989819675683975 9.328999817040159e-19 0.00507846986874938
-2491 -0.09761639684438705 -0.00446499977260828 0.005857029929757118
-2492 -0.09812109917402267 -0.002015999983996153 0.005784019827842712
-2493 -0.08772770315408707 -0.0166506003588438 0.006984000094234943
-2494 -0.09347940236330032 -0.01180600002408028 0.006305519957095385
-2495 -0.09386640042066574 -0.008756609633564949 0.006719150114804506
-2496 -0.09129290282726288 -0.007275059819221497 0.007647430058568716
-2497 -0.08925680071115494 -0.00582179008051753 0.008318499661982059
-2498 -0.08876349776983261 -0.01463500037789345 0.007161359768360853
-2499 -0.09163209795951843 -0.01121679972857237 0.006997569929808378
-2500 -0.0918503999710083 -0.01409259997308254 0.006320650223642588
-2501 -0.08986149728298187 -0.01230479963123798 0.0073187998495996
-2502 -0.08344220370054245 -0.0131844999268651 0.008846630342304707
-2503 -0.08507160097360611 -0.01103250030428171 0.008788649924099445
-2504 -0.08364570140838623 -0.009986789897084236 0.009255110286176205
-2505 -0.0796298012137413 -0.004323429893702269 0.01050010044127703
-2506 -0.08101599663496017 -0.005968289915472269 0.01015789993107319
-2507 -0.07803139835596085 -0.002766340039670467 0.01083160005509853
-2508 -0.08155269920825958 -0.0106952004134655 0.009606449864804745
-2509 -0.0792125016450882 -0.008995460346341133 0.0102335000410676
-2510 -0.08181949704885483 -0.00858002994209528 0.009789059869945049
-2511 -0.0975584015250206 -0.007830499671399593 0.005478859879076481
-2512 -0.09818500280380249 -0.01031020004302263 0.004667120054364204
-2513 -0.09989819675683975 -0.008136910386383533 0.004293520003557205
-2514 -0.09630150347948074 -0.01114779990166426 0.005403569899499416
-2515 -0.08997459709644318 -0.009524459950625896 0.00773447984829545
-2516 -0.07608009874820709 -0.030790900811553 0.004466310143470764
-2517 -0.07897190004587173 -0.0310639999806881 0.002774530090391636
-2518 -0.07360920310020447 -0.03173429891467094 0.004796879831701517
-2519 -0.07628340274095535 -0.03234609961509705 0.002889039926230907
-2520 -0.08024299889802933 -0.02781949937343597 0.004913929849863052
-2521 -0.07867439836263657 -0.02950309962034225 0.004375330172479153
-2522 -0.07851579785346985 -0.02560560032725334 0.006602670066058636
-2523 -0.07592450082302094 -0.02874059975147247 0.005837580189108849
-2524 -0.07788030058145523 -0.02781550027430058 0.005721270106732845
-2525 -0.07599770277738571 -0.02639289945363998 0.006943069864064455
-2526 -0.07360920310020447 -0.02463890053331852 0.008212979882955551
-2527 -0.09784310311079025 -0.01537119969725609 0.003010639920830727
-2528 -0.09535039961338043 -0.01457520015537739 0.004858389962464571
-2529 -0.08420579880475998 -0.028227299451828 0.002521160058677197
-2530 -0.08162839710712433 -0.02971759997308254 0.002654270036146045
-2531 -0.0828080028295517 -0.02693199925124645 0.004449690226465464
-2532 -0.09020440280437469 -0.01762159913778305 0.005873870104551315
-2533 -0.09198310226202011 -0.02112060040235519 0.003447589930146933
-2534 -0.09413199871778488 -0.01959419995546341 0.003131039906293154
-2535 -0.09280969947576523 -0.01614709943532944 0.00538235018029809
-2536 -0.09550879895687103 -0.01765060052275658 0.003460499923676252
-2537 -0.09257309883832932 -0.01894240081310272 0.004371029790490866
-2538 -0.09002210199832916 -0.02048690058290958 0.004808200057595968
-2539 -0.08120790123939514 -0.02505549974739552 0.006068849936127663
-2540 -0.08352869749069214 -0.02452420070767403 0.005537979770451784
-2541 -0.08467060327529907 -0.02600640058517456 0.004193120170384645
-2542 -0.08669310063123703 -0.02659150026738644 0.002375059993937612
-2543 -0.08912249654531479 -0.02487130090594292 0.002221409929916263
-2544 -0.08949069678783417 -0.02283089980483055 0.003755619982257485
-2545 -0.08721870183944702 -0.02197379991412163 0.005306450184434652
-2546 -0.08648359775543213 -0.02461840026080608 0.004197690170258284
-2547 -0.08495870232582092 -0.02291879989206791 0.005759479943662882
-2548 -0.09150280058383942 -0.02308440022170544 0.002061810111626983
-2549 -0.08916839957237244 -0.02571390010416508 0
-2550 -0.09800489991903305 -0.01700880005955696 0.001519159995950758
-2551 -0.09801899641752243 -0.0175905991345644 0
-2552 -0.09604260325431824 -0.0192416999489069 0.001718600047752261
-2553 -0.09607250243425369 -0.01988920010626316 0
-2554 -0.09382879734039307 -0.02122779935598373 0.001895989989861846
-2555 -0.081666000187397 -0.0307449996471405 0
-2556 -0.07899840176105499 -0.03214659914374352 0
-2557 -0.07360920310020447 -0.03484470024704933 0
-2558 -0.07360920310020447 -0.03451130166649818 0.001602889969944954
-2559 -0.07629629969596863 -0.03348080068826675 0
-2560 -0.08673900365829468 -0.02749690040946007 0
-2561 -0.08424949645996094 -0.02919469960033894 0
-2562 -0.1026910021901131 -0.001905909972265363 0.003431669902056456
-2563 -0.1040839999914169 -0.004909549839794636 0.001636520028114319
-2564 -0.1036190018057823 4.969060055243862e-19 0.002705029910430312
-2565 -0.1031889989972115 -0.004344699904322624 0.002883200068026781
-2566 -0.1042170003056526 -0.002381250029429793 0.00220121000893414
-2567 -0.1049389988183975 -0.00143585994374007 0.0004786190111190081
-2568 -0.1016630008816719 -0.006239550188183784 0.003568350104615092
-2569 -0.09989819675683975 -0.005445300135761499 0.004743029829114676
-2570 -0.09989819675683975 -0.002727970015257597 0.004996399860829115
-2571 -0.1018830016255379 7.071589804182679e-19 0.0038495899643749
-2572 -0.101173996925354 -0.001684430055320263 0.004310640040785074
-2573 -0.1015049964189529 -0.003711950033903122 0.00404332997277379
-2574 -0.1014880016446114 -0.008674999698996544 0.002891669981181622
-2575 -0.1049700006842613 -0.001654869993217289 0
-2576 -0.1048099994659424 -0.00352071993984282 0
-2577 -0.1029379963874817 -0.006756430026143789 0.002252140082418919
-2578 -0.1026460006833076 -0.01012500002980232 0
-2579 -0.09989819675683975 -0.01523539982736111 0
-2580 -0.09989819675683975 -0.01471630018204451 0.001314410008490086
-2581 -0.1013199985027313 -0.01257339958101511 0
-2582 -0.09989819675683975 -0.01077309995889664 0.003591019893065095
-2583 -0.1023819968104362 -0.01062010042369366 0.001240620040334761
-2584 -0.09989819675683975 -0.01289690006524324 0.00270366994664073
-2585 -0.1041560024023056 -0.005985530093312263 0.000893443007953465
-2586 -0.1047040000557899 -0.003093079896643758 0.001031029969453812
-2587 -0.1039540022611618 -0.00697069987654686 0.0007944750250317156
-2588 0.1459790021181107 -0.0005871389876119792 -0.0001957130007212982
-2589 0.1456490010023117 6.43826013140419e-20 -0.0003504829946905375
-2590 0.1415839940309525 -0.002637750003486872 -0.0008792509906925261
-2591 0.1398569941520691 -0.001732429955154657 -0.001508999965153635
-2592 0.141292005777359 -0.001332690007984638 -0.001226949971169233
-2593 0.1419879943132401 2.123960059905505e-19 -0.001156229991465807
-2594 0.1398569941520691 -0.004682010039687157 -0.0004181799886282533
-2595 0.1431739926338196 -0.001906960038468242 -0.0006356519879773259
-2596 0.1431789994239807 -0.002693200018256903 0
-2597 0.1446350067853928 -0.001223520026542246 -0.0004078400088474154
-2598 0.1398569941520691 -0.003427470102906227 -0.001142489956691861
-2599 0.1459790021181107 0.0005871389876119792 -0.0001957130007212982
-2600 0.1439120024442673 1.353559968031473e-19 -0.0007368429796770215
-2601 0.141292005777359 0.001332690007984638 -0.001226949971169233
-2602 0.1398569941520691 0.004847169853746891 0
-2603 0.1415870040655136 0.003728110110387206 0
-2604 0.1446390002965927 0.001727230031974614 0
-2605 0.1431739926338196 0.001906960038468242 -0.0006356519879773259
-2606 0.1459809988737106 0.0008288960088975728 0
-2607 0.1446350067853928 0.001223520026542246 -0.0004078400088474154
-2608 0.1431789994239807 0.002693200018256903 0
-2609 0.1415839940309525 0.002637750003486872 -0.0008792509906925261
-2610 0.1398569941520691 0.004682010039687157 -0.0004181799886282533
-2611 0.1194830015301704 0.01414269953966141 -0.003044419921934605
-2612 0.1221079975366592 0.01356980018317699 -0.002402809914201498
-2613 0.1205049976706505 0.01149039994925261 -0.003830119967460632
-2614 0.1258170008659363 0.01279820036143064 -0.001143089961260557
-2615 0.1231940016150475 0.01422919984906912 -0.001270900014787912
-2616 0.1377740055322647 0.004363290034234524 -0.001454430050216615
-2617 0.1377879977226257 0.005951569881290197 -0.0005315730231814086
-2618 0.135576993227005 0.005351929925382137 -0.001783980056643486
-2619 0.1332560032606125 0.006348739843815565 -0.002116250107064843
-2620 0.1332949995994568 0.008650409989058971 -0.0007726229960098863
-2621 0.130838006734848 0.007346579805016518 -0.002448860090225935
-2622 0.1377899944782257 0.006160289980471134 0
-2623 0.1356070041656494 0.007292489986866713 -0.0006513390108011663
-2624 0.1356109976768494 0.007547160144895315 0
-2625 0.1333000063896179 0.008952430449426174 0
-2626 0.1308770030736923 0.0100143002346158 -0.0008944440050981939
-2627 0.1308819949626923 0.01036460045725107 0
-2628 0.1258209943771362 0.01324770040810108 0
-2629 0.1283800005912781 0.0113944998010993 -0.001017719972878695
-2630 0.128383994102478 0.01179390028119087 0
-2631 0.1205129995942116 0.01569150015711784 -0.00140149996150285
-2632 0.1231969967484474 0.01472979970276356 0
-2633 0.1177750006318092 0.01719049923121929 -0.001535390038043261
-2634 0.136011004447937 0.002899759914726019 -0.002270499942824244
-2635 0.1341399997472763 0.004587590228766203 -0.00240837992168963
-2636 0.1209189966320992 0.008143319748342037 -0.00460866978392005
-2637 0.1231769993901253 0.01042350009083748 -0.00347450003027916
-2638 0.13230100274086 5.842109900714486e-19 -0.003180299885571003
-2639 0.125790998339653 0.009379340335726738 -0.003126450115814805
-2640 0.1295479983091354 6.81537991522627e-19 -0.003710119985044003
-2641 0.1307950019836426 0.002636840101331472 -0.00340001005679369
-2642 0.1198510006070137 0.004667410161346197 -0.005324069876223803
-2643 0.1320749968290329 0.004870919976383448 -0.002834920072928071
-2644 0.1290609985589981 0.005545329768210649 -0.00336733995936811
-2645 0.1334480047225952 0.002557849977165461 -0.002874820027500391
-2646 0.1263049989938736 0.00494092982262373 -0.004034049808979034
-2647 0.1283459961414337 0.008354759775102139 -0.002784919925034046
-2648 0.126690000295639 0.007306700106710196 -0.003513999981805682
-2649 0.1242299973964691 0.00726898992434144 -0.004070079885423183
-2650 0.1240030005574226 0.004559630062431097 -0.004533300176262856
-2651 0.1267140060663223 7.802249812984191e-19 -0.00424735015258193
-2652 0.1280360072851181 0.002563710091635585 -0.003936000168323517
-2653 0.1250810027122498 0.002479070099070668 -0.004499710164964199
-2654 0.1220619976520538 0.005647509824484587 -0.004782239906489849
-2655 0.1221190020442009 0.002742710057646036 -0.005041699856519699
-2656 0.1177750006318092 0.003186620073392987 -0.005836430005729198
-2657 0.1177750006318092 1.089749969456321e-18 -0.005932299885898829
-2658 0.1196409985423088 0.002150869928300381 -0.005536709912121296
-2659 0.1374810039997101 3.893650037187972e-19 -0.002119610086083412
-2660 0.1398569941520691 0.003427470102906227 -0.001142489956691861
-2661 0.1398569941520691 2.968040101619962e-19 -0.001615719986148179
-2662 0.1398569941520691 0.001732429955154657 -0.001508999965153635
-2663 0.138156995177269 0.002688510110601783 -0.001775569980964065
-2664 0.1205049976706505 -0.01149039994925261 -0.003830119967460632
-2665 0.1349570006132126 4.869249857593799e-19 -0.0026507000438869
-2666 0.1332560032606125 -0.006348739843815565 -0.002116250107064843
-2667 0.135576993227005 -0.005351929925382137 -0.001783980056643486
-2668 0.1242299973964691 -0.00726898992434144 -0.004070079885423183
-2669 0.1334480047225952 -0.002557849977165461 -0.002874820027500391
-2670 0.136011004447937 -0.002899759914726019 -0.002270499942824244
-2671 0.1341399997472763 -0.004587590228766203 -0.00240837992168963
-2672 0.1231769993901253 -0.01042350009083748 -0.00347450003027916
-2673 0.1307950019836426 -0.002636840101331472 -0.00340001005679369
-2674 0.1320749968290329 -0.004870919976383448 -0.002834920072928071
-2675 0.1290609985589981 -0.005545329768210649 -0.00336733995936811
-2676 0.130838006734848 -0.007346579805016518 -0.002448860090225935
-2677 0.126690000295639 -0.007306700106710196 -0.003513999981805682
-2678 0.1283459961414337 -0.008354759775102139 -0.002784919925034046
-2679 0.125790998339653 -0.009379340335726738 -0.003126450115814805
-2680 0.1240030005574226 -0.004559630062431097 -0.004533300176262856
-2681 0.1209189966320992 -0.008143319748342037 -0.00460866978392005
-2682 0.1250810027122498 -0.002479070099070668 -0.004499710164964199
-2683 0.1263049989938736 -0.00494092982262373 -0.004034049808979034
-2684 0.1280360072851181 -0.002563710091635585 -0.003936000168323517
-2685 0.1238069981336594 8.808520198033777e-19 -0.004795129876583815
-2686 0.1198510006070137 -0.004667410161346197 -0.005324069876223803
-2687 0.1221190020442009 -0.002742710057646036 -0.005041699856519699
-2688 0.1220619976520538 -0.005647509824484587 -0.004782239906489849
-2689 0.1208280026912689 9.83840969149905e-19 -0.005355780012905598
-2690 0.1196409985423088 -0.002150869928300381 -0.005536709912121296
-2691 0.1177750006318092 -0.003186620073392987 -0.005836430005729198
-2692 0.138156995177269 -0.002688510110601783 -0.001775569980964065
-2693 0.1398569941520691 -0.004847169853746891 0
-2694 0.1356109976768494 -0.007547160144895315 0
-2695 0.1332949995994568 -0.008650409989058971 -0.0007726229960098863
-2696 0.1308770030736923 -0.0100143002346158 -0.0008944440050981939
-2697 0.1333000063896179 -0.008952430449426174 0
-2698 0.1283800005912781 -0.0113944998010993 -0.001017719972878695
-2699 0.1308819949626923 -0.01036460045725107 0
-2700 0.128383994102478 -0.01179390028119087 0
-2701 0.1258209943771362 -0.01324770040810108 0
-2702 0.1231940016150475 -0.01422919984906912 -0.001270900014787912
-2703 0.1231969967484474 -0.01472979970276356 0
-2704 0.1205149963498116 -0.01624429970979691 0
-2705 0.1177750006318092 -0.01719049923121929 -0.001535390038043261
-2706 0.1194830015301704 -0.01414269953966141 -0.003044419921934605
-2707 0.1205129995942116 -0.01569150015711784 -0.00140149996150285
-2708 0.1177750006318092 -0.01506519969552755 -0.003158230101689696
-2709 0.1221079975366592 -0.01356980018317699 -0.002402809914201498
-2710 0.1258170008659363 -0.01279820036143064 -0.001143089961260557
-2711 0.1356070041656494 -0.007292489986866713 -0.0006513390108011663
-2712 0.1377740055322647 -0.004363290034234524 -0.001454430050216615
-2713 0.1377879977226257 -0.005951569881290197 -0.0005315730231814086
-2714 0.1005050018429756 0.02630040049552917 0
-2715 0.1063150018453598 0.02357620000839233 0
-2716 0.1091879978775978 0.02214800007641315 0
-2717 0.1062989979982376 0.02278020046651363 -0.002034649951383471
-2718 0.1091760024428368 0.02139919996261597 -0.00191130000166595
-2719 0.09462709724903107 0.02887539938092232 0
-2720 0.09755279868841171 0.02667300030589104 -0.00238232989795506
-2721 0.1120499968528748 0.02069680020213127 0
-2722 0.1149090006947517 0.01924050040543079 0
-2723 0.09166619926691055 0.03011170029640198 0
-2724 0.08869119733572006 0.03131350129842758 0
-2725 0.09164629876613617 0.02909360080957413 -0.002598539926111698
-2726 0.09460639953613281 0.02789999917149544 -0.002491920022293925
-2727 0.08568160235881805 0.0313681997358799 -0.002801700029522181
-2728 0.07965130358934402 0.03346430137753487 -0.002988910069689155
-2729 0.07360920310020447 0.0364282988011837 -0.001691919984295964
-2730 0.1177750006318092 0.01258429978042841 -0.004194770008325577
-2731 0.08965060114860535 0.027768699452281 -0.004515930078923702
-2732 0.07659979909658432 0.02525440044701099 -0.0084181297570467
-2733 0.07360920310020447 0.02861499972641468 -0.007702549919486046
-2734 0.07360920310020447 0.03113470040261745 -0.006526989862322807
-2735 0.07662779837846756 0.03448859974741936 -0.003080399939790368
-2736 0.0763327032327652 0.03206820040941238 -0.005306920036673546
-2737 0.07360920310020447 0.03349699825048447 -0.005063329823315144
-2738 0.08258520066738129 0.0237635001540184 -0.007921149954199791
-2739 0.08453969657421112 0.02624469995498657 -0.006600390188395977
-2740 0.08280190080404282 0.02970900014042854 -0.00516403978690505
-2741 0.08854480087757111 0.02218309976160526 -0.007394359912723303
-2742 0.0927995964884758 0.02640240080654621 -0.004465760197490454
-2743 0.08763349801301956 0.02550549991428852 -0.006276419851928949
-2744 0.08557070046663284 0.02299249917268753 -0.007664170116186142
-2745 0.09150800108909607 0.02133809961378574 -0.007112709805369377
-2746 0.09075400233268738 0.02456980012357235 -0.005998040083795786
-2747 0.09466250240802765 0.02377660013735294 -0.005432100035250187
-2748 0.1134359985589981 0.01726749911904335 -0.003349999897181988
-2749 0.1148779988288879 0.01361619960516691 -0.004538749810308218
-2750 0.08649670332670212 0.0288442000746727 -0.004724100232124329
-2751 0.0886726975440979 0.03025360032916069 -0.002702150028198957
-2752 0.1119849979877472 0.01465809997171164 -0.00488603999838233
-2753 0.1102569997310638 0.01844549924135208 -0.003739049891009927
-2754 0.07779330015182495 0.03296079859137535 -0.004201999865472317
-2755 0.09580189734697342 0.02589520066976547 -0.003839429933577776
-2756 0.08267179876565933 0.03243149816989899 -0.002896670019254088
-2757 0.09828480333089828 0.02426790073513985 -0.004135540220886469
-2758 0.1004849970340729 0.02541290037333965 -0.002269790042191744
-2759 0.07937580347061157 0.03152310103178024 -0.004857339896261692
-2760 0.07692079991102219 0.03055479936301708 -0.006085710134357214
-2761 0.1177750006318092 0.01506519969552755 -0.003158230101689696
-2762 0.07852110266685486 0.02700489945709705 -0.007439199835062027
-2763 0.07959330081939697 0.02451189979910851 -0.008170640096068382
-2764 0.08110480010509491 0.02688989974558353 -0.007000360172241926
-2765 0.07926689833402634 0.02911989949643612 -0.006330470088869333
-2766 0.1157540008425713 0.01668659970164299 -0.002892140066251159
-2767 0.1149049997329712 0.01858679950237274 -0.001660099951550364
-2768 0.1120420023798943 0.01999549940228462 -0.001785930013284087
-2769 0.09709160029888153 0.02200689911842346 -0.005655020009726286
-2770 0.1090909987688065 0.0156955998390913 -0.005231880117207766
-2771 0.07601939886808395 0.02837689965963364 -0.007338370196521282
-2772 0.1034030020236969 0.02411999925971031 -0.002154310001060367
-2773 0.1023819968104362 0.02040250040590763 -0.005052039865404367
-2774 0.1076150014996529 0.01814839988946915 -0.004663969855755568
-2775 0.1061889976263046 0.01671439968049526 -0.005571459885686636
-2776 0.1071870028972626 0.0204003993421793 -0.003626760095357895
-2777 0.1043630018830299 0.02182050049304962 -0.003704240079969168
-2778 0.1032740026712418 0.01769939996302128 -0.00589981023222208
-2779 0.1051679998636246 0.01936580054461956 -0.004786009900271893
-2780 0.09951160103082657 0.02143719978630543 -0.005314980167895555
-2781 0.1014460027217865 0.02297599986195564 -0.003940260037779808
-2782 0.1177750006318092 0.006360809784382582 -0.005540459882467985
-2783 0.07598350197076797 0.009061769582331181 -0.01158639974892139
-2784 0.1125620007514954 0.006267180200666189 -0.006473570130765438
-2785 0.1130390018224716 0.009568469598889351 -0.005917599890381098
-2786 0.115557000041008 0.005124089773744345 -0.006064279936254025
-2787 0.1146629974246025 0.008087689988315105 -0.005858960095793009
-2788 0.1177750006318092 0.009504949674010277 -0.005015380214899778
-2789 0.09318219870328903 0.01185590028762817 -0.008967489935457706
-2790 0.08183430135250092 0.01422910019755363 -0.01022959966212511
-2791 0.0828889012336731 0.01697029918432236 -0.00960887037217617
-2792 0.07989820092916489 0.01693519949913025 -0.01002870034426451
-2793 0.0789652019739151 0.01067289989441633 -0.01106049958616495
-2794 0.09740900248289108 0.01957049965858459 -0.006523489952087402
-2795 0.08780390024185181 0.01767480000853539 -0.008735040202736855
-2796 0.1072359979152679 0.002435399917885661 -0.007655439898371696
-2797 0.1070899963378906 0.004788630176335573 -0.00754904979839921
-2798 0.09216450154781342 0.006234900094568729 -0.009727519936859608
-2799 0.07360920310020447 0.00292837992310524 -0.01222109980881214
-2800 0.09771890193223953 0.01702209934592247 -0.007198739796876907
-2801 0.1003459990024567 0.01864789985120296 -0.006215959787368774
-2802 0.1003570035099983 0.01658320054411888 -0.006817180197685957
-2803 0.08388320356607437 0.01225700043141842 -0.01024159975349903
-2804 0.08418770134449005 0.0152252996340394 -0.009747940115630627
-2805 0.08147899806499481 0.01176759973168373 -0.01061690039932728
-2806 0.09292220324277878 0.01598010025918484 -0.008275790140032768
-2807 0.09677570313215256 0.0112490002065897 -0.008498609997332096
-2808 0.09790199995040894 0.005344749893993139 -0.008956920355558395
-2809 0.09499520063400269 0.005734960082918406 -0.009357980452477932
-2810 0.1008619964122772 0.007652999833226204 -0.008304299786686897
-2811 0.1034109964966774 0.008962330408394337 -0.00774070993065834
-2812 0.09758669883012772 0.008299100212752819 -0.008745459839701653
-2813 0.100101999938488 0.01246370002627373 -0.007759260013699532
-2814 0.08910650014877319 0.0198173001408577 -0.007996199652552605
-2815 0.1004199981689453 0.01015160046517849 -0.00807156041264534
-2816 0.1017699986696243 0.01456489972770214 -0.007045490201562643
-2817 0.1027790009975433 0.01143919955939054 -0.007479600142687559
-2818 0.1038779988884926 0.006213909946382046 -0.007962710224092007
-2819 0.09159749746322632 0.01435989979654551 -0.008803900331258774
-2820 0.09093510359525681 0.01760680042207241 -0.008243010379374027
-2821 0.07639169692993164 0.01286789961159229 -0.01112610008567572
-2822 0.07924660295248032 0.01400389987975359 -0.01060259994119406
-2823 0.07677450031042099 2.183150080160685e-18 -0.01188450027257204
-2824 0.07617779821157455 0.002378229983150959 -0.01192689966410398
-2825 0.0761013999581337 0.005353330168873072 -0.01182689983397722
-2826 0.07803229987621307 0.01906700059771538 -0.009859840385615826
-2827 0.07360920310020447 0.005854669958353043 -0.01210370007902384
-2828 0.0814765989780426 0.009108800441026688 -0.01090519968420267
-2829 0.08128619939088821 0.005810500122606754 -0.01117969956248999
-2830 0.1041010022163391 0.003135510021820664 -0.008134219795465469
-2831 0.07360920310020447 0.02600749954581261 -0.008669169619679451
-2832 0.08368030190467834 0.02059270069003105 -0.008673559874296188
-2833 0.07861500233411789 0.001827129977755249 -0.01165109965950251
-2834 0.08081989735364914 0.01975589990615845 -0.009307810105383396
-2835 0.08512409776449203 0.01776549965143204 -0.009124130010604858
-2836 0.08109410107135773 0.02222900092601776 -0.008629250340163708
-2837 0.07855120301246643 0.007348570041358471 -0.01140940003097057
-2838 0.07870610058307648 0.004185429774224758 -0.01156990043818951
-2839 0.08934620022773743 0.01528779976069927 -0.008982320316135883
-2840 0.07866139709949493 0.02163979969918728 -0.009159790351986885
-2841 0.08667249977588654 0.02023999951779842 -0.008291530422866344
-2842 0.09867569804191589 0.01447129994630814 -0.00761824008077383
-2843 0.08677030354738235 0.01460300013422966 -0.009489229880273342
-2844 0.08310569822788239 2.046360049443404e-18 -0.01113990042358637
-2845 0.08486899733543396 0.002047500107437372 -0.01089819986373186
-2846 0.08993580192327499 0.01309460029006004 -0.009269280359148979
-2847 0.1152120009064674 0.01110769994556904 -0.005170059856027365
-2848 0.08156280219554901 0.002565490081906319 -0.01128599978983402
-2849 0.08477009832859039 0.004847459960728884 -0.01080489996820688
-2850 0.09361959993839264 0.002929080044850707 -0.009705459699034691
-2851 0.07606910169124603 0.02102340012788773 -0.009697410278022289
-2852 0.08626940101385117 1.974960093714511e-18 -0.01075119990855455
-2853 0.08745899796485901 0.002929650014266372 -0.01054409984499216
-2854 0.1060359999537468 0.01094590034335852 -0.006988000124692917
-2855 0.1142970025539398 0.002468730090186 -0.006461539771407843
-2856 0.1047910004854202 0.01383879967033863 -0.006643760018050671
-2857 0.09501910209655762 0.01482160016894341 -0.008167180232703686
-2858 0.07360920310020447 0.01459669973701239 -0.01125319954007864
-2859 0.07672259956598282 0.01627550087869167 -0.01057459972798824
-2860 0.09889910370111465 1.654499984653811e-18 -0.009006660431623459
-2861 0.09574499726295471 1.738880058554886e-18 -0.009466029703617096
-2862 0.0944627970457077 0.02046719938516617 -0.006822419818490744
-2863 0.09426140040159225 0.01812360063195229 -0.007542020175606012
-2864 0.07690659910440445 0.02318619936704636 -0.009005050174891949
-2865 0.1101450026035309 0.003181949956342578 -0.007134309969842434
-2866 0.1092690005898476 0.006366820074617863 -0.007040690165013075
-2867 0.1009149998426437 0.002092130016535521 -0.008667130023241043
-2868 0.1098409965634346 0.009499849751591682 -0.006530529819428921
-2869 0.0756084993481636 0.01887339912354946 -0.01024060044437647
-2870 0.07360920310020447 0.01748769916594028 -0.01078560017049313
-2871 0.09843099862337112 0.002544489922001958 -0.009024379774928093
-2872 0.09613849967718124 0.003326599951833487 -0.00932942982763052
-2873 0.1065870001912117 0.007857689633965492 -0.007339990232139826
-2874 0.08943019807338715 1.899349995462876e-18 -0.01033960003405809
-2875 0.09054230153560638 0.003051579929888248 -0.01012740004807711
-2876 0.1020509973168373 1.567309978211894e-18 -0.00853206031024456
-2877 0.1010940000414848 0.004657519981265068 -0.008518540300428867
-2878 0.08838470280170441 0.006721199955791235 -0.01021530013531446
-2879 0.1086869984865189 0.01343549974262714 -0.005961619783192873
-2880 0.1122739985585213 0.01212240010499954 -0.00553649989888072
-2881 0.09441179782152176 0.008996360003948212 -0.009149120189249516
-2882 0.09093110263347626 0.009681710042059422 -0.009582109749317169
-2883 0.08448260277509689 0.008376809768378735 -0.01059310045093298
-2884 0.08750779926776886 0.01090210024267435 -0.009924129582941532
-2885 0.1177750006318092 -0.006360809784382582 -0.005540459882467985
-2886 0.1144810020923615 -0.01132019981741905 -0.005270319990813732
-2887 0.1177750006318092 -0.009504949674010277 -0.005015380214899778
-2888 0.0761013999581337 -0.005353330168873072 -0.01182689983397722
-2889 0.1105590015649796 -0.01176100037992001 -0.005968510173261166
-2890 0.07855120301246643 -0.007348570041358471 -0.01140940003097057
-2891 0.07598350197076797 -0.009061769582331181 -0.01158639974892139
-2892 0.1151319965720177 -0.007898430339992046 -0.005801440216600895
-2893 0.1125520020723343 -0.00617795018479228 -0.006484809797257185
-2894 0.07360920310020447 -0.01169160008430481 -0.01162409968674183
-2895 0.07360920310020447 -0.008776609785854816 -0.01190590020269156
-2896 0.1084050014615059 -0.009721999987959862 -0.00675914017483592
-2897 0.1127879992127419 -0.00893751997500658 -0.006072670221328735
-2898 0.08258520066738129 -0.0237635001540184 -0.007921149954199791
-2899 0.08183430135250092 -0.01422910019755363 -0.01022959966212511
-2900 0.07994040101766586 2.115159969711889e-18 -0.01151440013200045
-2901 0.0828889012336731 -0.01697029918432236 -0.00960887037217617
-2902 0.08081989735364914 -0.01975589990615845 -0.009307810105383396
-2903 0.0814765989780426 -0.009108800441026688 -0.01090519968420267
-2904 0.08780390024185181 -0.01767480000853539 -0.008735040202736855
-2905 0.1071799993515015 -0.006931869778782129 -0.007342630065977573
-2906 0.1071759983897209 -0.003778809914365411 -0.007600579876452684
-2907 0.08388400077819824 -0.01225700043141842 -0.01024150010198355
-2908 0.1103589981794357 -0.007981450296938419 -0.006659230217337608
-2909 0.1098600029945374 -0.004951110109686852 -0.007066890131682158
-2910 0.1114889979362488 1.284810014641865e-18 -0.006994190160185099
-2911 0.1090380027890205 -0.002000679960474372 -0.007370979990810156
-2912 0.09093470126390457 -0.01760780066251755 -0.008242839947342873
-2913 0.09292089939117432 -0.01598330028355122 -0.008275330066680908
-2914 0.09159749746322632 -0.01435989979654551 -0.008803900331258774
-2915 0.09318140149116516 -0.01185810007154942 -0.008967289701104164
-2916 0.09758610278367996 -0.008299180306494236 -0.00874555017799139
-2917 0.09511719644069672 -0.005724150221794844 -0.009341009892523289
-2918 0.1037859991192818 -0.007106109987944365 -0.007892790250480175
-2919 0.0982758030295372 -0.005858269985765219 -0.008863580413162708
-2920 0.1007869988679886 -0.007602440193295479 -0.008321410045027733
-2921 0.1032200008630753 -0.01194360014051199 -0.007315380033105612
-2922 0.1042909994721413 -0.0149039002135396 -0.006487050093710423
-2923 0.1004159972071648 -0.01015220023691654 -0.008072059601545334
-2924 0.08910650014877319 -0.0198173001408577 -0.007996199652552605
-2925 0.09677570313215256 -0.0112490002065897 -0.008498609997332096
-2926 0.09490419924259186 -0.01493520010262728 -0.008163530379533768
-2927 0.1025250032544136 -0.002334849908947945 -0.008412820287048817
-2928 0.1056990027427673 -0.009403339587152004 -0.007290990091860294
-2929 0.1068039983510971 -0.01299449987709522 -0.006442559882998466
-2930 0.1030090004205704 -0.009161749854683876 -0.00778135983273387
-2931 0.09997840225696564 -0.00262601999565959 -0.008790429681539536
-2932 0.08147899806499481 -0.01176759973168373 -0.01061690039932728
-2933 0.0789652019739151 -0.01067289989441633 -0.01106049958616495
-2934 0.07639169692993164 -0.01286789961159229 -0.01112610008567572
-2935 0.1153530031442642 -0.00471768993884325 -0.006136199925094843
-2936 0.07861500233411789 -0.001827129977755249 -0.01165109965950251
-2937 0.07360920310020447 -0.00292837992310524 -0.01222109980881214
-2938 0.08476889878511429 -0.004846860188990831 -0.01080510020256042
-2939 0.08448799699544907 -0.008376630023121834 -0.01059249974787235
-2940 0.1009569987654686 -0.004795330110937357 -0.008530669845640659
-2941 0.08512409776449203 -0.01776549965143204 -0.009124130010604858
-2942 0.07617779821157455 -0.002378229983150959 -0.01192689966410398
-2943 0.08109410107135773 -0.02222900092601776 -0.008629250340163708
-2944 0.08368030190467834 -0.02059270069003105 -0.008673559874296188
-2945 0.086770199239254 -0.01460300013422966 -0.009489229880273342
-2946 0.07989820092916489 -0.01693519949913025 -0.01002870034426451
-2947 0.07870610058307648 -0.004185429774224758 -0.01156990043818951
-2948 0.08156280219554901 -0.002565490081906319 -0.01128599978983402
-2949 0.08128619939088821 -0.005810500122606754 -0.01117969956248999
-2950 0.08934620022773743 -0.01528779976069927 -0.008982320316135883
-2951 0.07959330081939697 -0.02451189979910851 -0.008170640096068382
-2952 0.08667249977588654 -0.02023999951779842 -0.008291530422866344
-2953 0.09853699803352356 -0.01502879988402128 -0.00752383004873991
-2954 0.1000280007719994 -0.01258920039981604 -0.007749599870294333
-2955 0.1015589982271194 -0.01522110030055046 -0.006932190153747797
-2956 0.1052000001072884 1.47678002325164e-18 -0.008039209991693497
-2957 0.1044389978051186 -0.004305759910494089 -0.008016560226678848
-2958 0.08418770134449005 -0.0152252996340394 -0.009747940115630627
-2959 0.1083460003137589 1.382070014463426e-18 -0.007523620035499334
-2960 0.09444370120763779 -0.00899185985326767 -0.00914486963301897
-2961 0.1146309971809387 1.186780013067593e-18 -0.006460549775511026
-2962 0.08486820012331009 -0.002047080080956221 -0.01089830044656992
-2963 0.1156430020928383 -0.00213510007597506 -0.006247090175747871
-2964 0.09676290303468704 -0.00274964002892375 -0.009261880069971085
-2965 0.09389220178127289 -0.002924280008301139 -0.009667170234024525
-2966 0.1126819998025894 -0.002767429919913411 -0.006722909864038229
-2967 0.09258860349655151 1.820489904584521e-18 -0.009910300374031067
-2968 0.07360920310020447 -0.02320319972932339 -0.009512510150671005
-2969 0.07606910169124603 -0.02102340012788773 -0.009697410278022289
-2970 0.09705720096826553 -0.01724039949476719 -0.007264319807291031
-2971 0.07672259956598282 -0.01627550087869167 -0.01057459972798824
-2972 0.07924660295248032 -0.01400389987975359 -0.01060259994119406
-2973 0.0942595973610878 -0.01812740042805672 -0.007541330065578222
-2974 0.07659979909658432 -0.02525440044701099 -0.0084181297570467
-2975 0.07690659910440445 -0.02318619936704636 -0.009005050174891949
-2976 0.07803229987621307 -0.01906700059771538 -0.009859840385615826
-2977 0.07866139709949493 -0.02163979969918728 -0.009159790351986885
-2978 0.0756084993481636 -0.01887339912354946 -0.01024060044437647
-2979 0.07360920310020447 -0.02035919949412346 -0.0102105000987649
-2980 0.08747749775648117 -0.002930670045316219 -0.01054169982671738
-2981 0.09061159938573837 -0.003051759907975793 -0.01011789962649345
-2982 0.09224230051040649 -0.006227479781955481 -0.009717069566249847
-2983 0.0884087011218071 -0.006719210185110569 -0.01021219976246357
-2984 0.09095390141010284 -0.009678919799625874 -0.009579150006175041
-2985 0.08993449807167053 -0.01309479959309101 -0.00926946010440588
-2986 0.08751299977302551 -0.01090130023658276 -0.009923510253429413
-2987 0.1177750006318092 -0.01258429978042841 -0.004194770008325577
-2988 0.1148779988288879 -0.01361619960516691 -0.004538749810308218
-2989 0.07601939886808395 -0.02837689965963364 -0.007338370196521282
-2990 0.07662779837846756 -0.03448859974741936 -0.003080399939790368
-2991 0.07360920310020447 -0.03552690148353577 -0.003173140110448003
-2992 0.1090909987688065 -0.0156955998390913 -0.005231880117207766
-2993 0.07779330015182495 -0.03296079859137535 -0.004201999865472317
-2994 0.08557070046663284 -0.02299249917268753 -0.007664170116186142
-2995 0.09150800108909607 -0.02133809961378574 -0.007112709805369377
-2996 0.08854480087757111 -0.02218309976160526 -0.007394359912723303
-2997 0.09075400233268738 -0.02456980012357235 -0.005998040083795786
-2998 0.08965060114860535 -0.027768699452281 -0.004515930078923702
-2999 0.08453969657421112 -0.02624469995498657 -0.006600390188395977
-3000 0.08763349801301956 -0.02550549991428852 -0.006276419851928949
-3001 0.08649670332670212 -0.0288442000746727 -0.004724100232124329
-3002 0.08110480010509491 -0.02688989974558353 -0.007000360172241926
-3003 0.0927995964884758 -0.02640240080654621 -0.004465760197490454
-3004 0.09466250240802765 -0.02377660013735294 -0.005432100035250187
-3005 0.0944627970457077 -0.02046719938516617 -0.006822419818490744
-3006 0.0886726975440979 -0.03025360032916069 -0.002702150028198957
-3007 0.1119849979877472 -0.01465809997171164 -0.00488603999838233
-3008 0.07937580347061157 -0.03152310103178024 -0.004857339896261692
-3009 0.09828480333089828 -0.02426790073513985 -0.004135540220886469
-3010 0.09755279868841171 -0.02667300030589104 -0.00238232989795506
-3011 0.09580189734697342 -0.02589520066976547 -0.003839429933577776
-3012 0.08280190080404282 -0.02970900014042854 -0.00516403978690505
-3013 0.1034030020236969 -0.02411999925971031 -0.002154310001060367
-3014 0.0763327032327652 -0.03206820040941238 -0.005306920036673546
-3015 0.08267179876565933 -0.03243149816989899 -0.002896670019254088
-3016 0.08568160235881805 -0.0313681997358799 -0.002801700029522181
-3017 0.1134359985589981 -0.01726749911904335 -0.003349999897181988
-3018 0.1157540008425713 -0.01668659970164299 -0.002892140066251159
-3019 0.07852110266685486 -0.02700489945709705 -0.007439199835062027
-3020 0.07926689833402634 -0.02911989949643612 -0.006330470088869333
-3021 0.1149049997329712 -0.01858679950237274 -0.001660099951550364
-3022 0.09740900248289108 -0.01957049965858459 -0.006523489952087402
-3023 0.1014460027217865 -0.02297599986195564 -0.003940260037779808
-3024 0.09709160029888153 -0.02200689911842346 -0.005655020009726286
-3025 0.1091760024428368 -0.02139919996261597 -0.00191130000166595
-3026 0.1102569997310638 -0.01844549924135208 -0.003739049891009927
-3027 0.07360920310020447 -0.03113470040261745 -0.006526989862322807
-3028 0.07692079991102219 -0.03055479936301708 -0.006085710134357214
-3029 0.1032740026712418 -0.01769939996302128 -0.00589981023222208
-3030 0.1061889976263046 -0.01671439968049526 -0.005571459885686636
-3031 0.1076150014996529 -0.01814839988946915 -0.004663969855755568
-3032 0.1023819968104362 -0.02040250040590763 -0.005052039865404367
-3033 0.09951160103082657 -0.02143719978630543 -0.005314980167895555
-3034 0.1003459990024567 -0.01864789985120296 -0.006215959787368774
-3035 0.1071870028972626 -0.0204003993421793 -0.003626760095357895
-3036 0.1043630018830299 -0.02182050049304962 -0.003704240079969168
-3037 0.1051679998636246 -0.01936580054461956 -0.004786009900271893
-3038 0.1004849970340729 -0.02541290037333965 -0.002269790042191744
-3039 0.1062989979982376 -0.02278020046651363 -0.002034649951383471
-3040 0.1120420023798943 -0.01999549940228462 -0.001785930013284087
-3041 0.1177750006318092 -0.01779690012335777 0
-3042 0.09460639953613281 -0.02789999917149544 -0.002491920022293925
-3043 0.09164629876613617 -0.02909360080957413 -0.002598539926111698
-3044 0.07965130358934402 -0.03346430137753487 -0.002988910069689155
-3045 0.08268439769744873 -0.03357100114226341 0
-3046 0.07965970039367676 -0.03464179858565331 0
-3047 0.07360920310020447 -0.0364282988011837 -0.001691919984295964
-3048 0.03584320098161697 -0.04432540014386177 -0.0039589898660779
-3049 0.04541549831628799 -0.04272719845175743 -0.003816240001469851
-3050 0.05017510056495667 -0.04284749925136566 -0.00188033003360033
-3051 0.05333349853754044 -0.04212899878621101 -0.001848799991421402
-3052 0.05648209899663925 -0.04136890172958374 -0.001815440016798675
-3053 0.06274700164794922 -0.03970130160450935 -0.001742759952321649
-3054 0.05176340043544769 -0.04286770150065422 0
-3055 0.04859999939799309 -0.04357120022177696 0
-3056 0.04700750112533569 -0.04352400079369545 -0.001910010003484786
-3057 0.0658951997756958 -0.03877659887075424 -0.001704600057564676
-3058 0.04542750120162964 -0.04423199966549873 0
-3059 0.06117919832468033 -0.03911750018596649 -0.003493830095976591
-3060 0.04383059963583946 -0.0441582016646862 -0.001937850029207766
-3061 0.04224500060081482 -0.04484279826283455 0
-3062 0.04061450064182281 -0.04473140090703964 -0.001971790101379156
-3063 0.05804770067334175 -0.03992829844355583 -0.003566249972209334
-3064 0.05961940065026283 -0.04056670144200325 -0.001780239981599152
-3065 0.03728440031409264 -0.0452503003180027 -0.002039130078628659
-3066 0.07050260156393051 -0.03642779961228371 -0.003253600094467402
-3067 0.02944369986653328 -0.0464308001101017 -0.002156500006094575
-3068 0.03264499828219414 -0.04637600108981133 0
-3069 0.03395120054483414 -0.0457678996026516 -0.00203699991106987
-3070 0.06921970099210739 -0.03776900097727776 -0.001674039987847209
-3071 0.04799890145659447 -0.03590939939022064 -0.008282099850475788
-3072 0.06916890293359756 -0.03320629894733429 -0.006232679821550846
-3073 0.07099039852619171 -0.03185620158910751 -0.006631690077483654
-3074 0.03264230117201805 -0.04479619860649109 -0.004001040011644363
-3075 0.03455689921975136 -0.0404668003320694 -0.007341589778661728
-3076 0.03196129947900772 -0.04156789928674698 -0.006928860209882259
-3077 0.03350320085883141 -0.0430523008108139 -0.005622270051389933
-3078 0.06740009784698486 -0.03734280169010162 -0.003335329936817288
-3079 0.06842230260372162 -0.03542200103402138 -0.004888770170509815
-3080 0.03186300024390221 -0.03936609998345375 -0.008244140073657036
-3081 0.06429470330476761 -0.03824760019779205 -0.003416140098124743
-3082 0.06202669814229012 -0.03721040114760399 -0.005103420000523329
-3083 0.05957899987697601 -0.03541469946503639 -0.006822240073233843
-3084 0.06528949737548828 -0.03639569878578186 -0.004928660113364458
-3085 0.06306000053882599 -0.03465599939227104 -0.006613729987293482
-3086 0.0665815994143486 -0.03388160094618797 -0.006364690139889717
-3087 0.0590256005525589 -0.03802559897303581 -0.005162519868463278
-3088 0.05490370094776154 -0.04068949818611145 -0.003634240012615919
-3089 0.05590369924902916 -0.03874289989471436 -0.00527741014957428
-3090 0.05315870046615601 -0.03928849846124649 -0.005415880121290684
-3091 0.05457210168242455 -0.03678819909691811 -0.00687061995267868
-3092 0.04850130155682564 -0.03082449920475483 -0.01027479954063892
-3093 0.05017460137605667 -0.03356099873781204 -0.009068669751286507
-3094 0.05123639851808548 -0.036855798214674 -0.007351739797741175
-3095 0.05166120082139969 -0.03032859973609447 -0.010109500028193
-3096 0.05357189849019051 -0.03355130180716515 -0.008651440031826496
-3097 0.04380359873175621 -0.04093610122799873 -0.005839330144226551
-3098 0.03904210031032562 -0.04384149983525276 -0.003915769979357719
-3099 0.04223449900746346 -0.04331659898161888 -0.0038688899949193
-3100 0.04069890081882477 -0.04171169921755791 -0.005710890050977468
-3101 0.03738920018076897 -0.04190709814429283 -0.00602127006277442
-3102 0.07048369944095612 -0.02667099982500076 -0.008890350349247456
-3103 0.07140260189771652 -0.03407619893550873 -0.005166209768503904
-3104 0.07360920310020447 -0.03349699825048447 -0.005063329823315144
-3105 0.05796390026807785 -0.0292447991669178 -0.00974825955927372
-3106 0.06158610060811043 -0.03265770152211189 -0.007904199883341789
-3107 0.03580699861049652 -0.03245240077376366 -0.01081749983131886
-3108 0.06477349996566772 -0.03214430063962936 -0.00761470990255475
-3109 0.04730670154094696 -0.03344419971108437 -0.009441629983484745
-3110 0.04545620083808899 -0.03807789832353592 -0.007475859951227903
-3111 0.05719380080699921 -0.0368570014834404 -0.006373479962348938
-3112 0.04995520040392876 -0.04000340029597282 -0.00547845009714365
-3113 0.05692220106720924 -0.0319489985704422 -0.008883019909262657
-3114 0.06736080348491669 -0.02734529972076416 -0.009115110151469707
-3115 0.06910719722509384 -0.0294743999838829 -0.00806427001953125
-3116 0.06810279935598373 -0.03147109970450401 -0.00735368998721242
-3117 0.05875319987535477 -0.03297509998083115 -0.008192740380764008
-3118 0.05977629870176315 -0.03091650083661079 -0.008908960036933422
-3119 0.06296370178461075 -0.03038029931485653 -0.00866037979722023
-3120 0.06615599989891052 -0.02984209917485714 -0.008384140208363533
-3121 0.04858700186014175 -0.04208929836750031 -0.00375926005654037
-3122 0.05174989998340607 -0.04140999913215637 -0.003698589978739619
-3123 0.0566525012254715 -0.0346514992415905 -0.007708190008997917
-3124 0.0483241006731987 -0.03842309862375259 -0.006865019910037518
-3125 0.04692360013723373 -0.04059800133109093 -0.005567660089582205
-3126 0.04236280173063278 -0.03877250105142593 -0.007475350052118301
-3127 0.04399950057268143 -0.0350847989320755 -0.009119750000536442
-3128 0.04020629823207855 -0.03615200147032738 -0.009029990062117577
-3129 0.03149149939417839 -0.03665420040488243 -0.009565110318362713
-3130 0.03462250158190727 -0.03767380118370056 -0.008835120126605034
-3131 0.0370309017598629 -0.03634719923138618 -0.009229269810020924
-3132 0.04065360128879547 -0.03396860137581825 -0.009893599897623062
-3133 0.03898829966783524 -0.03210040181875229 -0.01070010010153055
-3134 0.03790849819779396 -0.03441840037703514 -0.009949970059096813
-3135 0.03797870129346848 -0.03894669935107231 -0.007865140214562416
-3136 0.03968250006437302 -0.04022910073399544 -0.006912120152264833
-3137 0.07360920310020447 -0.02861499972641468 -0.007702549919486046
-3138 0.07190150022506714 -0.02908230014145374 -0.007778239902108908
-3139 0.0341327004134655 -0.03486910089850426 -0.01007420010864735
-3140 0.02944369986653328 -0.03581469878554344 -0.01008289959281683
-3141 0.03262469917535782 -0.03279500082135201 -0.01093169953674078
-3142 0.03182090073823929 -0.02820540033280849 -0.01232129987329245
-3143 0.0353224016726017 -0.008361480198800564 -0.01505929976701736
-3144 0.07360920310020447 -0.005854669958353043 -0.01210370007902384
-3145 0.0645378977060318 -0.02068999968469143 -0.01120890025049448
-3146 0.07360920310020447 -0.02600749954581261 -0.008669169619679451
-3147 0.03668290004134178 -0.03004099987447262 -0.01150050014257431
-3148 0.03514460101723671 -0.02731529995799065 -0.01232740003615618
-3149 0.03861400112509727 -0.02792119979858398 -0.01194579992443323
-3150 0.04037069901823997 -0.02975150011479855 -0.0113207995891571
-3151 0.04216570034623146 -0.03171870112419128 -0.01057290006428957
-3152 0.07120350003242493 -0.02460060082376003 -0.009432559832930565
-3153 0.06843700259923935 -0.02467980049550533 -0.009776829741895199
-3154 0.03301560133695602 -0.03061450086534023 -0.01158410031348467
-3155 0.02944369986653328 -0.03314869850873947 -0.01104960031807423
-3156 0.0541330985724926 -0.01151440013200045 -0.01354559976607561
-3157 0.0569830983877182 -0.01305860001593828 -0.01314229983836412
-3158 0.05375050008296967 -0.01479919999837875 -0.01321639958769083
-3159 0.05261709913611412 -0.01874279975891113 -0.01274779997766018
-3160 0.04574229940772057 -0.007007549982517958 -0.01451960019767284
-3161 0.04760570079088211 -0.00984358973801136 -0.01419830042868853
-3162 0.0385906994342804 -0.02110379934310913 -0.01340360008180141
-3163 0.03538199886679649 -0.02137340046465397 -0.01355060003697872
-3164 0.03522200137376785 -0.02437339909374714 -0.01298729982227087
-3165 0.03625470027327538 -0.01566679961979389 -0.01434149965643883
-3166 0.0503045991063118 -0.02161329984664917 -0.01243910007178783
-3167 0.04848689958453178 -0.006419760175049305 -0.01435690000653267
-3168 0.04277700185775757 -0.02387039922177792 -0.01259359996765852
-3169 0.041457898914814 -0.02126039937138557 -0.01319089997559786
-3170 0.04045270010828972 -0.01383389998227358 -0.01430770009756088
-3171 0.03893639892339706 -0.01621190086007118 -0.01411859970539808
-3172 0.03747230023145676 -0.02313769981265068 -0.01309730019420385
-3173 0.04527610167860985 -0.01839490048587322 -0.01339189987629652
-3174 0.04738499969244003 -0.02082630060613155 -0.01282699964940548
-3175 0.03357879817485809 -0.01478559989482164 -0.01459410041570663
-3176 0.0343221016228199 -0.01806179992854595 -0.01413580030202866
-3177 0.03241910040378571 -0.02573899924755096 -0.01286830008029938
-3178 0.06894669681787491 -0.0139964995905757 -0.01183409988880157
-3179 0.04407069832086563 -0.02618589997291565 -0.01197469979524612
-3180 0.06656250357627869 -0.01412069983780384 -0.0120734004303813
-3181 0.03966429829597473 -0.005288609769195318 -0.01498270034790039
-3182 0.05598419904708862 -0.02011729963123798 -0.01220810040831566
-3183 0.0379347987473011 -0.01336229965090752 -0.01450490020215511
-3184 0.06676489859819412 -0.009576190263032913 -0.01254019979387522
-3185 0.06499490141868591 -0.002032639924436808 -0.01310800015926361
-3186 0.06416390091180801 2.42697997047932e-18 -0.01321190036833286
-3187 0.06731250137090683 2.368889971191864e-18 -0.01289559993892908
-3188 0.06449290364980698 -0.007546150125563145 -0.01292429957538843
-3189 0.03262009844183922 -0.01203809957951307 -0.01492480002343655
-3190 0.0346623994410038 -0.01052779983729124 -0.01494169980287552
-3191 0.03694719821214676 -0.01031369995325804 -0.01483509968966246
-3192 0.04002029821276665 -0.01880759932100773 -0.01368930004537106
-3193 0.04141119867563248 -0.01646599918603897 -0.01393330004066229
-3194 0.06898870319128036 -0.02025719918310642 -0.01077730022370815
-3195 0.06692910194396973 -0.02207970060408115 -0.0106258001178503
-3196 0.03140980005264282 -0.0142238000407815 -0.01477690041065216
-3197 0.03166859969496727 -0.01674629934132099 -0.0144651997834444
-3198 0.04390779882669449 -0.009081129916012287 -0.01451320014894009
-3199 0.04212610051035881 -0.01149229984730482 -0.01443529967218637
-3200 0.04481149837374687 -0.0122103001922369 -0.01418989989906549
-3201 0.04413989931344986 -0.02129519917070866 -0.01299399975687265
-3202 0.04549140110611916 -0.02370980009436607 -0.01241749990731478
-3203 0.05936169996857643 -0.007364590186625719 -0.01342490036040545
-3204 0.05688200145959854 -0.009310140274465084 -0.01350480038672686
-3205 0.06185739859938622 -0.008478119969367981 -0.01311769988387823
-3206 0.041024100035429 -0.008145060390233994 -0.01475679967552423
-3207 0.04351279884576797 -0.01666419953107834 -0.01376709993928671
-3208 0.03729290142655373 -0.0185650996863842 -0.01389109995216131
-3209 0.0484934002161026 -0.0240837000310421 -0.01208810042589903
-3210 0.06367009878158569 -0.01329679973423481 -0.01247849967330694
-3211 0.06419359892606735 -0.01014690008014441 -0.01275250036269426
-3212 0.0661081001162529 -0.01175540033727884 -0.01239980012178421
-3213 0.04660249873995781 -0.02663560025393963 -0.01165239978581667
-3214 0.03544630110263824 -0.01276149973273277 -0.01470329985022545
-3215 0.06450860202312469 -0.004615969955921173 -0.01307910028845072
-3216 0.04261590167880058 -0.01884559914469719 -0.01351370010524988
-3217 0.03273690119385719 -0.009054849855601788 -0.01515179965645075
-3218 0.04292890056967735 -0.01430440042167902 -0.01409879978746176
-3219 0.06689950078725815 -0.0190872997045517 -0.01125190034508705
-3220 0.03737229853868484 -0.006936879828572273 -0.01503170002251863
-3221 0.04841019958257675 -0.01353720016777515 -0.01379179954528809
-3222 0.04777229949831963 -0.01730399951338768 -0.01336419954895973
-3223 0.04552070051431656 -0.01539320033043623 -0.01378860045224428
-3224 0.04121740162372589 -0.02657910063862801 -0.01209769956767559
-3225 0.03990510106086731 -0.02362109906971455 -0.01284500025212765
-3226 0.03791550174355507 -0.02553319931030273 -0.01256689988076687
-3227 0.03937840089201927 -0.01061780005693436 -0.01467499975115061
-3228 0.06101410090923309 2.482570023160486e-18 -0.01351450011134148
-3229 0.06259670108556747 -0.002644400112330914 -0.01332959998399019
-3230 0.06181029975414276 -0.005611000116914511 -0.01329660043120384
-3231 0.07360920310020447 -0.01459669973701239 -0.01125319954007864
-3232 0.07123389840126038 -0.01302780024707317 -0.01171370036900043
-3233 0.07360920310020447 -0.01748769916594028 -0.01078560017049313
-3234 0.06974609941244125 -0.01810950040817261 -0.01110680028796196
-3235 0.07094830274581909 -0.0197443999350071 -0.0106527004390955
-3236 0.07061489671468735 -0.01555259991437197 -0.01143379975110292
-3237 0.03171379864215851 -0.003382859984412789 -0.01546410005539656
-3238 0.03491149842739105 -0.003250449895858765 -0.01530210021883249
-3239 0.03150599822402 -0.006717420183122158 -0.01535269990563393
-3240 0.03286109864711761 -0.02326860092580318 -0.01335300039499998
-3241 0.03748349845409393 -0.003503710031509399 -0.01516180019825697
-3242 0.06208230182528496 -0.02240259945392609 -0.01112459972500801
-3243 0.06751959770917892 -0.01640450023114681 -0.01164320018142462
-3244 0.06740409880876541 -0.006638600025326014 -0.0126868998631835
-3245 0.07042050361633301 -0.02212999947369099 -0.01018480025231838
-3246 0.03424689918756485 -0.005846419837325811 -0.01524860039353371
-3247 0.03183859959244728 -0.02044459991157055 -0.01391690038144588
-3248 0.03892410174012184 2.780389992060457e-18 -0.01513569988310337
-3249 0.03576400130987167 2.810639987061521e-18 -0.01530039962381124
-3250 0.04965440183877945 -0.002959910081699491 -0.01440490037202835
-3251 0.05155399814248085 2.627820043592654e-18 -0.01430520042777061
-3252 0.05330530181527138 -0.002463320037350059 -0.01413829997181892
-3253 0.05455039814114571 -0.004969430156052113 -0.01395860034972429
-3254 0.03106109984219074 -0.01061729993671179 -0.0151297003030777
-3255 0.06480000168085098 -0.01690159924328327 -0.01186269987374544
-3256 0.05949569866061211 -0.01033340021967888 -0.01318920031189919
-3257 0.04970249906182289 -0.01889139972627163 -0.01296889968216419
-3258 0.05619059875607491 -0.01704059913754463 -0.01269690040498972
-3259 0.05311930179595947 -0.02224669978022575 -0.01206429954618216
-3260 0.05469679832458496 -0.02508060075342655 -0.01128210034221411
-3261 0.05151350051164627 -0.02471630088984966 -0.01167550031095743
-3262 0.05949360132217407 -0.003450850024819374 -0.01359520014375448
-3263 0.06184329837560654 -0.01097240019589663 -0.01290920004248619
-3264 0.0605149008333683 -0.01334279961884022 -0.01278659980744123
-3265 0.05470870062708855 2.582310013856059e-18 -0.01405739970505238
-3266 0.05786209926009178 2.534070081302885e-18 -0.0137948002666235
-3267 0.05681850016117096 -0.00592187000438571 -0.01372690033167601
-3268 0.05076619982719421 -0.01604449935257435 -0.01330219954252243
-3269 0.05612310022115707 -0.002806959906592965 -0.01390200015157461
-3270 0.04414010047912598 -0.002477719914168119 -0.01479979977011681
-3271 0.04291310161352158 -0.005550200119614601 -0.01477930042892694
-3272 0.06144170090556145 -0.01878960058093071 -0.01190720032900572
-3273 0.05162740126252174 -0.01335230004042387 -0.01356130000203848
-3274 0.07141920179128647 -0.01080940011888742 -0.01194289978593588
-3275 0.06875450164079666 -0.01173240039497614 -0.01212510000914335
-3276 0.0407366007566452 -0.002911129966378212 -0.01499820034950972
-3277 0.06423590332269669 -0.0280115008354187 -0.009337170049548149
-3278 0.06514529883861542 -0.02428030036389828 -0.01030869968235493
-3279 0.06187539920210838 -0.01573619991540909 -0.01234420016407967
-3280 0.05933009833097458 -0.01615270040929317 -0.01253569964319468
-3281 0.05372650176286697 -0.008197469636797905 -0.01384889986366034
-3282 0.051910400390625 -0.00569193996489048 -0.01413580030202866
-3283 0.05107710137963295 -0.01078459993004799 -0.01385859958827496
-3284 0.05056130141019821 -0.00819557998329401 -0.01409760024398565
-3285 0.05840630084276199 -0.01867089979350567 -0.01223170012235641
-3286 0.05908500030636787 -0.02109749987721443 -0.01171999983489513
-3287 0.04642460122704506 -0.004346759989857674 -0.01459330040961504
-3288 0.07046060264110565 2.310030073549276e-18 -0.01257519982755184
-3289 0.06820099800825119 -0.002789620077237487 -0.01276810001581907
-3290 0.05977059900760651 -0.02408800087869167 -0.01099309977144003
-3291 0.04954009875655174 -0.02764669992029667 -0.01112260017544031
-3292 0.04533629864454269 -0.03128970041871071 -0.01042990013957024
-3293 0.0439119003713131 -0.02879359945654869 -0.01131189987063408
-3294 0.04677839949727058 -0.02908479981124401 -0.01097590010613203
-3295 0.07131429761648178 -0.002097520045936108 -0.01246820017695427
-3296 0.07069160044193268 -0.004793989937752485 -0.01244680024683475
-3297 0.07032179832458496 -0.008320000022649765 -0.0122750997543335
-3298 0.04677170142531395 -0.001959400018677115 -0.01463240012526512
-3299 0.04524140059947968 2.710720084582719e-18 -0.01475649978965521
-3300 0.06184139847755432 -0.02584009990096092 -0.01030219998210669
-3301 0.06110480055212975 -0.02865069918334484 -0.009550229646265507
-3302 0.05481550097465515 -0.0298020001500845 -0.009933999739587307
-3303 0.05754189938306808 -0.02679329924285412 -0.01053700037300587
-3304 0.0533686988055706 -0.02755220048129559 -0.01077079959213734
-3305 0.05677349865436554 -0.0233989991247654 -0.01146710012108088
-3306 0.02944369986653328 0.02727239951491356 -0.01271000038832426
-3307 0.03182090073823929 0.02820540033280849 -0.01232129987329245
-3308 0.03260369971394539 2.840100024577597e-18 -0.01546080037951469
-3309 0.03491149842739105 0.003250449895858765 -0.01530210021883249
-3310 0.07120350003242493 0.02460060082376003 -0.009432559832930565
-3311 0.03668290004134178 0.03004099987447262 -0.01150050014257431
-3312 0.03861400112509727 0.02792119979858398 -0.01194579992443323
-3313 0.04037069901823997 0.02975150011479855 -0.0113207995891571
-3314 0.06843700259923935 0.02467980049550533 -0.009776829741895199
-3315 0.07048369944095612 0.02667099982500076 -0.008890350349247456
-3316 0.03580699861049652 0.03245240077376366 -0.01081749983131886
-3317 0.03514460101723671 0.02731529995799065 -0.01232740003615618
-3318 0.03241910040378571 0.02573899924755096 -0.01286830008029938
-3319 0.02944369986653328 0.03314869850873947 -0.01104960031807423
-3320 0.03301560133695602 0.03061450086534023 -0.01158410031348467
-3321 0.02944369986653328 0.03022870048880577 -0.01194390002638102
-3322 0.03171379864215851 0.003382859984412789 -0.01546410005539656
-3323 0.02944369986653328 2.870529931361892e-18 -0.01562649942934513
-3324 0.0541330985724926 0.01151440013200045 -0.01354559976607561
-3325 0.0569830983877182 0.01305860001593828 -0.01314229983836412
-3326 0.05598419904708862 0.02011729963123798 -0.01220810040831566
-3327 0.05261709913611412 0.01874279975891113 -0.01274779997766018
-3328 0.04760570079088211 0.00984358973801136 -0.01419830042868853
-3329 0.041024100035429 0.008145060390233994 -0.01475679967552423
-3330 0.04574229940772057 0.007007549982517958 -0.01451960019767284
-3331 0.04738499969244003 0.02082630060613155 -0.01282699964940548
-3332 0.03538199886679649 0.02137340046465397 -0.01355060003697872
-3333 0.0385906994342804 0.02110379934310913 -0.01340360008180141
-3334 0.0343221016228199 0.01806179992854595 -0.01413580030202866
-3335 0.03791550174355507 0.02553319931030273 -0.01256689988076687
-3336 0.0503045991063118 0.02161329984664917 -0.01243910007178783
-3337 0.04277700185775757 0.02387039922177792 -0.01259359996765852
-3338 0.041457898914814 0.02126039937138557 -0.01319089997559786
-3339 0.04002029821276665 0.01880759932100773 -0.01368930004537106
-3340 0.03625470027327538 0.01566679961979389 -0.01434149965643883
-3341 0.05688200145959854 0.009310140274465084 -0.01350480038672686
-3342 0.03522200137376785 0.02437339909374714 -0.01298729982227087
-3343 0.04481149837374687 0.0122103001922369 -0.01418989989906549
-3344 0.04413989931344986 0.02129519917070866 -0.01299399975687265
-3345 0.04292890056967735 0.01430440042167902 -0.01409879978746176
-3346 0.04212610051035881 0.01149229984730482 -0.01443529967218637
-3347 0.06894669681787491 0.0139964995905757 -0.01183409988880157
-3348 0.04261590167880058 0.01884559914469719 -0.01351370010524988
-3349 0.04549140110611916 0.02370980009436607 -0.01241749990731478
-3350 0.03748349845409393 0.003503710031509399 -0.01516180019825697
-3351 0.03966429829597473 0.005288609769195318 -0.01498270034790039
-3352 0.04121740162372589 0.02657910063862801 -0.01209769956767559
-3353 0.07032179832458496 0.008320000022649765 -0.0122750997543335
-3354 0.06450860202312469 0.004615969955921173 -0.01307910028845072
-3355 0.03694719821214676 0.01031369995325804 -0.01483509968966246
-3356 0.06751959770917892 0.01640450023114681 -0.01164320018142462
-3357 0.03893639892339706 0.01621190086007118 -0.01411859970539808
-3358 0.06692910194396973 0.02207970060408115 -0.0106258001178503
-3359 0.06184329837560654 0.01097240019589663 -0.01290920004248619
-3360 0.06367009878158569 0.01329679973423481 -0.01247849967330694
-3361 0.02944369986653328 0.01523919962346554 -0.01477780006825924
-3362 0.03140980005264282 0.0142238000407815 -0.01477690041065216
-3363 0.03166859969496727 0.01674629934132099 -0.0144651997834444
-3364 0.03357879817485809 0.01478559989482164 -0.01459410041570663
-3365 0.0439119003713131 0.02879359945654869 -0.01131189987063408
-3366 0.04407069832086563 0.02618589997291565 -0.01197469979524612
-3367 0.0484934002161026 0.0240837000310421 -0.01208810042589903
-3368 0.06185739859938622 0.008478119969367981 -0.01311769988387823
-3369 0.05936169996857643 0.007364590186625719 -0.01342490036040545
-3370 0.04390779882669449 0.009081129916012287 -0.01451320014894009
-3371 0.04527610167860985 0.01839490048587322 -0.01339189987629652
-3372 0.03729290142655373 0.0185650996863842 -0.01389109995216131
-3373 0.03747230023145676 0.02313769981265068 -0.01309730019420385
-3374 0.03990510106086731 0.02362109906971455 -0.01284500025212765
-3375 0.0661081001162529 0.01175540033727884 -0.01239980012178421
-3376 0.06419359892606735 0.01014690008014441 -0.01275250036269426
-3377 0.03544630110263824 0.01276149973273277 -0.01470329985022545
-3378 0.0379347987473011 0.01336229965090752 -0.01450490020215511
-3379 0.03937840089201927 0.01061780005693436 -0.01467499975115061
-3380 0.04351279884576797 0.01666419953107834 -0.01376709993928671
-3381 0.0346623994410038 0.01052779983729124 -0.01494169980287552
-3382 0.04141119867563248 0.01646599918603897 -0.01393330004066229
-3383 0.04045270010828972 0.01383389998227358 -0.01430770009756088
-3384 0.04552070051431656 0.01539320033043623 -0.01378860045224428
-3385 0.07094830274581909 0.0197443999350071 -0.0106527004390955
-3386 0.04777229949831963 0.01730399951338768 -0.01336419954895973
-3387 0.05107710137963295 0.01078459993004799 -0.01385859958827496
-3388 0.06689950078725815 0.0190872997045517 -0.01125190034508705
-3389 0.05372650176286697 0.008197469636797905 -0.01384889986366034
-3390 0.03737229853868484 0.006936879828572273 -0.01503170002251863
-3391 0.0353224016726017 0.008361480198800564 -0.01505929976701736
-3392 0.05166120082139969 0.03032859973609447 -0.010109500028193
-3393 0.0407366007566452 0.002911129966378212 -0.01499820034950972
-3394 0.06499490141868591 0.002032639924436808 -0.01310800015926361
-3395 0.06259670108556747 0.002644400112330914 -0.01332959998399019
-3396 0.07061489671468735 0.01555259991437197 -0.01143379975110292
-3397 0.06974609941244125 0.01810950040817261 -0.01110680028796196
-3398 0.03424689918756485 0.005846419837325811 -0.01524860039353371
-3399 0.02944369986653328 0.006106450222432613 -0.01549329981207848
-3400 0.06144170090556145 0.01878960058093071 -0.01190720032900572
-3401 0.0645378977060318 0.02068999968469143 -0.01120890025049448
-3402 0.05908500030636787 0.02109749987721443 -0.01171999983489513
-3403 0.06208230182528496 0.02240259945392609 -0.01112459972500801
-3404 0.03150599822402 0.006717420183122158 -0.01535269990563393
-3405 0.03273690119385719 0.009054849855601788 -0.01515179965645075
-3406 0.06656250357627869 0.01412069983780384 -0.0120734004303813
-3407 0.07069160044193268 0.004793989937752485 -0.01244680024683475
-3408 0.06820099800825119 0.002789620077237487 -0.01276810001581907
-3409 0.07360920310020447 0.02035919949412346 -0.0102105000987649
-3410 0.07360920310020447 0.02320319972932339 -0.009512510150671005
-3411 0.07042050361633301 0.02212999947369099 -0.01018480025231838
-3412 0.06898870319128036 0.02025719918310642 -0.01077730022370815
-3413 0.03286109864711761 0.02326860092580318 -0.01335300039499998
-3414 0.03183859959244728 0.02044459991157055 -0.01391690038144588
-3415 0.04839820042252541 2.670620022847373e-18 -0.01453819964081049
-3416 0.05330530181527138 0.002463320037350059 -0.01413829997181892
-3417 0.04954009875655174 0.02764669992029667 -0.01112260017544031
-3418 0.05375050008296967 0.01479919999837875 -0.01321639958769083
-3419 0.02944369986653328 0.009155970066785812 -0.01532549969851971
-3420 0.03106109984219074 0.01061729993671179 -0.0151297003030777
-3421 0.02944369986653328 0.01220079977065325 -0.01508789975196123
-3422 0.03262009844183922 0.01203809957951307 -0.01492480002343655
-3423 0.06480000168085098 0.01690159924328327 -0.01186269987374544
-3424 0.05681850016117096 0.00592187000438571 -0.01372690033167601
-3425 0.05949569866061211 0.01033340021967888 -0.01318920031189919
-3426 0.05677349865436554 0.0233989991247654 -0.01146710012108088
-3427 0.05311930179595947 0.02224669978022575 -0.01206429954618216
-3428 0.0605149008333683 0.01334279961884022 -0.01278659980744123
-3429 0.04970249906182289 0.01889139972627163 -0.01296889968216419
-3430 0.06181029975414276 0.005611000116914511 -0.01329660043120384
-3431 0.05612310022115707 0.002806959906592965 -0.01390200015157461
-3432 0.06449290364980698 0.007546150125563145 -0.01292429957538843
-3433 0.06676489859819412 0.009576190263032913 -0.01254019979387522
-3434 0.06740409880876541 0.006638600025326014 -0.0126868998631835
-3435 0.04965440183877945 0.002959910081699491 -0.01440490037202835
-3436 0.05151350051164627 0.02471630088984966 -0.01167550031095743
-3437 0.04660249873995781 0.02663560025393963 -0.01165239978581667
-3438 0.06187539920210838 0.01573619991540909 -0.01234420016407967
-3439 0.05949360132217407 0.003450850024819374 -0.01359520014375448
-3440 0.04291310161352158 0.005550200119614601 -0.01477930042892694
-3441 0.04414010047912598 0.002477719914168119 -0.01479979977011681
-3442 0.07123389840126038 0.01302780024707317 -0.01171370036900043
-3443 0.05056130141019821 0.00819557998329401 -0.01409760024398565
-3444 0.05840630084276199 0.01867089979350567 -0.01223170012235641
-3445 0.06875450164079666 0.01173240039497614 -0.01212510000914335
-3446 0.07141920179128647 0.01080940011888742 -0.01194289978593588
-3447 0.07360920310020447 0.01169160008430481 -0.01162409968674183
-3448 0.07360920310020447 0.008776609785854816 -0.01190590020269156
-3449 0.04208340123295784 2.747610065155899e-18 -0.0149573003873229
-3450 0.06514529883861542 0.02428030036389828 -0.01030869968235493
-3451 0.04841019958257675 0.01353720016777515 -0.01379179954528809
-3452 0.05162740126252174 0.01335230004042387 -0.01356130000203848
-3453 0.05076619982719421 0.01604449935257435 -0.01330219954252243
-3454 0.051910400390625 0.00569193996489048 -0.01413580030202866
-3455 0.05933009833097458 0.01615270040929317 -0.01253569964319468
-3456 0.05619059875607491 0.01704059913754463 -0.01269690040498972
-3457 0.04848689958453178 0.006419760175049305 -0.01435690000653267
-3458 0.04642460122704506 0.004346759989857674 -0.01459330040961504
-3459 0.05455039814114571 0.004969430156052113 -0.01395860034972429
-3460 0.04850130155682564 0.03082449920475483 -0.01027479954063892
-3461 0.07360920310020447 2.252140045174905e-18 -0.01226009987294674
-3462 0.04533629864454269 0.03128970041871071 -0.01042990013957024
-3463 0.04677839949727058 0.02908479981124401 -0.01097590010613203
-3464 0.07131429761648178 0.002097520045936108 -0.01246820017695427
-3465 0.06184139847755432 0.02584009990096092 -0.01030219998210669
-3466 0.04677170142531395 0.001959400018677115 -0.01463240012526512
-3467 0.06423590332269669 0.0280115008354187 -0.009337170049548149
-3468 0.05469679832458496 0.02508060075342655 -0.01128210034221411
-3469 0.0533686988055706 0.02755220048129559 -0.01077079959213734
-3470 0.05754189938306808 0.02679329924285412 -0.01053700037300587
-3471 0.05977059900760651 0.02408800087869167 -0.01099309977144003
-3472 0.03264230117201805 0.04479619860649109 -0.004001040011644363
-3473 0.05123639851808548 0.036855798214674 -0.007351739797741175
-3474 0.03196129947900772 0.04156789928674698 -0.006928860209882259
-3475 0.03462250158190727 0.03767380118370056 -0.008835120126605034
-3476 0.06842230260372162 0.03542200103402138 -0.004888770170509815
-3477 0.07050260156393051 0.03642779961228371 -0.003253600094467402
-3478 0.06916890293359756 0.03320629894733429 -0.006232679821550846
-3479 0.0665815994143486 0.03388160094618797 -0.006364690139889717
-3480 0.06202669814229012 0.03721040114760399 -0.005103420000523329
-3481 0.06117919832468033 0.03911750018596649 -0.003493830095976591
-3482 0.05957899987697601 0.03541469946503639 -0.006822240073233843
-3483 0.06528949737548828 0.03639569878578186 -0.004928660113364458
-3484 0.05590369924902916 0.03874289989471436 -0.00527741014957428
-3485 0.0590256005525589 0.03802559897303581 -0.005162519868463278
-3486 0.05457210168242455 0.03678819909691811 -0.00687061995267868
-3487 0.04216570034623146 0.03171870112419128 -0.01057290006428957
-3488 0.04399950057268143 0.0350847989320755 -0.009119750000536442
-3489 0.05017460137605667 0.03356099873781204 -0.009068669751286507
-3490 0.05357189849019051 0.03355130180716515 -0.008651440031826496
-3491 0.06306000053882599 0.03465599939227104 -0.006613729987293482
-3492 0.04069890081882477 0.04171169921755791 -0.005710890050977468
-3493 0.03350320085883141 0.0430523008108139 -0.005622270051389933
-3494 0.03584320098161697 0.04432540014386177 -0.0039589898660779
-3495 0.03738920018076897 0.04190709814429283 -0.00602127006277442
-3496 0.06736080348491669 0.02734529972076416 -0.009115110151469707
-3497 0.06810279935598373 0.03147109970450401 -0.00735368998721242
-3498 0.03455689921975136 0.0404668003320694 -0.007341589778661728
-3499 0.03186300024390221 0.03936609998345375 -0.008244140073657036
-3500 0.07140260189771652 0.03407619893550873 -0.005166209768503904
-3501 0.05977629870176315 0.03091650083661079 -0.008908960036933422
-3502 0.06477349996566772 0.03214430063962936 -0.00761470990255475
-3503 0.04020629823207855 0.03615200147032738 -0.009029990062117577
-3504 0.03898829966783524 0.03210040181875229 -0.01070010010153055
-3505 0.03790849819779396 0.03441840037703514 -0.009949970059096813
-3506 0.06615599989891052 0.02984209917485714 -0.008384140208363533
-3507 0.04730670154094696 0.03344419971108437 -0.009441629983484745
-3508 0.05719380080699921 0.0368570014834404 -0.006373479962348938
-3509 0.04692360013723373 0.04059800133109093 -0.005567660089582205
-3510 0.05692220106720924 0.0319489985704422 -0.008883019909262657
-3511 0.05481550097465515 0.0298020001500845 -0.009933999739587307
-3512 0.05796390026807785 0.0292447991669178 -0.00974825955927372
-3513 0.05875319987535477 0.03297509998083115 -0.008192740380764008
-3514 0.0566525012254715 0.0346514992415905 -0.007708190008997917
-3515 0.06296370178461075 0.03038029931485653 -0.00866037979722023
-3516 0.06110480055212975 0.02865069918334484 -0.009550229646265507
-3517 0.06158610060811043 0.03265770152211189 -0.007904199883341789
-3518 0.04799890145659447 0.03590939939022064 -0.008282099850475788
-3519 0.0483241006731987 0.03842309862375259 -0.006865019910037518
-3520 0.04995520040392876 0.04000340029597282 -0.00547845009714365
-3521 0.05315870046615601 0.03928849846124649 -0.005415880121290684
-3522 0.04380359873175621 0.04093610122799873 -0.005839330144226551
-3523 0.04545620083808899 0.03807789832353592 -0.007475859951227903
-3524 0.02944369986653328 0.03581469878554344 -0.01008289959281683
-3525 0.03149149939417839 0.03665420040488243 -0.009565110318362713
-3526 0.02944369986653328 0.03841660171747208 -0.008955690078437328
-3527 0.04236280173063278 0.03877250105142593 -0.007475350052118301
-3528 0.0370309017598629 0.03634719923138618 -0.009229269810020924
-3529 0.0341327004134655 0.03486910089850426 -0.01007420010864735
-3530 0.04065360128879547 0.03396860137581825 -0.009893599897623062
-3531 0.04858700186014175 0.04208929836750031 -0.00375926005654037
-3532 0.03797870129346848 0.03894669935107231 -0.007865140214562416
-3533 0.03968250006437302 0.04022910073399544 -0.006912120152264833
-3534 0.06910719722509384 0.0294743999838829 -0.00806427001953125
-3535 0.07099039852619171 0.03185620158910751 -0.006631690077483654
-3536 0.07190150022506714 0.02908230014145374 -0.007778239902108908
-3537 0.03262469917535782 0.03279500082135201 -0.01093169953674078
-3538 0.03904210031032562 0.04384149983525276 -0.003915769979357719
-3539 0.04541549831628799 0.04272719845175743 -0.003816240001469851
-3540 0.04223449900746346 0.04331659898161888 -0.0038688899949193
-3541 0.05174989998340607 0.04140999913215637 -0.003698589978739619
-3542 0.05490370094776154 0.04068949818611145 -0.003634240012615919
-3543 0.05804770067334175 0.03992829844355583 -0.003566249972209334
-3544 0.05961940065026283 0.04056670144200325 -0.001780239981599152
-3545 0.06274700164794922 0.03970130160450935 -0.001742759952321649
-3546 0.06429470330476761 0.03824760019779205 -0.003416140098124743
-3547 0.06740009784698486 0.03734280169010162 -0.003335329936817288
-3548 0.05017510056495667 0.04284749925136566 -0.00188033003360033
-3549 0.05648209899663925 0.04136890172958374 -0.001815440016798675
-3550 0.05333349853754044 0.04212899878621101 -0.001848799991421402
-3551 0.04700750112533569 0.04352400079369545 -0.001910010003484786
-3552 0.0658951997756958 0.03877659887075424 -0.001704600057564676
-3553 0.04383059963583946 0.0441582016646862 -0.001937850029207766
-3554 0.03728440031409264 0.0452503003180027 -0.002039130078628659
-3555 0.04061450064182281 0.04473140090703964 -0.001971790101379156
-3556 0.07360920310020447 0.03552690148353577 -0.003173140110448003
-3557 0.07050540298223495 0.03771200031042099 0
-3558 0.07360920310020447 0.03678020089864731 0
-3559 0.03395120054483414 0.0457678996026516 -0.00203699991106987
-3560 0.06921970099210739 0.03776900097727776 -0.001674039987847209
-3561 -0.01051560044288635 -0.04237629845738411 -0.007896140217781067
-3562 0.02944369986653328 -0.04325760155916214 -0.006022680085152388
-3563 -0.008479219861328602 -0.04546229913830757 -0.005731239914894104
-3564 -0.002799409907311201 -0.04292549937963486 -0.007711539976298809
-3565 0.02461940050125122 -0.04006880149245262 -0.008424609899520874
-3566 0.02200979925692081 -0.03965239971876144 -0.008807159960269928
-3567 0.02673869952559471 -0.04203270003199577 -0.00712146982550621
-3568 0.01184340007603168 -0.04536119848489761 -0.005681890062987804
-3569 0.01411200035363436 -0.04670609906315804 -0.00417162012308836
-3570 -0.001279550022445619 -0.04713540151715279 -0.004209970124065876
-3571 -0.001596780028194189 -0.04552429914474487 -0.005841779988259077
-3572 0.002295339945703745 -0.04519800096750259 -0.006084280088543892
-3573 0.005882900208234787 -0.04488829895853996 -0.00626874016597867
-3574 -0.004359030164778233 -0.04709040001034737 -0.004205939825624228
-3575 0.02637900039553642 -0.04558660089969635 -0.004071630071848631
-3576 -0.008230440318584442 -0.04366840049624443 -0.007119010202586651
-3577 -0.005822449922561646 -0.04239730164408684 -0.007981309667229652
-3578 -0.005599389784038067 -0.04504029825329781 -0.006175910122692585
-3579 0.02724169939756393 -0.04392490163445473 -0.005666910205036402
-3580 0.01718430034816265 -0.04649059846997261 -0.004152379930019379
-3581 0.008557709865272045 -0.04340630024671555 -0.007273260038346052
-3582 0.01400620024651289 -0.04191270098090172 -0.00802129041403532
-3583 0.01943870075047016 -0.04485179856419563 -0.00561652984470129
-3584 0.02202280052006245 -0.04424820095300674 -0.005895069800317287
-3585 0.01105539966374636 -0.04217449948191643 -0.007970940321683884
-3586 0.00896333996206522 -0.04525699838995934 -0.005883490201085806
-3587 0.01053110044449568 -0.04394989833235741 -0.006843190174549818
-3588 -0.003040239913389087 -0.04102319851517677 -0.008785240352153778
-3589 0.01734290085732937 -0.04409610107541084 -0.006400750018656254
-3590 -0.005915530025959015 -0.03973690047860146 -0.009379079565405846
-3591 -0.008309789933264256 -0.04113529995083809 -0.008632339537143707
-3592 0.01543849986046553 -0.03991129994392395 -0.00903168972581625
-3593 0.01518029998987913 -0.04345589876174927 -0.006994930095970631
-3594 0.01282740011811256 -0.04370699822902679 -0.006929310038685799
-3595 0.01463830005377531 -0.04513299837708473 -0.005735749844461679
-3596 0.01249790005385876 -0.03999819979071617 -0.009093450382351875
-3597 -0.004362700041383505 -0.0344724990427494 -0.01149080041795969
-3598 -0.006477170158177614 -0.03689049929380417 -0.01058540027588606
-3599 0.01705240085721016 -0.04200829938054085 -0.007819719612598419
-3600 0.02107029967010021 -0.03759349882602692 -0.009813359938561916
-3601 0.01885960064828396 -0.03929600119590759 -0.009165080264210701
-3602 0.01918260008096695 -0.03626370057463646 -0.01045180018991232
-3603 0.02039170078933239 -0.04235659912228584 -0.007392779923975468
-3604 0.02364140003919601 -0.04204339906573296 -0.007351890206336975
-3605 0.0248929001390934 -0.0441385991871357 -0.005711840000003576
-3606 -0.007439100183546543 -0.03439820185303688 -0.01146609988063574
-3607 0.01577810011804104 -0.03691659867763519 -0.01034369971603155
-3608 -0.008552069775760174 -0.03849489986896515 -0.009889859706163406
-3609 -0.008675250224769115 -0.03628300130367279 -0.01077789999544621
-3610 0.001297579961828887 -0.04152709990739822 -0.008512509986758232
-3611 -0.0002217220026068389 -0.04288740083575249 -0.007739129941910505
-3612 0.002946580061689019 -0.04300969839096069 -0.00763275008648634
-3613 0.02944369986653328 -0.04091989994049072 -0.007624770049005747
-3614 -0.003314309986308217 -0.03790109977126122 -0.01022680010646582
-3615 0.01409680023789406 -0.03419189900159836 -0.01139730028808117
-3616 0.01343579962849617 -0.03812089934945107 -0.009925260208547115
-3617 0.01042430009692907 -0.03853359818458557 -0.009826740249991417
-3618 0.0263752993196249 -0.03337199985980988 -0.01112399995326996
-3619 0.01197099965065718 -0.03641660138964653 -0.01065600011497736
-3620 0.01102180033922195 -0.03430569916963577 -0.01143520046025515
-3621 -0.0007613640045747161 -0.04020509868860245 -0.0092042600736022
-3622 0.004578379914164543 -0.03663359954953194 -0.01070119999349117
-3623 0.008800039999186993 -0.03659500181674957 -0.01065510045737028
-3624 0.02442069910466671 -0.03521589934825897 -0.01057660020887852
-3625 0.00794564001262188 -0.03438900038599968 -0.01146300043910742
-3626 0.02944369986653328 -0.03841660171747208 -0.008955690078437328
-3627 0.0069428700953722 -0.0393977016210556 -0.009506549686193466
-3628 0.002969739958643913 -0.04029960185289383 -0.009130240418016911
-3629 0.0005805569817312062 -0.03735550120472908 -0.01045260019600391
-3630 0.001791769987903535 -0.03448760136961937 -0.01149590034037828
-3631 0.02677159942686558 -0.03920299932360649 -0.008730529807507992
-3632 0.02394969947636127 -0.03774679824709892 -0.009582630358636379
-3633 0.02677780017256737 -0.03648160025477409 -0.009955950081348419
-3634 0.0202396996319294 -0.0338331013917923 -0.01127769984304905
-3635 0.02202850021421909 -0.03576289862394333 -0.01049910020083189
-3636 0.02330780029296875 -0.03360620141029358 -0.01120209973305464
-3637 0.009226130321621895 -0.0411021001636982 -0.008617869578301907
-3638 0.006045530084520578 -0.0421576015651226 -0.008098180405795574
-3639 -0.008199930191040039 -0.03236730024218559 -0.01209099963307381
-3640 -0.007654150016605854 -0.02706010080873966 -0.01346630044281483
-3641 -0.007441270165145397 2.97872991177235e-18 -0.01621540077030659
-3642 0.01716969907283783 -0.03403440117835999 -0.01134479977190495
-3643 -0.01051560044288635 -0.02515389956533909 -0.01384100038558245
-3644 -0.01051560044288635 -0.01578149944543839 -0.01530370023101568
-3645 0.02684690058231354 -0.02761919982731342 -0.0127325002104044
-3646 0.02944369986653328 -0.02727239951491356 -0.01271000038832426
-3647 -0.01051560044288635 -0.02824299968779087 -0.01316229999065399
-3648 0.003547400003299117 -0.02486749924719334 -0.01395179983228445
-3649 0.01676809974014759 -0.01563649997115135 -0.01516429986804724
-3650 0.01862419955432415 -0.01773349940776825 -0.0148497000336647
-3651 0.01621510088443756 -0.02399099990725517 -0.01391690038144588
-3652 0.01797889918088913 -0.01277329958975315 -0.01542679965496063
-3653 0.003632739884778857 -0.01725150085985661 -0.01517170015722513
-3654 -0.001834299997426569 -0.01811850070953369 -0.01508279982954264
-3655 -0.001927049946971238 -0.02134530059993267 -0.01460659969598055
-3656 -0.007327749859541655 -0.01705689914524555 -0.01518000010401011
-3657 -0.002913489937782288 -0.0150049002841115 -0.01545609999448061
-3658 0.02944369986653328 -0.01523919962346554 -0.01477780006825924
-3659 0.02377299964427948 -0.009888609871268272 -0.0154705997556448
-3660 0.02644450031220913 -0.00792298000305891 -0.01550259999930859
-3661 0.02144310064613819 -0.01765879988670349 -0.01476419996470213
-3662 -0.004561650101095438 -0.01748890057206154 -0.01515250001102686
-3663 -0.003814480034634471 -0.01997189968824387 -0.01481309998780489
-3664 0.02122809924185276 -0.01201900001615286 -0.01539030019193888
-3665 -0.01051560044288635 -0.009481829591095448 -0.01587099954485893
-3666 0.02484860084950924 -0.01987339928746223 -0.01432089973241091
-3667 0.02358029969036579 -0.02258599922060966 -0.01391709968447685
-3668 0.0267574992030859 -0.02210989966988564 -0.01387850008904934
-3669 -0.002935450058430433 -0.02479269914329052 -0.01398770045489073
-3670 -0.004421070218086243 -0.0223833005875349 -0.01442109979689121
-3671 0.02944369986653328 -0.01826870068907738 -0.0143911000341177
-3672 0.02368490025401115 -0.02551859989762306 -0.01333940029144287
-3673 -0.01051560044288635 -0.003162649925798178 -0.01614820025861263
-3674 -0.01051560044288635 -0.006323779933154583 -0.01604470051825047
-3675 -0.008577000349760056 -0.007834809832274914 -0.01598710007965565
-3676 0.0266887005418539 -0.01680140011012554 -0.01468429993838072
-3677 0.0274363998323679 -0.01968690007925034 -0.01425290014594793
-3678 -0.002662430051714182 -0.03228040039539337 -0.01218710001558065
-3679 -0.007410920225083828 -0.02964089997112751 -0.0128533998504281
-3680 -0.005718130152672529 -0.03207869827747345 -0.01221380010247231
-3681 0.01549770031124353 -0.01860000006854534 -0.01482119970023632
-3682 0.0004486129910219461 -0.023098299279809 -0.01430310029536486
-3683 0.0001478269987273961 -0.01594579964876175 -0.01534979976713657
-3684 0.01610130071640015 -0.010886300355196 -0.01563969999551773
-3685 0.0006704339757561684 -0.01943350024521351 -0.01489359978586435
-3686 0.02681539952754974 -0.01108380034565926 -0.01527190022170544
-3687 0.0182402990758419 -0.02656389959156513 -0.01332509983330965
-3688 0.02013220079243183 -0.02372049912810326 -0.01383890025317669
-3689 -0.006418940145522356 -0.01976300030946732 -0.01482080016285181
-3690 -0.007368229795247316 -0.02161220088601112 -0.01452070008963346
-3691 0.02690310031175613 -0.004628890193998814 -0.01563530042767525
-3692 0.02944369986653328 -0.006106450222432613 -0.01549329981207848
-3693 0.02381259948015213 -0.006471219938248396 -0.01567069999873638
-3694 -0.001285549951717257 -0.03450550138950348 -0.01150180026888847
-3695 0.0273755993694067 -0.01360020041465759 -0.01502420008182526
-3696 0.02739059925079346 -0.03101019933819771 -0.01181020028889179
-3697 0.02944369986653328 -0.03022870048880577 -0.01194390002638102
-3698 -0.006944959983229637 -0.02438480034470558 -0.01403009984642267
-3699 -0.01051560044288635 -0.01263509970158339 -0.01562490034848452
-3700 0.02165180072188377 -0.02961920015513897 -0.01245590019971132
-3701 0.0194752998650074 -0.01474529970437288 -0.01518219988793135
-3702 0.02381259948015213 -0.02798690088093281 -0.01277409959584475
-3703 0.02112510055303574 -0.02712040022015572 -0.01309099979698658
-3704 -0.01051560044288635 -0.02204420045018196 -0.01441810000687838
-3705 0.02441189996898174 -0.0136668998748064 -0.0151231000199914
-3706 0.02186259999871254 -0.01534960046410561 -0.01503400038927794
-3707 0.02350899949669838 -0.01717459969222546 -0.01475290022790432
-3708 0.01884499937295914 -0.005253899842500687 -0.01588959991931915
-3709 0.01217519957572222 -0.007742370013147593 -0.01593079976737499
-3710 0.00476250983774662 -0.005797000136226416 -0.01611259952187538
-3711 0.006740400101989508 -0.007936310023069382 -0.01599030010402203
-3712 0.002033760072663426 -0.007058550138026476 -0.01607210002839565
-3713 0.004215680062770844 -0.00868596974760294 -0.01596730016171932
-3714 0.01404980011284351 -0.02935880050063133 -0.01279260031878948
-3715 0.01274900045245886 -0.01179269980639219 -0.01563720032572746
-3716 0.002216859953477979 -0.01355889998376369 -0.01559360045939684
-3717 -0.00109590997453779 -0.01211680006235838 -0.01573959924280643
-3718 0.01057920046150684 -0.02095809951424599 -0.01456610020250082
-3719 0.01382850017398596 -0.02147980034351349 -0.01442189980298281
-3720 0.0003974039864260703 -0.002329899929463863 -0.01624009944498539
-3721 0.0151055995374918 -0.02677690051496029 -0.01337550021708012
-3722 0.01056110020726919 -0.02313110046088696 -0.01419780030846596
-3723 0.009919510222971439 -0.02803670056164265 -0.0131973996758461
-3724 0.002831170102581382 -0.02821560017764568 -0.01323620043694973
-3725 0.02437819913029671 -0.03084589913487434 -0.01199750043451786
-3726 0.007961769588291645 -0.02133730053901672 -0.0145412003621459
-3727 0.003912690095603466 -0.0213031992316246 -0.01458670012652874
-3728 1.278580020880327e-05 -0.02638559974730015 -0.01366230007261038
-3729 -0.003980460111051798 -0.02986370027065277 -0.0128389997407794
-3730 0.01372979953885078 -0.009875760413706303 -0.01576800085604191
-3731 0.0179063007235527 -0.00835178978741169 -0.01576579920947552
-3732 -0.0006125890067778528 -0.0297072995454073 -0.01289070025086403
-3733 0.0006535819848068058 -0.03281269967556 -0.01202839985489845
-3734 -0.002665020059794188 -0.002902250038459897 -0.01622889935970306
-3735 -0.00129249005112797 2.988029903399283e-18 -0.0162661001086235
-3736 0.003997299820184708 -0.0114662004634738 -0.01576929911971092
-3737 -0.0007385169737972319 -0.005251190159469843 -0.01616239920258522
-3738 0.01269229967147112 -0.03213239833712578 -0.01207169983536005
-3739 0.01691720075905323 -0.02893389947712421 -0.01281549967825413
-3740 0.01573709957301617 -0.03164279833436012 -0.01213049981743097
-3741 -0.005096179898828268 -0.027241300791502 -0.01345730014145374
-3742 -0.002608150010928512 -0.02763820067048073 -0.01338679995387793
-3743 0.01937370002269745 -0.02873760089278221 -0.0127750001847744
-3744 0.02170230075716972 -0.03187460079789162 -0.01182319968938828
-3745 0.001579690026119351 -0.01025469973683357 -0.01587790064513683
-3746 0.00845750980079174 -0.009725919924676418 -0.01585919968783855
-3747 0.006248930003494024 -0.01070229988545179 -0.01581110060214996
-3748 0.009400430135428905 -0.007491909898817539 -0.01598509959876537
-3749 0.01216750033199787 -0.02737269923090935 -0.01330980006605387
-3750 0.01305530034005642 -0.02472149953246117 -0.0138525003567338
-3751 0.01007649954408407 -0.02541040070354939 -0.01376849971711636
-3752 0.02944369986653328 -0.009155970066785812 -0.01532549969851971
-3753 0.02944369986653328 -0.01220079977065325 -0.01508789975196123
-3754 0.01893389970064163 -0.03128520026803017 -0.01211540028452873
-3755 0.006362630054354668 -0.01939049921929836 -0.01485799998044968
-3756 0.007587740197777748 -0.005204670131206512 -0.01611060090363026
-3757 0.005587249994277954 -0.002775330096483231 -0.01620090007781982
-3758 0.002653599949553609 -0.0311322994530201 -0.01249739993363619
-3759 0.02176940068602562 -0.004900150001049042 -0.01580669917166233
-3760 0.005595630034804344 -0.03212400153279305 -0.0121916001662612
-3761 0.02944369986653328 -0.02128669992089272 -0.01392260007560253
-3762 0.02590020000934601 -0.02440650016069412 -0.01347879972308874
-3763 0.02944369986653328 -0.02428949996829033 -0.01336540002375841
-3764 0.01488909963518381 -0.008036060258746147 -0.01586209982633591
-3765 0.01592460088431835 -0.005802359897643328 -0.01594920083880424
-3766 0.01379919983446598 -0.005395589862018824 -0.01601249910891056
-3767 0.02135859988629818 -0.01991079933941364 -0.01444550044834614
-3768 0.01758709922432899 -0.02092679962515831 -0.01441380009055138
-3769 -0.007891260087490082 -0.01050950028002262 -0.01582209952175617
-3770 0.005340040195733309 -0.02966460026800632 -0.01286069955676794
-3771 0.01120399963110685 -0.009914480149745941 -0.01580910012125969
-3772 0.01213280018419027 -0.0141313998028636 -0.01542919967323542
-3773 -0.005297529976814985 -0.0148844001814723 -0.01545289997011423
-3774 -0.007527689915150404 -0.01338389981538057 -0.01558229979127645
-3775 -0.001810809946618974 -0.00855811033397913 -0.01600039936602116
-3776 0.01893250085413456 -0.01069589983671904 -0.01557420007884502
-3777 0.02089639939367771 -0.008015500381588936 -0.01569130085408688
-3778 0.004868879914283752 -0.0344482995569706 -0.01148280035704374
-3779 0.007930849678814411 2.977960013417216e-18 -0.01621129922568798
-3780 0.009263359941542149 -0.002639719983562827 -0.01616580039262772
-3781 0.002523229923099279 -0.004195420071482658 -0.01618519984185696
-3782 0.002976970048621297 -0.001861299970187247 -0.01623559929430485
-3783 0.01370569970458746 -0.01617610082030296 -0.01517389994114637
-3784 0.01077849976718426 -0.005183069966733456 -0.01607180014252663
-3785 0.01407920010387897 2.960930018965974e-18 -0.01611859910190105
-3786 0.009095599874854088 -0.01880449987947941 -0.01490969955921173
-3787 0.01490399986505508 -0.01364540029317141 -0.01542390044778585
-3788 0.01215930003672838 -0.01870080083608627 -0.01487709954380989
-3789 -0.004855259787291288 -0.01204250007867813 -0.0157306008040905
-3790 0.005358629859983921 -0.01372900046408176 -0.01555429957807064
-3791 -0.006023949943482876 -0.002785000018775463 -0.01620360091328621
-3792 -0.007769709918648005 -0.005166400223970413 -0.01611690036952496
-3793 -0.008462630212306976 -0.002203880110755563 -0.01618549972772598
-3794 -0.004400019999593496 -0.005473639816045761 -0.01614069938659668
-3795 -0.005493239965289831 -0.008513789623975754 -0.01598110049962997
-3796 0.007258940022438765 -0.02377519942820072 -0.0141251003369689
-3797 0.006663599982857704 -0.0272538997232914 -0.01342099998146296
-3798 -0.003386510070413351 -0.01031710021197796 -0.01587769947946072
-3799 0.008070129901170731 -0.0307071004062891 -0.01255560014396906
-3800 0.01100509986281395 2.970769952737752e-18 -0.01617209985852242
-3801 0.01247680000960827 -0.002723559970036149 -0.01611690036952496
-3802 0.009099819697439671 -0.01294459961354733 -0.01558999996632338
-3803 0.007211700081825256 -0.01632980071008205 -0.01525290030986071
-3804 0.01016900036484003 -0.03236629813909531 -0.01205519959330559
-3805 0.02944369986653328 -0.003053959924727678 -0.01559329964220524
-3806 0.02730559930205345 -0.00206982996314764 -0.0156830009073019
-3807 0.02637100033462048 2.889900019766046e-18 -0.01573190093040466
-3808 0.01110150013118982 -0.03008509986102581 -0.01267050020396709
-3809 0.02436669915914536 -0.002665840089321136 -0.01577669940888882
-3810 0.02026250027120113 -0.002268319949507713 -0.0159268993884325
-3811 0.01715279929339886 2.947310076589982e-18 -0.01604440063238144
-3812 0.01617930084466934 -0.003040109993889928 -0.016032500192523
-3813 0.01061160024255514 -0.01622959971427917 -0.01522149983793497
-3814 -0.01051560044288635 0.0313045009970665 -0.01236889977008104
-3815 -0.01051560044288635 0.03432850167155266 -0.01144280005246401
-3816 -0.008199930191040039 0.03236730024218559 -0.01209099963307381
-3817 0.02437819913029671 0.03084589913487434 -0.01199750043451786
-3818 -0.008462630212306976 0.002203880110755563 -0.01618549972772598
-3819 0.0202396996319294 0.0338331013917923 -0.01127769984304905
-3820 -0.01051560044288635 0.02824299968779087 -0.01316229999065399
-3821 0.02684690058231354 0.02761919982731342 -0.0127325002104044
-3822 -0.007410920225083828 0.02964089997112751 -0.0128533998504281
-3823 -0.001927049946971238 0.02134530059993267 -0.01460659969598055
-3824 0.01676809974014759 0.01563649997115135 -0.01516429986804724
-3825 0.0006704339757561684 0.01943350024521351 -0.01489359978586435
-3826 -0.002913489937782288 0.0150049002841115 -0.01545609999448061
-3827 0.02350899949669838 0.01717459969222546 -0.01475290022790432
-3828 -0.006418940145522356 0.01976300030946732 -0.01482080016285181
-3829 0.02644450031220913 0.00792298000305891 -0.01550259999930859
-3830 0.02377299964427948 0.009888609871268272 -0.0154705997556448
-3831 0.02381259948015213 0.006471219938248396 -0.01567069999873638
-3832 0.01862419955432415 0.01773349940776825 -0.0148497000336647
-3833 0.02144310064613819 0.01765879988670349 -0.01476419996470213
-3834 -0.003814480034634471 0.01997189968824387 -0.01481309998780489
-3835 0.02122809924185276 0.01201900001615286 -0.01539030019193888
-3836 -0.008577000349760056 0.007834809832274914 -0.01598710007965565
-3837 0.0273755993694067 0.01360020041465759 -0.01502420008182526
-3838 -0.005718130152672529 0.03207869827747345 -0.01221380010247231
-3839 -0.004362700041383505 0.0344724990427494 -0.01149080041795969
-3840 0.01797889918088913 0.01277329958975315 -0.01542679965496063
-3841 0.02944369986653328 0.01826870068907738 -0.0143911000341177
-3842 0.02381259948015213 0.02798690088093281 -0.01277409959584475
-3843 -0.01051560044288635 0.006323779933154583 -0.01604470051825047
-3844 0.0274363998323679 0.01968690007925034 -0.01425290014594793
-3845 -0.003980460111051798 0.02986370027065277 -0.0128389997407794
-3846 -0.007439100183546543 0.03439820185303688 -0.01146609988063574
-3847 0.01382850017398596 0.02147980034351349 -0.01442189980298281
-3848 0.01549770031124353 0.01860000006854534 -0.01482119970023632
-3849 -0.002935450058430433 0.02479269914329052 -0.01398770045489073
-3850 1.278580020880327e-05 0.02638559974730015 -0.01366230007261038
-3851 0.0004486129910219461 0.023098299279809 -0.01430310029536486
-3852 0.0001478269987273961 0.01594579964876175 -0.01534979976713657
-3853 -0.00109590997453779 0.01211680006235838 -0.01573959924280643
-3854 0.01610130071640015 0.010886300355196 -0.01563969999551773
-3855 -0.001834299997426569 0.01811850070953369 -0.01508279982954264
-3856 -0.004561650101095438 0.01748890057206154 -0.01515250001102686
-3857 0.0267574992030859 0.02210989966988564 -0.01387850008904934
-3858 0.00794564001262188 0.03438900038599968 -0.01146300043910742
-3859 -0.002662430051714182 0.03228040039539337 -0.01218710001558065
-3860 0.02484860084950924 0.01987339928746223 -0.01432089973241091
-3861 0.02739059925079346 0.03101019933819771 -0.01181020028889179
-3862 -0.004421070218086243 0.0223833005875349 -0.01442109979689121
-3863 -0.007654150016605854 0.02706010080873966 -0.01346630044281483
-3864 -0.01051560044288635 0.02204420045018196 -0.01441810000687838
-3865 -0.006944959983229637 0.02438480034470558 -0.01403009984642267
-3866 -0.0006125890067778528 0.0297072995454073 -0.01289070025086403
-3867 0.0194752998650074 0.01474529970437288 -0.01518219988793135
-3868 0.02358029969036579 0.02258599922060966 -0.01391709968447685
-3869 0.02590020000934601 0.02440650016069412 -0.01347879972308874
-3870 0.02013220079243183 0.02372049912810326 -0.01383890025317669
-3871 0.02368490025401115 0.02551859989762306 -0.01333940029144287
-3872 -0.007368229795247316 0.02161220088601112 -0.01452070008963346
-3873 -0.007327749859541655 0.01705689914524555 -0.01518000010401011
-3874 -0.01051560044288635 0.01891889981925488 -0.01490330044180155
-3875 0.02186259999871254 0.01534960046410561 -0.01503400038927794
-3876 0.02441189996898174 0.0136668998748064 -0.0151231000199914
-3877 0.0266887005418539 0.01680140011012554 -0.01468429993838072
-3878 0.01217519957572222 0.007742370013147593 -0.01593079976737499
-3879 0.007587740197777748 0.005204670131206512 -0.01611060090363026
-3880 0.01077849976718426 0.005183069966733456 -0.01607180014252663
-3881 0.00476250983774662 0.005797000136226416 -0.01611259952187538
-3882 0.001579690026119351 0.01025469973683357 -0.01587790064513683
-3883 0.0151055995374918 0.02677690051496029 -0.01337550021708012
-3884 0.004215680062770844 0.00868596974760294 -0.01596730016171932
-3885 0.003997299820184708 0.0114662004634738 -0.01576929911971092
-3886 0.01215930003672838 0.01870080083608627 -0.01487709954380989
-3887 0.009095599874854088 0.01880449987947941 -0.01490969955921173
-3888 0.01057920046150684 0.02095809951424599 -0.01456610020250082
-3889 -0.002665020059794188 0.002902250038459897 -0.01622889935970306
-3890 0.0003974039864260703 0.002329899929463863 -0.01624009944498539
-3891 -0.0007385169737972319 0.005251190159469843 -0.01616239920258522
-3892 0.009919510222971439 0.02803670056164265 -0.0131973996758461
-3893 0.005340040195733309 0.02966460026800632 -0.01286069955676794
-3894 0.02170230075716972 0.03187460079789162 -0.01182319968938828
-3895 0.003912690095603466 0.0213031992316246 -0.01458670012652874
-3896 -0.002608150010928512 0.02763820067048073 -0.01338679995387793
-3897 0.02112510055303574 0.02712040022015572 -0.01309099979698658
-3898 0.0182402990758419 0.02656389959156513 -0.01332509983330965
-3899 0.0006535819848068058 0.03281269967556 -0.01202839985489845
-3900 -0.004366950131952763 2.985160000264031e-18 -0.01625039987266064
-3901 0.006362630054354668 0.01939049921929836 -0.01485799998044968
-3902 0.01269229967147112 0.03213239833712578 -0.01207169983536005
-3903 0.01573709957301617 0.03164279833436012 -0.01213049981743097
-3904 0.01691720075905323 0.02893389947712421 -0.01281549967825413
-3905 -0.005096179898828268 0.027241300791502 -0.01345730014145374
-3906 0.02165180072188377 0.02961920015513897 -0.01245590019971132
-3907 0.01937370002269745 0.02873760089278221 -0.0127750001847744
-3908 0.01893389970064163 0.03128520026803017 -0.01211540028452873
-3909 0.002033760072663426 0.007058550138026476 -0.01607210002839565
-3910 0.006740400101989508 0.007936310023069382 -0.01599030010402203
-3911 0.009400430135428905 0.007491909898817539 -0.01598509959876537
-3912 0.01120399963110685 0.009914480149745941 -0.01580910012125969
-3913 0.00845750980079174 0.009725919924676418 -0.01585919968783855
-3914 0.01216750033199787 0.02737269923090935 -0.01330980006605387
-3915 0.01404980011284351 0.02935880050063133 -0.01279260031878948
-3916 0.002523229923099279 0.004195420071482658 -0.01618519984185696
-3917 0.01007649954408407 0.02541040070354939 -0.01376849971711636
-3918 0.02681539952754974 0.01108380034565926 -0.01527190022170544
-3919 0.007961769588291645 0.02133730053901672 -0.0145412003621459
-3920 0.007258940022438765 0.02377519942820072 -0.0141251003369689
-3921 0.01056110020726919 0.02313110046088696 -0.01419780030846596
-3922 0.00485645979642868 2.983089980781117e-18 -0.01623919978737831
-3923 0.005587249994277954 0.002775330096483231 -0.01620090007781982
-3924 -0.001285549951717257 0.03450550138950348 -0.01150180026888847
-3925 0.02436669915914536 0.002665840089321136 -0.01577669940888882
-3926 0.005595630034804344 0.03212400153279305 -0.0121916001662612
-3927 0.004868879914283752 0.0344482995569706 -0.01148280035704374
-3928 0.01110150013118982 0.03008509986102581 -0.01267050020396709
-3929 0.02944369986653328 0.02128669992089272 -0.01392260007560253
-3930 0.02944369986653328 0.02428949996829033 -0.01336540002375841
-3931 0.003632739884778857 0.01725150085985661 -0.01517170015722513
-3932 0.002216859953477979 0.01355889998376369 -0.01559360045939684
-3933 0.01592460088431835 0.005802359897643328 -0.01594920083880424
-3934 0.01488909963518381 0.008036060258746147 -0.01586209982633591
-3935 0.01379919983446598 0.005395589862018824 -0.01601249910891056
-3936 0.01305530034005642 0.02472149953246117 -0.0138525003567338
-3937 0.02135859988629818 0.01991079933941364 -0.01444550044834614
-3938 0.01758709922432899 0.02092679962515831 -0.01441380009055138
-3939 0.01621510088443756 0.02399099990725517 -0.01391690038144588
-3940 0.01884499937295914 0.005253899842500687 -0.01588959991931915
-3941 -0.007891260087490082 0.01050950028002262 -0.01582209952175617
-3942 -0.007527689915150404 0.01338389981538057 -0.01558229979127645
-3943 0.002831170102581382 0.02821560017764568 -0.01323620043694973
-3944 0.002653599949553609 0.0311322994530201 -0.01249739993363619
-3945 0.01372979953885078 0.009875760413706303 -0.01576800085604191
-3946 0.01274900045245886 0.01179269980639219 -0.01563720032572746
-3947 0.01490399986505508 0.01364540029317141 -0.01542390044778585
-3948 0.009099819697439671 0.01294459961354733 -0.01558999996632338
-3949 -0.005297529976814985 0.0148844001814723 -0.01545289997011423
-3950 -0.004855259787291288 0.01204250007867813 -0.0157306008040905
-3951 -0.006023949943482876 0.002785000018775463 -0.01620360091328621
-3952 -0.001810809946618974 0.00855811033397913 -0.01600039936602116
-3953 -0.004400019999593496 0.005473639816045761 -0.01614069938659668
-3954 0.01893250085413456 0.01069589983671904 -0.01557420007884502
-3955 0.0179063007235527 0.00835178978741169 -0.01576579920947552
-3956 0.02089639939367771 0.008015500381588936 -0.01569130085408688
-3957 0.01247680000960827 0.002723559970036149 -0.01611690036952496
-3958 0.002976970048621297 0.001861299970187247 -0.01623559929430485
-3959 -0.005493239965289831 0.008513789623975754 -0.01598110049962997
-3960 0.01061160024255514 0.01622959971427917 -0.01522149983793497
-3961 0.001782009960152209 2.986489899893863e-18 -0.01625769957900047
-3962 0.01213280018419027 0.0141313998028636 -0.01542919967323542
-3963 0.01370569970458746 0.01617610082030296 -0.01517389994114637
-3964 -0.003386510070413351 0.01031710021197796 -0.01587769947946072
-3965 0.006248930003494024 0.01070229988545179 -0.01581110060214996
-3966 -0.007769709918648005 0.005166400223970413 -0.01611690036952496
-3967 0.006663599982857704 0.0272538997232914 -0.01342099998146296
-3968 0.003547400003299117 0.02486749924719334 -0.01395179983228445
-3969 0.009263359941542149 0.002639719983562827 -0.01616580039262772
-3970 0.01102180033922195 0.03430569916963577 -0.01143520046025515
-3971 0.01409680023789406 0.03419189900159836 -0.01139730028808117
-3972 0.005358629859983921 0.01372900046408176 -0.01555429957807064
-3973 0.007211700081825256 0.01632980071008205 -0.01525290030986071
-3974 0.008070129901170731 0.0307071004062891 -0.01255560014396906
-3975 0.01016900036484003 0.03236629813909531 -0.01205519959330559
-3976 0.02730559930205345 0.00206982996314764 -0.0156830009073019
-3977 0.02329850010573864 2.910209992141213e-18 -0.01584249921143055
-3978 0.02944369986653328 0.003053959924727678 -0.01559329964220524
-3979 0.02690310031175613 0.004628890193998814 -0.01563530042767525
-3980 0.02022580057382584 2.929879933517418e-18 -0.01594950072467327
-3981 0.02176940068602562 0.004900150001049042 -0.01580669917166233
-3982 0.02026250027120113 0.002268319949507713 -0.0159268993884325
-3983 0.01617930084466934 0.003040109993889928 -0.016032500192523
-3984 0.02724169939756393 0.04392490163445473 -0.005666910205036402
-3985 0.02944369986653328 0.04528199881315231 -0.004044429864734411
-3986 -0.01051560044288635 0.04689360037446022 -0.004188369959592819
-3987 0.02673869952559471 0.04203270003199577 -0.00712146982550621
-3988 -0.003040239913389087 0.04102319851517677 -0.008785240352153778
-3989 0.0248929001390934 0.0441385991871357 -0.005711840000003576
-3990 -0.008479219861328602 0.04546229913830757 -0.005731239914894104
-3991 0.01184340007603168 0.04536119848489761 -0.005681890062987804
-3992 -0.001596780028194189 0.04552429914474487 -0.005841779988259077
-3993 0.001800209982320666 0.0471109002828598 -0.004207769874483347
-3994 0.002295339945703745 0.04519800096750259 -0.006084280088543892
-3995 0.005882900208234787 0.04488829895853996 -0.00626874016597867
-3996 0.002946580061689019 0.04300969839096069 -0.00763275008648634
-3997 0.004879610147327185 0.04705699905753136 -0.004202960059046745
-3998 0.02202280052006245 0.04424820095300674 -0.005895069800317287
-3999 -0.002799409907311201 0.04292549937963486 -0.007711539976298809
-4000 -0.008230440318584442 0.04366840049624443 -0.007119010202586651
-4001 -0.008309789933264256 0.04113529995083809 -0.008632339537143707
-4002 -0.005822449922561646 0.04239730164408684 -0.007981309667229652
-4003 -0.005599389784038067 0.04504029825329781 -0.006175910122692585
-4004 -0.004359030164778233 0.04709040001034737 -0.004205939825624228
-4005 0.02944369986653328 0.04325760155916214 -0.006022680085152388
-4006 0.00896333996206522 0.04525699838995934 -0.005883490201085806
-4007 0.01103620044887066 0.04686189815402031 -0.00418554013594985
-4008 0.01411200035363436 0.04670609906315804 -0.00417162012308836
-4009 0.01734290085732937 0.04409610107541084 -0.006400750018656254
-4010 0.02944369986653328 0.04091989994049072 -0.007624770049005747
-4011 0.01943870075047016 0.04485179856419563 -0.00561652984470129
-4012 0.01463830005377531 0.04513299837708473 -0.005735749844461679
-4013 0.008557709865272045 0.04340630024671555 -0.007273260038346052
-4014 0.01053110044449568 0.04394989833235741 -0.006843190174549818
-4015 -0.0007613640045747161 0.04020509868860245 -0.0092042600736022
-4016 0.01705240085721016 0.04200829938054085 -0.007819719612598419
-4017 0.01518029998987913 0.04345589876174927 -0.006994930095970631
-4018 0.01282740011811256 0.04370699822902679 -0.006929310038685799
-4019 0.01400620024651289 0.04191270098090172 -0.00802129041403532
-4020 0.01105539966374636 0.04217449948191643 -0.007970940321683884
-4021 -0.01051560044288635 0.03978389874100685 -0.009274429641664028
-4022 -0.008552069775760174 0.03849489986896515 -0.009889859706163406
-4023 -0.005915530025959015 0.03973690047860146 -0.009379079565405846
-4024 -0.003314309986308217 0.03790109977126122 -0.01022680010646582
-4025 0.01543849986046553 0.03991129994392395 -0.00903168972581625
-4026 0.02107029967010021 0.03759349882602692 -0.009813359938561916
-4027 0.01885960064828396 0.03929600119590759 -0.009165080264210701
-4028 0.02364140003919601 0.04204339906573296 -0.007351890206336975
-4029 0.02200979925692081 0.03965239971876144 -0.008807159960269928
-4030 0.02039170078933239 0.04235659912228584 -0.007392779923975468
-4031 0.01918260008096695 0.03626370057463646 -0.01045180018991232
-4032 0.01716969907283783 0.03403440117835999 -0.01134479977190495
-4033 0.006045530084520578 0.0421576015651226 -0.008098180405795574
-4034 -0.008675250224769115 0.03628300130367279 -0.01077789999544621
-4035 -0.006477170158177614 0.03689049929380417 -0.01058540027588606
-4036 -0.0002217220026068389 0.04288740083575249 -0.007739129941910505
-4037 0.001297579961828887 0.04152709990739822 -0.008512509986758232
-4038 0.02677159942686558 0.03920299932360649 -0.008730529807507992
-4039 0.02461940050125122 0.04006880149245262 -0.008424609899520874
-4040 0.01249790005385876 0.03999819979071617 -0.009093450382351875
-4041 0.01197099965065718 0.03641660138964653 -0.01065600011497736
-4042 0.01577810011804104 0.03691659867763519 -0.01034369971603155
-4043 0.01343579962849617 0.03812089934945107 -0.009925260208547115
-4044 0.01042430009692907 0.03853359818458557 -0.009826740249991417
-4045 0.008800039999186993 0.03659500181674957 -0.01065510045737028
-4046 0.0263752993196249 0.03337199985980988 -0.01112399995326996
-4047 0.02677780017256737 0.03648160025477409 -0.009955950081348419
-4048 0.004578379914164543 0.03663359954953194 -0.01070119999349117
-4049 0.02330780029296875 0.03360620141029358 -0.01120209973305464
-4050 0.001791769987903535 0.03448760136961937 -0.01149590034037828
-4051 0.0005805569817312062 0.03735550120472908 -0.01045260019600391
-4052 0.02394969947636127 0.03774679824709892 -0.009582630358636379
-4053 0.02442069910466671 0.03521589934825897 -0.01057660020887852
-4054 0.009226130321621895 0.0411021001636982 -0.008617869578301907
-4055 0.0069428700953722 0.0393977016210556 -0.009506549686193466
-4056 0.02202850021421909 0.03576289862394333 -0.01049910020083189
-4057 0.002969739958643913 0.04029960185289383 -0.009130240418016911
-4058 0.00291230995208025 0.04833099991083145 -0.002120970049872994
-4059 0.007958410307765007 0.04697579890489578 -0.004195710178464651
-4060 0.006064100190997124 0.0482637993991375 -0.002118010073900223
-4061 0.009536400437355042 0.04815350100398064 -0.002113180002197623
-4062 0.01718430034816265 0.04649059846997261 -0.004152379930019379
-4063 0.02025170065462589 0.04621570184826851 -0.004127820022404194
-4064 0.01706849969923496 0.04772179946303368 -0.002094229916110635
-4065 0.02331710048019886 0.04752539843320847 0
-4066 0.02125390060245991 0.04733080044388771 -0.002077070064842701
-4067 0.02331589907407761 0.04590610042214394 -0.004100169986486435
-4068 0.02450410090386868 0.04698869958519936 -0.002062059938907623
-4069 0.01284829992800951 0.04800400137901306 -0.002106619998812675
-4070 0.02759899944067001 0.04665450006723404 -0.00206729001365602
-4071 0.02944369986653328 0.0464308001101017 -0.002156500006094575
-4072 -0.007437219843268394 0.04698880016803741 -0.004196870140731335
-4073 0.0001278429990634322 0.04836760088801384 -0.002123859943822026
-4074 -0.001279550022445619 0.04713540151715279 -0.004209970124065876
-4075 -0.002826760057359934 0.04836149886250496 -0.002122770063579082
-4076 0.02637900039553642 0.04558660089969635 -0.004071630071848631
-4077 -0.006183200050145388 0.04826489835977554 -0.002138729905709624
-4078 0.0001278429990634322 -0.04836760088801384 -0.002123859943822026
-4079 0.00291230995208025 -0.04833099991083145 -0.002120970049872994
-4080 0.004881270229816437 -0.04871689900755882 0
-4081 0.001800209982320666 -0.0471109002828598 -0.004207769874483347
-4082 0.004879610147327185 -0.04705699905753136 -0.004202960059046745
-4083 0.006064100190997124 -0.0482637993991375 -0.002118010073900223
-4084 0.007958410307765007 -0.04697579890489578 -0.004195710178464651
-4085 0.009536400437355042 -0.04815350100398064 -0.002113180002197623
-4086 0.01284829992800951 -0.04800400137901306 -0.002106619998812675
-4087 0.01706849969923496 -0.04772179946303368 -0.002094229916110635
-4088 0.01411440037190914 -0.04835360124707222 0
-4089 0.00796039029955864 -0.0486329011619091 0
-4090 0.01103620044887066 -0.04686189815402031 -0.00418554013594985
-4091 0.01718650013208389 -0.04813050106167793 0
-4092 0.02025360055267811 -0.04784590005874634 0
-4093 0.02125390060245991 -0.04733080044388771 -0.002077070064842701
-4094 0.02025170065462589 -0.04621570184826851 -0.004127820022404194
-4095 0.02450410090386868 -0.04698869958519936 -0.002062059938907623
-4096 0.02331710048019886 -0.04752539843320847 0
-4097 0.02331589907407761 -0.04590610042214394 -0.004100169986486435
-4098 0.0110384002327919 -0.04851489886641502 0
-4099 0.02637960016727448 -0.0471947006881237 0
-4100 0.02944369986653328 -0.04687939956784248 0
-4101 -0.004358469974249601 -0.048751600086689 0
-4102 -0.002826760057359934 -0.04836149886250496 -0.002122770063579082
-4103 -0.006183200050145388 -0.04826489835977554 -0.002138729905709624
-4104 0.02759899944067001 -0.04665450006723404 -0.00206729001365602
-4105 0.02944369986653328 -0.04528199881315231 -0.004044429864734411
-4106 -0.01051560044288635 -0.04854780063033104 0
-4107 -0.01051560044288635 -0.04689360037446022 -0.004188369959592819
-4108 -0.007436930201947689 -0.04864640161395073 0
-4109 -0.007437219843268394 -0.04698880016803741 -0.004196870140731335
-4110 -0.02951299957931042 -0.04523659870028496 -0.004040370229631662
-4111 -0.02635790035128593 -0.04562579840421677 -0.004075129982084036
-4112 -0.0210878998041153 -0.04738340154290199 -0.00209034001454711
-4113 -0.01809499971568584 -0.04763590171933174 -0.002092299982905388
-4114 -0.01686160080134869 -0.04649779945611954 -0.004153020214289427
-4115 -0.02003219909965992 -0.04626519978046417 -0.004132240079343319
-4116 -0.02791460044682026 -0.04663509875535965 -0.002046860055997968
-4117 -0.02467009983956814 -0.04701900109648705 -0.002065259963274002
-4118 -0.03110959939658642 -0.04620819911360741 -0.002019779989495873
-4119 -0.03438629955053329 -0.04571279883384705 -0.001958090113475919
-4120 -0.03579879924654961 -0.04428489878773689 -0.00395536981523037
-4121 -0.0373368002474308 -0.04518689960241318 -0.001961650094017386
-4122 -0.04023090004920959 -0.04465179890394211 -0.0019750299397856
-4123 -0.03893020004034042 -0.04373760148882866 -0.00390648003667593
-4124 -0.01368850003927946 -0.04669350013136864 -0.004170500207692385
-4125 -0.01495239976793528 -0.04783869907259941 -0.002120069926604629
-4126 -0.01051560044288635 -0.04808330163359642 -0.002233250066637993
-4127 -0.04206240177154541 -0.03664619848132133 -0.008542969822883606
-4128 -0.01051560044288635 -0.04479720070958138 -0.006237019784748554
-4129 -0.03977020084857941 -0.03642110154032707 -0.008879819884896278
-4130 -0.03976560011506081 -0.03830070048570633 -0.00795281957834959
-4131 -0.03768150135874748 -0.03923920169472694 -0.007677469868212938
-4132 -0.03487420082092285 -0.03864099830389023 -0.008316189981997013
-4133 -0.02933670021593571 -0.04127290099859238 -0.007380019873380661
-4134 -0.02516880072653294 -0.03914690017700195 -0.008882259950041771
-4135 -0.02319739945232868 -0.04596839845180511 -0.004105729982256889
-4136 -0.02071860060095787 -0.0410705991089344 -0.008163399994373322
-4137 -0.01684669964015484 -0.03403950110077858 -0.01134650036692619
-4138 -0.03726129978895187 -0.03726650029420853 -0.00874571967869997
-4139 -0.0387004017829895 -0.03427280113101006 -0.009883820079267025
-4140 -0.04206240177154541 -0.03416420146822929 -0.009618230164051056
-4141 -0.02780250087380409 -0.04363369941711426 -0.005860359873622656
-4142 -0.03089799918234348 -0.04309000074863434 -0.00593593018129468
-4143 -0.02858269959688187 -0.03531660139560699 -0.01031079981476068
-4144 -0.0215671993792057 -0.04400920122861862 -0.006167559884488583
-4145 -0.02460410073399544 -0.04399739950895309 -0.005899359937757254
-4146 -0.03134800121188164 -0.03530240058898926 -0.0101215997710824
-4147 -0.03263580054044724 -0.03279519826173782 -0.01093169953674078
-4148 -0.02948489971458912 -0.03311819955706596 -0.01103939954191446
-4149 -0.01051560044288635 -0.03708929941058159 -0.0104417996481061
-4150 -0.01051560044288635 -0.03432850167155266 -0.01144280005246401
-4151 -0.02234929986298084 -0.03902649879455566 -0.009119139984250069
-4152 -0.03606969863176346 -0.04100289940834045 -0.006792750209569931
-4153 -0.03418629989027977 -0.04294490069150925 -0.005601920187473297
-4154 -0.0322410985827446 -0.04056369885802269 -0.007525119930505753
-4155 -0.03005550056695938 -0.03686970099806786 -0.009577699936926365
-4156 -0.03030869923532009 -0.03906660154461861 -0.008531290106475353
-4157 -0.02776139974594116 -0.03846580162644386 -0.00902791041880846
-4158 -0.02631659992039204 -0.04153959825634956 -0.00748455012217164
-4159 -0.02070879936218262 -0.03631599992513657 -0.01037439983338118
-4160 -0.01982120051980019 -0.03897260129451752 -0.009283280000090599
-4161 -0.03266119956970215 -0.0447952002286911 -0.004000939894467592
-4162 -0.02480719983577728 -0.03665729984641075 -0.01001810003072023
-4163 -0.03477229923009872 -0.0355461984872818 -0.009741709567606449
-4164 -0.03226659819483757 -0.03777379915118217 -0.008994219824671745
-4165 -0.01368109975010157 -0.03418239951133728 -0.01139410026371479
-4166 -0.01262039970606565 -0.03637810051441193 -0.01064470037817955
-4167 -0.02315350063145161 -0.04158680140972137 -0.007702169939875603
-4168 -0.01804729923605919 -0.04378649964928627 -0.006589789874851704
-4169 -0.01762579940259457 -0.0403158999979496 -0.008727669715881348
-4170 -0.01526420004665852 -0.04165270179510117 -0.008106750436127186
-4171 -0.02001079916954041 -0.03386979922652245 -0.01128990016877651
-4172 -0.03932559862732887 -0.04069650173187256 -0.006558659952133894
-4173 -0.01570519991219044 -0.0390854999423027 -0.009405089542269707
-4174 -0.01788369938731194 -0.03723400086164474 -0.01012799981981516
-4175 -0.01490879990160465 -0.03682690113782883 -0.01039670035243034
-4176 -0.04018820077180862 -0.04240550100803375 -0.005069170147180557
-4177 -0.0374164991080761 -0.04265100136399269 -0.005331019870936871
-4178 -0.01239180006086826 -0.04221190139651299 -0.007905970327556133
-4179 -0.01310709957033396 -0.03910699859261513 -0.009490270167589188
-4180 -0.01051560044288635 -0.03978389874100685 -0.009274429641664028
-4181 -0.01443289965391159 -0.04451340064406395 -0.006239110138267279
-4182 -0.03342229872941971 -0.02856590040028095 -0.01211799960583448
-4183 -0.01713749952614307 -0.007113149855285883 -0.01585770025849342
-4184 -0.0350152999162674 -0.008243010379374027 -0.01507250033318996
-4185 -0.01660080067813396 -0.004318609833717346 -0.0159837007522583
-4186 -0.04206240177154541 -0.0127988001331687 -0.01428280025720596
-4187 -0.04206240177154541 -0.02544819936156273 -0.01225730031728745
-4188 -0.01756200008094311 -0.01766430027782917 -0.01489850040525198
-4189 -0.01384519971907139 -0.01772050000727177 -0.01498330011963844
-4190 -0.02144920080900192 -0.0172715000808239 -0.01482999976724386
-4191 -0.0231419000774622 2.914400075534101e-18 -0.01586529985070229
-4192 -0.02574680000543594 -0.009041240438818932 -0.01546700019389391
-4193 -0.0184406004846096 -0.01265409961342812 -0.01543250028043985
-4194 -0.02364489994943142 -0.01399100013077259 -0.01513110008090734
-4195 -0.0322732999920845 -0.01029529981315136 -0.01508220005780458
-4196 -0.0353148989379406 -0.0116031002253294 -0.01480519957840443
-4197 -0.02128770016133785 -0.01286190003156662 -0.01532659959048033
-4198 -0.04206240177154541 -0.009605930186808109 -0.0145584000274539
-4199 -0.0381866991519928 -0.01004029996693134 -0.01475939992815256
-4200 -0.04022400081157684 -0.01151099987328053 -0.01451420038938522
-4201 -0.0289904996752739 -0.009542769752442837 -0.01529529970139265
-4202 -0.02840190008282661 -0.03030579909682274 -0.01195860002189875
-4203 -0.0302095003426075 -0.02773470059037209 -0.01252810005098581
-4204 -0.01996820047497749 -0.007658029906451702 -0.01575390063226223
-4205 -0.01782229915261269 -0.009980799630284309 -0.0156663004308939
-4206 -0.01399180013686419 -0.02346359938383102 -0.01407579984515905
-4207 -0.01051560044288635 -0.0313045009970665 -0.01236889977008104
-4208 -0.01935279928147793 -0.02014880068600178 -0.0144921001046896
-4209 -0.02102039940655231 -0.02248989976942539 -0.01404799986630678
-4210 -0.02753500081598759 -0.007030659820884466 -0.01551149971783161
-4211 -0.02547919936478138 -0.01642579957842827 -0.01478289999067783
-4212 -0.02047640085220337 -0.01057050004601479 -0.0155477998778224
-4213 -0.0197478998452425 -0.01503259968012571 -0.01515480037778616
-4214 -0.01634519919753075 -0.01496849954128265 -0.01525409985333681
-4215 -0.01958690024912357 -0.02467060089111328 -0.01368729956448078
-4216 -0.01762159913778305 -0.02280809916555882 -0.01410000026226044
-4217 -0.01676619984209538 -0.02555279992520809 -0.01359259989112616
-4218 -0.01580859906971455 -0.02053100056946278 -0.01453060004860163
-4219 -0.02342480048537254 -0.01119370013475418 -0.0153972003608942
-4220 -0.02263550087809563 -0.008369640447199345 -0.01562559977173805
-4221 -0.03535459935665131 -0.01445730030536652 -0.01451999973505735
-4222 -0.03324640169739723 -0.01693160086870193 -0.01434450037777424
-4223 -0.02946689911186695 -0.01574850082397461 -0.01468820031732321
-4224 -0.03278709948062897 -0.01323970034718513 -0.01479560043662786
-4225 -0.02960719913244247 -0.01232639979571104 -0.01504210010170937
-4226 -0.02234370075166225 -0.0249342005699873 -0.0135319996625185
-4227 -0.01051560044288635 -0.01891889981925488 -0.01490330044180155
-4228 -0.027683200314641 -0.002340489998459816 -0.01566779986023903
-4229 -0.02473879978060722 -0.002498730085790157 -0.01578200049698353
-4230 -0.02608080022037029 -0.00480755977332592 -0.01566749997437
-4231 -0.03868760168552399 -0.02737770043313503 -0.01203710027039051
-4232 -0.03520099818706512 -0.02630439959466457 -0.01255100034177303
-4233 -0.02301990054547787 -0.01972280070185661 -0.01442770007997751
-4234 -0.02771379984915257 -0.02168090082705021 -0.01390940044075251
-4235 -0.02467039972543716 -0.02236459963023663 -0.01392609998583794
-4236 -0.03060879930853844 -0.02276049926877022 -0.01357010006904602
-4237 -0.03199530020356178 -0.02573570050299168 -0.01288860011845827
-4238 -0.03025469928979874 -0.01940960064530373 -0.01415350008755922
-4239 -0.03868750110268593 -0.01381869986653328 -0.01438399963080883
-4240 -0.02518530003726482 -0.02487250044941902 -0.01342429965734482
-4241 -0.02711289934813976 -0.02695360034704208 -0.01287980005145073
-4242 -0.02347210049629211 -0.02778369933366776 -0.01285549998283386
-4243 -0.01503490004688501 -0.006143589969724417 -0.01595110073685646
-4244 -0.02676749974489212 -0.01925729960203171 -0.01434220001101494
-4245 -0.0382080003619194 -0.02368720062077045 -0.01290949992835522
-4246 -0.02729530073702335 -0.01389439962804317 -0.01499340031296015
-4247 -0.026451600715518 -0.0116768004372716 -0.01523880008608103
-4248 -0.0263299997895956 -0.03340280055999756 -0.01113430038094521
-4249 -0.04206240177154541 -0.01598300039768219 -0.01392170041799545
-4250 -0.01293530035763979 -0.02055780030786991 -0.01459749974310398
-4251 -0.02948169969022274 -0.02545190043747425 -0.01309190038591623
-4252 -0.02748190052807331 -0.02391190081834793 -0.01350970007479191
-4253 -0.01304659992456436 -0.007305169943720102 -0.01593980006873608
-4254 -0.01303800009191036 -0.01069450005888939 -0.01572529971599579
-4255 -0.03642090037465096 -0.01756650023162365 -0.01406690012663603
-4256 -0.0182448998093605 -0.002237109933048487 -0.01599369943141937
-4257 -0.02129890024662018 -0.002470009960234165 -0.01590240001678467
-4258 -0.0152545003220439 -0.008851310238242149 -0.01580299995839596
-4259 -0.02481280080974102 -0.006930939853191376 -0.01562589965760708
-4260 -0.03965840116143227 -0.01734640076756477 -0.0138903995975852
-4261 -0.03905890136957169 -0.02007509954273701 -0.01351550035178661
-4262 -0.02271159924566746 -0.005355549976229668 -0.01577240042388439
-4263 -0.01944600045681 -0.004713539965450764 -0.01589949987828732
-4264 -0.03425240144133568 -0.02336429990828037 -0.01324130035936832
-4265 -0.03627920150756836 -0.02100110054016113 -0.01354339998215437
-4266 -0.03345600143074989 -0.02012250013649464 -0.01386689953505993
-4267 -0.01330230012536049 -0.004394909832626581 -0.01605330035090446
-4268 -0.01982579939067364 -0.02750279940664768 -0.01306810043752193
-4269 -0.01630770042538643 -0.02893020026385784 -0.01283430028706789
-4270 -0.0134317995980382 -0.0270140003412962 -0.0133654996752739
-4271 -0.02588249929249287 -0.02957000024616718 -0.01229299977421761
-4272 -0.02279370091855526 -0.0312488991767168 -0.01197679992765188
-4273 -0.01682930067181587 2.947740003713357e-18 -0.01604669913649559
-4274 -0.01051560044288635 2.972699971901991e-18 -0.01618259958922863
-4275 -0.01512399967759848 -0.002089980058372021 -0.01606719940900803
-4276 -0.01262599974870682 -0.001931129954755306 -0.01612240076065063
-4277 -0.02317179925739765 -0.03365309908986092 -0.01121770031750202
-4278 -0.0133178997784853 -0.01392799988389015 -0.01543440017849207
-4279 -0.01557779964059591 -0.01189490035176277 -0.01557090040296316
-4280 -0.02905409969389439 -0.004696330055594444 -0.01554610021412373
-4281 -0.03019719943404198 -0.002132989931851625 -0.01556000020354986
-4282 -0.03659360110759735 -0.02969219908118248 -0.01157850027084351
-4283 -0.01903139986097813 -0.03097400069236755 -0.01220849994570017
-4284 -0.03892109915614128 -0.03201929852366447 -0.01067310012876987
-4285 -0.04206240177154541 -0.02855500020086765 -0.0114716999232769
-4286 -0.03957829996943474 -0.02996259927749634 -0.01126260031014681
-4287 -0.04206240177154541 -0.003204480046406388 -0.01486799959093332
-4288 -0.01334359962493181 -0.03046680055558681 -0.01251740008592606
-4289 -0.03925770148634911 -0.004304130095988512 -0.01500339992344379
-4290 -0.03878949955105782 -0.007464389782398939 -0.01489249989390373
-4291 -0.02128070034086704 -0.02941410057246685 -0.01254309993237257
-4292 -0.03397699818015099 -0.0308568999171257 -0.01144040003418922
-4293 -0.03578029945492744 -0.03242110088467598 -0.01080700010061264
-4294 -0.0314531996846199 -0.03059929981827736 -0.01169130019843578
-4295 -0.01584210060536861 -0.03177259862422943 -0.01208109967410564
-4296 -0.03453480079770088 -0.002117459895089269 -0.01533710025250912
-4297 -0.03260590136051178 2.840199906636563e-18 -0.01546129956841469
-4298 -0.03744740039110184 -0.002156100003048778 -0.01516509987413883
-4299 -0.03573650121688843 -0.00489520002156496 -0.01519429963082075
-4300 -0.03358609974384308 -0.006023580208420753 -0.01527069974690676
-4301 -0.03122100047767162 -0.007061710115522146 -0.01534259971231222
-4302 -0.0323714017868042 -0.003866980085149407 -0.01541479956358671
-4303 -0.0389104001224041 2.772850033981883e-18 -0.01509470026940107
-4304 -0.04206240177154541 2.738250102934555e-18 -0.01490630023181438
-4305 -0.03994809836149216 -0.001933100051246583 -0.01501729991286993
-4306 -0.03878949955105782 0.007464389782398939 -0.01489249989390373
-4307 -0.04206240177154541 0.009605930186808109 -0.0145584000274539
-4308 -0.03342229872941971 0.02856590040028095 -0.01211799960583448
-4309 -0.01503490004688501 0.006143589969724417 -0.01595110073685646
-4310 -0.01713749952614307 0.007113149855285883 -0.01585770025849342
-4311 -0.0381866991519928 0.01004029996693134 -0.01475939992815256
-4312 -0.0302095003426075 0.02773470059037209 -0.01252810005098581
-4313 -0.04206240177154541 0.0127988001331687 -0.01428280025720596
-4314 -0.04206240177154541 0.02544819936156273 -0.01225730031728745
-4315 -0.03642090037465096 0.01756650023162365 -0.01406690012663603
-4316 -0.03345600143074989 0.02012250013649464 -0.01386689953505993
-4317 -0.0350152999162674 0.008243010379374027 -0.01507250033318996
-4318 -0.0322732999920845 0.01029529981315136 -0.01508220005780458
-4319 -0.03324640169739723 0.01693160086870193 -0.01434450037777424
-4320 -0.02629729919135571 2.892769922901299e-18 -0.01574750058352947
-4321 -0.01762159913778305 0.02280809916555882 -0.01410000026226044
-4322 -0.0184406004846096 0.01265409961342812 -0.01543250028043985
-4323 -0.01634519919753075 0.01496849954128265 -0.01525409985333681
-4324 -0.0289904996752739 0.009542769752442837 -0.01529529970139265
-4325 -0.01557779964059591 0.01189490035176277 -0.01557090040296316
-4326 -0.02467039972543716 0.02236459963023663 -0.01392609998583794
-4327 -0.02144920080900192 0.0172715000808239 -0.01482999976724386
-4328 -0.04022400081157684 0.01151099987328053 -0.01451420038938522
-4329 -0.02574680000543594 0.009041240438818932 -0.01546700019389391
-4330 -0.01958690024912357 0.02467060089111328 -0.01368729956448078
-4331 -0.0152545003220439 0.008851310238242149 -0.01580299995839596
-4332 -0.02102039940655231 0.02248989976942539 -0.01404799986630678
-4333 -0.02753500081598759 0.007030659820884466 -0.01551149971783161
-4334 -0.02771379984915257 0.02168090082705021 -0.01390940044075251
-4335 -0.026451600715518 0.0116768004372716 -0.01523880008608103
-4336 -0.01782229915261269 0.009980799630284309 -0.0156663004308939
-4337 -0.02047640085220337 0.01057050004601479 -0.0155477998778224
-4338 -0.0197478998452425 0.01503259968012571 -0.01515480037778616
-4339 -0.01580859906971455 0.02053100056946278 -0.01453060004860163
-4340 -0.01756200008094311 0.01766430027782917 -0.01489850040525198
-4341 -0.01935279928147793 0.02014880068600178 -0.0144921001046896
-4342 -0.02263550087809563 0.008369640447199345 -0.01562559977173805
-4343 -0.03535459935665131 0.01445730030536652 -0.01451999973505735
-4344 -0.02234370075166225 0.0249342005699873 -0.0135319996625185
-4345 -0.02518530003726482 0.02487250044941902 -0.01342429965734482
-4346 -0.02960719913244247 0.01232639979571104 -0.01504210010170937
-4347 -0.02347210049629211 0.02778369933366776 -0.01285549998283386
-4348 -0.04206240177154541 0.02231249958276749 -0.01291829999536276
-4349 -0.01051560044288635 0.01578149944543839 -0.01530370023101568
-4350 -0.027683200314641 0.002340489998459816 -0.01566779986023903
-4351 -0.02608080022037029 0.00480755977332592 -0.01566749997437
-4352 -0.01996820047497749 0.007658029906451702 -0.01575390063226223
-4353 -0.02948489971458912 0.03311819955706596 -0.01103939954191446
-4354 -0.0314531996846199 0.03059929981827736 -0.01169130019843578
-4355 -0.03868760168552399 0.02737770043313503 -0.01203710027039051
-4356 -0.03520099818706512 0.02630439959466457 -0.01255100034177303
-4357 -0.0382080003619194 0.02368720062077045 -0.01290949992835522
-4358 -0.02676749974489212 0.01925729960203171 -0.01434220001101494
-4359 -0.02301990054547787 0.01972280070185661 -0.01442770007997751
-4360 -0.03425240144133568 0.02336429990828037 -0.01324130035936832
-4361 -0.03025469928979874 0.01940960064530373 -0.01415350008755922
-4362 -0.03278709948062897 0.01323970034718513 -0.01479560043662786
-4363 -0.0353148989379406 0.0116031002253294 -0.01480519957840443
-4364 -0.02748190052807331 0.02391190081834793 -0.01350970007479191
-4365 -0.02588249929249287 0.02957000024616718 -0.01229299977421761
-4366 -0.02711289934813976 0.02695360034704208 -0.01287980005145073
-4367 -0.02840190008282661 0.03030579909682274 -0.01195860002189875
-4368 -0.02946689911186695 0.01574850082397461 -0.01468820031732321
-4369 -0.01051560044288635 0.02515389956533909 -0.01384100038558245
-4370 -0.01399180013686419 0.02346359938383102 -0.01407579984515905
-4371 -0.02342480048537254 0.01119370013475418 -0.0153972003608942
-4372 -0.02128770016133785 0.01286190003156662 -0.01532659959048033
-4373 -0.02547919936478138 0.01642579957842827 -0.01478289999067783
-4374 -0.02729530073702335 0.01389439962804317 -0.01499340031296015
-4375 -0.02364489994943142 0.01399100013077259 -0.01513110008090734
-4376 -0.0182448998093605 0.002237109933048487 -0.01599369943141937
-4377 -0.01998589932918549 2.933099940846934e-18 -0.01596710085868835
-4378 -0.03965840116143227 0.01734640076756477 -0.0138903995975852
-4379 -0.03868750110268593 0.01381869986653328 -0.01438399963080883
-4380 -0.03060879930853844 0.02276049926877022 -0.01357010006904602
-4381 -0.02948169969022274 0.02545190043747425 -0.01309190038591623
-4382 -0.01304659992456436 0.007305169943720102 -0.01593980006873608
-4383 -0.03627920150756836 0.02100110054016113 -0.01354339998215437
-4384 -0.03199530020356178 0.02573570050299168 -0.01288860011845827
-4385 -0.02129890024662018 0.002470009960234165 -0.01590240001678467
-4386 -0.01051560044288635 0.01263509970158339 -0.01562490034848452
-4387 -0.01051560044288635 0.009481829591095448 -0.01587099954485893
-4388 -0.01303800009191036 0.01069450005888939 -0.01572529971599579
-4389 -0.02271159924566746 0.005355549976229668 -0.01577240042388439
-4390 -0.01384519971907139 0.01772050000727177 -0.01498330011963844
-4391 -0.01293530035763979 0.02055780030786991 -0.01459749974310398
-4392 -0.04206240177154541 0.01598300039768219 -0.01392170041799545
-4393 -0.04206240177154541 0.0191555991768837 -0.01346949953585863
-4394 -0.02481280080974102 0.006930939853191376 -0.01562589965760708
-4395 -0.02473879978060722 0.002498730085790157 -0.01578200049698353
-4396 -0.01944600045681 0.004713539965450764 -0.01589949987828732
-4397 -0.03905890136957169 0.02007509954273701 -0.01351550035178661
-4398 -0.01051560044288635 0.003162649925798178 -0.01614820025861263
-4399 -0.01330230012536049 0.004394909832626581 -0.01605330035090446
-4400 -0.01982579939067364 0.02750279940664768 -0.01306810043752193
-4401 -0.01903139986097813 0.03097400069236755 -0.01220849994570017
-4402 -0.01676619984209538 0.02555279992520809 -0.01359259989112616
-4403 -0.0134317995980382 0.0270140003412962 -0.0133654996752739
-4404 -0.01334359962493181 0.03046680055558681 -0.01251740008592606
-4405 -0.01262599974870682 0.001931129954755306 -0.01612240076065063
-4406 -0.01367240026593208 2.960080090886576e-18 -0.01611389964818954
-4407 -0.01660080067813396 0.004318609833717346 -0.0159837007522583
-4408 -0.01512399967759848 0.002089980058372021 -0.01606719940900803
-4409 -0.02317179925739765 0.03365309908986092 -0.01121770031750202
-4410 -0.0133178997784853 0.01392799988389015 -0.01543440017849207
-4411 -0.03019719943404198 0.002132989931851625 -0.01556000020354986
-4412 -0.02905409969389439 0.004696330055594444 -0.01554610021412373
-4413 -0.02945199981331825 2.868160058906927e-18 -0.01561350002884865
-4414 -0.03659360110759735 0.02969219908118248 -0.01157850027084351
-4415 -0.02279370091855526 0.0312488991767168 -0.01197679992765188
-4416 -0.03957829996943474 0.02996259927749634 -0.01126260031014681
-4417 -0.03892109915614128 0.03201929852366447 -0.01067310012876987
-4418 -0.04206240177154541 0.02855500020086765 -0.0114716999232769
-4419 -0.04206240177154541 0.006407110020518303 -0.01475249975919724
-4420 -0.01684669964015484 0.03403950110077858 -0.01134650036692619
-4421 -0.01584210060536861 0.03177259862422943 -0.01208109967410564
-4422 -0.01368109975010157 0.03418239951133728 -0.01139410026371479
-4423 -0.03573650121688843 0.00489520002156496 -0.01519429963082075
-4424 -0.01630770042538643 0.02893020026385784 -0.01283430028706789
-4425 -0.02128070034086704 0.02941410057246685 -0.01254309993237257
-4426 -0.03397699818015099 0.0308568999171257 -0.01144040003418922
-4427 -0.03744740039110184 0.002156100003048778 -0.01516509987413883
-4428 -0.0357585996389389 2.807759950963764e-18 -0.01528470031917095
-4429 -0.03453480079770088 0.002117459895089269 -0.01533710025250912
-4430 -0.0323714017868042 0.003866980085149407 -0.01541479956358671
-4431 -0.03358609974384308 0.006023580208420753 -0.01527069974690676
-4432 -0.03122100047767162 0.007061710115522146 -0.01534259971231222
-4433 -0.04206240177154541 0.003204480046406388 -0.01486799959093332
-4434 -0.03925770148634911 0.004304130095988512 -0.01500339992344379
-4435 -0.03994809836149216 0.001933100051246583 -0.01501729991286993
-4436 -0.02071860060095787 0.0410705991089344 -0.008163399994373322
-4437 -0.01762579940259457 0.0403158999979496 -0.008727669715881348
-4438 -0.03976560011506081 0.03830070048570633 -0.00795281957834959
-4439 -0.03768150135874748 0.03923920169472694 -0.007677469868212938
-4440 -0.0215671993792057 0.04400920122861862 -0.006167559884488583
-4441 -0.02951299957931042 0.04523659870028496 -0.004040370229631662
-4442 -0.03089799918234348 0.04309000074863434 -0.00593593018129468
-4443 -0.01490879990160465 0.03682690113782883 -0.01039670035243034
-4444 -0.03477229923009872 0.0355461984872818 -0.009741709567606449
-4445 -0.03487420082092285 0.03864099830389023 -0.008316189981997013
-4446 -0.03578029945492744 0.03242110088467598 -0.01080700010061264
-4447 -0.03726129978895187 0.03726650029420853 -0.00874571967869997
-4448 -0.0387004017829895 0.03427280113101006 -0.009883820079267025
-4449 -0.04206240177154541 0.03162109851837158 -0.01054039970040321
-4450 -0.04206240177154541 0.03416420146822929 -0.009618230164051056
-4451 -0.03005550056695938 0.03686970099806786 -0.009577699936926365
-4452 -0.02780250087380409 0.04363369941711426 -0.005860359873622656
-4453 -0.0263299997895956 0.03340280055999756 -0.01113430038094521
-4454 -0.02858269959688187 0.03531660139560699 -0.01031079981476068
-4455 -0.02315350063145161 0.04158680140972137 -0.007702169939875603
-4456 -0.02460410073399544 0.04399739950895309 -0.005899359937757254
-4457 -0.03030869923532009 0.03906660154461861 -0.008531290106475353
-4458 -0.02933670021593571 0.04127290099859238 -0.007380019873380661
-4459 -0.03263580054044724 0.03279519826173782 -0.01093169953674078
-4460 -0.01051560044288635 0.03708929941058159 -0.0104417996481061
-4461 -0.0322410985827446 0.04056369885802269 -0.007525119930505753
-4462 -0.02776139974594116 0.03846580162644386 -0.00902791041880846
-4463 -0.02631659992039204 0.04153959825634956 -0.00748455012217164
-4464 -0.02516880072653294 0.03914690017700195 -0.008882259950041771
-4465 -0.01982120051980019 0.03897260129451752 -0.009283280000090599
-4466 -0.03579879924654961 0.04428489878773689 -0.00395536981523037
-4467 -0.03418629989027977 0.04294490069150925 -0.005601920187473297
-4468 -0.02480719983577728 0.03665729984641075 -0.01001810003072023
-4469 -0.03226659819483757 0.03777379915118217 -0.008994219824671745
-4470 -0.03134800121188164 0.03530240058898926 -0.0101215997710824
-4471 -0.01262039970606565 0.03637810051441193 -0.01064470037817955
-4472 -0.01310709957033396 0.03910699859261513 -0.009490270167589188
-4473 -0.02070879936218262 0.03631599992513657 -0.01037439983338118
-4474 -0.02234929986298084 0.03902649879455566 -0.009119139984250069
-4475 -0.03977020084857941 0.03642110154032707 -0.008879819884896278
-4476 -0.02001079916954041 0.03386979922652245 -0.01128990016877651
-4477 -0.01788369938731194 0.03723400086164474 -0.01012799981981516
-4478 -0.04206240177154541 0.03903419896960258 -0.007273389957845211
-4479 -0.01570519991219044 0.0390854999423027 -0.009405089542269707
-4480 -0.01804729923605919 0.04378649964928627 -0.006589789874851704
-4481 -0.0374164991080761 0.04265100136399269 -0.005331019870936871
-4482 -0.04018820077180862 0.04240550100803375 -0.005069170147180557
-4483 -0.01686160080134869 0.04649779945611954 -0.004153020214289427
-4484 -0.03606969863176346 0.04100289940834045 -0.006792750209569931
-4485 -0.03932559862732887 0.04069650173187256 -0.006558659952133894
-4486 -0.01526420004665852 0.04165270179510117 -0.008106750436127186
-4487 -0.01051560044288635 0.04237629845738411 -0.007896140217781067
-4488 -0.01443289965391159 0.04451340064406395 -0.006239110138267279
-4489 -0.01051560044288635 0.04479720070958138 -0.006237019784748554
-4490 -0.01239180006086826 0.04221190139651299 -0.007905970327556133
-4491 -0.02791460044682026 0.04663509875535965 -0.002046860055997968
-4492 -0.02635790035128593 0.04562579840421677 -0.004075129982084036
-4493 -0.03893020004034042 0.04373760148882866 -0.00390648003667593
-4494 -0.0210878998041153 0.04738340154290199 -0.00209034001454711
-4495 -0.02003219909965992 0.04626519978046417 -0.004132240079343319
-4496 -0.02319739945232868 0.04596839845180511 -0.004105729982256889
-4497 -0.01809499971568584 0.04763590171933174 -0.002092299982905388
-4498 -0.02467009983956814 0.04701900109648705 -0.002065259963274002
-4499 -0.03110959939658642 0.04620819911360741 -0.002019779989495873
-4500 -0.03438629955053329 0.04571279883384705 -0.001958090113475919
-4501 -0.03266119956970215 0.0447952002286911 -0.004000939894467592
-4502 -0.0373368002474308 0.04518689960241318 -0.001961650094017386
-4503 -0.04206240177154541 0.0431951992213726 -0.00385804008692503
-4504 -0.04023090004920959 0.04465179890394211 -0.0019750299397856
-4505 -0.01051560044288635 0.04808330163359642 -0.002233250066637993
-4506 -0.01368959993124008 0.04834059998393059 0
-4507 -0.01495239976793528 0.04783869907259941 -0.002120069926604629
-4508 -0.01368850003927946 0.04669350013136864 -0.004170500207692385
-4509 -0.04619500041007996 0.04339810088276863 -0.001931519946083426
-4510 -0.04924729838967323 0.04269810020923615 -0.001924050040543079
-4511 -0.0537772998213768 0.04192750155925751 0
-4512 -0.06241000071167946 0.03927230089902878 0
-4513 -0.05955170094966888 0.04021919891238213 0
-4514 -0.0609733983874321 0.03940970078110695 -0.001729459967464209
-4515 -0.06381890177726746 0.03843459859490395 -0.001687149982899427
-4516 -0.06803680211305618 0.0371285006403923 0
-4517 -0.06802830100059509 0.03586680069565773 -0.003203490050509572
-4518 -0.05667269974946976 0.04110080003738403 0
-4519 -0.05521789938211441 0.04115980118513107 -0.001806269981898367
-4520 -0.05665789917111397 0.03970459848642349 -0.003546270076185465
-4521 -0.05810470134019852 0.04031430184841156 -0.001769160036928952
-4522 -0.05953650176525116 0.03885339945554733 -0.003470249939709902
-4523 -0.05376389995217323 0.04050249978899956 -0.003617529990151525
-4524 -0.05228950083255768 0.0419607013463974 -0.00184923002962023
-4525 -0.05085580050945282 0.04124730080366135 -0.003684059949591756
-4526 -0.0696633979678154 0.0361379012465477 -0.001601750031113625
-4527 -0.06666889786720276 0.03735220059752464 -0.001641980023123324
-4528 -0.04499499872326851 0.04255209863185883 -0.003800600068643689
-4529 -0.04206240177154541 0.04429110139608383 -0.002057119971141219
-4530 -0.07081639766693115 0.03475629910826683 -0.003104310017079115
-4531 -0.04518989846110344 0.03420599922537804 -0.009227380156517029
-4532 -0.047867801040411 0.03303990140557289 -0.009381289593875408
-4533 -0.04206240177154541 0.03664619848132133 -0.008542969822883606
-4534 -0.06633470207452774 0.03379639983177185 -0.005637399852275848
-4535 -0.06800910085439682 0.03092649951577187 -0.006844529882073402
-4536 -0.04430339857935905 0.03638099879026413 -0.008367990143597126
-4537 -0.0574336014688015 0.03724589943885803 -0.00558914989233017
-4538 -0.06098220124840736 0.03133039921522141 -0.008144579827785492
-4539 -0.05799710005521774 0.0287817008793354 -0.00959389004856348
-4540 -0.06441099941730499 0.03143120184540749 -0.007428899873048067
-4541 -0.06266400218009949 0.03432239964604378 -0.006280149798840284
-4542 -0.04633560031652451 0.03719960153102875 -0.007670970167964697
-4543 -0.04456660151481628 0.03923590108752251 -0.006741509772837162
-4544 -0.06016189977526665 0.03714080154895782 -0.004950790200382471
-4545 -0.06311129778623581 0.03645969927310944 -0.00462319003418088
-4546 -0.06239540129899979 0.03793900087475777 -0.003388579934835434
-4547 -0.06326819956302643 0.02958109974861145 -0.008449910208582878
-4548 -0.06616920232772827 0.02914539910852909 -0.008057739585638046
-4549 -0.06522669643163681 0.03694330155849457 -0.003299640025943518
-4550 -0.06509540230035782 0.03549110144376755 -0.004779169801622629
-4551 -0.04526039958000183 0.03110859915614128 -0.01036950014531612
-4552 -0.07050620019435883 0.02553410083055496 -0.008511349558830261
-4553 -0.0700519010424614 0.02855050005018711 -0.007467410061508417
-4554 -0.07360920310020447 0.02710920013487339 -0.007297220174223185
-4555 -0.07360920310020447 0.02949629910290241 -0.006183530203998089
-4556 -0.07105039805173874 0.03122100047767162 -0.005892099812626839
-4557 -0.06931819766759872 0.03336609899997711 -0.005005769897252321
-4558 -0.05595429986715317 0.03451250120997429 -0.007549609988927841
-4559 -0.05932049825787544 0.03418590128421783 -0.007088140118867159
-4560 -0.07360920310020447 0.03173429891467094 -0.004796879831701517
-4561 -0.0716807022690773 0.03311419859528542 -0.00437651015818119
-4562 -0.04206240177154541 0.04126409813761711 -0.005745130125433207
-4563 -0.04544829949736595 0.04099410027265549 -0.005278119817376137
-4564 -0.04792949929833412 0.04191790148615837 -0.003743960056453943
-4565 -0.04791650176048279 0.03977809846401215 -0.005773440003395081
-4566 -0.0494266003370285 0.03688229992985725 -0.007386900018900633
-4567 -0.05459199845790863 0.03836619853973389 -0.005425769835710526
-4568 -0.05226949974894524 0.03642719984054565 -0.007174340076744556
-4569 -0.0503958985209465 0.03367099910974503 -0.008806750178337097
-4570 -0.04781030118465424 0.03510620072484016 -0.008510979823768139
-4571 -0.05152999982237816 0.0390269011259079 -0.005617740098387003
-4572 -0.05325689911842346 0.03465100005269051 -0.007937449961900711
-4573 -0.05461210012435913 0.03604520112276077 -0.006965099833905697
-4574 -0.05385150015354156 0.03249029815196991 -0.008812930434942245
-4575 -0.05702260136604309 0.03187980130314827 -0.008581089787185192
-4576 -0.07360920310020447 0.02463890053331852 -0.008212979882955551
-4577 -0.0714339017868042 0.02256710082292557 -0.00922986026853323
-4578 -0.07360920310020447 0.006239099893718958 -0.0114272003993392
-4579 -0.04538270086050034 0.02588650025427341 -0.01184049993753433
-4580 -0.06815829873085022 0.007968240417540073 -0.01205999962985516
-4581 -0.05482880026102066 0.0294393002986908 -0.009813089855015278
-4582 -0.04852849990129471 0.02461089938879013 -0.01184660010039806
-4583 -0.06056369841098785 0.008596270345151424 -0.0129653001204133
-4584 -0.05982879921793938 0.0163780003786087 -0.01218529976904392
-4585 -0.06320369988679886 0.006997960153967142 -0.01277120038866997
-4586 -0.06059230118989944 0.004900679923593998 -0.01318090036511421
-4587 -0.06386210024356842 0.003713269950821996 -0.01285069994628429
-4588 -0.06025649979710579 0.0125620998442173 -0.01263120025396347
-4589 -0.05739739909768105 0.01026189979165792 -0.01317000016570091
-4590 -0.05340979993343353 0.002923989901319146 -0.01396869961172342
-4591 -0.05155219882726669 2.603960018823562e-18 -0.01417529955506325
-4592 -0.04953280091285706 0.0157661996781826 -0.01332630030810833
-4593 -0.04984759911894798 0.01844670064747334 -0.01291020028293133
-4594 -0.04583590105175972 0.009469250217080116 -0.01427050027996302
-4595 -0.0503447987139225 0.01371829956769943 -0.01350579969584942
-4596 -0.04808799922466278 0.01156620029360056 -0.01391729991883039
-4597 -0.06356669962406158 0.01998420059680939 -0.01108909957110882
-4598 -0.06057180091738701 0.02112310007214546 -0.01125590037554502
-4599 -0.05474279820919037 0.01561869960278273 -0.01284809969365597
-4600 -0.05139710009098053 0.02152270078659058 -0.01222139969468117
-4601 -0.05438509956002235 0.01095199957489967 -0.01341119967401028
-4602 -0.05540049821138382 0.008838370442390442 -0.01348700001835823
-4603 -0.04700300097465515 0.01979630067944527 -0.01293930038809776
-4604 -0.05317439883947372 0.01336739957332611 -0.01328270044177771
-4605 -0.05138190090656281 0.01123620010912418 -0.01366849988698959
-4606 -0.05564479902386665 0.01816529966890812 -0.01237520016729832
-4607 -0.04500539973378181 0.01212539989501238 -0.01411029975861311
-4608 -0.04455349966883659 0.01509399991482496 -0.01382480002939701
-4609 -0.06576450169086456 0.02173030003905296 -0.01039099972695112
-4610 -0.06250949949026108 0.01523530017584562 -0.0120278000831604
-4611 -0.06757819652557373 0.01606719940900803 -0.01121020037680864
-4612 -0.06540130078792572 0.01436209958046675 -0.01177070010453463
-4613 -0.06133110076189041 0.01835650019347668 -0.01168499980121851
-4614 -0.07360920310020447 0.01554219983518124 -0.01039549987763166
-4615 -0.05165059864521027 0.03005239926278591 -0.01001750025898218
-4616 -0.050034299492836 0.02766020037233829 -0.01092400029301643
-4617 -0.04845910146832466 0.0306003000587225 -0.01020010001957417
-4618 -0.0575455017387867 0.007321550045162439 -0.01337539963424206
-4619 -0.05635220184922218 0.01305569987744093 -0.01299929991364479
-4620 -0.06427539885044098 0.0171888992190361 -0.01149970013648272
-4621 -0.05426939949393272 0.006280870176851749 -0.01375799998641014
-4622 -0.06640910357236862 0.01893950067460537 -0.01088059972971678
-4623 -0.06326880306005478 0.01260210014879704 -0.01226949971169233
-4624 -0.04938169941306114 0.008986449800431728 -0.01402449980378151
-4625 -0.05193179845809937 0.01581650041043758 -0.01310119964182377
-4626 -0.05315230041742325 0.0186036005616188 -0.0125652002170682
-4627 -0.05560459941625595 0.0249502994120121 -0.01100050006061792
-4628 -0.05227150022983551 0.02477180026471615 -0.0114283999428153
-4629 -0.04438420012593269 0.01882190071046352 -0.0133213996887207
-4630 -0.04722800105810165 0.01690120063722134 -0.01336830016225576
-4631 -0.06115270033478737 0.02807099930942059 -0.009357010014355183
-4632 -0.07046549767255783 2.212170057590883e-18 -0.01204250007867813
-4633 -0.06661160290241241 0.002643249928951263 -0.0125316996127367
-4634 -0.06856279820203781 0.004650239832699299 -0.01219969987869263
-4635 -0.07090520113706589 0.005482879932969809 -0.01183759979903698
-4636 -0.07015509903430939 0.002273770049214363 -0.01205909997224808
-4637 -0.07000400125980377 0.02070599980652332 -0.009938470087945461
-4638 -0.05073710158467293 0.005801570136100054 -0.01410149969160557
-4639 -0.05250490084290504 0.008648550137877464 -0.0137772997841239
-4640 -0.05340909957885742 0.0275046993046999 -0.01058380026370287
-4641 -0.0469961017370224 0.02810450084507465 -0.01110890042036772
-4642 -0.06774149835109711 0.02063190005719662 -0.01032469980418682
-4643 -0.06829860061407089 0.02321299910545349 -0.009605560451745987
-4644 -0.04859279841184616 0.02147259935736656 -0.01249739993363619
-4645 -0.04545040056109428 0.02264860086143017 -0.01254830043762922
-4646 -0.07360920310020447 0.02164719998836517 -0.009101609699428082
-4647 -0.05869489908218384 0.02588650025427341 -0.01036449987441301
-4648 -0.06740520149469376 0.02643539942800999 -0.008811810053884983
-4649 -0.06174720078706741 0.002155029913410544 -0.01314069982618093
-4650 -0.04777970165014267 0.006960750091820955 -0.0142815001308918
-4651 -0.05639449879527092 0.001865520025603473 -0.01370839960873127
-4652 -0.05690060183405876 0.004225070122629404 -0.01359410025179386
-4653 -0.05471180006861687 2.551339958131767e-18 -0.01388879958540201
-4654 -0.05492119863629341 0.02148899994790554 -0.01185320038348436
-4655 -0.05828579887747765 0.0191383995115757 -0.01191489957273006
-4656 -0.05603739991784096 0.0274512991309166 -0.01027119997888803
-4657 -0.06280150264501572 0.02281619980931282 -0.01058079954236746
-4658 -0.06210190057754517 0.02544260025024414 -0.01000710017979145
-4659 -0.06032130122184753 0.02356790006160736 -0.01074260007590055
-4660 -0.05908099934458733 0.00217098998837173 -0.01343030016869307
-4661 -0.06995780020952225 0.01792039908468723 -0.0105279004201293
-4662 -0.06618329882621765 0.01118679996579885 -0.01204369962215424
-4663 -0.04743010178208351 0.01409380044788122 -0.0137090003117919
-4664 -0.05741000175476074 0.01592759974300861 -0.01252369955182076
-4665 -0.06520780175924301 0.00832642987370491 -0.01242929976433516
-4666 -0.06311880052089691 0.01000330038368702 -0.01255299989134073
-4667 -0.06587880104780197 0.005797860212624073 -0.01250459998846054
-4668 -0.05809219926595688 0.02280139923095703 -0.01120579987764359
-4669 -0.06429090350866318 0.02729449979960918 -0.009098149836063385
-4670 -0.06511040031909943 0.02457530051469803 -0.009777969680726528
-4671 -0.07360920310020447 0.009351289831101894 -0.01118880044668913
-4672 -0.07122460007667542 0.008532949723303318 -0.01158929988741875
-4673 -0.07169289886951447 0.0110828997567296 -0.01127989962697029
-4674 -0.07063029706478119 0.01399639993906021 -0.01106959953904152
-4675 -0.06783690303564072 0.013349499553442 -0.01156250014901161
-4676 -0.06939119845628738 0.01100079994648695 -0.01161570008844137
-4677 -0.05052810162305832 0.002655569929629564 -0.01422850042581558
-4678 -0.04734649881720543 0.003453030018135905 -0.01445959974080324
-4679 -0.04426740109920502 0.002564359921962023 -0.01471239980310202
-4680 -0.04463990032672882 0.006114080082625151 -0.01456569973379374
-4681 -0.04397109895944595 0.02851950004696846 -0.01128969993442297
-4682 -0.04938169941306114 -0.008986449800431728 -0.01402449980378151
-4683 -0.07360920310020447 -0.009351289831101894 -0.01118880044668913
-4684 -0.04526039958000183 -0.03110859915614128 -0.01036950014531612
-4685 -0.07360920310020447 -0.006239099893718958 -0.0114272003993392
-4686 -0.07122460007667542 -0.008532949723303318 -0.01158929988741875
-4687 -0.06417589634656906 2.366190053672491e-18 -0.01288089994341135
-4688 -0.04538270086050034 -0.02588650025427341 -0.01184049993753433
-4689 -0.06056369841098785 -0.008596270345151424 -0.0129653001204133
-4690 -0.06059230118989944 -0.004900679923593998 -0.01318090036511421
-4691 -0.05982879921793938 -0.0163780003786087 -0.01218529976904392
-4692 -0.05739739909768105 -0.01026189979165792 -0.01317000016570091
-4693 -0.05052810162305832 -0.002655569929629564 -0.01422850042581558
-4694 -0.05340979993343353 -0.002923989901319146 -0.01396869961172342
-4695 -0.06025649979710579 -0.0125620998442173 -0.01263120025396347
-4696 -0.06250949949026108 -0.01523530017584562 -0.0120278000831604
-4697 -0.04700300097465515 -0.01979630067944527 -0.01293930038809776
-4698 -0.04953280091285706 -0.0157661996781826 -0.01332630030810833
-4699 -0.06057180091738701 -0.02112310007214546 -0.01125590037554502
-4700 -0.05438509956002235 -0.01095199957489967 -0.01341119967401028
-4701 -0.06587880104780197 -0.005797860212624073 -0.01250459998846054
-4702 -0.05340909957885742 -0.0275046993046999 -0.01058380026370287
-4703 -0.05250490084290504 -0.008648550137877464 -0.0137772997841239
-4704 -0.05315230041742325 -0.0186036005616188 -0.0125652002170682
-4705 -0.05564479902386665 -0.01816529966890812 -0.01237520016729832
-4706 -0.05474279820919037 -0.01561869960278273 -0.01284809969365597
-4707 -0.04500539973378181 -0.01212539989501238 -0.01411029975861311
-4708 -0.04583590105175972 -0.009469250217080116 -0.01427050027996302
-4709 -0.06576450169086456 -0.02173030003905296 -0.01039099972695112
-4710 -0.06427539885044098 -0.0171888992190361 -0.01149970013648272
-4711 -0.06356669962406158 -0.01998420059680939 -0.01108909957110882
-4712 -0.06856279820203781 -0.004650239832699299 -0.01219969987869263
-4713 -0.07360920310020447 -0.01554219983518124 -0.01039549987763166
-4714 -0.04838979989290237 2.650829933487195e-18 -0.01443039998412132
-4715 -0.05426939949393272 -0.006280870176851749 -0.01375799998641014
-4716 -0.05540049821138382 -0.008838370442390442 -0.01348700001835823
-4717 -0.0575455017387867 -0.007321550045162439 -0.01337539963424206
-4718 -0.06320369988679886 -0.006997960153967142 -0.01277120038866997
-4719 -0.05741000175476074 -0.01592759974300861 -0.01252369955182076
-4720 -0.05635220184922218 -0.01305569987744093 -0.01299929991364479
-4721 -0.06640910357236862 -0.01893950067460537 -0.01088059972971678
-4722 -0.06757819652557373 -0.01606719940900803 -0.01121020037680864
-4723 -0.06133110076189041 -0.01835650019347668 -0.01168499980121851
-4724 -0.06774149835109711 -0.02063190005719662 -0.01032469980418682
-4725 -0.06032130122184753 -0.02356790006160736 -0.01074260007590055
-4726 -0.04808799922466278 -0.01156620029360056 -0.01391729991883039
-4727 -0.0503447987139225 -0.01371829956769943 -0.01350579969584942
-4728 -0.05317439883947372 -0.01336739957332611 -0.01328270044177771
-4729 -0.05138190090656281 -0.01123620010912418 -0.01366849988698959
-4730 -0.05193179845809937 -0.01581650041043758 -0.01310119964182377
-4731 -0.05139710009098053 -0.02152270078659058 -0.01222139969468117
-4732 -0.04206240177154541 -0.0191555991768837 -0.01346949953585863
-4733 -0.04455349966883659 -0.01509399991482496 -0.01382480002939701
-4734 -0.04743010178208351 -0.01409380044788122 -0.0137090003117919
-4735 -0.04722800105810165 -0.01690120063722134 -0.01336830016225576
-4736 -0.05908099934458733 -0.00217098998837173 -0.01343030016869307
-4737 -0.04206240177154541 -0.02231249958276749 -0.01291829999536276
-4738 -0.07015509903430939 -0.002273770049214363 -0.01205909997224808
-4739 -0.06732220202684402 2.291249971717025e-18 -0.01247300021350384
-4740 -0.06661160290241241 -0.002643249928951263 -0.0125316996127367
-4741 -0.07090520113706589 -0.005482879932969809 -0.01183759979903698
-4742 -0.07360920310020447 -0.003120969980955124 -0.01156819984316826
-4743 -0.06995780020952225 -0.01792039908468723 -0.0105279004201293
-4744 -0.07360920310020447 -0.01860979944467545 -0.009819650091230869
-4745 -0.05227150022983551 -0.02477180026471615 -0.0114283999428153
-4746 -0.050034299492836 -0.02766020037233829 -0.01092400029301643
-4747 -0.04852849990129471 -0.02461089938879013 -0.01184660010039806
-4748 -0.0469961017370224 -0.02810450084507465 -0.01110890042036772
-4749 -0.07000400125980377 -0.02070599980652332 -0.009938470087945461
-4750 -0.0714339017868042 -0.02256710082292557 -0.00922986026853323
-4751 -0.04438420012593269 -0.01882190071046352 -0.0133213996887207
-4752 -0.04859279841184616 -0.02147259935736656 -0.01249739993363619
-4753 -0.04545040056109428 -0.02264860086143017 -0.01254830043762922
-4754 -0.05869489908218384 -0.02588650025427341 -0.01036449987441301
-4755 -0.04463990032672882 -0.006114080082625151 -0.01456569973379374
-4756 -0.06829860061407089 -0.02321299910545349 -0.009605560451745987
-4757 -0.0610244981944561 2.433429911305702e-18 -0.01324700005352497
-4758 -0.05073710158467293 -0.005801570136100054 -0.01410149969160557
-4759 -0.05690060183405876 -0.004225070122629404 -0.01359410025179386
-4760 -0.05639449879527092 -0.001865520025603473 -0.01370839960873127
-4761 -0.05799710005521774 -0.0287817008793354 -0.00959389004856348
-4762 -0.05603739991784096 -0.0274512991309166 -0.01027119997888803
-4763 -0.05482880026102066 -0.0294393002986908 -0.009813089855015278
-4764 -0.06511040031909943 -0.02457530051469803 -0.009777969680726528
-4765 -0.06740520149469376 -0.02643539942800999 -0.008811810053884983
-4766 -0.06386210024356842 -0.003713269950821996 -0.01285069994628429
-4767 -0.06174720078706741 -0.002155029913410544 -0.01314069982618093
-4768 -0.06280150264501572 -0.02281619980931282 -0.01058079954236746
-4769 -0.05786950141191483 2.494750050885177e-18 -0.01358080003410578
-4770 -0.06618329882621765 -0.01118679996579885 -0.01204369962215424
-4771 -0.06311880052089691 -0.01000330038368702 -0.01255299989134073
-4772 -0.06326880306005478 -0.01260210014879704 -0.01226949971169233
-4773 -0.06540130078792572 -0.01436209958046675 -0.01177070010453463
-4774 -0.05828579887747765 -0.0191383995115757 -0.01191489957273006
-4775 -0.05809219926595688 -0.02280139923095703 -0.01120579987764359
-4776 -0.04984759911894798 -0.01844670064747334 -0.01291020028293133
-4777 -0.05492119863629341 -0.02148899994790554 -0.01185320038348436
-4778 -0.06939119845628738 -0.01100079994648695 -0.01161570008844137
-4779 -0.06520780175924301 -0.00832642987370491 -0.01242929976433516
-4780 -0.06815829873085022 -0.007968240417540073 -0.01205999962985516
-4781 -0.04426740109920502 -0.002564359921962023 -0.01471239980310202
-4782 -0.05560459941625595 -0.0249502994120121 -0.01100050006061792
-4783 -0.06210190057754517 -0.02544260025024414 -0.01000710017979145
-4784 -0.04206240177154541 -0.006407110020518303 -0.01475249975919724
-4785 -0.07063029706478119 -0.01399639993906021 -0.01106959953904152
-4786 -0.07169289886951447 -0.0110828997567296 -0.01127989962697029
-4787 -0.06783690303564072 -0.013349499553442 -0.01156250014901161
-4788 -0.04777970165014267 -0.006960750091820955 -0.0142815001308918
-4789 -0.04522600024938583 2.694329914335287e-18 -0.01466729957610369
-4790 -0.04734649881720543 -0.003453030018135905 -0.01445959974080324
-4791 -0.04397109895944595 -0.02851950004696846 -0.01128969993442297
-4792 -0.07050620019435883 -0.02553410083055496 -0.008511349558830261
-4793 -0.047867801040411 -0.03303990140557289 -0.009381289593875408
-4794 -0.06800910085439682 -0.03092649951577187 -0.006844529882073402
-4795 -0.06931819766759872 -0.03336609899997711 -0.005005769897252321
-4796 -0.07105039805173874 -0.03122100047767162 -0.005892099812626839
-4797 -0.07360920310020447 -0.03173429891467094 -0.004796879831701517
-4798 -0.06016189977526665 -0.03714080154895782 -0.004950790200382471
-4799 -0.04518989846110344 -0.03420599922537804 -0.009227380156517029
-4800 -0.06098220124840736 -0.03133039921522141 -0.008144579827785492
-4801 -0.05932049825787544 -0.03418590128421783 -0.007088140118867159
-4802 -0.04845910146832466 -0.0306003000587225 -0.01020010001957417
-4803 -0.05165059864521027 -0.03005239926278591 -0.01001750025898218
-4804 -0.0503958985209465 -0.03367099910974503 -0.008806750178337097
-4805 -0.04430339857935905 -0.03638099879026413 -0.008367990143597126
-4806 -0.04206240177154541 -0.03903419896960258 -0.007273389957845211
-4807 -0.05459199845790863 -0.03836619853973389 -0.005425769835710526
-4808 -0.06311129778623581 -0.03645969927310944 -0.00462319003418088
-4809 -0.06115270033478737 -0.02807099930942059 -0.009357010014355183
-4810 -0.06326819956302643 -0.02958109974861145 -0.008449910208582878
-4811 -0.06616920232772827 -0.02914539910852909 -0.008057739585638046
-4812 -0.06429090350866318 -0.02729449979960918 -0.009098149836063385
-4813 -0.06441099941730499 -0.03143120184540749 -0.007428899873048067
-4814 -0.06509540230035782 -0.03549110144376755 -0.004779169801622629
-4815 -0.04206240177154541 -0.04126409813761711 -0.005745130125433207
-4816 -0.06633470207452774 -0.03379639983177185 -0.005637399852275848
-4817 -0.06266400218009949 -0.03432239964604378 -0.006280149798840284
-4818 -0.06802830100059509 -0.03586680069565773 -0.003203490050509572
-4819 -0.04206240177154541 -0.03162109851837158 -0.01054039970040321
-4820 -0.0700519010424614 -0.02855050005018711 -0.007467410061508417
-4821 -0.0716807022690773 -0.03311419859528542 -0.00437651015818119
-4822 -0.07360920310020447 -0.03365740180015564 -0.003006160026416183
-4823 -0.04206240177154541 -0.0431951992213726 -0.00385804008692503
-4824 -0.04499499872326851 -0.04255209863185883 -0.003800600068643689
-4825 -0.04544829949736595 -0.04099410027265549 -0.005278119817376137
-4826 -0.04456660151481628 -0.03923590108752251 -0.006741509772837162
-4827 -0.05702260136604309 -0.03187980130314827 -0.008581089787185192
-4828 -0.04633560031652451 -0.03719960153102875 -0.007670970167964697
-4829 -0.05085580050945282 -0.04124730080366135 -0.003684059949591756
-4830 -0.04791650176048279 -0.03977809846401215 -0.005773440003395081
-4831 -0.05152999982237816 -0.0390269011259079 -0.005617740098387003
-4832 -0.05226949974894524 -0.03642719984054565 -0.007174340076744556
-4833 -0.0494266003370285 -0.03688229992985725 -0.007386900018900633
-4834 -0.04781030118465424 -0.03510620072484016 -0.008510979823768139
-4835 -0.05461210012435913 -0.03604520112276077 -0.006965099833905697
-4836 -0.0574336014688015 -0.03724589943885803 -0.00558914989233017
-4837 -0.05376389995217323 -0.04050249978899956 -0.003617529990151525
-4838 -0.05325689911842346 -0.03465100005269051 -0.007937449961900711
-4839 -0.05385150015354156 -0.03249029815196991 -0.008812930434942245
-4840 -0.05595429986715317 -0.03451250120997429 -0.007549609988927841
-4841 -0.04619500041007996 -0.04339810088276863 -0.001931519946083426
-4842 -0.04924729838967323 -0.04269810020923615 -0.001924050040543079
-4843 -0.05953650176525116 -0.03885339945554733 -0.003470249939709902
-4844 -0.06239540129899979 -0.03793900087475777 -0.003388579934835434
-4845 -0.06522669643163681 -0.03694330155849457 -0.003299640025943518
-4846 -0.0696633979678154 -0.0361379012465477 -0.001601750031113625
-4847 -0.05810470134019852 -0.04031430184841156 -0.001769160036928952
-4848 -0.05665789917111397 -0.03970459848642349 -0.003546270076185465
-4849 -0.0609733983874321 -0.03940970078110695 -0.001729459967464209
-4850 -0.04792949929833412 -0.04191790148615837 -0.003743960056453943
-4851 -0.05521789938211441 -0.04115980118513107 -0.001806269981898367
-4852 -0.05086689814925194 -0.04269950091838837 0
-4853 -0.05228950083255768 -0.0419607013463974 -0.00184923002962023
-4854 -0.06381890177726746 -0.03843459859490395 -0.001687149982899427
-4855 -0.06523910164833069 -0.03824169933795929 0
-4856 -0.06666889786720276 -0.03735220059752464 -0.001641980023123324
-4857 -0.06803680211305618 -0.0371285006403923 0
-4858 -0.04499879851937294 -0.04405229911208153 0
-4859 -0.04206240177154541 -0.04471899941563606 0
-4860 -0.04206240177154541 -0.04429110139608383 -0.002057119971141219
-4861 -0.07360920310020447 -0.03451130166649818 -0.001602889969944954
-4862 -0.07081639766693115 -0.03475629910826683 -0.003104310017079115
-4863 -0.09800489991903305 -0.01700880005955696 -0.001519159995950758
-4864 -0.09989819675683975 -0.01471630018204451 -0.001314410008490086
-4865 -0.09150280058383942 -0.02308440022170544 -0.002061810111626983
-4866 -0.09154680371284485 -0.02386349998414516 0
-4867 -0.09386850148439407 -0.02194250002503395 0
-4868 -0.08912249654531479 -0.02487130090594292 -0.002221409929916263
-4869 -0.08669310063123703 -0.02659150026738644 -0.002375059993937612
-4870 -0.09604260325431824 -0.0192416999489069 -0.001718600047752261
-4871 -0.07360920310020447 -0.02949629910290241 -0.006183530203998089
-4872 -0.07608009874820709 -0.030790900811553 -0.004466310143470764
-4873 -0.07628340274095535 -0.03234609961509705 -0.002889039926230907
-4874 -0.07788030058145523 -0.02781550027430058 -0.005721270106732845
-4875 -0.08162839710712433 -0.02971759997308254 -0.002654270036146045
-4876 -0.07867439836263657 -0.02950309962034225 -0.004375330172479153
-4877 -0.07897190004587173 -0.0310639999806881 -0.002774530090391636
-4878 -0.08120790123939514 -0.02505549974739552 -0.006068849936127663
-4879 -0.07929349690675735 -0.02262590080499649 -0.00754196010529995
-4880 -0.07851579785346985 -0.02560560032725334 -0.006602670066058636
-4881 -0.07360920310020447 -0.02710920013487339 -0.007297220174223185
-4882 -0.07599770277738571 -0.02639289945363998 -0.006943069864064455
-4883 -0.07592450082302094 -0.02874059975147247 -0.005837580189108849
-4884 -0.07644719630479813 -0.02362200058996677 -0.007873980328440666
-4885 -0.07360920310020447 -0.02463890053331852 -0.008212979882955551
-4886 -0.09768500179052353 -0.01274089980870485 -0.004246970172971487
-4887 -0.09535039961338043 -0.01457520015537739 -0.004858389962464571
-4888 -0.09413199871778488 -0.01959419995546341 -0.003131039906293154
-4889 -0.09550879895687103 -0.01765060052275658 -0.003460499923676252
-4890 -0.08420579880475998 -0.028227299451828 -0.002521160058677197
-4891 -0.0828080028295517 -0.02693199925124645 -0.004449690226465464
-4892 -0.08024299889802933 -0.02781949937343597 -0.004913929849863052
-4893 -0.09020440280437469 -0.01762159913778305 -0.005873870104551315
-4894 -0.09382879734039307 -0.02122779935598373 -0.001895989989861846
-4895 -0.09198310226202011 -0.02112060040235519 -0.003447589930146933
-4896 -0.09280969947576523 -0.01614709943532944 -0.00538235018029809
-4897 -0.09257309883832932 -0.01894240081310272 -0.004371029790490866
-4898 -0.08352869749069214 -0.02452420070767403 -0.005537979770451784
-4899 -0.08648359775543213 -0.02461840026080608 -0.004197690170258284
-4900 -0.08467060327529907 -0.02600640058517456 -0.004193120170384645
-4901 -0.09784310311079025 -0.01537119969725609 -0.003010639920830727
-4902 -0.08495870232582092 -0.02291879989206791 -0.005759479943662882
-4903 -0.09002210199832916 -0.02048690058290958 -0.004808200057595968
-4904 -0.08721870183944702 -0.02197379991412163 -0.005306450184434652
-4905 -0.08949069678783417 -0.02283089980483055 -0.003755619982257485
-4906 -0.08755730092525482 -0.01902740076184273 -0.006342470180243254
-4907 -0.07360920310020447 -0.02164719998836517 -0.009101609699428082
-4908 -0.07572150230407715 -0.02072739973664284 -0.008880959823727608
-4909 -0.0811678022146225 -0.01621749997138977 -0.008792189881205559
-4910 -0.07745420187711716 -0.0157868005335331 -0.009613920003175735
-4911 -0.07670559734106064 -0.01860979944467545 -0.009188540279865265
-4912 -0.07521550357341766 -0.01694630086421967 -0.009827770292758942
-4913 -0.08486650139093399 -0.02035650052130222 -0.00678551010787487
-4914 -0.08211240172386169 -0.02156239934265614 -0.007187460083514452
-4915 -0.07900740206241608 -0.01817500032484531 -0.008822419680655003
-4916 -0.07956299930810928 1.950919950367035e-18 -0.01062029972672462
-4917 -0.07587070018053055 -0.004208929836750031 -0.01113899983465672
-4918 -0.0761101022362709 -0.007618620060384274 -0.01089289970695972
-4919 -0.08605910092592239 -0.005213209893554449 -0.009146310389041901
-4920 -0.08345899730920792 -0.004442209843546152 -0.009771949611604214
-4921 -0.07861369848251343 -0.02077849954366684 -0.008252359926700592
-4922 -0.08073829859495163 -0.01912290044128895 -0.008224169723689556
-4923 -0.08772770315408707 -0.0166506003588438 -0.006984000094234943
-4924 -0.07648830115795135 -0.01084509957581758 -0.01051659975200891
-4925 -0.07934729754924774 -0.01297799963504076 -0.00972019974142313
-4926 -0.07627560198307037 -0.0133170997723937 -0.01023480016738176
-4927 -0.07360920310020447 -0.01245389971882105 -0.01084769982844591
-4928 -0.08301530033349991 -0.01846889965236187 -0.007850020192563534
-4929 -0.0861537978053093 -0.01490209996700287 -0.007846199907362461
-4930 -0.08574660122394562 -0.002698659896850586 -0.009344819933176041
-4931 -0.08547879755496979 -0.01768480055034161 -0.007382909767329693
-4932 -0.08367069810628891 -0.007078300230205059 -0.009546499699354172
-4933 -0.07658530026674271 2.041400067695383e-18 -0.01111279986798763
-4934 -0.07360920310020447 2.133619952647082e-18 -0.01161490008234978
-4935 -0.07554709911346436 -0.002019919920712709 -0.01126249972730875
-4936 -0.07803139835596085 -0.002766340039670467 -0.01083160005509853
-4937 -0.0792125016450882 -0.008995460346341133 -0.0102335000410676
-4938 -0.07831119745969772 -0.005692929960787296 -0.01065209973603487
-4939 -0.08116059750318527 -0.002817580010741949 -0.01028919965028763
-4940 -0.08369000256061554 -0.001962790032848716 -0.00982144009321928
-4941 -0.09818500280380249 -0.01031020004302263 -0.004667120054364204
-4942 -0.09989819675683975 -0.008136910386383533 -0.004293520003557205
-4943 -0.09264770150184631 -0.004888160154223442 -0.00748638017103076
-4944 -0.09283620119094849 -0.001887719961814582 -0.00758109986782074
-4945 -0.09574919939041138 -0.002563929883763194 -0.006693180184811354
-4946 -0.09425369650125504 1.323169998561129e-18 -0.007202989887446165
-4947 -0.09134499728679657 1.471089951215464e-18 -0.008008229546248913
-4948 -0.09572289884090424 -0.005757160019129515 -0.006483600009232759
-4949 -0.08802050352096558 -0.003232290036976337 -0.008783649653196335
-4950 -0.09034500271081924 -0.002492289990186691 -0.008227069862186909
-4951 -0.09989819675683975 -0.005445300135761499 -0.004743029829114676
-4952 -0.08925680071115494 -0.00582179008051753 -0.008318499661982059
-4953 -0.08631029725074768 -0.008611209690570831 -0.008790330030024052
-4954 -0.09989819675683975 9.328999817040159e-19 -0.00507846986874938
-4955 -0.09812109917402267 -0.002015999983996153 -0.005784019827842712
-4956 -0.09711319953203201 1.146479980419162e-18 -0.006241159979254007
-4957 -0.09761639684438705 -0.00446499977260828 -0.005857029929757118
-4958 -0.0918503999710083 -0.01409259997308254 -0.006320650223642588
-4959 -0.08876349776983261 -0.01463500037789345 -0.007161359768360853
-4960 -0.09129290282726288 -0.007275059819221497 -0.007647430058568716
-4961 -0.09347940236330032 -0.01180600002408028 -0.006305519957095385
-4962 -0.08986149728298187 -0.01230479963123798 -0.0073187998495996
-4963 -0.08703199774026871 -0.01217000000178814 -0.008121980354189873
-4964 -0.09163209795951843 -0.01121679972857237 -0.006997569929808378
-4965 -0.08403349667787552 -0.01604489982128143 -0.0081632100045681
-4966 -0.08507160097360611 -0.01103250030428171 -0.008788649924099445
-4967 -0.0796298012137413 -0.004323429893702269 -0.01050010044127703
-4968 -0.08101599663496017 -0.005968289915472269 -0.01015789993107319
-4969 -0.08344220370054245 -0.0131844999268651 -0.008846630342304707
-4970 -0.08364570140838623 -0.009986789897084236 -0.009255110286176205
-4971 -0.08155269920825958 -0.0106952004134655 -0.009606449864804745
-4972 -0.08181949704885483 -0.00858002994209528 -0.009789059869945049
-4973 -0.0975584015250206 -0.007830499671399593 -0.005478859879076481
-4974 -0.09630150347948074 -0.01114779990166426 -0.005403569899499416
-4975 -0.08997459709644318 -0.009524459950625896 -0.00773447984829545
-4976 -0.09386640042066574 -0.008756609633564949 -0.006719150114804506
-4977 -0.07670559734106064 0.01860979944467545 -0.009188540279865265
-4978 -0.07360920310020447 0.01860979944467545 -0.009819650091230869
-4979 -0.07572150230407715 0.02072739973664284 -0.008880959823727608
-4980 -0.07644719630479813 0.02362200058996677 -0.007873980328440666
-4981 -0.07745420187711716 0.0157868005335331 -0.009613920003175735
-4982 -0.07521550357341766 0.01694630086421967 -0.009827770292758942
-4983 -0.07929349690675735 0.02262590080499649 -0.00754196010529995
-4984 -0.08301530033349991 0.01846889965236187 -0.007850020192563534
-4985 -0.07900740206241608 0.01817500032484531 -0.008822419680655003
-4986 -0.07861369848251343 0.02077849954366684 -0.008252359926700592
-4987 -0.082533098757267 1.85235993281527e-18 -0.01008380018174648
-4988 -0.07587070018053055 0.004208929836750031 -0.01113899983465672
-4989 -0.0761101022362709 0.007618620060384274 -0.01089289970695972
-4990 -0.08367069810628891 0.007078300230205059 -0.009546499699354172
-4991 -0.08073829859495163 0.01912290044128895 -0.008224169723689556
-4992 -0.08772770315408707 0.0166506003588438 -0.006984000094234943
-4993 -0.08547879755496979 0.01768480055034161 -0.007382909767329693
-4994 -0.07934729754924774 0.01297799963504076 -0.00972019974142313
-4995 -0.07627560198307037 0.0133170997723937 -0.01023480016738176
-4996 -0.07648830115795135 0.01084509957581758 -0.01051659975200891
-4997 -0.0811678022146225 0.01621749997138977 -0.008792189881205559
-4998 -0.07360920310020447 0.01245389971882105 -0.01084769982844591
-4999 -0.08403349667787552 0.01604489982128143 -0.0081632100045681
-5000 -0.0854853019118309 1.737209980898141e-18 -0.009456920437514782
-5001 -0.08345899730920792 0.004442209843546152 -0.009771949611604214
-5002 -0.07803139835596085 0.002766340039670467 -0.01083160005509853
-5003 -0.07554709911346436 0.002019919920712709 -0.01126249972730875
-5004 -0.07360920310020447 0.003120969980955124 -0.01156819984316826
-5005 -0.08369000256061554 0.001962790032848716 -0.00982144009321928
-5006 -0.08116059750318527 0.002817580010741949 -0.01028919965028763
-5007 -0.08574660122394562 0.002698659896850586 -0.009344819933176041
-5008 -0.09989819675683975 0.008136910386383533 -0.004293520003557205
-5009 -0.08842139691114426 1.608810043133985e-18 -0.0087579395622015
-5010 -0.09574919939041138 0.002563929883763194 -0.006693180184811354
-5011 -0.09283620119094849 0.001887719961814582 -0.00758109986782074
-5012 -0.09572289884090424 0.005757160019129515 -0.006483600009232759
-5013 -0.09264770150184631 0.004888160154223442 -0.00748638017103076
-5014 -0.09034500271081924 0.002492289990186691 -0.008227069862186909
-5015 -0.08802050352096558 0.003232290036976337 -0.008783649653196335
-5016 -0.09761639684438705 0.00446499977260828 -0.005857029929757118
-5017 -0.08925680071115494 0.00582179008051753 -0.008318499661982059
-5018 -0.08605910092592239 0.005213209893554449 -0.009146310389041901
-5019 -0.08997459709644318 0.009524459950625896 -0.00773447984829545
-5020 -0.09812109917402267 0.002015999983996153 -0.005784019827842712
-5021 -0.09163209795951843 0.01121679972857237 -0.006997569929808378
-5022 -0.09347940236330032 0.01180600002408028 -0.006305519957095385
-5023 -0.09020440280437469 0.01762159913778305 -0.005873870104551315
-5024 -0.0861537978053093 0.01490209996700287 -0.007846199907362461
-5025 -0.08703199774026871 0.01217000000178814 -0.008121980354189873
-5026 -0.09129290282726288 0.007275059819221497 -0.007647430058568716
-5027 -0.09386640042066574 0.008756609633564949 -0.006719150114804506
-5028 -0.09630150347948074 0.01114779990166426 -0.005403569899499416
-5029 -0.08876349776983261 0.01463500037789345 -0.007161359768360853
-5030 -0.0918503999710083 0.01409259997308254 -0.006320650223642588
-5031 -0.08986149728298187 0.01230479963123798 -0.0073187998495996
-5032 -0.08507160097360611 0.01103250030428171 -0.008788649924099445
-5033 -0.08631029725074768 0.008611209690570831 -0.008790330030024052
-5034 -0.08344220370054245 0.0131844999268651 -0.008846630342304707
-5035 -0.07831119745969772 0.005692929960787296 -0.01065209973603487
-5036 -0.0796298012137413 0.004323429893702269 -0.01050010044127703
-5037 -0.08101599663496017 0.005968289915472269 -0.01015789993107319
-5038 -0.08364570140838623 0.009986789897084236 -0.009255110286176205
-5039 -0.0792125016450882 0.008995460346341133 -0.0102335000410676
-5040 -0.08181949704885483 0.00858002994209528 -0.009789059869945049
-5041 -0.08155269920825958 0.0106952004134655 -0.009606449864804745
-5042 -0.09989819675683975 0.005445300135761499 -0.004743029829114676
-5043 -0.0975584015250206 0.007830499671399593 -0.005478859879076481
-5044 -0.09818500280380249 0.01031020004302263 -0.004667120054364204
-5045 -0.07608009874820709 0.030790900811553 -0.004466310143470764
-5046 -0.07628340274095535 0.03234609961509705 -0.002889039926230907
-5047 -0.07360920310020447 0.03365740180015564 -0.003006160026416183
-5048 -0.07897190004587173 0.0310639999806881 -0.002774530090391636
-5049 -0.07592450082302094 0.02874059975147247 -0.005837580189108849
-5050 -0.08162839710712433 0.02971759997308254 -0.002654270036146045
-5051 -0.07867439836263657 0.02950309962034225 -0.004375330172479153
-5052 -0.08024299889802933 0.02781949937343597 -0.004913929849863052
-5053 -0.08120790123939514 0.02505549974739552 -0.006068849936127663
-5054 -0.08211240172386169 0.02156239934265614 -0.007187460083514452
-5055 -0.07788030058145523 0.02781550027430058 -0.005721270106732845
-5056 -0.07851579785346985 0.02560560032725334 -0.006602670066058636
-5057 -0.07599770277738571 0.02639289945363998 -0.006943069864064455
-5058 -0.09382879734039307 0.02122779935598373 -0.001895989989861846
-5059 -0.09535039961338043 0.01457520015537739 -0.004858389962464571
-5060 -0.09413199871778488 0.01959419995546341 -0.003131039906293154
-5061 -0.09800489991903305 0.01700880005955696 -0.001519159995950758
-5062 -0.09550879895687103 0.01765060052275658 -0.003460499923676252
-5063 -0.09784310311079025 0.01537119969725609 -0.003010639920830727
-5064 -0.0828080028295517 0.02693199925124645 -0.004449690226465464
-5065 -0.08949069678783417 0.02283089980483055 -0.003755619982257485
-5066 -0.08755730092525482 0.01902740076184273 -0.006342470180243254
-5067 -0.09002210199832916 0.02048690058290958 -0.004808200057595968
-5068 -0.09150280058383942 0.02308440022170544 -0.002061810111626983
-5069 -0.09280969947576523 0.01614709943532944 -0.00538235018029809
-5070 -0.09257309883832932 0.01894240081310272 -0.004371029790490866
-5071 -0.09198310226202011 0.02112060040235519 -0.003447589930146933
-5072 -0.08467060327529907 0.02600640058517456 -0.004193120170384645
-5073 -0.08669310063123703 0.02659150026738644 -0.002375059993937612
-5074 -0.09768500179052353 0.01274089980870485 -0.004246970172971487
-5075 -0.09989819675683975 0.01289690006524324 -0.00270366994664073
-5076 -0.08486650139093399 0.02035650052130222 -0.00678551010787487
-5077 -0.08495870232582092 0.02291879989206791 -0.005759479943662882
-5078 -0.08352869749069214 0.02452420070767403 -0.005537979770451784
-5079 -0.08648359775543213 0.02461840026080608 -0.004197690170258284
-5080 -0.08721870183944702 0.02197379991412163 -0.005306450184434652
-5081 -0.08916839957237244 0.02571390010416508 0
-5082 -0.08912249654531479 0.02487130090594292 -0.002221409929916263
-5083 -0.08673900365829468 0.02749690040946007 0
-5084 -0.09604260325431824 0.0192416999489069 -0.001718600047752261
-5085 -0.081666000187397 0.0307449996471405 0
-5086 -0.07899840176105499 0.03214659914374352 0
-5087 -0.07360920310020447 0.03451130166649818 -0.001602889969944954
-5088 -0.08424949645996094 0.02919469960033894 0
-5089 -0.08420579880475998 0.028227299451828 -0.002521160058677197
-5090 -0.1049389988183975 -0.00143585994374007 -0.0004786190111190081
-5091 -0.1029379963874817 -0.006756430026143789 -0.002252140082418919
-5092 -0.09989819675683975 -0.01289690006524324 -0.00270366994664073
-5093 -0.1023819968104362 -0.01062010042369366 -0.001240620040334761
-5094 -0.1014880016446114 -0.008674999698996544 -0.002891669981181622
-5095 -0.1041560024023056 -0.005985530093312263 -0.000893443007953465
-5096 -0.1044749990105629 -0.005594640038907528 0
-5097 -0.1037480011582375 -0.007812789641320705 0
-5098 -0.1039540022611618 -0.00697069987654686 -0.0007944750250317156
-5099 -0.09989819675683975 -0.01077309995889664 -0.003591019893065095
-5100 -0.1047040000557899 -0.003093079896643758 -0.001031029969453812
-5101 -0.1031889989972115 -0.004344699904322624 -0.002883200068026781
-5102 -0.1040839999914169 -0.004909549839794636 -0.001636520028114319
-5103 -0.1036190018057823 4.969060055243862e-19 -0.002705029910430312
-5104 -0.1047499999403954 2.475940015454509e-19 -0.00134783994872123
-5105 -0.1042170003056526 -0.002381250029429793 -0.00220121000893414
-5106 -0.1026910021901131 -0.001905909972265363 -0.003431669902056456
-5107 -0.101173996925354 -0.001684430055320263 -0.004310640040785074
-5108 -0.1015049964189529 -0.003711950033903122 -0.00404332997277379
-5109 -0.09989819675683975 -0.002727970015257597 -0.004996399860829115
-5110 -0.1016630008816719 -0.006239550188183784 -0.003568350104615092
-5111 -0.1049389988183975 0.00143585994374007 -0.0004786190111190081
-5112 -0.1040839999914169 0.004909549839794636 -0.001636520028114319
-5113 -0.1042170003056526 0.002381250029429793 -0.00220121000893414
-5114 -0.1031889989972115 0.004344699904322624 -0.002883200068026781
-5115 -0.1015049964189529 0.003711950033903122 -0.00404332997277379
-5116 -0.1026910021901131 0.001905909972265363 -0.003431669902056456
-5117 -0.1018830016255379 7.071589804182679e-19 -0.0038495899643749
-5118 -0.09989819675683975 0.002727970015257597 -0.004996399860829115
-5119 -0.101173996925354 0.001684430055320263 -0.004310640040785074
-5120 -0.1016630008816719 0.006239550188183784 -0.003568350104615092
-5121 -0.1014880016446114 0.008674999698996544 -0.002891669981181622
-5122 -0.1029379963874817 0.006756430026143789 -0.002252140082418919
-5123 -0.1041560024023056 0.005985530093312263 -0.000893443007953465
-5124 -0.09989819675683975 0.01471630018204451 -0.001314410008490086
-5125 -0.09989819675683975 0.01077309995889664 -0.003591019893065095
-5126 -0.1047040000557899 0.003093079896643758 -0.001031029969453812
-5127 -0.1039540022611618 0.00697069987654686 -0.0007944750250317156
-5128 -0.1023819968104362 0.01062010042369366 -0.001240620040334761
-$EndNodes
-$Elements
-10252
-1 2 2 0 1 1297 1301 1
-2 2 2 0 1 35 4 33
-3 2 2 0 1 1297 2 1296
-4 2 2 0 1 1 2 1297
-5 2 2 0 1 1296 3 5
-6 2 2 0 1 2 3 1296
-7 2 2 0 1 6 35 34
-8 2 2 0 1 5 6 34
-9 2 2 0 1 35 6 4
-10 2 2 0 1 3 6 5
-11 2 2 0 1 3 4 6
-12 2 2 0 1 1 1301 2606
-13 2 2 0 1 7 2603 2602
-14 2 2 0 1 2604 3 2
-15 2 2 0 1 2604 2608 3
-16 2 2 0 1 2606 2 1
-17 2 2 0 1 2604 2 2606
-18 2 2 0 1 3 2603 4
-19 2 2 0 1 3 2608 2603
-20 2 2 0 1 7 4 2603
-21 2 2 0 1 33 4 7
-22 2 2 0 1 26 15 8
-23 2 2 0 1 55 9 26
-24 2 2 0 1 8 55 26
-25 2 2 0 1 8 37 55
-26 2 2 0 1 10 1324 1349
-27 2 2 0 1 10 43 11
-28 2 2 0 1 19 1330 1324
-29 2 2 0 1 10 19 1324
-30 2 2 0 1 20 11 44
-31 2 2 0 1 11 20 10
-32 2 2 0 1 27 15 26
-33 2 2 0 1 12 21 44
-34 2 2 0 1 21 20 44
-35 2 2 0 1 19 10 20
-36 2 2 0 1 14 13 1330
-37 2 2 0 1 19 14 1330
-38 2 2 0 1 27 22 15
-39 2 2 0 1 13 16 1337
-40 2 2 0 1 13 14 16
-41 2 2 0 1 14 18 16
-42 2 2 0 1 9 17 26
-43 2 2 0 1 54 17 9
-44 2 2 0 1 14 21 18
-45 2 2 0 1 19 20 21
-46 2 2 0 1 21 14 19
-47 2 2 0 1 29 16 18
-48 2 2 0 1 12 18 21
-49 2 2 0 1 46 18 12
-50 2 2 0 1 23 29 18
-51 2 2 0 1 29 23 27
-52 2 2 0 1 46 23 18
-53 2 2 0 1 46 22 23
-54 2 2 0 1 22 27 23
-55 2 2 0 1 27 24 29
-56 2 2 0 1 25 26 17
-57 2 2 0 1 25 24 27
-58 2 2 0 1 26 25 27
-59 2 2 0 1 28 1337 16
-60 2 2 0 1 1337 28 1340
-61 2 2 0 1 29 28 16
-62 2 2 0 1 29 24 28
-63 2 2 0 1 1342 1340 30
-64 2 2 0 1 28 30 1340
-65 2 2 0 1 30 25 17
-66 2 2 0 1 30 24 25
-67 2 2 0 1 24 30 28
-68 2 2 0 1 31 54 32
-69 2 2 0 1 31 1342 30
-70 2 2 0 1 1342 31 32
-71 2 2 0 1 31 17 54
-72 2 2 0 1 30 17 31
-73 2 2 0 1 1349 36 10
-74 2 2 0 1 36 43 10
-75 2 2 0 1 33 43 36
-76 2 2 0 1 35 33 36
-77 2 2 0 1 35 1349 34
-78 2 2 0 1 1349 35 36
-79 2 2 0 1 39 37 8
-80 2 2 0 1 39 50 38
-81 2 2 0 1 50 53 38
-82 2 2 0 1 38 37 39
-83 2 2 0 1 50 41 51
-84 2 2 0 1 50 39 41
-85 2 2 0 1 41 39 8
-86 2 2 0 1 15 41 8
-87 2 2 0 1 40 15 22
-88 2 2 0 1 15 40 41
-89 2 2 0 1 51 41 40
-90 2 2 0 1 33 42 43
-91 2 2 0 1 7 42 33
-92 2 2 0 1 43 47 11
-93 2 2 0 1 43 42 47
-94 2 2 0 1 11 48 44
-95 2 2 0 1 11 47 48
-96 2 2 0 1 44 45 12
-97 2 2 0 1 44 48 45
-98 2 2 0 1 12 49 46
-99 2 2 0 1 12 45 49
-100 2 2 0 1 46 40 22
-101 2 2 0 1 46 49 40
-102 2 2 0 1 42 2602 2622
-103 2 2 0 1 7 2602 42
-104 2 2 0 1 2622 47 42
-105 2 2 0 1 2622 2624 47
-106 2 2 0 1 2624 48 47
-107 2 2 0 1 2624 2625 48
-108 2 2 0 1 2625 45 48
-109 2 2 0 1 2625 2627 45
-110 2 2 0 1 2627 49 45
-111 2 2 0 1 2627 2630 49
-112 2 2 0 1 2630 40 49
-113 2 2 0 1 2630 2628 40
-114 2 2 0 1 2628 51 40
-115 2 2 0 1 2628 2632 51
-116 2 2 0 1 2632 50 51
-117 2 2 0 1 2632 52 50
-118 2 2 0 1 52 53 50
-119 2 2 0 1 52 207 53
-120 2 2 0 1 9 61 54
-121 2 2 0 1 56 55 37
-122 2 2 0 1 188 56 37
-123 2 2 0 1 98 59 57
-124 2 2 0 1 146 62 63
-125 2 2 0 1 58 97 59
-126 2 2 0 1 60 63 62
-127 2 2 0 1 61 60 62
-128 2 2 0 1 97 357 362
-129 2 2 0 1 139 75 1496
-130 2 2 0 1 60 61 9
-131 2 2 0 1 60 56 63
-132 2 2 0 1 55 56 60
-133 2 2 0 1 9 55 60
-134 2 2 0 1 1482 64 69
-135 2 2 0 1 177 101 176
-136 2 2 0 1 117 65 74
-137 2 2 0 1 65 117 83
-138 2 2 0 1 357 133 310
-139 2 2 0 1 66 79 115
-140 2 2 0 1 79 66 67
-141 2 2 0 1 68 1435 69
-142 2 2 0 1 64 68 69
-143 2 2 0 1 70 58 71
-144 2 2 0 1 80 70 71
-145 2 2 0 1 179 72 78
-146 2 2 0 1 66 73 67
-147 2 2 0 1 78 77 199
-148 2 2 0 1 71 82 80
-149 2 2 0 1 135 104 74
-150 2 2 0 1 199 113 130
-151 2 2 0 1 112 75 139
-152 2 2 0 1 95 112 139
-153 2 2 0 1 153 85 76
-154 2 2 0 1 102 98 376
-155 2 2 0 1 1435 102 376
-156 2 2 0 1 72 77 78
-157 2 2 0 1 77 113 199
-158 2 2 0 1 82 79 80
-159 2 2 0 1 115 79 82
-160 2 2 0 1 79 132 80
-161 2 2 0 1 79 67 132
-162 2 2 0 1 135 65 81
-163 2 2 0 1 74 65 135
-164 2 2 0 1 157 82 71
-165 2 2 0 1 83 76 89
-166 2 2 0 1 89 84 88
-167 2 2 0 1 84 89 76
-168 2 2 0 1 84 85 87
-169 2 2 0 1 84 76 85
-170 2 2 0 1 88 86 92
-171 2 2 0 1 86 88 84
-172 2 2 0 1 86 87 96
-173 2 2 0 1 84 87 86
-174 2 2 0 1 88 114 89
-175 2 2 0 1 90 89 114
-176 2 2 0 1 109 172 173
-177 2 2 0 1 104 135 109
-178 2 2 0 1 89 91 83
-179 2 2 0 1 89 90 91
-180 2 2 0 1 94 88 92
-181 2 2 0 1 94 93 114
-182 2 2 0 1 93 94 127
-183 2 2 0 1 114 88 94
-184 2 2 0 1 112 1451 75
-185 2 2 0 1 112 95 99
-186 2 2 0 1 92 86 141
-187 2 2 0 1 99 141 96
-188 2 2 0 1 86 96 141
-189 2 2 0 1 83 91 65
-190 2 2 0 1 91 81 65
-191 2 2 0 1 72 135 81
-192 2 2 0 1 132 70 80
-193 2 2 0 1 70 97 58
-194 2 2 0 1 97 133 357
-195 2 2 0 1 97 70 133
-196 2 2 0 1 133 70 132
-197 2 2 0 1 1435 68 102
-198 2 2 0 1 102 59 98
-199 2 2 0 1 143 67 73
-200 2 2 0 1 66 100 101
-201 2 2 0 1 115 100 66
-202 2 2 0 1 362 57 97
-203 2 2 0 1 57 59 97
-204 2 2 0 1 106 71 58
-205 2 2 0 1 106 157 71
-206 2 2 0 1 106 64 118
-207 2 2 0 1 106 118 157
-208 2 2 0 1 95 141 99
-209 2 2 0 1 101 73 66
-210 2 2 0 1 137 136 222
-211 2 2 0 1 103 176 101
-212 2 2 0 1 100 103 101
-213 2 2 0 1 102 107 59
-214 2 2 0 1 107 102 68
-215 2 2 0 1 105 73 101
-216 2 2 0 1 177 105 101
-217 2 2 0 1 115 116 100
-218 2 2 0 1 143 131 67
-219 2 2 0 1 103 104 109
-220 2 2 0 1 100 104 103
-221 2 2 0 1 108 105 177
-222 2 2 0 1 107 58 59
-223 2 2 0 1 106 58 107
-224 2 2 0 1 64 107 68
-225 2 2 0 1 64 106 107
-226 2 2 0 1 104 116 74
-227 2 2 0 1 104 100 116
-228 2 2 0 1 111 105 108
-229 2 2 0 1 173 176 103
-230 2 2 0 1 109 173 103
-231 2 2 0 1 110 200 127
-232 2 2 0 1 200 110 122
-233 2 2 0 1 111 143 73
-234 2 2 0 1 111 73 105
-235 2 2 0 1 99 1451 112
-236 2 2 0 1 93 113 90
-237 2 2 0 1 90 114 93
-238 2 2 0 1 77 90 113
-239 2 2 0 1 82 116 115
-240 2 2 0 1 117 74 116
-241 2 2 0 1 158 116 82
-242 2 2 0 1 116 158 117
-243 2 2 0 1 123 124 1482
-244 2 2 0 1 156 83 117
-245 2 2 0 1 83 156 76
-246 2 2 0 1 188 119 56
-247 2 2 0 1 119 63 56
-248 2 2 0 1 54 129 32
-249 2 2 0 1 129 128 32
-250 2 2 0 1 124 64 1482
-251 2 2 0 1 118 64 124
-252 2 2 0 1 61 129 54
-253 2 2 0 1 119 188 121
-254 2 2 0 1 120 151 1515
-255 2 2 0 1 120 85 153
-256 2 2 0 1 110 121 122
-257 2 2 0 1 137 149 142
-258 2 2 0 1 111 142 143
-259 2 2 0 1 1491 125 123
-260 2 2 0 1 124 123 125
-261 2 2 0 1 118 124 125
-262 2 2 0 1 146 110 126
-263 2 2 0 1 126 94 92
-264 2 2 0 1 127 126 110
-265 2 2 0 1 94 126 127
-266 2 2 0 1 129 1496 128
-267 2 2 0 1 62 129 61
-268 2 2 0 1 1496 129 139
-269 2 2 0 1 62 139 129
-270 2 2 0 1 1451 99 1508
-271 2 2 0 1 127 130 93
-272 2 2 0 1 127 200 130
-273 2 2 0 1 113 93 130
-274 2 2 0 1 72 81 91
-275 2 2 0 1 72 91 77
-276 2 2 0 1 90 77 91
-277 2 2 0 1 133 131 310
-278 2 2 0 1 131 150 310
-279 2 2 0 1 131 132 67
-280 2 2 0 1 132 131 133
-281 2 2 0 1 152 134 1515
-282 2 2 0 1 87 134 96
-283 2 2 0 1 172 109 135
-284 2 2 0 1 72 172 135
-285 2 2 0 1 72 179 172
-286 2 2 0 1 147 136 137
-287 2 2 0 1 147 142 111
-288 2 2 0 1 142 147 137
-289 2 2 0 1 62 138 139
-290 2 2 0 1 138 62 146
-291 2 2 0 1 138 95 139
-292 2 2 0 1 140 1508 99
-293 2 2 0 1 96 140 99
-294 2 2 0 1 95 148 141
-295 2 2 0 1 126 148 146
-296 2 2 0 1 144 131 143
-297 2 2 0 1 142 144 143
-298 2 2 0 1 131 144 150
-299 2 2 0 1 155 120 153
-300 2 2 0 1 120 145 85
-301 2 2 0 1 134 145 1515
-302 2 2 0 1 145 120 1515
-303 2 2 0 1 148 138 146
-304 2 2 0 1 95 138 148
-305 2 2 0 1 147 108 136
-306 2 2 0 1 111 108 147
-307 2 2 0 1 145 87 85
-308 2 2 0 1 134 87 145
-309 2 2 0 1 148 92 141
-310 2 2 0 1 126 92 148
-311 2 2 0 1 144 149 150
-312 2 2 0 1 142 149 144
-313 2 2 0 1 155 1491 151
-314 2 2 0 1 1491 155 125
-315 2 2 0 1 120 155 151
-316 2 2 0 1 140 152 1508
-317 2 2 0 1 152 140 134
-318 2 2 0 1 140 96 134
-319 2 2 0 1 154 155 153
-320 2 2 0 1 154 125 155
-321 2 2 0 1 154 157 118
-322 2 2 0 1 154 118 125
-323 2 2 0 1 63 119 146
-324 2 2 0 1 119 110 146
-325 2 2 0 1 110 119 121
-326 2 2 0 1 153 76 156
-327 2 2 0 1 156 154 153
-328 2 2 0 1 157 158 82
-329 2 2 0 1 157 154 158
-330 2 2 0 1 156 117 158
-331 2 2 0 1 158 154 156
-332 2 2 0 1 37 38 188
-333 2 2 0 1 182 163 210
-334 2 2 0 1 159 455 222
-335 2 2 0 1 136 159 222
-336 2 2 0 1 161 160 162
-337 2 2 0 1 160 161 183
-338 2 2 0 1 210 162 160
-339 2 2 0 1 162 210 163
-340 2 2 0 1 159 168 455
-341 2 2 0 1 166 420 419
-342 2 2 0 1 164 165 185
-343 2 2 0 1 121 192 122
-344 2 2 0 1 166 167 216
-345 2 2 0 1 169 419 168
-346 2 2 0 1 419 169 166
-347 2 2 0 1 164 167 169
-348 2 2 0 1 167 166 169
-349 2 2 0 1 170 177 176
-350 2 2 0 1 177 170 171
-351 2 2 0 1 185 170 181
-352 2 2 0 1 185 171 170
-353 2 2 0 1 175 173 172
-354 2 2 0 1 174 173 175
-355 2 2 0 1 175 162 163
-356 2 2 0 1 163 174 175
-357 2 2 0 1 174 176 173
-358 2 2 0 1 170 176 174
-359 2 2 0 1 174 163 181
-360 2 2 0 1 181 170 174
-361 2 2 0 1 171 108 177
-362 2 2 0 1 171 185 165
-363 2 2 0 1 178 172 179
-364 2 2 0 1 175 172 178
-365 2 2 0 1 178 161 162
-366 2 2 0 1 162 175 178
-367 2 2 0 1 180 179 78
-368 2 2 0 1 178 179 180
-369 2 2 0 1 188 191 121
-370 2 2 0 1 182 181 163
-371 2 2 0 1 211 181 182
-372 2 2 0 1 191 192 121
-373 2 2 0 1 164 216 167
-374 2 2 0 1 183 194 184
-375 2 2 0 1 194 183 161
-376 2 2 0 1 178 194 161
-377 2 2 0 1 180 194 178
-378 2 2 0 1 213 164 185
-379 2 2 0 1 213 216 164
-380 2 2 0 1 184 204 203
-381 2 2 0 1 194 204 184
-382 2 2 0 1 164 186 165
-383 2 2 0 1 186 159 165
-384 2 2 0 1 186 164 169
-385 2 2 0 1 185 211 213
-386 2 2 0 1 211 185 181
-387 2 2 0 1 190 209 191
-388 2 2 0 1 209 192 191
-389 2 2 0 1 187 38 53
-390 2 2 0 1 187 191 188
-391 2 2 0 1 38 187 188
-392 2 2 0 1 189 136 108
-393 2 2 0 1 189 165 159
-394 2 2 0 1 136 189 159
-395 2 2 0 1 171 189 108
-396 2 2 0 1 171 165 189
-397 2 2 0 1 190 187 53
-398 2 2 0 1 190 191 187
-399 2 2 0 1 193 192 209
-400 2 2 0 1 192 193 196
-401 2 2 0 1 195 78 199
-402 2 2 0 1 204 194 195
-403 2 2 0 1 78 195 180
-404 2 2 0 1 195 194 180
-405 2 2 0 1 196 193 198
-406 2 2 0 1 196 198 205
-407 2 2 0 1 122 197 200
-408 2 2 0 1 196 197 192
-409 2 2 0 1 197 122 192
-410 2 2 0 1 186 168 159
-411 2 2 0 1 169 168 186
-412 2 2 0 1 203 205 198
-413 2 2 0 1 130 202 199
-414 2 2 0 1 200 201 130
-415 2 2 0 1 201 200 197
-416 2 2 0 1 202 195 199
-417 2 2 0 1 201 196 205
-418 2 2 0 1 197 196 201
-419 2 2 0 1 201 202 130
-420 2 2 0 1 205 202 201
-421 2 2 0 1 204 195 202
-422 2 2 0 1 205 203 204
-423 2 2 0 1 204 202 205
-424 2 2 0 1 206 160 183
-425 2 2 0 1 2719 160 206
-426 2 2 0 1 190 207 2722
-427 2 2 0 1 53 207 190
-428 2 2 0 1 208 184 203
-429 2 2 0 1 208 2714 184
-430 2 2 0 1 2715 203 198
-431 2 2 0 1 208 203 2715
-432 2 2 0 1 2716 198 193
-433 2 2 0 1 2715 198 2716
-434 2 2 0 1 2721 193 209
-435 2 2 0 1 2721 2716 193
-436 2 2 0 1 2722 209 190
-437 2 2 0 1 2721 209 2722
-438 2 2 0 1 2714 183 184
-439 2 2 0 1 2714 206 183
-440 2 2 0 1 182 210 2723
-441 2 2 0 1 2723 2724 182
-442 2 2 0 1 2719 210 160
-443 2 2 0 1 2719 2723 210
-444 2 2 0 1 2724 211 182
-445 2 2 0 1 2724 212 211
-446 2 2 0 1 212 213 211
-447 2 2 0 1 212 214 213
-448 2 2 0 1 214 216 213
-449 2 2 0 1 214 215 216
-450 2 2 0 1 215 166 216
-451 2 2 0 1 215 217 166
-452 2 2 0 1 490 217 3558
-453 2 2 0 1 490 166 217
-454 2 2 0 1 420 166 490
-455 2 2 0 1 231 218 219
-456 2 2 0 1 238 229 219
-457 2 2 0 1 316 300 220
-458 2 2 0 1 219 230 231
-459 2 2 0 1 315 232 1528
-460 2 2 0 1 319 232 315
-461 2 2 0 1 380 98 57
-462 2 2 0 1 273 296 270
-463 2 2 0 1 221 137 222
-464 2 2 0 1 418 221 222
-465 2 2 0 1 149 293 150
-466 2 2 0 1 228 224 449
-467 2 2 0 1 223 224 229
-468 2 2 0 1 223 225 224
-469 2 2 0 1 225 449 224
-470 2 2 0 1 229 251 223
-471 2 2 0 1 225 226 449
-472 2 2 0 1 227 418 366
-473 2 2 0 1 221 418 227
-474 2 2 0 1 270 323 227
-475 2 2 0 1 227 323 221
-476 2 2 0 1 270 227 273
-477 2 2 0 1 230 228 454
-478 2 2 0 1 224 228 230
-479 2 2 0 1 230 219 229
-480 2 2 0 1 229 224 230
-481 2 2 0 1 238 218 320
-482 2 2 0 1 219 218 238
-483 2 2 0 1 231 454 541
-484 2 2 0 1 231 230 454
-485 2 2 0 1 649 319 317
-486 2 2 0 1 649 232 319
-487 2 2 0 1 335 235 233
-488 2 2 0 1 359 277 335
-489 2 2 0 1 233 359 335
-490 2 2 0 1 234 233 235
-491 2 2 0 1 370 338 234
-492 2 2 0 1 235 370 234
-493 2 2 0 1 278 236 275
-494 2 2 0 1 256 303 278
-495 2 2 0 1 307 236 278
-496 2 2 0 1 242 348 246
-497 2 2 0 1 347 342 245
-498 2 2 0 1 257 279 237
-499 2 2 0 1 279 257 299
-500 2 2 0 1 239 229 238
-501 2 2 0 1 229 239 251
-502 2 2 0 1 276 242 246
-503 2 2 0 1 341 244 245
-504 2 2 0 1 247 240 299
-505 2 2 0 1 282 249 240
-506 2 2 0 1 338 241 234
-507 2 2 0 1 242 241 348
-508 2 2 0 1 277 243 335
-509 2 2 0 1 342 243 245
-510 2 2 0 1 244 287 245
-511 2 2 0 1 236 372 275
-512 2 2 0 1 263 298 246
-513 2 2 0 1 288 261 237
-514 2 2 0 1 247 248 240
-515 2 2 0 1 284 249 282
-516 2 2 0 1 345 277 359
-517 2 2 0 1 250 257 237
-518 2 2 0 1 250 251 239
-519 2 2 0 1 257 250 239
-520 2 2 0 1 354 252 275
-521 2 2 0 1 351 253 296
-522 2 2 0 1 281 242 276
-523 2 2 0 1 247 334 248
-524 2 2 0 1 254 255 539
-525 2 2 0 1 254 247 299
-526 2 2 0 1 256 290 284
-527 2 2 0 1 290 256 252
-528 2 2 0 1 258 257 239
-529 2 2 0 1 238 258 239
-530 2 2 0 1 257 258 326
-531 2 2 0 1 313 259 264
-532 2 2 0 1 266 313 264
-533 2 2 0 1 259 313 312
-534 2 2 0 1 261 260 276
-535 2 2 0 1 260 261 288
-536 2 2 0 1 262 263 246
-537 2 2 0 1 264 265 266
-538 2 2 0 1 364 308 325
-539 2 2 0 1 337 338 370
-540 2 2 0 1 256 302 303
-541 2 2 0 1 283 302 282
-542 2 2 0 1 223 274 225
-543 2 2 0 1 354 294 252
-544 2 2 0 1 346 266 265
-545 2 2 0 1 266 346 361
-546 2 2 0 1 292 309 375
-547 2 2 0 1 267 292 375
-548 2 2 0 1 244 286 287
-549 2 2 0 1 333 268 539
-550 2 2 0 1 247 268 334
-551 2 2 0 1 268 333 334
-552 2 2 0 1 283 289 300
-553 2 2 0 1 289 220 300
-554 2 2 0 1 289 283 248
-555 2 2 0 1 314 259 312
-556 2 2 0 1 259 314 295
-557 2 2 0 1 249 269 288
-558 2 2 0 1 269 249 284
-559 2 2 0 1 270 324 323
-560 2 2 0 1 324 270 295
-561 2 2 0 1 261 271 237
-562 2 2 0 1 271 261 298
-563 2 2 0 1 272 296 273
-564 2 2 0 1 280 342 347
-565 2 2 0 1 268 254 539
-566 2 2 0 1 247 254 268
-567 2 2 0 1 297 274 263
-568 2 2 0 1 225 274 297
-569 2 2 0 1 278 252 256
-570 2 2 0 1 278 275 252
-571 2 2 0 1 276 298 261
-572 2 2 0 1 276 246 298
-573 2 2 0 1 246 348 262
-574 2 2 0 1 347 245 287
-575 2 2 0 1 341 243 277
-576 2 2 0 1 341 245 243
-577 2 2 0 1 307 303 308
-578 2 2 0 1 278 303 307
-579 2 2 0 1 294 281 291
-580 2 2 0 1 279 240 249
-581 2 2 0 1 279 299 240
-582 2 2 0 1 288 279 249
-583 2 2 0 1 237 279 288
-584 2 2 0 1 250 271 251
-585 2 2 0 1 250 237 271
-586 2 2 0 1 340 241 338
-587 2 2 0 1 348 241 340
-588 2 2 0 1 280 265 264
-589 2 2 0 1 347 265 280
-590 2 2 0 1 281 260 291
-591 2 2 0 1 281 276 260
-592 2 2 0 1 262 297 263
-593 2 2 0 1 282 248 283
-594 2 2 0 1 282 240 248
-595 2 2 0 1 284 302 256
-596 2 2 0 1 284 282 302
-597 2 2 0 1 285 286 267
-598 2 2 0 1 287 286 285
-599 2 2 0 1 260 269 291
-600 2 2 0 1 260 288 269
-601 2 2 0 1 289 334 220
-602 2 2 0 1 248 334 289
-603 2 2 0 1 269 290 291
-604 2 2 0 1 284 290 269
-605 2 2 0 1 290 294 291
-606 2 2 0 1 290 252 294
-607 2 2 0 1 286 292 267
-608 2 2 0 1 324 314 293
-609 2 2 0 1 295 314 324
-610 2 2 0 1 316 301 300
-611 2 2 0 1 325 308 301
-612 2 2 0 1 294 354 353
-613 2 2 0 1 242 281 353
-614 2 2 0 1 353 281 294
-615 2 2 0 1 369 354 275
-616 2 2 0 1 259 295 253
-617 2 2 0 1 295 296 253
-618 2 2 0 1 296 295 270
-619 2 2 0 1 370 321 337
-620 2 2 0 1 377 226 297
-621 2 2 0 1 226 225 297
-622 2 2 0 1 263 274 298
-623 2 2 0 1 251 274 223
-624 2 2 0 1 271 274 251
-625 2 2 0 1 298 274 271
-626 2 2 0 1 359 369 345
-627 2 2 0 1 255 326 605
-628 2 2 0 1 254 326 255
-629 2 2 0 1 257 326 299
-630 2 2 0 1 299 326 254
-631 2 2 0 1 301 283 300
-632 2 2 0 1 301 302 283
-633 2 2 0 1 301 308 303
-634 2 2 0 1 301 303 302
-635 2 2 0 1 409 304 427
-636 2 2 0 1 305 364 306
-637 2 2 0 1 364 307 308
-638 2 2 0 1 309 352 1619
-639 2 2 0 1 309 292 352
-640 2 2 0 1 286 244 352
-641 2 2 0 1 352 292 286
-642 2 2 0 1 310 311 357
-643 2 2 0 1 311 310 312
-644 2 2 0 1 311 313 266
-645 2 2 0 1 312 313 311
-646 2 2 0 1 310 150 312
-647 2 2 0 1 314 150 293
-648 2 2 0 1 312 150 314
-649 2 2 0 1 319 315 316
-650 2 2 0 1 316 322 319
-651 2 2 0 1 317 319 318
-652 2 2 0 1 322 318 319
-653 2 2 0 1 320 258 238
-654 2 2 0 1 315 1528 325
-655 2 2 0 1 272 351 296
-656 2 2 0 1 351 272 321
-657 2 2 0 1 272 387 321
-658 2 2 0 1 318 322 332
-659 2 2 0 1 220 322 316
-660 2 2 0 1 322 220 332
-661 2 2 0 1 253 264 259
-662 2 2 0 1 253 280 264
-663 2 2 0 1 285 380 361
-664 2 2 0 1 380 285 267
-665 2 2 0 1 285 361 346
-666 2 2 0 1 323 149 137
-667 2 2 0 1 137 221 323
-668 2 2 0 1 149 323 293
-669 2 2 0 1 323 324 293
-670 2 2 0 1 325 316 315
-671 2 2 0 1 301 316 325
-672 2 2 0 1 605 258 320
-673 2 2 0 1 605 326 258
-674 2 2 0 1 306 325 1528
-675 2 2 0 1 306 364 325
-676 2 2 0 1 382 1685 1637
-677 2 2 0 1 344 329 1637
-678 2 2 0 1 349 304 409
-679 2 2 0 1 328 327 345
-680 2 2 0 1 327 328 329
-681 2 2 0 1 330 233 234
-682 2 2 0 1 331 333 332
-683 2 2 0 1 331 220 334
-684 2 2 0 1 220 331 332
-685 2 2 0 1 333 331 334
-686 2 2 0 1 307 383 236
-687 2 2 0 1 253 350 280
-688 2 2 0 1 350 253 351
-689 2 2 0 1 277 374 341
-690 2 2 0 1 343 243 342
-691 2 2 0 1 243 343 335
-692 2 2 0 1 353 336 242
-693 2 2 0 1 241 336 234
-694 2 2 0 1 336 241 242
-695 2 2 0 1 367 235 335
-696 2 2 0 1 337 339 338
-697 2 2 0 1 329 382 1637
-698 2 2 0 1 328 382 329
-699 2 2 0 1 339 340 338
-700 2 2 0 1 304 340 339
-701 2 2 0 1 355 341 374
-702 2 2 0 1 280 343 342
-703 2 2 0 1 343 367 335
-704 2 2 0 1 336 330 234
-705 2 2 0 1 353 330 336
-706 2 2 0 1 355 244 341
-707 2 2 0 1 352 244 355
-708 2 2 0 1 373 344 356
-709 2 2 0 1 344 373 329
-710 2 2 0 1 329 373 327
-711 2 2 0 1 374 345 327
-712 2 2 0 1 345 374 277
-713 2 2 0 1 346 265 347
-714 2 2 0 1 347 287 346
-715 2 2 0 1 285 346 287
-716 2 2 0 1 382 328 372
-717 2 2 0 1 340 349 348
-718 2 2 0 1 262 348 349
-719 2 2 0 1 349 340 304
-720 2 2 0 1 367 350 351
-721 2 2 0 1 1619 352 355
-722 2 2 0 1 353 354 330
-723 2 2 0 1 355 356 1619
-724 2 2 0 1 373 356 355
-725 2 2 0 1 365 383 307
-726 2 2 0 1 364 365 307
-727 2 2 0 1 360 357 311
-728 2 2 0 1 372 358 275
-729 2 2 0 1 358 369 275
-730 2 2 0 1 321 371 351
-731 2 2 0 1 371 367 351
-732 2 2 0 1 233 368 359
-733 2 2 0 1 368 369 359
-734 2 2 0 1 360 266 361
-735 2 2 0 1 311 266 360
-736 2 2 0 1 360 362 357
-737 2 2 0 1 360 361 362
-738 2 2 0 1 305 363 365
-739 2 2 0 1 364 305 365
-740 2 2 0 1 366 385 273
-741 2 2 0 1 227 366 273
-742 2 2 0 1 280 350 343
-743 2 2 0 1 343 350 367
-744 2 2 0 1 369 368 354
-745 2 2 0 1 330 368 233
-746 2 2 0 1 368 330 354
-747 2 2 0 1 408 349 409
-748 2 2 0 1 358 372 328
-749 2 2 0 1 345 358 328
-750 2 2 0 1 345 369 358
-751 2 2 0 1 235 371 370
-752 2 2 0 1 371 235 367
-753 2 2 0 1 371 321 370
-754 2 2 0 1 383 372 236
-755 2 2 0 1 372 383 382
-756 2 2 0 1 355 374 373
-757 2 2 0 1 373 374 327
-758 2 2 0 1 375 1676 267
-759 2 2 0 1 337 321 387
-760 2 2 0 1 408 378 349
-761 2 2 0 1 378 262 349
-762 2 2 0 1 98 379 376
-763 2 2 0 1 379 1676 376
-764 2 2 0 1 377 378 408
-765 2 2 0 1 378 377 297
-766 2 2 0 1 262 378 297
-767 2 2 0 1 1676 379 267
-768 2 2 0 1 379 380 267
-769 2 2 0 1 380 379 98
-770 2 2 0 1 57 362 361
-771 2 2 0 1 380 57 361
-772 2 2 0 1 381 1685 382
-773 2 2 0 1 383 381 382
-774 2 2 0 1 1685 381 363
-775 2 2 0 1 384 387 272
-776 2 2 0 1 273 384 272
-777 2 2 0 1 381 365 363
-778 2 2 0 1 383 365 381
-779 2 2 0 1 385 384 273
-780 2 2 0 1 434 384 385
-781 2 2 0 1 428 386 434
-782 2 2 0 1 386 384 434
-783 2 2 0 1 387 384 386
-784 2 2 0 1 427 386 428
-785 2 2 0 1 304 386 427
-786 2 2 0 1 304 339 386
-787 2 2 0 1 386 339 337
-788 2 2 0 1 386 337 387
-789 2 2 0 1 459 661 394
-790 2 2 0 1 388 389 440
-791 2 2 0 1 391 390 422
-792 2 2 0 1 421 391 422
-793 2 2 0 1 393 459 394
-794 2 2 0 1 392 394 713
-795 2 2 0 1 392 416 393
-796 2 2 0 1 394 392 393
-797 2 2 0 1 399 395 478
-798 2 2 0 1 416 446 445
-799 2 2 0 1 395 421 478
-800 2 2 0 1 391 421 395
-801 2 2 0 1 400 390 391
-802 2 2 0 1 415 417 461
-803 2 2 0 1 395 400 391
-804 2 2 0 1 397 396 404
-805 2 2 0 1 401 396 397
-806 2 2 0 1 397 405 398
-807 2 2 0 1 398 401 397
-808 2 2 0 1 401 399 396
-809 2 2 0 1 395 399 401
-810 2 2 0 1 398 400 401
-811 2 2 0 1 395 401 400
-812 2 2 0 1 402 398 405
-813 2 2 0 1 425 398 402
-814 2 2 0 1 403 404 470
-815 2 2 0 1 397 404 403
-816 2 2 0 1 403 431 405
-817 2 2 0 1 405 397 403
-818 2 2 0 1 402 405 432
-819 2 2 0 1 406 470 469
-820 2 2 0 1 403 470 406
-821 2 2 0 1 406 411 431
-822 2 2 0 1 431 403 406
-823 2 2 0 1 442 469 435
-824 2 2 0 1 406 469 442
-825 2 2 0 1 442 440 411
-826 2 2 0 1 411 406 442
-827 2 2 0 1 377 407 226
-828 2 2 0 1 389 388 444
-829 2 2 0 1 444 407 389
-830 2 2 0 1 412 408 409
-831 2 2 0 1 412 440 389
-832 2 2 0 1 410 409 427
-833 2 2 0 1 412 409 410
-834 2 2 0 1 410 411 440
-835 2 2 0 1 440 412 410
-836 2 2 0 1 400 398 425
-837 2 2 0 1 425 390 400
-838 2 2 0 1 462 443 413
-839 2 2 0 1 462 437 443
-840 2 2 0 1 461 437 462
-841 2 2 0 1 437 461 417
-842 2 2 0 1 453 437 417
-843 2 2 0 1 228 447 454
-844 2 2 0 1 447 414 445
-845 2 2 0 1 393 415 459
-846 2 2 0 1 415 393 417
-847 2 2 0 1 393 416 417
-848 2 2 0 1 429 366 418
-849 2 2 0 1 429 422 390
-850 2 2 0 1 714 446 713
-851 2 2 0 1 446 416 392
-852 2 2 0 1 446 392 713
-853 2 2 0 1 419 420 421
-854 2 2 0 1 420 478 421
-855 2 2 0 1 419 422 168
-856 2 2 0 1 419 421 422
-857 2 2 0 1 423 428 434
-858 2 2 0 1 423 402 432
-859 2 2 0 1 385 424 434
-860 2 2 0 1 402 424 425
-861 2 2 0 1 452 414 450
-862 2 2 0 1 449 451 228
-863 2 2 0 1 414 451 450
-864 2 2 0 1 366 430 385
-865 2 2 0 1 425 430 390
-866 2 2 0 1 439 408 412
-867 2 2 0 1 389 439 412
-868 2 2 0 1 438 444 443
-869 2 2 0 1 411 433 431
-870 2 2 0 1 433 411 410
-871 2 2 0 1 441 442 435
-872 2 2 0 1 426 444 388
-873 2 2 0 1 436 427 428
-874 2 2 0 1 427 436 410
-875 2 2 0 1 429 430 366
-876 2 2 0 1 429 390 430
-877 2 2 0 1 423 436 428
-878 2 2 0 1 423 432 436
-879 2 2 0 1 433 405 431
-880 2 2 0 1 432 405 433
-881 2 2 0 1 424 423 434
-882 2 2 0 1 402 423 424
-883 2 2 0 1 430 424 385
-884 2 2 0 1 425 424 430
-885 2 2 0 1 481 441 435
-886 2 2 0 1 436 433 410
-887 2 2 0 1 432 433 436
-888 2 2 0 1 438 437 453
-889 2 2 0 1 443 437 438
-890 2 2 0 1 439 377 408
-891 2 2 0 1 377 439 407
-892 2 2 0 1 439 389 407
-893 2 2 0 1 440 441 388
-894 2 2 0 1 441 440 442
-895 2 2 0 1 443 426 413
-896 2 2 0 1 426 443 444
-897 2 2 0 1 426 481 413
-898 2 2 0 1 444 438 407
-899 2 2 0 1 438 450 407
-900 2 2 0 1 457 458 714
-901 2 2 0 1 446 714 458
-902 2 2 0 1 447 445 458
-903 2 2 0 1 446 458 445
-904 2 2 0 1 452 438 453
-905 2 2 0 1 452 450 438
-906 2 2 0 1 451 447 228
-907 2 2 0 1 414 447 451
-908 2 2 0 1 226 448 449
-909 2 2 0 1 450 448 407
-910 2 2 0 1 448 226 407
-911 2 2 0 1 448 451 449
-912 2 2 0 1 450 451 448
-913 2 2 0 1 441 481 426
-914 2 2 0 1 441 426 388
-915 2 2 0 1 445 452 416
-916 2 2 0 1 452 417 416
-917 2 2 0 1 417 452 453
-918 2 2 0 1 452 445 414
-919 2 2 0 1 454 447 458
-920 2 2 0 1 456 429 418
-921 2 2 0 1 456 222 455
-922 2 2 0 1 418 222 456
-923 2 2 0 1 456 422 429
-924 2 2 0 1 456 455 168
-925 2 2 0 1 168 422 456
-926 2 2 0 1 454 457 541
-927 2 2 0 1 458 457 454
-928 2 2 0 1 488 459 415
-929 2 2 0 1 488 460 489
-930 2 2 0 1 487 415 461
-931 2 2 0 1 487 463 460
-932 2 2 0 1 484 461 462
-933 2 2 0 1 484 483 463
-934 2 2 0 1 482 462 413
-935 2 2 0 1 482 464 483
-936 2 2 0 1 465 413 481
-937 2 2 0 1 465 467 464
-938 2 2 0 1 466 481 435
-939 2 2 0 1 466 480 467
-940 2 2 0 1 479 435 469
-941 2 2 0 1 479 468 480
-942 2 2 0 1 471 469 470
-943 2 2 0 1 471 473 468
-944 2 2 0 1 472 470 404
-945 2 2 0 1 472 475 473
-946 2 2 0 1 486 404 396
-947 2 2 0 1 486 474 475
-948 2 2 0 1 476 396 399
-949 2 2 0 1 476 485 474
-950 2 2 0 1 477 3557 485
-951 2 2 0 1 477 399 478
-952 2 2 0 1 479 466 435
-953 2 2 0 1 480 466 479
-954 2 2 0 1 466 465 481
-955 2 2 0 1 467 465 466
-956 2 2 0 1 471 479 469
-957 2 2 0 1 468 479 471
-958 2 2 0 1 465 482 413
-959 2 2 0 1 464 482 465
-960 2 2 0 1 482 484 462
-961 2 2 0 1 483 484 482
-962 2 2 0 1 477 476 399
-963 2 2 0 1 485 476 477
-964 2 2 0 1 484 487 461
-965 2 2 0 1 463 487 484
-966 2 2 0 1 472 471 470
-967 2 2 0 1 473 471 472
-968 2 2 0 1 486 472 404
-969 2 2 0 1 475 472 486
-970 2 2 0 1 476 486 396
-971 2 2 0 1 474 486 476
-972 2 2 0 1 487 488 415
-973 2 2 0 1 460 488 487
-974 2 2 0 1 490 478 420
-975 2 2 0 1 756 489 757
-976 2 2 0 1 490 3558 3557
-977 2 2 0 1 756 661 459
-978 2 2 0 1 488 756 459
-979 2 2 0 1 488 489 756
-980 2 2 0 1 490 477 478
-981 2 2 0 1 3557 477 490
-982 2 2 0 1 799 491 702
-983 2 2 0 1 491 689 702
-984 2 2 0 1 589 510 542
-985 2 2 0 1 619 1800 583
-986 2 2 0 1 574 722 575
-987 2 2 0 1 619 492 1800
-988 2 2 0 1 497 320 218
-989 2 2 0 1 497 512 320
-990 2 2 0 1 597 599 592
-991 2 2 0 1 855 542 493
-992 2 2 0 1 494 333 539
-993 2 2 0 1 521 495 519
-994 2 2 0 1 496 505 847
-995 2 2 0 1 231 497 218
-996 2 2 0 1 799 510 491
-997 2 2 0 1 497 574 537
-998 2 2 0 1 1801 492 859
-999 2 2 0 1 1801 1800 492
-1000 2 2 0 1 493 510 799
-1001 2 2 0 1 493 542 510
-1002 2 2 0 1 638 499 568
-1003 2 2 0 1 503 517 498
-1004 2 2 0 1 528 499 638
-1005 2 2 0 1 528 517 503
-1006 2 2 0 1 500 501 562
-1007 2 2 0 1 634 628 552
-1008 2 2 0 1 501 628 562
-1009 2 2 0 1 578 559 610
-1010 2 2 0 1 559 578 579
-1011 2 2 0 1 501 527 502
-1012 2 2 0 1 499 529 585
-1013 2 2 0 1 525 529 503
-1014 2 2 0 1 504 525 503
-1015 2 2 0 1 498 504 503
-1016 2 2 0 1 506 505 496
-1017 2 2 0 1 505 506 642
-1018 2 2 0 1 525 641 563
-1019 2 2 0 1 538 539 255
-1020 2 2 0 1 548 511 509
-1021 2 2 0 1 498 507 504
-1022 2 2 0 1 532 535 540
-1023 2 2 0 1 535 532 536
-1024 2 2 0 1 509 508 548
-1025 2 2 0 1 508 509 552
-1026 2 2 0 1 508 549 548
-1027 2 2 0 1 530 505 642
-1028 2 2 0 1 530 525 504
-1029 2 2 0 1 513 509 511
-1030 2 2 0 1 621 502 527
-1031 2 2 0 1 521 635 495
-1032 2 2 0 1 494 531 540
-1033 2 2 0 1 589 522 510
-1034 2 2 0 1 511 604 513
-1035 2 2 0 1 604 512 513
-1036 2 2 0 1 524 491 510
-1037 2 2 0 1 524 582 523
-1038 2 2 0 1 514 634 552
-1039 2 2 0 1 634 514 565
-1040 2 2 0 1 231 515 497
-1041 2 2 0 1 515 574 497
-1042 2 2 0 1 549 551 502
-1043 2 2 0 1 551 501 502
-1044 2 2 0 1 589 516 517
-1045 2 2 0 1 516 498 517
-1046 2 2 0 1 605 518 255
-1047 2 2 0 1 545 512 497
-1048 2 2 0 1 537 545 497
-1049 2 2 0 1 520 519 859
-1050 2 2 0 1 492 520 859
-1051 2 2 0 1 519 520 521
-1052 2 2 0 1 518 538 255
-1053 2 2 0 1 511 538 518
-1054 2 2 0 1 524 522 582
-1055 2 2 0 1 510 522 524
-1056 2 2 0 1 318 534 317
-1057 2 2 0 1 689 524 523
-1058 2 2 0 1 689 491 524
-1059 2 2 0 1 585 577 499
-1060 2 2 0 1 563 529 525
-1061 2 2 0 1 563 585 529
-1062 2 2 0 1 565 564 634
-1063 2 2 0 1 528 526 517
-1064 2 2 0 1 638 526 528
-1065 2 2 0 1 558 563 641
-1066 2 2 0 1 500 527 501
-1067 2 2 0 1 500 550 527
-1068 2 2 0 1 528 529 499
-1069 2 2 0 1 528 503 529
-1070 2 2 0 1 530 641 525
-1071 2 2 0 1 642 641 530
-1072 2 2 0 1 532 531 502
-1073 2 2 0 1 532 540 531
-1074 2 2 0 1 578 547 546
-1075 2 2 0 1 578 610 547
-1076 2 2 0 1 530 507 505
-1077 2 2 0 1 504 507 530
-1078 2 2 0 1 544 507 498
-1079 2 2 0 1 621 532 502
-1080 2 2 0 1 536 532 621
-1081 2 2 0 1 518 604 511
-1082 2 2 0 1 632 533 567
-1083 2 2 0 1 603 648 723
-1084 2 2 0 1 536 534 535
-1085 2 2 0 1 535 534 318
-1086 2 2 0 1 536 645 534
-1087 2 2 0 1 574 573 537
-1088 2 2 0 1 523 582 697
-1089 2 2 0 1 511 548 538
-1090 2 2 0 1 538 494 539
-1091 2 2 0 1 333 494 540
-1092 2 2 0 1 515 231 541
-1093 2 2 0 1 515 722 574
-1094 2 2 0 1 722 515 541
-1095 2 2 0 1 544 498 516
-1096 2 2 0 1 542 516 589
-1097 2 2 0 1 855 516 542
-1098 2 2 0 1 516 855 543
-1099 2 2 0 1 543 544 516
-1100 2 2 0 1 496 845 506
-1101 2 2 0 1 582 522 581
-1102 2 2 0 1 573 546 537
-1103 2 2 0 1 501 551 628
-1104 2 2 0 1 551 552 628
-1105 2 2 0 1 546 545 537
-1106 2 2 0 1 545 513 512
-1107 2 2 0 1 545 546 547
-1108 2 2 0 1 509 513 547
-1109 2 2 0 1 545 547 513
-1110 2 2 0 1 544 543 847
-1111 2 2 0 1 505 507 847
-1112 2 2 0 1 847 507 544
-1113 2 2 0 1 531 549 502
-1114 2 2 0 1 531 548 549
-1115 2 2 0 1 531 494 538
-1116 2 2 0 1 538 548 531
-1117 2 2 0 1 550 613 657
-1118 2 2 0 1 508 551 549
-1119 2 2 0 1 508 552 551
-1120 2 2 0 1 631 595 553
-1121 2 2 0 1 596 555 593
-1122 2 2 0 1 554 555 553
-1123 2 2 0 1 625 631 553
-1124 2 2 0 1 557 596 593
-1125 2 2 0 1 556 596 557
-1126 2 2 0 1 630 584 558
-1127 2 2 0 1 561 584 593
-1128 2 2 0 1 587 559 579
-1129 2 2 0 1 587 588 647
-1130 2 2 0 1 569 560 647
-1131 2 2 0 1 594 554 553
-1132 2 2 0 1 606 561 593
-1133 2 2 0 1 618 616 500
-1134 2 2 0 1 562 618 500
-1135 2 2 0 1 626 563 558
-1136 2 2 0 1 601 564 565
-1137 2 2 0 1 564 601 600
-1138 2 2 0 1 602 601 565
-1139 2 2 0 1 533 566 567
-1140 2 2 0 1 586 600 577
-1141 2 2 0 1 599 598 579
-1142 2 2 0 1 611 559 560
-1143 2 2 0 1 630 620 557
-1144 2 2 0 1 631 609 595
-1145 2 2 0 1 602 570 568
-1146 2 2 0 1 569 570 560
-1147 2 2 0 1 571 603 614
-1148 2 2 0 1 603 571 644
-1149 2 2 0 1 569 643 570
-1150 2 2 0 1 643 568 570
-1151 2 2 0 1 615 526 638
-1152 2 2 0 1 575 572 574
-1153 2 2 0 1 572 573 574
-1154 2 2 0 1 572 575 592
-1155 2 2 0 1 576 568 499
-1156 2 2 0 1 577 576 499
-1157 2 2 0 1 526 590 517
-1158 2 2 0 1 522 590 581
-1159 2 2 0 1 590 526 581
-1160 2 2 0 1 591 578 546
-1161 2 2 0 1 573 591 546
-1162 2 2 0 1 578 591 579
-1163 2 2 0 1 616 608 500
-1164 2 2 0 1 608 550 500
-1165 2 2 0 1 580 697 582
-1166 2 2 0 1 581 580 582
-1167 2 2 0 1 566 583 567
-1168 2 2 0 1 619 583 566
-1169 2 2 0 1 626 584 561
-1170 2 2 0 1 558 584 626
-1171 2 2 0 1 566 533 620
-1172 2 2 0 1 577 585 586
-1173 2 2 0 1 1955 612 1933
-1174 2 2 0 1 587 598 588
-1175 2 2 0 1 587 579 598
-1176 2 2 0 1 590 589 517
-1177 2 2 0 1 522 589 590
-1178 2 2 0 1 591 599 579
-1179 2 2 0 1 573 599 591
-1180 2 2 0 1 599 572 592
-1181 2 2 0 1 599 573 572
-1182 2 2 0 1 557 584 630
-1183 2 2 0 1 557 593 584
-1184 2 2 0 1 606 555 554
-1185 2 2 0 1 593 555 606
-1186 2 2 0 1 594 595 616
-1187 2 2 0 1 553 595 594
-1188 2 2 0 1 625 555 596
-1189 2 2 0 1 553 555 625
-1190 2 2 0 1 609 612 613
-1191 2 2 0 1 594 607 554
-1192 2 2 0 1 556 624 596
-1193 2 2 0 1 587 560 559
-1194 2 2 0 1 587 647 560
-1195 2 2 0 1 556 620 533
-1196 2 2 0 1 556 557 620
-1197 2 2 0 1 611 570 602
-1198 2 2 0 1 611 560 570
-1199 2 2 0 1 535 332 540
-1200 2 2 0 1 332 535 318
-1201 2 2 0 1 333 540 332
-1202 2 2 0 1 598 597 703
-1203 2 2 0 1 597 598 599
-1204 2 2 0 1 588 598 703
-1205 2 2 0 1 600 576 577
-1206 2 2 0 1 601 576 600
-1207 2 2 0 1 568 576 602
-1208 2 2 0 1 601 602 576
-1209 2 2 0 1 1923 624 1924
-1210 2 2 0 1 625 596 624
-1211 2 2 0 1 580 622 697
-1212 2 2 0 1 580 581 614
-1213 2 2 0 1 536 655 645
-1214 2 2 0 1 603 723 614
-1215 2 2 0 1 644 648 603
-1216 2 2 0 1 569 647 644
-1217 2 2 0 1 604 605 320
-1218 2 2 0 1 518 605 604
-1219 2 2 0 1 512 604 320
-1220 2 2 0 1 626 585 563
-1221 2 2 0 1 606 554 607
-1222 2 2 0 1 608 616 595
-1223 2 2 0 1 608 613 550
-1224 2 2 0 1 608 609 613
-1225 2 2 0 1 608 595 609
-1226 2 2 0 1 559 611 610
-1227 2 2 0 1 611 565 610
-1228 2 2 0 1 565 611 602
-1229 2 2 0 1 509 514 552
-1230 2 2 0 1 509 547 514
-1231 2 2 0 1 514 610 565
-1232 2 2 0 1 514 547 610
-1233 2 2 0 1 612 657 613
-1234 2 2 0 1 495 635 845
-1235 2 2 0 1 845 635 506
-1236 2 2 0 1 581 615 614
-1237 2 2 0 1 615 581 526
-1238 2 2 0 1 614 615 571
-1239 2 2 0 1 594 616 618
-1240 2 2 0 1 617 618 562
-1241 2 2 0 1 617 607 618
-1242 2 2 0 1 594 618 607
-1243 2 2 0 1 642 506 639
-1244 2 2 0 1 639 506 635
-1245 2 2 0 1 619 566 637
-1246 2 2 0 1 620 630 637
-1247 2 2 0 1 566 620 637
-1248 2 2 0 1 621 527 550
-1249 2 2 0 1 550 657 621
-1250 2 2 0 1 655 536 621
-1251 2 2 0 1 657 655 621
-1252 2 2 0 1 622 614 723
-1253 2 2 0 1 622 580 614
-1254 2 2 0 1 623 624 1923
-1255 2 2 0 1 624 623 625
-1256 2 2 0 1 612 646 1933
-1257 2 2 0 1 646 612 609
-1258 2 2 0 1 1924 633 632
-1259 2 2 0 1 556 633 624
-1260 2 2 0 1 633 1924 624
-1261 2 2 0 1 626 627 585
-1262 2 2 0 1 628 629 562
-1263 2 2 0 1 629 628 634
-1264 2 2 0 1 636 635 521
-1265 2 2 0 1 640 630 558
-1266 2 2 0 1 658 607 617
-1267 2 2 0 1 1932 623 1923
-1268 2 2 0 1 623 631 625
-1269 2 2 0 1 646 1932 1933
-1270 2 2 0 1 631 646 609
-1271 2 2 0 1 633 533 632
-1272 2 2 0 1 556 533 633
-1273 2 2 0 1 658 600 586
-1274 2 2 0 1 629 617 562
-1275 2 2 0 1 564 629 634
-1276 2 2 0 1 636 639 635
-1277 2 2 0 1 640 639 636
-1278 2 2 0 1 636 637 630
-1279 2 2 0 1 630 640 636
-1280 2 2 0 1 606 627 561
-1281 2 2 0 1 561 627 626
-1282 2 2 0 1 607 627 606
-1283 2 2 0 1 619 520 492
-1284 2 2 0 1 520 636 521
-1285 2 2 0 1 619 637 520
-1286 2 2 0 1 520 637 636
-1287 2 2 0 1 568 643 638
-1288 2 2 0 1 643 615 638
-1289 2 2 0 1 571 615 643
-1290 2 2 0 1 558 641 639
-1291 2 2 0 1 639 640 558
-1292 2 2 0 1 639 641 642
-1293 2 2 0 1 643 569 644
-1294 2 2 0 1 643 644 571
-1295 2 2 0 1 645 652 1950
-1296 2 2 0 1 623 1932 646
-1297 2 2 0 1 631 623 646
-1298 2 2 0 1 588 703 650
-1299 2 2 0 1 627 586 585
-1300 2 2 0 1 586 607 658
-1301 2 2 0 1 586 627 607
-1302 2 2 0 1 644 651 648
-1303 2 2 0 1 651 644 647
-1304 2 2 0 1 651 650 648
-1305 2 2 0 1 317 654 649
-1306 2 2 0 1 654 1950 649
-1307 2 2 0 1 651 588 650
-1308 2 2 0 1 647 588 651
-1309 2 2 0 1 656 652 645
-1310 2 2 0 1 652 656 653
-1311 2 2 0 1 655 656 645
-1312 2 2 0 1 1950 654 645
-1313 2 2 0 1 654 534 645
-1314 2 2 0 1 534 654 317
-1315 2 2 0 1 653 656 1955
-1316 2 2 0 1 656 612 1955
-1317 2 2 0 1 657 656 655
-1318 2 2 0 1 612 656 657
-1319 2 2 0 1 658 617 629
-1320 2 2 0 1 600 658 564
-1321 2 2 0 1 564 658 629
-1322 2 2 0 1 674 943 696
-1323 2 2 0 1 659 394 661
-1324 2 2 0 1 660 659 661
-1325 2 2 0 1 945 662 663
-1326 2 2 0 1 662 758 663
-1327 2 2 0 1 667 675 710
-1328 2 2 0 1 675 667 673
-1329 2 2 0 1 665 715 664
-1330 2 2 0 1 715 665 699
-1331 2 2 0 1 668 667 710
-1332 2 2 0 1 659 678 664
-1333 2 2 0 1 943 676 945
-1334 2 2 0 1 676 662 945
-1335 2 2 0 1 665 664 678
-1336 2 2 0 1 746 685 742
-1337 2 2 0 1 693 742 685
-1338 2 2 0 1 666 736 761
-1339 2 2 0 1 669 736 666
-1340 2 2 0 1 667 668 666
-1341 2 2 0 1 669 666 668
-1342 2 2 0 1 669 739 736
-1343 2 2 0 1 670 739 669
-1344 2 2 0 1 732 670 669
-1345 2 2 0 1 670 740 739
-1346 2 2 0 1 671 740 670
-1347 2 2 0 1 680 671 670
-1348 2 2 0 1 672 682 688
-1349 2 2 0 1 749 679 753
-1350 2 2 0 1 759 666 761
-1351 2 2 0 1 666 759 673
-1352 2 2 0 1 667 666 673
-1353 2 2 0 1 660 678 659
-1354 2 2 0 1 674 676 943
-1355 2 2 0 1 675 676 674
-1356 2 2 0 1 662 676 673
-1357 2 2 0 1 675 673 676
-1358 2 2 0 1 759 758 673
-1359 2 2 0 1 758 662 673
-1360 2 2 0 1 394 659 664
-1361 2 2 0 1 671 746 740
-1362 2 2 0 1 685 746 671
-1363 2 2 0 1 693 677 742
-1364 2 2 0 1 688 677 693
-1365 2 2 0 1 753 678 660
-1366 2 2 0 1 753 679 678
-1367 2 2 0 1 664 713 394
-1368 2 2 0 1 684 680 695
-1369 2 2 0 1 691 672 687
-1370 2 2 0 1 679 681 682
-1371 2 2 0 1 681 679 749
-1372 2 2 0 1 681 688 682
-1373 2 2 0 1 685 683 693
-1374 2 2 0 1 687 683 684
-1375 2 2 0 1 680 686 671
-1376 2 2 0 1 686 685 671
-1377 2 2 0 1 686 680 684
-1378 2 2 0 1 711 710 717
-1379 2 2 0 1 672 694 687
-1380 2 2 0 1 693 694 688
-1381 2 2 0 1 694 672 688
-1382 2 2 0 1 708 675 674
-1383 2 2 0 1 707 689 523
-1384 2 2 0 1 690 691 687
-1385 2 2 0 1 690 692 691
-1386 2 2 0 1 694 683 687
-1387 2 2 0 1 693 683 694
-1388 2 2 0 1 677 681 749
-1389 2 2 0 1 677 688 681
-1390 2 2 0 1 684 690 687
-1391 2 2 0 1 684 695 690
-1392 2 2 0 1 686 683 685
-1393 2 2 0 1 684 683 686
-1394 2 2 0 1 706 696 705
-1395 2 2 0 1 696 706 674
-1396 2 2 0 1 706 708 674
-1397 2 2 0 1 592 700 597
-1398 2 2 0 1 717 523 697
-1399 2 2 0 1 707 523 717
-1400 2 2 0 1 682 698 699
-1401 2 2 0 1 698 682 672
-1402 2 2 0 1 691 698 672
-1403 2 2 0 1 698 729 699
-1404 2 2 0 1 729 698 700
-1405 2 2 0 1 665 682 699
-1406 2 2 0 1 679 682 665
-1407 2 2 0 1 665 678 679
-1408 2 2 0 1 669 668 732
-1409 2 2 0 1 711 668 710
-1410 2 2 0 1 700 709 597
-1411 2 2 0 1 732 701 670
-1412 2 2 0 1 701 680 670
-1413 2 2 0 1 704 705 702
-1414 2 2 0 1 689 704 702
-1415 2 2 0 1 709 703 597
-1416 2 2 0 1 707 704 689
-1417 2 2 0 1 704 706 705
-1418 2 2 0 1 706 707 708
-1419 2 2 0 1 706 704 707
-1420 2 2 0 1 691 692 709
-1421 2 2 0 1 691 709 698
-1422 2 2 0 1 698 709 700
-1423 2 2 0 1 708 710 675
-1424 2 2 0 1 710 708 717
-1425 2 2 0 1 707 717 708
-1426 2 2 0 1 712 732 668
-1427 2 2 0 1 712 711 725
-1428 2 2 0 1 711 712 668
-1429 2 2 0 1 732 712 725
-1430 2 2 0 1 716 713 664
-1431 2 2 0 1 716 714 713
-1432 2 2 0 1 715 716 664
-1433 2 2 0 1 690 726 692
-1434 2 2 0 1 726 690 695
-1435 2 2 0 1 703 719 650
-1436 2 2 0 1 718 717 697
-1437 2 2 0 1 717 718 711
-1438 2 2 0 1 719 703 709
-1439 2 2 0 1 692 719 709
-1440 2 2 0 1 719 692 726
-1441 2 2 0 1 722 541 457
-1442 2 2 0 1 721 648 650
-1443 2 2 0 1 719 726 721
-1444 2 2 0 1 719 721 650
-1445 2 2 0 1 622 718 697
-1446 2 2 0 1 725 711 718
-1447 2 2 0 1 457 724 722
-1448 2 2 0 1 727 720 721
-1449 2 2 0 1 722 730 575
-1450 2 2 0 1 730 722 724
-1451 2 2 0 1 648 720 723
-1452 2 2 0 1 648 721 720
-1453 2 2 0 1 457 714 724
-1454 2 2 0 1 714 716 724
-1455 2 2 0 1 720 727 725
-1456 2 2 0 1 718 720 725
-1457 2 2 0 1 723 720 622
-1458 2 2 0 1 720 718 622
-1459 2 2 0 1 731 715 699
-1460 2 2 0 1 731 716 715
-1461 2 2 0 1 729 731 699
-1462 2 2 0 1 731 724 716
-1463 2 2 0 1 731 730 724
-1464 2 2 0 1 726 695 727
-1465 2 2 0 1 727 721 726
-1466 2 2 0 1 575 728 592
-1467 2 2 0 1 729 728 731
-1468 2 2 0 1 728 700 592
-1469 2 2 0 1 729 700 728
-1470 2 2 0 1 730 728 575
-1471 2 2 0 1 730 731 728
-1472 2 2 0 1 701 695 680
-1473 2 2 0 1 725 701 732
-1474 2 2 0 1 727 701 725
-1475 2 2 0 1 727 695 701
-1476 2 2 0 1 734 761 736
-1477 2 2 0 1 734 733 760
-1478 2 2 0 1 735 733 734
-1479 2 2 0 1 736 735 734
-1480 2 2 0 1 735 736 739
-1481 2 2 0 1 735 737 733
-1482 2 2 0 1 738 737 735
-1483 2 2 0 1 739 738 735
-1484 2 2 0 1 738 739 740
-1485 2 2 0 1 738 741 737
-1486 2 2 0 1 747 741 738
-1487 2 2 0 1 740 747 738
-1488 2 2 0 1 743 746 742
-1489 2 2 0 1 743 744 748
-1490 2 2 0 1 745 742 677
-1491 2 2 0 1 743 742 745
-1492 2 2 0 1 745 750 744
-1493 2 2 0 1 744 743 745
-1494 2 2 0 1 747 740 746
-1495 2 2 0 1 747 748 741
-1496 2 2 0 1 745 677 749
-1497 2 2 0 1 745 751 750
-1498 2 2 0 1 752 751 745
-1499 2 2 0 1 749 752 745
-1500 2 2 0 1 752 749 753
-1501 2 2 0 1 752 4065 751
-1502 2 2 0 1 755 4065 752
-1503 2 2 0 1 753 755 752
-1504 2 2 0 1 755 753 660
-1505 2 2 0 1 755 754 4065
-1506 2 2 0 1 746 743 747
-1507 2 2 0 1 743 748 747
-1508 2 2 0 1 660 764 755
-1509 2 2 0 1 764 754 755
-1510 2 2 0 1 764 756 757
-1511 2 2 0 1 754 764 757
-1512 2 2 0 1 766 763 767
-1513 2 2 0 1 766 758 759
-1514 2 2 0 1 734 762 761
-1515 2 2 0 1 762 734 760
-1516 2 2 0 1 762 759 761
-1517 2 2 0 1 766 759 762
-1518 2 2 0 1 763 762 760
-1519 2 2 0 1 763 766 762
-1520 2 2 0 1 756 764 661
-1521 2 2 0 1 764 660 661
-1522 2 2 0 1 968 767 765
-1523 2 2 0 1 758 968 663
-1524 2 2 0 1 766 968 758
-1525 2 2 0 1 766 767 968
-1526 2 2 0 1 768 996 1039
-1527 2 2 0 1 996 768 788
-1528 2 2 0 1 833 877 844
-1529 2 2 0 1 795 769 796
-1530 2 2 0 1 880 821 879
-1531 2 2 0 1 788 768 888
-1532 2 2 0 1 833 880 877
-1533 2 2 0 1 795 852 769
-1534 2 2 0 1 1020 789 1021
-1535 2 2 0 1 834 867 1087
-1536 2 2 0 1 1019 843 770
-1537 2 2 0 1 808 771 779
-1538 2 2 0 1 824 772 775
-1539 2 2 0 1 889 780 888
-1540 2 2 0 1 780 889 773
-1541 2 2 0 1 777 836 790
-1542 2 2 0 1 774 806 775
-1543 2 2 0 1 774 776 785
-1544 2 2 0 1 806 815 777
-1545 2 2 0 1 827 826 784
-1546 2 2 0 1 806 800 775
-1547 2 2 0 1 791 800 790
-1548 2 2 0 1 812 778 786
-1549 2 2 0 1 829 808 779
-1550 2 2 0 1 789 829 779
-1551 2 2 0 1 810 808 781
-1552 2 2 0 1 808 828 771
-1553 2 2 0 1 818 2067 793
-1554 2 2 0 1 807 791 790
-1555 2 2 0 1 861 840 785
-1556 2 2 0 1 802 780 773
-1557 2 2 0 1 780 802 781
-1558 2 2 0 1 811 812 786
-1559 2 2 0 1 782 861 785
-1560 2 2 0 1 861 782 796
-1561 2 2 0 1 804 814 817
-1562 2 2 0 1 804 812 773
-1563 2 2 0 1 783 784 825
-1564 2 2 0 1 772 837 775
-1565 2 2 0 1 780 830 888
-1566 2 2 0 1 830 788 888
-1567 2 2 0 1 875 832 873
-1568 2 2 0 1 776 805 785
-1569 2 2 0 1 819 805 786
-1570 2 2 0 1 787 1020 996
-1571 2 2 0 1 787 788 789
-1572 2 2 0 1 788 787 996
-1573 2 2 0 1 1020 787 789
-1574 2 2 0 1 822 823 844
-1575 2 2 0 1 836 797 790
-1576 2 2 0 1 812 803 773
-1577 2 2 0 1 798 836 855
-1578 2 2 0 1 791 813 825
-1579 2 2 0 1 813 791 807
-1580 2 2 0 1 792 849 793
-1581 2 2 0 1 794 880 833
-1582 2 2 0 1 795 782 819
-1583 2 2 0 1 795 796 782
-1584 2 2 0 1 797 836 798
-1585 2 2 0 1 877 822 844
-1586 2 2 0 1 877 876 822
-1587 2 2 0 1 849 818 793
-1588 2 2 0 1 872 493 799
-1589 2 2 0 1 774 837 776
-1590 2 2 0 1 774 775 837
-1591 2 2 0 1 824 800 791
-1592 2 2 0 1 824 775 800
-1593 2 2 0 1 804 778 812
-1594 2 2 0 1 817 778 804
-1595 2 2 0 1 828 801 826
-1596 2 2 0 1 802 803 809
-1597 2 2 0 1 802 773 803
-1598 2 2 0 1 804 889 814
-1599 2 2 0 1 773 889 804
-1600 2 2 0 1 824 801 772
-1601 2 2 0 1 782 805 819
-1602 2 2 0 1 782 785 805
-1603 2 2 0 1 774 840 806
-1604 2 2 0 1 774 785 840
-1605 2 2 0 1 807 790 797
-1606 2 2 0 1 777 800 806
-1607 2 2 0 1 777 790 800
-1608 2 2 0 1 811 805 776
-1609 2 2 0 1 811 786 805
-1610 2 2 0 1 829 781 808
-1611 2 2 0 1 783 813 873
-1612 2 2 0 1 783 825 813
-1613 2 2 0 1 810 802 809
-1614 2 2 0 1 810 781 802
-1615 2 2 0 1 811 803 812
-1616 2 2 0 1 813 854 873
-1617 2 2 0 1 807 854 813
-1618 2 2 0 1 862 814 889
-1619 2 2 0 1 835 770 843
-1620 2 2 0 1 820 852 795
-1621 2 2 0 1 815 496 847
-1622 2 2 0 1 806 840 815
-1623 2 2 0 1 2067 816 2109
-1624 2 2 0 1 818 816 2067
-1625 2 2 0 1 814 816 817
-1626 2 2 0 1 818 817 816
-1627 2 2 0 1 819 820 795
-1628 2 2 0 1 821 880 794
-1629 2 2 0 1 867 822 876
-1630 2 2 0 1 822 867 835
-1631 2 2 0 1 823 822 835
-1632 2 2 0 1 824 791 825
-1633 2 2 0 1 826 825 784
-1634 2 2 0 1 826 801 825
-1635 2 2 0 1 824 825 801
-1636 2 2 0 1 823 827 844
-1637 2 2 0 1 827 823 771
-1638 2 2 0 1 827 828 826
-1639 2 2 0 1 827 771 828
-1640 2 2 0 1 780 781 830
-1641 2 2 0 1 830 789 788
-1642 2 2 0 1 829 789 830
-1643 2 2 0 1 829 830 781
-1644 2 2 0 1 784 783 831
-1645 2 2 0 1 832 831 873
-1646 2 2 0 1 794 831 832
-1647 2 2 0 1 833 831 794
-1648 2 2 0 1 783 873 831
-1649 2 2 0 1 495 853 519
-1650 2 2 0 1 769 853 796
-1651 2 2 0 1 772 810 809
-1652 2 2 0 1 772 801 810
-1653 2 2 0 1 828 808 810
-1654 2 2 0 1 828 810 801
-1655 2 2 0 1 797 798 871
-1656 2 2 0 1 834 835 867
-1657 2 2 0 1 770 835 834
-1658 2 2 0 1 855 836 543
-1659 2 2 0 1 811 776 837
-1660 2 2 0 1 809 837 772
-1661 2 2 0 1 809 803 837
-1662 2 2 0 1 811 837 803
-1663 2 2 0 1 794 908 821
-1664 2 2 0 1 820 838 852
-1665 2 2 0 1 2131 838 792
-1666 2 2 0 1 848 1021 789
-1667 2 2 0 1 779 848 789
-1668 2 2 0 1 839 543 836
-1669 2 2 0 1 777 839 836
-1670 2 2 0 1 815 860 496
-1671 2 2 0 1 860 815 840
-1672 2 2 0 1 841 827 784
-1673 2 2 0 1 831 841 784
-1674 2 2 0 1 827 841 844
-1675 2 2 0 1 853 842 796
-1676 2 2 0 1 842 853 495
-1677 2 2 0 1 850 843 779
-1678 2 2 0 1 771 850 779
-1679 2 2 0 1 841 833 844
-1680 2 2 0 1 831 833 841
-1681 2 2 0 1 838 849 792
-1682 2 2 0 1 820 849 838
-1683 2 2 0 1 845 842 495
-1684 2 2 0 1 842 861 796
-1685 2 2 0 1 860 845 496
-1686 2 2 0 1 786 846 819
-1687 2 2 0 1 846 786 778
-1688 2 2 0 1 846 820 819
-1689 2 2 0 1 839 847 543
-1690 2 2 0 1 847 839 815
-1691 2 2 0 1 839 777 815
-1692 2 2 0 1 848 1019 1021
-1693 2 2 0 1 1019 848 843
-1694 2 2 0 1 848 779 843
-1695 2 2 0 1 846 778 817
-1696 2 2 0 1 818 846 817
-1697 2 2 0 1 846 818 849
-1698 2 2 0 1 846 849 820
-1699 2 2 0 1 823 850 771
-1700 2 2 0 1 850 823 835
-1701 2 2 0 1 843 850 835
-1702 2 2 0 1 851 859 519
-1703 2 2 0 1 851 769 852
-1704 2 2 0 1 853 769 851
-1705 2 2 0 1 853 851 519
-1706 2 2 0 1 807 797 854
-1707 2 2 0 1 854 871 881
-1708 2 2 0 1 854 797 871
-1709 2 2 0 1 798 855 493
-1710 2 2 0 1 798 493 872
-1711 2 2 0 1 871 798 872
-1712 2 2 0 1 875 856 908
-1713 2 2 0 1 832 875 908
-1714 2 2 0 1 832 908 794
-1715 2 2 0 1 870 799 702
-1716 2 2 0 1 872 799 870
-1717 2 2 0 1 857 2131 2155
-1718 2 2 0 1 857 851 852
-1719 2 2 0 1 859 858 1801
-1720 2 2 0 1 858 2155 1801
-1721 2 2 0 1 858 859 851
-1722 2 2 0 1 857 838 2131
-1723 2 2 0 1 852 838 857
-1724 2 2 0 1 858 857 2155
-1725 2 2 0 1 851 857 858
-1726 2 2 0 1 933 856 875
-1727 2 2 0 1 845 860 842
-1728 2 2 0 1 860 840 861
-1729 2 2 0 1 860 861 842
-1730 2 2 0 1 863 2109 816
-1731 2 2 0 1 863 814 862
-1732 2 2 0 1 816 814 863
-1733 2 2 0 1 863 864 2109
-1734 2 2 0 1 863 862 864
-1735 2 2 0 1 876 902 865
-1736 2 2 0 1 933 875 881
-1737 2 2 0 1 865 866 876
-1738 2 2 0 1 866 867 876
-1739 2 2 0 1 866 1087 867
-1740 2 2 0 1 1087 866 868
-1741 2 2 0 1 866 865 868
-1742 2 2 0 1 869 883 1039
-1743 2 2 0 1 883 768 1039
-1744 2 2 0 1 927 882 870
-1745 2 2 0 1 882 872 870
-1746 2 2 0 1 887 888 768
-1747 2 2 0 1 883 887 768
-1748 2 2 0 1 871 882 881
-1749 2 2 0 1 882 871 872
-1750 2 2 0 1 873 874 875
-1751 2 2 0 1 881 874 854
-1752 2 2 0 1 874 881 875
-1753 2 2 0 1 874 873 854
-1754 2 2 0 1 878 902 876
-1755 2 2 0 1 877 878 876
-1756 2 2 0 1 902 878 879
-1757 2 2 0 1 878 880 879
-1758 2 2 0 1 877 880 878
-1759 2 2 0 1 881 927 933
-1760 2 2 0 1 927 881 882
-1761 2 2 0 1 883 886 887
-1762 2 2 0 1 885 2186 864
-1763 2 2 0 1 862 885 864
-1764 2 2 0 1 886 884 2186
-1765 2 2 0 1 2186 885 886
-1766 2 2 0 1 885 887 886
-1767 2 2 0 1 887 885 862
-1768 2 2 0 1 890 889 888
-1769 2 2 0 1 890 887 862
-1770 2 2 0 1 887 890 888
-1771 2 2 0 1 889 890 862
-1772 2 2 0 1 891 869 1067
-1773 2 2 0 1 884 891 1067
-1774 2 2 0 1 869 891 883
-1775 2 2 0 1 886 891 884
-1776 2 2 0 1 886 883 891
-1777 2 2 0 1 895 1095 1111
-1778 2 2 0 1 1107 892 893
-1779 2 2 0 1 892 938 893
-1780 2 2 0 1 663 964 945
-1781 2 2 0 1 897 896 930
-1782 2 2 0 1 894 945 964
-1783 2 2 0 1 915 917 916
-1784 2 2 0 1 903 895 1111
-1785 2 2 0 1 916 941 915
-1786 2 2 0 1 904 941 932
-1787 2 2 0 1 941 904 915
-1788 2 2 0 1 901 896 897
-1789 2 2 0 1 898 921 896
-1790 2 2 0 1 935 705 696
-1791 2 2 0 1 899 907 950
-1792 2 2 0 1 913 899 917
-1793 2 2 0 1 931 921 900
-1794 2 2 0 1 898 955 909
-1795 2 2 0 1 896 901 898
-1796 2 2 0 1 929 927 870
-1797 2 2 0 1 879 926 902
-1798 2 2 0 1 926 915 904
-1799 2 2 0 1 902 903 865
-1800 2 2 0 1 902 926 903
-1801 2 2 0 1 895 903 904
-1802 2 2 0 1 926 904 903
-1803 2 2 0 1 904 932 895
-1804 2 2 0 1 865 1111 868
-1805 2 2 0 1 903 1111 865
-1806 2 2 0 1 908 919 821
-1807 2 2 0 1 911 905 919
-1808 2 2 0 1 899 906 907
-1809 2 2 0 1 906 899 913
-1810 2 2 0 1 908 922 919
-1811 2 2 0 1 930 936 897
-1812 2 2 0 1 910 898 909
-1813 2 2 0 1 898 910 921
-1814 2 2 0 1 913 912 911
-1815 2 2 0 1 912 913 917
-1816 2 2 0 1 912 905 911
-1817 2 2 0 1 920 879 821
-1818 2 2 0 1 705 928 702
-1819 2 2 0 1 928 870 702
-1820 2 2 0 1 914 930 896
-1821 2 2 0 1 921 914 896
-1822 2 2 0 1 915 925 917
-1823 2 2 0 1 918 916 917
-1824 2 2 0 1 899 918 917
-1825 2 2 0 1 919 920 821
-1826 2 2 0 1 919 905 920
-1827 2 2 0 1 925 912 917
-1828 2 2 0 1 905 912 925
-1829 2 2 0 1 900 911 931
-1830 2 2 0 1 900 913 911
-1831 2 2 0 1 906 937 907
-1832 2 2 0 1 937 910 909
-1833 2 2 0 1 900 921 910
-1834 2 2 0 1 911 922 931
-1835 2 2 0 1 911 919 922
-1836 2 2 0 1 924 936 930
-1837 2 2 0 1 920 926 879
-1838 2 2 0 1 918 950 923
-1839 2 2 0 1 950 918 899
-1840 2 2 0 1 856 922 908
-1841 2 2 0 1 924 856 933
-1842 2 2 0 1 856 924 922
-1843 2 2 0 1 920 905 925
-1844 2 2 0 1 926 925 915
-1845 2 2 0 1 925 926 920
-1846 2 2 0 1 929 936 927
-1847 2 2 0 1 870 928 929
-1848 2 2 0 1 928 935 929
-1849 2 2 0 1 935 928 705
-1850 2 2 0 1 914 924 930
-1851 2 2 0 1 931 914 921
-1852 2 2 0 1 914 931 922
-1853 2 2 0 1 922 924 914
-1854 2 2 0 1 942 901 897
-1855 2 2 0 1 942 894 901
-1856 2 2 0 1 1095 932 1096
-1857 2 2 0 1 1095 895 932
-1858 2 2 0 1 936 933 927
-1859 2 2 0 1 924 933 936
-1860 2 2 0 1 940 1107 1096
-1861 2 2 0 1 932 940 1096
-1862 2 2 0 1 934 935 942
-1863 2 2 0 1 897 934 942
-1864 2 2 0 1 935 934 929
-1865 2 2 0 1 936 934 897
-1866 2 2 0 1 936 929 934
-1867 2 2 0 1 940 892 1107
-1868 2 2 0 1 963 894 964
-1869 2 2 0 1 963 901 894
-1870 2 2 0 1 937 906 910
-1871 2 2 0 1 913 900 906
-1872 2 2 0 1 900 910 906
-1873 2 2 0 1 938 939 923
-1874 2 2 0 1 892 939 938
-1875 2 2 0 1 939 918 923
-1876 2 2 0 1 916 918 939
-1877 2 2 0 1 901 955 898
-1878 2 2 0 1 955 901 963
-1879 2 2 0 1 892 940 939
-1880 2 2 0 1 941 940 932
-1881 2 2 0 1 940 941 916
-1882 2 2 0 1 916 939 940
-1883 2 2 0 1 944 942 935
-1884 2 2 0 1 696 943 944
-1885 2 2 0 1 935 696 944
-1886 2 2 0 1 944 943 945
-1887 2 2 0 1 894 944 945
-1888 2 2 0 1 944 894 942
-1889 2 2 0 1 949 947 946
-1890 2 2 0 1 937 947 907
-1891 2 2 0 1 907 948 950
-1892 2 2 0 1 958 948 949
-1893 2 2 0 1 950 959 923
-1894 2 2 0 1 951 959 958
-1895 2 2 0 1 923 952 938
-1896 2 2 0 1 962 952 951
-1897 2 2 0 1 909 953 937
-1898 2 2 0 1 946 953 954
-1899 2 2 0 1 955 957 909
-1900 2 2 0 1 954 957 956
-1901 2 2 0 1 954 953 957
-1902 2 2 0 1 953 909 957
-1903 2 2 0 1 963 965 955
-1904 2 2 0 1 956 965 966
-1905 2 2 0 1 956 957 965
-1906 2 2 0 1 957 955 965
-1907 2 2 0 1 953 947 937
-1908 2 2 0 1 946 947 953
-1909 2 2 0 1 947 948 907
-1910 2 2 0 1 947 949 948
-1911 2 2 0 1 948 959 950
-1912 2 2 0 1 948 958 959
-1913 2 2 0 1 959 952 923
-1914 2 2 0 1 959 951 952
-1915 2 2 0 1 952 960 938
-1916 2 2 0 1 1154 960 961
-1917 2 2 0 1 893 960 1154
-1918 2 2 0 1 893 938 960
-1919 2 2 0 1 960 962 961
-1920 2 2 0 1 952 962 960
-1921 2 2 0 1 967 963 964
-1922 2 2 0 1 963 967 965
-1923 2 2 0 1 4506 966 967
-1924 2 2 0 1 966 965 967
-1925 2 2 0 1 4506 968 765
-1926 2 2 0 1 663 968 964
-1927 2 2 0 1 968 967 964
-1928 2 2 0 1 4506 967 968
-1929 2 2 0 1 1236 969 1035
-1930 2 2 0 1 1236 1035 1036
-1931 2 2 0 1 994 1045 1040
-1932 2 2 0 1 974 1074 970
-1933 2 2 0 1 1029 992 975
-1934 2 2 0 1 834 971 770
-1935 2 2 0 1 971 834 1037
-1936 2 2 0 1 1028 1029 970
-1937 2 2 0 1 1086 972 973
-1938 2 2 0 1 1029 974 970
-1939 2 2 0 1 975 974 1029
-1940 2 2 0 1 1043 1027 2324
-1941 2 2 0 1 976 1058 993
-1942 2 2 0 1 1086 1034 1037
-1943 2 2 0 1 981 1003 977
-1944 2 2 0 1 1061 981 986
-1945 2 2 0 1 1055 1002 977
-1946 2 2 0 1 1002 1055 1025
-1947 2 2 0 1 1065 1055 977
-1948 2 2 0 1 1008 981 1061
-1949 2 2 0 1 1006 1027 1043
-1950 2 2 0 1 1006 1055 1065
-1951 2 2 0 1 999 981 1008
-1952 2 2 0 1 981 978 986
-1953 2 2 0 1 978 981 977
-1954 2 2 0 1 979 980 1025
-1955 2 2 0 1 1080 979 2302
-1956 2 2 0 1 1044 979 1080
-1957 2 2 0 1 981 1059 1003
-1958 2 2 0 1 1059 981 999
-1959 2 2 0 1 1022 989 991
-1960 2 2 0 1 1014 982 1022
-1961 2 2 0 1 982 1014 983
-1962 2 2 0 1 991 1014 1022
-1963 2 2 0 1 1060 994 1040
-1964 2 2 0 1 1060 982 983
-1965 2 2 0 1 1009 1052 998
-1966 2 2 0 1 1052 1009 1012
-1967 2 2 0 1 987 1005 986
-1968 2 2 0 1 1010 984 998
-1969 2 2 0 1 1018 988 1034
-1970 2 2 0 1 985 987 986
-1971 2 2 0 1 985 1004 1032
-1972 2 2 0 1 987 1015 1005
-1973 2 2 0 1 1015 987 983
-1974 2 2 0 1 990 988 991
-1975 2 2 0 1 989 990 991
-1976 2 2 0 1 1072 1076 1001
-1977 2 2 0 1 1027 1066 992
-1978 2 2 0 1 1058 1033 993
-1979 2 2 0 1 987 1013 983
-1980 2 2 0 1 994 1013 1032
-1981 2 2 0 1 1063 1062 1005
-1982 2 2 0 1 1020 995 996
-1983 2 2 0 1 995 1040 996
-1984 2 2 0 1 995 1020 997
-1985 2 2 0 1 1052 1051 998
-1986 2 2 0 1 984 1011 999
-1987 2 2 0 1 1011 984 1078
-1988 2 2 0 1 984 1007 998
-1989 2 2 0 1 1036 1041 1000
-1990 2 2 0 1 975 992 1066
-1991 2 2 0 1 1076 1017 1001
-1992 2 2 0 1 1017 1157 1001
-1993 2 2 0 1 1081 1080 2302
-1994 2 2 0 1 1033 973 993
-1995 2 2 0 1 1086 973 1033
-1996 2 2 0 1 1002 980 1004
-1997 2 2 0 1 1002 1025 980
-1998 2 2 0 1 977 1003 1065
-1999 2 2 0 1 978 1002 1004
-2000 2 2 0 1 977 1002 978
-2001 2 2 0 1 1061 1005 1062
-2002 2 2 0 1 1061 986 1005
-2003 2 2 0 1 985 978 1004
-2004 2 2 0 1 986 978 985
-2005 2 2 0 1 1006 1066 1027
-2006 2 2 0 1 1006 1065 1066
-2007 2 2 0 1 1010 1078 984
-2008 2 2 0 1 999 1007 984
-2009 2 2 0 1 999 1008 1007
-2010 2 2 0 1 980 1032 1004
-2011 2 2 0 1 1009 998 1007
-2012 2 2 0 1 1010 1051 1016
-2013 2 2 0 1 1010 998 1051
-2014 2 2 0 1 1059 999 1011
-2015 2 2 0 1 1068 1012 1009
-2016 2 2 0 1 1060 1013 994
-2017 2 2 0 1 1060 983 1013
-2018 2 2 0 1 1015 1014 991
-2019 2 2 0 1 983 1014 1015
-2020 2 2 0 1 1069 1018 1058
-2021 2 2 0 1 1051 1041 1016
-2022 2 2 0 1 985 1013 987
-2023 2 2 0 1 985 1032 1013
-2024 2 2 0 1 1063 1015 991
-2025 2 2 0 1 1005 1015 1063
-2026 2 2 0 1 1017 1016 1038
-2027 2 2 0 1 1017 1078 1010
-2028 2 2 0 1 1010 1016 1017
-2029 2 2 0 1 988 1018 1048
-2030 2 2 0 1 1069 1048 1018
-2031 2 2 0 1 1026 1021 1019
-2032 2 2 0 1 989 1022 1026
-2033 2 2 0 1 1021 997 1020
-2034 2 2 0 1 997 1021 1026
-2035 2 2 0 1 997 1022 982
-2036 2 2 0 1 997 1026 1022
-2037 2 2 0 1 1102 1050 1049
-2038 2 2 0 1 1023 1024 1042
-2039 2 2 0 1 1055 1024 1025
-2040 2 2 0 1 1026 1019 770
-2041 2 2 0 1 971 1026 770
-2042 2 2 0 1 2324 1031 1030
-2043 2 2 0 1 1031 2324 1027
-2044 2 2 0 1 992 1031 1027
-2045 2 2 0 1 1028 1031 1029
-2046 2 2 0 1 2327 1031 1028
-2047 2 2 0 1 992 1029 1031
-2048 2 2 0 1 2327 1030 1031
-2049 2 2 0 1 1017 1038 1157
-2050 2 2 0 1 994 1044 1045
-2051 2 2 0 1 994 1032 1044
-2052 2 2 0 1 980 979 1044
-2053 2 2 0 1 980 1044 1032
-2054 2 2 0 1 1033 1058 1018
-2055 2 2 0 1 1034 1033 1018
-2056 2 2 0 1 1033 1034 1086
-2057 2 2 0 1 2302 979 2339
-2058 2 2 0 1 990 1034 988
-2059 2 2 0 1 1038 1041 1035
-2060 2 2 0 1 1016 1041 1038
-2061 2 2 0 1 1035 1041 1036
-2062 2 2 0 1 1037 1034 971
-2063 2 2 0 1 989 1026 971
-2064 2 2 0 1 990 989 971
-2065 2 2 0 1 1034 990 971
-2066 2 2 0 1 1038 969 1157
-2067 2 2 0 1 1038 1035 969
-2068 2 2 0 1 1070 1050 1102
-2069 2 2 0 1 1050 1070 1012
-2070 2 2 0 1 1084 1039 996
-2071 2 2 0 1 1040 1084 996
-2072 2 2 0 1 1041 1053 1000
-2073 2 2 0 1 1053 1041 1051
-2074 2 2 0 1 1042 1054 1043
-2075 2 2 0 1 1054 1006 1043
-2076 2 2 0 1 1054 1042 1024
-2077 2 2 0 1 1044 1083 1045
-2078 2 2 0 1 1083 1044 1080
-2079 2 2 0 1 1046 2339 979
-2080 2 2 0 1 1025 1046 979
-2081 2 2 0 1 2339 1046 1023
-2082 2 2 0 1 1068 1047 1048
-2083 2 2 0 1 1047 1062 1048
-2084 2 2 0 1 1049 1057 976
-2085 2 2 0 1 1069 1057 1050
-2086 2 2 0 1 1057 1049 1050
-2087 2 2 0 1 1053 1056 1000
-2088 2 2 0 1 1051 1052 1053
-2089 2 2 0 1 1054 1055 1006
-2090 2 2 0 1 1024 1055 1054
-2091 2 2 0 1 1056 1070 1102
-2092 2 2 0 1 1070 1052 1012
-2093 2 2 0 1 1057 1058 976
-2094 2 2 0 1 1069 1058 1057
-2095 2 2 0 1 1046 1024 1023
-2096 2 2 0 1 1025 1024 1046
-2097 2 2 0 1 1045 1084 1040
-2098 2 2 0 1 1076 1078 1017
-2099 2 2 0 1 1059 1079 1003
-2100 2 2 0 1 1059 1011 1079
-2101 2 2 0 1 982 995 997
-2102 2 2 0 1 995 982 1060
-2103 2 2 0 1 1040 995 1060
-2104 2 2 0 1 1061 1062 1047
-2105 2 2 0 1 1047 1008 1061
-2106 2 2 0 1 1047 1007 1008
-2107 2 2 0 1 1068 1009 1047
-2108 2 2 0 1 1009 1007 1047
-2109 2 2 0 1 1048 1062 1063
-2110 2 2 0 1 988 1063 991
-2111 2 2 0 1 988 1048 1063
-2112 2 2 0 1 975 1073 974
-2113 2 2 0 1 975 1079 1073
-2114 2 2 0 1 1064 1065 1003
-2115 2 2 0 1 1079 1064 1003
-2116 2 2 0 1 1065 1064 1066
-2117 2 2 0 1 975 1064 1079
-2118 2 2 0 1 975 1066 1064
-2119 2 2 0 1 869 1071 1067
-2120 2 2 0 1 1071 1082 1067
-2121 2 2 0 1 1012 1068 1050
-2122 2 2 0 1 1069 1050 1068
-2123 2 2 0 1 1069 1068 1048
-2124 2 2 0 1 1070 1056 1053
-2125 2 2 0 1 1053 1052 1070
-2126 2 2 0 1 1084 869 1039
-2127 2 2 0 1 1071 869 1084
-2128 2 2 0 1 1074 1077 1072
-2129 2 2 0 1 1073 1077 974
-2130 2 2 0 1 1077 1074 974
-2131 2 2 0 1 1075 1078 1076
-2132 2 2 0 1 1073 1075 1076
-2133 2 2 0 1 1077 1076 1072
-2134 2 2 0 1 1073 1076 1077
-2135 2 2 0 1 1075 1011 1078
-2136 2 2 0 1 1011 1075 1079
-2137 2 2 0 1 1075 1073 1079
-2138 2 2 0 1 1083 1084 1045
-2139 2 2 0 1 1081 1083 1080
-2140 2 2 0 1 1081 1082 1083
-2141 2 2 0 1 1082 1071 1083
-2142 2 2 0 1 1083 1071 1084
-2143 2 2 0 1 1086 1085 972
-2144 2 2 0 1 1085 1086 1037
-2145 2 2 0 1 1085 834 1087
-2146 2 2 0 1 1037 834 1085
-2147 2 2 0 1 868 1085 1087
-2148 2 2 0 1 868 972 1085
-2149 2 2 0 1 1036 1088 1236
-2150 2 2 0 1 1112 1094 1125
-2151 2 2 0 1 1000 1113 1036
-2152 2 2 0 1 1115 1116 1089
-2153 2 2 0 1 1093 973 972
-2154 2 2 0 1 1093 1112 1125
-2155 2 2 0 1 1112 1093 972
-2156 2 2 0 1 1098 1111 1095
-2157 2 2 0 1 1089 1110 1115
-2158 2 2 0 1 1113 1089 1116
-2159 2 2 0 1 1098 1094 1112
-2160 2 2 0 1 1091 1101 1090
-2161 2 2 0 1 1228 1116 1114
-2162 2 2 0 1 1108 1109 1148
-2163 2 2 0 1 1101 1147 1106
-2164 2 2 0 1 1123 1101 1091
-2165 2 2 0 1 1098 1112 1111
-2166 2 2 0 1 1130 1123 1091
-2167 2 2 0 1 1092 1102 1049
-2168 2 2 0 1 1090 1092 1091
-2169 2 2 0 1 1089 1105 1110
-2170 2 2 0 1 973 1133 993
-2171 2 2 0 1 1093 1133 973
-2172 2 2 0 1 1125 1133 1093
-2173 2 2 0 1 1105 1092 1090
-2174 2 2 0 1 1097 1094 1098
-2175 2 2 0 1 1096 1098 1095
-2176 2 2 0 1 1096 1097 1098
-2177 2 2 0 1 1104 1000 1056
-2178 2 2 0 1 1104 1105 1089
-2179 2 2 0 1 1127 1099 1126
-2180 2 2 0 1 1100 1101 1106
-2181 2 2 0 1 1100 1109 1090
-2182 2 2 0 1 1101 1100 1090
-2183 2 2 0 1 1102 1103 1056
-2184 2 2 0 1 1105 1103 1092
-2185 2 2 0 1 1103 1102 1092
-2186 2 2 0 1 1104 1113 1000
-2187 2 2 0 1 1089 1113 1104
-2188 2 2 0 1 1103 1104 1056
-2189 2 2 0 1 1105 1104 1103
-2190 2 2 0 1 1148 1100 1106
-2191 2 2 0 1 1148 1109 1100
-2192 2 2 0 1 1097 1096 1107
-2193 2 2 0 1 1090 1110 1105
-2194 2 2 0 1 1109 1110 1090
-2195 2 2 0 1 1115 1108 1141
-2196 2 2 0 1 1110 1108 1115
-2197 2 2 0 1 1109 1108 1110
-2198 2 2 0 1 868 1111 1112
-2199 2 2 0 1 972 868 1112
-2200 2 2 0 1 1113 1228 1088
-2201 2 2 0 1 1116 1228 1113
-2202 2 2 0 1 1113 1088 1036
-2203 2 2 0 1 1119 1114 1116
-2204 2 2 0 1 1115 1119 1116
-2205 2 2 0 1 1117 1092 1049
-2206 2 2 0 1 1091 1117 1130
-2207 2 2 0 1 1091 1092 1117
-2208 2 2 0 1 1119 1118 1114
-2209 2 2 0 1 1118 1119 1141
-2210 2 2 0 1 1119 1115 1141
-2211 2 2 0 1 893 1153 1107
-2212 2 2 0 1 1153 1121 1107
-2213 2 2 0 1 1121 1097 1107
-2214 2 2 0 1 1120 1121 1153
-2215 2 2 0 1 1121 1120 1122
-2216 2 2 0 1 1097 1121 1122
-2217 2 2 0 1 1122 1094 1097
-2218 2 2 0 1 976 1117 1049
-2219 2 2 0 1 1127 1136 1123
-2220 2 2 0 1 1147 1123 1136
-2221 2 2 0 1 1101 1123 1147
-2222 2 2 0 1 1124 1125 1094
-2223 2 2 0 1 1124 1122 1126
-2224 2 2 0 1 1122 1124 1094
-2225 2 2 0 1 1127 1128 1136
-2226 2 2 0 1 1135 1122 1120
-2227 2 2 0 1 1135 1126 1122
-2228 2 2 0 1 1124 1126 1099
-2229 2 2 0 1 1133 1124 1099
-2230 2 2 0 1 1124 1133 1125
-2231 2 2 0 1 1130 1129 1123
-2232 2 2 0 1 1127 1129 1099
-2233 2 2 0 1 1129 1127 1123
-2234 2 2 0 1 1126 1128 1127
-2235 2 2 0 1 1128 1126 1135
-2236 2 2 0 1 1099 1132 1133
-2237 2 2 0 1 1099 1129 1132
-2238 2 2 0 1 1132 1129 1130
-2239 2 2 0 1 1131 993 1133
-2240 2 2 0 1 1132 1131 1133
-2241 2 2 0 1 1131 976 993
-2242 2 2 0 1 976 1131 1117
-2243 2 2 0 1 1117 1131 1130
-2244 2 2 0 1 1131 1132 1130
-2245 2 2 0 1 1153 1134 1120
-2246 2 2 0 1 1145 1134 1151
-2247 2 2 0 1 1146 1144 1145
-2248 2 2 0 1 1120 1144 1135
-2249 2 2 0 1 1135 1143 1128
-2250 2 2 0 1 4511 1143 1146
-2251 2 2 0 1 1128 1137 1136
-2252 2 2 0 1 4518 1137 4511
-2253 2 2 0 1 1136 1138 1147
-2254 2 2 0 1 4513 1138 4518
-2255 2 2 0 1 1147 1139 1106
-2256 2 2 0 1 4512 1139 4513
-2257 2 2 0 1 1106 1149 1148
-2258 2 2 0 1 1150 1149 4512
-2259 2 2 0 1 1148 1140 1108
-2260 2 2 0 1 4516 1140 1150
-2261 2 2 0 1 1108 1142 1141
-2262 2 2 0 1 1155 1142 4516
-2263 2 2 0 1 1137 1138 1136
-2264 2 2 0 1 1137 4518 1138
-2265 2 2 0 1 1143 1137 1128
-2266 2 2 0 1 1143 4511 1137
-2267 2 2 0 1 1134 1144 1120
-2268 2 2 0 1 1134 1145 1144
-2269 2 2 0 1 1144 1143 1135
-2270 2 2 0 1 1144 1146 1143
-2271 2 2 0 1 1138 1139 1147
-2272 2 2 0 1 1138 4513 1139
-2273 2 2 0 1 1139 1149 1106
-2274 2 2 0 1 1139 4512 1149
-2275 2 2 0 1 1149 1140 1148
-2276 2 2 0 1 1149 1150 1140
-2277 2 2 0 1 1140 1142 1108
-2278 2 2 0 1 1140 4516 1142
-2279 2 2 0 1 1151 1154 961
-2280 2 2 0 1 1270 1155 1152
-2281 2 2 0 1 893 1154 1153
-2282 2 2 0 1 1270 1118 1141
-2283 2 2 0 1 1154 1134 1153
-2284 2 2 0 1 1151 1134 1154
-2285 2 2 0 1 1142 1270 1141
-2286 2 2 0 1 1142 1155 1270
-2287 2 2 0 1 1157 1156 1161
-2288 2 2 0 1 969 1156 1157
-2289 2 2 0 1 969 1162 1156
-2290 2 2 0 1 1236 1162 969
-2291 2 2 0 1 1072 1167 1074
-2292 2 2 0 1 1158 1212 1160
-2293 2 2 0 1 1161 1158 1160
-2294 2 2 0 1 1159 1001 1157
-2295 2 2 0 1 1159 1161 1160
-2296 2 2 0 1 1161 1159 1157
-2297 2 2 0 1 1163 1161 1156
-2298 2 2 0 1 1163 1162 1231
-2299 2 2 0 1 1156 1162 1163
-2300 2 2 0 1 1160 1212 1164
-2301 2 2 0 1 1256 1165 1168
-2302 2 2 0 1 1074 1166 970
-2303 2 2 0 1 1166 1074 1167
-2304 2 2 0 1 1168 1163 1231
-2305 2 2 0 1 1158 1161 1163
-2306 2 2 0 1 1216 2480 2474
-2307 2 2 0 1 1178 1028 970
-2308 2 2 0 1 970 1166 1178
-2309 2 2 0 1 1169 1182 1185
-2310 2 2 0 1 1182 1169 1195
-2311 2 2 0 1 1165 1170 1168
-2312 2 2 0 1 1163 1170 1158
-2313 2 2 0 1 1170 1163 1168
-2314 2 2 0 1 1175 1171 1203
-2315 2 2 0 1 1171 1175 1172
-2316 2 2 0 1 1164 1181 1167
-2317 2 2 0 1 1173 1165 1172
-2318 2 2 0 1 1165 1173 1212
-2319 2 2 0 1 1167 1174 1164
-2320 2 2 0 1 1174 1167 1072
-2321 2 2 0 1 1174 1160 1164
-2322 2 2 0 1 1212 1170 1165
-2323 2 2 0 1 1212 1158 1170
-2324 2 2 0 1 1001 1174 1072
-2325 2 2 0 1 1214 1172 1175
-2326 2 2 0 1 1172 1214 1173
-2327 2 2 0 1 1214 1211 1213
-2328 2 2 0 1 1195 1169 1220
-2329 2 2 0 1 1184 2487 1186
-2330 2 2 0 1 1185 1182 1184
-2331 2 2 0 1 1256 1171 1172
-2332 2 2 0 1 1165 1256 1172
-2333 2 2 0 1 1176 2474 1177
-2334 2 2 0 1 2474 1176 1216
-2335 2 2 0 1 1216 1218 1185
-2336 2 2 0 1 1185 1218 1169
-2337 2 2 0 1 1159 1174 1001
-2338 2 2 0 1 1159 1160 1174
-2339 2 2 0 1 1180 1178 1166
-2340 2 2 0 1 1178 1180 1176
-2341 2 2 0 1 1028 1179 2327
-2342 2 2 0 1 1179 1177 2327
-2343 2 2 0 1 1179 1028 1178
-2344 2 2 0 1 1179 1176 1177
-2345 2 2 0 1 1178 1176 1179
-2346 2 2 0 1 1181 1166 1167
-2347 2 2 0 1 1181 1180 1166
-2348 2 2 0 1 1181 1218 1180
-2349 2 2 0 1 1187 1184 1182
-2350 2 2 0 1 1216 1183 2480
-2351 2 2 0 1 1184 1183 1185
-2352 2 2 0 1 1183 1216 1185
-2353 2 2 0 1 1226 1209 1255
-2354 2 2 0 1 1183 1186 2480
-2355 2 2 0 1 1184 1186 1183
-2356 2 2 0 1 1222 1209 1226
-2357 2 2 0 1 1187 2487 1184
-2358 2 2 0 1 1194 1188 1189
-2359 2 2 0 1 1190 1191 2483
-2360 2 2 0 1 1191 1196 2483
-2361 2 2 0 1 1191 1190 1189
-2362 2 2 0 1 1188 1192 1196
-2363 2 2 0 1 1191 1188 1196
-2364 2 2 0 1 1189 1188 1191
-2365 2 2 0 1 1189 1190 2487
-2366 2 2 0 1 1189 1187 1194
-2367 2 2 0 1 1187 1189 2487
-2368 2 2 0 1 1188 1204 1192
-2369 2 2 0 1 1200 1193 1292
-2370 2 2 0 1 1193 1196 1192
-2371 2 2 0 1 1182 1195 1194
-2372 2 2 0 1 1194 1187 1182
-2373 2 2 0 1 1225 1194 1195
-2374 2 2 0 1 1196 1197 2483
-2375 2 2 0 1 1198 1201 1203
-2376 2 2 0 1 1224 1206 1204
-2377 2 2 0 1 1199 1200 2490
-2378 2 2 0 1 1197 1199 2490
-2379 2 2 0 1 1224 1201 1206
-2380 2 2 0 1 1199 1197 1196
-2381 2 2 0 1 1193 1199 1196
-2382 2 2 0 1 1199 1193 1200
-2383 2 2 0 1 1203 1201 1202
-2384 2 2 0 1 1202 1211 1214
-2385 2 2 0 1 1214 1175 1202
-2386 2 2 0 1 1202 1175 1203
-2387 2 2 0 1 1208 1201 1198
-2388 2 2 0 1 1208 1206 1201
-2389 2 2 0 1 1205 1194 1225
-2390 2 2 0 1 1205 1204 1188
-2391 2 2 0 1 1194 1205 1188
-2392 2 2 0 1 1206 1207 1204
-2393 2 2 0 1 1206 1208 1207
-2394 2 2 0 1 1209 1207 1255
-2395 2 2 0 1 1208 1255 1207
-2396 2 2 0 1 1225 1195 1211
-2397 2 2 0 1 1210 1225 1211
-2398 2 2 0 1 1202 1210 1211
-2399 2 2 0 1 1225 1210 1224
-2400 2 2 0 1 1210 1201 1224
-2401 2 2 0 1 1202 1201 1210
-2402 2 2 0 1 1212 1213 1164
-2403 2 2 0 1 1173 1213 1212
-2404 2 2 0 1 1173 1214 1213
-2405 2 2 0 1 1215 1211 1195
-2406 2 2 0 1 1215 1220 1213
-2407 2 2 0 1 1220 1215 1195
-2408 2 2 0 1 1211 1215 1213
-2409 2 2 0 1 1176 1217 1216
-2410 2 2 0 1 1218 1217 1180
-2411 2 2 0 1 1217 1218 1216
-2412 2 2 0 1 1217 1176 1180
-2413 2 2 0 1 1219 1164 1213
-2414 2 2 0 1 1220 1219 1213
-2415 2 2 0 1 1164 1219 1181
-2416 2 2 0 1 1221 1218 1181
-2417 2 2 0 1 1221 1220 1169
-2418 2 2 0 1 1218 1221 1169
-2419 2 2 0 1 1219 1221 1181
-2420 2 2 0 1 1219 1220 1221
-2421 2 2 0 1 1223 1193 1192
-2422 2 2 0 1 1193 1223 1292
-2423 2 2 0 1 1209 1222 1223
-2424 2 2 0 1 1223 1222 1292
-2425 2 2 0 1 1204 1223 1192
-2426 2 2 0 1 1223 1204 1207
-2427 2 2 0 1 1209 1223 1207
-2428 2 2 0 1 1204 1225 1224
-2429 2 2 0 1 1205 1225 1204
-2430 2 2 0 1 1255 1279 1226
-2431 2 2 0 1 1267 1227 1268
-2432 2 2 0 1 1228 1114 1227
-2433 2 2 0 1 1114 1268 1227
-2434 2 2 0 1 1118 1268 1114
-2435 2 2 0 1 1229 1228 1227
-2436 2 2 0 1 1267 1230 1227
-2437 2 2 0 1 1229 1230 1232
-2438 2 2 0 1 1229 1227 1230
-2439 2 2 0 1 1229 1088 1228
-2440 2 2 0 1 1241 1230 1267
-2441 2 2 0 1 1230 1241 1233
-2442 2 2 0 1 1232 1230 1233
-2443 2 2 0 1 1247 1168 1231
-2444 2 2 0 1 1234 1231 1162
-2445 2 2 0 1 1247 1231 1234
-2446 2 2 0 1 1234 1232 1233
-2447 2 2 0 1 1233 1247 1234
-2448 2 2 0 1 1235 1088 1229
-2449 2 2 0 1 1235 1232 1234
-2450 2 2 0 1 1229 1232 1235
-2451 2 2 0 1 1088 1235 1236
-2452 2 2 0 1 1162 1235 1234
-2453 2 2 0 1 1235 1162 1236
-2454 2 2 0 1 1237 1240 1264
-2455 2 2 0 1 1238 1255 1208
-2456 2 2 0 1 1198 1239 1208
-2457 2 2 0 1 1239 1238 1208
-2458 2 2 0 1 1237 1239 1240
-2459 2 2 0 1 1239 1237 1259
-2460 2 2 0 1 1259 1238 1239
-2461 2 2 0 1 1250 1246 1241
-2462 2 2 0 1 1246 1233 1241
-2463 2 2 0 1 1254 1253 1242
-2464 2 2 0 1 1243 1203 1171
-2465 2 2 0 1 1254 1244 1243
-2466 2 2 0 1 1244 1254 1242
-2467 2 2 0 1 1247 1248 1168
-2468 2 2 0 1 1264 1244 1242
-2469 2 2 0 1 1264 1240 1244
-2470 2 2 0 1 1245 1198 1203
-2471 2 2 0 1 1245 1244 1240
-2472 2 2 0 1 1245 1239 1198
-2473 2 2 0 1 1240 1239 1245
-2474 2 2 0 1 1243 1245 1203
-2475 2 2 0 1 1243 1244 1245
-2476 2 2 0 1 1246 1247 1233
-2477 2 2 0 1 1246 1248 1247
-2478 2 2 0 1 1246 1249 1248
-2479 2 2 0 1 1250 1249 1246
-2480 2 2 0 1 1266 1249 1250
-2481 2 2 0 1 1238 1259 1251
-2482 2 2 0 1 1252 1253 1254
-2483 2 2 0 1 1248 1249 1252
-2484 2 2 0 1 1249 1266 1252
-2485 2 2 0 1 1266 1253 1252
-2486 2 2 0 1 1238 1279 1255
-2487 2 2 0 1 1251 1279 1238
-2488 2 2 0 1 1258 1256 1168
-2489 2 2 0 1 1258 1248 1252
-2490 2 2 0 1 1248 1258 1168
-2491 2 2 0 1 1243 1257 1254
-2492 2 2 0 1 1257 1252 1254
-2493 2 2 0 1 1257 1171 1256
-2494 2 2 0 1 1171 1257 1243
-2495 2 2 0 1 1252 1257 1258
-2496 2 2 0 1 1258 1257 1256
-2497 2 2 0 1 1260 1259 1261
-2498 2 2 0 1 1260 1251 1259
-2499 2 2 0 1 1261 1237 1263
-2500 2 2 0 1 1261 1259 1237
-2501 2 2 0 1 1263 1264 1262
-2502 2 2 0 1 1263 1237 1264
-2503 2 2 0 1 1262 1242 1265
-2504 2 2 0 1 1262 1264 1242
-2505 2 2 0 1 1253 1265 1242
-2506 2 2 0 1 5081 1265 1253
-2507 2 2 0 1 1266 5081 1253
-2508 2 2 0 1 5083 5081 1266
-2509 2 2 0 1 5086 5085 1267
-2510 2 2 0 1 5085 1241 1267
-2511 2 2 0 1 1268 5086 1267
-2512 2 2 0 1 1269 5086 1268
-2513 2 2 0 1 1269 1270 1152
-2514 2 2 0 1 1268 1270 1269
-2515 2 2 0 1 1268 1118 1270
-2516 2 2 0 1 5088 1266 1250
-2517 2 2 0 1 5083 1266 5088
-2518 2 2 0 1 5085 1250 1241
-2519 2 2 0 1 5088 1250 5085
-2520 2 2 0 1 1271 1274 1272
-2521 2 2 0 1 1273 1274 1280
-2522 2 2 0 1 1280 1274 1271
-2523 2 2 0 1 1290 1275 1288
-2524 2 2 0 1 1290 1282 1275
-2525 2 2 0 1 1278 1276 1277
-2526 2 2 0 1 1277 1251 1278
-2527 2 2 0 1 1278 1251 1260
-2528 2 2 0 1 1279 1251 1277
-2529 2 2 0 1 1279 1277 1226
-2530 2 2 0 1 1284 1226 1277
-2531 2 2 0 1 1283 1273 1275
-2532 2 2 0 1 1273 1280 1275
-2533 2 2 0 1 1288 1275 1280
-2534 2 2 0 1 1281 1283 1282
-2535 2 2 0 1 1275 1282 1283
-2536 2 2 0 1 1290 1284 1277
-2537 2 2 0 1 1290 1277 1282
-2538 2 2 0 1 1277 1276 1281
-2539 2 2 0 1 1282 1277 1281
-2540 2 2 0 1 1272 1285 1271
-2541 2 2 0 1 1284 1222 1226
-2542 2 2 0 1 1280 1286 1288
-2543 2 2 0 1 2571 1289 2564
-2544 2 2 0 1 1289 1286 2564
-2545 2 2 0 1 1286 1287 1288
-2546 2 2 0 1 1287 1290 1288
-2547 2 2 0 1 1285 2564 1286
-2548 2 2 0 1 1289 1287 1286
-2549 2 2 0 1 1271 1286 1280
-2550 2 2 0 1 1271 1285 1286
-2551 2 2 0 1 1294 1292 1222
-2552 2 2 0 1 1294 1290 1287
-2553 2 2 0 1 1291 1200 1292
-2554 2 2 0 1 1291 1287 1289
-2555 2 2 0 1 1200 1293 2490
-2556 2 2 0 1 2571 1293 1289
-2557 2 2 0 1 1293 2571 2490
-2558 2 2 0 1 1291 1293 1200
-2559 2 2 0 1 1291 1289 1293
-2560 2 2 0 1 1294 1291 1292
-2561 2 2 0 1 1294 1287 1291
-2562 2 2 0 1 1222 1284 1294
-2563 2 2 0 1 1284 1290 1294
-2564 2 2 0 1 1301 1297 1295
-2565 2 2 0 1 1348 1313 1300
-2566 2 2 0 1 1296 1298 1297
-2567 2 2 0 1 1298 1295 1297
-2568 2 2 0 1 1296 5 1305
-2569 2 2 0 1 1305 1298 1296
-2570 2 2 0 1 5 34 1299
-2571 2 2 0 1 1300 1299 1348
-2572 2 2 0 1 1348 1299 34
-2573 2 2 0 1 1305 5 1299
-2574 2 2 0 1 1305 1299 1300
-2575 2 2 0 1 1295 1303 1301
-2576 2 2 0 1 1302 1306 2693
-2577 2 2 0 1 1298 1305 1304
-2578 2 2 0 1 1305 2596 1304
-2579 2 2 0 1 1295 1298 1303
-2580 2 2 0 1 1304 1303 1298
-2581 2 2 0 1 1305 1300 1302
-2582 2 2 0 1 2596 1305 1302
-2583 2 2 0 1 1302 1300 1306
-2584 2 2 0 1 1313 1306 1300
-2585 2 2 0 1 1322 1307 1320
-2586 2 2 0 1 1308 1307 1376
-2587 2 2 0 1 1376 1354 1308
-2588 2 2 0 1 1307 1322 1376
-2589 2 2 0 1 1312 1311 1308
-2590 2 2 0 1 1311 1307 1308
-2591 2 2 0 1 1307 1311 1320
-2592 2 2 0 1 1310 1320 1311
-2593 2 2 0 1 1352 1309 1310
-2594 2 2 0 1 1311 1352 1310
-2595 2 2 0 1 1311 1312 1352
-2596 2 2 0 1 1314 1315 1313
-2597 2 2 0 1 1315 1306 1313
-2598 2 2 0 1 1314 1326 1351
-2599 2 2 0 1 1314 1351 1315
-2600 2 2 0 1 1326 1325 1318
-2601 2 2 0 1 1318 1351 1326
-2602 2 2 0 1 1317 1325 1316
-2603 2 2 0 1 1325 1317 1318
-2604 2 2 0 1 1316 1319 1353
-2605 2 2 0 1 1353 1317 1316
-2606 2 2 0 1 1352 1319 1309
-2607 2 2 0 1 1319 1352 1353
-2608 2 2 0 1 1310 1321 1320
-2609 2 2 0 1 1320 1321 1424
-2610 2 2 0 1 1322 1320 1424
-2611 2 2 0 1 1323 1424 1321
-2612 2 2 0 1 1349 1324 1346
-2613 2 2 0 1 1346 1326 1314
-2614 2 2 0 1 1324 1330 1332
-2615 2 2 0 1 1324 1332 1346
-2616 2 2 0 1 1328 1325 1326
-2617 2 2 0 1 1346 1328 1326
-2618 2 2 0 1 1310 1335 1321
-2619 2 2 0 1 1327 1316 1325
-2620 2 2 0 1 1328 1327 1325
-2621 2 2 0 1 1346 1332 1328
-2622 2 2 0 1 13 1329 1330
-2623 2 2 0 1 1329 1332 1330
-2624 2 2 0 1 1309 1335 1310
-2625 2 2 0 1 1338 13 1337
-2626 2 2 0 1 13 1338 1329
-2627 2 2 0 1 1331 1329 1338
-2628 2 2 0 1 1323 1321 1345
-2629 2 2 0 1 1323 1345 1484
-2630 2 2 0 1 1327 1329 1331
-2631 2 2 0 1 1328 1332 1327
-2632 2 2 0 1 1332 1329 1327
-2633 2 2 0 1 1333 1331 1338
-2634 2 2 0 1 1316 1327 1331
-2635 2 2 0 1 1316 1331 1319
-2636 2 2 0 1 1331 1333 1334
-2637 2 2 0 1 1333 1335 1334
-2638 2 2 0 1 1331 1334 1319
-2639 2 2 0 1 1334 1309 1319
-2640 2 2 0 1 1334 1335 1309
-2641 2 2 0 1 1335 1333 1341
-2642 2 2 0 1 1321 1336 1345
-2643 2 2 0 1 1335 1341 1336
-2644 2 2 0 1 1335 1336 1321
-2645 2 2 0 1 1338 1337 1339
-2646 2 2 0 1 1339 1337 1340
-2647 2 2 0 1 1339 1333 1338
-2648 2 2 0 1 1333 1339 1341
-2649 2 2 0 1 1340 1342 1344
-2650 2 2 0 1 1344 1339 1340
-2651 2 2 0 1 1344 1345 1336
-2652 2 2 0 1 1336 1341 1344
-2653 2 2 0 1 1344 1341 1339
-2654 2 2 0 1 1342 32 1343
-2655 2 2 0 1 1484 1343 32
-2656 2 2 0 1 1342 1343 1344
-2657 2 2 0 1 1343 1484 1345
-2658 2 2 0 1 1345 1344 1343
-2659 2 2 0 1 1349 1346 1347
-2660 2 2 0 1 1347 1346 1314
-2661 2 2 0 1 1313 1347 1314
-2662 2 2 0 1 1313 1348 1347
-2663 2 2 0 1 1347 1348 1349
-2664 2 2 0 1 34 1349 1348
-2665 2 2 0 1 1350 2693 1315
-2666 2 2 0 1 1306 1315 2693
-2667 2 2 0 1 1351 1350 1315
-2668 2 2 0 1 2694 1350 1351
-2669 2 2 0 1 1351 1318 2694
-2670 2 2 0 1 2694 1318 2697
-2671 2 2 0 1 1317 2697 1318
-2672 2 2 0 1 2699 2697 1317
-2673 2 2 0 1 1317 1353 2699
-2674 2 2 0 1 2699 1353 2700
-2675 2 2 0 1 1352 2700 1353
-2676 2 2 0 1 2701 2700 1352
-2677 2 2 0 1 1352 1312 2701
-2678 2 2 0 1 2701 1312 2703
-2679 2 2 0 1 1308 2703 1312
-2680 2 2 0 1 2704 2703 1308
-2681 2 2 0 1 1308 1354 2704
-2682 2 2 0 1 3041 2704 1354
-2683 2 2 0 1 1395 1355 1356
-2684 2 2 0 1 1355 1370 1356
-2685 2 2 0 1 1357 1395 1359
-2686 2 2 0 1 1356 1359 1395
-2687 2 2 0 1 1367 1357 1358
-2688 2 2 0 1 1359 1358 1357
-2689 2 2 0 1 1361 1360 1362
-2690 2 2 0 1 1361 1362 1363
-2691 2 2 0 1 3041 1360 1361
-2692 2 2 0 1 1360 3041 1354
-2693 2 2 0 1 1366 1411 1364
-2694 2 2 0 1 1364 1365 1366
-2695 2 2 0 1 1363 1362 1411
-2696 2 2 0 1 1366 1363 1411
-2697 2 2 0 1 1367 1365 1364
-2698 2 2 0 1 1365 1367 1358
-2699 2 2 0 1 1368 1378 1371
-2700 2 2 0 1 1378 1369 1371
-2701 2 2 0 1 1378 1400 1369
-2702 2 2 0 1 1355 1368 1370
-2703 2 2 0 1 1371 1370 1368
-2704 2 2 0 1 1369 1400 1372
-2705 2 2 0 1 1373 1372 1400
-2706 2 2 0 1 1372 1373 3045
-2707 2 2 0 1 3045 1373 1374
-2708 2 2 0 1 1374 3046 3045
-2709 2 2 0 1 1374 1383 3046
-2710 2 2 0 1 3046 1383 1375
-2711 2 2 0 1 1791 1375 1790
-2712 2 2 0 1 1375 1383 1790
-2713 2 2 0 1 1381 1790 1383
-2714 2 2 0 1 1376 1322 1485
-2715 2 2 0 1 1368 1377 1378
-2716 2 2 0 1 1379 1403 1531
-2717 2 2 0 1 1531 1380 1379
-2718 2 2 0 1 1395 1396 1355
-2719 2 2 0 1 1392 1355 1396
-2720 2 2 0 1 1368 1355 1392
-2721 2 2 0 1 1377 1368 1392
-2722 2 2 0 1 1380 1733 1379
-2723 2 2 0 1 1383 1384 1381
-2724 2 2 0 1 1404 1393 1382
-2725 2 2 0 1 1408 1488 1414
-2726 2 2 0 1 1374 1394 1383
-2727 2 2 0 1 1383 1385 1384
-2728 2 2 0 1 1385 1733 1384
-2729 2 2 0 1 1385 1394 1393
-2730 2 2 0 1 1383 1394 1385
-2731 2 2 0 1 1386 1387 1391
-2732 2 2 0 1 1386 1391 1406
-2733 2 2 0 1 1390 1386 1382
-2734 2 2 0 1 1382 1386 1406
-2735 2 2 0 1 1388 1500 1474
-2736 2 2 0 1 1388 1474 1389
-2737 2 2 0 1 1377 1392 1388
-2738 2 2 0 1 1389 1377 1388
-2739 2 2 0 1 1387 1389 1474
-2740 2 2 0 1 1387 1386 1389
-2741 2 2 0 1 1389 1390 1377
-2742 2 2 0 1 1389 1386 1390
-2743 2 2 0 1 1391 1402 1406
-2744 2 2 0 1 1406 1404 1382
-2745 2 2 0 1 1398 1432 1500
-2746 2 2 0 1 1398 1500 1388
-2747 2 2 0 1 1392 1396 1398
-2748 2 2 0 1 1388 1392 1398
-2749 2 2 0 1 1397 1437 1432
-2750 2 2 0 1 1397 1432 1398
-2751 2 2 0 1 1488 1401 1485
-2752 2 2 0 1 1390 1378 1377
-2753 2 2 0 1 1390 1400 1378
-2754 2 2 0 1 1408 1401 1488
-2755 2 2 0 1 1374 1393 1394
-2756 2 2 0 1 1357 1410 1395
-2757 2 2 0 1 1396 1395 1410
-2758 2 2 0 1 1396 1410 1398
-2759 2 2 0 1 1397 1398 1410
-2760 2 2 0 1 1373 1382 1393
-2761 2 2 0 1 1393 1374 1373
-2762 2 2 0 1 1367 1418 1357
-2763 2 2 0 1 1418 1410 1357
-2764 2 2 0 1 1399 1393 1404
-2765 2 2 0 1 1404 1379 1399
-2766 2 2 0 1 1385 1393 1399
-2767 2 2 0 1 1373 1400 1382
-2768 2 2 0 1 1382 1400 1390
-2769 2 2 0 1 1401 1362 1360
-2770 2 2 0 1 1408 1362 1401
-2771 2 2 0 1 1354 1376 1407
-2772 2 2 0 1 1401 1407 1485
-2773 2 2 0 1 1485 1407 1376
-2774 2 2 0 1 1402 1403 1405
-2775 2 2 0 1 1404 1405 1379
-2776 2 2 0 1 1403 1379 1405
-2777 2 2 0 1 1402 1405 1406
-2778 2 2 0 1 1405 1404 1406
-2779 2 2 0 1 1354 1407 1360
-2780 2 2 0 1 1407 1401 1360
-2781 2 2 0 1 1408 1411 1362
-2782 2 2 0 1 1408 1413 1411
-2783 2 2 0 1 1409 1433 1437
-2784 2 2 0 1 1418 1409 1410
-2785 2 2 0 1 1437 1397 1409
-2786 2 2 0 1 1409 1397 1410
-2787 2 2 0 1 1364 1411 1413
-2788 2 2 0 1 1413 1417 1364
-2789 2 2 0 1 1412 1414 1416
-2790 2 2 0 1 1408 1412 1413
-2791 2 2 0 1 1412 1408 1414
-2792 2 2 0 1 1733 1399 1379
-2793 2 2 0 1 1733 1385 1399
-2794 2 2 0 1 1417 1367 1364
-2795 2 2 0 1 1419 1498 1433
-2796 2 2 0 1 1498 1415 1416
-2797 2 2 0 1 1415 1412 1416
-2798 2 2 0 1 1409 1419 1433
-2799 2 2 0 1 1415 1417 1413
-2800 2 2 0 1 1415 1413 1412
-2801 2 2 0 1 1498 1419 1415
-2802 2 2 0 1 1419 1417 1415
-2803 2 2 0 1 1409 1418 1419
-2804 2 2 0 1 1418 1367 1417
-2805 2 2 0 1 1419 1418 1417
-2806 2 2 0 1 1483 1323 1484
-2807 2 2 0 1 1322 1424 1481
-2808 2 2 0 1 1322 1481 1485
-2809 2 2 0 1 1682 1683 1460
-2810 2 2 0 1 1522 1420 1516
-2811 2 2 0 1 1458 1430 1460
-2812 2 2 0 1 1423 1420 1522
-2813 2 2 0 1 1420 1423 1483
-2814 2 2 0 1 1458 1671 1421
-2815 2 2 0 1 75 1422 1496
-2816 2 2 0 1 1483 1423 1323
-2817 2 2 0 1 1481 1423 1522
-2818 2 2 0 1 1423 1481 1424
-2819 2 2 0 1 1423 1424 1323
-2820 2 2 0 1 1470 1482 69
-2821 2 2 0 1 1425 1391 1387
-2822 2 2 0 1 1428 1426 1427
-2823 2 2 0 1 1443 1426 1428
-2824 2 2 0 1 1421 1623 1457
-2825 2 2 0 1 1468 1441 1465
-2826 2 2 0 1 1465 1441 1429
-2827 2 2 0 1 1435 1459 69
-2828 2 2 0 1 1470 69 1459
-2829 2 2 0 1 1456 1462 1430
-2830 2 2 0 1 1456 1431 1462
-2831 2 2 0 1 1455 1432 1437
-2832 2 2 0 1 1429 1466 1465
-2833 2 2 0 1 1437 1433 1438
-2834 2 2 0 1 1442 1462 1431
-2835 2 2 0 1 1501 1427 1471
-2836 2 2 0 1 1498 1439 1433
-2837 2 2 0 1 1422 75 1452
-2838 2 2 0 1 1452 1507 1422
-2839 2 2 0 1 1486 1480 1434
-2840 2 2 0 1 1436 1435 376
-2841 2 2 0 1 1682 1436 376
-2842 2 2 0 1 1437 1438 1455
-2843 2 2 0 1 1438 1433 1439
-2844 2 2 0 1 1442 1431 1441
-2845 2 2 0 1 1441 1468 1442
-2846 2 2 0 1 1440 1441 1431
-2847 2 2 0 1 1429 1441 1440
-2848 2 2 0 1 1453 1428 1501
-2849 2 2 0 1 1428 1427 1501
-2850 2 2 0 1 1442 1525 1462
-2851 2 2 0 1 1443 1444 1480
-2852 2 2 0 1 1448 1445 1444
-2853 2 2 0 1 1444 1445 1480
-2854 2 2 0 1 1434 1445 1446
-2855 2 2 0 1 1480 1445 1434
-2856 2 2 0 1 1447 1448 1518
-2857 2 2 0 1 1447 1445 1448
-2858 2 2 0 1 1446 1447 1510
-2859 2 2 0 1 1446 1445 1447
-2860 2 2 0 1 1450 1448 1444
-2861 2 2 0 1 1477 1450 1444
-2862 2 2 0 1 1474 1500 1472
-2863 2 2 0 1 1471 1472 1501
-2864 2 2 0 1 1454 1444 1443
-2865 2 2 0 1 1444 1454 1477
-2866 2 2 0 1 1518 1448 1494
-2867 2 2 0 1 1449 1494 1450
-2868 2 2 0 1 1449 1495 1494
-2869 2 2 0 1 1494 1448 1450
-2870 2 2 0 1 1451 1452 75
-2871 2 2 0 1 1476 1507 1452
-2872 2 2 0 1 1511 1447 1518
-2873 2 2 0 1 1511 1476 1510
-2874 2 2 0 1 1510 1447 1511
-2875 2 2 0 1 1454 1443 1428
-2876 2 2 0 1 1428 1453 1454
-2877 2 2 0 1 1501 1455 1453
-2878 2 2 0 1 1431 1456 1440
-2879 2 2 0 1 1458 1456 1430
-2880 2 2 0 1 1457 1458 1421
-2881 2 2 0 1 1458 1457 1456
-2882 2 2 0 1 1457 1440 1456
-2883 2 2 0 1 1435 1436 1459
-2884 2 2 0 1 1436 1682 1460
-2885 2 2 0 1 1466 1429 1490
-2886 2 2 0 1 1465 1425 1461
-2887 2 2 0 1 1468 1465 1461
-2888 2 2 0 1 1671 1458 1683
-2889 2 2 0 1 1683 1458 1460
-2890 2 2 0 1 1462 1463 1430
-2891 2 2 0 1 1463 1462 1525
-2892 2 2 0 1 1470 1463 1464
-2893 2 2 0 1 1463 1525 1464
-2894 2 2 0 1 1476 1511 1507
-2895 2 2 0 1 1465 1466 1425
-2896 2 2 0 1 1502 1531 1403
-2897 2 2 0 1 1425 1387 1473
-2898 2 2 0 1 1473 1461 1425
-2899 2 2 0 1 1460 1467 1436
-2900 2 2 0 1 1436 1467 1459
-2901 2 2 0 1 1466 1469 1425
-2902 2 2 0 1 1391 1425 1469
-2903 2 2 0 1 1468 1461 1478
-2904 2 2 0 1 1499 1490 1429
-2905 2 2 0 1 1471 1473 1472
-2906 2 2 0 1 1471 1461 1473
-2907 2 2 0 1 1469 1402 1391
-2908 2 2 0 1 1430 1467 1460
-2909 2 2 0 1 1430 1463 1467
-2910 2 2 0 1 1467 1470 1459
-2911 2 2 0 1 1470 1467 1463
-2912 2 2 0 1 1471 1427 1478
-2913 2 2 0 1 1478 1461 1471
-2914 2 2 0 1 1402 1469 1504
-2915 2 2 0 1 1387 1474 1473
-2916 2 2 0 1 1472 1473 1474
-2917 2 2 0 1 1416 1475 1495
-2918 2 2 0 1 1414 1475 1416
-2919 2 2 0 1 1466 1490 1504
-2920 2 2 0 1 1469 1466 1504
-2921 2 2 0 1 1451 1476 1452
-2922 2 2 0 1 1449 1477 1439
-2923 2 2 0 1 1477 1449 1450
-2924 2 2 0 1 1439 1477 1438
-2925 2 2 0 1 1468 1478 1442
-2926 2 2 0 1 1427 1426 1478
-2927 2 2 0 1 1442 1478 1524
-2928 2 2 0 1 1426 1524 1478
-2929 2 2 0 1 123 1482 1492
-2930 2 2 0 1 1479 1426 1443
-2931 2 2 0 1 1479 1443 1480
-2932 2 2 0 1 1481 1523 1485
-2933 2 2 0 1 1481 1522 1523
-2934 2 2 0 1 32 128 1497
-2935 2 2 0 1 32 1497 1484
-2936 2 2 0 1 1470 1492 1482
-2937 2 2 0 1 1470 1464 1492
-2938 2 2 0 1 1497 1483 1484
-2939 2 2 0 1 1485 1523 1488
-2940 2 2 0 1 1487 1515 151
-2941 2 2 0 1 1486 1434 1487
-2942 2 2 0 1 1488 1475 1414
-2943 2 2 0 1 1502 1505 1489
-2944 2 2 0 1 1504 1490 1505
-2945 2 2 0 1 1491 123 1493
-2946 2 2 0 1 123 1492 1493
-2947 2 2 0 1 1493 1492 1464
-2948 2 2 0 1 1475 1516 1512
-2949 2 2 0 1 1518 1494 1512
-2950 2 2 0 1 1512 1495 1475
-2951 2 2 0 1 1512 1494 1495
-2952 2 2 0 1 128 1496 1497
-2953 2 2 0 1 1497 1420 1483
-2954 2 2 0 1 1496 1422 1497
-2955 2 2 0 1 1422 1420 1497
-2956 2 2 0 1 1508 1476 1451
-2957 2 2 0 1 1449 1498 1495
-2958 2 2 0 1 1416 1495 1498
-2959 2 2 0 1 1498 1449 1439
-2960 2 2 0 1 1453 1455 1454
-2961 2 2 0 1 1455 1438 1454
-2962 2 2 0 1 1438 1477 1454
-2963 2 2 0 1 1457 1623 1499
-2964 2 2 0 1 1499 1623 1624
-2965 2 2 0 1 1499 1429 1440
-2966 2 2 0 1 1457 1499 1440
-2967 2 2 0 1 152 1515 1519
-2968 2 2 0 1 1510 1519 1446
-2969 2 2 0 1 1472 1500 1501
-2970 2 2 0 1 1455 1501 1500
-2971 2 2 0 1 1500 1432 1455
-2972 2 2 0 1 1502 1403 1503
-2973 2 2 0 1 1505 1503 1504
-2974 2 2 0 1 1502 1503 1505
-2975 2 2 0 1 1506 1420 1422
-2976 2 2 0 1 1506 1516 1420
-2977 2 2 0 1 1422 1507 1506
-2978 2 2 0 1 1509 1476 1508
-2979 2 2 0 1 1509 1510 1476
-2980 2 2 0 1 1511 1517 1507
-2981 2 2 0 1 1517 1512 1516
-2982 2 2 0 1 1499 1513 1490
-2983 2 2 0 1 1505 1490 1513
-2984 2 2 0 1 1624 1513 1499
-2985 2 2 0 1 1487 1521 1486
-2986 2 2 0 1 1434 1514 1487
-2987 2 2 0 1 1514 1519 1515
-2988 2 2 0 1 1515 1487 1514
-2989 2 2 0 1 1517 1516 1506
-2990 2 2 0 1 1517 1506 1507
-2991 2 2 0 1 1402 1503 1403
-2992 2 2 0 1 1503 1402 1504
-2993 2 2 0 1 1514 1434 1446
-2994 2 2 0 1 1446 1519 1514
-2995 2 2 0 1 1511 1518 1517
-2996 2 2 0 1 1512 1517 1518
-2997 2 2 0 1 1624 1489 1513
-2998 2 2 0 1 1513 1489 1505
-2999 2 2 0 1 151 1491 1521
-3000 2 2 0 1 1491 1493 1521
-3001 2 2 0 1 151 1521 1487
-3002 2 2 0 1 152 1509 1508
-3003 2 2 0 1 1519 1509 152
-3004 2 2 0 1 1509 1519 1510
-3005 2 2 0 1 1520 1486 1521
-3006 2 2 0 1 1521 1493 1520
-3007 2 2 0 1 1464 1525 1520
-3008 2 2 0 1 1493 1464 1520
-3009 2 2 0 1 1522 1516 1523
-3010 2 2 0 1 1475 1523 1516
-3011 2 2 0 1 1475 1488 1523
-3012 2 2 0 1 1486 1479 1480
-3013 2 2 0 1 1479 1486 1520
-3014 2 2 0 1 1524 1525 1442
-3015 2 2 0 1 1520 1525 1524
-3016 2 2 0 1 1479 1524 1426
-3017 2 2 0 1 1520 1524 1479
-3018 2 2 0 1 1526 1527 1798
-3019 2 2 0 1 1542 1526 1536
-3020 2 2 0 1 1615 1635 1630
-3021 2 2 0 1 1526 1798 1540
-3022 2 2 0 1 232 1627 1528
-3023 2 2 0 1 232 1626 1627
-3024 2 2 0 1 1684 1683 1682
-3025 2 2 0 1 1606 1529 1530
-3026 2 2 0 1 1531 1502 1532
-3027 2 2 0 1 1531 1532 1538
-3028 2 2 0 1 1634 1489 1624
-3029 2 2 0 1 1759 1534 1533
-3030 2 2 0 1 1535 1536 1534
-3031 2 2 0 1 1534 1609 1535
-3032 2 2 0 1 1534 1759 1609
-3033 2 2 0 1 1535 1560 1536
-3034 2 2 0 1 1609 1759 1758
-3035 2 2 0 1 1537 1739 1538
-3036 2 2 0 1 1538 1532 1537
-3037 2 2 0 1 1530 1537 1539
-3038 2 2 0 1 1532 1539 1537
-3039 2 2 0 1 1537 1530 1529
-3040 2 2 0 1 1764 1533 1540
-3041 2 2 0 1 1540 1533 1534
-3042 2 2 0 1 1526 1540 1536
-3043 2 2 0 1 1540 1534 1536
-3044 2 2 0 1 1541 1527 1542
-3045 2 2 0 1 1526 1542 1527
-3046 2 2 0 1 1798 2017 1764
-3047 2 2 0 1 1764 1540 1798
-3048 2 2 0 1 649 1626 232
-3049 2 2 0 1 1626 649 1543
-3050 2 2 0 1 1647 1640 1544
-3051 2 2 0 1 1611 1647 1552
-3052 2 2 0 1 1611 1640 1647
-3053 2 2 0 1 1640 1641 1544
-3054 2 2 0 1 1545 1641 1648
-3055 2 2 0 1 1544 1641 1545
-3056 2 2 0 1 1546 1547 1666
-3057 2 2 0 1 1547 1617 1581
-3058 2 2 0 1 1546 1584 1547
-3059 2 2 0 1 1660 1550 1583
-3060 2 2 0 1 1551 1579 1548
-3061 2 2 0 1 1549 1559 1558
-3062 2 2 0 1 1549 1612 1559
-3063 2 2 0 1 1536 1561 1542
-3064 2 2 0 1 1560 1561 1536
-3065 2 2 0 1 1550 1590 1583
-3066 2 2 0 1 1551 1657 1653
-3067 2 2 0 1 1564 1612 1556
-3068 2 2 0 1 1592 1556 1578
-3069 2 2 0 1 1648 1641 1646
-3070 2 2 0 1 1550 1660 1646
-3071 2 2 0 1 1552 1647 1553
-3072 2 2 0 1 1551 1553 1579
-3073 2 2 0 1 1657 1551 1554
-3074 2 2 0 1 1666 1675 1546
-3075 2 2 0 1 1583 1582 1555
-3076 2 2 0 1 1576 1558 1569
-3077 2 2 0 1 1595 1564 1556
-3078 2 2 0 1 1578 1596 1592
-3079 2 2 0 1 1611 1552 1674
-3080 2 2 0 1 1557 1558 1559
-3081 2 2 0 1 1557 1561 1560
-3082 2 2 0 1 1557 1559 1561
-3083 2 2 0 1 1600 1604 1666
-3084 2 2 0 1 1606 1632 1628
-3085 2 2 0 1 1590 1550 1589
-3086 2 2 0 1 1594 1564 1595
-3087 2 2 0 1 1562 1613 1563
-3088 2 2 0 1 1612 1564 1613
-3089 2 2 0 1 1581 1596 1599
-3090 2 2 0 1 1581 1599 1600
-3091 2 2 0 1 1561 1559 1565
-3092 2 2 0 1 1561 1565 1542
-3093 2 2 0 1 1559 1566 1565
-3094 2 2 0 1 1622 1586 1575
-3095 2 2 0 1 1570 1586 1622
-3096 2 2 0 1 1567 1622 1575
-3097 2 2 0 1 1568 1569 1590
-3098 2 2 0 1 1568 1576 1569
-3099 2 2 0 1 1555 1680 1583
-3100 2 2 0 1 1586 1570 1587
-3101 2 2 0 1 1618 1636 1616
-3102 2 2 0 1 1608 1545 1648
-3103 2 2 0 1 1617 1591 1581
-3104 2 2 0 1 1592 1591 1573
-3105 2 2 0 1 1609 1610 1535
-3106 2 2 0 1 1598 1604 1600
-3107 2 2 0 1 1570 1659 1587
-3108 2 2 0 1 1669 1659 1570
-3109 2 2 0 1 1601 375 309
-3110 2 2 0 1 1571 375 1601
-3111 2 2 0 1 1593 1657 1554
-3112 2 2 0 1 1572 1643 1563
-3113 2 2 0 1 1564 1594 1572
-3114 2 2 0 1 1572 1594 1643
-3115 2 2 0 1 1574 1573 1615
-3116 2 2 0 1 1615 1630 1574
-3117 2 2 0 1 1574 1595 1573
-3118 2 2 0 1 1575 1603 1567
-3119 2 2 0 1 1575 1607 1603
-3120 2 2 0 1 1576 1577 1578
-3121 2 2 0 1 1578 1577 1596
-3122 2 2 0 1 1539 1602 1530
-3123 2 2 0 1 1530 1602 1607
-3124 2 2 0 1 1585 1569 1558
-3125 2 2 0 1 1582 1569 1585
-3126 2 2 0 1 1606 1687 1529
-3127 2 2 0 1 1588 1548 1579
-3128 2 2 0 1 1563 1613 1572
-3129 2 2 0 1 1564 1572 1613
-3130 2 2 0 1 1555 1610 1580
-3131 2 2 0 1 1610 1609 1580
-3132 2 2 0 1 1547 1581 1600
-3133 2 2 0 1 1547 1600 1666
-3134 2 2 0 1 1590 1569 1582
-3135 2 2 0 1 1590 1582 1583
-3136 2 2 0 1 1680 1660 1583
-3137 2 2 0 1 1554 1551 1548
-3138 2 2 0 1 1653 1552 1553
-3139 2 2 0 1 1553 1551 1653
-3140 2 2 0 1 1584 1616 1617
-3141 2 2 0 1 1617 1547 1584
-3142 2 2 0 1 1589 1598 1597
-3143 2 2 0 1 1556 1549 1578
-3144 2 2 0 1 1612 1549 1556
-3145 2 2 0 1 1576 1578 1549
-3146 2 2 0 1 1576 1549 1558
-3147 2 2 0 1 1560 1585 1557
-3148 2 2 0 1 1557 1585 1558
-3149 2 2 0 1 1646 1652 1648
-3150 2 2 0 1 1652 1646 1660
-3151 2 2 0 1 1586 1587 1588
-3152 2 2 0 1 1587 1548 1588
-3153 2 2 0 1 1568 1589 1597
-3154 2 2 0 1 1589 1568 1590
-3155 2 2 0 1 1580 1680 1555
-3156 2 2 0 1 1595 1592 1573
-3157 2 2 0 1 1592 1595 1556
-3158 2 2 0 1 1581 1591 1596
-3159 2 2 0 1 1596 1591 1592
-3160 2 2 0 1 1593 1633 1571
-3161 2 2 0 1 1593 1554 1633
-3162 2 2 0 1 1568 1597 1577
-3163 2 2 0 1 1576 1568 1577
-3164 2 2 0 1 1630 1594 1574
-3165 2 2 0 1 1594 1595 1574
-3166 2 2 0 1 1599 1577 1597
-3167 2 2 0 1 1577 1599 1596
-3168 2 2 0 1 1597 1598 1599
-3169 2 2 0 1 1599 1598 1600
-3170 2 2 0 1 1571 1601 1593
-3171 2 2 0 1 1603 1602 1634
-3172 2 2 0 1 1602 1603 1607
-3173 2 2 0 1 1635 1615 1614
-3174 2 2 0 1 1636 1614 1616
-3175 2 2 0 1 1605 1604 1598
-3176 2 2 0 1 1589 1550 1605
-3177 2 2 0 1 1589 1605 1598
-3178 2 2 0 1 1667 1666 1604
-3179 2 2 0 1 1607 1575 1632
-3180 2 2 0 1 1632 1606 1607
-3181 2 2 0 1 1606 1530 1607
-3182 2 2 0 1 1608 1677 1545
-3183 2 2 0 1 1758 1712 1580
-3184 2 2 0 1 1758 1580 1609
-3185 2 2 0 1 1582 1610 1555
-3186 2 2 0 1 1560 1535 1610
-3187 2 2 0 1 1610 1585 1560
-3188 2 2 0 1 1610 1582 1585
-3189 2 2 0 1 1667 1611 1674
-3190 2 2 0 1 1562 1908 1566
-3191 2 2 0 1 1613 1562 1566
-3192 2 2 0 1 1559 1612 1566
-3193 2 2 0 1 1612 1613 1566
-3194 2 2 0 1 1614 1615 1573
-3195 2 2 0 1 1591 1614 1573
-3196 2 2 0 1 1617 1616 1614
-3197 2 2 0 1 1614 1591 1617
-3198 2 2 0 1 1714 1716 1661
-3199 2 2 0 1 1618 305 306
-3200 2 2 0 1 1616 1584 1618
-3201 2 2 0 1 1620 309 1619
-3202 2 2 0 1 1601 309 1620
-3203 2 2 0 1 1593 1620 1657
-3204 2 2 0 1 1593 1601 1620
-3205 2 2 0 1 1421 1621 1623
-3206 2 2 0 1 1621 1567 1623
-3207 2 2 0 1 1621 1570 1622
-3208 2 2 0 1 1567 1621 1622
-3209 2 2 0 1 1623 1567 1624
-3210 2 2 0 1 1624 1603 1634
-3211 2 2 0 1 1603 1624 1567
-3212 2 2 0 1 1627 1626 1635
-3213 2 2 0 1 1629 1635 1626
-3214 2 2 0 1 1543 1625 1626
-3215 2 2 0 1 1625 1629 1626
-3216 2 2 0 1 1541 1542 1565
-3217 2 2 0 1 1627 1636 1528
-3218 2 2 0 1 1628 1687 1606
-3219 2 2 0 1 1677 1687 1628
-3220 2 2 0 1 1677 1678 1687
-3221 2 2 0 1 1625 1631 1629
-3222 2 2 0 1 1635 1629 1630
-3223 2 2 0 1 1630 1629 1631
-3224 2 2 0 1 1586 1632 1575
-3225 2 2 0 1 1588 1632 1586
-3226 2 2 0 1 1684 1633 1669
-3227 2 2 0 1 1684 1571 1633
-3228 2 2 0 1 1633 1659 1669
-3229 2 2 0 1 1539 1502 1489
-3230 2 2 0 1 1502 1539 1532
-3231 2 2 0 1 1539 1489 1634
-3232 2 2 0 1 1602 1539 1634
-3233 2 2 0 1 1636 1627 1635
-3234 2 2 0 1 1636 1635 1614
-3235 2 2 0 1 1908 1541 1565
-3236 2 2 0 1 1565 1566 1908
-3237 2 2 0 1 1636 306 1528
-3238 2 2 0 1 306 1636 1618
-3239 2 2 0 1 1650 1637 1685
-3240 2 2 0 1 1639 344 1637
-3241 2 2 0 1 1661 1638 1714
-3242 2 2 0 1 1651 1674 1658
-3243 2 2 0 1 1658 1639 1651
-3244 2 2 0 1 1640 1655 1641
-3245 2 2 0 1 1642 1631 1643
-3246 2 2 0 1 1594 1630 1642
-3247 2 2 0 1 1630 1631 1642
-3248 2 2 0 1 1642 1643 1594
-3249 2 2 0 1 1686 1584 1546
-3250 2 2 0 1 1632 1588 1644
-3251 2 2 0 1 1632 1644 1628
-3252 2 2 0 1 1653 1654 1552
-3253 2 2 0 1 1579 1553 1645
-3254 2 2 0 1 1553 1647 1645
-3255 2 2 0 1 1605 1550 1656
-3256 2 2 0 1 1656 1646 1641
-3257 2 2 0 1 1656 1550 1646
-3258 2 2 0 1 1647 1544 1662
-3259 2 2 0 1 1648 1649 1608
-3260 2 2 0 1 1637 1650 1639
-3261 2 2 0 1 1650 1651 1639
-3262 2 2 0 1 1652 1649 1648
-3263 2 2 0 1 1649 1652 1661
-3264 2 2 0 1 1653 1663 1654
-3265 2 2 0 1 1579 1645 1588
-3266 2 2 0 1 1662 1645 1647
-3267 2 2 0 1 1641 1655 1656
-3268 2 2 0 1 1655 1605 1656
-3269 2 2 0 1 1663 1653 1657
-3270 2 2 0 1 1620 1663 1657
-3271 2 2 0 1 356 344 1664
-3272 2 2 0 1 1664 344 1639
-3273 2 2 0 1 1639 1658 1664
-3274 2 2 0 1 1674 1654 1658
-3275 2 2 0 1 1552 1654 1674
-3276 2 2 0 1 1587 1659 1548
-3277 2 2 0 1 1659 1554 1548
-3278 2 2 0 1 1633 1554 1659
-3279 2 2 0 1 1650 1675 1651
-3280 2 2 0 1 1638 1652 1660
-3281 2 2 0 1 1680 1638 1660
-3282 2 2 0 1 1638 1661 1652
-3283 2 2 0 1 1662 1628 1644
-3284 2 2 0 1 1619 1663 1620
-3285 2 2 0 1 1604 1605 1655
-3286 2 2 0 1 356 1663 1619
-3287 2 2 0 1 1663 356 1664
-3288 2 2 0 1 1584 1686 1688
-3289 2 2 0 1 1584 1688 1618
-3290 2 2 0 1 1670 1621 1421
-3291 2 2 0 1 1666 1665 1675
-3292 2 2 0 1 1665 1666 1667
-3293 2 2 0 1 1668 1677 1628
-3294 2 2 0 1 1628 1662 1668
-3295 2 2 0 1 1640 1611 1672
-3296 2 2 0 1 1667 1672 1611
-3297 2 2 0 1 1669 1570 1670
-3298 2 2 0 1 1670 1570 1621
-3299 2 2 0 1 1421 1671 1670
-3300 2 2 0 1 1671 1669 1670
-3301 2 2 0 1 363 305 1688
-3302 2 2 0 1 1688 305 1618
-3303 2 2 0 1 1739 1529 1735
-3304 2 2 0 1 1537 1529 1739
-3305 2 2 0 1 1645 1644 1588
-3306 2 2 0 1 1644 1645 1662
-3307 2 2 0 1 1604 1672 1667
-3308 2 2 0 1 1655 1640 1672
-3309 2 2 0 1 1604 1655 1672
-3310 2 2 0 1 1714 1638 1673
-3311 2 2 0 1 1675 1665 1651
-3312 2 2 0 1 1674 1651 1665
-3313 2 2 0 1 1667 1674 1665
-3314 2 2 0 1 1544 1545 1668
-3315 2 2 0 1 1668 1662 1544
-3316 2 2 0 1 1668 1545 1677
-3317 2 2 0 1 1546 1675 1686
-3318 2 2 0 1 1650 1686 1675
-3319 2 2 0 1 1663 1664 1654
-3320 2 2 0 1 1664 1658 1654
-3321 2 2 0 1 1571 1676 375
-3322 2 2 0 1 1677 1608 1678
-3323 2 2 0 1 1638 1679 1673
-3324 2 2 0 1 1638 1680 1679
-3325 2 2 0 1 376 1676 1681
-3326 2 2 0 1 1681 1682 376
-3327 2 2 0 1 1673 1679 1712
-3328 2 2 0 1 1580 1712 1679
-3329 2 2 0 1 1679 1680 1580
-3330 2 2 0 1 1676 1571 1681
-3331 2 2 0 1 1681 1571 1684
-3332 2 2 0 1 1681 1684 1682
-3333 2 2 0 1 1683 1669 1671
-3334 2 2 0 1 1669 1683 1684
-3335 2 2 0 1 1689 1650 1685
-3336 2 2 0 1 1686 1650 1689
-3337 2 2 0 1 1689 1685 363
-3338 2 2 0 1 1687 1678 1690
-3339 2 2 0 1 1687 1690 1529
-3340 2 2 0 1 363 1688 1689
-3341 2 2 0 1 1688 1686 1689
-3342 2 2 0 1 1735 1529 1690
-3343 2 2 0 1 1692 1735 1690
-3344 2 2 0 1 1692 1693 1691
-3345 2 2 0 1 1692 1690 1693
-3346 2 2 0 1 1690 1678 1693
-3347 2 2 0 1 1716 1691 1693
-3348 2 2 0 1 1661 1716 1693
-3349 2 2 0 1 1693 1649 1661
-3350 2 2 0 1 1649 1693 1608
-3351 2 2 0 1 1678 1608 1693
-3352 2 2 0 1 1697 2053 1696
-3353 2 2 0 1 1694 1715 1713
-3354 2 2 0 1 1741 1695 1762
-3355 2 2 0 1 1762 1695 1732
-3356 2 2 0 1 1696 1726 1697
-3357 2 2 0 1 1697 1729 2014
-3358 2 2 0 1 1726 1730 1729
-3359 2 2 0 1 1726 1729 1697
-3360 2 2 0 1 1698 1699 1702
-3361 2 2 0 1 1724 1731 1730
-3362 2 2 0 1 1698 1732 1699
-3363 2 2 0 1 1699 1732 1695
-3364 2 2 0 1 1695 1741 1720
-3365 2 2 0 1 1700 1765 1761
-3366 2 2 0 1 1720 1699 1695
-3367 2 2 0 1 1704 1786 1788
-3368 2 2 0 1 1703 1704 1788
-3369 2 2 0 1 1701 1744 1704
-3370 2 2 0 1 1701 1704 1703
-3371 2 2 0 1 1702 1703 1788
-3372 2 2 0 1 1702 1699 1703
-3373 2 2 0 1 1701 1703 1720
-3374 2 2 0 1 1703 1699 1720
-3375 2 2 0 1 1734 1744 1701
-3376 2 2 0 1 1734 1701 1719
-3377 2 2 0 1 1707 1786 1705
-3378 2 2 0 1 1786 1704 1705
-3379 2 2 0 1 1744 1743 1705
-3380 2 2 0 1 1704 1744 1705
-3381 2 2 0 1 1706 1744 1734
-3382 2 2 0 1 1711 1710 1707
-3383 2 2 0 1 1711 1707 1705
-3384 2 2 0 1 1743 1708 1711
-3385 2 2 0 1 1705 1743 1711
-3386 2 2 0 1 1709 1777 1710
-3387 2 2 0 1 1709 1710 1711
-3388 2 2 0 1 1708 1694 1709
-3389 2 2 0 1 1711 1708 1709
-3390 2 2 0 1 1712 1758 1750
-3391 2 2 0 1 1713 1715 1751
-3392 2 2 0 1 1715 1750 1751
-3393 2 2 0 1 1673 1717 1714
-3394 2 2 0 1 1717 1715 1694
-3395 2 2 0 1 1714 1718 1716
-3396 2 2 0 1 1714 1717 1718
-3397 2 2 0 1 1718 1694 1708
-3398 2 2 0 1 1694 1718 1717
-3399 2 2 0 1 1719 1701 1720
-3400 2 2 0 1 1719 1720 1741
-3401 2 2 0 1 1722 1721 1768
-3402 2 2 0 1 1721 1722 1723
-3403 2 2 0 1 1765 1721 1723
-3404 2 2 0 1 1765 1723 1761
-3405 2 2 0 1 1747 1761 1723
-3406 2 2 0 1 1753 1533 1764
-3407 2 2 0 1 1753 1724 1725
-3408 2 2 0 1 1726 1696 1700
-3409 2 2 0 1 1726 1700 1761
-3410 2 2 0 1 1726 1761 1730
-3411 2 2 0 1 1739 1727 1538
-3412 2 2 0 1 1762 1727 1741
-3413 2 2 0 1 1728 2014 1731
-3414 2 2 0 1 1729 1730 1731
-3415 2 2 0 1 1731 2014 1729
-3416 2 2 0 1 1381 1384 1732
-3417 2 2 0 1 1732 1698 1381
-3418 2 2 0 1 1762 1384 1733
-3419 2 2 0 1 1732 1384 1762
-3420 2 2 0 1 1691 1742 1692
-3421 2 2 0 1 1734 1742 1706
-3422 2 2 0 1 1692 1745 1735
-3423 2 2 0 1 1734 1719 1745
-3424 2 2 0 1 1725 1756 1755
-3425 2 2 0 1 1759 1533 1757
-3426 2 2 0 1 1755 1757 1725
-3427 2 2 0 1 1735 1740 1739
-3428 2 2 0 1 1741 1740 1719
-3429 2 2 0 1 1673 1736 1717
-3430 2 2 0 1 1715 1717 1736
-3431 2 2 0 1 1751 1737 1722
-3432 2 2 0 1 1743 1746 1708
-3433 2 2 0 1 1718 1708 1746
-3434 2 2 0 1 1709 1748 1777
-3435 2 2 0 1 1749 1713 1751
-3436 2 2 0 1 1691 1716 1738
-3437 2 2 0 1 1718 1738 1716
-3438 2 2 0 1 1727 1739 1740
-3439 2 2 0 1 1727 1740 1741
-3440 2 2 0 1 1738 1742 1691
-3441 2 2 0 1 1706 1742 1738
-3442 2 2 0 1 1746 1743 1744
-3443 2 2 0 1 1706 1746 1744
-3444 2 2 0 1 1742 1745 1692
-3445 2 2 0 1 1745 1742 1734
-3446 2 2 0 1 1745 1740 1735
-3447 2 2 0 1 1740 1745 1719
-3448 2 2 0 1 1777 1748 1769
-3449 2 2 0 1 1718 1746 1738
-3450 2 2 0 1 1738 1746 1706
-3451 2 2 0 1 1723 1737 1747
-3452 2 2 0 1 1737 1723 1722
-3453 2 2 0 1 1712 1736 1673
-3454 2 2 0 1 1750 1736 1712
-3455 2 2 0 1 1736 1750 1715
-3456 2 2 0 1 1748 1694 1713
-3457 2 2 0 1 1748 1709 1694
-3458 2 2 0 1 1722 1768 1749
-3459 2 2 0 1 1749 1751 1722
-3460 2 2 0 1 1769 1749 1768
-3461 2 2 0 1 1750 1737 1751
-3462 2 2 0 1 1750 1755 1737
-3463 2 2 0 1 1752 1728 1754
-3464 2 2 0 1 1728 1731 1754
-3465 2 2 0 1 1753 1754 1724
-3466 2 2 0 1 1754 1731 1724
-3467 2 2 0 1 1747 1737 1756
-3468 2 2 0 1 1755 1756 1737
-3469 2 2 0 1 1753 1757 1533
-3470 2 2 0 1 1757 1753 1725
-3471 2 2 0 1 1758 1759 1760
-3472 2 2 0 1 1755 1750 1760
-3473 2 2 0 1 1758 1760 1750
-3474 2 2 0 1 1760 1759 1757
-3475 2 2 0 1 1757 1755 1760
-3476 2 2 0 1 1769 1748 1749
-3477 2 2 0 1 1713 1749 1748
-3478 2 2 0 1 1724 1730 1756
-3479 2 2 0 1 1761 1756 1730
-3480 2 2 0 1 1747 1756 1761
-3481 2 2 0 1 1724 1756 1725
-3482 2 2 0 1 1763 1538 1727
-3483 2 2 0 1 1531 1763 1380
-3484 2 2 0 1 1763 1531 1538
-3485 2 2 0 1 1727 1762 1763
-3486 2 2 0 1 1763 1733 1380
-3487 2 2 0 1 1762 1733 1763
-3488 2 2 0 1 1764 1754 1753
-3489 2 2 0 1 1752 1764 2017
-3490 2 2 0 1 1764 1752 1754
-3491 2 2 0 1 1700 1696 1793
-3492 2 2 0 1 3068 1789 1793
-3493 2 2 0 1 1765 1700 1784
-3494 2 2 0 1 1789 1785 1784
-3495 2 2 0 1 1766 1721 1765
-3496 2 2 0 1 1785 3061 1766
-3497 2 2 0 1 1768 1721 1767
-3498 2 2 0 1 3061 3058 1767
-3499 2 2 0 1 1779 1769 1768
-3500 2 2 0 1 3058 3055 1779
-3501 2 2 0 1 1777 1769 1778
-3502 2 2 0 1 3055 3054 1778
-3503 2 2 0 1 3054 1780 1770
-3504 2 2 0 1 1710 1777 1770
-3505 2 2 0 1 1710 1782 1707
-3506 2 2 0 1 1780 1783 1782
-3507 2 2 0 1 1786 1707 1771
-3508 2 2 0 1 1771 1783 1787
-3509 2 2 0 1 1786 1772 1788
-3510 2 2 0 1 1787 1773 1772
-3511 2 2 0 1 1702 1788 1781
-3512 2 2 0 1 1781 1773 1774
-3513 2 2 0 1 1774 1775 1776
-3514 2 2 0 1 1702 1776 1698
-3515 2 2 0 1 1778 1770 1777
-3516 2 2 0 1 1778 3054 1770
-3517 2 2 0 1 1779 1778 1769
-3518 2 2 0 1 1779 3055 1778
-3519 2 2 0 1 1770 1782 1710
-3520 2 2 0 1 1770 1780 1782
-3521 2 2 0 1 1767 1779 1768
-3522 2 2 0 1 1767 3058 1779
-3523 2 2 0 1 1781 1776 1702
-3524 2 2 0 1 1781 1774 1776
-3525 2 2 0 1 1766 1767 1721
-3526 2 2 0 1 1766 3061 1767
-3527 2 2 0 1 1771 1707 1782
-3528 2 2 0 1 1771 1782 1783
-3529 2 2 0 1 1784 1766 1765
-3530 2 2 0 1 1784 1785 1766
-3531 2 2 0 1 1771 1772 1786
-3532 2 2 0 1 1771 1787 1772
-3533 2 2 0 1 1781 1788 1772
-3534 2 2 0 1 1781 1772 1773
-3535 2 2 0 1 1793 1784 1700
-3536 2 2 0 1 1793 1789 1784
-3537 2 2 0 1 1381 1698 1790
-3538 2 2 0 1 1792 4100 3068
-3539 2 2 0 1 1790 1775 1791
-3540 2 2 0 1 2053 1792 1696
-3541 2 2 0 1 1792 1793 1696
-3542 2 2 0 1 1793 1792 3068
-3543 2 2 0 1 1790 1698 1776
-3544 2 2 0 1 1790 1776 1775
-3545 2 2 0 1 1799 2089 2153
-3546 2 2 0 1 2153 2006 1799
-3547 2 2 0 1 1824 1880 1796
-3548 2 2 0 1 583 1800 1940
-3549 2 2 0 1 1819 1871 1842
-3550 2 2 0 1 1800 1794 1940
-3551 2 2 0 1 1527 1541 1820
-3552 2 2 0 1 1541 1910 1820
-3553 2 2 0 1 2003 1996 1901
-3554 2 2 0 1 1795 1796 2125
-3555 2 2 0 1 1563 1643 1840
-3556 2 2 0 1 2121 1816 1823
-3557 2 2 0 1 2133 1852 1797
-3558 2 2 0 1 1820 1798 1527
-3559 2 2 0 1 1824 2089 1799
-3560 2 2 0 1 1819 1820 1849
-3561 2 2 0 1 1800 1801 1794
-3562 2 2 0 1 1801 2157 1794
-3563 2 2 0 1 1824 1795 2089
-3564 2 2 0 1 1795 1824 1796
-3565 2 2 0 1 1802 1870 1803
-3566 2 2 0 1 1881 1804 1843
-3567 2 2 0 1 1870 1802 1827
-3568 2 2 0 1 1804 1881 1827
-3569 2 2 0 1 1847 1829 1806
-3570 2 2 0 1 1927 1805 1811
-3571 2 2 0 1 1806 1927 1847
-3572 2 2 0 1 1833 1913 1892
-3573 2 2 0 1 1807 1833 1892
-3574 2 2 0 1 1922 1847 1821
-3575 2 2 0 1 1830 1802 1926
-3576 2 2 0 1 1812 1804 1830
-3577 2 2 0 1 1804 1812 1810
-3578 2 2 0 1 1804 1810 1843
-3579 2 2 0 1 2133 1797 1846
-3580 2 2 0 1 1808 1846 1797
-3581 2 2 0 1 1812 1828 1945
-3582 2 2 0 1 1562 1563 1839
-3583 2 2 0 1 1814 1809 1855
-3584 2 2 0 1 1810 1851 1843
-3585 2 2 0 1 1899 1831 1898
-3586 2 2 0 1 1835 1831 1899
-3587 2 2 0 1 1858 1814 1855
-3588 2 2 0 1 1858 1811 1814
-3589 2 2 0 1 1855 1854 1858
-3590 2 2 0 1 1797 1813 1808
-3591 2 2 0 1 1812 1813 1810
-3592 2 2 0 1 1817 1809 1814
-3593 2 2 0 1 1821 1815 1922
-3594 2 2 0 1 1823 1816 1915
-3595 2 2 0 1 1853 1840 1898
-3596 2 2 0 1 1880 1824 1882
-3597 2 2 0 1 1909 1809 1817
-3598 2 2 0 1 1909 1817 1910
-3599 2 2 0 1 1824 1799 1818
-3600 2 2 0 1 1838 1818 1837
-3601 2 2 0 1 1811 1805 1914
-3602 2 2 0 1 1914 1805 1825
-3603 2 2 0 1 1798 1820 1841
-3604 2 2 0 1 1819 1841 1820
-3605 2 2 0 1 1854 1821 1848
-3606 2 2 0 1 1847 1848 1821
-3607 2 2 0 1 1881 1844 1880
-3608 2 2 0 1 1844 1881 1843
-3609 2 2 0 1 1562 1822 1908
-3610 2 2 0 1 1850 1820 1910
-3611 2 2 0 1 1849 1820 1850
-3612 2 2 0 1 2121 1942 2157
-3613 2 2 0 1 1942 1794 2157
-3614 2 2 0 1 2121 1823 1942
-3615 2 2 0 1 1839 1822 1562
-3616 2 2 0 1 1839 1809 1822
-3617 2 2 0 1 1818 1838 1882
-3618 2 2 0 1 1824 1818 1882
-3619 2 2 0 1 1543 1953 1625
-3620 2 2 0 1 1837 1818 2006
-3621 2 2 0 1 1818 1799 2006
-3622 2 2 0 1 1926 1802 1902
-3623 2 2 0 1 1830 1828 1812
-3624 2 2 0 1 1926 1828 1830
-3625 2 2 0 1 1937 1825 1805
-3626 2 2 0 1 1826 1827 1881
-3627 2 2 0 1 1826 1870 1827
-3628 2 2 0 1 1945 1828 1863
-3629 2 2 0 1 1922 1829 1847
-3630 2 2 0 1 1856 1829 1922
-3631 2 2 0 1 1802 1830 1827
-3632 2 2 0 1 1830 1804 1827
-3633 2 2 0 1 1945 1813 1812
-3634 2 2 0 1 1813 1945 1808
-3635 2 2 0 1 1831 1821 1853
-3636 2 2 0 1 1831 1853 1898
-3637 2 2 0 1 1833 1832 1834
-3638 2 2 0 1 1913 1833 1834
-3639 2 2 0 1 1813 1797 1851
-3640 2 2 0 1 1851 1810 1813
-3641 2 2 0 1 1845 1843 1851
-3642 2 2 0 1 1815 1821 1831
-3643 2 2 0 1 1815 1831 1835
-3644 2 2 0 1 1809 1909 1822
-3645 2 2 0 1 1866 632 567
-3646 2 2 0 1 1906 2028 1949
-3647 2 2 0 1 1835 1899 1953
-3648 2 2 0 1 1899 1625 1953
-3649 2 2 0 1 1953 1836 1835
-3650 2 2 0 1 1819 1849 1874
-3651 2 2 0 1 1837 1875 1838
-3652 2 2 0 1 1855 1809 1839
-3653 2 2 0 1 1563 1840 1839
-3654 2 2 0 1 1643 1898 1840
-3655 2 2 0 1 1841 2017 1798
-3656 2 2 0 1 1841 1819 1842
-3657 2 2 0 1 1841 1842 2017
-3658 2 2 0 1 1843 1845 1844
-3659 2 2 0 1 1796 1880 1844
-3660 2 2 0 1 2125 1796 1844
-3661 2 2 0 1 1844 2132 2125
-3662 2 2 0 1 1844 1845 2132
-3663 2 2 0 1 2138 2133 1846
-3664 2 2 0 1 1916 1882 1838
-3665 2 2 0 1 1874 1849 1832
-3666 2 2 0 1 1847 1927 1848
-3667 2 2 0 1 1848 1927 1811
-3668 2 2 0 1 1850 1832 1849
-3669 2 2 0 1 1910 1817 1850
-3670 2 2 0 1 1834 1832 1850
-3671 2 2 0 1 1814 1834 1817
-3672 2 2 0 1 1817 1834 1850
-3673 2 2 0 1 1852 2132 1845
-3674 2 2 0 1 1797 1852 1851
-3675 2 2 0 1 1852 1845 1851
-3676 2 2 0 1 1853 1821 1854
-3677 2 2 0 1 1854 1855 1853
-3678 2 2 0 1 1853 1839 1840
-3679 2 2 0 1 1855 1839 1853
-3680 2 2 0 1 1856 1957 1857
-3681 2 2 0 1 1858 1854 1848
-3682 2 2 0 1 1811 1858 1848
-3683 2 2 0 1 1885 1859 1860
-3684 2 2 0 1 1884 1886 1861
-3685 2 2 0 1 1884 1889 1860
-3686 2 2 0 1 1905 1860 1859
-3687 2 2 0 1 1896 1861 1886
-3688 2 2 0 1 1891 1896 1886
-3689 2 2 0 1 1863 1862 1928
-3690 2 2 0 1 1939 1861 1862
-3691 2 2 0 1 1807 1892 1894
-3692 2 2 0 1 1951 1894 1893
-3693 2 2 0 1 1869 1893 1868
-3694 2 2 0 1 1919 1860 1889
-3695 2 2 0 1 1939 1938 1861
-3696 2 2 0 1 1911 1920 1829
-3697 2 2 0 1 1829 1920 1806
-3698 2 2 0 1 1877 1863 1828
-3699 2 2 0 1 1937 1865 1825
-3700 2 2 0 1 1864 1865 1937
-3701 2 2 0 1 1904 1825 1865
-3702 2 2 0 1 567 1878 1866
-3703 2 2 0 1 1864 1948 1902
-3704 2 2 0 1 1879 1901 1807
-3705 2 2 0 1 1867 1868 1892
-3706 2 2 0 1 1928 1896 1895
-3707 2 2 0 1 1887 1859 1885
-3708 2 2 0 1 1803 1897 1904
-3709 2 2 0 1 1868 1897 1869
-3710 2 2 0 1 1917 1906 1918
-3711 2 2 0 1 1906 1907 1918
-3712 2 2 0 1 1897 1944 1869
-3713 2 2 0 1 1897 1803 1944
-3714 2 2 0 1 1826 1943 1870
-3715 2 2 0 1 1819 1883 1871
-3716 2 2 0 1 1874 1883 1819
-3717 2 2 0 1 1996 1871 1883
-3718 2 2 0 1 1803 1903 1802
-3719 2 2 0 1 1902 1802 1903
-3720 2 2 0 1 1826 1881 1872
-3721 2 2 0 1 1916 1872 1882
-3722 2 2 0 1 1872 1916 1826
-3723 2 2 0 1 1832 1833 1873
-3724 2 2 0 1 1832 1873 1874
-3725 2 2 0 1 1807 1873 1833
-3726 2 2 0 1 1912 1911 1829
-3727 2 2 0 1 1829 1856 1912
-3728 2 2 0 1 1875 1876 1838
-3729 2 2 0 1 1916 1838 1876
-3730 2 2 0 1 1878 567 583
-3731 2 2 0 1 1940 1878 583
-3732 2 2 0 1 1939 1862 1877
-3733 2 2 0 1 1877 1862 1863
-3734 2 2 0 1 1878 1895 1866
-3735 2 2 0 1 1926 1902 1948
-3736 2 2 0 1 1933 1888 1955
-3737 2 2 0 1 1894 1951 1879
-3738 2 2 0 1 1879 1807 1894
-3739 2 2 0 1 1880 1872 1881
-3740 2 2 0 1 1880 1882 1872
-3741 2 2 0 1 1901 1873 1807
-3742 2 2 0 1 1873 1901 1874
-3743 2 2 0 1 1883 1901 1996
-3744 2 2 0 1 1874 1901 1883
-3745 2 2 0 1 1896 1928 1862
-3746 2 2 0 1 1861 1896 1862
-3747 2 2 0 1 1884 1938 1889
-3748 2 2 0 1 1884 1861 1938
-3749 2 2 0 1 1911 1885 1919
-3750 2 2 0 1 1885 1860 1919
-3751 2 2 0 1 1886 1884 1905
-3752 2 2 0 1 1905 1884 1860
-3753 2 2 0 1 1887 1857 1888
-3754 2 2 0 1 1889 1890 1919
-3755 2 2 0 1 1891 1886 1925
-3756 2 2 0 1 1892 1868 1894
-3757 2 2 0 1 1868 1893 1894
-3758 2 2 0 1 1895 1891 1866
-3759 2 2 0 1 1896 1891 1895
-3760 2 2 0 1 1867 1904 1897
-3761 2 2 0 1 1867 1897 1868
-3762 2 2 0 1 1899 1898 1631
-3763 2 2 0 1 1625 1899 1631
-3764 2 2 0 1 1898 1643 1631
-3765 2 2 0 1 2003 1879 1900
-3766 2 2 0 1 1901 1879 2003
-3767 2 2 0 1 1951 1900 1879
-3768 2 2 0 1 1864 1902 1903
-3769 2 2 0 1 1864 1903 1865
-3770 2 2 0 1 1803 1904 1903
-3771 2 2 0 1 1904 1865 1903
-3772 2 2 0 1 1924 1925 1923
-3773 2 2 0 1 1925 1886 1905
-3774 2 2 0 1 2029 1876 1875
-3775 2 2 0 1 1876 1917 1916
-3776 2 2 0 1 1836 1956 1835
-3777 2 2 0 1 2028 1906 1917
-3778 2 2 0 1 1907 1906 1949
-3779 2 2 0 1 1893 1869 1907
-3780 2 2 0 1 1909 1541 1908
-3781 2 2 0 1 1909 1908 1822
-3782 2 2 0 1 1541 1909 1910
-3783 2 2 0 1 1828 1926 1877
-3784 2 2 0 1 1890 1889 1938
-3785 2 2 0 1 1912 1885 1911
-3786 2 2 0 1 1856 1857 1912
-3787 2 2 0 1 1912 1857 1887
-3788 2 2 0 1 1912 1887 1885
-3789 2 2 0 1 1892 1913 1867
-3790 2 2 0 1 1825 1867 1913
-3791 2 2 0 1 1904 1867 1825
-3792 2 2 0 1 1914 1814 1811
-3793 2 2 0 1 1814 1914 1834
-3794 2 2 0 1 1914 1825 1913
-3795 2 2 0 1 1914 1913 1834
-3796 2 2 0 1 1957 1888 1857
-3797 2 2 0 1 1816 2138 1915
-3798 2 2 0 1 1846 1915 2138
-3799 2 2 0 1 1916 1917 1943
-3800 2 2 0 1 1916 1943 1826
-3801 2 2 0 1 1917 1918 1943
-3802 2 2 0 1 1920 1911 1919
-3803 2 2 0 1 1930 1806 1920
-3804 2 2 0 1 1930 1920 1890
-3805 2 2 0 1 1890 1920 1919
-3806 2 2 0 1 1946 1846 1808
-3807 2 2 0 1 1946 1915 1846
-3808 2 2 0 1 1878 1940 1921
-3809 2 2 0 1 1895 1921 1928
-3810 2 2 0 1 1878 1921 1895
-3811 2 2 0 1 1815 1856 1922
-3812 2 2 0 1 1856 1815 1957
-3813 2 2 0 1 1835 1956 1815
-3814 2 2 0 1 1957 1815 1956
-3815 2 2 0 1 2029 2028 1917
-3816 2 2 0 1 1917 1876 2029
-3817 2 2 0 1 1923 1925 1931
-3818 2 2 0 1 1925 1905 1931
-3819 2 2 0 1 1888 1933 1934
-3820 2 2 0 1 1934 1887 1888
-3821 2 2 0 1 1935 1924 632
-3822 2 2 0 1 1935 1891 1925
-3823 2 2 0 1 1925 1924 1935
-3824 2 2 0 1 1926 1947 1877
-3825 2 2 0 1 1927 1806 1959
-3826 2 2 0 1 1927 1959 1805
-3827 2 2 0 1 1823 1915 1941
-3828 2 2 0 1 1928 1929 1863
-3829 2 2 0 1 1890 1936 1930
-3830 2 2 0 1 1931 1932 1923
-3831 2 2 0 1 1931 1905 1859
-3832 2 2 0 1 1934 1933 1932
-3833 2 2 0 1 1859 1887 1934
-3834 2 2 0 1 1866 1935 632
-3835 2 2 0 1 1866 1891 1935
-3836 2 2 0 1 1948 1864 1936
-3837 2 2 0 1 1959 1806 1930
-3838 2 2 0 1 1937 1805 1959
-3839 2 2 0 1 1941 1915 1946
-3840 2 2 0 1 1929 1941 1946
-3841 2 2 0 1 1921 1941 1928
-3842 2 2 0 1 1928 1941 1929
-3843 2 2 0 1 1938 1939 1947
-3844 2 2 0 1 1939 1877 1947
-3845 2 2 0 1 1890 1938 1947
-3846 2 2 0 1 1794 1942 1940
-3847 2 2 0 1 1941 1942 1823
-3848 2 2 0 1 1942 1921 1940
-3849 2 2 0 1 1921 1942 1941
-3850 2 2 0 1 1870 1944 1803
-3851 2 2 0 1 1943 1944 1870
-3852 2 2 0 1 1944 1943 1918
-3853 2 2 0 1 1863 1946 1945
-3854 2 2 0 1 1863 1929 1946
-3855 2 2 0 1 1946 1808 1945
-3856 2 2 0 1 1869 1944 1907
-3857 2 2 0 1 1907 1944 1918
-3858 2 2 0 1 1950 652 1836
-3859 2 2 0 1 1931 1934 1932
-3860 2 2 0 1 1859 1934 1931
-3861 2 2 0 1 1900 1951 2018
-3862 2 2 0 1 1926 1948 1947
-3863 2 2 0 1 1890 1948 1936
-3864 2 2 0 1 1948 1890 1947
-3865 2 2 0 1 1949 1952 1907
-3866 2 2 0 1 1907 1952 1893
-3867 2 2 0 1 1952 1949 2018
-3868 2 2 0 1 1954 649 1950
-3869 2 2 0 1 1543 649 1954
-3870 2 2 0 1 1951 1952 2018
-3871 2 2 0 1 1952 1951 1893
-3872 2 2 0 1 1958 1836 652
-3873 2 2 0 1 1958 652 653
-3874 2 2 0 1 1956 1836 1958
-3875 2 2 0 1 1954 1950 1836
-3876 2 2 0 1 1836 1953 1954
-3877 2 2 0 1 1543 1954 1953
-3878 2 2 0 1 1958 653 1955
-3879 2 2 0 1 1888 1958 1955
-3880 2 2 0 1 1956 1958 1957
-3881 2 2 0 1 1888 1957 1958
-3882 2 2 0 1 1936 1959 1930
-3883 2 2 0 1 1936 1864 1937
-3884 2 2 0 1 1936 1937 1959
-3885 2 2 0 1 1992 1993 1960
-3886 2 2 0 1 2053 1697 1977
-3887 2 2 0 1 1977 2049 2053
-3888 2 2 0 1 2194 2054 1976
-3889 2 2 0 1 1976 2054 2056
-3890 2 2 0 1 2010 1961 2011
-3891 2 2 0 1 1975 1961 2010
-3892 2 2 0 1 2013 1962 2000
-3893 2 2 0 1 2000 1962 1998
-3894 2 2 0 1 1963 2011 1961
-3895 2 2 0 1 1977 2013 2001
-3896 2 2 0 1 2194 1974 1960
-3897 2 2 0 1 2194 1976 1974
-3898 2 2 0 1 2001 2013 2000
-3899 2 2 0 1 1978 2048 2043
-3900 2 2 0 1 1979 1978 2043
-3901 2 2 0 1 1973 2035 1964
-3902 2 2 0 1 1966 1964 2035
-3903 2 2 0 1 1963 1961 1964
-3904 2 2 0 1 1964 1966 1963
-3905 2 2 0 1 2035 2041 1966
-3906 2 2 0 1 1965 1966 2041
-3907 2 2 0 1 2002 1966 1965
-3908 2 2 0 1 2041 1967 1965
-3909 2 2 0 1 1983 1965 1967
-3910 2 2 0 1 2034 1965 1983
-3911 2 2 0 1 1968 1969 1986
-3912 2 2 0 1 1981 1970 1971
-3913 2 2 0 1 1964 1972 1973
-3914 2 2 0 1 1964 1975 1972
-3915 2 2 0 1 1961 1975 1964
-3916 2 2 0 1 2049 1977 2001
-3917 2 2 0 1 1960 1974 1992
-3918 2 2 0 1 2010 1992 1974
-3919 2 2 0 1 1975 1974 1976
-3920 2 2 0 1 1974 1975 2010
-3921 2 2 0 1 1972 1975 2056
-3922 2 2 0 1 1976 2056 1975
-3923 2 2 0 1 1697 2013 1977
-3924 2 2 0 1 1967 2048 1983
-3925 2 2 0 1 1978 1983 2048
-3926 2 2 0 1 2043 2046 1979
-3927 2 2 0 1 1968 1979 2046
-3928 2 2 0 1 1971 2049 2001
-3929 2 2 0 1 1971 2001 1981
-3930 2 2 0 1 2013 1697 2014
-3931 2 2 0 1 2034 1991 2033
-3932 2 2 0 1 1988 1986 1980
-3933 2 2 0 1 1982 1981 1969
-3934 2 2 0 1 1970 1981 1982
-3935 2 2 0 1 1968 1982 1969
-3936 2 2 0 1 1979 1989 1978
-3937 2 2 0 1 1991 1989 1988
-3938 2 2 0 1 1984 2034 1983
-3939 2 2 0 1 1984 1983 1978
-3940 2 2 0 1 1991 2034 1984
-3941 2 2 0 1 2011 2021 2015
-3942 2 2 0 1 1986 1988 1985
-3943 2 2 0 1 1968 1985 1979
-3944 2 2 0 1 1986 1985 1968
-3945 2 2 0 1 1987 1992 2010
-3946 2 2 0 1 1837 2006 2008
-3947 2 2 0 1 1980 1990 1988
-3948 2 2 0 1 2009 1990 1980
-3949 2 2 0 1 1985 1988 1989
-3950 2 2 0 1 1979 1985 1989
-3951 2 2 0 1 1982 2046 1970
-3952 2 2 0 1 1968 2046 1982
-3953 2 2 0 1 1991 1988 1990
-3954 2 2 0 1 1991 1990 2033
-3955 2 2 0 1 1989 1984 1978
-3956 2 2 0 1 1989 1991 1984
-3957 2 2 0 1 1994 2226 1993
-3958 2 2 0 1 1992 1994 1993
-3959 2 2 0 1 1987 1994 1992
-3960 2 2 0 1 2003 1995 1996
-3961 2 2 0 1 1837 2015 1875
-3962 2 2 0 1 2015 1837 2008
-3963 2 2 0 1 1997 1969 1998
-3964 2 2 0 1 1997 1986 1969
-3965 2 2 0 1 1980 1986 1997
-3966 2 2 0 1 1998 1999 1997
-3967 2 2 0 1 1997 1999 1995
-3968 2 2 0 1 1969 2000 1998
-3969 2 2 0 1 1969 1981 2000
-3970 2 2 0 1 1981 2001 2000
-3971 2 2 0 1 1966 2002 1963
-3972 2 2 0 1 2021 2011 1963
-3973 2 2 0 1 2005 1995 2003
-3974 2 2 0 1 2004 2002 1965
-3975 2 2 0 1 2034 2004 1965
-3976 2 2 0 1 2007 2006 2153
-3977 2 2 0 1 2007 2153 2226
-3978 2 2 0 1 2005 2003 1900
-3979 2 2 0 1 2007 2008 2006
-3980 2 2 0 1 2007 2226 1994
-3981 2 2 0 1 2008 1994 1987
-3982 2 2 0 1 2007 1994 2008
-3983 2 2 0 1 2009 1980 2005
-3984 2 2 0 1 1980 1997 2005
-3985 2 2 0 1 1995 2005 1997
-3986 2 2 0 1 1987 2010 2011
-3987 2 2 0 1 2011 2015 1987
-3988 2 2 0 1 1987 2015 2008
-3989 2 2 0 1 1963 2002 2012
-3990 2 2 0 1 2021 2012 2027
-3991 2 2 0 1 1963 2012 2021
-3992 2 2 0 1 2002 2027 2012
-3993 2 2 0 1 2013 2014 2031
-3994 2 2 0 1 2031 2014 1728
-3995 2 2 0 1 2013 2031 1962
-3996 2 2 0 1 2016 1990 2009
-3997 2 2 0 1 2033 1990 2016
-3998 2 2 0 1 2019 1900 2018
-3999 2 2 0 1 2020 1875 2015
-4000 2 2 0 1 2020 2015 2021
-4001 2 2 0 1 2005 1900 2019
-4002 2 2 0 1 2005 2019 2009
-4003 2 2 0 1 2019 2016 2009
-4004 2 2 0 1 1842 1752 2017
-4005 2 2 0 1 2018 1949 2024
-4006 2 2 0 1 2024 2016 2019
-4007 2 2 0 1 2018 2024 2019
-4008 2 2 0 1 1875 2020 2029
-4009 2 2 0 1 2021 2027 2020
-4010 2 2 0 1 1752 1842 2022
-4011 2 2 0 1 2026 2024 2025
-4012 2 2 0 1 1842 1871 2023
-4013 2 2 0 1 2022 1842 2023
-4014 2 2 0 1 2025 1949 2028
-4015 2 2 0 1 2024 1949 2025
-4016 2 2 0 1 2022 1728 1752
-4017 2 2 0 1 1728 2022 2031
-4018 2 2 0 1 2025 2027 2026
-4019 2 2 0 1 2025 2020 2027
-4020 2 2 0 1 2025 2028 2029
-4021 2 2 0 1 2025 2029 2020
-4022 2 2 0 1 2030 1998 1962
-4023 2 2 0 1 1962 2031 2030
-4024 2 2 0 1 1999 1998 2030
-4025 2 2 0 1 2031 2022 2030
-4026 2 2 0 1 2022 2023 2030
-4027 2 2 0 1 2016 2026 2033
-4028 2 2 0 1 2016 2024 2026
-4029 2 2 0 1 2032 1871 1996
-4030 2 2 0 1 1999 2030 2032
-4031 2 2 0 1 1995 2032 1996
-4032 2 2 0 1 1995 1999 2032
-4033 2 2 0 1 2032 2023 1871
-4034 2 2 0 1 2030 2023 2032
-4035 2 2 0 1 2033 2004 2034
-4036 2 2 0 1 2002 2004 2027
-4037 2 2 0 1 2026 2027 2004
-4038 2 2 0 1 2004 2033 2026
-4039 2 2 0 1 1973 2036 2035
-4040 2 2 0 1 2036 2037 2038
-4041 2 2 0 1 2039 2036 2038
-4042 2 2 0 1 2035 2036 2039
-4043 2 2 0 1 2039 2041 2035
-4044 2 2 0 1 2038 4080 2039
-4045 2 2 0 1 2040 2039 4080
-4046 2 2 0 1 2041 2039 2040
-4047 2 2 0 1 2040 1967 2041
-4048 2 2 0 1 4080 4089 2040
-4049 2 2 0 1 2042 2040 4089
-4050 2 2 0 1 1967 2040 2042
-4051 2 2 0 1 2044 2043 2048
-4052 2 2 0 1 4098 4088 2044
-4053 2 2 0 1 2045 2046 2043
-4054 2 2 0 1 2045 2043 2044
-4055 2 2 0 1 4088 4091 2045
-4056 2 2 0 1 2044 4088 2045
-4057 2 2 0 1 2042 2048 1967
-4058 2 2 0 1 4089 4098 2042
-4059 2 2 0 1 2045 1970 2046
-4060 2 2 0 1 4091 4092 2045
-4061 2 2 0 1 2047 2045 4092
-4062 2 2 0 1 1970 2045 2047
-4063 2 2 0 1 2047 1971 1970
-4064 2 2 0 1 4092 4096 2047
-4065 2 2 0 1 2050 2047 4096
-4066 2 2 0 1 1971 2047 2050
-4067 2 2 0 1 2050 2049 1971
-4068 2 2 0 1 4096 4099 2050
-4069 2 2 0 1 2048 2042 2044
-4070 2 2 0 1 2044 2042 4098
-4071 2 2 0 1 2049 2050 2052
-4072 2 2 0 1 2052 2050 4099
-4073 2 2 0 1 4100 1792 2052
-4074 2 2 0 1 2052 4099 4100
-4075 2 2 0 1 4108 4101 2055
-4076 2 2 0 1 2055 1972 2056
-4077 2 2 0 1 2036 1973 2051
-4078 2 2 0 1 2037 2036 2051
-4079 2 2 0 1 2051 1973 1972
-4080 2 2 0 1 2051 1972 2055
-4081 2 2 0 1 2051 4101 2037
-4082 2 2 0 1 2055 4101 2051
-4083 2 2 0 1 1792 2053 2052
-4084 2 2 0 1 2052 2053 2049
-4085 2 2 0 1 2266 4106 4108
-4086 2 2 0 1 2056 2054 2266
-4087 2 2 0 1 2266 2055 2056
-4088 2 2 0 1 2055 2266 4108
-4089 2 2 0 1 2169 2296 2170
-4090 2 2 0 1 2075 2170 2296
-4091 2 2 0 1 2057 2058 2088
-4092 2 2 0 1 2084 2071 2149
-4093 2 2 0 1 2179 2129 2112
-4094 2 2 0 1 2170 2075 2063
-4095 2 2 0 1 2058 2057 2112
-4096 2 2 0 1 2084 2149 2059
-4097 2 2 0 1 2060 2118 2061
-4098 2 2 0 1 2124 2166 2165
-4099 2 2 0 1 2143 2321 2272
-4100 2 2 0 1 2115 2066 2062
-4101 2 2 0 1 2065 2123 2091
-4102 2 2 0 1 2063 2064 2096
-4103 2 2 0 1 2096 2064 2081
-4104 2 2 0 1 2087 2141 2080
-4105 2 2 0 1 2108 2098 2065
-4106 2 2 0 1 2100 2126 2098
-4107 2 2 0 1 2141 2107 2108
-4108 2 2 0 1 2116 2114 2093
-4109 2 2 0 1 2108 2065 2090
-4110 2 2 0 1 2080 2090 2083
-4111 2 2 0 1 2103 2140 2092
-4112 2 2 0 1 2062 2066 2119
-4113 2 2 0 1 2119 2118 2062
-4114 2 2 0 1 2066 2105 2104
-4115 2 2 0 1 2117 2066 2115
-4116 2 2 0 1 2067 2147 793
-4117 2 2 0 1 2080 2083 2101
-4118 2 2 0 1 2100 2099 2068
-4119 2 2 0 1 2069 2081 2064
-4120 2 2 0 1 2069 2064 2104
-4121 2 2 0 1 2103 2092 2127
-4122 2 2 0 1 2100 2068 2070
-4123 2 2 0 1 2070 2068 2071
-4124 2 2 0 1 2145 2095 2094
-4125 2 2 0 1 2092 2094 2081
-4126 2 2 0 1 2114 2120 2072
-4127 2 2 0 1 2065 2073 2123
-4128 2 2 0 1 2063 2074 2064
-4129 2 2 0 1 2074 2063 2075
-4130 2 2 0 1 2076 2174 2175
-4131 2 2 0 1 2102 2126 2100
-4132 2 2 0 1 2110 2103 2102
-4133 2 2 0 1 2061 2077 2296
-4134 2 2 0 1 2118 2075 2077
-4135 2 2 0 1 2075 2296 2077
-4136 2 2 0 1 2118 2077 2061
-4137 2 2 0 1 2078 2088 2079
-4138 2 2 0 1 2087 2080 2085
-4139 2 2 0 1 2081 2106 2092
-4140 2 2 0 1 2086 2125 2087
-4141 2 2 0 1 2082 2083 2072
-4142 2 2 0 1 2082 2101 2083
-4143 2 2 0 1 793 2137 792
-4144 2 2 0 1 2111 2058 2112
-4145 2 2 0 1 2084 2110 2070
-4146 2 2 0 1 2084 2070 2071
-4147 2 2 0 1 2085 2086 2087
-4148 2 2 0 1 2057 2088 2078
-4149 2 2 0 1 2178 2057 2078
-4150 2 2 0 1 2147 2137 793
-4151 2 2 0 1 1795 2150 2089
-4152 2 2 0 1 2098 2126 2073
-4153 2 2 0 1 2065 2098 2073
-4154 2 2 0 1 2083 2090 2091
-4155 2 2 0 1 2090 2065 2091
-4156 2 2 0 1 2094 2092 2140
-4157 2 2 0 1 2145 2094 2140
-4158 2 2 0 1 2097 2117 2093
-4159 2 2 0 1 2069 2128 2106
-4160 2 2 0 1 2081 2069 2106
-4161 2 2 0 1 2094 2095 2096
-4162 2 2 0 1 2096 2081 2094
-4163 2 2 0 1 2123 2097 2091
-4164 2 2 0 1 2070 2110 2102
-4165 2 2 0 1 2102 2100 2070
-4166 2 2 0 1 2098 2108 2099
-4167 2 2 0 1 2099 2100 2098
-4168 2 2 0 1 2085 2080 2101
-4169 2 2 0 1 2090 2141 2108
-4170 2 2 0 1 2080 2141 2090
-4171 2 2 0 1 2126 2102 2127
-4172 2 2 0 1 2102 2103 2127
-4173 2 2 0 1 2104 2119 2066
-4174 2 2 0 1 2175 2082 2120
-4175 2 2 0 1 2120 2082 2072
-4176 2 2 0 1 2128 2069 2105
-4177 2 2 0 1 2105 2069 2104
-4178 2 2 0 1 2106 2127 2092
-4179 2 2 0 1 2082 2175 2177
-4180 2 2 0 1 2177 2101 2082
-4181 2 2 0 1 2095 2160 2096
-4182 2 2 0 1 2143 2272 2113
-4183 2 2 0 1 2059 2130 2084
-4184 2 2 0 1 2133 2107 1852
-4185 2 2 0 1 2108 2107 2099
-4186 2 2 0 1 2161 2067 2109
-4187 2 2 0 1 2161 2147 2067
-4188 2 2 0 1 2095 2145 2161
-4189 2 2 0 1 2145 2147 2161
-4190 2 2 0 1 2084 2130 2110
-4191 2 2 0 1 2111 2112 2129
-4192 2 2 0 1 2165 2178 2078
-4193 2 2 0 1 2165 2078 2113
-4194 2 2 0 1 2113 2078 2079
-4195 2 2 0 1 2091 2072 2083
-4196 2 2 0 1 2093 2114 2072
-4197 2 2 0 1 2072 2097 2093
-4198 2 2 0 1 2072 2091 2097
-4199 2 2 0 1 2079 2088 2116
-4200 2 2 0 1 2116 2115 2079
-4201 2 2 0 1 2093 2117 2116
-4202 2 2 0 1 2116 2117 2115
-4203 2 2 0 1 2104 2064 2074
-4204 2 2 0 1 2118 2074 2075
-4205 2 2 0 1 2074 2118 2119
-4206 2 2 0 1 2119 2104 2074
-4207 2 2 0 1 2136 2120 2114
-4208 2 2 0 1 2175 2136 2076
-4209 2 2 0 1 2076 2136 2111
-4210 2 2 0 1 2111 2136 2058
-4211 2 2 0 1 2136 2175 2120
-4212 2 2 0 1 2122 1816 2121
-4213 2 2 0 1 2149 2071 2122
-4214 2 2 0 1 2105 2123 2128
-4215 2 2 0 1 2097 2123 2105
-4216 2 2 0 1 2105 2066 2117
-4217 2 2 0 1 2117 2097 2105
-4218 2 2 0 1 2173 2086 2085
-4219 2 2 0 1 2113 2124 2165
-4220 2 2 0 1 2113 2272 2124
-4221 2 2 0 1 2125 2132 2087
-4222 2 2 0 1 2073 2126 2127
-4223 2 2 0 1 2123 2073 2128
-4224 2 2 0 1 2073 2106 2128
-4225 2 2 0 1 2127 2106 2073
-4226 2 2 0 1 2111 2129 2207
-4227 2 2 0 1 2130 2059 2158
-4228 2 2 0 1 2158 2131 792
-4229 2 2 0 1 2118 2060 2144
-4230 2 2 0 1 2118 2144 2062
-4231 2 2 0 1 2132 2142 2087
-4232 2 2 0 1 2141 2087 2142
-4233 2 2 0 1 2159 2107 2133
-4234 2 2 0 1 2099 2107 2159
-4235 2 2 0 1 2114 2116 2135
-4236 2 2 0 1 2135 2136 2114
-4237 2 2 0 1 2135 2116 2088
-4238 2 2 0 1 2122 2071 2139
-4239 2 2 0 1 1816 2122 2139
-4240 2 2 0 1 2134 2062 2143
-4241 2 2 0 1 2062 2134 2115
-4242 2 2 0 1 2058 2135 2088
-4243 2 2 0 1 2058 2136 2135
-4244 2 2 0 1 2137 2158 792
-4245 2 2 0 1 2158 2137 2130
-4246 2 2 0 1 1816 2139 2138
-4247 2 2 0 1 2139 2071 2068
-4248 2 2 0 1 2133 2138 2159
-4249 2 2 0 1 2146 2103 2110
-4250 2 2 0 1 2146 2140 2103
-4251 2 2 0 1 2130 2146 2110
-4252 2 2 0 1 1852 2142 2132
-4253 2 2 0 1 2107 2142 1852
-4254 2 2 0 1 2107 2141 2142
-4255 2 2 0 1 2321 2144 2060
-4256 2 2 0 1 2321 2143 2144
-4257 2 2 0 1 2062 2144 2143
-4258 2 2 0 1 2145 2140 2146
-4259 2 2 0 1 2146 2147 2145
-4260 2 2 0 1 2137 2147 2146
-4261 2 2 0 1 2146 2130 2137
-4262 2 2 0 1 2079 2115 2134
-4263 2 2 0 1 2079 2134 2113
-4264 2 2 0 1 2143 2113 2134
-4265 2 2 0 1 2148 2121 2157
-4266 2 2 0 1 2149 2148 2059
-4267 2 2 0 1 2149 2122 2148
-4268 2 2 0 1 2122 2121 2148
-4269 2 2 0 1 2101 2177 2085
-4270 2 2 0 1 2182 2173 2177
-4271 2 2 0 1 2173 2085 2177
-4272 2 2 0 1 2125 2086 1795
-4273 2 2 0 1 1795 2086 2150
-4274 2 2 0 1 2173 2150 2086
-4275 2 2 0 1 2207 2151 2174
-4276 2 2 0 1 2207 2174 2076
-4277 2 2 0 1 2076 2111 2207
-4278 2 2 0 1 2152 2153 2089
-4279 2 2 0 1 2152 2089 2150
-4280 2 2 0 1 2155 2131 2154
-4281 2 2 0 1 2059 2148 2154
-4282 2 2 0 1 1801 2155 2156
-4283 2 2 0 1 2156 2148 2157
-4284 2 2 0 1 2156 2157 1801
-4285 2 2 0 1 2131 2158 2154
-4286 2 2 0 1 2059 2154 2158
-4287 2 2 0 1 2155 2154 2156
-4288 2 2 0 1 2156 2154 2148
-4289 2 2 0 1 2151 2164 2174
-4290 2 2 0 1 2138 2139 2159
-4291 2 2 0 1 2068 2099 2159
-4292 2 2 0 1 2159 2139 2068
-4293 2 2 0 1 2109 2162 2161
-4294 2 2 0 1 2160 2095 2162
-4295 2 2 0 1 2161 2162 2095
-4296 2 2 0 1 2162 2109 864
-4297 2 2 0 1 864 2160 2162
-4298 2 2 0 1 2178 2163 2180
-4299 2 2 0 1 2182 2174 2164
-4300 2 2 0 1 2163 2178 2167
-4301 2 2 0 1 2167 2178 2165
-4302 2 2 0 1 2165 2166 2167
-4303 2 2 0 1 2167 2166 2168
-4304 2 2 0 1 2168 2163 2167
-4305 2 2 0 1 2189 2169 2172
-4306 2 2 0 1 2170 2172 2169
-4307 2 2 0 1 2183 2152 2171
-4308 2 2 0 1 2150 2171 2152
-4309 2 2 0 1 2170 2063 2187
-4310 2 2 0 1 2187 2172 2170
-4311 2 2 0 1 2182 2171 2173
-4312 2 2 0 1 2171 2150 2173
-4313 2 2 0 1 2174 2176 2175
-4314 2 2 0 1 2182 2177 2176
-4315 2 2 0 1 2174 2182 2176
-4316 2 2 0 1 2175 2176 2177
-4317 2 2 0 1 2180 2181 2178
-4318 2 2 0 1 2057 2178 2181
-4319 2 2 0 1 2179 2181 2180
-4320 2 2 0 1 2179 2112 2181
-4321 2 2 0 1 2181 2112 2057
-4322 2 2 0 1 2183 2182 2164
-4323 2 2 0 1 2171 2182 2183
-4324 2 2 0 1 2185 2172 2187
-4325 2 2 0 1 2184 864 2186
-4326 2 2 0 1 2160 864 2184
-4327 2 2 0 1 2186 884 2185
-4328 2 2 0 1 2184 2186 2185
-4329 2 2 0 1 2185 2187 2184
-4330 2 2 0 1 2160 2184 2187
-4331 2 2 0 1 2096 2188 2063
-4332 2 2 0 1 2160 2187 2188
-4333 2 2 0 1 2187 2063 2188
-4334 2 2 0 1 2160 2188 2096
-4335 2 2 0 1 2190 884 1067
-4336 2 2 0 1 2189 2172 2190
-4337 2 2 0 1 2190 1067 2189
-4338 2 2 0 1 884 2190 2185
-4339 2 2 0 1 2190 2172 2185
-4340 2 2 0 1 2390 2205 2399
-4341 2 2 0 1 2191 2192 2239
-4342 2 2 0 1 2239 2192 2237
-4343 2 2 0 1 2195 2054 2194
-4344 2 2 0 1 2220 2193 2198
-4345 2 2 0 1 2194 2244 2195
-4346 2 2 0 1 2210 2211 2215
-4347 2 2 0 1 2203 2399 2205
-4348 2 2 0 1 2196 2211 2210
-4349 2 2 0 1 2197 2230 2196
-4350 2 2 0 1 2197 2196 2210
-4351 2 2 0 1 2229 2198 2193
-4352 2 2 0 1 2193 2199 2202
-4353 2 2 0 1 2226 2200 1993
-4354 2 2 0 1 2246 2213 2222
-4355 2 2 0 1 2213 2201 2215
-4356 2 2 0 1 2218 2199 2216
-4357 2 2 0 1 2240 2202 2249
-4358 2 2 0 1 2229 2193 2202
-4359 2 2 0 1 2224 2152 2183
-4360 2 2 0 1 2179 2180 2204
-4361 2 2 0 1 2204 2197 2210
-4362 2 2 0 1 2180 2163 2203
-4363 2 2 0 1 2203 2204 2180
-4364 2 2 0 1 2203 2205 2197
-4365 2 2 0 1 2197 2204 2203
-4366 2 2 0 1 2230 2197 2205
-4367 2 2 0 1 2399 2163 2168
-4368 2 2 0 1 2163 2399 2203
-4369 2 2 0 1 2219 2207 2129
-4370 2 2 0 1 2206 2219 2223
-4371 2 2 0 1 2213 2246 2235
-4372 2 2 0 1 2213 2235 2201
-4373 2 2 0 1 2207 2219 2208
-4374 2 2 0 1 2234 2220 2198
-4375 2 2 0 1 2249 2202 2236
-4376 2 2 0 1 2199 2236 2202
-4377 2 2 0 1 2206 2214 2201
-4378 2 2 0 1 2215 2201 2214
-4379 2 2 0 1 2214 2206 2223
-4380 2 2 0 1 2221 2129 2179
-4381 2 2 0 1 2226 2153 2225
-4382 2 2 0 1 2225 2153 2152
-4383 2 2 0 1 2228 2193 2220
-4384 2 2 0 1 2228 2199 2193
-4385 2 2 0 1 2209 2210 2215
-4386 2 2 0 1 2215 2211 2212
-4387 2 2 0 1 2212 2213 2215
-4388 2 2 0 1 2221 2219 2129
-4389 2 2 0 1 2219 2221 2223
-4390 2 2 0 1 2214 2209 2215
-4391 2 2 0 1 2209 2214 2223
-4392 2 2 0 1 2206 2218 2216
-4393 2 2 0 1 2201 2218 2206
-4394 2 2 0 1 2217 2235 2246
-4395 2 2 0 1 2249 2236 2217
-4396 2 2 0 1 2199 2218 2236
-4397 2 2 0 1 2216 2208 2206
-4398 2 2 0 1 2219 2206 2208
-4399 2 2 0 1 2234 2227 2220
-4400 2 2 0 1 2204 2221 2179
-4401 2 2 0 1 2212 2259 2222
-4402 2 2 0 1 2212 2222 2213
-4403 2 2 0 1 2208 2151 2207
-4404 2 2 0 1 2151 2227 2164
-4405 2 2 0 1 2151 2208 2227
-4406 2 2 0 1 2209 2223 2221
-4407 2 2 0 1 2210 2209 2204
-4408 2 2 0 1 2204 2209 2221
-4409 2 2 0 1 2183 2234 2224
-4410 2 2 0 1 2224 2225 2152
-4411 2 2 0 1 2225 2224 2200
-4412 2 2 0 1 2200 2226 2225
-4413 2 2 0 1 2227 2228 2220
-4414 2 2 0 1 2199 2228 2216
-4415 2 2 0 1 2216 2228 2208
-4416 2 2 0 1 2228 2227 2208
-4417 2 2 0 1 2242 2198 2229
-4418 2 2 0 1 2244 2242 2229
-4419 2 2 0 1 2231 2230 2390
-4420 2 2 0 1 2230 2205 2390
-4421 2 2 0 1 2164 2234 2183
-4422 2 2 0 1 2164 2227 2234
-4423 2 2 0 1 2191 2232 2231
-4424 2 2 0 1 2232 2230 2231
-4425 2 2 0 1 2200 2233 2242
-4426 2 2 0 1 2198 2242 2233
-4427 2 2 0 1 2200 2224 2233
-4428 2 2 0 1 2198 2233 2234
-4429 2 2 0 1 2224 2234 2233
-4430 2 2 0 1 2232 2191 2239
-4431 2 2 0 1 2195 2244 2241
-4432 2 2 0 1 2229 2241 2244
-4433 2 2 0 1 2236 2235 2217
-4434 2 2 0 1 2235 2218 2201
-4435 2 2 0 1 2218 2235 2236
-4436 2 2 0 1 2238 2237 2259
-4437 2 2 0 1 2237 2238 2239
-4438 2 2 0 1 2238 2259 2212
-4439 2 2 0 1 2212 2211 2238
-4440 2 2 0 1 2202 2240 2229
-4441 2 2 0 1 2229 2240 2241
-4442 2 2 0 1 2239 2238 2232
-4443 2 2 0 1 2232 2196 2230
-4444 2 2 0 1 2211 2196 2232
-4445 2 2 0 1 2238 2211 2232
-4446 2 2 0 1 2243 2200 2242
-4447 2 2 0 1 1993 2243 1960
-4448 2 2 0 1 2243 1993 2200
-4449 2 2 0 1 2194 1960 2243
-4450 2 2 0 1 2243 2244 2194
-4451 2 2 0 1 2242 2244 2243
-4452 2 2 0 1 2255 2245 2257
-4453 2 2 0 1 2246 2245 2217
-4454 2 2 0 1 2246 2222 2256
-4455 2 2 0 1 2257 2256 2247
-4456 2 2 0 1 2258 2222 2259
-4457 2 2 0 1 2258 2248 2247
-4458 2 2 0 1 2237 2260 2259
-4459 2 2 0 1 2260 2262 2248
-4460 2 2 0 1 2251 2249 2217
-4461 2 2 0 1 2250 2251 2255
-4462 2 2 0 1 2240 2249 2252
-4463 2 2 0 1 2250 2253 2252
-4464 2 2 0 1 2252 2251 2250
-4465 2 2 0 1 2252 2249 2251
-4466 2 2 0 1 2240 2254 2241
-4467 2 2 0 1 2265 2254 2253
-4468 2 2 0 1 2254 2252 2253
-4469 2 2 0 1 2254 2240 2252
-4470 2 2 0 1 2217 2245 2251
-4471 2 2 0 1 2255 2251 2245
-4472 2 2 0 1 2245 2246 2256
-4473 2 2 0 1 2256 2257 2245
-4474 2 2 0 1 2258 2256 2222
-4475 2 2 0 1 2256 2258 2247
-4476 2 2 0 1 2260 2258 2259
-4477 2 2 0 1 2258 2260 2248
-4478 2 2 0 1 2261 2260 2237
-4479 2 2 0 1 2442 4859 2261
-4480 2 2 0 1 2192 2261 2237
-4481 2 2 0 1 2192 2442 2261
-4482 2 2 0 1 2261 4859 2262
-4483 2 2 0 1 2260 2261 2262
-4484 2 2 0 1 2241 2263 2195
-4485 2 2 0 1 2254 2263 2241
-4486 2 2 0 1 2263 2265 2264
-4487 2 2 0 1 2254 2265 2263
-4488 2 2 0 1 4106 2266 2264
-4489 2 2 0 1 2054 2195 2266
-4490 2 2 0 1 2266 2195 2263
-4491 2 2 0 1 2264 2266 2263
-4492 2 2 0 1 2444 2526 2267
-4493 2 2 0 1 2526 2268 2267
-4494 2 2 0 1 2269 2331 2312
-4495 2 2 0 1 2362 2456 2270
-4496 2 2 0 1 2361 2271 2276
-4497 2 2 0 1 2272 2273 2124
-4498 2 2 0 1 2124 2273 2274
-4499 2 2 0 1 2456 2276 2326
-4500 2 2 0 1 2275 2304 2381
-4501 2 2 0 1 2362 2276 2456
-4502 2 2 0 1 2362 2361 2276
-4503 2 2 0 1 2324 2325 1043
-4504 2 2 0 1 2277 2332 2404
-4505 2 2 0 1 2275 2274 2333
-4506 2 2 0 1 2353 2279 2278
-4507 2 2 0 1 2279 2308 2290
-4508 2 2 0 1 2346 2278 2306
-4509 2 2 0 1 2346 2306 2282
-4510 2 2 0 1 2364 2278 2346
-4511 2 2 0 1 2308 2279 2280
-4512 2 2 0 1 2345 1043 2325
-4513 2 2 0 1 2364 2346 2345
-4514 2 2 0 1 2279 2310 2280
-4515 2 2 0 1 2290 2281 2279
-4516 2 2 0 1 2278 2279 2281
-4517 2 2 0 1 2284 2282 2283
-4518 2 2 0 1 2284 2373 2302
-4519 2 2 0 1 2284 2285 2373
-4520 2 2 0 1 2286 2279 2353
-4521 2 2 0 1 2310 2279 2286
-4522 2 2 0 1 2295 2287 2322
-4523 2 2 0 1 2288 2314 2322
-4524 2 2 0 1 2294 2314 2288
-4525 2 2 0 1 2295 2322 2314
-4526 2 2 0 1 2269 2312 2356
-4527 2 2 0 1 2294 2288 2356
-4528 2 2 0 1 2311 2298 2357
-4529 2 2 0 1 2357 2298 2366
-4530 2 2 0 1 2289 2293 2290
-4531 2 2 0 1 2311 2299 2291
-4532 2 2 0 1 2333 2319 2318
-4533 2 2 0 1 2292 2290 2293
-4534 2 2 0 1 2316 2305 2292
-4535 2 2 0 1 2293 2289 2315
-4536 2 2 0 1 2293 2315 2294
-4537 2 2 0 1 2319 2334 2295
-4538 2 2 0 1 2287 2295 2334
-4539 2 2 0 1 2301 2352 2462
-4540 2 2 0 1 2271 2309 2325
-4541 2 2 0 1 2332 2277 2303
-4542 2 2 0 1 2293 2294 2313
-4543 2 2 0 1 2313 2312 2316
-4544 2 2 0 1 2289 2307 2360
-4545 2 2 0 1 2296 2355 2061
-4546 2 2 0 1 2296 2269 2355
-4547 2 2 0 1 2355 2297 2061
-4548 2 2 0 1 2311 2344 2298
-4549 2 2 0 1 2354 2299 2310
-4550 2 2 0 1 2354 2371 2299
-4551 2 2 0 1 2299 2311 2300
-4552 2 2 0 1 2268 2342 2336
-4553 2 2 0 1 2271 2361 2309
-4554 2 2 0 1 2301 2330 2352
-4555 2 2 0 1 2330 2301 2335
-4556 2 2 0 1 1081 2302 2373
-4557 2 2 0 1 2303 2277 2304
-4558 2 2 0 1 2303 2304 2275
-4559 2 2 0 1 2305 2283 2306
-4560 2 2 0 1 2282 2306 2283
-4561 2 2 0 1 2353 2278 2364
-4562 2 2 0 1 2305 2306 2281
-4563 2 2 0 1 2278 2281 2306
-4564 2 2 0 1 2307 2289 2308
-4565 2 2 0 1 2308 2289 2290
-4566 2 2 0 1 2305 2281 2292
-4567 2 2 0 1 2292 2281 2290
-4568 2 2 0 1 2309 2345 2325
-4569 2 2 0 1 2345 2309 2364
-4570 2 2 0 1 2299 2371 2291
-4571 2 2 0 1 2299 2300 2310
-4572 2 2 0 1 2310 2300 2280
-4573 2 2 0 1 2283 2305 2316
-4574 2 2 0 1 2300 2311 2357
-4575 2 2 0 1 2317 2344 2291
-4576 2 2 0 1 2344 2311 2291
-4577 2 2 0 1 2286 2354 2310
-4578 2 2 0 1 2367 2357 2366
-4579 2 2 0 1 2312 2313 2356
-4580 2 2 0 1 2313 2294 2356
-4581 2 2 0 1 2315 2295 2314
-4582 2 2 0 1 2314 2294 2315
-4583 2 2 0 1 2332 2318 2348
-4584 2 2 0 1 2336 2344 2317
-4585 2 2 0 1 2293 2313 2292
-4586 2 2 0 1 2313 2316 2292
-4587 2 2 0 1 2360 2295 2315
-4588 2 2 0 1 2289 2360 2315
-4589 2 2 0 1 2330 2329 2317
-4590 2 2 0 1 2291 2371 2330
-4591 2 2 0 1 2291 2330 2317
-4592 2 2 0 1 2318 2319 2359
-4593 2 2 0 1 2348 2318 2359
-4594 2 2 0 1 2320 2321 2060
-4595 2 2 0 1 2320 2322 2287
-4596 2 2 0 1 2297 2060 2061
-4597 2 2 0 1 2297 2320 2060
-4598 2 2 0 1 2297 2288 2322
-4599 2 2 0 1 2320 2297 2322
-4600 2 2 0 1 2323 2405 2341
-4601 2 2 0 1 1023 1042 2350
-4602 2 2 0 1 2282 2350 2346
-4603 2 2 0 1 2321 2320 2272
-4604 2 2 0 1 2272 2320 2273
-4605 2 2 0 1 2328 2324 1030
-4606 2 2 0 1 2325 2324 2328
-4607 2 2 0 1 2328 2271 2325
-4608 2 2 0 1 2326 2276 2328
-4609 2 2 0 1 2326 2328 2327
-4610 2 2 0 1 2276 2271 2328
-4611 2 2 0 1 1030 2327 2328
-4612 2 2 0 1 2329 2330 2335
-4613 2 2 0 1 2285 2312 2331
-4614 2 2 0 1 2312 2285 2316
-4615 2 2 0 1 2284 2283 2285
-4616 2 2 0 1 2285 2283 2316
-4617 2 2 0 1 2318 2332 2303
-4618 2 2 0 1 2303 2333 2318
-4619 2 2 0 1 2303 2275 2333
-4620 2 2 0 1 2284 2302 2339
-4621 2 2 0 1 2334 2319 2333
-4622 2 2 0 1 2329 2267 2336
-4623 2 2 0 1 2317 2329 2336
-4624 2 2 0 1 2267 2268 2336
-4625 2 2 0 1 2273 2333 2274
-4626 2 2 0 1 2273 2320 2287
-4627 2 2 0 1 2287 2334 2273
-4628 2 2 0 1 2273 2334 2333
-4629 2 2 0 1 2329 2335 2444
-4630 2 2 0 1 2267 2329 2444
-4631 2 2 0 1 2347 2323 2341
-4632 2 2 0 1 2341 2366 2347
-4633 2 2 0 1 2169 2351 2296
-4634 2 2 0 1 2296 2351 2269
-4635 2 2 0 1 2337 2336 2342
-4636 2 2 0 1 2344 2336 2337
-4637 2 2 0 1 2338 1042 1043
-4638 2 2 0 1 2345 2338 1043
-4639 2 2 0 1 2350 1042 2338
-4640 2 2 0 1 2331 2372 2285
-4641 2 2 0 1 2285 2372 2373
-4642 2 2 0 1 2339 2340 2284
-4643 2 2 0 1 2284 2340 2282
-4644 2 2 0 1 2339 1023 2340
-4645 2 2 0 1 2367 2359 2358
-4646 2 2 0 1 2358 2359 2307
-4647 2 2 0 1 2404 2349 2405
-4648 2 2 0 1 2349 2348 2341
-4649 2 2 0 1 2341 2405 2349
-4650 2 2 0 1 2342 2343 2337
-4651 2 2 0 1 2344 2337 2298
-4652 2 2 0 1 2338 2345 2346
-4653 2 2 0 1 2350 2338 2346
-4654 2 2 0 1 2343 2323 2347
-4655 2 2 0 1 2347 2366 2298
-4656 2 2 0 1 2349 2404 2332
-4657 2 2 0 1 2348 2349 2332
-4658 2 2 0 1 2340 1023 2350
-4659 2 2 0 1 2282 2340 2350
-4660 2 2 0 1 2351 2331 2269
-4661 2 2 0 1 2371 2352 2330
-4662 2 2 0 1 2353 2363 2286
-4663 2 2 0 1 2354 2286 2363
-4664 2 2 0 1 2297 2355 2288
-4665 2 2 0 1 2356 2288 2355
-4666 2 2 0 1 2355 2269 2356
-4667 2 2 0 1 2308 2358 2307
-4668 2 2 0 1 2308 2280 2358
-4669 2 2 0 1 2280 2300 2358
-4670 2 2 0 1 2367 2358 2357
-4671 2 2 0 1 2357 2358 2300
-4672 2 2 0 1 2360 2307 2359
-4673 2 2 0 1 2319 2295 2360
-4674 2 2 0 1 2359 2319 2360
-4675 2 2 0 1 2370 2361 2362
-4676 2 2 0 1 2361 2370 2363
-4677 2 2 0 1 2365 2353 2364
-4678 2 2 0 1 2363 2353 2365
-4679 2 2 0 1 2365 2364 2309
-4680 2 2 0 1 2363 2365 2361
-4681 2 2 0 1 2361 2365 2309
-4682 2 2 0 1 1067 1082 2374
-4683 2 2 0 1 2374 2189 1067
-4684 2 2 0 1 2366 2341 2367
-4685 2 2 0 1 2341 2348 2367
-4686 2 2 0 1 2367 2348 2359
-4687 2 2 0 1 2337 2343 2347
-4688 2 2 0 1 2337 2347 2298
-4689 2 2 0 1 2351 2169 2189
-4690 2 2 0 1 2374 2351 2189
-4691 2 2 0 1 2270 2462 2369
-4692 2 2 0 1 2369 2370 2362
-4693 2 2 0 1 2369 2362 2270
-4694 2 2 0 1 2352 2371 2368
-4695 2 2 0 1 2352 2368 2370
-4696 2 2 0 1 2369 2462 2352
-4697 2 2 0 1 2370 2369 2352
-4698 2 2 0 1 2368 2371 2354
-4699 2 2 0 1 2354 2363 2368
-4700 2 2 0 1 2370 2368 2363
-4701 2 2 0 1 2331 2351 2372
-4702 2 2 0 1 2372 1081 2373
-4703 2 2 0 1 1081 2372 1082
-4704 2 2 0 1 2374 1082 2372
-4705 2 2 0 1 2372 2351 2374
-4706 2 2 0 1 2275 2381 2375
-4707 2 2 0 1 2375 2274 2275
-4708 2 2 0 1 2166 2124 2375
-4709 2 2 0 1 2124 2274 2375
-4710 2 2 0 1 2166 2375 2168
-4711 2 2 0 1 2375 2381 2168
-4712 2 2 0 1 2268 2526 2376
-4713 2 2 0 1 2380 2384 2378
-4714 2 2 0 1 2268 2377 2342
-4715 2 2 0 1 2383 2386 2398
-4716 2 2 0 1 2381 2304 2379
-4717 2 2 0 1 2378 2379 2380
-4718 2 2 0 1 2381 2379 2378
-4719 2 2 0 1 2390 2399 2382
-4720 2 2 0 1 2383 2398 2397
-4721 2 2 0 1 2386 2383 2377
-4722 2 2 0 1 2382 2378 2384
-4723 2 2 0 1 2387 2388 2385
-4724 2 2 0 1 2386 2400 2518
-4725 2 2 0 1 2395 2428 2396
-4726 2 2 0 1 2387 2436 2427
-4727 2 2 0 1 2388 2387 2417
-4728 2 2 0 1 2378 2382 2399
-4729 2 2 0 1 2417 2414 2388
-4730 2 2 0 1 2405 2323 2389
-4731 2 2 0 1 2389 2385 2388
-4732 2 2 0 1 2391 2383 2397
-4733 2 2 0 1 2304 2277 2413
-4734 2 2 0 1 2413 2379 2304
-4735 2 2 0 1 2379 2413 2380
-4736 2 2 0 1 2389 2391 2385
-4737 2 2 0 1 2382 2384 2403
-4738 2 2 0 1 2382 2231 2390
-4739 2 2 0 1 2403 2231 2382
-4740 2 2 0 1 2342 2393 2343
-4741 2 2 0 1 2383 2391 2393
-4742 2 2 0 1 2415 2407 2411
-4743 2 2 0 1 2387 2394 2436
-4744 2 2 0 1 2394 2385 2395
-4745 2 2 0 1 2385 2394 2387
-4746 2 2 0 1 2343 2392 2323
-4747 2 2 0 1 2392 2391 2389
-4748 2 2 0 1 2389 2323 2392
-4749 2 2 0 1 2393 2342 2377
-4750 2 2 0 1 2383 2393 2377
-4751 2 2 0 1 2393 2392 2343
-4752 2 2 0 1 2393 2391 2392
-4753 2 2 0 1 2436 2394 2396
-4754 2 2 0 1 2395 2396 2394
-4755 2 2 0 1 2403 2191 2231
-4756 2 2 0 1 2391 2397 2385
-4757 2 2 0 1 2395 2385 2397
-4758 2 2 0 1 2398 2443 2428
-4759 2 2 0 1 2428 2397 2398
-4760 2 2 0 1 2397 2428 2395
-4761 2 2 0 1 2378 2399 2168
-4762 2 2 0 1 2168 2381 2378
-4763 2 2 0 1 2268 2376 2377
-4764 2 2 0 1 2377 2376 2400
-4765 2 2 0 1 2386 2377 2400
-4766 2 2 0 1 2401 2386 2518
-4767 2 2 0 1 2398 2386 2401
-4768 2 2 0 1 2389 2420 2405
-4769 2 2 0 1 2414 2420 2388
-4770 2 2 0 1 2420 2389 2388
-4771 2 2 0 1 2518 2441 2401
-4772 2 2 0 1 2401 2441 2443
-4773 2 2 0 1 2443 2398 2401
-4774 2 2 0 1 2421 2192 2191
-4775 2 2 0 1 2421 2191 2402
-4776 2 2 0 1 2402 2191 2403
-4777 2 2 0 1 2421 2402 2409
-4778 2 2 0 1 2406 2409 2402
-4779 2 2 0 1 2406 2402 2403
-4780 2 2 0 1 2384 2406 2403
-4781 2 2 0 1 2404 2405 2420
-4782 2 2 0 1 2417 2408 2407
-4783 2 2 0 1 2408 2417 2427
-4784 2 2 0 1 2417 2387 2427
-4785 2 2 0 1 2380 2412 2384
-4786 2 2 0 1 2411 2406 2412
-4787 2 2 0 1 2412 2406 2384
-4788 2 2 0 1 2407 2408 2424
-4789 2 2 0 1 2409 2406 2410
-4790 2 2 0 1 2410 2406 2411
-4791 2 2 0 1 2415 2411 2412
-4792 2 2 0 1 2412 2413 2415
-4793 2 2 0 1 2412 2380 2413
-4794 2 2 0 1 2414 2417 2416
-4795 2 2 0 1 2407 2415 2416
-4796 2 2 0 1 2407 2416 2417
-4797 2 2 0 1 2407 2424 2411
-4798 2 2 0 1 2410 2411 2424
-4799 2 2 0 1 2413 2418 2415
-4800 2 2 0 1 2418 2416 2415
-4801 2 2 0 1 2416 2418 2414
-4802 2 2 0 1 2277 2419 2413
-4803 2 2 0 1 2413 2419 2418
-4804 2 2 0 1 2404 2419 2277
-4805 2 2 0 1 2420 2419 2404
-4806 2 2 0 1 2414 2419 2420
-4807 2 2 0 1 2414 2418 2419
-4808 2 2 0 1 2421 2409 2422
-4809 2 2 0 1 4858 2422 2423
-4810 2 2 0 1 2423 2433 4852
-4811 2 2 0 1 2409 2410 2433
-4812 2 2 0 1 2410 2424 2425
-4813 2 2 0 1 4852 2425 2426
-4814 2 2 0 1 2424 2408 2432
-4815 2 2 0 1 2426 2432 2431
-4816 2 2 0 1 2408 2427 2430
-4817 2 2 0 1 2431 2430 2435
-4818 2 2 0 1 2427 2436 2434
-4819 2 2 0 1 2435 2434 2438
-4820 2 2 0 1 2436 2396 2437
-4821 2 2 0 1 2438 2437 4855
-4822 2 2 0 1 2428 2439 2396
-4823 2 2 0 1 4855 2439 4857
-4824 2 2 0 1 2429 2428 2443
-4825 2 2 0 1 2429 2440 4857
-4826 2 2 0 1 2432 2408 2430
-4827 2 2 0 1 2430 2431 2432
-4828 2 2 0 1 2422 2409 2433
-4829 2 2 0 1 2433 2423 2422
-4830 2 2 0 1 2430 2427 2434
-4831 2 2 0 1 2434 2435 2430
-4832 2 2 0 1 2425 2424 2432
-4833 2 2 0 1 2432 2426 2425
-4834 2 2 0 1 2433 2410 2425
-4835 2 2 0 1 2425 4852 2433
-4836 2 2 0 1 2434 2436 2437
-4837 2 2 0 1 2437 2438 2434
-4838 2 2 0 1 2437 2396 2439
-4839 2 2 0 1 2439 4855 2437
-4840 2 2 0 1 2428 2429 2439
-4841 2 2 0 1 2439 2429 4857
-4842 2 2 0 1 4859 2442 4858
-4843 2 2 0 1 2558 2557 2440
-4844 2 2 0 1 2192 2421 2442
-4845 2 2 0 1 2558 2443 2441
-4846 2 2 0 1 2442 2421 2422
-4847 2 2 0 1 4858 2442 2422
-4848 2 2 0 1 2429 2443 2558
-4849 2 2 0 1 2429 2558 2440
-4850 2 2 0 1 2450 2452 2335
-4851 2 2 0 1 2444 2335 2452
-4852 2 2 0 1 2452 2445 2444
-4853 2 2 0 1 2526 2444 2445
-4854 2 2 0 1 2462 2270 2446
-4855 2 2 0 1 2447 2448 2455
-4856 2 2 0 1 2455 2450 2447
-4857 2 2 0 1 2335 2301 2449
-4858 2 2 0 1 2449 2447 2450
-4859 2 2 0 1 2449 2450 2335
-4860 2 2 0 1 2450 2454 2452
-4861 2 2 0 1 2451 2445 2454
-4862 2 2 0 1 2445 2452 2454
-4863 2 2 0 1 2447 2463 2448
-4864 2 2 0 1 2459 2453 2472
-4865 2 2 0 1 2478 2270 2456
-4866 2 2 0 1 2446 2270 2478
-4867 2 2 0 1 2451 2454 2459
-4868 2 2 0 1 2454 2450 2455
-4869 2 2 0 1 2473 2474 2480
-4870 2 2 0 1 2326 2457 2456
-4871 2 2 0 1 2456 2457 2478
-4872 2 2 0 1 2471 2470 2475
-4873 2 2 0 1 2475 2470 2468
-4874 2 2 0 1 2453 2459 2458
-4875 2 2 0 1 2458 2454 2455
-4876 2 2 0 1 2458 2459 2454
-4877 2 2 0 1 2460 2493 2532
-4878 2 2 0 1 2460 2465 2493
-4879 2 2 0 1 2446 2509 2463
-4880 2 2 0 1 2465 2453 2461
-4881 2 2 0 1 2461 2453 2448
-4882 2 2 0 1 2446 2463 2464
-4883 2 2 0 1 2462 2446 2464
-4884 2 2 0 1 2464 2463 2447
-4885 2 2 0 1 2453 2458 2448
-4886 2 2 0 1 2448 2458 2455
-4887 2 2 0 1 2464 2301 2462
-4888 2 2 0 1 2493 2465 2466
-4889 2 2 0 1 2466 2465 2461
-4890 2 2 0 1 2466 2502 2467
-4891 2 2 0 1 2475 2468 2504
-4892 2 2 0 1 1186 2487 2469
-4893 2 2 0 1 2469 2470 2471
-4894 2 2 0 1 2460 2472 2465
-4895 2 2 0 1 2465 2472 2453
-4896 2 2 0 1 1177 2474 2507
-4897 2 2 0 1 2473 2507 2474
-4898 2 2 0 1 2471 2506 2473
-4899 2 2 0 1 2471 2475 2506
-4900 2 2 0 1 2301 2464 2449
-4901 2 2 0 1 2447 2449 2464
-4902 2 2 0 1 2457 2476 2478
-4903 2 2 0 1 2507 2476 2457
-4904 2 2 0 1 2327 1177 2477
-4905 2 2 0 1 2326 2477 2457
-4906 2 2 0 1 2327 2477 2326
-4907 2 2 0 1 2507 2477 1177
-4908 2 2 0 1 2477 2507 2457
-4909 2 2 0 1 2478 2509 2446
-4910 2 2 0 1 2509 2478 2476
-4911 2 2 0 1 2476 2506 2509
-4912 2 2 0 1 2469 2479 2470
-4913 2 2 0 1 2480 2481 2473
-4914 2 2 0 1 2469 2471 2481
-4915 2 2 0 1 2473 2481 2471
-4916 2 2 0 1 2582 2482 2512
-4917 2 2 0 1 2480 1186 2481
-4918 2 2 0 1 2481 1186 2469
-4919 2 2 0 1 2512 2513 2582
-4920 2 2 0 1 2479 2469 2487
-4921 2 2 0 1 2488 2486 2497
-4922 2 2 0 1 1190 2483 2485
-4923 2 2 0 1 2484 2485 2483
-4924 2 2 0 1 1190 2485 2488
-4925 2 2 0 1 2489 2486 2484
-4926 2 2 0 1 2485 2484 2486
-4927 2 2 0 1 2486 2488 2485
-4928 2 2 0 1 2487 1190 2488
-4929 2 2 0 1 2479 2488 2497
-4930 2 2 0 1 2487 2488 2479
-4931 2 2 0 1 2486 2489 2495
-4932 2 2 0 1 2491 2570 2569
-4933 2 2 0 1 2484 2491 2489
-4934 2 2 0 1 2468 2470 2497
-4935 2 2 0 1 2479 2497 2470
-4936 2 2 0 1 2497 2515 2468
-4937 2 2 0 1 1197 2484 2483
-4938 2 2 0 1 2535 2532 2500
-4939 2 2 0 1 2495 2494 2499
-4940 2 2 0 1 2490 2492 1197
-4941 2 2 0 1 2490 2570 2492
-4942 2 2 0 1 2494 2500 2499
-4943 2 2 0 1 1197 2492 2484
-4944 2 2 0 1 2491 2484 2492
-4945 2 2 0 1 2491 2492 2570
-4946 2 2 0 1 2532 2498 2500
-4947 2 2 0 1 2498 2466 2467
-4948 2 2 0 1 2498 2493 2466
-4949 2 2 0 1 2532 2493 2498
-4950 2 2 0 1 2528 2535 2500
-4951 2 2 0 1 2528 2500 2494
-4952 2 2 0 1 2497 2496 2515
-4953 2 2 0 1 2486 2495 2496
-4954 2 2 0 1 2486 2496 2497
-4955 2 2 0 1 2495 2514 2494
-4956 2 2 0 1 2528 2494 2514
-4957 2 2 0 1 2512 2482 2514
-4958 2 2 0 1 2514 2482 2528
-4959 2 2 0 1 2515 2467 2468
-4960 2 2 0 1 2501 2467 2515
-4961 2 2 0 1 2501 2498 2467
-4962 2 2 0 1 2499 2501 2515
-4963 2 2 0 1 2501 2499 2500
-4964 2 2 0 1 2498 2501 2500
-4965 2 2 0 1 2502 2448 2463
-4966 2 2 0 1 2448 2502 2461
-4967 2 2 0 1 2461 2502 2466
-4968 2 2 0 1 2468 2467 2503
-4969 2 2 0 1 2504 2503 2502
-4970 2 2 0 1 2468 2503 2504
-4971 2 2 0 1 2467 2502 2503
-4972 2 2 0 1 2507 2473 2505
-4973 2 2 0 1 2476 2505 2506
-4974 2 2 0 1 2506 2505 2473
-4975 2 2 0 1 2505 2476 2507
-4976 2 2 0 1 2508 2502 2463
-4977 2 2 0 1 2502 2508 2504
-4978 2 2 0 1 2509 2508 2463
-4979 2 2 0 1 2510 2509 2506
-4980 2 2 0 1 2475 2504 2510
-4981 2 2 0 1 2510 2506 2475
-4982 2 2 0 1 2508 2509 2510
-4983 2 2 0 1 2504 2508 2510
-4984 2 2 0 1 2489 2491 2511
-4985 2 2 0 1 2569 2511 2491
-4986 2 2 0 1 2511 2513 2512
-4987 2 2 0 1 2513 2511 2569
-4988 2 2 0 1 2511 2495 2489
-4989 2 2 0 1 2514 2495 2511
-4990 2 2 0 1 2514 2511 2512
-4991 2 2 0 1 2515 2495 2499
-4992 2 2 0 1 2515 2496 2495
-4993 2 2 0 1 2482 2582 2584
-4994 2 2 0 1 2519 2516 2517
-4995 2 2 0 1 2516 2518 2400
-4996 2 2 0 1 2518 2516 2519
-4997 2 2 0 1 2518 2519 2441
-4998 2 2 0 1 2516 2400 2523
-4999 2 2 0 1 2517 2516 2521
-5000 2 2 0 1 2524 2521 2523
-5001 2 2 0 1 2521 2516 2523
-5002 2 2 0 1 2400 2376 2523
-5003 2 2 0 1 2517 2521 2530
-5004 2 2 0 1 2521 2520 2530
-5005 2 2 0 1 2520 2521 2524
-5006 2 2 0 1 2459 2539 2451
-5007 2 2 0 1 2522 2445 2451
-5008 2 2 0 1 2522 2451 2539
-5009 2 2 0 1 2520 2524 2522
-5010 2 2 0 1 2539 2520 2522
-5011 2 2 0 1 2523 2376 2525
-5012 2 2 0 1 2525 2522 2524
-5013 2 2 0 1 2523 2525 2524
-5014 2 2 0 1 2376 2526 2525
-5015 2 2 0 1 2445 2522 2525
-5016 2 2 0 1 2525 2526 2445
-5017 2 2 0 1 2534 2552 2554
-5018 2 2 0 1 2527 2528 2482
-5019 2 2 0 1 2528 2536 2535
-5020 2 2 0 1 2527 2536 2528
-5021 2 2 0 1 2536 2552 2534
-5022 2 2 0 1 2550 2552 2536
-5023 2 2 0 1 2527 2550 2536
-5024 2 2 0 1 2531 2529 2530
-5025 2 2 0 1 2530 2520 2531
-5026 2 2 0 1 2548 2543 2544
-5027 2 2 0 1 2532 2538 2460
-5028 2 2 0 1 2544 2538 2533
-5029 2 2 0 1 2544 2533 2548
-5030 2 2 0 1 2539 2459 2540
-5031 2 2 0 1 2554 2548 2533
-5032 2 2 0 1 2534 2554 2533
-5033 2 2 0 1 2537 2532 2535
-5034 2 2 0 1 2533 2537 2534
-5035 2 2 0 1 2537 2535 2536
-5036 2 2 0 1 2536 2534 2537
-5037 2 2 0 1 2538 2532 2537
-5038 2 2 0 1 2537 2533 2538
-5039 2 2 0 1 2520 2539 2531
-5040 2 2 0 1 2540 2531 2539
-5041 2 2 0 1 2531 2540 2541
-5042 2 2 0 1 2529 2531 2541
-5043 2 2 0 1 2529 2541 2542
-5044 2 2 0 1 2580 2550 2527
-5045 2 2 0 1 2543 2546 2544
-5046 2 2 0 1 2540 2546 2541
-5047 2 2 0 1 2541 2546 2542
-5048 2 2 0 1 2543 2542 2546
-5049 2 2 0 1 2584 2527 2482
-5050 2 2 0 1 2584 2580 2527
-5051 2 2 0 1 2472 2547 2459
-5052 2 2 0 1 2547 2546 2540
-5053 2 2 0 1 2540 2459 2547
-5054 2 2 0 1 2544 2545 2538
-5055 2 2 0 1 2544 2546 2545
-5056 2 2 0 1 2460 2545 2472
-5057 2 2 0 1 2460 2538 2545
-5058 2 2 0 1 2546 2547 2545
-5059 2 2 0 1 2547 2472 2545
-5060 2 2 0 1 2548 2554 4867
-5061 2 2 0 1 2548 4867 4866
-5062 2 2 0 1 2548 4866 2543
-5063 2 2 0 1 4866 2549 2543
-5064 2 2 0 1 2542 2543 2549
-5065 2 2 0 1 2542 2549 2560
-5066 2 2 0 1 2550 2551 2552
-5067 2 2 0 1 2552 2551 2553
-5068 2 2 0 1 2552 2553 2554
-5069 2 2 0 1 4867 2554 2553
-5070 2 2 0 1 2551 2550 2579
-5071 2 2 0 1 2579 2550 2580
-5072 2 2 0 1 2555 2556 2517
-5073 2 2 0 1 2517 2530 2555
-5074 2 2 0 1 2556 2519 2517
-5075 2 2 0 1 2519 2556 2559
-5076 2 2 0 1 2558 2559 2557
-5077 2 2 0 1 2558 2519 2559
-5078 2 2 0 1 2519 2558 2441
-5079 2 2 0 1 2529 2542 2561
-5080 2 2 0 1 2560 2561 2542
-5081 2 2 0 1 2529 2555 2530
-5082 2 2 0 1 2555 2529 2561
-5083 2 2 0 1 1285 1272 2567
-5084 2 2 0 1 2582 2513 2574
-5085 2 2 0 1 2563 2566 2586
-5086 2 2 0 1 2564 2562 2571
-5087 2 2 0 1 2566 2562 2564
-5088 2 2 0 1 2563 2565 2566
-5089 2 2 0 1 2577 2565 2563
-5090 2 2 0 1 2564 1285 2566
-5091 2 2 0 1 2565 2562 2566
-5092 2 2 0 1 2567 2566 1285
-5093 2 2 0 1 2566 2567 2586
-5094 2 2 0 1 2568 2513 2569
-5095 2 2 0 1 2565 2577 2568
-5096 2 2 0 1 2573 2569 2570
-5097 2 2 0 1 2562 2565 2573
-5098 2 2 0 1 2571 2572 2490
-5099 2 2 0 1 2572 2570 2490
-5100 2 2 0 1 2571 2562 2572
-5101 2 2 0 1 2570 2572 2573
-5102 2 2 0 1 2572 2562 2573
-5103 2 2 0 1 2568 2569 2573
-5104 2 2 0 1 2568 2573 2565
-5105 2 2 0 1 2513 2568 2574
-5106 2 2 0 1 2574 2568 2577
-5107 2 2 0 1 1272 2575 2567
-5108 2 2 0 1 2575 2586 2567
-5109 2 2 0 1 2576 2586 2575
-5110 2 2 0 1 2563 2585 2577
-5111 2 2 0 1 2577 2585 2587
-5112 2 2 0 1 2578 2581 2583
-5113 2 2 0 1 2580 2583 2581
-5114 2 2 0 1 2579 2580 2581
-5115 2 2 0 1 2583 2580 2584
-5116 2 2 0 1 2582 2583 2584
-5117 2 2 0 1 2574 2583 2582
-5118 2 2 0 1 2576 5096 2585
-5119 2 2 0 1 2586 2585 2563
-5120 2 2 0 1 2586 2576 2585
-5121 2 2 0 1 2587 5096 5097
-5122 2 2 0 1 2585 5096 2587
-5123 2 2 0 1 2577 2583 2574
-5124 2 2 0 1 2577 2587 2583
-5125 2 2 0 1 2583 5097 2578
-5126 2 2 0 1 2587 5097 2583
-5127 2 2 0 1 2589 1301 2588
-5128 2 2 0 1 2591 2590 2598
-5129 2 2 0 1 2589 2597 2600
-5130 2 2 0 1 2588 2597 2589
-5131 2 2 0 1 2600 2595 2593
-5132 2 2 0 1 2597 2595 2600
-5133 2 2 0 1 2593 2592 2661
-5134 2 2 0 1 2591 2592 2590
-5135 2 2 0 1 2592 2591 2661
-5136 2 2 0 1 2592 2595 2590
-5137 2 2 0 1 2593 2595 2592
-5138 2 2 0 1 2594 1302 2693
-5139 2 2 0 1 2588 1301 1303
-5140 2 2 0 1 2595 1304 2596
-5141 2 2 0 1 2595 2597 1304
-5142 2 2 0 1 2597 1303 1304
-5143 2 2 0 1 2597 2588 1303
-5144 2 2 0 1 1302 2595 2596
-5145 2 2 0 1 1302 2590 2595
-5146 2 2 0 1 2594 2590 1302
-5147 2 2 0 1 2598 2590 2594
-5148 2 2 0 1 2589 2599 1301
-5149 2 2 0 1 2662 2660 2609
-5150 2 2 0 1 2589 2600 2607
-5151 2 2 0 1 2589 2607 2599
-5152 2 2 0 1 2600 2593 2605
-5153 2 2 0 1 2607 2600 2605
-5154 2 2 0 1 2593 2661 2601
-5155 2 2 0 1 2609 2601 2662
-5156 2 2 0 1 2662 2601 2661
-5157 2 2 0 1 2605 2593 2601
-5158 2 2 0 1 2605 2601 2609
-5159 2 2 0 1 2599 2606 1301
-5160 2 2 0 1 2610 2602 2603
-5161 2 2 0 1 2604 2605 2608
-5162 2 2 0 1 2607 2605 2604
-5163 2 2 0 1 2604 2606 2607
-5164 2 2 0 1 2606 2599 2607
-5165 2 2 0 1 2603 2608 2605
-5166 2 2 0 1 2609 2603 2605
-5167 2 2 0 1 2603 2609 2610
-5168 2 2 0 1 2660 2610 2609
-5169 2 2 0 1 2730 2611 2613
-5170 2 2 0 1 2611 2761 2631
-5171 2 2 0 1 2633 2631 2761
-5172 2 2 0 1 2611 2730 2761
-5173 2 2 0 1 2612 2631 2615
-5174 2 2 0 1 2611 2631 2612
-5175 2 2 0 1 2613 2611 2612
-5176 2 2 0 1 2612 2637 2613
-5177 2 2 0 1 2639 2637 2614
-5178 2 2 0 1 2614 2637 2612
-5179 2 2 0 1 2615 2614 2612
-5180 2 2 0 1 2660 2616 2617
-5181 2 2 0 1 2660 2617 2610
-5182 2 2 0 1 2623 2616 2618
-5183 2 2 0 1 2616 2623 2617
-5184 2 2 0 1 2620 2618 2619
-5185 2 2 0 1 2623 2618 2620
-5186 2 2 0 1 2626 2619 2621
-5187 2 2 0 1 2620 2619 2626
-5188 2 2 0 1 2629 2621 2647
-5189 2 2 0 1 2626 2621 2629
-5190 2 2 0 1 2639 2614 2647
-5191 2 2 0 1 2629 2647 2614
-5192 2 2 0 1 2617 2622 2602
-5193 2 2 0 1 2602 2610 2617
-5194 2 2 0 1 2623 2624 2622
-5195 2 2 0 1 2622 2617 2623
-5196 2 2 0 1 2625 2624 2620
-5197 2 2 0 1 2620 2624 2623
-5198 2 2 0 1 2626 2627 2625
-5199 2 2 0 1 2626 2625 2620
-5200 2 2 0 1 2629 2630 2627
-5201 2 2 0 1 2629 2627 2626
-5202 2 2 0 1 2628 2630 2614
-5203 2 2 0 1 2629 2614 2630
-5204 2 2 0 1 2615 2632 2628
-5205 2 2 0 1 2614 2615 2628
-5206 2 2 0 1 2631 52 2632
-5207 2 2 0 1 2631 2632 2615
-5208 2 2 0 1 2633 52 2631
-5209 2 2 0 1 52 2633 207
-5210 2 2 0 1 2636 2613 2637
-5211 2 2 0 1 2636 2788 2613
-5212 2 2 0 1 2788 2730 2613
-5213 2 2 0 1 2782 2788 2636
-5214 2 2 0 1 2634 2618 2616
-5215 2 2 0 1 2659 2665 2634
-5216 2 2 0 1 2665 2638 2645
-5217 2 2 0 1 2665 2645 2634
-5218 2 2 0 1 2635 2619 2618
-5219 2 2 0 1 2618 2634 2635
-5220 2 2 0 1 2649 2636 2637
-5221 2 2 0 1 2619 2643 2621
-5222 2 2 0 1 2635 2643 2619
-5223 2 2 0 1 2634 2645 2635
-5224 2 2 0 1 2640 2641 2638
-5225 2 2 0 1 2641 2645 2638
-5226 2 2 0 1 2649 2637 2639
-5227 2 2 0 1 2652 2640 2651
-5228 2 2 0 1 2640 2652 2641
-5229 2 2 0 1 2644 2641 2652
-5230 2 2 0 1 2782 2636 2642
-5231 2 2 0 1 2782 2642 2656
-5232 2 2 0 1 2643 2641 2644
-5233 2 2 0 1 2635 2645 2643
-5234 2 2 0 1 2645 2641 2643
-5235 2 2 0 1 2646 2644 2652
-5236 2 2 0 1 2621 2643 2644
-5237 2 2 0 1 2621 2644 2647
-5238 2 2 0 1 2644 2646 2648
-5239 2 2 0 1 2649 2648 2646
-5240 2 2 0 1 2644 2648 2647
-5241 2 2 0 1 2648 2639 2647
-5242 2 2 0 1 2648 2649 2639
-5243 2 2 0 1 2649 2646 2650
-5244 2 2 0 1 2636 2654 2642
-5245 2 2 0 1 2649 2650 2654
-5246 2 2 0 1 2649 2654 2636
-5247 2 2 0 1 2652 2651 2653
-5248 2 2 0 1 2653 2651 2685
-5249 2 2 0 1 2653 2646 2652
-5250 2 2 0 1 2646 2653 2650
-5251 2 2 0 1 2685 2689 2655
-5252 2 2 0 1 2655 2653 2685
-5253 2 2 0 1 2655 2642 2654
-5254 2 2 0 1 2654 2650 2655
-5255 2 2 0 1 2655 2650 2653
-5256 2 2 0 1 2689 2657 2658
-5257 2 2 0 1 2656 2658 2657
-5258 2 2 0 1 2689 2658 2655
-5259 2 2 0 1 2658 2656 2642
-5260 2 2 0 1 2642 2655 2658
-5261 2 2 0 1 2634 2616 2663
-5262 2 2 0 1 2663 2659 2634
-5263 2 2 0 1 2616 2660 2663
-5264 2 2 0 1 2660 2662 2663
-5265 2 2 0 1 2661 2659 2662
-5266 2 2 0 1 2662 2659 2663
-5267 2 2 0 1 2681 2672 2664
-5268 2 2 0 1 2887 2885 2681
-5269 2 2 0 1 2664 2887 2681
-5270 2 2 0 1 2664 2987 2887
-5271 2 2 0 1 2670 2665 2659
-5272 2 2 0 1 2670 2712 2667
-5273 2 2 0 1 2669 2638 2665
-5274 2 2 0 1 2670 2669 2665
-5275 2 2 0 1 2671 2667 2666
-5276 2 2 0 1 2667 2671 2670
-5277 2 2 0 1 2668 2672 2681
-5278 2 2 0 1 2676 2674 2666
-5279 2 2 0 1 2674 2671 2666
-5280 2 2 0 1 2669 2670 2671
-5281 2 2 0 1 2673 2640 2638
-5282 2 2 0 1 2669 2673 2638
-5283 2 2 0 1 2668 2679 2672
-5284 2 2 0 1 2640 2684 2651
-5285 2 2 0 1 2640 2673 2684
-5286 2 2 0 1 2673 2675 2684
-5287 2 2 0 1 2885 2686 2681
-5288 2 2 0 1 2691 2686 2885
-5289 2 2 0 1 2673 2674 2675
-5290 2 2 0 1 2669 2671 2674
-5291 2 2 0 1 2674 2673 2669
-5292 2 2 0 1 2683 2684 2675
-5293 2 2 0 1 2676 2675 2674
-5294 2 2 0 1 2678 2675 2676
-5295 2 2 0 1 2677 2683 2675
-5296 2 2 0 1 2683 2677 2668
-5297 2 2 0 1 2678 2677 2675
-5298 2 2 0 1 2678 2679 2677
-5299 2 2 0 1 2679 2668 2677
-5300 2 2 0 1 2668 2680 2683
-5301 2 2 0 1 2688 2681 2686
-5302 2 2 0 1 2688 2680 2668
-5303 2 2 0 1 2681 2688 2668
-5304 2 2 0 1 2682 2651 2684
-5305 2 2 0 1 2651 2682 2685
-5306 2 2 0 1 2683 2682 2684
-5307 2 2 0 1 2683 2680 2682
-5308 2 2 0 1 2689 2685 2687
-5309 2 2 0 1 2682 2687 2685
-5310 2 2 0 1 2687 2688 2686
-5311 2 2 0 1 2687 2680 2688
-5312 2 2 0 1 2680 2687 2682
-5313 2 2 0 1 2689 2690 2657
-5314 2 2 0 1 2690 2691 2657
-5315 2 2 0 1 2690 2689 2687
-5316 2 2 0 1 2690 2686 2691
-5317 2 2 0 1 2687 2686 2690
-5318 2 2 0 1 2659 2692 2670
-5319 2 2 0 1 2692 2712 2670
-5320 2 2 0 1 2598 2712 2692
-5321 2 2 0 1 2591 2598 2692
-5322 2 2 0 1 2591 2659 2661
-5323 2 2 0 1 2659 2591 2692
-5324 2 2 0 1 2713 2693 1350
-5325 2 2 0 1 2594 2693 2713
-5326 2 2 0 1 2711 1350 2694
-5327 2 2 0 1 2713 1350 2711
-5328 2 2 0 1 2695 2694 2697
-5329 2 2 0 1 2711 2694 2695
-5330 2 2 0 1 2696 2697 2699
-5331 2 2 0 1 2695 2697 2696
-5332 2 2 0 1 2698 2699 2700
-5333 2 2 0 1 2696 2699 2698
-5334 2 2 0 1 2710 2700 2701
-5335 2 2 0 1 2698 2700 2710
-5336 2 2 0 1 2702 2701 2703
-5337 2 2 0 1 2710 2701 2702
-5338 2 2 0 1 2707 2703 2704
-5339 2 2 0 1 2702 2703 2707
-5340 2 2 0 1 2704 2705 2707
-5341 2 2 0 1 2704 3041 2705
-5342 2 2 0 1 2706 2987 2664
-5343 2 2 0 1 2706 2707 2708
-5344 2 2 0 1 2705 2708 2707
-5345 2 2 0 1 2708 2987 2706
-5346 2 2 0 1 2707 2709 2702
-5347 2 2 0 1 2707 2706 2709
-5348 2 2 0 1 2709 2706 2664
-5349 2 2 0 1 2672 2709 2664
-5350 2 2 0 1 2710 2672 2679
-5351 2 2 0 1 2672 2710 2709
-5352 2 2 0 1 2702 2709 2710
-5353 2 2 0 1 2598 2713 2712
-5354 2 2 0 1 2594 2713 2598
-5355 2 2 0 1 2712 2711 2667
-5356 2 2 0 1 2712 2713 2711
-5357 2 2 0 1 2667 2695 2666
-5358 2 2 0 1 2667 2711 2695
-5359 2 2 0 1 2666 2696 2676
-5360 2 2 0 1 2666 2695 2696
-5361 2 2 0 1 2676 2698 2678
-5362 2 2 0 1 2676 2696 2698
-5363 2 2 0 1 2678 2710 2679
-5364 2 2 0 1 2678 2698 2710
-5365 2 2 0 1 2767 2722 207
-5366 2 2 0 1 2633 2767 207
-5367 2 2 0 1 2758 2714 208
-5368 2 2 0 1 2758 208 2772
-5369 2 2 0 1 208 2715 2772
-5370 2 2 0 1 2715 2717 2772
-5371 2 2 0 1 2715 2716 2717
-5372 2 2 0 1 2718 2717 2716
-5373 2 2 0 1 2721 2718 2716
-5374 2 2 0 1 2718 2721 2768
-5375 2 2 0 1 206 2726 2719
-5376 2 2 0 1 2726 206 2720
-5377 2 2 0 1 2720 206 2714
-5378 2 2 0 1 2758 2720 2714
-5379 2 2 0 1 2768 2721 2722
-5380 2 2 0 1 2768 2722 2767
-5381 2 2 0 1 2751 2723 2725
-5382 2 2 0 1 2723 2751 2724
-5383 2 2 0 1 2751 2727 2724
-5384 2 2 0 1 2719 2725 2723
-5385 2 2 0 1 2719 2726 2725
-5386 2 2 0 1 2724 2727 212
-5387 2 2 0 1 2756 212 2727
-5388 2 2 0 1 2756 214 212
-5389 2 2 0 1 214 2728 215
-5390 2 2 0 1 2728 214 2756
-5391 2 2 0 1 217 215 2735
-5392 2 2 0 1 215 2728 2735
-5393 2 2 0 1 3558 217 2729
-5394 2 2 0 1 217 2735 2729
-5395 2 2 0 1 3556 2729 2735
-5396 2 2 0 1 2761 2730 2749
-5397 2 2 0 1 2751 2725 2731
-5398 2 2 0 1 2771 2732 2831
-5399 2 2 0 1 2831 2733 2771
-5400 2 2 0 1 2726 2720 2755
-5401 2 2 0 1 2742 2726 2755
-5402 2 2 0 1 2726 2742 2725
-5403 2 2 0 1 2731 2725 2742
-5404 2 2 0 1 2733 2734 2771
-5405 2 2 0 1 2735 2737 3556
-5406 2 2 0 1 2765 2759 2740
-5407 2 2 0 1 2752 2770 2753
-5408 2 2 0 1 2728 2754 2735
-5409 2 2 0 1 2735 2736 2737
-5410 2 2 0 1 2736 2734 2737
-5411 2 2 0 1 2736 2754 2759
-5412 2 2 0 1 2735 2754 2736
-5413 2 2 0 1 2738 2739 2744
-5414 2 2 0 1 2738 2764 2739
-5415 2 2 0 1 2750 2739 2740
-5416 2 2 0 1 2739 2764 2740
-5417 2 2 0 1 2741 2746 2745
-5418 2 2 0 1 2741 2743 2746
-5419 2 2 0 1 2731 2742 2746
-5420 2 2 0 1 2731 2746 2743
-5421 2 2 0 1 2744 2743 2741
-5422 2 2 0 1 2744 2739 2743
-5423 2 2 0 1 2731 2743 2750
-5424 2 2 0 1 2739 2750 2743
-5425 2 2 0 1 2738 2763 2764
-5426 2 2 0 1 2764 2765 2740
-5427 2 2 0 1 2747 2862 2745
-5428 2 2 0 1 2747 2745 2746
-5429 2 2 0 1 2742 2755 2747
-5430 2 2 0 1 2746 2742 2747
-5431 2 2 0 1 2769 2794 2862
-5432 2 2 0 1 2769 2862 2747
-5433 2 2 0 1 2752 2748 2749
-5434 2 2 0 1 2750 2751 2731
-5435 2 2 0 1 2751 2750 2727
-5436 2 2 0 1 2748 2752 2753
-5437 2 2 0 1 2728 2759 2754
-5438 2 2 0 1 2720 2758 2757
-5439 2 2 0 1 2755 2720 2757
-5440 2 2 0 1 2755 2757 2747
-5441 2 2 0 1 2769 2747 2757
-5442 2 2 0 1 2756 2740 2759
-5443 2 2 0 1 2759 2728 2756
-5444 2 2 0 1 2781 2758 2772
-5445 2 2 0 1 2781 2757 2758
-5446 2 2 0 1 2760 2759 2765
-5447 2 2 0 1 2765 2771 2760
-5448 2 2 0 1 2736 2759 2760
-5449 2 2 0 1 2756 2727 2740
-5450 2 2 0 1 2750 2740 2727
-5451 2 2 0 1 2767 2748 2768
-5452 2 2 0 1 2753 2768 2748
-5453 2 2 0 1 2766 2633 2761
-5454 2 2 0 1 2748 2766 2749
-5455 2 2 0 1 2749 2766 2761
-5456 2 2 0 1 2762 2763 2732
-5457 2 2 0 1 2771 2765 2762
-5458 2 2 0 1 2762 2732 2771
-5459 2 2 0 1 2764 2763 2762
-5460 2 2 0 1 2764 2762 2765
-5461 2 2 0 1 2633 2766 2767
-5462 2 2 0 1 2748 2767 2766
-5463 2 2 0 1 2768 2753 2718
-5464 2 2 0 1 2718 2753 2776
-5465 2 2 0 1 2801 2794 2780
-5466 2 2 0 1 2781 2780 2757
-5467 2 2 0 1 2794 2769 2780
-5468 2 2 0 1 2780 2769 2757
-5469 2 2 0 1 2718 2776 2717
-5470 2 2 0 1 2776 2777 2717
-5471 2 2 0 1 2770 2775 2774
-5472 2 2 0 1 2753 2774 2776
-5473 2 2 0 1 2753 2770 2774
-5474 2 2 0 1 2734 2760 2771
-5475 2 2 0 1 2734 2736 2760
-5476 2 2 0 1 2717 2777 2772
-5477 2 2 0 1 2778 2801 2773
-5478 2 2 0 1 2779 2775 2778
-5479 2 2 0 1 2774 2775 2779
-5480 2 2 0 1 2780 2773 2801
-5481 2 2 0 1 2776 2779 2777
-5482 2 2 0 1 2776 2774 2779
-5483 2 2 0 1 2778 2773 2779
-5484 2 2 0 1 2773 2777 2779
-5485 2 2 0 1 2780 2781 2773
-5486 2 2 0 1 2777 2781 2772
-5487 2 2 0 1 2777 2773 2781
-5488 2 2 0 1 2786 2782 2656
-5489 2 2 0 1 2730 2788 2847
-5490 2 2 0 1 2730 2847 2749
-5491 2 2 0 1 2799 2827 2825
-5492 2 2 0 1 2785 2784 2868
-5493 2 2 0 1 2783 2837 2825
-5494 2 2 0 1 2787 2784 2785
-5495 2 2 0 1 2784 2787 2786
-5496 2 2 0 1 2783 3448 3447
-5497 2 2 0 1 2959 2865 2910
-5498 2 2 0 1 2786 2787 2782
-5499 2 2 0 1 2847 2787 2785
-5500 2 2 0 1 2787 2847 2788
-5501 2 2 0 1 2787 2788 2782
-5502 2 2 0 1 2848 2844 2900
-5503 2 2 0 1 2744 2832 2738
-5504 2 2 0 1 2819 2846 2839
-5505 2 2 0 1 2789 2846 2819
-5506 2 2 0 1 2858 2821 3447
-5507 2 2 0 1 2804 2790 2791
-5508 2 2 0 1 2790 2792 2791
-5509 2 2 0 1 2823 2833 2900
-5510 2 2 0 1 2848 2900 2833
-5511 2 2 0 1 2793 2828 2837
-5512 2 2 0 1 2793 2805 2828
-5513 2 2 0 1 2863 2862 2794
-5514 2 2 0 1 2791 2792 2834
-5515 2 2 0 1 2794 2801 2800
-5516 2 2 0 1 2803 2828 2805
-5517 2 2 0 1 2839 2795 2820
-5518 2 2 0 1 2778 2802 2801
-5519 2 2 0 1 2865 2959 2796
-5520 2 2 0 1 2796 2797 2865
-5521 2 2 0 1 2798 2881 2809
-5522 2 2 0 1 2824 2823 3461
-5523 2 2 0 1 2799 2824 3461
-5524 2 2 0 1 2794 2800 2863
-5525 2 2 0 1 2800 2801 2802
-5526 2 2 0 1 2790 2803 2805
-5527 2 2 0 1 2803 2790 2804
-5528 2 2 0 1 2805 2822 2790
-5529 2 2 0 1 2822 2792 2790
-5530 2 2 0 1 2806 2819 2820
-5531 2 2 0 1 2819 2839 2820
-5532 2 2 0 1 2803 2883 2828
-5533 2 2 0 1 2789 2807 2881
-5534 2 2 0 1 2815 2812 2807
-5535 2 2 0 1 2807 2812 2881
-5536 2 2 0 1 2809 2812 2808
-5537 2 2 0 1 2881 2812 2809
-5538 2 2 0 1 2810 2815 2811
-5539 2 2 0 1 2810 2812 2815
-5540 2 2 0 1 2808 2810 2877
-5541 2 2 0 1 2808 2812 2810
-5542 2 2 0 1 2815 2807 2813
-5543 2 2 0 1 2807 2842 2813
-5544 2 2 0 1 2741 2745 2814
-5545 2 2 0 1 2814 2820 2795
-5546 2 2 0 1 2857 2807 2789
-5547 2 2 0 1 2807 2857 2842
-5548 2 2 0 1 2811 2815 2817
-5549 2 2 0 1 2817 2813 2816
-5550 2 2 0 1 2816 2856 2817
-5551 2 2 0 1 2817 2815 2813
-5552 2 2 0 1 2959 2956 2796
-5553 2 2 0 1 2796 2830 2797
-5554 2 2 0 1 2818 2810 2811
-5555 2 2 0 1 2818 2830 2877
-5556 2 2 0 1 2877 2810 2818
-5557 2 2 0 1 2789 2819 2857
-5558 2 2 0 1 2806 2857 2819
-5559 2 2 0 1 2820 2863 2806
-5560 2 2 0 1 2805 2793 2822
-5561 2 2 0 1 2783 2793 2837
-5562 2 2 0 1 2821 2783 3447
-5563 2 2 0 1 2783 2821 2793
-5564 2 2 0 1 2822 2793 2821
-5565 2 2 0 1 2823 2824 2833
-5566 2 2 0 1 2824 2799 2825
-5567 2 2 0 1 2834 2792 2826
-5568 2 2 0 1 2832 2835 2791
-5569 2 2 0 1 2804 2791 2835
-5570 2 2 0 1 3448 2783 2827
-5571 2 2 0 1 2827 2783 2825
-5572 2 2 0 1 2828 2829 2837
-5573 2 2 0 1 2829 2828 2883
-5574 2 2 0 1 2848 2829 2849
-5575 2 2 0 1 2829 2883 2849
-5576 2 2 0 1 2818 2797 2830
-5577 2 2 0 1 2832 2791 2834
-5578 2 2 0 1 3410 2831 2732
-5579 2 2 0 1 2832 2744 2841
-5580 2 2 0 1 2832 2841 2835
-5581 2 2 0 1 2825 2838 2824
-5582 2 2 0 1 2824 2838 2833
-5583 2 2 0 1 2834 2836 2832
-5584 2 2 0 1 2738 2832 2836
-5585 2 2 0 1 2835 2843 2804
-5586 2 2 0 1 2859 2826 2792
-5587 2 2 0 1 2795 2841 2814
-5588 2 2 0 1 2795 2835 2841
-5589 2 2 0 1 2836 2763 2738
-5590 2 2 0 1 2837 2838 2825
-5591 2 2 0 1 2837 2829 2838
-5592 2 2 0 1 2838 2848 2833
-5593 2 2 0 1 2848 2838 2829
-5594 2 2 0 1 2843 2795 2839
-5595 2 2 0 1 2795 2843 2835
-5596 2 2 0 1 2763 2836 2840
-5597 2 2 0 1 2744 2741 2841
-5598 2 2 0 1 2841 2741 2814
-5599 2 2 0 1 2879 2856 2775
-5600 2 2 0 1 2879 2775 2770
-5601 2 2 0 1 2834 2826 2840
-5602 2 2 0 1 2836 2834 2840
-5603 2 2 0 1 2796 2956 2830
-5604 2 2 0 1 2816 2842 2802
-5605 2 2 0 1 2813 2842 2816
-5606 2 2 0 1 2802 2842 2800
-5607 2 2 0 1 2803 2804 2843
-5608 2 2 0 1 2839 2846 2843
-5609 2 2 0 1 2803 2843 2884
-5610 2 2 0 1 2846 2884 2843
-5611 2 2 0 1 2852 2844 2845
-5612 2 2 0 1 2882 2846 2789
-5613 2 2 0 1 2882 2789 2881
-5614 2 2 0 1 2847 2880 2749
-5615 2 2 0 1 2847 2785 2880
-5616 2 2 0 1 2657 2855 2656
-5617 2 2 0 1 2657 2961 2855
-5618 2 2 0 1 2848 2845 2844
-5619 2 2 0 1 2848 2849 2845
-5620 2 2 0 1 2855 2786 2656
-5621 2 2 0 1 2749 2880 2752
-5622 2 2 0 1 2850 2861 2967
-5623 2 2 0 1 2798 2809 2850
-5624 2 2 0 1 2752 2879 2770
-5625 2 2 0 1 3410 2851 3409
-5626 2 2 0 1 2840 2826 2851
-5627 2 2 0 1 2874 2852 2853
-5628 2 2 0 1 2852 2845 2853
-5629 2 2 0 1 2853 2845 2849
-5630 2 2 0 1 2879 2868 2854
-5631 2 2 0 1 2817 2854 2811
-5632 2 2 0 1 2879 2854 2856
-5633 2 2 0 1 2817 2856 2854
-5634 2 2 0 1 2961 2910 2855
-5635 2 2 0 1 2855 2784 2786
-5636 2 2 0 1 2910 2865 2855
-5637 2 2 0 1 2865 2784 2855
-5638 2 2 0 1 2956 2876 2830
-5639 2 2 0 1 2778 2856 2816
-5640 2 2 0 1 2856 2778 2775
-5641 2 2 0 1 2778 2816 2802
-5642 2 2 0 1 2806 2863 2857
-5643 2 2 0 1 2863 2800 2857
-5644 2 2 0 1 2800 2842 2857
-5645 2 2 0 1 2821 2858 2859
-5646 2 2 0 1 2859 2858 2870
-5647 2 2 0 1 2859 2792 2822
-5648 2 2 0 1 2859 2822 2821
-5649 2 2 0 1 2860 2861 2871
-5650 2 2 0 1 2877 2871 2808
-5651 2 2 0 1 2814 2745 2820
-5652 2 2 0 1 2863 2820 2745
-5653 2 2 0 1 2745 2862 2863
-5654 2 2 0 1 3410 2732 2864
-5655 2 2 0 1 2851 2864 2840
-5656 2 2 0 1 3410 2864 2851
-5657 2 2 0 1 2866 2784 2865
-5658 2 2 0 1 2866 2868 2784
-5659 2 2 0 1 2865 2797 2866
-5660 2 2 0 1 2876 2867 2830
-5661 2 2 0 1 2877 2830 2867
-5662 2 2 0 1 2797 2818 2873
-5663 2 2 0 1 2873 2854 2868
-5664 2 2 0 1 2859 2869 2826
-5665 2 2 0 1 2851 2826 2869
-5666 2 2 0 1 2870 2869 2859
-5667 2 2 0 1 2850 2875 2798
-5668 2 2 0 1 2809 2872 2850
-5669 2 2 0 1 2872 2871 2861
-5670 2 2 0 1 2861 2850 2872
-5671 2 2 0 1 2873 2868 2866
-5672 2 2 0 1 2873 2866 2797
-5673 2 2 0 1 2763 2864 2732
-5674 2 2 0 1 2864 2763 2840
-5675 2 2 0 1 2872 2809 2808
-5676 2 2 0 1 2808 2871 2872
-5677 2 2 0 1 2811 2873 2818
-5678 2 2 0 1 2811 2854 2873
-5679 2 2 0 1 2870 3409 2869
-5680 2 2 0 1 2869 3409 2851
-5681 2 2 0 1 2967 2874 2875
-5682 2 2 0 1 2874 2853 2875
-5683 2 2 0 1 2967 2875 2850
-5684 2 2 0 1 2860 2867 2876
-5685 2 2 0 1 2871 2867 2860
-5686 2 2 0 1 2867 2871 2877
-5687 2 2 0 1 2878 2798 2875
-5688 2 2 0 1 2875 2853 2878
-5689 2 2 0 1 2849 2883 2878
-5690 2 2 0 1 2853 2849 2878
-5691 2 2 0 1 2785 2868 2880
-5692 2 2 0 1 2879 2880 2868
-5693 2 2 0 1 2879 2752 2880
-5694 2 2 0 1 2798 2882 2881
-5695 2 2 0 1 2882 2798 2878
-5696 2 2 0 1 2884 2883 2803
-5697 2 2 0 1 2878 2883 2884
-5698 2 2 0 1 2882 2884 2846
-5699 2 2 0 1 2878 2884 2882
-5700 2 2 0 1 2887 2892 2885
-5701 2 2 0 1 2886 2887 2987
-5702 2 2 0 1 2988 2886 2987
-5703 2 2 0 1 2886 2892 2887
-5704 2 2 0 1 3007 2886 2988
-5705 2 2 0 1 2937 2888 3144
-5706 2 2 0 1 3007 2889 2886
-5707 2 2 0 1 2890 2891 2888
-5708 2 2 0 1 2893 2908 2909
-5709 2 2 0 1 2892 2897 2893
-5710 2 2 0 1 2897 2908 2893
-5711 2 2 0 1 2885 2935 2691
-5712 2 2 0 1 2935 2885 2892
-5713 2 2 0 1 2893 2935 2892
-5714 2 2 0 1 2961 2966 2910
-5715 2 2 0 1 2891 2894 2895
-5716 2 2 0 1 2908 2889 2896
-5717 2 2 0 1 2929 2896 2889
-5718 2 2 0 1 3030 2929 2992
-5719 2 2 0 1 3030 2922 2929
-5720 2 2 0 1 2896 2929 2928
-5721 2 2 0 1 2909 2966 2893
-5722 2 2 0 1 2908 2897 2889
-5723 2 2 0 1 2897 2886 2889
-5724 2 2 0 1 2886 2897 2892
-5725 2 2 0 1 2844 2948 2900
-5726 2 2 0 1 2898 2944 2994
-5727 2 2 0 1 2985 2914 2950
-5728 2 2 0 1 2914 2985 2915
-5729 2 2 0 1 2894 2934 3231
-5730 2 2 0 1 2901 2899 2958
-5731 2 2 0 1 2899 2901 2946
-5732 2 2 0 1 2936 2823 2900
-5733 2 2 0 1 2948 2936 2900
-5734 2 2 0 1 2909 2911 2966
-5735 2 2 0 1 2911 2909 2906
-5736 2 2 0 1 2933 2890 2903
-5737 2 2 0 1 2932 2933 2903
-5738 2 2 0 1 3005 2973 3022
-5739 2 2 0 1 2901 2902 2946
-5740 2 2 0 1 3022 2970 3034
-5741 2 2 0 1 2903 2907 2932
-5742 2 2 0 1 2912 2904 2950
-5743 2 2 0 1 2982 2917 2960
-5744 2 2 0 1 2823 2942 3461
-5745 2 2 0 1 2942 2937 3461
-5746 2 2 0 1 2905 2906 2909
-5747 2 2 0 1 2973 2970 3022
-5748 2 2 0 1 2907 2899 2932
-5749 2 2 0 1 2958 2899 2907
-5750 2 2 0 1 2905 2908 2896
-5751 2 2 0 1 2909 2908 2905
-5752 2 2 0 1 2910 2911 2959
-5753 2 2 0 1 2910 2966 2911
-5754 2 2 0 1 2917 2964 2919
-5755 2 2 0 1 2899 2972 2932
-5756 2 2 0 1 2899 2946 2972
-5757 2 2 0 1 2912 2914 2913
-5758 2 2 0 1 2950 2914 2912
-5759 2 2 0 1 2939 2907 2903
-5760 2 2 0 1 2915 2960 2925
-5761 2 2 0 1 2928 2905 2896
-5762 2 2 0 1 2928 2918 2905
-5763 2 2 0 1 2906 2905 2957
-5764 2 2 0 1 2918 2957 2905
-5765 2 2 0 1 2925 2916 2923
-5766 2 2 0 1 2916 2925 2960
-5767 2 2 0 1 2916 2917 2919
-5768 2 2 0 1 2916 2960 2917
-5769 2 2 0 1 2930 2918 2928
-5770 2 2 0 1 2930 2920 2918
-5771 2 2 0 1 2957 2918 2940
-5772 2 2 0 1 2920 2940 2918
-5773 2 2 0 1 2923 2920 2930
-5774 2 2 0 1 2920 2923 2916
-5775 2 2 0 1 2920 2919 2940
-5776 2 2 0 1 2916 2919 2920
-5777 2 2 0 1 2921 2923 2930
-5778 2 2 0 1 2921 2955 2954
-5779 2 2 0 1 2955 2921 2922
-5780 2 2 0 1 2954 2923 2921
-5781 2 2 0 1 2923 2954 2925
-5782 2 2 0 1 2953 2925 2954
-5783 2 2 0 1 2924 2995 2996
-5784 2 2 0 1 2904 2912 2924
-5785 2 2 0 1 2925 2926 2915
-5786 2 2 0 1 2925 2953 2926
-5787 2 2 0 1 2927 2940 2931
-5788 2 2 0 1 2940 2927 2957
-5789 2 2 0 1 2921 2928 2929
-5790 2 2 0 1 2928 2921 2930
-5791 2 2 0 1 2922 2921 2929
-5792 2 2 0 1 2860 2964 2861
-5793 2 2 0 1 2860 2931 2964
-5794 2 2 0 1 2915 2926 2914
-5795 2 2 0 1 2926 2913 2914
-5796 2 2 0 1 2973 2912 2913
-5797 2 2 0 1 2972 2933 2932
-5798 2 2 0 1 2933 2891 2890
-5799 2 2 0 1 2891 2934 2894
-5800 2 2 0 1 2891 2933 2934
-5801 2 2 0 1 2934 2933 2972
-5802 2 2 0 1 2893 2966 2935
-5803 2 2 0 1 2823 2936 2942
-5804 2 2 0 1 2942 2888 2937
-5805 2 2 0 1 2976 2946 2902
-5806 2 2 0 1 2901 2941 2944
-5807 2 2 0 1 2958 2941 2901
-5808 2 2 0 1 2895 3144 2891
-5809 2 2 0 1 3144 2888 2891
-5810 2 2 0 1 2949 2903 2890
-5811 2 2 0 1 2949 2939 2903
-5812 2 2 0 1 2949 2948 2938
-5813 2 2 0 1 2949 2938 2939
-5814 2 2 0 1 2944 2902 2901
-5815 2 2 0 1 2968 2974 3146
-5816 2 2 0 1 2956 2927 2876
-5817 2 2 0 1 2876 2931 2860
-5818 2 2 0 1 2876 2927 2931
-5819 2 2 0 1 2919 2931 2940
-5820 2 2 0 1 2919 2964 2931
-5821 2 2 0 1 2952 2994 2944
-5822 2 2 0 1 2941 2952 2944
-5823 2 2 0 1 2942 2947 2888
-5824 2 2 0 1 2947 2942 2936
-5825 2 2 0 1 2943 2902 2944
-5826 2 2 0 1 2898 2943 2944
-5827 2 2 0 1 2958 2945 2941
-5828 2 2 0 1 2976 2971 2946
-5829 2 2 0 1 2952 2904 2924
-5830 2 2 0 1 2941 2904 2952
-5831 2 2 0 1 2951 2943 2898
-5832 2 2 0 1 2947 2890 2888
-5833 2 2 0 1 2949 2890 2947
-5834 2 2 0 1 2948 2947 2936
-5835 2 2 0 1 2948 2949 2947
-5836 2 2 0 1 2904 2945 2950
-5837 2 2 0 1 2904 2941 2945
-5838 2 2 0 1 2977 2943 2951
-5839 2 2 0 1 2996 2994 2952
-5840 2 2 0 1 2924 2996 2952
-5841 2 2 0 1 2922 3029 2955
-5842 2 2 0 1 3029 2922 3030
-5843 2 2 0 1 2977 2976 2902
-5844 2 2 0 1 2977 2902 2943
-5845 2 2 0 1 2953 2954 2955
-5846 2 2 0 1 2957 2956 2906
-5847 2 2 0 1 2956 2957 2927
-5848 2 2 0 1 2907 2945 2958
-5849 2 2 0 1 2985 2950 2945
-5850 2 2 0 1 2889 2992 2929
-5851 2 2 0 1 2992 2889 3007
-5852 2 2 0 1 2959 2906 2956
-5853 2 2 0 1 2911 2906 2959
-5854 2 2 0 1 2986 2945 2907
-5855 2 2 0 1 2945 2986 2985
-5856 2 2 0 1 2852 2962 2844
-5857 2 2 0 1 2984 2915 2985
-5858 2 2 0 1 2915 2984 2960
-5859 2 2 0 1 2691 2963 2657
-5860 2 2 0 1 2963 2961 2657
-5861 2 2 0 1 2962 2948 2844
-5862 2 2 0 1 2938 2948 2962
-5863 2 2 0 1 2935 2963 2691
-5864 2 2 0 1 2917 2965 2964
-5865 2 2 0 1 2965 2917 2982
-5866 2 2 0 1 2961 2963 2966
-5867 2 2 0 1 2963 2935 2966
-5868 2 2 0 1 2967 2861 2965
-5869 2 2 0 1 2861 2964 2965
-5870 2 2 0 1 2968 2979 2969
-5871 2 2 0 1 2977 2969 2976
-5872 2 2 0 1 2874 2980 2852
-5873 2 2 0 1 2962 2852 2980
-5874 2 2 0 1 2938 2962 2980
-5875 2 2 0 1 2973 2913 2926
-5876 2 2 0 1 2973 2926 2970
-5877 2 2 0 1 2953 2970 2926
-5878 2 2 0 1 2934 2971 3231
-5879 2 2 0 1 2971 3233 3231
-5880 2 2 0 1 2971 2972 2946
-5881 2 2 0 1 2972 2971 2934
-5882 2 2 0 1 3034 2955 3029
-5883 2 2 0 1 2955 3034 2953
-5884 2 2 0 1 2970 2953 3034
-5885 2 2 0 1 2995 2924 2912
-5886 2 2 0 1 2973 2995 2912
-5887 2 2 0 1 2973 3005 2995
-5888 2 2 0 1 2975 2974 2968
-5889 2 2 0 1 2975 2969 2977
-5890 2 2 0 1 2969 2975 2968
-5891 2 2 0 1 2981 2965 2982
-5892 2 2 0 1 2978 2971 2976
-5893 2 2 0 1 2969 2978 2976
-5894 2 2 0 1 2971 2978 3233
-5895 2 2 0 1 2975 2951 2974
-5896 2 2 0 1 2977 2951 2975
-5897 2 2 0 1 2978 2979 3233
-5898 2 2 0 1 2969 2979 2978
-5899 2 2 0 1 2967 2981 2874
-5900 2 2 0 1 2981 2967 2965
-5901 2 2 0 1 2981 2980 2874
-5902 2 2 0 1 2983 2981 2982
-5903 2 2 0 1 2983 2980 2981
-5904 2 2 0 1 2983 2939 2938
-5905 2 2 0 1 2983 2938 2980
-5906 2 2 0 1 2982 2960 2984
-5907 2 2 0 1 2984 2983 2982
-5908 2 2 0 1 2939 2986 2907
-5909 2 2 0 1 2939 2983 2986
-5910 2 2 0 1 2984 2985 2986
-5911 2 2 0 1 2986 2983 2984
-5912 2 2 0 1 2987 2708 2988
-5913 2 2 0 1 3006 2998 3043
-5914 2 2 0 1 2974 2989 3146
-5915 2 2 0 1 2989 3137 3146
-5916 2 2 0 1 3011 3042 3003
-5917 2 2 0 1 3042 3011 3010
-5918 2 2 0 1 3043 3003 3042
-5919 2 2 0 1 3003 3043 2998
-5920 2 2 0 1 2989 3027 3137
-5921 2 2 0 1 2990 2991 3104
-5922 2 2 0 1 3008 3020 3012
-5923 2 2 0 1 3007 3026 2992
-5924 2 2 0 1 2990 2993 3044
-5925 2 2 0 1 3014 3104 3027
-5926 2 2 0 1 3104 3014 2990
-5927 2 2 0 1 3008 2993 3014
-5928 2 2 0 1 2993 2990 3014
-5929 2 2 0 1 2999 2898 2994
-5930 2 2 0 1 2898 2999 3002
-5931 2 2 0 1 3012 2999 3001
-5932 2 2 0 1 3012 3002 2999
-5933 2 2 0 1 2997 2996 2995
-5934 2 2 0 1 3000 2996 2997
-5935 2 2 0 1 2997 3003 2998
-5936 2 2 0 1 2998 3000 2997
-5937 2 2 0 1 3000 2994 2996
-5938 2 2 0 1 2999 2994 3000
-5939 2 2 0 1 3000 2998 3001
-5940 2 2 0 1 3001 2999 3000
-5941 2 2 0 1 3002 2951 2898
-5942 2 2 0 1 3002 3012 3020
-5943 2 2 0 1 3004 2995 3005
-5944 2 2 0 1 2997 2995 3004
-5945 2 2 0 1 3004 3011 3003
-5946 2 2 0 1 3003 2997 3004
-5947 2 2 0 1 3024 3005 3022
-5948 2 2 0 1 3004 3005 3024
-5949 2 2 0 1 2988 3017 3007
-5950 2 2 0 1 3006 3001 2998
-5951 2 2 0 1 3016 3001 3006
-5952 2 2 0 1 3017 3026 3007
-5953 2 2 0 1 3008 3044 2993
-5954 2 2 0 1 3010 3009 3038
-5955 2 2 0 1 3009 3010 3011
-5956 2 2 0 1 3004 3009 3011
-5957 2 2 0 1 3024 3009 3004
-5958 2 2 0 1 3015 3008 3012
-5959 2 2 0 1 3015 3044 3008
-5960 2 2 0 1 3038 3023 3013
-5961 2 2 0 1 3009 3023 3038
-5962 2 2 0 1 3008 3028 3020
-5963 2 2 0 1 3028 2989 3020
-5964 2 2 0 1 3028 3008 3014
-5965 2 2 0 1 3012 3016 3015
-5966 2 2 0 1 3016 3012 3001
-5967 2 2 0 1 3021 3040 3017
-5968 2 2 0 1 3040 3026 3017
-5969 2 2 0 1 3018 2708 2705
-5970 2 2 0 1 3018 3017 2988
-5971 2 2 0 1 2708 3018 2988
-5972 2 2 0 1 3019 2974 2951
-5973 2 2 0 1 3019 3020 2989
-5974 2 2 0 1 2974 3019 2989
-5975 2 2 0 1 3002 3019 2951
-5976 2 2 0 1 3002 3020 3019
-5977 2 2 0 1 3021 3018 2705
-5978 2 2 0 1 3021 3017 3018
-5979 2 2 0 1 3025 3026 3040
-5980 2 2 0 1 3026 3025 3035
-5981 2 2 0 1 3033 3022 3034
-5982 2 2 0 1 3023 3009 3033
-5983 2 2 0 1 3022 3033 3024
-5984 2 2 0 1 3033 3009 3024
-5985 2 2 0 1 3035 3025 3039
-5986 2 2 0 1 3035 3039 3036
-5987 2 2 0 1 2992 3031 3030
-5988 2 2 0 1 3035 3031 3026
-5989 2 2 0 1 3031 2992 3026
-5990 2 2 0 1 3028 3027 2989
-5991 2 2 0 1 3014 3027 3028
-5992 2 2 0 1 3013 3036 3039
-5993 2 2 0 1 3029 3032 3034
-5994 2 2 0 1 3030 3037 3029
-5995 2 2 0 1 3037 3030 3031
-5996 2 2 0 1 3032 3033 3034
-5997 2 2 0 1 3037 3035 3036
-5998 2 2 0 1 3031 3035 3037
-5999 2 2 0 1 3037 3032 3029
-6000 2 2 0 1 3036 3032 3037
-6001 2 2 0 1 3023 3033 3032
-6002 2 2 0 1 3036 3013 3023
-6003 2 2 0 1 3023 3032 3036
-6004 2 2 0 1 3010 1359 1356
-6005 2 2 0 1 3038 1359 3010
-6006 2 2 0 1 3038 1358 1359
-6007 2 2 0 1 3038 3013 1358
-6008 2 2 0 1 3039 1366 1365
-6009 2 2 0 1 3025 1366 3039
-6010 2 2 0 1 3025 1363 1366
-6011 2 2 0 1 3025 3040 1363
-6012 2 2 0 1 3013 1365 1358
-6013 2 2 0 1 3039 1365 3013
-6014 2 2 0 1 3040 1361 1363
-6015 2 2 0 1 3021 1361 3040
-6016 2 2 0 1 3021 3041 1361
-6017 2 2 0 1 3021 2705 3041
-6018 2 2 0 1 3042 1356 1370
-6019 2 2 0 1 3010 1356 3042
-6020 2 2 0 1 1371 3006 3043
-6021 2 2 0 1 1369 3006 1371
-6022 2 2 0 1 1369 3016 3006
-6023 2 2 0 1 3043 1370 1371
-6024 2 2 0 1 3042 1370 3043
-6025 2 2 0 1 1372 3016 1369
-6026 2 2 0 1 1372 3015 3016
-6027 2 2 0 1 3045 3015 1372
-6028 2 2 0 1 3044 3045 3046
-6029 2 2 0 1 3015 3045 3044
-6030 2 2 0 1 2990 3046 1375
-6031 2 2 0 1 3044 3046 2990
-6032 2 2 0 1 3047 1375 1791
-6033 2 2 0 1 3047 2990 1375
-6034 2 2 0 1 2991 2990 3047
-6035 2 2 0 1 3069 1789 3068
-6036 2 2 0 1 3069 3074 3048
-6037 2 2 0 1 3065 1785 1789
-6038 2 2 0 1 3065 3048 3098
-6039 2 2 0 1 3062 3098 3099
-6040 2 2 0 1 3062 3061 1785
-6041 2 2 0 1 3060 3099 3049
-6042 2 2 0 1 3060 3058 3061
-6043 2 2 0 1 3056 3049 3121
-6044 2 2 0 1 3056 3055 3058
-6045 2 2 0 1 3050 3054 3055
-6046 2 2 0 1 3050 3121 3122
-6047 2 2 0 1 3051 1780 3054
-6048 2 2 0 1 3051 3122 3088
-6049 2 2 0 1 3052 1783 1780
-6050 2 2 0 1 3052 3088 3063
-6051 2 2 0 1 3064 3063 3059
-6052 2 2 0 1 3064 1787 1783
-6053 2 2 0 1 3053 3059 3081
-6054 2 2 0 1 3053 1773 1787
-6055 2 2 0 1 3057 1774 1773
-6056 2 2 0 1 3057 3081 3078
-6057 2 2 0 1 3070 1775 1774
-6058 2 2 0 1 3070 3078 3066
-6059 2 2 0 1 3050 3051 3054
-6060 2 2 0 1 3050 3122 3051
-6061 2 2 0 1 3056 3050 3055
-6062 2 2 0 1 3056 3121 3050
-6063 2 2 0 1 3051 3052 1780
-6064 2 2 0 1 3051 3088 3052
-6065 2 2 0 1 3053 3057 1773
-6066 2 2 0 1 3053 3081 3057
-6067 2 2 0 1 3060 3056 3058
-6068 2 2 0 1 3060 3049 3056
-6069 2 2 0 1 3064 3053 1787
-6070 2 2 0 1 3064 3059 3053
-6071 2 2 0 1 3057 3070 1774
-6072 2 2 0 1 3057 3078 3070
-6073 2 2 0 1 3062 3060 3061
-6074 2 2 0 1 3062 3099 3060
-6075 2 2 0 1 3052 3064 1783
-6076 2 2 0 1 3052 3063 3064
-6077 2 2 0 1 3065 3062 1785
-6078 2 2 0 1 3065 3098 3062
-6079 2 2 0 1 3069 3065 1789
-6080 2 2 0 1 3069 3048 3065
-6081 2 2 0 1 3047 3066 2991
-6082 2 2 0 1 3067 3068 4100
-6083 2 2 0 1 3047 1791 1775
-6084 2 2 0 1 3067 4105 3074
-6085 2 2 0 1 3067 3069 3068
-6086 2 2 0 1 3074 3069 3067
-6087 2 2 0 1 3070 3047 1775
-6088 2 2 0 1 3070 3066 3047
-6089 2 2 0 1 4105 3562 3074
-6090 2 2 0 1 3124 3071 3094
-6091 2 2 0 1 3072 3116 3073
-6092 2 2 0 1 3103 3072 3073
-6093 2 2 0 1 3077 3074 3562
-6094 2 2 0 1 3076 3562 3613
-6095 2 2 0 1 3076 3075 3077
-6096 2 2 0 1 3562 3076 3077
-6097 2 2 0 1 3078 3079 3066
-6098 2 2 0 1 3075 3080 3130
-6099 2 2 0 1 3079 3103 3066
-6100 2 2 0 1 3072 3103 3079
-6101 2 2 0 1 3086 3116 3072
-6102 2 2 0 1 3048 3101 3098
-6103 2 2 0 1 3079 3086 3072
-6104 2 2 0 1 3082 3081 3059
-6105 2 2 0 1 3084 3081 3082
-6106 2 2 0 1 3082 3083 3085
-6107 2 2 0 1 3085 3084 3082
-6108 2 2 0 1 3084 3078 3081
-6109 2 2 0 1 3079 3078 3084
-6110 2 2 0 1 3085 3086 3084
-6111 2 2 0 1 3079 3084 3086
-6112 2 2 0 1 3106 3085 3083
-6113 2 2 0 1 3108 3085 3106
-6114 2 2 0 1 3087 3059 3063
-6115 2 2 0 1 3082 3059 3087
-6116 2 2 0 1 3087 3111 3083
-6117 2 2 0 1 3083 3082 3087
-6118 2 2 0 1 3106 3083 3117
-6119 2 2 0 1 3089 3063 3088
-6120 2 2 0 1 3087 3063 3089
-6121 2 2 0 1 3089 3091 3111
-6122 2 2 0 1 3111 3087 3089
-6123 2 2 0 1 3090 3088 3122
-6124 2 2 0 1 3089 3088 3090
-6125 2 2 0 1 3090 3094 3091
-6126 2 2 0 1 3091 3089 3090
-6127 2 2 0 1 3292 3127 3151
-6128 2 2 0 1 3071 3124 3110
-6129 2 2 0 1 3110 3127 3071
-6130 2 2 0 1 3093 3092 3095
-6131 2 2 0 1 3093 3094 3071
-6132 2 2 0 1 3096 3095 3302
-6133 2 2 0 1 3093 3095 3096
-6134 2 2 0 1 3096 3091 3094
-6135 2 2 0 1 3094 3093 3096
-6136 2 2 0 1 3086 3085 3108
-6137 2 2 0 1 3108 3116 3086
-6138 2 2 0 1 3099 3097 3049
-6139 2 2 0 1 3099 3100 3097
-6140 2 2 0 1 3098 3100 3099
-6141 2 2 0 1 3100 3098 3101
-6142 2 2 0 1 3136 3100 3101
-6143 2 2 0 1 3107 3139 3141
-6144 2 2 0 1 3139 3131 3130
-6145 2 2 0 1 3077 3048 3074
-6146 2 2 0 1 3048 3077 3101
-6147 2 2 0 1 3077 3075 3101
-6148 2 2 0 1 3115 3114 3102
-6149 2 2 0 1 3115 3073 3116
-6150 2 2 0 1 3626 3080 3613
-6151 2 2 0 1 3080 3075 3076
-6152 2 2 0 1 3080 3076 3613
-6153 2 2 0 1 3104 2991 3103
-6154 2 2 0 1 2991 3066 3103
-6155 2 2 0 1 3104 3073 3027
-6156 2 2 0 1 3104 3103 3073
-6157 2 2 0 1 3118 3105 3301
-6158 2 2 0 1 3118 3106 3117
-6159 2 2 0 1 3277 3119 3301
-6160 2 2 0 1 3106 3119 3108
-6161 2 2 0 1 3135 3131 3128
-6162 2 2 0 1 3133 3134 3107
-6163 2 2 0 1 3131 3134 3128
-6164 2 2 0 1 3114 3120 3277
-6165 2 2 0 1 3108 3120 3116
-6166 2 2 0 1 3109 3092 3093
-6167 2 2 0 1 3071 3109 3093
-6168 2 2 0 1 3126 3110 3097
-6169 2 2 0 1 3091 3123 3111
-6170 2 2 0 1 3123 3091 3096
-6171 2 2 0 1 3112 3090 3122
-6172 2 2 0 1 3125 3110 3124
-6173 2 2 0 1 3113 3302 3105
-6174 2 2 0 1 3302 3113 3096
-6175 2 2 0 1 3115 3120 3114
-6176 2 2 0 1 3115 3116 3120
-6177 2 2 0 1 3118 3113 3105
-6178 2 2 0 1 3118 3117 3113
-6179 2 2 0 1 3123 3083 3111
-6180 2 2 0 1 3117 3083 3123
-6181 2 2 0 1 3119 3118 3301
-6182 2 2 0 1 3106 3118 3119
-6183 2 2 0 1 3120 3119 3277
-6184 2 2 0 1 3108 3119 3120
-6185 2 2 0 1 3121 3112 3122
-6186 2 2 0 1 3113 3123 3096
-6187 2 2 0 1 3117 3123 3113
-6188 2 2 0 1 3126 3100 3136
-6189 2 2 0 1 3097 3100 3126
-6190 2 2 0 1 3109 3292 3092
-6191 2 2 0 1 3292 3109 3127
-6192 2 2 0 1 3109 3071 3127
-6193 2 2 0 1 3094 3112 3124
-6194 2 2 0 1 3112 3094 3090
-6195 2 2 0 1 3097 3125 3049
-6196 2 2 0 1 3125 3097 3110
-6197 2 2 0 1 3125 3121 3049
-6198 2 2 0 1 3110 3126 3127
-6199 2 2 0 1 3126 3128 3127
-6200 2 2 0 1 3140 3129 3626
-6201 2 2 0 1 3080 3626 3129
-6202 2 2 0 1 3139 3130 3129
-6203 2 2 0 1 3080 3129 3130
-6204 2 2 0 1 3135 3126 3136
-6205 2 2 0 1 3135 3128 3126
-6206 2 2 0 1 3134 3139 3107
-6207 2 2 0 1 3131 3139 3134
-6208 2 2 0 1 3151 3132 3133
-6209 2 2 0 1 3128 3132 3127
-6210 2 2 0 1 3132 3151 3127
-6211 2 2 0 1 3132 3134 3133
-6212 2 2 0 1 3128 3134 3132
-6213 2 2 0 1 3112 3121 3125
-6214 2 2 0 1 3112 3125 3124
-6215 2 2 0 1 3130 3135 3075
-6216 2 2 0 1 3135 3101 3075
-6217 2 2 0 1 3101 3135 3136
-6218 2 2 0 1 3135 3130 3131
-6219 2 2 0 1 3138 3115 3102
-6220 2 2 0 1 3138 3146 3137
-6221 2 2 0 1 3102 3146 3138
-6222 2 2 0 1 3138 3073 3115
-6223 2 2 0 1 3138 3137 3027
-6224 2 2 0 1 3027 3073 3138
-6225 2 2 0 1 3141 3139 3129
-6226 2 2 0 1 3141 3140 3155
-6227 2 2 0 1 3129 3140 3141
-6228 2 2 0 1 3697 3646 3142
-6229 2 2 0 1 3177 3148 3142
-6230 2 2 0 1 3246 3143 3217
-6231 2 2 0 1 3142 3154 3697
-6232 2 2 0 1 3238 3308 3249
-6233 2 2 0 1 3237 3308 3238
-6234 2 2 0 1 3296 2937 3144
-6235 2 2 0 1 3278 3145 3195
-6236 2 2 0 1 3152 2968 3146
-6237 2 2 0 1 3102 3152 3146
-6238 2 2 0 1 2979 3235 3233
-6239 2 2 0 1 3107 3147 3133
-6240 2 2 0 1 3149 3147 3148
-6241 2 2 0 1 3149 3150 3147
-6242 2 2 0 1 3150 3133 3147
-6243 2 2 0 1 3148 3226 3149
-6244 2 2 0 1 3150 3151 3133
-6245 2 2 0 1 3153 3102 3114
-6246 2 2 0 1 3152 3102 3153
-6247 2 2 0 1 3195 3245 3153
-6248 2 2 0 1 3153 3245 3152
-6249 2 2 0 1 3195 3153 3278
-6250 2 2 0 1 3154 3107 3141
-6251 2 2 0 1 3147 3107 3154
-6252 2 2 0 1 3154 3142 3148
-6253 2 2 0 1 3148 3147 3154
-6254 2 2 0 1 3177 3646 3763
-6255 2 2 0 1 3142 3646 3177
-6256 2 2 0 1 3697 3141 3155
-6257 2 2 0 1 3154 3141 3697
-6258 2 2 0 1 3237 3323 3308
-6259 2 2 0 1 3805 3323 3237
-6260 2 2 0 1 3157 3258 3158
-6261 2 2 0 1 3156 3204 3157
-6262 2 2 0 1 3158 3156 3157
-6263 2 2 0 1 3159 3158 3258
-6264 2 2 0 1 3182 3259 3159
-6265 2 2 0 1 3258 3182 3159
-6266 2 2 0 1 3198 3160 3161
-6267 2 2 0 1 3199 3206 3198
-6268 2 2 0 1 3271 3160 3198
-6269 2 2 0 1 3174 3209 3202
-6270 2 2 0 1 3211 3263 3205
-6271 2 2 0 1 3163 3208 3162
-6272 2 2 0 1 3208 3163 3176
-6273 2 2 0 1 3164 3148 3177
-6274 2 2 0 1 3148 3164 3226
-6275 2 2 0 1 3201 3174 3202
-6276 2 2 0 1 3203 3230 3205
-6277 2 2 0 1 3175 3165 3176
-6278 2 2 0 1 3183 3171 3165
-6279 2 2 0 1 3259 3166 3159
-6280 2 2 0 1 3174 3166 3209
-6281 2 2 0 1 3204 3256 3157
-6282 2 2 0 1 3263 3256 3205
-6283 2 2 0 1 3230 3188 3205
-6284 2 2 0 1 3160 3167 3161
-6285 2 2 0 1 3179 3168 3202
-6286 2 2 0 1 3192 3169 3162
-6287 2 2 0 1 3175 3214 3165
-6288 2 2 0 1 3170 3171 3183
-6289 2 2 0 1 3281 3204 3156
-6290 2 2 0 1 3172 3163 3162
-6291 2 2 0 1 3172 3226 3164
-6292 2 2 0 1 3163 3172 3164
-6293 2 2 0 1 3221 3200 3161
-6294 2 2 0 1 3272 3255 3145
-6295 2 2 0 1 3173 3174 3201
-6296 2 2 0 1 3175 3189 3214
-6297 2 2 0 1 3197 3671 3658
-6298 2 2 0 1 3197 3175 3176
-6299 2 2 0 1 3199 3218 3170
-6300 2 2 0 1 3218 3199 3200
-6301 2 2 0 1 3240 3163 3164
-6302 2 2 0 1 3177 3240 3164
-6303 2 2 0 1 3163 3240 3247
-6304 2 2 0 1 3178 3243 3180
-6305 2 2 0 1 3275 3178 3180
-6306 2 2 0 1 3243 3178 3236
-6307 2 2 0 1 3169 3216 3201
-6308 2 2 0 1 3216 3169 3192
-6309 2 2 0 1 3213 3179 3202
-6310 2 2 0 1 3180 3212 3275
-6311 2 2 0 1 3276 3181 3241
-6312 2 2 0 1 3305 3259 3182
-6313 2 2 0 1 3199 3227 3206
-6314 2 2 0 1 3191 3227 3183
-6315 2 2 0 1 3149 3224 3150
-6316 2 2 0 1 3221 3223 3200
-6317 2 2 0 1 3184 3275 3212
-6318 2 2 0 1 3275 3184 3297
-6319 2 2 0 1 3185 3186 3187
-6320 2 2 0 1 3289 3185 3187
-6321 2 2 0 1 3230 3215 3188
-6322 2 2 0 1 3753 3196 3658
-6323 2 2 0 1 3175 3196 3189
-6324 2 2 0 1 3196 3753 3189
-6325 2 2 0 1 3191 3190 3143
-6326 2 2 0 1 3190 3217 3143
-6327 2 2 0 1 3190 3191 3214
-6328 2 2 0 1 3234 3243 3236
-6329 2 2 0 1 3243 3234 3219
-6330 2 2 0 1 3171 3193 3192
-6331 2 2 0 1 3193 3171 3170
-6332 2 2 0 1 3195 3194 3245
-6333 2 2 0 1 3194 3195 3219
-6334 2 2 0 1 3169 3225 3162
-6335 2 2 0 1 3225 3169 3168
-6336 2 2 0 1 3242 3145 3278
-6337 2 2 0 1 3210 3263 3211
-6338 2 2 0 1 3196 3197 3658
-6339 2 2 0 1 3175 3197 3196
-6340 2 2 0 1 3293 3224 3179
-6341 2 2 0 1 3150 3224 3293
-6342 2 2 0 1 3198 3200 3199
-6343 2 2 0 1 3198 3161 3200
-6344 2 2 0 1 3201 3168 3169
-6345 2 2 0 1 3201 3202 3168
-6346 2 2 0 1 3202 3209 3213
-6347 2 2 0 1 3211 3205 3188
-6348 2 2 0 1 3203 3256 3204
-6349 2 2 0 1 3203 3205 3256
-6350 2 2 0 1 3271 3206 3181
-6351 2 2 0 1 3198 3206 3271
-6352 2 2 0 1 3223 3173 3207
-6353 2 2 0 1 3208 3165 3171
-6354 2 2 0 1 3208 3176 3165
-6355 2 2 0 1 3192 3208 3171
-6356 2 2 0 1 3162 3208 3192
-6357 2 2 0 1 3172 3225 3226
-6358 2 2 0 1 3172 3162 3225
-6359 2 2 0 1 3261 3166 3259
-6360 2 2 0 1 3209 3166 3261
-6361 2 2 0 1 3210 3212 3180
-6362 2 2 0 1 3211 3212 3210
-6363 2 2 0 1 3173 3216 3207
-6364 2 2 0 1 3173 3201 3216
-6365 2 2 0 1 3213 3293 3179
-6366 2 2 0 1 3183 3214 3191
-6367 2 2 0 1 3183 3165 3214
-6368 2 2 0 1 3170 3227 3199
-6369 2 2 0 1 3170 3183 3227
-6370 2 2 0 1 3244 3215 3289
-6371 2 2 0 1 3188 3215 3244
-6372 2 2 0 1 3216 3193 3207
-6373 2 2 0 1 3216 3192 3193
-6374 2 2 0 1 3190 3189 3217
-6375 2 2 0 1 3214 3189 3190
-6376 2 2 0 1 3193 3218 3207
-6377 2 2 0 1 3170 3218 3193
-6378 2 2 0 1 3218 3223 3207
-6379 2 2 0 1 3218 3200 3223
-6380 2 2 0 1 3215 3185 3289
-6381 2 2 0 1 3194 3234 3235
-6382 2 2 0 1 3219 3234 3194
-6383 2 2 0 1 3246 3220 3143
-6384 2 2 0 1 3241 3181 3220
-6385 2 2 0 1 3223 3221 3222
-6386 2 2 0 1 3174 3173 3222
-6387 2 2 0 1 3222 3173 3223
-6388 2 2 0 1 3283 3221 3161
-6389 2 2 0 1 3243 3219 3255
-6390 2 2 0 1 3219 3145 3255
-6391 2 2 0 1 3145 3219 3195
-6392 2 2 0 1 3182 3286 3305
-6393 2 2 0 1 3292 3151 3293
-6394 2 2 0 1 3151 3150 3293
-6395 2 2 0 1 3179 3224 3168
-6396 2 2 0 1 3226 3224 3149
-6397 2 2 0 1 3225 3224 3226
-6398 2 2 0 1 3168 3224 3225
-6399 2 2 0 1 3156 3283 3281
-6400 2 2 0 1 3671 3247 3761
-6401 2 2 0 1 3197 3247 3671
-6402 2 2 0 1 3163 3247 3176
-6403 2 2 0 1 3176 3247 3197
-6404 2 2 0 1 3220 3191 3143
-6405 2 2 0 1 3220 3227 3191
-6406 2 2 0 1 3220 3181 3206
-6407 2 2 0 1 3220 3206 3227
-6408 2 2 0 1 3095 3304 3302
-6409 2 2 0 1 3449 3276 3248
-6410 2 2 0 1 3276 3271 3181
-6411 2 2 0 1 3186 3229 3228
-6412 2 2 0 1 3186 3185 3229
-6413 2 2 0 1 3215 3230 3229
-6414 2 2 0 1 3229 3185 3215
-6415 2 2 0 1 3231 3232 2894
-6416 2 2 0 1 3232 3231 3236
-6417 2 2 0 1 3232 3178 3275
-6418 2 2 0 1 3236 3178 3232
-6419 2 2 0 1 3231 3233 3236
-6420 2 2 0 1 3234 3233 3235
-6421 2 2 0 1 3236 3233 3234
-6422 2 2 0 1 3237 3238 3246
-6423 2 2 0 1 3246 3239 3237
-6424 2 2 0 1 3805 3237 3692
-6425 2 2 0 1 3239 3692 3237
-6426 2 2 0 1 3763 3240 3177
-6427 2 2 0 1 3238 3249 3241
-6428 2 2 0 1 3242 3272 3145
-6429 2 2 0 1 3272 3242 3286
-6430 2 2 0 1 3242 3290 3286
-6431 2 2 0 1 3692 3239 3752
-6432 2 2 0 1 3217 3239 3246
-6433 2 2 0 1 3239 3217 3752
-6434 2 2 0 1 3255 3180 3243
-6435 2 2 0 1 3255 3210 3180
-6436 2 2 0 1 3244 3296 3297
-6437 2 2 0 1 3296 3244 3289
-6438 2 2 0 1 3244 3297 3184
-6439 2 2 0 1 3245 2979 2968
-6440 2 2 0 1 2968 3152 3245
-6441 2 2 0 1 2979 3245 3235
-6442 2 2 0 1 3245 3194 3235
-6443 2 2 0 1 3241 3246 3238
-6444 2 2 0 1 3220 3246 3241
-6445 2 2 0 1 3761 3240 3763
-6446 2 2 0 1 3761 3247 3240
-6447 2 2 0 1 3248 3241 3249
-6448 2 2 0 1 3248 3276 3241
-6449 2 2 0 1 3250 3415 3251
-6450 2 2 0 1 3265 3252 3251
-6451 2 2 0 1 3291 3304 3095
-6452 2 2 0 1 3282 3253 3281
-6453 2 2 0 1 3253 3282 3252
-6454 2 2 0 1 3268 3158 3159
-6455 2 2 0 1 3254 3753 3752
-6456 2 2 0 1 3254 3217 3189
-6457 2 2 0 1 3217 3254 3752
-6458 2 2 0 1 3753 3254 3189
-6459 2 2 0 1 3271 3287 3160
-6460 2 2 0 1 3255 3279 3210
-6461 2 2 0 1 3279 3255 3272
-6462 2 2 0 1 3204 3267 3203
-6463 2 2 0 1 3264 3256 3263
-6464 2 2 0 1 3256 3264 3157
-6465 2 2 0 1 3222 3257 3174
-6466 2 2 0 1 3166 3257 3159
-6467 2 2 0 1 3257 3166 3174
-6468 2 2 0 1 3280 3258 3157
-6469 2 2 0 1 3305 3260 3259
-6470 2 2 0 1 3252 3250 3251
-6471 2 2 0 1 3282 3250 3252
-6472 2 2 0 1 3260 3261 3259
-6473 2 2 0 1 3304 3261 3260
-6474 2 2 0 1 3262 3203 3267
-6475 2 2 0 1 3210 3264 3263
-6476 2 2 0 1 3264 3280 3157
-6477 2 2 0 1 3257 3268 3159
-6478 2 2 0 1 3222 3268 3257
-6479 2 2 0 1 3262 3230 3203
-6480 2 2 0 1 3229 3230 3262
-6481 2 2 0 1 3269 3265 3266
-6482 2 2 0 1 3265 3269 3252
-6483 2 2 0 1 3252 3269 3253
-6484 2 2 0 1 3267 3281 3253
-6485 2 2 0 1 3281 3267 3204
-6486 2 2 0 1 3184 3212 3211
-6487 2 2 0 1 3211 3188 3184
-6488 2 2 0 1 3244 3184 3188
-6489 2 2 0 1 3250 3282 3167
-6490 2 2 0 1 3261 3291 3209
-6491 2 2 0 1 3213 3209 3291
-6492 2 2 0 1 3291 3261 3304
-6493 2 2 0 1 3280 3279 3272
-6494 2 2 0 1 3228 3229 3262
-6495 2 2 0 1 3222 3221 3268
-6496 2 2 0 1 3262 3266 3228
-6497 2 2 0 1 3269 3266 3262
-6498 2 2 0 1 3270 3287 3271
-6499 2 2 0 1 3276 3270 3271
-6500 2 2 0 1 3274 2894 3232
-6501 2 2 0 1 3167 3284 3161
-6502 2 2 0 1 3284 3283 3161
-6503 2 2 0 1 3286 3285 3272
-6504 2 2 0 1 3285 3280 3272
-6505 2 2 0 1 3158 3273 3156
-6506 2 2 0 1 3273 3283 3156
-6507 2 2 0 1 3274 3275 3297
-6508 2 2 0 1 3232 3275 3274
-6509 2 2 0 1 3274 2895 2894
-6510 2 2 0 1 3274 3297 2895
-6511 2 2 0 1 3449 3299 3270
-6512 2 2 0 1 3276 3449 3270
-6513 2 2 0 1 3114 3277 3278
-6514 2 2 0 1 3153 3114 3278
-6515 2 2 0 1 3210 3279 3264
-6516 2 2 0 1 3264 3279 3280
-6517 2 2 0 1 3283 3273 3221
-6518 2 2 0 1 3268 3273 3158
-6519 2 2 0 1 3273 3268 3221
-6520 2 2 0 1 3092 3291 3095
-6521 2 2 0 1 3284 3167 3282
-6522 2 2 0 1 3281 3284 3282
-6523 2 2 0 1 3281 3283 3284
-6524 2 2 0 1 3258 3285 3182
-6525 2 2 0 1 3285 3258 3280
-6526 2 2 0 1 3285 3286 3182
-6527 2 2 0 1 3287 3167 3160
-6528 2 2 0 1 3167 3287 3250
-6529 2 2 0 1 3262 3267 3269
-6530 2 2 0 1 3269 3267 3253
-6531 2 2 0 1 3187 3288 3289
-6532 2 2 0 1 3305 3286 3290
-6533 2 2 0 1 3092 3294 3291
-6534 2 2 0 1 3294 3213 3291
-6535 2 2 0 1 2937 3295 3461
-6536 2 2 0 1 3295 3288 3461
-6537 2 2 0 1 3292 3294 3092
-6538 2 2 0 1 3294 3292 3293
-6539 2 2 0 1 3213 3294 3293
-6540 2 2 0 1 3288 3295 3289
-6541 2 2 0 1 3295 3296 3289
-6542 2 2 0 1 3296 3295 2937
-6543 2 2 0 1 3144 2895 3297
-6544 2 2 0 1 3296 3144 3297
-6545 2 2 0 1 3298 3415 3250
-6546 2 2 0 1 3287 3298 3250
-6547 2 2 0 1 3415 3298 3299
-6548 2 2 0 1 3300 3290 3242
-6549 2 2 0 1 3278 3300 3242
-6550 2 2 0 1 3298 3270 3299
-6551 2 2 0 1 3287 3270 3298
-6552 2 2 0 1 3277 3300 3278
-6553 2 2 0 1 3301 3300 3277
-6554 2 2 0 1 3105 3303 3301
-6555 2 2 0 1 3303 3300 3301
-6556 2 2 0 1 3290 3300 3303
-6557 2 2 0 1 3302 3303 3105
-6558 2 2 0 1 3304 3303 3302
-6559 2 2 0 1 3304 3260 3303
-6560 2 2 0 1 3303 3260 3305
-6561 2 2 0 1 3303 3305 3290
-6562 2 2 0 1 3306 3321 3307
-6563 2 2 0 1 3318 3307 3317
-6564 2 2 0 1 3398 3405 3391
-6565 2 2 0 1 3321 3320 3307
-6566 2 2 0 1 3308 3309 3249
-6567 2 2 0 1 3309 3308 3322
-6568 2 2 0 1 3407 2827 2799
-6569 2 2 0 1 3401 3450 3358
-6570 2 2 0 1 2831 3410 3310
-6571 2 2 0 1 2831 3310 3315
-6572 2 2 0 1 3385 3409 2870
-6573 2 2 0 1 3316 3504 3311
-6574 2 2 0 1 3312 3317 3311
-6575 2 2 0 1 3311 3313 3312
-6576 2 2 0 1 3311 3504 3313
-6577 2 2 0 1 3312 3335 3317
-6578 2 2 0 1 3487 3313 3504
-6579 2 2 0 1 3314 3496 3315
-6580 2 2 0 1 3315 3310 3314
-6581 2 2 0 1 3358 3314 3411
-6582 2 2 0 1 3310 3411 3314
-6583 2 2 0 1 3314 3358 3450
-6584 2 2 0 1 3320 3537 3316
-6585 2 2 0 1 3320 3316 3311
-6586 2 2 0 1 3307 3320 3317
-6587 2 2 0 1 3320 3311 3317
-6588 2 2 0 1 3318 3930 3306
-6589 2 2 0 1 3306 3307 3318
-6590 2 2 0 1 3537 3321 3319
-6591 2 2 0 1 3320 3321 3537
-6592 2 2 0 1 3308 3323 3322
-6593 2 2 0 1 3978 3322 3323
-6594 2 2 0 1 3325 3418 3456
-6595 2 2 0 1 3324 3325 3341
-6596 2 2 0 1 3324 3418 3325
-6597 2 2 0 1 3418 3327 3456
-6598 2 2 0 1 3326 3327 3427
-6599 2 2 0 1 3456 3327 3326
-6600 2 2 0 1 3328 3330 3370
-6601 2 2 0 1 3370 3329 3346
-6602 2 2 0 1 3330 3440 3370
-6603 2 2 0 1 3367 3331 3349
-6604 2 2 0 1 3359 3376 3368
-6605 2 2 0 1 3332 3333 3372
-6606 2 2 0 1 3332 3372 3334
-6607 2 2 0 1 3318 3317 3342
-6608 2 2 0 1 3342 3317 3335
-6609 2 2 0 1 3349 3331 3344
-6610 2 2 0 1 3369 3368 3430
-6611 2 2 0 1 3364 3334 3340
-6612 2 2 0 1 3357 3378 3340
-6613 2 2 0 1 3427 3327 3336
-6614 2 2 0 1 3331 3367 3336
-6615 2 2 0 1 3341 3325 3425
-6616 2 2 0 1 3368 3425 3359
-6617 2 2 0 1 3432 3430 3368
-6618 2 2 0 1 3457 3330 3328
-6619 2 2 0 1 3337 3366 3349
-6620 2 2 0 1 3333 3338 3339
-6621 2 2 0 1 3340 3377 3364
-6622 2 2 0 1 3378 3357 3383
-6623 2 2 0 1 3341 3389 3324
-6624 2 2 0 1 3373 3333 3332
-6625 2 2 0 1 3373 3342 3335
-6626 2 2 0 1 3332 3342 3373
-6627 2 2 0 1 3343 3451 3328
-6628 2 2 0 1 3401 3423 3400
-6629 2 2 0 1 3371 3344 3331
-6630 2 2 0 1 3377 3422 3364
-6631 2 2 0 1 3361 3841 3363
-6632 2 2 0 1 3363 3334 3364
-6633 2 2 0 1 3383 3345 3346
-6634 2 2 0 1 3345 3343 3346
-6635 2 2 0 1 3342 3332 3413
-6636 2 2 0 1 3413 3318 3342
-6637 2 2 0 1 3332 3414 3413
-6638 2 2 0 1 3347 3406 3356
-6639 2 2 0 1 3445 3406 3347
-6640 2 2 0 1 3396 3347 3356
-6641 2 2 0 1 3348 3338 3344
-6642 2 2 0 1 3348 3339 3338
-6643 2 2 0 1 3366 3437 3349
-6644 2 2 0 1 3445 3375 3406
-6645 2 2 0 1 3350 3351 3393
-6646 2 2 0 1 3426 3326 3427
-6647 2 2 0 1 3329 3379 3346
-6648 2 2 0 1 3355 3378 3379
-6649 2 2 0 1 3313 3352 3312
-6650 2 2 0 1 3384 3451 3343
-6651 2 2 0 1 3375 3445 3433
-6652 2 2 0 1 3445 3353 3433
-6653 2 2 0 1 3394 3187 3186
-6654 2 2 0 1 3187 3394 3408
-6655 2 2 0 1 3354 3430 3432
-6656 2 2 0 1 3421 3361 3362
-6657 2 2 0 1 3422 3362 3364
-6658 2 2 0 1 3422 3421 3362
-6659 2 2 0 1 3355 3391 3381
-6660 2 2 0 1 3405 3381 3391
-6661 2 2 0 1 3355 3381 3377
-6662 2 2 0 1 3356 3397 3396
-6663 2 2 0 1 3356 3388 3397
-6664 2 2 0 1 3382 3357 3339
-6665 2 2 0 1 3382 3383 3357
-6666 2 2 0 1 3411 3412 3358
-6667 2 2 0 1 3358 3412 3388
-6668 2 2 0 1 3338 3333 3374
-6669 2 2 0 1 3337 3338 3374
-6670 2 2 0 1 3401 3403 3450
-6671 2 2 0 1 3376 3359 3360
-6672 2 2 0 1 3363 3362 3361
-6673 2 2 0 1 3362 3363 3364
-6674 2 2 0 1 3365 3366 3352
-6675 2 2 0 1 3352 3313 3365
-6676 2 2 0 1 3343 3370 3346
-6677 2 2 0 1 3370 3343 3328
-6678 2 2 0 1 3337 3344 3338
-6679 2 2 0 1 3344 3337 3349
-6680 2 2 0 1 3437 3367 3349
-6681 2 2 0 1 3376 3432 3368
-6682 2 2 0 1 3341 3425 3369
-6683 2 2 0 1 3368 3369 3425
-6684 2 2 0 1 3440 3351 3329
-6685 2 2 0 1 3329 3370 3440
-6686 2 2 0 1 3371 3384 3380
-6687 2 2 0 1 3357 3340 3372
-6688 2 2 0 1 3334 3372 3340
-6689 2 2 0 1 3357 3372 3339
-6690 2 2 0 1 3333 3339 3372
-6691 2 2 0 1 3373 3335 3374
-6692 2 2 0 1 3333 3373 3374
-6693 2 2 0 1 3336 3436 3427
-6694 2 2 0 1 3436 3336 3367
-6695 2 2 0 1 3406 3375 3360
-6696 2 2 0 1 3375 3376 3360
-6697 2 2 0 1 3371 3380 3348
-6698 2 2 0 1 3344 3371 3348
-6699 2 2 0 1 3437 3366 3365
-6700 2 2 0 1 3378 3355 3377
-6701 2 2 0 1 3378 3377 3340
-6702 2 2 0 1 3383 3346 3379
-6703 2 2 0 1 3379 3378 3383
-6704 2 2 0 1 3408 3354 3434
-6705 2 2 0 1 3354 3432 3434
-6706 2 2 0 1 3382 3348 3380
-6707 2 2 0 1 3348 3382 3339
-6708 2 2 0 1 3381 3405 3422
-6709 2 2 0 1 3422 3377 3381
-6710 2 2 0 1 3380 3345 3382
-6711 2 2 0 1 3382 3345 3383
-6712 2 2 0 1 3380 3384 3345
-6713 2 2 0 1 3345 3384 3343
-6714 2 2 0 1 3394 3354 3408
-6715 2 2 0 1 3397 3412 3385
-6716 2 2 0 1 3412 3397 3388
-6717 2 2 0 1 3398 3391 3390
-6718 2 2 0 1 3390 3351 3350
-6719 2 2 0 1 3386 3451 3384
-6720 2 2 0 1 3371 3331 3386
-6721 2 2 0 1 3371 3386 3384
-6722 2 2 0 1 3387 3328 3451
-6723 2 2 0 1 3388 3356 3423
-6724 2 2 0 1 3423 3401 3388
-6725 2 2 0 1 3401 3358 3388
-6726 2 2 0 1 3426 3402 3326
-6727 2 2 0 1 3487 3462 3365
-6728 2 2 0 1 3365 3313 3487
-6729 2 2 0 1 3366 3337 3352
-6730 2 2 0 1 3335 3312 3352
-6731 2 2 0 1 3374 3335 3352
-6732 2 2 0 1 3337 3374 3352
-6733 2 2 0 1 3387 3324 3389
-6734 2 2 0 1 3929 3414 3841
-6735 2 2 0 1 3363 3841 3414
-6736 2 2 0 1 3334 3414 3332
-6737 2 2 0 1 3334 3363 3414
-6738 2 2 0 1 3390 3391 3355
-6739 2 2 0 1 3355 3379 3390
-6740 2 2 0 1 3351 3390 3329
-6741 2 2 0 1 3390 3379 3329
-6742 2 2 0 1 3392 3511 3469
-6743 2 2 0 1 3393 3449 3248
-6744 2 2 0 1 3440 3393 3351
-6745 2 2 0 1 3395 3186 3228
-6746 2 2 0 1 3394 3186 3395
-6747 2 2 0 1 3395 3430 3354
-6748 2 2 0 1 3394 3395 3354
-6749 2 2 0 1 2858 3447 3442
-6750 2 2 0 1 3442 3396 2858
-6751 2 2 0 1 3442 3445 3347
-6752 2 2 0 1 3396 3442 3347
-6753 2 2 0 1 2858 3396 2870
-6754 2 2 0 1 2870 3397 3385
-6755 2 2 0 1 3397 2870 3396
-6756 2 2 0 1 3322 3398 3309
-6757 2 2 0 1 3322 3404 3398
-6758 2 2 0 1 3322 3978 3399
-6759 2 2 0 1 3404 3322 3399
-6760 2 2 0 1 3413 3930 3318
-6761 2 2 0 1 3309 3350 3249
-6762 2 2 0 1 3400 3403 3401
-6763 2 2 0 1 3402 3403 3400
-6764 2 2 0 1 3402 3471 3403
-6765 2 2 0 1 3419 3404 3399
-6766 2 2 0 1 3404 3405 3398
-6767 2 2 0 1 3419 3405 3404
-6768 2 2 0 1 3406 3423 3356
-6769 2 2 0 1 3360 3423 3406
-6770 2 2 0 1 3434 3353 3407
-6771 2 2 0 1 3434 3407 3408
-6772 2 2 0 1 3353 3434 3433
-6773 2 2 0 1 3411 3410 3409
-6774 2 2 0 1 3410 3411 3310
-6775 2 2 0 1 3411 3409 3385
-6776 2 2 0 1 3412 3411 3385
-6777 2 2 0 1 3398 3350 3309
-6778 2 2 0 1 3398 3390 3350
-6779 2 2 0 1 3413 3929 3930
-6780 2 2 0 1 3414 3929 3413
-6781 2 2 0 1 3350 3248 3249
-6782 2 2 0 1 3393 3248 3350
-6783 2 2 0 1 3435 3251 3415
-6784 2 2 0 1 3416 3265 3251
-6785 2 2 0 1 3469 3417 3392
-6786 2 2 0 1 3454 3389 3459
-6787 2 2 0 1 3454 3459 3416
-6788 2 2 0 1 3418 3453 3327
-6789 2 2 0 1 3420 3419 3421
-6790 2 2 0 1 3422 3405 3420
-6791 2 2 0 1 3405 3419 3420
-6792 2 2 0 1 3420 3421 3422
-6793 2 2 0 1 3440 3330 3458
-6794 2 2 0 1 3423 3360 3438
-6795 2 2 0 1 3423 3438 3400
-6796 2 2 0 1 3341 3369 3424
-6797 2 2 0 1 3428 3359 3425
-6798 2 2 0 1 3425 3325 3428
-6799 2 2 0 1 3386 3331 3429
-6800 2 2 0 1 3429 3336 3327
-6801 2 2 0 1 3429 3331 3336
-6802 2 2 0 1 3455 3325 3456
-6803 2 2 0 1 3427 3468 3426
-6804 2 2 0 1 3251 3435 3416
-6805 2 2 0 1 3416 3435 3454
-6806 2 2 0 1 3436 3468 3427
-6807 2 2 0 1 3468 3436 3469
-6808 2 2 0 1 3369 3439 3424
-6809 2 2 0 1 3428 3360 3359
-6810 2 2 0 1 3428 3325 3455
-6811 2 2 0 1 3327 3453 3429
-6812 2 2 0 1 3453 3386 3429
-6813 2 2 0 1 3439 3369 3430
-6814 2 2 0 1 3430 3395 3439
-6815 2 2 0 1 3266 3265 3431
-6816 2 2 0 1 3431 3265 3416
-6817 2 2 0 1 3431 3416 3459
-6818 2 2 0 1 3389 3424 3459
-6819 2 2 0 1 3389 3341 3424
-6820 2 2 0 1 3376 3375 3433
-6821 2 2 0 1 3376 3433 3432
-6822 2 2 0 1 3433 3434 3432
-6823 2 2 0 1 3454 3435 3457
-6824 2 2 0 1 3417 3436 3367
-6825 2 2 0 1 3437 3417 3367
-6826 2 2 0 1 3417 3469 3436
-6827 2 2 0 1 3438 3455 3400
-6828 2 2 0 1 3439 3395 3228
-6829 2 2 0 1 3451 3386 3453
-6830 2 2 0 1 3439 3228 3266
-6831 2 2 0 1 3431 3439 3266
-6832 2 2 0 1 3441 3440 3458
-6833 2 2 0 1 3393 3440 3441
-6834 2 2 0 1 3442 3447 3446
-6835 2 2 0 1 3457 3328 3443
-6836 2 2 0 1 3443 3328 3387
-6837 2 2 0 1 3444 3402 3400
-6838 2 2 0 1 3400 3455 3444
-6839 2 2 0 1 3418 3324 3452
-6840 2 2 0 1 3387 3452 3324
-6841 2 2 0 1 3445 3446 3353
-6842 2 2 0 1 3445 3442 3446
-6843 2 2 0 1 3447 3448 3446
-6844 2 2 0 1 3448 3353 3446
-6845 2 2 0 1 3299 3449 3441
-6846 2 2 0 1 3441 3449 3393
-6847 2 2 0 1 3496 3450 3467
-6848 2 2 0 1 3314 3450 3496
-6849 2 2 0 1 3360 3428 3438
-6850 2 2 0 1 3455 3438 3428
-6851 2 2 0 1 3451 3452 3387
-6852 2 2 0 1 3453 3418 3452
-6853 2 2 0 1 3451 3453 3452
-6854 2 2 0 1 3417 3460 3392
-6855 2 2 0 1 3443 3454 3457
-6856 2 2 0 1 3454 3443 3389
-6857 2 2 0 1 3387 3389 3443
-6858 2 2 0 1 3456 3326 3444
-6859 2 2 0 1 3444 3455 3456
-6860 2 2 0 1 3444 3326 3402
-6861 2 2 0 1 3457 3458 3330
-6862 2 2 0 1 3435 3458 3457
-6863 2 2 0 1 3431 3424 3439
-6864 2 2 0 1 3431 3459 3424
-6865 2 2 0 1 3187 3408 3288
-6866 2 2 0 1 3402 3426 3471
-6867 2 2 0 1 3460 3417 3463
-6868 2 2 0 1 3437 3463 3417
-6869 2 2 0 1 2799 3461 3464
-6870 2 2 0 1 3464 3461 3288
-6871 2 2 0 1 3462 3460 3463
-6872 2 2 0 1 3365 3462 3463
-6873 2 2 0 1 3365 3463 3437
-6874 2 2 0 1 3464 3288 3408
-6875 2 2 0 1 3408 3407 3464
-6876 2 2 0 1 3464 3407 2799
-6877 2 2 0 1 2827 3353 3448
-6878 2 2 0 1 3407 3353 2827
-6879 2 2 0 1 3466 3435 3415
-6880 2 2 0 1 3458 3435 3466
-6881 2 2 0 1 3466 3415 3299
-6882 2 2 0 1 3403 3471 3465
-6883 2 2 0 1 3403 3465 3450
-6884 2 2 0 1 3299 3441 3466
-6885 2 2 0 1 3441 3458 3466
-6886 2 2 0 1 3467 3450 3465
-6887 2 2 0 1 3516 3467 3465
-6888 2 2 0 1 3516 3470 3512
-6889 2 2 0 1 3516 3465 3470
-6890 2 2 0 1 3465 3471 3470
-6891 2 2 0 1 3511 3512 3470
-6892 2 2 0 1 3469 3511 3470
-6893 2 2 0 1 3470 3468 3469
-6894 2 2 0 1 3468 3470 3426
-6895 2 2 0 1 3471 3426 3470
-6896 2 2 0 1 3985 3472 4005
-6897 2 2 0 1 3518 3519 3473
-6898 2 2 0 1 3478 3535 3497
-6899 2 2 0 1 3535 3478 3500
-6900 2 2 0 1 4005 3472 3493
-6901 2 2 0 1 4010 4005 3474
-6902 2 2 0 1 3498 3474 3493
-6903 2 2 0 1 3474 4005 3493
-6904 2 2 0 1 3547 3477 3476
-6905 2 2 0 1 3475 3499 3498
-6906 2 2 0 1 3500 3476 3477
-6907 2 2 0 1 3476 3500 3478
-6908 2 2 0 1 3497 3479 3478
-6909 2 2 0 1 3538 3495 3494
-6910 2 2 0 1 3476 3478 3479
-6911 2 2 0 1 3480 3481 3546
-6912 2 2 0 1 3480 3546 3483
-6913 2 2 0 1 3482 3480 3491
-6914 2 2 0 1 3480 3483 3491
-6915 2 2 0 1 3483 3546 3547
-6916 2 2 0 1 3547 3476 3483
-6917 2 2 0 1 3483 3479 3491
-6918 2 2 0 1 3476 3479 3483
-6919 2 2 0 1 3517 3482 3491
-6920 2 2 0 1 3491 3502 3517
-6921 2 2 0 1 3485 3543 3481
-6922 2 2 0 1 3485 3481 3480
-6923 2 2 0 1 3508 3485 3482
-6924 2 2 0 1 3485 3480 3482
-6925 2 2 0 1 3513 3482 3517
-6926 2 2 0 1 3484 3542 3543
-6927 2 2 0 1 3484 3543 3485
-6928 2 2 0 1 3486 3484 3508
-6929 2 2 0 1 3484 3485 3508
-6930 2 2 0 1 3521 3541 3542
-6931 2 2 0 1 3521 3542 3484
-6932 2 2 0 1 3473 3521 3486
-6933 2 2 0 1 3521 3484 3486
-6934 2 2 0 1 3488 3462 3487
-6935 2 2 0 1 3523 3519 3518
-6936 2 2 0 1 3488 3523 3518
-6937 2 2 0 1 3460 3489 3392
-6938 2 2 0 1 3489 3518 3473
-6939 2 2 0 1 3392 3490 3511
-6940 2 2 0 1 3392 3489 3490
-6941 2 2 0 1 3490 3473 3486
-6942 2 2 0 1 3473 3490 3489
-6943 2 2 0 1 3491 3479 3502
-6944 2 2 0 1 3479 3497 3502
-6945 2 2 0 1 3539 3522 3540
-6946 2 2 0 1 3540 3522 3492
-6947 2 2 0 1 3540 3492 3538
-6948 2 2 0 1 3495 3538 3492
-6949 2 2 0 1 3495 3492 3533
-6950 2 2 0 1 3316 3537 3529
-6951 2 2 0 1 3528 3529 3475
-6952 2 2 0 1 3493 3472 3494
-6953 2 2 0 1 3494 3495 3493
-6954 2 2 0 1 3498 3493 3495
-6955 2 2 0 1 3496 3534 3315
-6956 2 2 0 1 3535 3534 3497
-6957 2 2 0 1 3526 4010 3499
-6958 2 2 0 1 3498 3499 3474
-6959 2 2 0 1 3474 3499 4010
-6960 2 2 0 1 3556 2737 3500
-6961 2 2 0 1 3500 3477 3556
-6962 2 2 0 1 3535 2737 2734
-6963 2 2 0 1 3500 2737 3535
-6964 2 2 0 1 3512 3501 3516
-6965 2 2 0 1 3517 3501 3513
-6966 2 2 0 1 3516 3515 3467
-6967 2 2 0 1 3517 3502 3515
-6968 2 2 0 1 3528 3532 3503
-6969 2 2 0 1 3504 3316 3505
-6970 2 2 0 1 3505 3528 3503
-6971 2 2 0 1 3467 3506 3496
-6972 2 2 0 1 3497 3506 3502
-6973 2 2 0 1 3460 3507 3489
-6974 2 2 0 1 3518 3489 3507
-6975 2 2 0 1 3522 3523 3527
-6976 2 2 0 1 3508 3514 3486
-6977 2 2 0 1 3490 3486 3514
-6978 2 2 0 1 3521 3520 3541
-6979 2 2 0 1 3509 3519 3523
-6980 2 2 0 1 3512 3511 3510
-6981 2 2 0 1 3490 3510 3511
-6982 2 2 0 1 3534 3496 3506
-6983 2 2 0 1 3534 3506 3497
-6984 2 2 0 1 3510 3501 3512
-6985 2 2 0 1 3513 3501 3510
-6986 2 2 0 1 3514 3508 3482
-6987 2 2 0 1 3514 3482 3513
-6988 2 2 0 1 3501 3515 3516
-6989 2 2 0 1 3515 3501 3517
-6990 2 2 0 1 3515 3506 3467
-6991 2 2 0 1 3506 3515 3502
-6992 2 2 0 1 3541 3520 3531
-6993 2 2 0 1 3490 3514 3510
-6994 2 2 0 1 3510 3514 3513
-6995 2 2 0 1 3527 3533 3492
-6996 2 2 0 1 3522 3527 3492
-6997 2 2 0 1 3507 3460 3462
-6998 2 2 0 1 3507 3462 3488
-6999 2 2 0 1 3507 3488 3518
-7000 2 2 0 1 3519 3520 3473
-7001 2 2 0 1 3473 3520 3521
-7002 2 2 0 1 3509 3522 3539
-7003 2 2 0 1 3509 3523 3522
-7004 2 2 0 1 3509 3539 3531
-7005 2 2 0 1 3527 3523 3488
-7006 2 2 0 1 3488 3503 3527
-7007 2 2 0 1 3526 3525 3524
-7008 2 2 0 1 3499 3525 3526
-7009 2 2 0 1 3525 3475 3529
-7010 2 2 0 1 3475 3525 3499
-7011 2 2 0 1 3533 3527 3532
-7012 2 2 0 1 3532 3527 3503
-7013 2 2 0 1 3505 3316 3529
-7014 2 2 0 1 3528 3505 3529
-7015 2 2 0 1 3504 3530 3487
-7016 2 2 0 1 3530 3503 3488
-7017 2 2 0 1 3530 3488 3487
-7018 2 2 0 1 3504 3505 3530
-7019 2 2 0 1 3503 3530 3505
-7020 2 2 0 1 3509 3531 3520
-7021 2 2 0 1 3519 3509 3520
-7022 2 2 0 1 3532 3475 3498
-7023 2 2 0 1 3498 3495 3532
-7024 2 2 0 1 3532 3495 3533
-7025 2 2 0 1 3532 3528 3475
-7026 2 2 0 1 3536 3315 3534
-7027 2 2 0 1 2831 3536 2733
-7028 2 2 0 1 3536 2831 3315
-7029 2 2 0 1 3534 3535 3536
-7030 2 2 0 1 3536 2734 2733
-7031 2 2 0 1 3535 2734 3536
-7032 2 2 0 1 3525 3529 3537
-7033 2 2 0 1 3537 3319 3524
-7034 2 2 0 1 3524 3525 3537
-7035 2 2 0 1 3559 489 460
-7036 2 2 0 1 3494 3472 3559
-7037 2 2 0 1 3554 460 463
-7038 2 2 0 1 3538 3494 3554
-7039 2 2 0 1 3555 463 483
-7040 2 2 0 1 3540 3538 3555
-7041 2 2 0 1 3553 483 464
-7042 2 2 0 1 3539 3540 3553
-7043 2 2 0 1 3531 3539 3551
-7044 2 2 0 1 3551 464 467
-7045 2 2 0 1 3548 467 480
-7046 2 2 0 1 3541 3531 3548
-7047 2 2 0 1 3550 480 468
-7048 2 2 0 1 3542 3541 3550
-7049 2 2 0 1 468 473 3549
-7050 2 2 0 1 3543 3542 3549
-7051 2 2 0 1 3481 3543 3544
-7052 2 2 0 1 473 475 3544
-7053 2 2 0 1 475 474 3545
-7054 2 2 0 1 3546 3481 3545
-7055 2 2 0 1 3552 474 485
-7056 2 2 0 1 3547 3546 3552
-7057 2 2 0 1 485 3557 3560
-7058 2 2 0 1 3547 3560 3477
-7059 2 2 0 1 3550 3548 480
-7060 2 2 0 1 3548 3550 3541
-7061 2 2 0 1 3548 3551 467
-7062 2 2 0 1 3551 3548 3531
-7063 2 2 0 1 3549 3550 468
-7064 2 2 0 1 3550 3549 3542
-7065 2 2 0 1 3545 3544 475
-7066 2 2 0 1 3544 3545 3481
-7067 2 2 0 1 3551 3553 464
-7068 2 2 0 1 3553 3551 3539
-7069 2 2 0 1 3544 3549 473
-7070 2 2 0 1 3549 3544 3543
-7071 2 2 0 1 3545 474 3552
-7072 2 2 0 1 3545 3552 3546
-7073 2 2 0 1 3553 3555 483
-7074 2 2 0 1 3555 3553 3540
-7075 2 2 0 1 485 3560 3552
-7076 2 2 0 1 3560 3547 3552
-7077 2 2 0 1 3555 3554 463
-7078 2 2 0 1 3554 3555 3538
-7079 2 2 0 1 3554 3559 460
-7080 2 2 0 1 3559 3554 3494
-7081 2 2 0 1 3556 3477 2729
-7082 2 2 0 1 757 489 4071
-7083 2 2 0 1 2729 3557 3558
-7084 2 2 0 1 3472 3985 4071
-7085 2 2 0 1 3559 4071 489
-7086 2 2 0 1 3559 3472 4071
-7087 2 2 0 1 3560 3557 2729
-7088 2 2 0 1 3477 3560 2729
-7089 2 2 0 1 3591 3561 4180
-7090 2 2 0 1 3579 3562 4105
-7091 2 2 0 1 3575 3579 4105
-7092 2 2 0 1 4128 3563 4107
-7093 2 2 0 1 3563 4109 4107
-7094 2 2 0 1 3564 3577 3588
-7095 2 2 0 1 3577 3564 3578
-7096 2 2 0 1 3604 3565 3567
-7097 2 2 0 1 3565 3604 3566
-7098 2 2 0 1 3611 3564 3588
-7099 2 2 0 1 3579 3605 3567
-7100 2 2 0 1 3561 3576 4128
-7101 2 2 0 1 3576 3563 4128
-7102 2 2 0 1 3604 3567 3605
-7103 2 2 0 1 4090 3568 3569
-7104 2 2 0 1 3595 3569 3568
-7105 2 2 0 1 3571 4081 3570
-7106 2 2 0 1 3572 4081 3571
-7107 2 2 0 1 3564 3611 3571
-7108 2 2 0 1 3572 3571 3611
-7109 2 2 0 1 3572 4082 4081
-7110 2 2 0 1 3573 4082 3572
-7111 2 2 0 1 3612 3573 3572
-7112 2 2 0 1 3573 4084 4082
-7113 2 2 0 1 3586 4084 3573
-7114 2 2 0 1 3581 3586 3573
-7115 2 2 0 1 3599 3603 3589
-7116 2 2 0 1 4094 3584 4097
-7117 2 2 0 1 3574 3571 3570
-7118 2 2 0 1 3571 3574 3578
-7119 2 2 0 1 3564 3571 3578
-7120 2 2 0 1 3575 3605 3579
-7121 2 2 0 1 3591 3576 3561
-7122 2 2 0 1 3577 3576 3591
-7123 2 2 0 1 3563 3576 3578
-7124 2 2 0 1 3577 3578 3576
-7125 2 2 0 1 3574 4109 3578
-7126 2 2 0 1 4109 3563 3578
-7127 2 2 0 1 3562 3579 3567
-7128 2 2 0 1 3586 4090 4084
-7129 2 2 0 1 3568 4090 3586
-7130 2 2 0 1 3595 3580 3569
-7131 2 2 0 1 3589 3580 3595
-7132 2 2 0 1 4097 3605 3575
-7133 2 2 0 1 4097 3584 3605
-7134 2 2 0 1 3567 3613 3562
-7135 2 2 0 1 3585 3581 3637
-7136 2 2 0 1 3592 3599 3582
-7137 2 2 0 1 3584 3583 3603
-7138 2 2 0 1 3583 3584 4094
-7139 2 2 0 1 3583 3589 3603
-7140 2 2 0 1 3568 3594 3595
-7141 2 2 0 1 3582 3594 3585
-7142 2 2 0 1 3581 3587 3586
-7143 2 2 0 1 3587 3568 3586
-7144 2 2 0 1 3587 3581 3585
-7145 2 2 0 1 3621 3588 3614
-7146 2 2 0 1 3599 3593 3582
-7147 2 2 0 1 3595 3593 3589
-7148 2 2 0 1 3593 3599 3589
-7149 2 2 0 1 3590 3577 3591
-7150 2 2 0 1 3598 3606 3597
-7151 2 2 0 1 3596 3592 3582
-7152 2 2 0 1 3596 3616 3592
-7153 2 2 0 1 3593 3594 3582
-7154 2 2 0 1 3595 3594 3593
-7155 2 2 0 1 3580 3583 4094
-7156 2 2 0 1 3580 3589 3583
-7157 2 2 0 1 3585 3596 3582
-7158 2 2 0 1 3585 3637 3596
-7159 2 2 0 1 3587 3594 3568
-7160 2 2 0 1 3585 3594 3587
-7161 2 2 0 1 3608 4180 4149
-7162 2 2 0 1 4180 3608 3591
-7163 2 2 0 1 3608 3590 3591
-7164 2 2 0 1 3634 3602 3642
-7165 2 2 0 1 3614 3597 3694
-7166 2 2 0 1 3598 3597 3614
-7167 2 2 0 1 3603 3601 3566
-7168 2 2 0 1 3601 3603 3599
-7169 2 2 0 1 3592 3601 3599
-7170 2 2 0 1 3601 3600 3566
-7171 2 2 0 1 3600 3601 3602
-7172 2 2 0 1 3604 3603 3566
-7173 2 2 0 1 3584 3603 3604
-7174 2 2 0 1 3604 3605 3584
-7175 2 2 0 1 3572 3611 3612
-7176 2 2 0 1 3621 3611 3588
-7177 2 2 0 1 3602 3607 3642
-7178 2 2 0 1 3612 3638 3573
-7179 2 2 0 1 3638 3581 3573
-7180 2 2 0 1 3606 3609 4150
-7181 2 2 0 1 3609 4149 4150
-7182 2 2 0 1 3607 3615 3642
-7183 2 2 0 1 3598 3609 3606
-7184 2 2 0 1 3609 3608 4149
-7185 2 2 0 1 3608 3598 3590
-7186 2 2 0 1 3608 3609 3598
-7187 2 2 0 1 3592 3616 3607
-7188 2 2 0 1 3592 3607 3601
-7189 2 2 0 1 3601 3607 3602
-7190 2 2 0 1 3590 3588 3577
-7191 2 2 0 1 3588 3590 3614
-7192 2 2 0 1 3598 3614 3590
-7193 2 2 0 1 3610 3612 3611
-7194 2 2 0 1 3610 3621 3628
-7195 2 2 0 1 3621 3610 3611
-7196 2 2 0 1 3612 3610 3628
-7197 2 2 0 1 3631 3613 3567
-7198 2 2 0 1 3631 3626 3613
-7199 2 2 0 1 3565 3631 3567
-7200 2 2 0 1 3596 3617 3616
-7201 2 2 0 1 3617 3596 3637
-7202 2 2 0 1 3615 3619 3620
-7203 2 2 0 1 3629 3614 3694
-7204 2 2 0 1 3614 3629 3621
-7205 2 2 0 1 3619 3615 3607
-7206 2 2 0 1 3616 3619 3607
-7207 2 2 0 1 3619 3616 3617
-7208 2 2 0 1 3155 3140 3618
-7209 2 2 0 1 3623 3625 3620
-7210 2 2 0 1 3619 3617 3623
-7211 2 2 0 1 3619 3623 3620
-7212 2 2 0 1 3630 3629 3694
-7213 2 2 0 1 3628 3621 3629
-7214 2 2 0 1 3140 3633 3618
-7215 2 2 0 1 3627 3622 3623
-7216 2 2 0 1 3618 3624 3636
-7217 2 2 0 1 3624 3618 3633
-7218 2 2 0 1 3625 3622 3778
-7219 2 2 0 1 3625 3623 3622
-7220 2 2 0 1 3140 3626 3633
-7221 2 2 0 1 3626 3631 3633
-7222 2 2 0 1 3622 3627 3628
-7223 2 2 0 1 3629 3622 3628
-7224 2 2 0 1 3778 3622 3630
-7225 2 2 0 1 3622 3629 3630
-7226 2 2 0 1 3632 3565 3566
-7227 2 2 0 1 3632 3631 3565
-7228 2 2 0 1 3600 3632 3566
-7229 2 2 0 1 3632 3633 3631
-7230 2 2 0 1 3632 3624 3633
-7231 2 2 0 1 3617 3637 3627
-7232 2 2 0 1 3627 3623 3617
-7233 2 2 0 1 3636 3635 3634
-7234 2 2 0 1 3600 3635 3632
-7235 2 2 0 1 3635 3602 3634
-7236 2 2 0 1 3600 3602 3635
-7237 2 2 0 1 3624 3635 3636
-7238 2 2 0 1 3624 3632 3635
-7239 2 2 0 1 3638 3637 3581
-7240 2 2 0 1 3628 3638 3612
-7241 2 2 0 1 3627 3638 3628
-7242 2 2 0 1 3627 3637 3638
-7243 2 2 0 1 3639 3606 4150
-7244 2 2 0 1 4207 3639 4150
-7245 2 2 0 1 3741 3679 3640
-7246 2 2 0 1 3791 3641 3900
-7247 2 2 0 1 3725 3618 3636
-7248 2 2 0 1 3791 3793 3641
-7249 2 2 0 1 3645 3763 3646
-7250 2 2 0 1 3645 3762 3763
-7251 2 2 0 1 3642 3754 3634
-7252 2 2 0 1 3643 3640 3647
-7253 2 2 0 1 3695 3753 3658
-7254 2 2 0 1 3675 3665 3674
-7255 2 2 0 1 3644 3656 4227
-7256 2 2 0 1 3697 3645 3646
-7257 2 2 0 1 4207 3679 3639
-7258 2 2 0 1 3645 3725 3702
-7259 2 2 0 1 3793 4274 3641
-7260 2 2 0 1 3673 4274 3793
-7261 2 2 0 1 3647 3679 4207
-7262 2 2 0 1 3647 3640 3679
-7263 2 2 0 1 3648 3727 3796
-7264 2 2 0 1 3655 3669 3670
-7265 2 2 0 1 3682 3727 3648
-7266 2 2 0 1 3682 3669 3655
-7267 2 2 0 1 3684 3652 3787
-7268 2 2 0 1 3681 3649 3650
-7269 2 2 0 1 3652 3649 3787
-7270 2 2 0 1 3687 3721 3651
-7271 2 2 0 1 3721 3687 3739
-7272 2 2 0 1 3652 3776 3664
-7273 2 2 0 1 3727 3685 3653
-7274 2 2 0 1 3654 3685 3655
-7275 2 2 0 1 3663 3654 3655
-7276 2 2 0 1 3670 3663 3655
-7277 2 2 0 1 3774 3656 3644
-7278 2 2 0 1 3656 3774 3773
-7279 2 2 0 1 3654 3657 3683
-7280 2 2 0 1 3676 3658 3671
-7281 2 2 0 1 3707 3666 3767
-7282 2 2 0 1 3670 3689 3663
-7283 2 2 0 1 3659 3660 3686
-7284 2 2 0 1 3660 3659 3693
-7285 2 2 0 1 3767 3661 3707
-7286 2 2 0 1 3661 3767 3650
-7287 2 2 0 1 3661 3706 3707
-7288 2 2 0 1 3662 3656 3773
-7289 2 2 0 1 3662 3654 3663
-7290 2 2 0 1 3667 3767 3666
-7291 2 2 0 1 3777 3664 3776
-7292 2 2 0 1 3675 3769 3665
-7293 2 2 0 1 3695 3705 3686
-7294 2 2 0 1 3741 3729 3679
-7295 2 2 0 1 3666 3668 3667
-7296 2 2 0 1 3668 3762 3667
-7297 2 2 0 1 3680 3639 3679
-7298 2 2 0 1 3680 3678 3597
-7299 2 2 0 1 3768 3681 3650
-7300 2 2 0 1 3681 3768 3719
-7301 2 2 0 1 3697 3696 3645
-7302 2 2 0 1 3696 3725 3645
-7303 2 2 0 1 3706 3701 3664
-7304 2 2 0 1 3701 3652 3664
-7305 2 2 0 1 3741 3698 3669
-7306 2 2 0 1 3698 3670 3669
-7307 2 2 0 1 3761 3677 3671
-7308 2 2 0 1 3672 3762 3645
-7309 2 2 0 1 3702 3672 3645
-7310 2 2 0 1 3792 3674 3673
-7311 2 2 0 1 3793 3792 3673
-7312 2 2 0 1 3674 3792 3675
-7313 2 2 0 1 3677 3676 3671
-7314 2 2 0 1 3666 3676 3677
-7315 2 2 0 1 3680 3729 3678
-7316 2 2 0 1 3679 3729 3680
-7317 2 2 0 1 3692 3691 3805
-7318 2 2 0 1 3606 3680 3597
-7319 2 2 0 1 3606 3639 3680
-7320 2 2 0 1 3653 3755 3727
-7321 2 2 0 1 3683 3685 3654
-7322 2 2 0 1 3683 3653 3685
-7323 2 2 0 1 3719 3788 3681
-7324 2 2 0 1 3682 3728 3669
-7325 2 2 0 1 3648 3728 3682
-7326 2 2 0 1 3717 3683 3657
-7327 2 2 0 1 3684 3776 3652
-7328 2 2 0 1 3684 3731 3776
-7329 2 2 0 1 3682 3685 3727
-7330 2 2 0 1 3682 3655 3685
-7331 2 2 0 1 3662 3657 3654
-7332 2 2 0 1 3773 3657 3662
-7333 2 2 0 1 3659 3705 3664
-7334 2 2 0 1 3659 3686 3705
-7335 2 2 0 1 3687 3688 3703
-7336 2 2 0 1 3687 3651 3688
-7337 2 2 0 1 3662 3689 3656
-7338 2 2 0 1 3663 3689 3662
-7339 2 2 0 1 3690 3689 3670
-7340 2 2 0 1 3777 3659 3664
-7341 2 2 0 1 3693 3659 3777
-7342 2 2 0 1 3677 3668 3666
-7343 2 2 0 1 3961 3720 3735
-7344 2 2 0 1 3760 3625 3778
-7345 2 2 0 1 3693 3691 3660
-7346 2 2 0 1 3660 3691 3692
-7347 2 2 0 1 3693 3809 3691
-7348 2 2 0 1 3725 3700 3702
-7349 2 2 0 1 3597 3678 3694
-7350 2 2 0 1 3666 3707 3676
-7351 2 2 0 1 3676 3695 3658
-7352 2 2 0 1 3753 3695 3686
-7353 2 2 0 1 3618 3696 3155
-7354 2 2 0 1 3696 3618 3725
-7355 2 2 0 1 3696 3697 3155
-7356 2 2 0 1 3690 3670 3698
-7357 2 2 0 1 3640 3698 3741
-7358 2 2 0 1 3643 3698 3640
-7359 2 2 0 1 3698 3643 3704
-7360 2 2 0 1 3704 3690 3698
-7361 2 2 0 1 3644 3699 3774
-7362 2 2 0 1 3678 3729 3732
-7363 2 2 0 1 3700 3703 3702
-7364 2 2 0 1 3652 3701 3649
-7365 2 2 0 1 3701 3650 3649
-7366 2 2 0 1 3703 3672 3702
-7367 2 2 0 1 3672 3667 3762
-7368 2 2 0 1 3672 3703 3688
-7369 2 2 0 1 3767 3667 3688
-7370 2 2 0 1 3672 3688 3667
-7371 2 2 0 1 3690 3704 4227
-7372 2 2 0 1 3656 3689 4227
-7373 2 2 0 1 4227 3689 3690
-7374 2 2 0 1 3705 3706 3664
-7375 2 2 0 1 3705 3707 3706
-7376 2 2 0 1 3705 3695 3676
-7377 2 2 0 1 3676 3707 3705
-7378 2 2 0 1 3731 3765 3708
-7379 2 2 0 1 3661 3701 3706
-7380 2 2 0 1 3661 3650 3701
-7381 2 2 0 1 3784 3709 3748
-7382 2 2 0 1 3710 3711 3713
-7383 2 2 0 1 3746 3711 3748
-7384 2 2 0 1 3756 3784 3748
-7385 2 2 0 1 3712 3710 3713
-7386 2 2 0 1 3781 3710 3712
-7387 2 2 0 1 3775 3745 3717
-7388 2 2 0 1 3736 3745 3713
-7389 2 2 0 1 3714 3721 3739
-7390 2 2 0 1 3714 3738 3808
-7391 2 2 0 1 3723 3749 3808
-7392 2 2 0 1 3771 3746 3748
-7393 2 2 0 1 3747 3736 3713
-7394 2 2 0 1 3715 3730 3684
-7395 2 2 0 1 3787 3715 3684
-7396 2 2 0 1 3716 3683 3717
-7397 2 2 0 1 3718 3788 3719
-7398 2 2 0 1 3788 3718 3786
-7399 2 2 0 1 3722 3718 3719
-7400 2 2 0 1 3720 3734 3735
-7401 2 2 0 1 3803 3786 3755
-7402 2 2 0 1 3754 3740 3739
-7403 2 2 0 1 3750 3721 3749
-7404 2 2 0 1 3775 3737 3712
-7405 2 2 0 1 3784 3766 3709
-7406 2 2 0 1 3722 3751 3796
-7407 2 2 0 1 3723 3751 3749
-7408 2 2 0 1 3770 3760 3758
-7409 2 2 0 1 3760 3770 3799
-7410 2 2 0 1 3723 3797 3751
-7411 2 2 0 1 3797 3796 3751
-7412 2 2 0 1 3724 3728 3648
-7413 2 2 0 1 3636 3744 3725
-7414 2 2 0 1 3744 3700 3725
-7415 2 2 0 1 3744 3636 3634
-7416 2 2 0 1 3726 3796 3727
-7417 2 2 0 1 3755 3726 3727
-7418 2 2 0 1 3728 3742 3669
-7419 2 2 0 1 3729 3742 3732
-7420 2 2 0 1 3742 3728 3732
-7421 2 2 0 1 3743 3687 3703
-7422 2 2 0 1 3700 3743 3703
-7423 2 2 0 1 3687 3743 3739
-7424 2 2 0 1 3730 3764 3684
-7425 2 2 0 1 3764 3731 3684
-7426 2 2 0 1 3733 3694 3678
-7427 2 2 0 1 3732 3733 3678
-7428 2 2 0 1 3734 3900 3735
-7429 2 2 0 1 3791 3900 3734
-7430 2 2 0 1 3716 3745 3736
-7431 2 2 0 1 3717 3745 3716
-7432 2 2 0 1 3734 3720 3737
-7433 2 2 0 1 3755 3653 3803
-7434 2 2 0 1 3811 3812 3785
-7435 2 2 0 1 3714 3740 3738
-7436 2 2 0 1 3714 3739 3740
-7437 2 2 0 1 3742 3741 3669
-7438 2 2 0 1 3729 3741 3742
-7439 2 2 0 1 3743 3754 3739
-7440 2 2 0 1 3700 3754 3743
-7441 2 2 0 1 3754 3744 3634
-7442 2 2 0 1 3754 3700 3744
-7443 2 2 0 1 3712 3745 3775
-7444 2 2 0 1 3712 3713 3745
-7445 2 2 0 1 3747 3711 3746
-7446 2 2 0 1 3713 3711 3747
-7447 2 2 0 1 3771 3709 3730
-7448 2 2 0 1 3748 3709 3771
-7449 2 2 0 1 3756 3711 3710
-7450 2 2 0 1 3748 3711 3756
-7451 2 2 0 1 3766 3812 3765
-7452 2 2 0 1 3771 3802 3746
-7453 2 2 0 1 3781 3757 3710
-7454 2 2 0 1 3714 3749 3721
-7455 2 2 0 1 3714 3808 3749
-7456 2 2 0 1 3781 3737 3720
-7457 2 2 0 1 3781 3712 3737
-7458 2 2 0 1 3750 3751 3722
-7459 2 2 0 1 3750 3749 3751
-7460 2 2 0 1 3660 3752 3686
-7461 2 2 0 1 3752 3660 3692
-7462 2 2 0 1 3753 3686 3752
-7463 2 2 0 1 3740 3642 3615
-7464 2 2 0 1 3642 3740 3754
-7465 2 2 0 1 3738 3740 3615
-7466 2 2 0 1 3786 3726 3755
-7467 2 2 0 1 3718 3726 3786
-7468 2 2 0 1 3796 3726 3722
-7469 2 2 0 1 3718 3722 3726
-7470 2 2 0 1 3779 3757 3922
-7471 2 2 0 1 3756 3710 3757
-7472 2 2 0 1 3733 3630 3694
-7473 2 2 0 1 3733 3732 3758
-7474 2 2 0 1 3693 3759 3809
-7475 2 2 0 1 3760 3778 3758
-7476 2 2 0 1 3799 3625 3760
-7477 2 2 0 1 3723 3808 3799
-7478 2 2 0 1 3668 3761 3763
-7479 2 2 0 1 3677 3761 3668
-7480 2 2 0 1 3762 3668 3763
-7481 2 2 0 1 3716 3653 3683
-7482 2 2 0 1 3747 3746 3802
-7483 2 2 0 1 3764 3730 3709
-7484 2 2 0 1 3764 3765 3731
-7485 2 2 0 1 3764 3766 3765
-7486 2 2 0 1 3764 3709 3766
-7487 2 2 0 1 3721 3750 3651
-7488 2 2 0 1 3750 3719 3651
-7489 2 2 0 1 3719 3750 3722
-7490 2 2 0 1 3767 3768 3650
-7491 2 2 0 1 3767 3688 3768
-7492 2 2 0 1 3768 3651 3719
-7493 2 2 0 1 3768 3688 3651
-7494 2 2 0 1 3812 3708 3765
-7495 2 2 0 1 3665 3769 3699
-7496 2 2 0 1 3699 3769 3774
-7497 2 2 0 1 3732 3724 3758
-7498 2 2 0 1 3724 3732 3728
-7499 2 2 0 1 3758 3724 3770
-7500 2 2 0 1 3771 3730 3715
-7501 2 2 0 1 3772 3715 3787
-7502 2 2 0 1 3772 3802 3715
-7503 2 2 0 1 3771 3715 3802
-7504 2 2 0 1 3773 3774 3789
-7505 2 2 0 1 3789 3774 3769
-7506 2 2 0 1 3791 3734 3794
-7507 2 2 0 1 3737 3775 3794
-7508 2 2 0 1 3734 3737 3794
-7509 2 2 0 1 3777 3776 3731
-7510 2 2 0 1 3731 3708 3777
-7511 2 2 0 1 3759 3693 3777
-7512 2 2 0 1 3708 3759 3777
-7513 2 2 0 1 3630 3758 3778
-7514 2 2 0 1 3630 3733 3758
-7515 2 2 0 1 3780 3757 3779
-7516 2 2 0 1 3757 3780 3756
-7517 2 2 0 1 3812 3801 3785
-7518 2 2 0 1 3801 3812 3766
-7519 2 2 0 1 3922 3782 3961
-7520 2 2 0 1 3781 3782 3757
-7521 2 2 0 1 3782 3922 3757
-7522 2 2 0 1 3716 3790 3653
-7523 2 2 0 1 3649 3783 3787
-7524 2 2 0 1 3783 3649 3681
-7525 2 2 0 1 3795 3769 3675
-7526 2 2 0 1 3798 3775 3717
-7527 2 2 0 1 3813 3802 3772
-7528 2 2 0 1 3800 3780 3779
-7529 2 2 0 1 3780 3784 3756
-7530 2 2 0 1 3801 3800 3785
-7531 2 2 0 1 3784 3801 3766
-7532 2 2 0 1 3782 3720 3961
-7533 2 2 0 1 3781 3720 3782
-7534 2 2 0 1 3813 3786 3803
-7535 2 2 0 1 3783 3772 3787
-7536 2 2 0 1 3788 3783 3681
-7537 2 2 0 1 3795 3789 3769
-7538 2 2 0 1 3798 3789 3795
-7539 2 2 0 1 3795 3794 3775
-7540 2 2 0 1 3775 3798 3795
-7541 2 2 0 1 3747 3790 3736
-7542 2 2 0 1 3736 3790 3716
-7543 2 2 0 1 3802 3790 3747
-7544 2 2 0 1 3791 3792 3793
-7545 2 2 0 1 3792 3795 3675
-7546 2 2 0 1 3791 3794 3792
-7547 2 2 0 1 3792 3794 3795
-7548 2 2 0 1 3796 3797 3648
-7549 2 2 0 1 3797 3724 3648
-7550 2 2 0 1 3770 3724 3797
-7551 2 2 0 1 3717 3657 3789
-7552 2 2 0 1 3789 3798 3717
-7553 2 2 0 1 3789 3657 3773
-7554 2 2 0 1 3797 3723 3799
-7555 2 2 0 1 3797 3799 3770
-7556 2 2 0 1 3809 3977 3807
-7557 2 2 0 1 3780 3800 3801
-7558 2 2 0 1 3784 3780 3801
-7559 2 2 0 1 3738 3615 3620
-7560 2 2 0 1 3790 3803 3653
-7561 2 2 0 1 3803 3802 3813
-7562 2 2 0 1 3803 3790 3802
-7563 2 2 0 1 3799 3804 3625
-7564 2 2 0 1 3804 3799 3808
-7565 2 2 0 1 3804 3620 3625
-7566 2 2 0 1 3805 3806 3323
-7567 2 2 0 1 3806 3807 3323
-7568 2 2 0 1 3804 3738 3620
-7569 2 2 0 1 3808 3738 3804
-7570 2 2 0 1 3810 3977 3809
-7571 2 2 0 1 3977 3810 3980
-7572 2 2 0 1 3759 3810 3809
-7573 2 2 0 1 3807 3806 3809
-7574 2 2 0 1 3806 3691 3809
-7575 2 2 0 1 3691 3806 3805
-7576 2 2 0 1 3980 3810 3811
-7577 2 2 0 1 3810 3812 3811
-7578 2 2 0 1 3708 3810 3759
-7579 2 2 0 1 3812 3810 3708
-7580 2 2 0 1 3813 3772 3783
-7581 2 2 0 1 3786 3813 3788
-7582 2 2 0 1 3788 3813 3783
-7583 2 2 0 1 3815 3816 3814
-7584 2 2 0 1 3815 3846 3816
-7585 2 2 0 1 3905 3863 3822
-7586 2 2 0 1 3900 3641 3951
-7587 2 2 0 1 3817 4049 4046
-7588 2 2 0 1 3641 3818 3951
-7589 2 2 0 1 3930 3821 3306
-7590 2 2 0 1 3821 3930 3869
-7591 2 2 0 1 3819 3908 4032
-7592 2 2 0 1 3820 3863 4369
-7593 2 2 0 1 3837 3361 3421
-7594 2 2 0 1 3843 4387 3836
-7595 2 2 0 1 3874 3873 4349
-7596 2 2 0 1 3321 3306 3821
-7597 2 2 0 1 3816 3822 3814
-7598 2 2 0 1 3821 3842 3817
-7599 2 2 0 1 3641 4274 3818
-7600 2 2 0 1 4274 4398 3818
-7601 2 2 0 1 3820 3814 3822
-7602 2 2 0 1 3822 3863 3820
-7603 2 2 0 1 3920 3895 3968
-7604 2 2 0 1 3823 3862 3849
-7605 2 2 0 1 3968 3895 3851
-7606 2 2 0 1 3851 3823 3849
-7607 2 2 0 1 3854 3947 3840
-7608 2 2 0 1 3848 3832 3824
-7609 2 2 0 1 3840 3947 3824
-7610 2 2 0 1 3883 3898 3939
-7611 2 2 0 1 3904 3898 3883
-7612 2 2 0 1 3840 3835 3954
-7613 2 2 0 1 3895 3931 3825
-7614 2 2 0 1 3825 3855 3823
-7615 2 2 0 1 3834 3823 3855
-7616 2 2 0 1 3834 3862 3823
-7617 2 2 0 1 4349 3873 3942
-7618 2 2 0 1 3942 3873 3949
-7619 2 2 0 1 3855 3852 3826
-7620 2 2 0 1 3841 3361 3877
-7621 2 2 0 1 3937 3860 3827
-7622 2 2 0 1 3862 3834 3828
-7623 2 2 0 1 3918 3829 3830
-7624 2 2 0 1 3831 3830 3829
-7625 2 2 0 1 3833 3937 3827
-7626 2 2 0 1 3833 3832 3937
-7627 2 2 0 1 3827 3875 3833
-7628 2 2 0 1 3856 3949 3873
-7629 2 2 0 1 3834 3855 3856
-7630 2 2 0 1 3868 3860 3937
-7631 2 2 0 1 3835 3956 3954
-7632 2 2 0 1 3836 4387 3941
-7633 2 2 0 1 3918 3876 3837
-7634 2 2 0 1 3822 3845 3905
-7635 2 2 0 1 3860 3868 3857
-7636 2 2 0 1 3857 3868 3869
-7637 2 2 0 1 3838 3822 3816
-7638 2 2 0 1 3859 3838 3839
-7639 2 2 0 1 3832 3848 3938
-7640 2 2 0 1 3847 3938 3848
-7641 2 2 0 1 3821 3861 3321
-7642 2 2 0 1 3817 3861 3821
-7643 2 2 0 1 3835 3867 3875
-7644 2 2 0 1 3840 3867 3835
-7645 2 2 0 1 3905 3849 3865
-7646 2 2 0 1 3862 3865 3849
-7647 2 2 0 1 3844 3929 3841
-7648 2 2 0 1 3821 3869 3871
-7649 2 2 0 1 3821 3871 3842
-7650 2 2 0 1 3843 3966 4398
-7651 2 2 0 1 3966 3818 4398
-7652 2 2 0 1 3843 3836 3966
-7653 2 2 0 1 3877 3844 3841
-7654 2 2 0 1 3877 3860 3844
-7655 2 2 0 1 3838 3859 3845
-7656 2 2 0 1 3845 3822 3838
-7657 2 2 0 1 3978 3979 3399
-7658 2 2 0 1 3839 3838 3846
-7659 2 2 0 1 3846 3838 3816
-7660 2 2 0 1 3895 3901 3931
-7661 2 2 0 1 3855 3825 3852
-7662 2 2 0 1 3825 3931 3852
-7663 2 2 0 1 3886 3847 3848
-7664 2 2 0 1 3849 3850 3851
-7665 2 2 0 1 3968 3851 3850
-7666 2 2 0 1 3826 3852 3853
-7667 2 2 0 1 3954 3854 3840
-7668 2 2 0 1 3854 3954 3955
-7669 2 2 0 1 3851 3895 3825
-7670 2 2 0 1 3823 3851 3825
-7671 2 2 0 1 3856 3855 3826
-7672 2 2 0 1 3856 3826 3949
-7673 2 2 0 1 3830 3835 3876
-7674 2 2 0 1 3876 3918 3830
-7675 2 2 0 1 3898 3897 3870
-7676 2 2 0 1 3939 3898 3870
-7677 2 2 0 1 3873 3828 3856
-7678 2 2 0 1 3834 3856 3828
-7679 2 2 0 1 3872 3862 3828
-7680 2 2 0 1 3956 3835 3830
-7681 2 2 0 1 3956 3830 3831
-7682 2 2 0 1 3860 3857 3844
-7683 2 2 0 1 3890 3961 3735
-7684 2 2 0 1 3926 3927 3858
-7685 2 2 0 1 3831 3829 3979
-7686 2 2 0 1 3829 3399 3979
-7687 2 2 0 1 3979 3925 3831
-7688 2 2 0 1 3906 3817 3842
-7689 2 2 0 1 3859 3839 3924
-7690 2 2 0 1 3827 3860 3877
-7691 2 2 0 1 3877 3361 3837
-7692 2 2 0 1 3837 3421 3918
-7693 2 2 0 1 3319 3321 3861
-7694 2 2 0 1 3861 3817 4046
-7695 2 2 0 1 3861 4046 3319
-7696 2 2 0 1 3862 3872 3865
-7697 2 2 0 1 3905 3865 3863
-7698 2 2 0 1 4369 3863 3865
-7699 2 2 0 1 3865 3864 4369
-7700 2 2 0 1 3864 3865 3872
-7701 2 2 0 1 4349 3942 4386
-7702 2 2 0 1 3859 3866 3845
-7703 2 2 0 1 3842 3897 3906
-7704 2 2 0 1 3824 3867 3840
-7705 2 2 0 1 3824 3832 3867
-7706 2 2 0 1 3897 3842 3871
-7707 2 2 0 1 3868 3871 3869
-7708 2 2 0 1 3897 3871 3870
-7709 2 2 0 1 3937 3870 3868
-7710 2 2 0 1 3870 3871 3868
-7711 2 2 0 1 3872 3874 3864
-7712 2 2 0 1 3828 3873 3874
-7713 2 2 0 1 3874 3872 3828
-7714 2 2 0 1 3875 3876 3835
-7715 2 2 0 1 3827 3876 3875
-7716 2 2 0 1 3877 3837 3876
-7717 2 2 0 1 3827 3877 3876
-7718 2 2 0 1 3955 3940 3933
-7719 2 2 0 1 3833 3875 3867
-7720 2 2 0 1 3832 3833 3867
-7721 2 2 0 1 3878 3880 3911
-7722 2 2 0 1 3910 3881 3884
-7723 2 2 0 1 3911 3910 3913
-7724 2 2 0 1 3879 3911 3880
-7725 2 2 0 1 3909 3884 3881
-7726 2 2 0 1 3916 3909 3881
-7727 2 2 0 1 3952 3853 3882
-7728 2 2 0 1 3882 3885 3884
-7729 2 2 0 1 3883 3915 3904
-7730 2 2 0 1 3915 3928 3902
-7731 2 2 0 1 3892 3928 3914
-7732 2 2 0 1 3913 3912 3911
-7733 2 2 0 1 3965 3884 3885
-7734 2 2 0 1 3946 3854 3945
-7735 2 2 0 1 3854 3946 3947
-7736 2 2 0 1 3853 3852 3932
-7737 2 2 0 1 3847 3886 3888
-7738 2 2 0 1 3886 3887 3888
-7739 2 2 0 1 3888 3921 3847
-7740 2 2 0 1 3735 3889 3890
-7741 2 2 0 1 3973 3901 3887
-7742 2 2 0 1 3903 3908 3904
-7743 2 2 0 1 3936 3914 3883
-7744 2 2 0 1 3952 3909 3891
-7745 2 2 0 1 3935 3880 3878
-7746 2 2 0 1 3917 3921 3920
-7747 2 2 0 1 3892 3914 3917
-7748 2 2 0 1 3944 3926 3893
-7749 2 2 0 1 3893 3926 3974
-7750 2 2 0 1 3917 3967 3892
-7751 2 2 0 1 3917 3920 3967
-7752 2 2 0 1 3943 3968 3850
-7753 2 2 0 1 3817 3894 4049
-7754 2 2 0 1 3906 3894 3817
-7755 2 2 0 1 3819 4049 3894
-7756 2 2 0 1 3895 3920 3919
-7757 2 2 0 1 3895 3919 3901
-7758 2 2 0 1 3849 3896 3850
-7759 2 2 0 1 3896 3845 3866
-7760 2 2 0 1 3866 3850 3896
-7761 2 2 0 1 3907 3897 3898
-7762 2 2 0 1 3907 3906 3897
-7763 2 2 0 1 3898 3904 3907
-7764 2 2 0 1 3945 3854 3934
-7765 2 2 0 1 3934 3854 3955
-7766 2 2 0 1 3899 3859 3924
-7767 2 2 0 1 3859 3899 3866
-7768 2 2 0 1 3889 3735 3900
-7769 2 2 0 1 3951 3889 3900
-7770 2 2 0 1 3885 3882 3932
-7771 2 2 0 1 3853 3932 3882
-7772 2 2 0 1 3889 3891 3890
-7773 2 2 0 1 3901 3973 3931
-7774 2 2 0 1 3785 3983 3811
-7775 2 2 0 1 3902 3903 3915
-7776 2 2 0 1 3915 3903 3904
-7777 2 2 0 1 3905 3896 3849
-7778 2 2 0 1 3905 3845 3896
-7779 2 2 0 1 3907 3904 3908
-7780 2 2 0 1 3906 3907 3908
-7781 2 2 0 1 3819 3894 3908
-7782 2 2 0 1 3906 3908 3894
-7783 2 2 0 1 3909 3952 3882
-7784 2 2 0 1 3884 3909 3882
-7785 2 2 0 1 3965 3913 3910
-7786 2 2 0 1 3910 3884 3965
-7787 2 2 0 1 3912 3945 3878
-7788 2 2 0 1 3878 3911 3912
-7789 2 2 0 1 3881 3910 3879
-7790 2 2 0 1 3879 3910 3911
-7791 2 2 0 1 3935 3933 3983
-7792 2 2 0 1 3948 3912 3913
-7793 2 2 0 1 3916 3881 3923
-7794 2 2 0 1 3914 3915 3883
-7795 2 2 0 1 3928 3915 3914
-7796 2 2 0 1 3891 3916 3890
-7797 2 2 0 1 3909 3916 3891
-7798 2 2 0 1 3921 3917 3936
-7799 2 2 0 1 3917 3914 3936
-7800 2 2 0 1 3829 3918 3419
-7801 2 2 0 1 3419 3399 3829
-7802 2 2 0 1 3918 3421 3419
-7803 2 2 0 1 3903 3971 4032
-7804 2 2 0 1 3908 3903 4032
-7805 2 2 0 1 3903 3902 3971
-7806 2 2 0 1 3887 3901 3919
-7807 2 2 0 1 3888 3887 3919
-7808 2 2 0 1 3920 3921 3919
-7809 2 2 0 1 3919 3921 3888
-7810 2 2 0 1 3922 3923 3779
-7811 2 2 0 1 3923 3881 3879
-7812 2 2 0 1 3924 4050 3899
-7813 2 2 0 1 3944 3866 3899
-7814 2 2 0 1 3925 3981 3831
-7815 2 2 0 1 3926 3944 3927
-7816 2 2 0 1 3926 3858 3974
-7817 2 2 0 1 3892 3974 3928
-7818 2 2 0 1 3930 3929 3857
-7819 2 2 0 1 3857 3929 3844
-7820 2 2 0 1 3857 3869 3930
-7821 2 2 0 1 3931 3932 3852
-7822 2 2 0 1 3965 3948 3913
-7823 2 2 0 1 3945 3934 3878
-7824 2 2 0 1 3955 3933 3934
-7825 2 2 0 1 3934 3933 3935
-7826 2 2 0 1 3934 3935 3878
-7827 2 2 0 1 3939 3936 3883
-7828 2 2 0 1 3847 3936 3939
-7829 2 2 0 1 3921 3936 3847
-7830 2 2 0 1 3938 3937 3832
-7831 2 2 0 1 3937 3938 3870
-7832 2 2 0 1 3939 3938 3847
-7833 2 2 0 1 3938 3939 3870
-7834 2 2 0 1 3940 3983 3933
-7835 2 2 0 1 4386 3941 4387
-7836 2 2 0 1 3941 4386 3942
-7837 2 2 0 1 3943 3866 3944
-7838 2 2 0 1 3850 3866 3943
-7839 2 2 0 1 3943 3944 3893
-7840 2 2 0 1 3945 3912 3946
-7841 2 2 0 1 3947 3946 3962
-7842 2 2 0 1 3962 3946 3948
-7843 2 2 0 1 3946 3912 3948
-7844 2 2 0 1 3942 3949 3950
-7845 2 2 0 1 3950 3941 3942
-7846 2 2 0 1 3889 3951 3953
-7847 2 2 0 1 3891 3953 3952
-7848 2 2 0 1 3889 3953 3891
-7849 2 2 0 1 3954 3956 3955
-7850 2 2 0 1 3955 3956 3940
-7851 2 2 0 1 3831 3981 3956
-7852 2 2 0 1 3940 3956 3981
-7853 2 2 0 1 3944 4050 3927
-7854 2 2 0 1 3899 4050 3944
-7855 2 2 0 1 3779 3923 3969
-7856 2 2 0 1 3923 3879 3969
-7857 2 2 0 1 3983 3785 3957
-7858 2 2 0 1 3957 3935 3983
-7859 2 2 0 1 3958 3922 3961
-7860 2 2 0 1 3958 3916 3923
-7861 2 2 0 1 3923 3922 3958
-7862 2 2 0 1 3932 3931 3972
-7863 2 2 0 1 3824 3947 3963
-7864 2 2 0 1 3848 3824 3963
-7865 2 2 0 1 3836 3941 3959
-7866 2 2 0 1 3964 3853 3952
-7867 2 2 0 1 3962 3948 3960
-7868 2 2 0 1 3969 3800 3779
-7869 2 2 0 1 3969 3879 3880
-7870 2 2 0 1 3957 3785 3800
-7871 2 2 0 1 3880 3935 3957
-7872 2 2 0 1 3890 3958 3961
-7873 2 2 0 1 3890 3916 3958
-7874 2 2 0 1 3887 3960 3973
-7875 2 2 0 1 3962 3963 3947
-7876 2 2 0 1 3848 3963 3886
-7877 2 2 0 1 3950 3959 3941
-7878 2 2 0 1 3959 3950 3964
-7879 2 2 0 1 3953 3959 3952
-7880 2 2 0 1 3964 3952 3959
-7881 2 2 0 1 3972 3965 3885
-7882 2 2 0 1 3885 3932 3972
-7883 2 2 0 1 3965 3972 3948
-7884 2 2 0 1 3818 3966 3951
-7885 2 2 0 1 3959 3966 3836
-7886 2 2 0 1 3966 3953 3951
-7887 2 2 0 1 3953 3966 3959
-7888 2 2 0 1 3967 3920 3968
-7889 2 2 0 1 3967 3968 3943
-7890 2 2 0 1 3943 3893 3967
-7891 2 2 0 1 3950 3826 3853
-7892 2 2 0 1 3950 3853 3964
-7893 2 2 0 1 3826 3950 3949
-7894 2 2 0 1 3892 3967 3974
-7895 2 2 0 1 3967 3893 3974
-7896 2 2 0 1 3807 3977 3925
-7897 2 2 0 1 3969 3957 3800
-7898 2 2 0 1 3880 3957 3969
-7899 2 2 0 1 3902 3970 3971
-7900 2 2 0 1 3973 3972 3931
-7901 2 2 0 1 3948 3973 3960
-7902 2 2 0 1 3973 3948 3972
-7903 2 2 0 1 3858 3975 3974
-7904 2 2 0 1 3974 3975 3928
-7905 2 2 0 1 3975 3858 3970
-7906 2 2 0 1 3978 3323 3976
-7907 2 2 0 1 3976 3323 3807
-7908 2 2 0 1 3902 3975 3970
-7909 2 2 0 1 3975 3902 3928
-7910 2 2 0 1 3982 3925 3977
-7911 2 2 0 1 3982 3977 3980
-7912 2 2 0 1 3981 3925 3982
-7913 2 2 0 1 3976 3807 3925
-7914 2 2 0 1 3925 3979 3976
-7915 2 2 0 1 3978 3976 3979
-7916 2 2 0 1 3982 3980 3811
-7917 2 2 0 1 3983 3982 3811
-7918 2 2 0 1 3981 3982 3940
-7919 2 2 0 1 3983 3940 3982
-7920 2 2 0 1 3963 3962 3960
-7921 2 2 0 1 3887 3886 3960
-7922 2 2 0 1 3963 3960 3886
-7923 2 2 0 1 4001 4021 4487
-7924 2 2 0 1 4005 3984 3985
-7925 2 2 0 1 4076 3985 3984
-7926 2 2 0 1 3986 3990 4489
-7927 2 2 0 1 3986 4072 3990
-7928 2 2 0 1 3988 4002 3999
-7929 2 2 0 1 4002 4003 3999
-7930 2 2 0 1 3987 4039 4028
-7931 2 2 0 1 4028 4039 4029
-7932 2 2 0 1 3999 4036 3988
-7933 2 2 0 1 3984 3987 3989
-7934 2 2 0 1 4487 4489 4000
-7935 2 2 0 1 4000 4489 3990
-7936 2 2 0 1 3989 3987 4028
-7937 2 2 0 1 4008 3991 4007
-7938 2 2 0 1 3991 4008 4012
-7939 2 2 0 1 3992 4074 3993
-7940 2 2 0 1 3992 3993 3994
-7941 2 2 0 1 3992 4036 3999
-7942 2 2 0 1 3994 4036 3992
-7943 2 2 0 1 3994 3993 3997
-7944 2 2 0 1 3994 3997 3995
-7945 2 2 0 1 3995 3996 3994
-7946 2 2 0 1 3995 3997 4059
-7947 2 2 0 1 3995 4059 4006
-7948 2 2 0 1 4006 4013 3995
-7949 2 2 0 1 4016 4009 4030
-7950 2 2 0 1 4067 3998 4063
-7951 2 2 0 1 3992 4004 4074
-7952 2 2 0 1 3992 4003 4004
-7953 2 2 0 1 3999 4003 3992
-7954 2 2 0 1 3984 3989 4076
-7955 2 2 0 1 4000 4001 4487
-7956 2 2 0 1 4000 4002 4001
-7957 2 2 0 1 4000 3990 4003
-7958 2 2 0 1 4002 4000 4003
-7959 2 2 0 1 4072 4004 4003
-7960 2 2 0 1 4003 3990 4072
-7961 2 2 0 1 3987 3984 4005
-7962 2 2 0 1 4006 4059 4007
-7963 2 2 0 1 4006 4007 3991
-7964 2 2 0 1 4012 4008 4062
-7965 2 2 0 1 4012 4062 4009
-7966 2 2 0 1 4076 3989 4067
-7967 2 2 0 1 4067 3989 3998
-7968 2 2 0 1 4010 3987 4005
-7969 2 2 0 1 4013 4020 4054
-7970 2 2 0 1 4019 4016 4025
-7971 2 2 0 1 3998 4030 4011
-7972 2 2 0 1 3998 4011 4063
-7973 2 2 0 1 4009 4011 4030
-7974 2 2 0 1 3991 4012 4018
-7975 2 2 0 1 4020 4018 4019
-7976 2 2 0 1 4013 4006 4014
-7977 2 2 0 1 3991 4014 4006
-7978 2 2 0 1 4013 4014 4020
-7979 2 2 0 1 3988 4015 4024
-7980 2 2 0 1 4016 4019 4017
-7981 2 2 0 1 4017 4012 4009
-7982 2 2 0 1 4009 4016 4017
-7983 2 2 0 1 4023 4001 4002
-7984 2 2 0 1 3839 3846 4035
-7985 2 2 0 1 4025 4040 4019
-7986 2 2 0 1 4043 4040 4025
-7987 2 2 0 1 4017 4019 4018
-7988 2 2 0 1 4012 4017 4018
-7989 2 2 0 1 4063 4011 4062
-7990 2 2 0 1 4009 4062 4011
-7991 2 2 0 1 4020 4019 4040
-7992 2 2 0 1 4020 4040 4054
-7993 2 2 0 1 4014 3991 4018
-7994 2 2 0 1 4018 4020 4014
-7995 2 2 0 1 4460 4021 4022
-7996 2 2 0 1 4001 4022 4021
-7997 2 2 0 1 4022 4001 4023
-7998 2 2 0 1 3819 4032 4031
-7999 2 2 0 1 3839 4024 3924
-8000 2 2 0 1 4024 3839 4035
-8001 2 2 0 1 4027 4030 4029
-8002 2 2 0 1 4016 4030 4027
-8003 2 2 0 1 4027 4025 4016
-8004 2 2 0 1 4029 4026 4027
-8005 2 2 0 1 4026 4031 4027
-8006 2 2 0 1 4030 4028 4029
-8007 2 2 0 1 4030 3998 4028
-8008 2 2 0 1 3998 3989 4028
-8009 2 2 0 1 3996 4036 3994
-8010 2 2 0 1 4015 3988 4036
-8011 2 2 0 1 4031 4032 4042
-8012 2 2 0 1 4033 3996 3995
-8013 2 2 0 1 4033 3995 4013
-8014 2 2 0 1 4034 3846 3815
-8015 2 2 0 1 4460 4034 3815
-8016 2 2 0 1 3971 4042 4032
-8017 2 2 0 1 3846 4034 4035
-8018 2 2 0 1 4022 4034 4460
-8019 2 2 0 1 4022 4023 4035
-8020 2 2 0 1 4022 4035 4034
-8021 2 2 0 1 4043 4025 4042
-8022 2 2 0 1 4025 4027 4042
-8023 2 2 0 1 4027 4031 4042
-8024 2 2 0 1 4002 3988 4023
-8025 2 2 0 1 4023 3988 4024
-8026 2 2 0 1 4035 4023 4024
-8027 2 2 0 1 4036 3996 4037
-8028 2 2 0 1 4015 4037 4057
-8029 2 2 0 1 4036 4037 4015
-8030 2 2 0 1 3996 4057 4037
-8031 2 2 0 1 4010 4038 3987
-8032 2 2 0 1 4038 4010 3526
-8033 2 2 0 1 3987 4038 4039
-8034 2 2 0 1 4044 4040 4043
-8035 2 2 0 1 4054 4040 4044
-8036 2 2 0 1 3971 3970 4041
-8037 2 2 0 1 3924 4024 4051
-8038 2 2 0 1 4051 4024 4015
-8039 2 2 0 1 3971 4041 4042
-8040 2 2 0 1 4043 4042 4041
-8041 2 2 0 1 4041 4044 4043
-8042 2 2 0 1 3319 4046 3524
-8043 2 2 0 1 3858 4045 3970
-8044 2 2 0 1 4045 4044 4041
-8045 2 2 0 1 4041 3970 4045
-8046 2 2 0 1 3924 4051 4050
-8047 2 2 0 1 4015 4057 4051
-8048 2 2 0 1 4046 4047 3524
-8049 2 2 0 1 4055 4045 4048
-8050 2 2 0 1 4046 4049 4053
-8051 2 2 0 1 4047 4046 4053
-8052 2 2 0 1 3858 3927 4048
-8053 2 2 0 1 4048 4045 3858
-8054 2 2 0 1 4047 3526 3524
-8055 2 2 0 1 3526 4047 4038
-8056 2 2 0 1 4048 4057 4055
-8057 2 2 0 1 4048 4051 4057
-8058 2 2 0 1 4050 4048 3927
-8059 2 2 0 1 4050 4051 4048
-8060 2 2 0 1 4052 4029 4039
-8061 2 2 0 1 4039 4038 4052
-8062 2 2 0 1 4026 4029 4052
-8063 2 2 0 1 4038 4047 4052
-8064 2 2 0 1 4047 4053 4052
-8065 2 2 0 1 4044 4055 4054
-8066 2 2 0 1 4044 4045 4055
-8067 2 2 0 1 4056 4049 3819
-8068 2 2 0 1 4026 4052 4056
-8069 2 2 0 1 4031 4056 3819
-8070 2 2 0 1 4031 4026 4056
-8071 2 2 0 1 4056 4053 4049
-8072 2 2 0 1 4052 4053 4056
-8073 2 2 0 1 4054 4033 4013
-8074 2 2 0 1 3996 4033 4057
-8075 2 2 0 1 4055 4057 4033
-8076 2 2 0 1 4033 4054 4055
-8077 2 2 0 1 760 733 4073
-8078 2 2 0 1 4073 733 4058
-8079 2 2 0 1 3993 4074 4073
-8080 2 2 0 1 4058 3993 4073
-8081 2 2 0 1 4058 733 737
-8082 2 2 0 1 4058 737 4060
-8083 2 2 0 1 3997 3993 4058
-8084 2 2 0 1 4060 3997 4058
-8085 2 2 0 1 4060 737 741
-8086 2 2 0 1 4060 741 4061
-8087 2 2 0 1 4059 3997 4060
-8088 2 2 0 1 4061 4059 4060
-8089 2 2 0 1 4069 748 744
-8090 2 2 0 1 4008 4007 4069
-8091 2 2 0 1 750 4064 744
-8092 2 2 0 1 4062 4008 4064
-8093 2 2 0 1 4069 4064 4008
-8094 2 2 0 1 744 4064 4069
-8095 2 2 0 1 4061 741 748
-8096 2 2 0 1 4007 4059 4061
-8097 2 2 0 1 4064 750 751
-8098 2 2 0 1 4064 751 4066
-8099 2 2 0 1 4063 4062 4064
-8100 2 2 0 1 4066 4063 4064
-8101 2 2 0 1 4066 751 4065
-8102 2 2 0 1 4066 4065 4068
-8103 2 2 0 1 4067 4063 4066
-8104 2 2 0 1 4068 4067 4066
-8105 2 2 0 1 754 4068 4065
-8106 2 2 0 1 4076 4067 4068
-8107 2 2 0 1 4061 748 4069
-8108 2 2 0 1 4069 4007 4061
-8109 2 2 0 1 754 4070 4068
-8110 2 2 0 1 4076 4068 4070
-8111 2 2 0 1 754 757 4070
-8112 2 2 0 1 4071 4070 757
-8113 2 2 0 1 763 4077 767
-8114 2 2 0 1 4077 4004 4072
-8115 2 2 0 1 4073 4075 760
-8116 2 2 0 1 4074 4075 4073
-8117 2 2 0 1 763 760 4075
-8118 2 2 0 1 4075 4077 763
-8119 2 2 0 1 4074 4004 4075
-8120 2 2 0 1 4075 4004 4077
-8121 2 2 0 1 3985 4070 4071
-8122 2 2 0 1 3985 4076 4070
-8123 2 2 0 1 767 4505 765
-8124 2 2 0 1 4505 4072 3986
-8125 2 2 0 1 4505 767 4077
-8126 2 2 0 1 4072 4505 4077
-8127 2 2 0 1 4078 2038 2037
-8128 2 2 0 1 4079 2038 4078
-8129 2 2 0 1 4078 3570 4081
-8130 2 2 0 1 4081 4079 4078
-8131 2 2 0 1 4079 4080 2038
-8132 2 2 0 1 4083 4080 4079
-8133 2 2 0 1 4079 4081 4082
-8134 2 2 0 1 4082 4083 4079
-8135 2 2 0 1 4083 4089 4080
-8136 2 2 0 1 4085 4089 4083
-8137 2 2 0 1 4083 4082 4084
-8138 2 2 0 1 4084 4085 4083
-8139 2 2 0 1 4086 4088 4098
-8140 2 2 0 1 4086 4090 3569
-8141 2 2 0 1 4087 4091 4088
-8142 2 2 0 1 4087 3569 3580
-8143 2 2 0 1 4086 3569 4087
-8144 2 2 0 1 4088 4086 4087
-8145 2 2 0 1 4085 4098 4089
-8146 2 2 0 1 4085 4084 4090
-8147 2 2 0 1 4087 4092 4091
-8148 2 2 0 1 4093 4092 4087
-8149 2 2 0 1 4087 3580 4094
-8150 2 2 0 1 4094 4093 4087
-8151 2 2 0 1 4093 4096 4092
-8152 2 2 0 1 4095 4096 4093
-8153 2 2 0 1 4093 4094 4097
-8154 2 2 0 1 4097 4095 4093
-8155 2 2 0 1 4095 4099 4096
-8156 2 2 0 1 4095 4097 3575
-8157 2 2 0 1 4086 4098 4085
-8158 2 2 0 1 4090 4086 4085
-8159 2 2 0 1 4104 4099 4095
-8160 2 2 0 1 3575 4104 4095
-8161 2 2 0 1 4099 4104 4100
-8162 2 2 0 1 4104 3067 4100
-8163 2 2 0 1 4103 4101 4108
-8164 2 2 0 1 4109 3574 4103
-8165 2 2 0 1 4102 4078 2037
-8166 2 2 0 1 4078 4102 3570
-8167 2 2 0 1 4101 4102 2037
-8168 2 2 0 1 4101 4103 4102
-8169 2 2 0 1 4102 3574 3570
-8170 2 2 0 1 4103 3574 4102
-8171 2 2 0 1 3067 4104 4105
-8172 2 2 0 1 4104 3575 4105
-8173 2 2 0 1 4126 4108 4106
-8174 2 2 0 1 4109 4126 4107
-8175 2 2 0 1 4126 4103 4108
-8176 2 2 0 1 4109 4103 4126
-8177 2 2 0 1 2257 4116 2255
-8178 2 2 0 1 4111 4116 4110
-8179 2 2 0 1 2247 4118 2257
-8180 2 2 0 1 4110 4118 4161
-8181 2 2 0 1 2248 4119 2247
-8182 2 2 0 1 4161 4119 4120
-8183 2 2 0 1 2262 4121 2248
-8184 2 2 0 1 4120 4121 4123
-8185 2 2 0 1 2255 4117 2250
-8186 2 2 0 1 4135 4117 4111
-8187 2 2 0 1 2250 4112 2253
-8188 2 2 0 1 2250 4117 4112
-8189 2 2 0 1 4115 4112 4135
-8190 2 2 0 1 4117 4135 4112
-8191 2 2 0 1 2253 4113 2265
-8192 2 2 0 1 2253 4112 4113
-8193 2 2 0 1 4114 4113 4115
-8194 2 2 0 1 4112 4115 4113
-8195 2 2 0 1 4116 4117 2255
-8196 2 2 0 1 4116 4111 4117
-8197 2 2 0 1 4118 4116 2257
-8198 2 2 0 1 4110 4116 4118
-8199 2 2 0 1 4119 4118 2247
-8200 2 2 0 1 4161 4118 4119
-8201 2 2 0 1 4121 4119 2248
-8202 2 2 0 1 4120 4119 4121
-8203 2 2 0 1 4121 4122 4123
-8204 2 2 0 1 4860 4122 4859
-8205 2 2 0 1 4122 4823 4123
-8206 2 2 0 1 4860 4823 4122
-8207 2 2 0 1 4122 2262 4859
-8208 2 2 0 1 4121 2262 4122
-8209 2 2 0 1 2264 2265 4125
-8210 2 2 0 1 4114 4125 4113
-8211 2 2 0 1 4125 4114 4124
-8212 2 2 0 1 2265 4113 4125
-8213 2 2 0 1 2264 4126 4106
-8214 2 2 0 1 4107 4126 4124
-8215 2 2 0 1 4125 4126 2264
-8216 2 2 0 1 4125 4124 4126
-8217 2 2 0 1 4129 4127 4140
-8218 2 2 0 1 4176 4123 4823
-8219 2 2 0 1 4815 4176 4823
-8220 2 2 0 1 4107 4124 4128
-8221 2 2 0 1 4169 4136 4160
-8222 2 2 0 1 4181 4128 4124
-8223 2 2 0 1 4132 4154 4152
-8224 2 2 0 1 4139 4129 4140
-8225 2 2 0 1 4152 4131 4132
-8226 2 2 0 1 4138 4131 4130
-8227 2 2 0 1 4131 4138 4132
-8228 2 2 0 1 4168 4136 4169
-8229 2 2 0 1 4144 4167 4136
-8230 2 2 0 1 4179 4149 4180
-8231 2 2 0 1 4142 4110 4161
-8232 2 2 0 1 4133 4142 4154
-8233 2 2 0 1 4134 4167 4158
-8234 2 2 0 1 4144 4115 4135
-8235 2 2 0 1 4136 4168 4144
-8236 2 2 0 1 4175 4137 4165
-8237 2 2 0 1 4147 4163 4293
-8238 2 2 0 1 4163 4132 4138
-8239 2 2 0 1 4293 4139 4284
-8240 2 2 0 1 4293 4163 4139
-8241 2 2 0 1 4129 4139 4138
-8242 2 2 0 1 4163 4138 4139
-8243 2 2 0 1 4138 4130 4129
-8244 2 2 0 1 4284 4140 4819
-8245 2 2 0 1 4284 4139 4140
-8246 2 2 0 1 4248 4143 4148
-8247 2 2 0 1 4157 4155 4143
-8248 2 2 0 1 4142 4141 4110
-8249 2 2 0 1 4141 4142 4133
-8250 2 2 0 1 4248 4162 4143
-8251 2 2 0 1 4160 4174 4169
-8252 2 2 0 1 4145 4144 4135
-8253 2 2 0 1 4144 4145 4167
-8254 2 2 0 1 4133 4156 4157
-8255 2 2 0 1 4156 4133 4154
-8256 2 2 0 1 4156 4155 4157
-8257 2 2 0 1 4146 4147 4148
-8258 2 2 0 1 4149 4166 4150
-8259 2 2 0 1 4166 4165 4150
-8260 2 2 0 1 4151 4160 4136
-8261 2 2 0 1 4167 4151 4136
-8262 2 2 0 1 4132 4164 4154
-8263 2 2 0 1 4153 4152 4154
-8264 2 2 0 1 4142 4153 4154
-8265 2 2 0 1 4143 4146 4148
-8266 2 2 0 1 4143 4155 4146
-8267 2 2 0 1 4164 4156 4154
-8268 2 2 0 1 4155 4156 4164
-8269 2 2 0 1 4158 4157 4134
-8270 2 2 0 1 4158 4133 4157
-8271 2 2 0 1 4141 4111 4110
-8272 2 2 0 1 4111 4145 4135
-8273 2 2 0 1 4158 4167 4145
-8274 2 2 0 1 4157 4162 4134
-8275 2 2 0 1 4157 4143 4162
-8276 2 2 0 1 4159 4174 4160
-8277 2 2 0 1 4146 4163 4147
-8278 2 2 0 1 4153 4161 4120
-8279 2 2 0 1 4161 4153 4142
-8280 2 2 0 1 4277 4162 4248
-8281 2 2 0 1 4159 4277 4171
-8282 2 2 0 1 4277 4159 4162
-8283 2 2 0 1 4146 4155 4164
-8284 2 2 0 1 4163 4164 4132
-8285 2 2 0 1 4164 4163 4146
-8286 2 2 0 1 4175 4174 4137
-8287 2 2 0 1 4165 4166 4175
-8288 2 2 0 1 4166 4179 4175
-8289 2 2 0 1 4179 4166 4149
-8290 2 2 0 1 4151 4159 4160
-8291 2 2 0 1 4134 4151 4167
-8292 2 2 0 1 4151 4134 4162
-8293 2 2 0 1 4162 4159 4151
-8294 2 2 0 1 4170 4168 4169
-8295 2 2 0 1 4170 4181 4168
-8296 2 2 0 1 4127 4130 4806
-8297 2 2 0 1 4127 4129 4130
-8298 2 2 0 1 4174 4171 4137
-8299 2 2 0 1 4159 4171 4174
-8300 2 2 0 1 4172 4815 4806
-8301 2 2 0 1 4130 4172 4806
-8302 2 2 0 1 4173 4179 4170
-8303 2 2 0 1 4169 4173 4170
-8304 2 2 0 1 4179 4173 4175
-8305 2 2 0 1 4174 4173 4169
-8306 2 2 0 1 4174 4175 4173
-8307 2 2 0 1 4172 4176 4815
-8308 2 2 0 1 4114 4181 4124
-8309 2 2 0 1 4114 4168 4181
-8310 2 2 0 1 4111 4141 4145
-8311 2 2 0 1 4133 4158 4141
-8312 2 2 0 1 4158 4145 4141
-8313 2 2 0 1 4123 4177 4120
-8314 2 2 0 1 4176 4177 4123
-8315 2 2 0 1 4177 4153 4120
-8316 2 2 0 1 4152 4153 4177
-8317 2 2 0 1 4168 4115 4144
-8318 2 2 0 1 4115 4168 4114
-8319 2 2 0 1 4176 4172 4177
-8320 2 2 0 1 4131 4172 4130
-8321 2 2 0 1 4172 4131 4152
-8322 2 2 0 1 4152 4177 4172
-8323 2 2 0 1 4178 4170 4179
-8324 2 2 0 1 4180 3561 4178
-8325 2 2 0 1 4179 4180 4178
-8326 2 2 0 1 4178 3561 4128
-8327 2 2 0 1 4181 4178 4128
-8328 2 2 0 1 4178 4181 4170
-8329 2 2 0 1 4290 4198 4784
-8330 2 2 0 1 4198 4290 4199
-8331 2 2 0 1 4203 4182 4237
-8332 2 2 0 1 4183 4243 4258
-8333 2 2 0 1 4294 4148 4147
-8334 2 2 0 1 4199 4290 4184
-8335 2 2 0 1 4203 4294 4182
-8336 2 2 0 1 4183 4185 4243
-8337 2 2 0 1 4186 4239 4249
-8338 2 2 0 1 4187 4231 4285
-8339 2 2 0 1 4732 4261 4737
-8340 2 2 0 1 4222 4266 4255
-8341 2 2 0 1 4233 4211 4190
-8342 2 2 0 1 4301 4195 4184
-8343 2 2 0 1 4195 4301 4201
-8344 2 2 0 1 4218 4206 4216
-8345 2 2 0 1 4213 4188 4190
-8346 2 2 0 1 4213 4197 4193
-8347 2 2 0 1 4188 4189 4218
-8348 2 2 0 1 4236 4234 4252
-8349 2 2 0 1 4188 4208 4190
-8350 2 2 0 1 4209 4208 4216
-8351 2 2 0 1 4192 4259 4220
-8352 2 2 0 1 4221 4222 4255
-8353 2 2 0 1 4239 4221 4255
-8354 2 2 0 1 4223 4222 4224
-8355 2 2 0 1 4222 4238 4266
-8356 2 2 0 1 4229 4320 4191
-8357 2 2 0 1 4215 4209 4216
-8358 2 2 0 1 4279 4214 4193
-8359 2 2 0 1 4225 4195 4201
-8360 2 2 0 1 4195 4225 4224
-8361 2 2 0 1 4219 4192 4220
-8362 2 2 0 1 4205 4279 4193
-8363 2 2 0 1 4279 4205 4258
-8364 2 2 0 1 4210 4280 4230
-8365 2 2 0 1 4210 4192 4201
-8366 2 2 0 1 4240 4252 4235
-8367 2 2 0 1 4211 4194 4190
-8368 2 2 0 1 4195 4196 4184
-8369 2 2 0 1 4196 4199 4184
-8370 2 2 0 1 4272 4271 4242
-8371 2 2 0 1 4197 4212 4193
-8372 2 2 0 1 4204 4212 4220
-8373 2 2 0 1 4200 4186 4198
-8374 2 2 0 1 4200 4199 4239
-8375 2 2 0 1 4199 4200 4198
-8376 2 2 0 1 4186 4200 4239
-8377 2 2 0 1 4232 4264 4237
-8378 2 2 0 1 4206 4217 4216
-8379 2 2 0 1 4192 4247 4201
-8380 2 2 0 1 4270 4206 3643
-8381 2 2 0 1 4209 4226 4235
-8382 2 2 0 1 4226 4209 4215
-8383 2 2 0 1 4377 4257 4191
-8384 2 2 0 1 4202 4294 4203
-8385 2 2 0 1 4183 4205 4204
-8386 2 2 0 1 4183 4258 4205
-8387 2 2 0 1 4217 4206 4270
-8388 2 2 0 1 4182 4232 4237
-8389 2 2 0 1 4182 4282 4232
-8390 2 2 0 1 4257 4229 4191
-8391 2 2 0 1 4288 3647 4207
-8392 2 2 0 1 4213 4194 4197
-8393 2 2 0 1 4213 4190 4194
-8394 2 2 0 1 4233 4208 4209
-8395 2 2 0 1 4233 4190 4208
-8396 2 2 0 1 4210 4259 4192
-8397 2 2 0 1 4230 4259 4210
-8398 2 2 0 1 4238 4244 4234
-8399 2 2 0 1 4225 4247 4246
-8400 2 2 0 1 4225 4201 4247
-8401 2 2 0 1 4210 4301 4280
-8402 2 2 0 1 4201 4301 4210
-8403 2 2 0 1 4233 4244 4211
-8404 2 2 0 1 4205 4212 4204
-8405 2 2 0 1 4205 4193 4212
-8406 2 2 0 1 4213 4214 4188
-8407 2 2 0 1 4213 4193 4214
-8408 2 2 0 1 4215 4216 4217
-8409 2 2 0 1 4218 4208 4188
-8410 2 2 0 1 4218 4216 4208
-8411 2 2 0 1 4219 4212 4197
-8412 2 2 0 1 4219 4220 4212
-8413 2 2 0 1 4221 4224 4222
-8414 2 2 0 1 4240 4226 4242
-8415 2 2 0 1 4240 4235 4226
-8416 2 2 0 1 4223 4225 4246
-8417 2 2 0 1 4223 4224 4225
-8418 2 2 0 1 4219 4247 4192
-8419 2 2 0 1 4226 4268 4242
-8420 2 2 0 1 4215 4268 4226
-8421 2 2 0 1 4302 4280 4301
-8422 2 2 0 1 4245 4737 4261
-8423 2 2 0 1 4263 4185 4183
-8424 2 2 0 1 4189 3644 4227
-8425 2 2 0 1 4188 4214 4189
-8426 2 2 0 1 4320 4228 4413
-8427 2 2 0 1 4229 4228 4320
-8428 2 2 0 1 4280 4228 4230
-8429 2 2 0 1 4229 4230 4228
-8430 2 2 0 1 4204 4263 4183
-8431 2 2 0 1 4148 4294 4202
-8432 2 2 0 1 4231 4232 4282
-8433 2 2 0 1 4232 4231 4245
-8434 2 2 0 1 4264 4232 4245
-8435 2 2 0 1 4233 4209 4235
-8436 2 2 0 1 4234 4235 4252
-8437 2 2 0 1 4234 4244 4235
-8438 2 2 0 1 4233 4235 4244
-8439 2 2 0 1 4264 4236 4237
-8440 2 2 0 1 4236 4264 4266
-8441 2 2 0 1 4236 4238 4234
-8442 2 2 0 1 4236 4266 4238
-8443 2 2 0 1 4195 4224 4196
-8444 2 2 0 1 4196 4239 4199
-8445 2 2 0 1 4221 4239 4196
-8446 2 2 0 1 4221 4196 4224
-8447 2 2 0 1 4252 4240 4241
-8448 2 2 0 1 4271 4241 4242
-8449 2 2 0 1 4202 4241 4271
-8450 2 2 0 1 4203 4241 4202
-8451 2 2 0 1 4240 4242 4241
-8452 2 2 0 1 3665 4253 3674
-8453 2 2 0 1 4243 4253 4258
-8454 2 2 0 1 4211 4223 4246
-8455 2 2 0 1 4211 4244 4223
-8456 2 2 0 1 4238 4222 4223
-8457 2 2 0 1 4238 4223 4244
-8458 2 2 0 1 4217 4270 4269
-8459 2 2 0 1 4187 4245 4231
-8460 2 2 0 1 4737 4245 4187
-8461 2 2 0 1 3643 4206 3704
-8462 2 2 0 1 4219 4197 4194
-8463 2 2 0 1 4246 4194 4211
-8464 2 2 0 1 4246 4247 4194
-8465 2 2 0 1 4219 4194 4247
-8466 2 2 0 1 4202 4248 4148
-8467 2 2 0 1 4263 4256 4185
-8468 2 2 0 1 4273 4256 4377
-8469 2 2 0 1 4260 4249 4239
-8470 2 2 0 1 4255 4260 4239
-8471 2 2 0 1 4250 3704 4206
-8472 2 2 0 1 4218 4250 4206
-8473 2 2 0 1 4189 4278 3644
-8474 2 2 0 1 4278 4189 4214
-8475 2 2 0 1 4251 4236 4252
-8476 2 2 0 1 4241 4251 4252
-8477 2 2 0 1 4236 4251 4237
-8478 2 2 0 1 4253 4254 4258
-8479 2 2 0 1 4254 4253 3665
-8480 2 2 0 1 4265 4261 4255
-8481 2 2 0 1 4266 4265 4255
-8482 2 2 0 1 4251 4203 4237
-8483 2 2 0 1 4241 4203 4251
-8484 2 2 0 1 4256 4257 4377
-8485 2 2 0 1 4263 4257 4256
-8486 2 2 0 1 3699 4254 3665
-8487 2 2 0 1 4254 4279 4258
-8488 2 2 0 1 4278 3699 3644
-8489 2 2 0 1 4220 4262 4204
-8490 2 2 0 1 4262 4220 4259
-8491 2 2 0 1 4262 4263 4204
-8492 2 2 0 1 4250 4227 3704
-8493 2 2 0 1 4227 4250 4189
-8494 2 2 0 1 4250 4218 4189
-8495 2 2 0 1 4260 4732 4249
-8496 2 2 0 1 4732 4260 4261
-8497 2 2 0 1 4260 4255 4261
-8498 2 2 0 1 4262 4259 4230
-8499 2 2 0 1 4229 4262 4230
-8500 2 2 0 1 4262 4229 4257
-8501 2 2 0 1 4262 4257 4263
-8502 2 2 0 1 4264 4265 4266
-8503 2 2 0 1 4265 4264 4245
-8504 2 2 0 1 4261 4265 4245
-8505 2 2 0 1 4267 3673 3674
-8506 2 2 0 1 4267 4243 4185
-8507 2 2 0 1 4253 4243 4267
-8508 2 2 0 1 4253 4267 3674
-8509 2 2 0 1 4215 4217 4268
-8510 2 2 0 1 4268 4269 4283
-8511 2 2 0 1 4268 4217 4269
-8512 2 2 0 1 4270 3643 3647
-8513 2 2 0 1 4270 3647 4288
-8514 2 2 0 1 4269 4270 4288
-8515 2 2 0 1 4272 4277 4248
-8516 2 2 0 1 4271 4272 4248
-8517 2 2 0 1 4271 4248 4202
-8518 2 2 0 1 4165 4207 4150
-8519 2 2 0 1 4288 4207 4165
-8520 2 2 0 1 4275 4273 4406
-8521 2 2 0 1 4275 4267 4185
-8522 2 2 0 1 3673 4276 4274
-8523 2 2 0 1 4276 4406 4274
-8524 2 2 0 1 4276 3673 4267
-8525 2 2 0 1 4275 4256 4273
-8526 2 2 0 1 4185 4256 4275
-8527 2 2 0 1 4276 4275 4406
-8528 2 2 0 1 4267 4275 4276
-8529 2 2 0 1 4171 4277 4272
-8530 2 2 0 1 3699 4278 4254
-8531 2 2 0 1 4278 4214 4279
-8532 2 2 0 1 4278 4279 4254
-8533 2 2 0 1 4281 4413 4228
-8534 2 2 0 1 4281 4280 4302
-8535 2 2 0 1 4228 4280 4281
-8536 2 2 0 1 4281 4297 4413
-8537 2 2 0 1 4281 4302 4297
-8538 2 2 0 1 4282 4293 4284
-8539 2 2 0 1 4171 4272 4283
-8540 2 2 0 1 4284 4286 4282
-8541 2 2 0 1 4286 4231 4282
-8542 2 2 0 1 4286 4284 4819
-8543 2 2 0 1 4285 4286 4819
-8544 2 2 0 1 4286 4285 4231
-8545 2 2 0 1 4287 4289 4784
-8546 2 2 0 1 4289 4290 4784
-8547 2 2 0 1 4137 4295 4165
-8548 2 2 0 1 4295 4288 4165
-8549 2 2 0 1 4299 4184 4290
-8550 2 2 0 1 4289 4299 4290
-8551 2 2 0 1 4269 4295 4283
-8552 2 2 0 1 4295 4269 4288
-8553 2 2 0 1 4242 4291 4272
-8554 2 2 0 1 4283 4291 4268
-8555 2 2 0 1 4291 4283 4272
-8556 2 2 0 1 4291 4242 4268
-8557 2 2 0 1 4292 4293 4282
-8558 2 2 0 1 4182 4292 4282
-8559 2 2 0 1 4293 4292 4147
-8560 2 2 0 1 4292 4294 4147
-8561 2 2 0 1 4182 4294 4292
-8562 2 2 0 1 4283 4137 4171
-8563 2 2 0 1 4137 4283 4295
-8564 2 2 0 1 4289 4298 4299
-8565 2 2 0 1 4296 4428 4297
-8566 2 2 0 1 4302 4296 4297
-8567 2 2 0 1 4298 4303 4428
-8568 2 2 0 1 4428 4296 4298
-8569 2 2 0 1 4296 4299 4298
-8570 2 2 0 1 4299 4296 4302
-8571 2 2 0 1 4300 4301 4184
-8572 2 2 0 1 4300 4299 4302
-8573 2 2 0 1 4299 4300 4184
-8574 2 2 0 1 4301 4300 4302
-8575 2 2 0 1 4303 4305 4304
-8576 2 2 0 1 4287 4305 4289
-8577 2 2 0 1 4305 4287 4304
-8578 2 2 0 1 4298 4305 4303
-8579 2 2 0 1 4298 4289 4305
-8580 2 2 0 1 4307 4306 4419
-8581 2 2 0 1 4311 4306 4307
-8582 2 2 0 1 4308 4312 4384
-8583 2 2 0 1 4309 4310 4331
-8584 2 2 0 1 4353 4354 4459
-8585 2 2 0 1 4306 4311 4317
-8586 2 2 0 1 4312 4308 4354
-8587 2 2 0 1 4407 4310 4309
-8588 2 2 0 1 4392 4379 4313
-8589 2 2 0 1 4314 4418 4355
-8590 2 2 0 1 4397 4393 4348
-8591 2 2 0 1 4319 4315 4316
-8592 2 2 0 1 4327 4373 4359
-8593 2 2 0 1 4432 4317 4318
-8594 2 2 0 1 4324 4432 4318
-8595 2 2 0 1 4370 4339 4321
-8596 2 2 0 1 4340 4338 4327
-8597 2 2 0 1 4322 4372 4338
-8598 2 2 0 1 4339 4390 4340
-8599 2 2 0 1 4380 4364 4334
-8600 2 2 0 1 4340 4327 4341
-8601 2 2 0 1 4321 4341 4332
-8602 2 2 0 1 4329 4342 4394
-8603 2 2 0 1 4343 4315 4319
-8604 2 2 0 1 4379 4315 4343
-8605 2 2 0 1 4368 4362 4319
-8606 2 2 0 1 4319 4316 4361
-8607 2 2 0 1 4191 4320 4395
-8608 2 2 0 1 4321 4332 4330
-8609 2 2 0 1 4322 4323 4325
-8610 2 2 0 1 4324 4318 4346
-8611 2 2 0 1 4346 4318 4362
-8612 2 2 0 1 4342 4329 4371
-8613 2 2 0 1 4322 4325 4336
-8614 2 2 0 1 4336 4325 4331
-8615 2 2 0 1 4333 4351 4412
-8616 2 2 0 1 4329 4333 4324
-8617 2 2 0 1 4364 4345 4326
-8618 2 2 0 1 4327 4375 4373
-8619 2 2 0 1 4363 4318 4317
-8620 2 2 0 1 4317 4311 4363
-8621 2 2 0 1 4365 4415 4347
-8622 2 2 0 1 4372 4322 4337
-8623 2 2 0 1 4342 4337 4352
-8624 2 2 0 1 4307 4313 4328
-8625 2 2 0 1 4328 4379 4311
-8626 2 2 0 1 4328 4311 4307
-8627 2 2 0 1 4313 4379 4328
-8628 2 2 0 1 4356 4384 4360
-8629 2 2 0 1 4370 4321 4402
-8630 2 2 0 1 4329 4324 4335
-8631 2 2 0 1 4403 4369 4370
-8632 2 2 0 1 4344 4332 4326
-8633 2 2 0 1 4344 4330 4332
-8634 2 2 0 1 4377 4191 4385
-8635 2 2 0 1 4367 4312 4354
-8636 2 2 0 1 4310 4352 4336
-8637 2 2 0 1 4310 4336 4331
-8638 2 2 0 1 4402 4403 4370
-8639 2 2 0 1 4308 4384 4356
-8640 2 2 0 1 4414 4308 4356
-8641 2 2 0 1 4395 4385 4191
-8642 2 2 0 1 3820 4404 3814
-8643 2 2 0 1 4372 4375 4338
-8644 2 2 0 1 4375 4327 4338
-8645 2 2 0 1 4332 4341 4359
-8646 2 2 0 1 4341 4327 4359
-8647 2 2 0 1 4394 4333 4329
-8648 2 2 0 1 4333 4394 4351
-8649 2 2 0 1 4361 4334 4358
-8650 2 2 0 1 4346 4374 4335
-8651 2 2 0 1 4335 4324 4346
-8652 2 2 0 1 4333 4412 4432
-8653 2 2 0 1 4333 4432 4324
-8654 2 2 0 1 4373 4358 4359
-8655 2 2 0 1 4336 4352 4337
-8656 2 2 0 1 4337 4322 4336
-8657 2 2 0 1 4338 4340 4323
-8658 2 2 0 1 4323 4322 4338
-8659 2 2 0 1 4402 4321 4330
-8660 2 2 0 1 4341 4339 4340
-8661 2 2 0 1 4321 4339 4341
-8662 2 2 0 1 4372 4337 4371
-8663 2 2 0 1 4371 4337 4342
-8664 2 2 0 1 4319 4362 4343
-8665 2 2 0 1 4347 4344 4345
-8666 2 2 0 1 4345 4344 4326
-8667 2 2 0 1 4374 4346 4368
-8668 2 2 0 1 4368 4346 4362
-8669 2 2 0 1 4329 4335 4371
-8670 2 2 0 1 4344 4347 4400
-8671 2 2 0 1 4400 4330 4344
-8672 2 2 0 1 4432 4412 4430
-8673 2 2 0 1 4397 4348 4357
-8674 2 2 0 1 4407 4396 4310
-8675 2 2 0 1 4349 4390 3874
-8676 2 2 0 1 4340 4390 4323
-8677 2 2 0 1 4413 4350 4320
-8678 2 2 0 1 4395 4320 4350
-8679 2 2 0 1 4350 4412 4351
-8680 2 2 0 1 4395 4350 4351
-8681 2 2 0 1 4352 4310 4396
-8682 2 2 0 1 4353 4367 4354
-8683 2 2 0 1 4414 4356 4355
-8684 2 2 0 1 4357 4355 4356
-8685 2 2 0 1 4356 4360 4357
-8686 2 2 0 1 4359 4326 4332
-8687 2 2 0 1 4334 4364 4326
-8688 2 2 0 1 4326 4358 4334
-8689 2 2 0 1 4326 4359 4358
-8690 2 2 0 1 4380 4360 4384
-8691 2 2 0 1 4316 4360 4380
-8692 2 2 0 1 4380 4334 4361
-8693 2 2 0 1 4361 4316 4380
-8694 2 2 0 1 4362 4318 4363
-8695 2 2 0 1 4379 4363 4311
-8696 2 2 0 1 4379 4343 4363
-8697 2 2 0 1 4343 4362 4363
-8698 2 2 0 1 4366 4345 4364
-8699 2 2 0 1 4347 4366 4365
-8700 2 2 0 1 4366 4367 4365
-8701 2 2 0 1 4367 4366 4312
-8702 2 2 0 1 4366 4347 4345
-8703 2 2 0 1 4387 3843 4382
-8704 2 2 0 1 4331 4382 4309
-8705 2 2 0 1 4368 4373 4374
-8706 2 2 0 1 4358 4373 4368
-8707 2 2 0 1 4361 4368 4319
-8708 2 2 0 1 4361 4358 4368
-8709 2 2 0 1 4424 4403 4402
-8710 2 2 0 1 4355 4357 4314
-8711 2 2 0 1 4348 4314 4357
-8712 2 2 0 1 4369 3864 4370
-8713 2 2 0 1 4371 4375 4372
-8714 2 2 0 1 4373 4375 4374
-8715 2 2 0 1 4375 4335 4374
-8716 2 2 0 1 4371 4335 4375
-8717 2 2 0 1 4353 4453 4367
-8718 2 2 0 1 4396 4407 4376
-8719 2 2 0 1 4376 4273 4377
-8720 2 2 0 1 4378 4379 4392
-8721 2 2 0 1 4379 4378 4315
-8722 2 2 0 1 3864 4391 4370
-8723 2 2 0 1 4339 4370 4391
-8724 2 2 0 1 4410 4390 4349
-8725 2 2 0 1 4323 4390 4410
-8726 2 2 0 1 4364 4380 4381
-8727 2 2 0 1 4381 4366 4364
-8728 2 2 0 1 4384 4381 4380
-8729 2 2 0 1 4382 4331 4388
-8730 2 2 0 1 4388 4387 4382
-8731 2 2 0 1 4397 4383 4315
-8732 2 2 0 1 4316 4315 4383
-8733 2 2 0 1 4312 4381 4384
-8734 2 2 0 1 4312 4366 4381
-8735 2 2 0 1 4385 4376 4377
-8736 2 2 0 1 4376 4385 4396
-8737 2 2 0 1 4386 4387 4388
-8738 2 2 0 1 4388 4331 4325
-8739 2 2 0 1 4349 4386 4410
-8740 2 2 0 1 4389 4342 4352
-8741 2 2 0 1 4394 4342 4389
-8742 2 2 0 1 4352 4396 4389
-8743 2 2 0 1 3874 4391 3864
-8744 2 2 0 1 4390 4391 3874
-8745 2 2 0 1 4390 4339 4391
-8746 2 2 0 1 4392 4393 4378
-8747 2 2 0 1 4378 4393 4397
-8748 2 2 0 1 4378 4397 4315
-8749 2 2 0 1 4389 4351 4394
-8750 2 2 0 1 4395 4351 4389
-8751 2 2 0 1 4385 4395 4389
-8752 2 2 0 1 4389 4396 4385
-8753 2 2 0 1 4316 4383 4360
-8754 2 2 0 1 4383 4357 4360
-8755 2 2 0 1 4397 4357 4383
-8756 2 2 0 1 4399 3843 4398
-8757 2 2 0 1 4399 4407 4309
-8758 2 2 0 1 4309 4382 4399
-8759 2 2 0 1 4382 3843 4399
-8760 2 2 0 1 4330 4400 4402
-8761 2 2 0 1 4401 4424 4400
-8762 2 2 0 1 4424 4402 4400
-8763 2 2 0 1 4369 4403 3820
-8764 2 2 0 1 3820 4403 4404
-8765 2 2 0 1 4424 4404 4403
-8766 2 2 0 1 4415 4453 4409
-8767 2 2 0 1 4365 4453 4415
-8768 2 2 0 1 4453 4365 4367
-8769 2 2 0 1 3814 4422 3815
-8770 2 2 0 1 4422 3814 4404
-8771 2 2 0 1 4406 4273 4408
-8772 2 2 0 1 4407 4399 4408
-8773 2 2 0 1 4405 4398 4274
-8774 2 2 0 1 4274 4406 4405
-8775 2 2 0 1 4405 4399 4398
-8776 2 2 0 1 4273 4376 4408
-8777 2 2 0 1 4407 4408 4376
-8778 2 2 0 1 4406 4408 4405
-8779 2 2 0 1 4405 4408 4399
-8780 2 2 0 1 4409 4476 4415
-8781 2 2 0 1 4386 4388 4410
-8782 2 2 0 1 4325 4323 4410
-8783 2 2 0 1 4410 4388 4325
-8784 2 2 0 1 4350 4413 4411
-8785 2 2 0 1 4411 4430 4412
-8786 2 2 0 1 4350 4411 4412
-8787 2 2 0 1 4411 4413 4297
-8788 2 2 0 1 4430 4411 4297
-8789 2 2 0 1 4446 4414 4417
-8790 2 2 0 1 4401 4415 4476
-8791 2 2 0 1 4416 4417 4414
-8792 2 2 0 1 4414 4355 4416
-8793 2 2 0 1 4355 4418 4416
-8794 2 2 0 1 4418 4449 4416
-8795 2 2 0 1 4416 4449 4417
-8796 2 2 0 1 4433 4419 4434
-8797 2 2 0 1 4434 4419 4306
-8798 2 2 0 1 4422 4421 4420
-8799 2 2 0 1 4404 4421 4422
-8800 2 2 0 1 4306 4317 4423
-8801 2 2 0 1 4306 4423 4434
-8802 2 2 0 1 4401 4421 4424
-8803 2 2 0 1 4421 4404 4424
-8804 2 2 0 1 4415 4425 4347
-8805 2 2 0 1 4401 4400 4425
-8806 2 2 0 1 4415 4401 4425
-8807 2 2 0 1 4347 4425 4400
-8808 2 2 0 1 4446 4426 4414
-8809 2 2 0 1 4308 4414 4426
-8810 2 2 0 1 4459 4426 4446
-8811 2 2 0 1 4459 4354 4426
-8812 2 2 0 1 4426 4354 4308
-8813 2 2 0 1 4420 4401 4476
-8814 2 2 0 1 4420 4421 4401
-8815 2 2 0 1 4423 4427 4434
-8816 2 2 0 1 4428 4429 4297
-8817 2 2 0 1 4430 4297 4429
-8818 2 2 0 1 4303 4427 4428
-8819 2 2 0 1 4427 4429 4428
-8820 2 2 0 1 4429 4427 4423
-8821 2 2 0 1 4423 4430 4429
-8822 2 2 0 1 4431 4317 4432
-8823 2 2 0 1 4430 4423 4431
-8824 2 2 0 1 4423 4317 4431
-8825 2 2 0 1 4431 4432 4430
-8826 2 2 0 1 4435 4303 4304
-8827 2 2 0 1 4433 4434 4435
-8828 2 2 0 1 4435 4304 4433
-8829 2 2 0 1 4435 4427 4303
-8830 2 2 0 1 4434 4427 4435
-8831 2 2 0 1 4533 4475 4450
-8832 2 2 0 1 4503 4482 4562
-8833 2 2 0 1 4503 4493 4482
-8834 2 2 0 1 3986 4489 4508
-8835 2 2 0 1 4436 4437 4465
-8836 2 2 0 1 4489 4488 4508
-8837 2 2 0 1 4445 4484 4461
-8838 2 2 0 1 4448 4450 4475
-8839 2 2 0 1 4445 4439 4484
-8840 2 2 0 1 4447 4438 4439
-8841 2 2 0 1 4439 4445 4447
-8842 2 2 0 1 4436 4480 4437
-8843 2 2 0 1 4436 4455 4440
-8844 2 2 0 1 4460 4472 4021
-8845 2 2 0 1 4501 4441 4442
-8846 2 2 0 1 4442 4458 4461
-8847 2 2 0 1 4464 4463 4455
-8848 2 2 0 1 4495 4440 4496
-8849 2 2 0 1 4436 4440 4480
-8850 2 2 0 1 4422 4420 4443
-8851 2 2 0 1 4459 4446 4444
-8852 2 2 0 1 4445 4444 4447
-8853 2 2 0 1 4448 4446 4417
-8854 2 2 0 1 4446 4448 4444
-8855 2 2 0 1 4475 4447 4448
-8856 2 2 0 1 4447 4444 4448
-8857 2 2 0 1 4438 4447 4475
-8858 2 2 0 1 4450 4417 4449
-8859 2 2 0 1 4417 4450 4448
-8860 2 2 0 1 4453 4353 4454
-8861 2 2 0 1 4454 4451 4462
-8862 2 2 0 1 4441 4452 4442
-8863 2 2 0 1 4442 4452 4458
-8864 2 2 0 1 4468 4453 4454
-8865 2 2 0 1 4465 4437 4477
-8866 2 2 0 1 4496 4440 4456
-8867 2 2 0 1 4440 4455 4456
-8868 2 2 0 1 4458 4462 4457
-8869 2 2 0 1 4457 4461 4458
-8870 2 2 0 1 4457 4462 4451
-8871 2 2 0 1 4470 4353 4459
-8872 2 2 0 1 3815 4471 4460
-8873 2 2 0 1 3815 4422 4471
-8874 2 2 0 1 4436 4465 4474
-8875 2 2 0 1 4474 4455 4436
-8876 2 2 0 1 4469 4445 4461
-8877 2 2 0 1 4461 4484 4467
-8878 2 2 0 1 4467 4442 4461
-8879 2 2 0 1 4454 4353 4470
-8880 2 2 0 1 4451 4454 4470
-8881 2 2 0 1 4457 4469 4461
-8882 2 2 0 1 4457 4451 4469
-8883 2 2 0 1 4464 4462 4463
-8884 2 2 0 1 4463 4462 4458
-8885 2 2 0 1 4452 4441 4492
-8886 2 2 0 1 4496 4456 4492
-8887 2 2 0 1 4456 4455 4463
-8888 2 2 0 1 4462 4464 4468
-8889 2 2 0 1 4468 4454 4462
-8890 2 2 0 1 4473 4465 4477
-8891 2 2 0 1 4444 4470 4459
-8892 2 2 0 1 4467 4466 4501
-8893 2 2 0 1 4467 4501 4442
-8894 2 2 0 1 4468 4409 4453
-8895 2 2 0 1 4476 4409 4473
-8896 2 2 0 1 4473 4409 4468
-8897 2 2 0 1 4470 4469 4451
-8898 2 2 0 1 4469 4444 4445
-8899 2 2 0 1 4470 4444 4469
-8900 2 2 0 1 4420 4477 4443
-8901 2 2 0 1 4422 4443 4471
-8902 2 2 0 1 4472 4471 4443
-8903 2 2 0 1 4472 4460 4471
-8904 2 2 0 1 4474 4465 4473
-8905 2 2 0 1 4455 4474 4464
-8906 2 2 0 1 4464 4474 4468
-8907 2 2 0 1 4473 4468 4474
-8908 2 2 0 1 4486 4437 4480
-8909 2 2 0 1 4480 4488 4486
-8910 2 2 0 1 4438 4533 4478
-8911 2 2 0 1 4533 4438 4475
-8912 2 2 0 1 4420 4476 4477
-8913 2 2 0 1 4477 4476 4473
-8914 2 2 0 1 4562 4485 4478
-8915 2 2 0 1 4485 4438 4478
-8916 2 2 0 1 4472 4479 4486
-8917 2 2 0 1 4486 4479 4437
-8918 2 2 0 1 4443 4479 4472
-8919 2 2 0 1 4479 4477 4437
-8920 2 2 0 1 4443 4477 4479
-8921 2 2 0 1 4485 4562 4482
-8922 2 2 0 1 4508 4488 4483
-8923 2 2 0 1 4480 4483 4488
-8924 2 2 0 1 4456 4452 4492
-8925 2 2 0 1 4458 4452 4463
-8926 2 2 0 1 4463 4452 4456
-8927 2 2 0 1 4481 4493 4466
-8928 2 2 0 1 4481 4482 4493
-8929 2 2 0 1 4466 4467 4481
-8930 2 2 0 1 4467 4484 4481
-8931 2 2 0 1 4495 4480 4440
-8932 2 2 0 1 4483 4480 4495
-8933 2 2 0 1 4485 4482 4481
-8934 2 2 0 1 4485 4439 4438
-8935 2 2 0 1 4485 4484 4439
-8936 2 2 0 1 4484 4485 4481
-8937 2 2 0 1 4486 4490 4472
-8938 2 2 0 1 4490 4487 4021
-8939 2 2 0 1 4021 4472 4490
-8940 2 2 0 1 4489 4487 4490
-8941 2 2 0 1 4490 4488 4489
-8942 2 2 0 1 4490 4486 4488
-8943 2 2 0 1 946 4491 949
-8944 2 2 0 1 4492 4441 4491
-8945 2 2 0 1 958 949 4499
-8946 2 2 0 1 4499 4441 4501
-8947 2 2 0 1 951 958 4500
-8948 2 2 0 1 4501 4466 4500
-8949 2 2 0 1 951 4502 962
-8950 2 2 0 1 4493 4502 4466
-8951 2 2 0 1 946 954 4498
-8952 2 2 0 1 4496 4492 4498
-8953 2 2 0 1 956 4494 954
-8954 2 2 0 1 954 4494 4498
-8955 2 2 0 1 4495 4496 4494
-8956 2 2 0 1 4496 4498 4494
-8957 2 2 0 1 966 4497 956
-8958 2 2 0 1 956 4497 4494
-8959 2 2 0 1 4497 4483 4495
-8960 2 2 0 1 4494 4497 4495
-8961 2 2 0 1 946 4498 4491
-8962 2 2 0 1 4492 4491 4498
-8963 2 2 0 1 4499 949 4491
-8964 2 2 0 1 4441 4499 4491
-8965 2 2 0 1 4499 4500 958
-8966 2 2 0 1 4500 4499 4501
-8967 2 2 0 1 4500 4502 951
-8968 2 2 0 1 4502 4500 4466
-8969 2 2 0 1 4493 4504 4502
-8970 2 2 0 1 4529 961 4504
-8971 2 2 0 1 4503 4504 4493
-8972 2 2 0 1 4504 4503 4529
-8973 2 2 0 1 962 4504 961
-8974 2 2 0 1 962 4502 4504
-8975 2 2 0 1 966 4506 4507
-8976 2 2 0 1 4507 4483 4497
-8977 2 2 0 1 4508 4483 4507
-8978 2 2 0 1 4507 4497 966
-8979 2 2 0 1 4505 4506 765
-8980 2 2 0 1 3986 4508 4505
-8981 2 2 0 1 4506 4505 4507
-8982 2 2 0 1 4505 4508 4507
-8983 2 2 0 1 1145 1151 4509
-8984 2 2 0 1 4528 4564 4509
-8985 2 2 0 1 1145 4510 1146
-8986 2 2 0 1 4564 4525 4510
-8987 2 2 0 1 4525 4523 4524
-8988 2 2 0 1 1146 4524 4511
-8989 2 2 0 1 4523 4520 4519
-8990 2 2 0 1 4511 4519 4518
-8991 2 2 0 1 4513 4518 4521
-8992 2 2 0 1 4520 4522 4521
-8993 2 2 0 1 4512 4513 4514
-8994 2 2 0 1 4522 4546 4514
-8995 2 2 0 1 1150 4512 4515
-8996 2 2 0 1 4546 4549 4515
-8997 2 2 0 1 4527 4516 1150
-8998 2 2 0 1 4549 4517 4527
-8999 2 2 0 1 4526 1155 4516
-9000 2 2 0 1 4526 4517 4530
-9001 2 2 0 1 4519 4521 4518
-9002 2 2 0 1 4521 4519 4520
-9003 2 2 0 1 4509 4510 1145
-9004 2 2 0 1 4510 4509 4564
-9005 2 2 0 1 4521 4514 4513
-9006 2 2 0 1 4514 4521 4522
-9007 2 2 0 1 4524 4519 4511
-9008 2 2 0 1 4519 4524 4523
-9009 2 2 0 1 4510 4524 1146
-9010 2 2 0 1 4524 4510 4525
-9011 2 2 0 1 4514 4515 4512
-9012 2 2 0 1 4515 4514 4546
-9013 2 2 0 1 4516 4527 4526
-9014 2 2 0 1 4517 4526 4527
-9015 2 2 0 1 4515 4527 1150
-9016 2 2 0 1 4527 4515 4549
-9017 2 2 0 1 4529 1151 961
-9018 2 2 0 1 1152 1155 5087
-9019 2 2 0 1 4503 4528 4529
-9020 2 2 0 1 5087 4530 5047
-9021 2 2 0 1 4529 4509 1151
-9022 2 2 0 1 4528 4509 4529
-9023 2 2 0 1 1155 4526 5087
-9024 2 2 0 1 5087 4526 4530
-9025 2 2 0 1 4552 4576 4554
-9026 2 2 0 1 4570 4542 4531
-9027 2 2 0 1 4648 4552 4553
-9028 2 2 0 1 4557 4535 4556
-9029 2 2 0 1 4617 4532 4551
-9030 2 2 0 1 4570 4531 4532
-9031 2 2 0 1 4532 4531 4551
-9032 2 2 0 1 4536 4533 4450
-9033 2 2 0 1 4535 4557 4534
-9034 2 2 0 1 4535 4553 4556
-9035 2 2 0 1 4536 4531 4542
-9036 2 2 0 1 4559 4541 4544
-9037 2 2 0 1 4556 4555 4560
-9038 2 2 0 1 4549 4550 4517
-9039 2 2 0 1 4544 4546 4522
-9040 2 2 0 1 4537 4559 4544
-9041 2 2 0 1 4531 4536 4450
-9042 2 2 0 1 4558 4559 4537
-9043 2 2 0 1 4631 4538 4539
-9044 2 2 0 1 4538 4541 4559
-9045 2 2 0 1 4535 4534 4540
-9046 2 2 0 1 4617 4615 4569
-9047 2 2 0 1 4532 4617 4569
-9048 2 2 0 1 4570 4532 4569
-9049 2 2 0 1 4538 4540 4541
-9050 2 2 0 1 4542 4543 4536
-9051 2 2 0 1 4478 4533 4536
-9052 2 2 0 1 4536 4543 4478
-9053 2 2 0 1 4648 4548 4669
-9054 2 2 0 1 4535 4540 4548
-9055 2 2 0 1 4568 4567 4571
-9056 2 2 0 1 4544 4545 4546
-9057 2 2 0 1 4545 4541 4550
-9058 2 2 0 1 4544 4541 4545
-9059 2 2 0 1 4669 4547 4631
-9060 2 2 0 1 4540 4538 4547
-9061 2 2 0 1 4631 4547 4538
-9062 2 2 0 1 4548 4648 4553
-9063 2 2 0 1 4535 4548 4553
-9064 2 2 0 1 4669 4548 4547
-9065 2 2 0 1 4547 4548 4540
-9066 2 2 0 1 4546 4545 4549
-9067 2 2 0 1 4549 4545 4550
-9068 2 2 0 1 4562 4478 4543
-9069 2 2 0 1 4540 4534 4541
-9070 2 2 0 1 4550 4541 4534
-9071 2 2 0 1 4517 4557 4530
-9072 2 2 0 1 4517 4534 4557
-9073 2 2 0 1 4534 4517 4550
-9074 2 2 0 1 4450 4449 4531
-9075 2 2 0 1 4531 4449 4551
-9076 2 2 0 1 4554 4553 4552
-9077 2 2 0 1 4553 4554 4555
-9078 2 2 0 1 4553 4555 4556
-9079 2 2 0 1 4561 4556 4560
-9080 2 2 0 1 4557 4556 4561
-9081 2 2 0 1 4539 4538 4575
-9082 2 2 0 1 4558 4575 4559
-9083 2 2 0 1 4559 4575 4538
-9084 2 2 0 1 4561 5047 4530
-9085 2 2 0 1 4560 5047 4561
-9086 2 2 0 1 4530 4557 4561
-9087 2 2 0 1 4503 4562 4528
-9088 2 2 0 1 4528 4562 4563
-9089 2 2 0 1 4543 4563 4562
-9090 2 2 0 1 4528 4563 4564
-9091 2 2 0 1 4565 4564 4563
-9092 2 2 0 1 4565 4563 4543
-9093 2 2 0 1 4542 4565 4543
-9094 2 2 0 1 4539 4575 4581
-9095 2 2 0 1 4537 4520 4567
-9096 2 2 0 1 4520 4537 4522
-9097 2 2 0 1 4537 4544 4522
-9098 2 2 0 1 4542 4570 4566
-9099 2 2 0 1 4571 4565 4566
-9100 2 2 0 1 4566 4565 4542
-9101 2 2 0 1 4567 4520 4523
-9102 2 2 0 1 4564 4565 4525
-9103 2 2 0 1 4525 4565 4571
-9104 2 2 0 1 4566 4568 4571
-9105 2 2 0 1 4569 4568 4566
-9106 2 2 0 1 4566 4570 4569
-9107 2 2 0 1 4537 4573 4558
-9108 2 2 0 1 4567 4568 4573
-9109 2 2 0 1 4537 4567 4573
-9110 2 2 0 1 4567 4523 4571
-9111 2 2 0 1 4525 4571 4523
-9112 2 2 0 1 4572 4568 4569
-9113 2 2 0 1 4568 4572 4573
-9114 2 2 0 1 4572 4558 4573
-9115 2 2 0 1 4615 4574 4569
-9116 2 2 0 1 4572 4569 4574
-9117 2 2 0 1 4581 4574 4615
-9118 2 2 0 1 4575 4574 4581
-9119 2 2 0 1 4574 4575 4558
-9120 2 2 0 1 4574 4558 4572
-9121 2 2 0 1 4552 4577 4576
-9122 2 2 0 1 4646 4576 4577
-9123 2 2 0 1 4594 4650 4624
-9124 2 2 0 1 4671 4672 4578
-9125 2 2 0 1 4580 4634 4635
-9126 2 2 0 1 4348 4645 4314
-9127 2 2 0 1 4314 4645 4579
-9128 2 2 0 1 4635 5004 4578
-9129 2 2 0 1 4551 4641 4617
-9130 2 2 0 1 4672 4635 4578
-9131 2 2 0 1 4672 4580 4635
-9132 2 2 0 1 4739 4633 4687
-9133 2 2 0 1 4640 4581 4615
-9134 2 2 0 1 4641 4579 4582
-9135 2 2 0 1 4666 4588 4583
-9136 2 2 0 1 4588 4664 4619
-9137 2 2 0 1 4586 4583 4618
-9138 2 2 0 1 4586 4618 4652
-9139 2 2 0 1 4585 4583 4586
-9140 2 2 0 1 4588 4584 4664
-9141 2 2 0 1 4587 4687 4633
-9142 2 2 0 1 4585 4586 4587
-9143 2 2 0 1 4588 4610 4584
-9144 2 2 0 1 4619 4589 4588
-9145 2 2 0 1 4583 4588 4589
-9146 2 2 0 1 4590 4652 4621
-9147 2 2 0 1 4590 4677 4591
-9148 2 2 0 1 4590 4638 4677
-9149 2 2 0 1 4623 4588 4666
-9150 2 2 0 1 4610 4588 4623
-9151 2 2 0 1 4630 4593 4603
-9152 2 2 0 1 4663 4592 4630
-9153 2 2 0 1 4595 4592 4663
-9154 2 2 0 1 4593 4630 4592
-9155 2 2 0 1 4594 4624 4596
-9156 2 2 0 1 4595 4663 4596
-9157 2 2 0 1 4598 4597 4657
-9158 2 2 0 1 4598 4657 4659
-9159 2 2 0 1 4599 4604 4619
-9160 2 2 0 1 4622 4597 4620
-9161 2 2 0 1 4582 4600 4628
-9162 2 2 0 1 4601 4619 4604
-9163 2 2 0 1 4639 4602 4601
-9164 2 2 0 1 4625 4604 4599
-9165 2 2 0 1 4595 4604 4625
-9166 2 2 0 1 4644 4593 4600
-9167 2 2 0 1 4603 4593 4644
-9168 2 2 0 1 4614 4674 4998
-9169 2 2 0 1 4667 4633 4634
-9170 2 2 0 1 4640 4615 4616
-9171 2 2 0 1 4604 4595 4605
-9172 2 2 0 1 4605 4624 4639
-9173 2 2 0 1 4626 4599 4606
-9174 2 2 0 1 4607 4313 4307
-9175 2 2 0 1 4307 4594 4607
-9176 2 2 0 1 4607 4608 4313
-9177 2 2 0 1 4657 4597 4609
-9178 2 2 0 1 4620 4610 4612
-9179 2 2 0 1 4611 4620 4612
-9180 2 2 0 1 4613 4620 4597
-9181 2 2 0 1 4648 4643 4552
-9182 2 2 0 1 4634 4580 4667
-9183 2 2 0 1 4674 4614 4661
-9184 2 2 0 1 4661 4614 4978
-9185 2 2 0 1 4714 4591 4677
-9186 2 2 0 1 4616 4615 4617
-9187 2 2 0 1 4616 4617 4641
-9188 2 2 0 1 4602 4621 4618
-9189 2 2 0 1 4652 4618 4621
-9190 2 2 0 1 4583 4585 4666
-9191 2 2 0 1 4602 4618 4589
-9192 2 2 0 1 4583 4589 4618
-9193 2 2 0 1 4606 4599 4664
-9194 2 2 0 1 4664 4599 4619
-9195 2 2 0 1 4602 4589 4601
-9196 2 2 0 1 4601 4589 4619
-9197 2 2 0 1 4633 4667 4587
-9198 2 2 0 1 4667 4585 4587
-9199 2 2 0 1 4620 4611 4622
-9200 2 2 0 1 4613 4610 4620
-9201 2 2 0 1 4584 4610 4613
-9202 2 2 0 1 4621 4602 4639
-9203 2 2 0 1 4598 4613 4597
-9204 2 2 0 1 4622 4642 4609
-9205 2 2 0 1 4597 4622 4609
-9206 2 2 0 1 4612 4610 4623
-9207 2 2 0 1 4668 4598 4659
-9208 2 2 0 1 4624 4605 4596
-9209 2 2 0 1 4605 4595 4596
-9210 2 2 0 1 4625 4593 4592
-9211 2 2 0 1 4592 4595 4625
-9212 2 2 0 1 4640 4628 4627
-9213 2 2 0 1 4609 4642 4643
-9214 2 2 0 1 4604 4605 4601
-9215 2 2 0 1 4605 4639 4601
-9216 2 2 0 1 4593 4625 4626
-9217 2 2 0 1 4625 4599 4626
-9218 2 2 0 1 4661 4637 4642
-9219 2 2 0 1 4611 4661 4622
-9220 2 2 0 1 4661 4642 4622
-9221 2 2 0 1 4628 4600 4654
-9222 2 2 0 1 4627 4628 4654
-9223 2 2 0 1 4392 4629 4393
-9224 2 2 0 1 4629 4630 4603
-9225 2 2 0 1 4608 4392 4313
-9226 2 2 0 1 4629 4392 4608
-9227 2 2 0 1 4630 4608 4663
-9228 2 2 0 1 4608 4630 4629
-9229 2 2 0 1 4631 4539 4647
-9230 2 2 0 1 4660 4769 4757
-9231 2 2 0 1 4652 4660 4586
-9232 2 2 0 1 4629 4348 4393
-9233 2 2 0 1 4348 4629 4645
-9234 2 2 0 1 4739 4632 4636
-9235 2 2 0 1 4636 4633 4739
-9236 2 2 0 1 4636 4634 4633
-9237 2 2 0 1 5004 4635 4636
-9238 2 2 0 1 4636 4934 5004
-9239 2 2 0 1 4635 4634 4636
-9240 2 2 0 1 4934 4636 4632
-9241 2 2 0 1 4978 4637 4661
-9242 2 2 0 1 4638 4624 4650
-9243 2 2 0 1 4624 4638 4639
-9244 2 2 0 1 4590 4621 4638
-9245 2 2 0 1 4638 4621 4639
-9246 2 2 0 1 4628 4640 4616
-9247 2 2 0 1 4616 4582 4628
-9248 2 2 0 1 4616 4641 4582
-9249 2 2 0 1 4653 4590 4591
-9250 2 2 0 1 4644 4600 4582
-9251 2 2 0 1 4577 4643 4637
-9252 2 2 0 1 4642 4637 4643
-9253 2 2 0 1 4552 4643 4577
-9254 2 2 0 1 4645 4582 4579
-9255 2 2 0 1 4645 4629 4603
-9256 2 2 0 1 4603 4644 4645
-9257 2 2 0 1 4645 4644 4582
-9258 2 2 0 1 4646 4637 4978
-9259 2 2 0 1 4637 4646 4577
-9260 2 2 0 1 4631 4647 4658
-9261 2 2 0 1 4647 4659 4658
-9262 2 2 0 1 4680 4307 4419
-9263 2 2 0 1 4307 4680 4594
-9264 2 2 0 1 4670 4643 4648
-9265 2 2 0 1 4670 4609 4643
-9266 2 2 0 1 4757 4687 4649
-9267 2 2 0 1 4649 4687 4587
-9268 2 2 0 1 4649 4660 4757
-9269 2 2 0 1 4650 4678 4638
-9270 2 2 0 1 4638 4678 4677
-9271 2 2 0 1 4590 4653 4651
-9272 2 2 0 1 4590 4651 4652
-9273 2 2 0 1 4653 4769 4651
-9274 2 2 0 1 4654 4655 4668
-9275 2 2 0 1 4654 4606 4655
-9276 2 2 0 1 4539 4581 4656
-9277 2 2 0 1 4647 4656 4627
-9278 2 2 0 1 4647 4539 4656
-9279 2 2 0 1 4648 4669 4670
-9280 2 2 0 1 4670 4657 4609
-9281 2 2 0 1 4649 4587 4586
-9282 2 2 0 1 4660 4649 4586
-9283 2 2 0 1 4658 4669 4631
-9284 2 2 0 1 4658 4659 4657
-9285 2 2 0 1 4640 4656 4581
-9286 2 2 0 1 4656 4640 4627
-9287 2 2 0 1 4660 4651 4769
-9288 2 2 0 1 4651 4660 4652
-9289 2 2 0 1 4680 4650 4594
-9290 2 2 0 1 4661 4611 4674
-9291 2 2 0 1 4623 4666 4662
-9292 2 2 0 1 4623 4662 4612
-9293 2 2 0 1 4663 4608 4607
-9294 2 2 0 1 4596 4663 4607
-9295 2 2 0 1 4607 4594 4596
-9296 2 2 0 1 4664 4655 4606
-9297 2 2 0 1 4664 4584 4655
-9298 2 2 0 1 4655 4584 4613
-9299 2 2 0 1 4655 4598 4668
-9300 2 2 0 1 4655 4613 4598
-9301 2 2 0 1 4626 4606 4654
-9302 2 2 0 1 4626 4600 4593
-9303 2 2 0 1 4654 4600 4626
-9304 2 2 0 1 4676 4580 4672
-9305 2 2 0 1 4662 4580 4676
-9306 2 2 0 1 4585 4665 4666
-9307 2 2 0 1 4662 4666 4665
-9308 2 2 0 1 4667 4665 4585
-9309 2 2 0 1 4580 4662 4665
-9310 2 2 0 1 4580 4665 4667
-9311 2 2 0 1 4433 4304 4679
-9312 2 2 0 1 4679 4304 4789
-9313 2 2 0 1 4647 4668 4659
-9314 2 2 0 1 4627 4668 4647
-9315 2 2 0 1 4668 4627 4654
-9316 2 2 0 1 4658 4670 4669
-9317 2 2 0 1 4658 4657 4670
-9318 2 2 0 1 4433 4680 4419
-9319 2 2 0 1 4680 4433 4679
-9320 2 2 0 1 4671 4998 4673
-9321 2 2 0 1 4672 4673 4676
-9322 2 2 0 1 4671 4673 4672
-9323 2 2 0 1 4675 4674 4611
-9324 2 2 0 1 4676 4674 4675
-9325 2 2 0 1 4674 4673 4998
-9326 2 2 0 1 4674 4676 4673
-9327 2 2 0 1 4611 4612 4675
-9328 2 2 0 1 4675 4612 4662
-9329 2 2 0 1 4675 4662 4676
-9330 2 2 0 1 4650 4680 4678
-9331 2 2 0 1 4678 4714 4677
-9332 2 2 0 1 4714 4678 4789
-9333 2 2 0 1 4679 4789 4678
-9334 2 2 0 1 4679 4678 4680
-9335 2 2 0 1 4641 4551 4681
-9336 2 2 0 1 4681 4579 4641
-9337 2 2 0 1 4681 4418 4314
-9338 2 2 0 1 4314 4579 4681
-9339 2 2 0 1 4681 4449 4418
-9340 2 2 0 1 4551 4449 4681
-9341 2 2 0 1 4885 4907 4750
-9342 2 2 0 1 4885 4750 4792
-9343 2 2 0 1 4682 4788 4708
-9344 2 2 0 1 4686 4683 4685
-9345 2 2 0 1 4741 4712 4780
-9346 2 2 0 1 4187 4753 4737
-9347 2 2 0 1 4753 4187 4688
-9348 2 2 0 1 4742 4741 4685
-9349 2 2 0 1 4748 4684 4802
-9350 2 2 0 1 4741 4686 4685
-9351 2 2 0 1 4780 4686 4741
-9352 2 2 0 1 4687 4740 4739
-9353 2 2 0 1 4763 4702 4803
-9354 2 2 0 1 4748 4747 4688
-9355 2 2 0 1 4695 4771 4689
-9356 2 2 0 1 4719 4695 4720
-9357 2 2 0 1 4690 4717 4689
-9358 2 2 0 1 4717 4690 4759
-9359 2 2 0 1 4718 4690 4689
-9360 2 2 0 1 4691 4695 4719
-9361 2 2 0 1 4766 4740 4687
-9362 2 2 0 1 4766 4690 4718
-9363 2 2 0 1 4696 4695 4691
-9364 2 2 0 1 4695 4692 4720
-9365 2 2 0 1 4692 4695 4689
-9366 2 2 0 1 4694 4715 4759
-9367 2 2 0 1 4693 4694 4591
-9368 2 2 0 1 4758 4694 4693
-9369 2 2 0 1 4695 4772 4771
-9370 2 2 0 1 4772 4695 4696
-9371 2 2 0 1 4735 4697 4776
-9372 2 2 0 1 4698 4734 4735
-9373 2 2 0 1 4734 4698 4727
-9374 2 2 0 1 4776 4698 4735
-9375 2 2 0 1 4726 4682 4708
-9376 2 2 0 1 4726 4734 4727
-9377 2 2 0 1 4699 4768 4711
-9378 2 2 0 1 4768 4699 4725
-9379 2 2 0 1 4728 4706 4720
-9380 2 2 0 1 4721 4710 4711
-9381 2 2 0 1 4745 4731 4747
-9382 2 2 0 1 4700 4728 4720
-9383 2 2 0 1 4700 4716 4703
-9384 2 2 0 1 4728 4730 4706
-9385 2 2 0 1 4730 4728 4727
-9386 2 2 0 1 4752 4731 4776
-9387 2 2 0 1 4697 4752 4776
-9388 2 2 0 1 4927 4785 4713
-9389 2 2 0 1 4740 4701 4712
-9390 2 2 0 1 4702 4746 4803
-9391 2 2 0 1 4728 4729 4727
-9392 2 2 0 1 4682 4729 4703
-9393 2 2 0 1 4704 4705 4706
-9394 2 2 0 1 4186 4707 4198
-9395 2 2 0 1 4707 4708 4198
-9396 2 2 0 1 4707 4186 4733
-9397 2 2 0 1 4768 4709 4711
-9398 2 2 0 1 4710 4773 4696
-9399 2 2 0 1 4773 4710 4722
-9400 2 2 0 1 4710 4723 4711
-9401 2 2 0 1 4792 4756 4765
-9402 2 2 0 1 4780 4712 4701
-9403 2 2 0 1 4785 4743 4713
-9404 2 2 0 1 4743 4744 4713
-9405 2 2 0 1 4714 4693 4591
-9406 2 2 0 1 4746 4802 4803
-9407 2 2 0 1 4748 4802 4746
-9408 2 2 0 1 4717 4715 4716
-9409 2 2 0 1 4717 4759 4715
-9410 2 2 0 1 4689 4771 4718
-9411 2 2 0 1 4692 4717 4716
-9412 2 2 0 1 4689 4717 4692
-9413 2 2 0 1 4719 4706 4705
-9414 2 2 0 1 4719 4720 4706
-9415 2 2 0 1 4700 4692 4716
-9416 2 2 0 1 4720 4692 4700
-9417 2 2 0 1 4766 4701 4740
-9418 2 2 0 1 4766 4718 4701
-9419 2 2 0 1 4721 4722 4710
-9420 2 2 0 1 4696 4723 4710
-9421 2 2 0 1 4696 4691 4723
-9422 2 2 0 1 4715 4703 4716
-9423 2 2 0 1 4699 4711 4723
-9424 2 2 0 1 4721 4709 4724
-9425 2 2 0 1 4721 4711 4709
-9426 2 2 0 1 4772 4696 4773
-9427 2 2 0 1 4775 4725 4699
-9428 2 2 0 1 4726 4729 4682
-9429 2 2 0 1 4726 4727 4729
-9430 2 2 0 1 4730 4698 4776
-9431 2 2 0 1 4727 4698 4730
-9432 2 2 0 1 4782 4745 4702
-9433 2 2 0 1 4709 4756 4724
-9434 2 2 0 1 4700 4729 4728
-9435 2 2 0 1 4700 4703 4729
-9436 2 2 0 1 4704 4730 4776
-9437 2 2 0 1 4706 4730 4704
-9438 2 2 0 1 4743 4724 4749
-9439 2 2 0 1 4743 4722 4721
-9440 2 2 0 1 4721 4724 4743
-9441 2 2 0 1 4731 4745 4777
-9442 2 2 0 1 4782 4777 4745
-9443 2 2 0 1 4751 4249 4732
-9444 2 2 0 1 4697 4735 4751
-9445 2 2 0 1 4249 4733 4186
-9446 2 2 0 1 4733 4249 4751
-9447 2 2 0 1 4733 4735 4734
-9448 2 2 0 1 4733 4751 4735
-9449 2 2 0 1 4809 4754 4761
-9450 2 2 0 1 4769 4736 4757
-9451 2 2 0 1 4690 4736 4759
-9452 2 2 0 1 4751 4732 4737
-9453 2 2 0 1 4753 4751 4737
-9454 2 2 0 1 4739 4738 4632
-9455 2 2 0 1 4738 4739 4740
-9456 2 2 0 1 4712 4738 4740
-9457 2 2 0 1 4742 4738 4741
-9458 2 2 0 1 4742 4934 4738
-9459 2 2 0 1 4712 4741 4738
-9460 2 2 0 1 4738 4934 4632
-9461 2 2 0 1 4743 4749 4744
-9462 2 2 0 1 4682 4758 4788
-9463 2 2 0 1 4682 4703 4758
-9464 2 2 0 1 4715 4694 4758
-9465 2 2 0 1 4715 4758 4703
-9466 2 2 0 1 4746 4702 4745
-9467 2 2 0 1 4747 4746 4745
-9468 2 2 0 1 4746 4747 4748
-9469 2 2 0 1 4591 4694 4653
-9470 2 2 0 1 4752 4747 4731
-9471 2 2 0 1 4749 4756 4750
-9472 2 2 0 1 4724 4756 4749
-9473 2 2 0 1 4750 4756 4792
-9474 2 2 0 1 4688 4747 4753
-9475 2 2 0 1 4697 4751 4753
-9476 2 2 0 1 4752 4697 4753
-9477 2 2 0 1 4747 4752 4753
-9478 2 2 0 1 4749 4907 4744
-9479 2 2 0 1 4749 4750 4907
-9480 2 2 0 1 4783 4754 4809
-9481 2 2 0 1 4754 4783 4725
-9482 2 2 0 1 4755 4784 4198
-9483 2 2 0 1 4708 4755 4198
-9484 2 2 0 1 4756 4764 4765
-9485 2 2 0 1 4764 4756 4709
-9486 2 2 0 1 4757 4767 4687
-9487 2 2 0 1 4767 4766 4687
-9488 2 2 0 1 4767 4757 4736
-9489 2 2 0 1 4758 4790 4788
-9490 2 2 0 1 4790 4758 4693
-9491 2 2 0 1 4760 4653 4694
-9492 2 2 0 1 4759 4760 4694
-9493 2 2 0 1 4653 4760 4769
-9494 2 2 0 1 4775 4774 4777
-9495 2 2 0 1 4774 4705 4777
-9496 2 2 0 1 4761 4762 4763
-9497 2 2 0 1 4782 4762 4754
-9498 2 2 0 1 4762 4761 4754
-9499 2 2 0 1 4764 4812 4765
-9500 2 2 0 1 4709 4768 4764
-9501 2 2 0 1 4767 4690 4766
-9502 2 2 0 1 4736 4690 4767
-9503 2 2 0 1 4812 4783 4809
-9504 2 2 0 1 4783 4768 4725
-9505 2 2 0 1 4762 4702 4763
-9506 2 2 0 1 4782 4702 4762
-9507 2 2 0 1 4760 4736 4769
-9508 2 2 0 1 4759 4736 4760
-9509 2 2 0 1 4788 4755 4708
-9510 2 2 0 1 4785 4722 4743
-9511 2 2 0 1 4772 4770 4771
-9512 2 2 0 1 4772 4773 4770
-9513 2 2 0 1 4734 4707 4733
-9514 2 2 0 1 4707 4734 4726
-9515 2 2 0 1 4708 4707 4726
-9516 2 2 0 1 4719 4705 4774
-9517 2 2 0 1 4774 4691 4719
-9518 2 2 0 1 4774 4723 4691
-9519 2 2 0 1 4775 4699 4774
-9520 2 2 0 1 4699 4723 4774
-9521 2 2 0 1 4777 4705 4704
-9522 2 2 0 1 4731 4704 4776
-9523 2 2 0 1 4731 4777 4704
-9524 2 2 0 1 4780 4778 4686
-9525 2 2 0 1 4780 4770 4778
-9526 2 2 0 1 4779 4718 4771
-9527 2 2 0 1 4770 4779 4771
-9528 2 2 0 1 4718 4779 4701
-9529 2 2 0 1 4780 4779 4770
-9530 2 2 0 1 4780 4701 4779
-9531 2 2 0 1 4287 4781 4304
-9532 2 2 0 1 4781 4789 4304
-9533 2 2 0 1 4725 4775 4754
-9534 2 2 0 1 4782 4754 4775
-9535 2 2 0 1 4782 4775 4777
-9536 2 2 0 1 4783 4812 4764
-9537 2 2 0 1 4764 4768 4783
-9538 2 2 0 1 4755 4287 4784
-9539 2 2 0 1 4781 4287 4755
-9540 2 2 0 1 4683 4786 4927
-9541 2 2 0 1 4778 4786 4686
-9542 2 2 0 1 4786 4683 4686
-9543 2 2 0 1 4787 4722 4785
-9544 2 2 0 1 4778 4787 4785
-9545 2 2 0 1 4786 4785 4927
-9546 2 2 0 1 4778 4785 4786
-9547 2 2 0 1 4787 4773 4722
-9548 2 2 0 1 4773 4787 4770
-9549 2 2 0 1 4787 4778 4770
-9550 2 2 0 1 4790 4755 4788
-9551 2 2 0 1 4714 4790 4693
-9552 2 2 0 1 4714 4789 4790
-9553 2 2 0 1 4789 4781 4790
-9554 2 2 0 1 4790 4781 4755
-9555 2 2 0 1 4748 4791 4684
-9556 2 2 0 1 4791 4748 4688
-9557 2 2 0 1 4791 4187 4285
-9558 2 2 0 1 4688 4187 4791
-9559 2 2 0 1 4819 4791 4285
-9560 2 2 0 1 4819 4684 4791
-9561 2 2 0 1 4792 4881 4885
-9562 2 2 0 1 4799 4828 4834
-9563 2 2 0 1 4765 4820 4792
-9564 2 2 0 1 4795 4796 4794
-9565 2 2 0 1 4793 4802 4684
-9566 2 2 0 1 4793 4799 4834
-9567 2 2 0 1 4799 4793 4684
-9568 2 2 0 1 4805 4140 4127
-9569 2 2 0 1 4794 4816 4795
-9570 2 2 0 1 4820 4794 4796
-9571 2 2 0 1 4805 4828 4799
-9572 2 2 0 1 4801 4798 4817
-9573 2 2 0 1 4871 4796 4797
-9574 2 2 0 1 4818 4814 4845
-9575 2 2 0 1 4798 4843 4844
-9576 2 2 0 1 4836 4798 4801
-9577 2 2 0 1 4805 4799 4140
-9578 2 2 0 1 4840 4836 4801
-9579 2 2 0 1 4800 4809 4761
-9580 2 2 0 1 4817 4800 4801
-9581 2 2 0 1 4794 4813 4816
-9582 2 2 0 1 4802 4804 4803
-9583 2 2 0 1 4793 4804 4802
-9584 2 2 0 1 4834 4804 4793
-9585 2 2 0 1 4813 4800 4817
-9586 2 2 0 1 4826 4828 4805
-9587 2 2 0 1 4806 4805 4127
-9588 2 2 0 1 4806 4826 4805
-9589 2 2 0 1 4811 4765 4812
-9590 2 2 0 1 4811 4813 4794
-9591 2 2 0 1 4807 4832 4831
-9592 2 2 0 1 4808 4798 4844
-9593 2 2 0 1 4808 4814 4817
-9594 2 2 0 1 4798 4808 4817
-9595 2 2 0 1 4809 4810 4812
-9596 2 2 0 1 4813 4810 4800
-9597 2 2 0 1 4810 4809 4800
-9598 2 2 0 1 4811 4820 4765
-9599 2 2 0 1 4794 4820 4811
-9600 2 2 0 1 4810 4811 4812
-9601 2 2 0 1 4813 4811 4810
-9602 2 2 0 1 4845 4808 4844
-9603 2 2 0 1 4845 4814 4808
-9604 2 2 0 1 4826 4806 4815
-9605 2 2 0 1 4817 4816 4813
-9606 2 2 0 1 4814 4816 4817
-9607 2 2 0 1 4795 4818 4862
-9608 2 2 0 1 4816 4818 4795
-9609 2 2 0 1 4814 4818 4816
-9610 2 2 0 1 4819 4140 4799
-9611 2 2 0 1 4684 4819 4799
-9612 2 2 0 1 4792 4820 4881
-9613 2 2 0 1 4820 4871 4881
-9614 2 2 0 1 4796 4871 4820
-9615 2 2 0 1 4821 4797 4796
-9616 2 2 0 1 4795 4821 4796
-9617 2 2 0 1 4827 4800 4761
-9618 2 2 0 1 4801 4827 4840
-9619 2 2 0 1 4801 4800 4827
-9620 2 2 0 1 4821 4822 4797
-9621 2 2 0 1 4822 4821 4862
-9622 2 2 0 1 4821 4795 4862
-9623 2 2 0 1 4823 4824 4815
-9624 2 2 0 1 4824 4825 4815
-9625 2 2 0 1 4825 4826 4815
-9626 2 2 0 1 4850 4825 4824
-9627 2 2 0 1 4825 4850 4830
-9628 2 2 0 1 4826 4825 4830
-9629 2 2 0 1 4830 4828 4826
-9630 2 2 0 1 4763 4827 4761
-9631 2 2 0 1 4807 4848 4836
-9632 2 2 0 1 4843 4836 4848
-9633 2 2 0 1 4798 4836 4843
-9634 2 2 0 1 4833 4834 4828
-9635 2 2 0 1 4833 4830 4831
-9636 2 2 0 1 4830 4833 4828
-9637 2 2 0 1 4807 4837 4848
-9638 2 2 0 1 4829 4830 4850
-9639 2 2 0 1 4829 4831 4830
-9640 2 2 0 1 4833 4831 4832
-9641 2 2 0 1 4804 4833 4832
-9642 2 2 0 1 4833 4804 4834
-9643 2 2 0 1 4840 4835 4836
-9644 2 2 0 1 4807 4835 4832
-9645 2 2 0 1 4835 4807 4836
-9646 2 2 0 1 4831 4837 4807
-9647 2 2 0 1 4837 4831 4829
-9648 2 2 0 1 4832 4838 4804
-9649 2 2 0 1 4832 4835 4838
-9650 2 2 0 1 4838 4835 4840
-9651 2 2 0 1 4839 4803 4804
-9652 2 2 0 1 4838 4839 4804
-9653 2 2 0 1 4839 4763 4803
-9654 2 2 0 1 4763 4839 4827
-9655 2 2 0 1 4827 4839 4840
-9656 2 2 0 1 4839 4838 4840
-9657 2 2 0 1 2423 4841 4858
-9658 2 2 0 1 4824 4841 4850
-9659 2 2 0 1 4852 4842 2423
-9660 2 2 0 1 4850 4842 4829
-9661 2 2 0 1 4829 4853 4837
-9662 2 2 0 1 2426 4853 4852
-9663 2 2 0 1 4837 4851 4848
-9664 2 2 0 1 2431 4851 2426
-9665 2 2 0 1 2435 4847 2431
-9666 2 2 0 1 4848 4847 4843
-9667 2 2 0 1 2438 4849 2435
-9668 2 2 0 1 4843 4849 4844
-9669 2 2 0 1 4855 4854 2438
-9670 2 2 0 1 4844 4854 4845
-9671 2 2 0 1 4857 4856 4855
-9672 2 2 0 1 4845 4856 4818
-9673 2 2 0 1 2440 4846 4857
-9674 2 2 0 1 4818 4846 4862
-9675 2 2 0 1 4847 4851 2431
-9676 2 2 0 1 4848 4851 4847
-9677 2 2 0 1 4849 4847 2435
-9678 2 2 0 1 4843 4847 4849
-9679 2 2 0 1 4842 4841 2423
-9680 2 2 0 1 4850 4841 4842
-9681 2 2 0 1 4851 4853 2426
-9682 2 2 0 1 4837 4853 4851
-9683 2 2 0 1 4853 4842 4852
-9684 2 2 0 1 4829 4842 4853
-9685 2 2 0 1 4854 4849 2438
-9686 2 2 0 1 4844 4849 4854
-9687 2 2 0 1 4856 4854 4855
-9688 2 2 0 1 4845 4854 4856
-9689 2 2 0 1 4846 4856 4857
-9690 2 2 0 1 4818 4856 4846
-9691 2 2 0 1 4858 4860 4859
-9692 2 2 0 1 4861 2440 2557
-9693 2 2 0 1 4823 4860 4824
-9694 2 2 0 1 4861 4822 4862
-9695 2 2 0 1 4841 4860 4858
-9696 2 2 0 1 4841 4824 4860
-9697 2 2 0 1 4861 4846 2440
-9698 2 2 0 1 4862 4846 4861
-9699 2 2 0 1 2579 4863 2551
-9700 2 2 0 1 2579 4864 4863
-9701 2 2 0 1 2553 4894 4867
-9702 2 2 0 1 2553 4870 4894
-9703 2 2 0 1 4867 4865 4866
-9704 2 2 0 1 4867 4894 4865
-9705 2 2 0 1 4866 4868 2549
-9706 2 2 0 1 4866 4865 4868
-9707 2 2 0 1 2549 4868 4869
-9708 2 2 0 1 4869 2560 2549
-9709 2 2 0 1 2551 4870 2553
-9710 2 2 0 1 2551 4863 4870
-9711 2 2 0 1 4877 2556 2555
-9712 2 2 0 1 4877 2555 4875
-9713 2 2 0 1 2556 4873 2559
-9714 2 2 0 1 2556 4877 4873
-9715 2 2 0 1 2559 4861 2557
-9716 2 2 0 1 4873 4861 2559
-9717 2 2 0 1 4873 4822 4861
-9718 2 2 0 1 4869 2561 2560
-9719 2 2 0 1 4890 2561 4869
-9720 2 2 0 1 4890 2555 2561
-9721 2 2 0 1 4875 2555 4890
-9722 2 2 0 1 4886 5092 5099
-9723 2 2 0 1 4877 4872 4873
-9724 2 2 0 1 4871 4797 4872
-9725 2 2 0 1 4797 4873 4872
-9726 2 2 0 1 4822 4873 4797
-9727 2 2 0 1 4883 4871 4872
-9728 2 2 0 1 4877 4876 4872
-9729 2 2 0 1 4883 4876 4874
-9730 2 2 0 1 4883 4872 4876
-9731 2 2 0 1 4883 4881 4871
-9732 2 2 0 1 4875 4876 4877
-9733 2 2 0 1 4876 4875 4892
-9734 2 2 0 1 4874 4876 4892
-9735 2 2 0 1 4878 4914 4879
-9736 2 2 0 1 4880 4879 4884
-9737 2 2 0 1 4878 4879 4880
-9738 2 2 0 1 4880 4874 4892
-9739 2 2 0 1 4892 4878 4880
-9740 2 2 0 1 4882 4881 4883
-9741 2 2 0 1 4882 4874 4880
-9742 2 2 0 1 4883 4874 4882
-9743 2 2 0 1 4881 4882 4885
-9744 2 2 0 1 4884 4882 4880
-9745 2 2 0 1 4882 4884 4885
-9746 2 2 0 1 4870 4888 4894
-9747 2 2 0 1 4901 4886 4887
-9748 2 2 0 1 4896 4889 4887
-9749 2 2 0 1 4889 4901 4887
-9750 2 2 0 1 4870 4889 4888
-9751 2 2 0 1 4889 4870 4863
-9752 2 2 0 1 4863 4901 4889
-9753 2 2 0 1 4890 4891 4875
-9754 2 2 0 1 4891 4892 4875
-9755 2 2 0 1 4905 4868 4865
-9756 2 2 0 1 4903 4893 4906
-9757 2 2 0 1 4905 4895 4903
-9758 2 2 0 1 4895 4905 4865
-9759 2 2 0 1 4878 4898 4914
-9760 2 2 0 1 4894 4895 4865
-9761 2 2 0 1 4894 4888 4895
-9762 2 2 0 1 4897 4896 4893
-9763 2 2 0 1 4897 4895 4888
-9764 2 2 0 1 4897 4889 4896
-9765 2 2 0 1 4888 4889 4897
-9766 2 2 0 1 4903 4897 4893
-9767 2 2 0 1 4903 4895 4897
-9768 2 2 0 1 4891 4878 4892
-9769 2 2 0 1 4891 4898 4878
-9770 2 2 0 1 4891 4900 4898
-9771 2 2 0 1 4890 4900 4891
-9772 2 2 0 1 4869 4900 4890
-9773 2 2 0 1 4901 4863 4864
-9774 2 2 0 1 4899 4868 4905
-9775 2 2 0 1 4898 4900 4899
-9776 2 2 0 1 4900 4869 4899
-9777 2 2 0 1 4869 4868 4899
-9778 2 2 0 1 4901 5092 4886
-9779 2 2 0 1 4864 5092 4901
-9780 2 2 0 1 4902 4913 4914
-9781 2 2 0 1 4902 4898 4899
-9782 2 2 0 1 4898 4902 4914
-9783 2 2 0 1 4903 4904 4905
-9784 2 2 0 1 4904 4899 4905
-9785 2 2 0 1 4904 4906 4913
-9786 2 2 0 1 4906 4904 4903
-9787 2 2 0 1 4899 4904 4902
-9788 2 2 0 1 4902 4904 4913
-9789 2 2 0 1 4744 4908 4911
-9790 2 2 0 1 4907 4908 4744
-9791 2 2 0 1 4907 4884 4908
-9792 2 2 0 1 4885 4884 4907
-9793 2 2 0 1 4927 4924 4683
-9794 2 2 0 1 4915 4909 4910
-9795 2 2 0 1 4911 4915 4910
-9796 2 2 0 1 4912 4713 4744
-9797 2 2 0 1 4912 4911 4910
-9798 2 2 0 1 4911 4912 4744
-9799 2 2 0 1 4921 4911 4908
-9800 2 2 0 1 4921 4884 4879
-9801 2 2 0 1 4908 4884 4921
-9802 2 2 0 1 4910 4909 4925
-9803 2 2 0 1 4913 4928 4914
-9804 2 2 0 1 4683 4918 4685
-9805 2 2 0 1 4918 4683 4924
-9806 2 2 0 1 4914 4921 4879
-9807 2 2 0 1 4915 4911 4921
-9808 2 2 0 1 4939 4987 4916
-9809 2 2 0 1 4917 4742 4685
-9810 2 2 0 1 4685 4918 4917
-9811 2 2 0 1 4932 4919 4920
-9812 2 2 0 1 4919 4932 4953
-9813 2 2 0 1 4928 4922 4914
-9814 2 2 0 1 4921 4922 4915
-9815 2 2 0 1 4922 4921 4914
-9816 2 2 0 1 4923 4906 4893
-9817 2 2 0 1 4906 4923 4931
-9818 2 2 0 1 4925 4937 4924
-9819 2 2 0 1 4965 4928 4931
-9820 2 2 0 1 4928 4965 4909
-9821 2 2 0 1 4924 4926 4925
-9822 2 2 0 1 4926 4924 4927
-9823 2 2 0 1 4926 4910 4925
-9824 2 2 0 1 4909 4922 4928
-9825 2 2 0 1 4909 4915 4922
-9826 2 2 0 1 4713 4926 4927
-9827 2 2 0 1 4929 4931 4923
-9828 2 2 0 1 4931 4929 4965
-9829 2 2 0 1 4929 4963 4969
-9830 2 2 0 1 4953 4932 4970
-9831 2 2 0 1 4930 5009 5000
-9832 2 2 0 1 4920 4919 4930
-9833 2 2 0 1 4913 4906 4931
-9834 2 2 0 1 4928 4913 4931
-9835 2 2 0 1 4936 4916 4933
-9836 2 2 0 1 4916 4936 4939
-9837 2 2 0 1 4939 4968 4920
-9838 2 2 0 1 4920 4968 4932
-9839 2 2 0 1 4912 4926 4713
-9840 2 2 0 1 4912 4910 4926
-9841 2 2 0 1 4938 4917 4918
-9842 2 2 0 1 4917 4938 4936
-9843 2 2 0 1 4742 4935 4934
-9844 2 2 0 1 4935 4933 4934
-9845 2 2 0 1 4935 4742 4917
-9846 2 2 0 1 4935 4936 4933
-9847 2 2 0 1 4917 4936 4935
-9848 2 2 0 1 4937 4918 4924
-9849 2 2 0 1 4937 4938 4918
-9850 2 2 0 1 4937 4968 4938
-9851 2 2 0 1 4949 4930 4919
-9852 2 2 0 1 4939 4940 4987
-9853 2 2 0 1 4930 4940 4920
-9854 2 2 0 1 4940 4939 4920
-9855 2 2 0 1 5099 4941 4886
-9856 2 2 0 1 4940 5000 4987
-9857 2 2 0 1 4930 5000 4940
-9858 2 2 0 1 4942 4941 5099
-9859 2 2 0 1 4949 5009 4930
-9860 2 2 0 1 4952 4943 4950
-9861 2 2 0 1 4947 4944 4946
-9862 2 2 0 1 4944 4945 4946
-9863 2 2 0 1 4944 4947 4950
-9864 2 2 0 1 4943 4948 4945
-9865 2 2 0 1 4944 4943 4945
-9866 2 2 0 1 4950 4943 4944
-9867 2 2 0 1 4950 4947 5009
-9868 2 2 0 1 4950 4949 4952
-9869 2 2 0 1 4949 4950 5009
-9870 2 2 0 1 4943 4976 4948
-9871 2 2 0 1 5109 4957 4951
-9872 2 2 0 1 4957 4945 4948
-9873 2 2 0 1 4919 4953 4952
-9874 2 2 0 1 4952 4949 4919
-9875 2 2 0 1 4975 4952 4953
-9876 2 2 0 1 4945 4956 4946
-9877 2 2 0 1 4896 4958 4893
-9878 2 2 0 1 4964 4961 4976
-9879 2 2 0 1 4956 4955 4954
-9880 2 2 0 1 4955 5109 4954
-9881 2 2 0 1 4964 4958 4961
-9882 2 2 0 1 4955 4956 4945
-9883 2 2 0 1 4957 4955 4945
-9884 2 2 0 1 4955 4957 5109
-9885 2 2 0 1 4893 4958 4959
-9886 2 2 0 1 4959 4963 4929
-9887 2 2 0 1 4929 4923 4959
-9888 2 2 0 1 4959 4923 4893
-9889 2 2 0 1 4887 4958 4896
-9890 2 2 0 1 4887 4961 4958
-9891 2 2 0 1 4960 4952 4975
-9892 2 2 0 1 4960 4976 4943
-9893 2 2 0 1 4952 4960 4943
-9894 2 2 0 1 4961 4974 4976
-9895 2 2 0 1 4961 4887 4974
-9896 2 2 0 1 4941 4974 4886
-9897 2 2 0 1 4887 4886 4974
-9898 2 2 0 1 4975 4953 4963
-9899 2 2 0 1 4962 4975 4963
-9900 2 2 0 1 4959 4962 4963
-9901 2 2 0 1 4975 4962 4964
-9902 2 2 0 1 4962 4958 4964
-9903 2 2 0 1 4959 4958 4962
-9904 2 2 0 1 4909 4969 4925
-9905 2 2 0 1 4965 4969 4909
-9906 2 2 0 1 4965 4929 4969
-9907 2 2 0 1 4966 4963 4953
-9908 2 2 0 1 4966 4970 4969
-9909 2 2 0 1 4970 4966 4953
-9910 2 2 0 1 4963 4966 4969
-9911 2 2 0 1 4936 4967 4939
-9912 2 2 0 1 4968 4967 4938
-9913 2 2 0 1 4967 4968 4939
-9914 2 2 0 1 4967 4936 4938
-9915 2 2 0 1 4971 4925 4969
-9916 2 2 0 1 4970 4971 4969
-9917 2 2 0 1 4925 4971 4937
-9918 2 2 0 1 4972 4968 4937
-9919 2 2 0 1 4972 4970 4932
-9920 2 2 0 1 4968 4972 4932
-9921 2 2 0 1 4971 4972 4937
-9922 2 2 0 1 4971 4970 4972
-9923 2 2 0 1 4973 4957 4948
-9924 2 2 0 1 4957 4973 4951
-9925 2 2 0 1 4941 4942 4973
-9926 2 2 0 1 4973 4942 4951
-9927 2 2 0 1 4976 4973 4948
-9928 2 2 0 1 4973 4976 4974
-9929 2 2 0 1 4941 4973 4974
-9930 2 2 0 1 4976 4975 4964
-9931 2 2 0 1 4960 4975 4976
-9932 2 2 0 1 4978 4977 4979
-9933 2 2 0 1 4979 4646 4978
-9934 2 2 0 1 4646 4979 4980
-9935 2 2 0 1 4576 4646 4980
-9936 2 2 0 1 4996 4998 4671
-9937 2 2 0 1 4997 4985 4981
-9938 2 2 0 1 4977 4981 4985
-9939 2 2 0 1 4614 4982 4978
-9940 2 2 0 1 4982 4981 4977
-9941 2 2 0 1 4977 4978 4982
-9942 2 2 0 1 4977 4986 4979
-9943 2 2 0 1 4980 4986 4983
-9944 2 2 0 1 4986 4980 4979
-9945 2 2 0 1 4997 4981 4994
-9946 2 2 0 1 5054 4984 5076
-9947 2 2 0 1 4578 4989 4671
-9948 2 2 0 1 4671 4989 4996
-9949 2 2 0 1 5054 4983 4986
-9950 2 2 0 1 4977 4985 4986
-9951 2 2 0 1 4916 4987 5006
-9952 2 2 0 1 5004 4988 4578
-9953 2 2 0 1 4578 4988 4989
-9954 2 2 0 1 5001 5018 4990
-9955 2 2 0 1 4990 5018 5033
-9956 2 2 0 1 4991 4984 5054
-9957 2 2 0 1 4986 4985 4991
-9958 2 2 0 1 4991 5054 4986
-9959 2 2 0 1 5023 5066 4992
-9960 2 2 0 1 5066 4993 4992
-9961 2 2 0 1 5039 4994 4996
-9962 2 2 0 1 4993 4984 4999
-9963 2 2 0 1 4999 4984 4997
-9964 2 2 0 1 4994 4995 4996
-9965 2 2 0 1 4996 4995 4998
-9966 2 2 0 1 4994 4981 4995
-9967 2 2 0 1 4984 4991 4997
-9968 2 2 0 1 4991 4985 4997
-9969 2 2 0 1 4614 4998 4995
-9970 2 2 0 1 4992 4993 5024
-9971 2 2 0 1 5024 4993 4999
-9972 2 2 0 1 5024 5034 5025
-9973 2 2 0 1 4990 5033 5038
-9974 2 2 0 1 5000 5009 5007
-9975 2 2 0 1 5001 5007 5018
-9976 2 2 0 1 5066 5076 4993
-9977 2 2 0 1 4993 5076 4984
-9978 2 2 0 1 4916 5002 4933
-9979 2 2 0 1 4916 5006 5002
-9980 2 2 0 1 5006 5001 5037
-9981 2 2 0 1 5001 4990 5037
-9982 2 2 0 1 4982 4614 4995
-9983 2 2 0 1 4995 4981 4982
-9984 2 2 0 1 4988 5035 4989
-9985 2 2 0 1 5002 5035 4988
-9986 2 2 0 1 4934 5003 5004
-9987 2 2 0 1 4934 4933 5003
-9988 2 2 0 1 5004 5003 4988
-9989 2 2 0 1 5002 5003 4933
-9990 2 2 0 1 5003 5002 4988
-9991 2 2 0 1 4989 5039 4996
-9992 2 2 0 1 5039 4989 5035
-9993 2 2 0 1 5035 5037 5039
-9994 2 2 0 1 5007 5015 5018
-9995 2 2 0 1 5006 4987 5005
-9996 2 2 0 1 5005 5007 5001
-9997 2 2 0 1 5005 5001 5006
-9998 2 2 0 1 5074 5044 5125
-9999 2 2 0 1 5005 4987 5000
-10000 2 2 0 1 5007 5005 5000
-10001 2 2 0 1 5044 5008 5125
-10002 2 2 0 1 5015 5007 5009
-10003 2 2 0 1 5014 5013 5017
-10004 2 2 0 1 5011 4947 4946
-10005 2 2 0 1 4946 5010 5011
-10006 2 2 0 1 5014 4947 5011
-10007 2 2 0 1 5012 5013 5010
-10008 2 2 0 1 5013 5011 5010
-10009 2 2 0 1 5013 5014 5011
-10010 2 2 0 1 5009 4947 5014
-10011 2 2 0 1 5015 5014 5017
-10012 2 2 0 1 5009 5014 5015
-10013 2 2 0 1 5013 5012 5027
-10014 2 2 0 1 5042 5016 5118
-10015 2 2 0 1 5010 5016 5012
-10016 2 2 0 1 5018 5017 5033
-10017 2 2 0 1 5015 5017 5018
-10018 2 2 0 1 5017 5019 5033
-10019 2 2 0 1 5010 4946 4956
-10020 2 2 0 1 5069 5023 5030
-10021 2 2 0 1 5022 5021 5027
-10022 2 2 0 1 5020 4956 4954
-10023 2 2 0 1 5020 4954 5118
-10024 2 2 0 1 5030 5021 5022
-10025 2 2 0 1 5020 5010 4956
-10026 2 2 0 1 5016 5010 5020
-10027 2 2 0 1 5016 5020 5118
-10028 2 2 0 1 5023 5029 5030
-10029 2 2 0 1 5024 5025 5029
-10030 2 2 0 1 5024 5029 4992
-10031 2 2 0 1 5023 4992 5029
-10032 2 2 0 1 5069 5030 5059
-10033 2 2 0 1 5059 5030 5022
-10034 2 2 0 1 5019 5017 5026
-10035 2 2 0 1 5026 5013 5027
-10036 2 2 0 1 5017 5013 5026
-10037 2 2 0 1 5022 5027 5028
-10038 2 2 0 1 5059 5022 5028
-10039 2 2 0 1 5028 5044 5074
-10040 2 2 0 1 5074 5059 5028
-10041 2 2 0 1 5033 5019 5025
-10042 2 2 0 1 5031 5025 5019
-10043 2 2 0 1 5029 5025 5031
-10044 2 2 0 1 5031 5019 5021
-10045 2 2 0 1 5021 5030 5031
-10046 2 2 0 1 5029 5031 5030
-10047 2 2 0 1 4997 4994 5034
-10048 2 2 0 1 4997 5034 4999
-10049 2 2 0 1 5024 4999 5034
-10050 2 2 0 1 5032 5033 5025
-10051 2 2 0 1 5038 5032 5034
-10052 2 2 0 1 5033 5032 5038
-10053 2 2 0 1 5025 5034 5032
-10054 2 2 0 1 5002 5006 5036
-10055 2 2 0 1 5035 5036 5037
-10056 2 2 0 1 5036 5006 5037
-10057 2 2 0 1 5036 5035 5002
-10058 2 2 0 1 5034 4994 5041
-10059 2 2 0 1 5034 5041 5038
-10060 2 2 0 1 5041 4994 5039
-10061 2 2 0 1 5040 5039 5037
-10062 2 2 0 1 4990 5038 5040
-10063 2 2 0 1 5040 5037 4990
-10064 2 2 0 1 5041 5039 5040
-10065 2 2 0 1 5038 5041 5040
-10066 2 2 0 1 5012 5016 5043
-10067 2 2 0 1 5016 5042 5043
-10068 2 2 0 1 5044 5043 5008
-10069 2 2 0 1 5043 5042 5008
-10070 2 2 0 1 5043 5027 5012
-10071 2 2 0 1 5028 5027 5043
-10072 2 2 0 1 5043 5044 5028
-10073 2 2 0 1 5019 5027 5021
-10074 2 2 0 1 5027 5019 5026
-10075 2 2 0 1 5074 5125 5075
-10076 2 2 0 1 5046 5045 5048
-10077 2 2 0 1 5045 4560 4555
-10078 2 2 0 1 4560 5045 5046
-10079 2 2 0 1 4560 5046 5047
-10080 2 2 0 1 5045 4555 5049
-10081 2 2 0 1 5051 5048 5045
-10082 2 2 0 1 5049 5055 5051
-10083 2 2 0 1 5051 5045 5049
-10084 2 2 0 1 4555 4554 5049
-10085 2 2 0 1 5048 5051 5050
-10086 2 2 0 1 5050 5051 5052
-10087 2 2 0 1 5055 5052 5051
-10088 2 2 0 1 5053 4983 5054
-10089 2 2 0 1 5056 4980 4983
-10090 2 2 0 1 4983 5053 5056
-10091 2 2 0 1 5056 5052 5055
-10092 2 2 0 1 5053 5052 5056
-10093 2 2 0 1 5057 5049 4554
-10094 2 2 0 1 5056 5055 5057
-10095 2 2 0 1 5055 5049 5057
-10096 2 2 0 1 5057 4554 4576
-10097 2 2 0 1 5056 5057 4980
-10098 2 2 0 1 4576 4980 5057
-10099 2 2 0 1 5058 5060 5084
-10100 2 2 0 1 5074 5063 5059
-10101 2 2 0 1 5069 5059 5062
-10102 2 2 0 1 5062 5059 5063
-10103 2 2 0 1 5084 5060 5062
-10104 2 2 0 1 5062 5061 5084
-10105 2 2 0 1 5061 5062 5063
-10106 2 2 0 1 5050 5064 5089
-10107 2 2 0 1 5064 5050 5052
-10108 2 2 0 1 5068 5082 5065
-10109 2 2 0 1 5066 5023 5067
-10110 2 2 0 1 5065 5067 5071
-10111 2 2 0 1 5065 5071 5068
-10112 2 2 0 1 5054 5078 5053
-10113 2 2 0 1 5068 5071 5058
-10114 2 2 0 1 5058 5071 5060
-10115 2 2 0 1 5069 5070 5023
-10116 2 2 0 1 5060 5071 5070
-10117 2 2 0 1 5070 5069 5062
-10118 2 2 0 1 5060 5070 5062
-10119 2 2 0 1 5070 5067 5023
-10120 2 2 0 1 5067 5070 5071
-10121 2 2 0 1 5053 5064 5052
-10122 2 2 0 1 5064 5053 5078
-10123 2 2 0 1 5078 5072 5064
-10124 2 2 0 1 5089 5064 5072
-10125 2 2 0 1 5089 5072 5073
-10126 2 2 0 1 5063 5124 5061
-10127 2 2 0 1 5079 5065 5082
-10128 2 2 0 1 5072 5078 5079
-10129 2 2 0 1 5072 5079 5073
-10130 2 2 0 1 5073 5079 5082
-10131 2 2 0 1 5063 5074 5075
-10132 2 2 0 1 5124 5063 5075
-10133 2 2 0 1 5076 5077 5054
-10134 2 2 0 1 5077 5079 5078
-10135 2 2 0 1 5054 5077 5078
-10136 2 2 0 1 5065 5080 5067
-10137 2 2 0 1 5080 5065 5079
-10138 2 2 0 1 5076 5066 5080
-10139 2 2 0 1 5080 5066 5067
-10140 2 2 0 1 5077 5080 5079
-10141 2 2 0 1 5080 5077 5076
-10142 2 2 0 1 1265 5081 5082
-10143 2 2 0 1 5068 1265 5082
-10144 2 2 0 1 5081 5073 5082
-10145 2 2 0 1 5081 5083 5073
-10146 2 2 0 1 1263 1262 5058
-10147 2 2 0 1 5058 5084 1263
-10148 2 2 0 1 1265 5068 1262
-10149 2 2 0 1 5068 5058 1262
-10150 2 2 0 1 1260 1261 5061
-10151 2 2 0 1 5061 5124 1260
-10152 2 2 0 1 1261 1263 5084
-10153 2 2 0 1 5084 5061 1261
-10154 2 2 0 1 5048 5085 5086
-10155 2 2 0 1 5048 5050 5085
-10156 2 2 0 1 5086 1269 5046
-10157 2 2 0 1 5046 5048 5086
-10158 2 2 0 1 5087 1269 1152
-10159 2 2 0 1 5087 5046 1269
-10160 2 2 0 1 5046 5087 5047
-10161 2 2 0 1 5083 5088 5073
-10162 2 2 0 1 5089 5073 5088
-10163 2 2 0 1 5088 5085 5089
-10164 2 2 0 1 5050 5089 5085
-10165 2 2 0 1 1272 5090 2575
-10166 2 2 0 1 2575 5100 2576
-10167 2 2 0 1 5090 5100 2575
-10168 2 2 0 1 5095 5102 5091
-10169 2 2 0 1 5098 5095 5091
-10170 2 2 0 1 5093 2581 2578
-10171 2 2 0 1 4864 2581 5093
-10172 2 2 0 1 2579 2581 4864
-10173 2 2 0 1 5092 4864 5093
-10174 2 2 0 1 5092 5093 5099
-10175 2 2 0 1 5094 5099 5093
-10176 2 2 0 1 2576 5095 5096
-10177 2 2 0 1 5095 2576 5100
-10178 2 2 0 1 5095 5100 5102
-10179 2 2 0 1 5098 5097 5096
-10180 2 2 0 1 5098 5096 5095
-10181 2 2 0 1 5091 5094 5093
-10182 2 2 0 1 5093 5098 5091
-10183 2 2 0 1 5093 2578 5097
-10184 2 2 0 1 5093 5097 5098
-10185 2 2 0 1 1272 5104 5090
-10186 2 2 0 1 5094 4942 5099
-10187 2 2 0 1 5100 5105 5102
-10188 2 2 0 1 5117 5106 5103
-10189 2 2 0 1 5106 5105 5103
-10190 2 2 0 1 5105 5101 5102
-10191 2 2 0 1 5101 5091 5102
-10192 2 2 0 1 5104 5103 5105
-10193 2 2 0 1 5106 5101 5105
-10194 2 2 0 1 5090 5105 5100
-10195 2 2 0 1 5090 5104 5105
-10196 2 2 0 1 5110 4951 4942
-10197 2 2 0 1 5110 5091 5101
-10198 2 2 0 1 5108 5109 4951
-10199 2 2 0 1 5108 5101 5106
-10200 2 2 0 1 5109 5107 4954
-10201 2 2 0 1 5117 5107 5106
-10202 2 2 0 1 5107 5117 4954
-10203 2 2 0 1 5108 5107 5109
-10204 2 2 0 1 5108 5106 5107
-10205 2 2 0 1 5110 5108 4951
-10206 2 2 0 1 5110 5101 5108
-10207 2 2 0 1 4942 5094 5110
-10208 2 2 0 1 5094 5091 5110
-10209 2 2 0 1 5111 5104 1272
-10210 2 2 0 1 5125 5008 5121
-10211 2 2 0 1 5112 5113 5126
-10212 2 2 0 1 5103 5116 5117
-10213 2 2 0 1 5103 5113 5116
-10214 2 2 0 1 5114 5113 5112
-10215 2 2 0 1 5114 5112 5122
-10216 2 2 0 1 5103 5104 5113
-10217 2 2 0 1 5114 5116 5113
-10218 2 2 0 1 5104 5111 5113
-10219 2 2 0 1 5111 5126 5113
-10220 2 2 0 1 5042 5120 5008
-10221 2 2 0 1 5114 5122 5120
-10222 2 2 0 1 5118 5115 5042
-10223 2 2 0 1 5114 5115 5116
-10224 2 2 0 1 5118 4954 5119
-10225 2 2 0 1 5116 5119 5117
-10226 2 2 0 1 5117 5119 4954
-10227 2 2 0 1 5115 5118 5119
-10228 2 2 0 1 5115 5119 5116
-10229 2 2 0 1 5120 5042 5115
-10230 2 2 0 1 5115 5114 5120
-10231 2 2 0 1 5120 5121 5008
-10232 2 2 0 1 5122 5121 5120
-10233 2 2 0 1 1272 1274 5111
-10234 2 2 0 1 5126 1274 1273
-10235 2 2 0 1 5126 5111 1274
-10236 2 2 0 1 5122 5112 5123
-10237 2 2 0 1 5122 5123 5127
-10238 2 2 0 1 1276 1278 5128
-10239 2 2 0 1 5124 5128 1278
-10240 2 2 0 1 1260 5124 1278
-10241 2 2 0 1 5128 5124 5075
-10242 2 2 0 1 5125 5128 5075
-10243 2 2 0 1 5121 5128 5125
-10244 2 2 0 1 5123 1273 1283
-10245 2 2 0 1 5123 5126 1273
-10246 2 2 0 1 5112 5126 5123
-10247 2 2 0 1 5127 1283 1281
-10248 2 2 0 1 5123 1283 5127
-10249 2 2 0 1 5122 5128 5121
-10250 2 2 0 1 5122 5127 5128
-10251 2 2 0 1 5128 1281 1276
-10252 2 2 0 1 5127 1281 5128
-$EndElements
-"""
+    import os
+    return bempp.api.import_grid(os.path.join(os.path.dirname(__file__), 'almond.msh'))
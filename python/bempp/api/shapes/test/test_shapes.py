@@ -0,0 +1,63 @@
+"""Test cases for the shapes module."""
+
+from unittest import TestCase
+import unittest
+import bempp.api
+
+
+class TestShapes(TestCase):
+    """Test the native mesh generators and the grid cache."""
+
+    requiresgmsh = unittest.skipIf(bempp.api.GMSH_PATH is None, reason="Needs GMSH")
+
+    def _check_closed_and_outward(self, grid, center):
+        import numpy as np
+
+        leaf_view = grid.leaf_view
+        self.assertTrue(np.all(leaf_view.element_neighbors >= 0))
+        directions = leaf_view.centroids - np.array(center)[:, np.newaxis]
+        self.assertTrue(np.all(np.sum(directions * leaf_view.normals, axis=0) > 0))
+
+    def test_sphere(self):
+        import numpy as np
+
+        grid = bempp.api.shapes.sphere(r=2, origin=(1, 0, 0), h=0.2, use_gmsh=False)
+        radii = np.linalg.norm(grid.leaf_view.vertices - np.array([[1], [0], [0]]), axis=0)
+
+        self.assertAlmostEqual(np.max(np.abs(radii - 2)), 0)
+        self.assertAlmostEqual(np.sum(grid.leaf_view.areas) / (16 * np.pi), 1, 2)
+        self._check_closed_and_outward(grid, (1, 0, 0))
+
+    def test_cube(self):
+        import numpy as np
+
+        grid = bempp.api.shapes.cube(length=2, origin=(0, 0, 1), h=0.5, use_gmsh=False)
+
+        self.assertEqual(grid.leaf_view.entity_count(0), 6 * 2 * 4 * 4)
+        self.assertEqual(grid.leaf_view.entity_count(2), 6 * 4 * 4 + 2)
+        self.assertAlmostEqual(np.sum(grid.leaf_view.areas), 24)
+        self._check_closed_and_outward(grid, (1, 1, 2))
+
+    @requiresgmsh
+    def test_gmsh_grids_are_cached(self):
+        import os
+        import numpy as np
+
+        def cache_files():
+            return set(name for name in os.listdir(bempp.api.TMP_PATH)
+                       if name.startswith('grid_') and name.endswith('.npz'))
+
+        before = cache_files()
+        grid = bempp.api.shapes.cube(h=0.37, use_gmsh=True)
+        self.assertEqual(len(cache_files() - before), 1)
+
+        cached_grid = bempp.api.shapes.cube(h=0.37, use_gmsh=True)
+        self.assertEqual(len(cache_files() - before), 1)
+        self.assertAlmostEqual(np.linalg.norm(
+            grid.leaf_view.vertices - cached_grid.leaf_view.vertices), 0)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
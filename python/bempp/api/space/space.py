@@ -1,5 +1,37 @@
 """Definition of a Bem++ space object and the associated factory function."""
 
+import weakref as _weakref
+
+# Spaces indexed by grid id and then by (kind, order, domains, closed). The
+# spaces of a grid are dropped when the core grid object through which they
+# were first created is freed. Since a space keeps its grid alive, the grid
+# id of a stored entry can not be reused by another grid.
+_SPACE_CACHE = {}
+_GRID_REFERENCES = {}
+
+
+def _drop_cached_spaces(grid_id):
+    """Remove the memoized spaces of a grid."""
+    _SPACE_CACHE.pop(grid_id, None)
+    _GRID_REFERENCES.pop(grid_id, None)
+
+
+def _cached_spaces(grid):
+    """Return the dictionary of memoized spaces of a grid."""
+    grid_id = grid.unique_id
+    if grid_id not in _SPACE_CACHE:
+        _SPACE_CACHE[grid_id] = {}
+        _GRID_REFERENCES[grid_id] = _weakref.ref(
+            grid._impl, lambda reference, grid_id=grid_id: _drop_cached_spaces(grid_id))
+    return _SPACE_CACHE[grid_id]
+
+
+def _reset_cached_spaces(grid):
+    """Clear data cached by the memoized spaces of a grid after it has changed."""
+    for space in _SPACE_CACHE.get(grid.unique_id, {}).values():
+        space._local_dof_maps = None
+
+
 class Space(object):
     """ Space of functions defined on a grid
 
@@ -30,10 +62,28 @@ class Space(object):
         global_dof_interpolation_points : np.ndarray
             (3xN) matrix of normal directions associated with the interpolation points.
 
+        local2global : np.ndarray
+            (n_elements x n_local_dofs) array of the global dofs of each element.
+
+        local_multipliers : np.ndarray
+            (n_elements x n_local_dofs) array of the weights of the global dofs.
+
+        kind : string
+            The kind of the space, e.g. "P", or None if the space was
+            not created with function_space.
+
+        order : int
+            The order of the space or None if the space was not
+            created with function_space.
+
     """
     
-    def __init__(self, impl):
+    def __init__(self, impl, kind=None, order=None):
         self._impl = impl
+        self._kind = kind
+        self._order = order
+        self._local_dof_maps = None
+        self._discontinuous_space = None
 
     def __eq__(self, other):
         return self.is_identical(other)
@@ -57,6 +107,15 @@ class Space(object):
         """
         return self._impl.get_global_dofs(element._impl, dof_weights)
 
+    def _get_local_dof_maps(self):
+        """Return cached arrays (global_dofs, weights) with one row per element."""
+        if self._local_dof_maps is None:
+            global_dofs, weights = self._impl.local_dof_maps()
+            global_dofs.flags.writeable = False
+            weights.flags.writeable = False
+            self._local_dof_maps = (global_dofs, weights)
+        return self._local_dof_maps
+
     def evaluate_local_basis(self, element, local_coordinates,
                              local_coefficients):
         """Evaluate a local basis on a given element."""
@@ -64,6 +123,16 @@ class Space(object):
                                                local_coordinates,
                                                local_coefficients)
 
+    @property
+    def kind(self):
+        """Return the kind of the space or None if it was not created with function_space."""
+        return self._kind
+
+    @property
+    def order(self):
+        """Return the order of the space or None if it was not created with function_space."""
+        return self._order
+
     @property
     def dtype(self):
         """Return the data type of the basis functions in the space."""
@@ -98,7 +167,32 @@ class Space(object):
     @property
     def discontinuous_space(self):
         """Return the associated discontinuous scalar space."""
-        return Space(self._impl.discontinuous_space)
+        if self._discontinuous_space is None:
+            self._discontinuous_space = Space(self._impl.discontinuous_space)
+        return self._discontinuous_space
+
+    @property
+    def local2global(self):
+        """Return an (n_elements x n_local_dofs) array of global dof indices.
+
+        Row i contains the global dofs associated with the local dofs of
+        the element with index i in the leaf view. Rows of elements with
+        fewer local dofs are padded with -1. The array is computed once
+        and is read-only.
+
+        """
+        return self._get_local_dof_maps()[0]
+
+    @property
+    def local_multipliers(self):
+        """Return an (n_elements x n_local_dofs) array of dof weights.
+
+        Entry (i, j) is the weight with which the global dof
+        local2global[i, j] contributes to the jth local dof of
+        element i. Padded entries are 0.
+
+        """
+        return self._get_local_dof_maps()[1]
 
     @property
     def global_dof_interpolation_points(self):
@@ -153,6 +247,10 @@ def function_space(grid, kind, order, domains=None, closed=True):
     see a detailed help for space objects see the documentation
     of the instantiated object.
 
+    Spaces are memoized. Calling the function again with the same
+    arguments on the same grid returns the existing space object. The
+    memoized spaces are released together with the grid.
+
     Examples
     --------
     To initialize a space of piecewise constant functions use
@@ -165,6 +263,16 @@ def function_space(grid, kind, order, domains=None, closed=True):
 
     """
     from bempp.core.space.space import function_space as _function_space
-    return Space(_function_space(grid._impl, kind, order, domains, closed))
+
+    if domains is not None:
+        domains = tuple(int(domain) for domain in domains)
+    key = (kind, order, domains, bool(closed))
+
+    spaces = _cached_spaces(grid)
+    if key not in spaces:
+        spaces[key] = Space(_function_space(grid._impl, kind, order,
+                                            None if domains is None else list(domains), closed),
+                            kind, order)
+    return spaces[key]
 
 
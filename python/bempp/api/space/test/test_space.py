@@ -0,0 +1,66 @@
+"""Test cases for the space class."""
+
+from unittest import TestCase
+import bempp.api
+
+
+class TestSpace(TestCase):
+    """Test the bulk dof maps of spaces."""
+
+    def setUp(self):
+        self._grid = bempp.api.shapes.regular_sphere(2)
+
+    def test_local2global_agrees_with_get_global_dofs(self):
+        import numpy as np
+
+        for kind, order in [("P", 1), ("DP", 0), ("RT", 0)]:
+            space = bempp.api.function_space(self._grid, kind, order)
+            local2global = space.local2global
+            local_multipliers = space.local_multipliers
+            index_set = self._grid.leaf_view.index_set()
+
+            self.assertEqual(local2global.shape[0], self._grid.leaf_view.entity_count(0))
+            self.assertEqual(local2global.shape, local_multipliers.shape)
+            for element in self._grid.leaf_view.entity_iterator(0):
+                dofs, weights = space.get_global_dofs(element, dof_weights=True)
+                index = index_set.entity_index(element)
+                self.assertEqual(list(local2global[index, :len(dofs)]), list(dofs))
+                self.assertTrue(np.allclose(local_multipliers[index, :len(dofs)], weights))
+
+    def test_local2global_is_cached_and_read_only(self):
+
+        space = bempp.api.function_space(self._grid, "P", 1)
+        self.assertIs(space.local2global, space.local2global)
+        self.assertFalse(space.local2global.flags.writeable)
+
+    def test_function_space_is_memoized(self):
+
+        space = bempp.api.function_space(self._grid, "P", 1)
+        self.assertIs(bempp.api.function_space(self._grid, "P", 1), space)
+        self.assertIs(bempp.api.function_space(space.grid, "P", 1), space)
+        self.assertIsNot(bempp.api.function_space(self._grid, "DP", 0), space)
+        self.assertIs(self._grid.barycentric_grid(), self._grid.barycentric_grid())
+
+    def test_kind_and_order_are_stored(self):
+
+        space = bempp.api.function_space(self._grid, "DP", 0)
+        self.assertEqual((space.kind, space.order), ("DP", 0))
+        self.assertIsNone(space.discontinuous_space.kind)
+
+    def test_memoized_spaces_are_freed_with_the_grid(self):
+        import gc
+        import weakref
+
+        grid = bempp.api.shapes.regular_sphere(1)
+        space = weakref.ref(bempp.api.function_space(grid, "DP", 0))
+        self.assertIsNotNone(space())
+
+        del grid
+        gc.collect()
+        self.assertIsNone(space())
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()
@@ -0,0 +1,77 @@
+"""Startup benchmark for bempp.api."""
+
+from unittest import TestCase
+import unittest
+import sys
+
+# Maximum time in seconds for 'import bempp.api' in a fresh interpreter.
+# It can be overridden with the environment variable BEMPP_STARTUP_TIME_LIMIT.
+STARTUP_TIME_LIMIT = 1.0
+
+_STARTUP_SCRIPT = """
+import json
+import os
+import sys
+import time
+
+start = time.time()
+import bempp.api
+elapsed = time.time() - start
+
+print(json.dumps({
+    'time': elapsed,
+    'modules': sorted(name for name in sys.modules
+                      if name == 'dolfin' or name.startswith('bempp.api.')),
+    'config_dir_created': os.path.isdir(os.path.join(os.environ['HOME'], '.bempp'))}))
+"""
+
+
+def _measure_startup():
+    """Import bempp.api in a new interpreter and return the measurements."""
+    import json
+    import os
+    import shutil
+    import subprocess
+    import tempfile
+
+    home = tempfile.mkdtemp()
+    try:
+        env = dict(os.environ, HOME=home)
+        output = subprocess.check_output([sys.executable, '-c', _STARTUP_SCRIPT], env=env)
+    finally:
+        shutil.rmtree(home)
+    return json.loads(output.decode('utf-8').strip().split('\n')[-1])
+
+
+class TestStartup(TestCase):
+    """Check that importing bempp.api is fast and free of side effects."""
+
+    requireslazyimport = unittest.skipIf(
+        sys.version_info < (3, 7), reason="Lazy imports need Python 3.7")
+
+    @classmethod
+    def setUpClass(cls):
+        cls._startup = _measure_startup()
+
+    @requireslazyimport
+    def test_optional_modules_are_not_imported(self):
+        modules = self._startup['modules']
+        for name in ['dolfin', 'bempp.api.shapes', 'bempp.api.operators',
+                     'bempp.api.hmat', 'bempp.api.linalg', 'bempp.api.file_interfaces']:
+            self.assertNotIn(name, modules)
+
+    @requireslazyimport
+    def test_config_dir_is_not_created(self):
+        self.assertFalse(self._startup['config_dir_created'])
+
+    @requireslazyimport
+    def test_startup_time(self):
+        import os
+        limit = float(os.environ.get('BEMPP_STARTUP_TIME_LIMIT', STARTUP_TIME_LIMIT))
+        self.assertLess(self._startup['time'], limit)
+
+
+if __name__ == "__main__":
+    from unittest import main
+
+    main()